@@ -0,0 +1,592 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+"""
+End-to-end receive throughput over loopback, using the HSB emulator
+as the data source; no GPU (or HSB) is needed.
+
+For each combination of transport, sensor count, frame size, MTU and
+frame rate, a child process runs an HSBEmulator with one DataPlane per
+sensor; this process enumerates it, configures it just as an
+application would, and receives its frames with LinuxReceiver or
+LinuxCoeReceiver in host_memory mode.  Packets/s, frames/s, drop rates,
+CPU use and frame latency for each case are written as JSON; with
+--baseline, results are compared to an earlier run and the exit
+status is nonzero if any case regressed.
+
+Frame latency is the time from the emulator starting to send the frame
+to the receiver getting its last packet, both of which are recorded in
+the frame metadata (using CLOCK_REALTIME).  A frame rate of 0 sends
+frames as fast as the emulator can.
+
+The COE transport uses a raw socket, so it needs CAP_NET_RAW; without
+that, COE cases are recorded as skipped.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+import hololink as hololink_module
+
+TRANSPORTS = ("linux", "coe")
+# ETH_P_AVTP; see LinuxCoeReceiverOp.
+ETH_P_AVTP = 0x22F0
+# Used for the COE line threshold.
+COE_PIXEL_WIDTH = 1920
+# Results are compared with the baseline result with the same key.
+CASE_KEY = ("transport", "sensors", "frame_size", "mtu", "frame_rate")
+
+
+def serve(
+    transport,
+    address,
+    sensors,
+    frame_size,
+    frame_rate,
+    frame_count,
+    start_timeout_s,
+    results,
+    stop,
+):
+    """Runs in the emulator child process: sends frame_count frames
+    from each sensor, once the host has configured that sensor, then
+    reports what was sent to results and waits for stop."""
+    import hololink.emulation as hemu
+
+    hsb = hemu.HSBEmulator()
+    data_plane_type = {"linux": hemu.LinuxDataPlane, "coe": hemu.COEDataPlane}[
+        transport
+    ]
+    ip_address = hemu.IPAddress(address)
+    data_plane_id = 0
+    data_planes = [
+        data_plane_type(hsb, ip_address, data_plane_id, sensor)
+        for sensor in range(sensors)
+    ]
+    hsb.start()
+    # All the sensors share one data plane, which is enumerated once.
+    for data_plane in data_planes[1:]:
+        data_plane.stop_bootp()
+    frame = (np.arange(frame_size) & 0xFF).astype(np.uint8)
+    sent = [0] * sensors
+    errors = [0] * sensors
+
+    def _send(sensor):
+        data_plane = data_planes[sensor]
+        # send() doesn't do anything until the host configures us.
+        deadline = time.monotonic() + start_timeout_s
+        while data_plane.send(frame) == 0:
+            if time.monotonic() > deadline:
+                return
+            time.sleep(0.001)
+        sent[sensor] = 1
+        next_frame = time.monotonic()
+        while sent[sensor] < frame_count:
+            if frame_rate:
+                next_frame += 1 / frame_rate
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            if data_plane.send(frame) < 0:
+                errors[sensor] += 1
+            sent[sensor] += 1
+
+    threads = [
+        threading.Thread(target=_send, args=(sensor,), daemon=True)
+        for sensor in range(sensors)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    results.put(
+        {
+            "frames_sent": sent,
+            "send_errors": errors,
+            "cpu_s": usage.ru_utime + usage.ru_stime,
+        }
+    )
+    stop.wait()
+    hsb.stop()
+
+
+def _cpu_times():
+    """Returns {cpu name: (busy, total)} jiffies from /proc/stat."""
+    r = {}
+    with open("/proc/stat") as f:
+        for line in f:
+            name, *fields = line.split()
+            if not name.startswith("cpu") or name == "cpu":
+                continue
+            values = [int(field) for field in fields]
+            total = sum(values[:8])
+            # idle and iowait
+            idle = values[3] + values[4]
+            r[name] = (total - idle, total)
+    return r
+
+
+def _cpu_utilization(before, after):
+    """Returns the busy fraction of each core between two
+    _cpu_times samples."""
+    r = {}
+    for name, (busy, total) in after.items():
+        if name not in before:
+            continue
+        busy_before, total_before = before[name]
+        elapsed = total - total_before
+        r[name] = round((busy - busy_before) / elapsed, 4) if elapsed else 0.0
+    return r
+
+
+def _thread_cpu_s(tid):
+    """Returns the CPU time, in seconds, used by the given thread
+    of this process."""
+    with open(f"/proc/self/task/{tid}/stat") as f:
+        # Fields after the command name, which may contain spaces.
+        fields = f.read().rsplit(")", 1)[1].split()
+    utime, stime = int(fields[11]), int(fields[12])
+    return (utime + stime) / os.sysconf("SC_CLK_TCK")
+
+
+def _quantile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class Receiver:
+    """One sensor's receiver, configured the way the receiver
+    operators do it, plus a thread that fetches its frames."""
+
+    def __init__(self, transport, hololink_channel, sensor, frame_size, args):
+        self._transport = transport
+        self._hololink_channel = hololink_channel
+        self._sensor = sensor
+        self._frame_size = frame_size
+        self._pages = args.pages
+        self._coe_interface = args.coe_interface
+        self._allocation_size = (
+            hololink_module.round_up(frame_size, hololink_module.PAGE_SIZE)
+            + hololink_module.METADATA_SIZE
+        )
+        self._receiver = None
+        self._receiver_tid = None
+        self._done = False
+        self.frames = 0
+        # (timestamp_ns, received_ns) for each frame we got.
+        self.times = []
+
+    def start(self):
+        if self._transport == "linux":
+            self._data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._hololink_channel.configure_socket(self._data_socket.fileno())
+            self._receiver = hololink_module.operators.LinuxReceiver(
+                0,
+                self._frame_size,
+                self._data_socket.fileno(),
+                0,
+                pages=self._pages,
+                host_memory=True,
+            )
+        else:
+            self._data_socket = socket.socket(
+                socket.AF_PACKET, socket.SOCK_RAW, socket.ntohs(ETH_P_AVTP)
+            )
+            self._data_socket.bind((self._coe_interface, 0))
+            self._receiver = hololink_module.operators.LinuxCoeReceiver(
+                0,
+                self._allocation_size,
+                self._data_socket.fileno(),
+                self._sensor,
+                pages=self._pages,
+                host_memory=True,
+            )
+        self._receiver_thread = threading.Thread(target=self._run, daemon=True)
+        self._receiver_thread.start()
+        self._fetch_thread = threading.Thread(target=self._fetch, daemon=True)
+        self._fetch_thread.start()
+        if self._transport == "linux":
+            self._hololink_channel.authenticate(
+                self._receiver.get_qp_number(), self._receiver.get_rkey()
+            )
+            local_port = self._data_socket.getsockname()[1]
+            self._hololink_channel.configure_roce(
+                0, self._frame_size, self._allocation_size, 1, local_port
+            )
+        else:
+            self._hololink_channel.configure_coe(
+                self._sensor, self._frame_size, COE_PIXEL_WIDTH, False
+            )
+
+    def _run(self):
+        self._receiver_tid = threading.get_native_id()
+        self._receiver.run()
+
+    def _fetch(self):
+        timeout_ms = 100
+        while not self._done:
+            ok, metadata = self._receiver.get_next_frame(timeout_ms)
+            if not ok:
+                continue
+            self.frames += 1
+            self.times.append(
+                (
+                    metadata.timestamp_s * 1_000_000_000 + metadata.timestamp_ns,
+                    metadata.received_s * 1_000_000_000 + metadata.received_ns,
+                )
+            )
+
+    def receiver_cpu_s(self):
+        return _thread_cpu_s(self._receiver_tid)
+
+    def telemetry(self):
+        return self._receiver.get_telemetry().counters()
+
+    def stop(self):
+        self._done = True
+        self._fetch_thread.join()
+        self._hololink_channel.unconfigure()
+        self._receiver.close()
+        self._receiver_thread.join()
+        self._data_socket.close()
+
+
+def run_case(args, transport, sensors, frame_size, mtu, frame_rate):
+    case = {
+        "transport": transport,
+        "sensors": sensors,
+        "frame_size": frame_size,
+        "mtu": mtu,
+        "frame_rate": frame_rate,
+    }
+    logging.info(f"{case=}")
+    if transport == "coe":
+        try:
+            socket.socket(
+                socket.AF_PACKET, socket.SOCK_RAW, socket.ntohs(ETH_P_AVTP)
+            ).close()
+        except PermissionError as e:
+            case["skipped"] = f"COE needs a raw socket: {e}"
+            return case
+
+    # Spawn (rather than fork) so the emulator doesn't inherit
+    # any of our threads.
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    stop = context.Event()
+    emulator = context.Process(
+        target=serve,
+        args=(
+            transport,
+            args.hololink,
+            sensors,
+            frame_size,
+            frame_rate,
+            args.frames,
+            args.timeout,
+            results,
+            stop,
+        ),
+        daemon=True,
+    )
+    emulator.start()
+    receivers = []
+    started = []
+    hololink = None
+    try:
+        channel_metadata = hololink_module.Enumerator.find_channel(
+            channel_ip=args.hololink
+        )
+        for sensor in range(sensors):
+            metadata = hololink_module.Metadata(channel_metadata)
+            hololink_module.DataChannel.use_sensor(metadata, sensor)
+            hololink_module.DataChannel.use_mtu(metadata, mtu)
+            hololink_channel = hololink_module.DataChannel(metadata)
+            receivers.append(
+                Receiver(transport, hololink_channel, sensor, frame_size, args)
+            )
+        hololink = receivers[0]._hololink_channel.hololink()
+        hololink.start()
+        cpu_before = _cpu_times()
+        for receiver in receivers:
+            receiver.start()
+            started.append(receiver)
+        try:
+            sent = results.get(timeout=args.timeout)
+        except queue.Empty:
+            raise RuntimeError(f"Emulator didn't finish within {args.timeout} seconds.")
+        # Let the receivers finish with the last frames.
+        deadline = time.monotonic() + 1
+        frames_sent = sum(sent["frames_sent"])
+        while time.monotonic() < deadline:
+            if sum(receiver.frames for receiver in receivers) >= frames_sent:
+                break
+            time.sleep(0.01)
+        cpu_after = _cpu_times()
+        receiver_cpu_s = [receiver.receiver_cpu_s() for receiver in receivers]
+        counters = [receiver.telemetry() for receiver in receivers]
+        times = [t for receiver in receivers for t in receiver.times]
+    finally:
+        for receiver in started:
+            receiver.stop()
+        if hololink is not None:
+            hololink.stop()
+        stop.set()
+        emulator.join(timeout=5)
+        if emulator.is_alive():
+            emulator.kill()
+        hololink_module.Hololink.reset_framework()
+
+    def total(name):
+        return sum(c[name] for c in counters)
+
+    # From the start of the first frame to the end of the last.
+    elapsed_s = (
+        (max(received for _, received in times) - min(start for start, _ in times))
+        / 1e9
+        if times
+        else 0
+    )
+    latencies_s = [(received - start) / 1e9 for start, received in times]
+    frames_delivered = total("frames_delivered")
+    packets_received = total("packets_received")
+    packets_dropped = total("packets_dropped")
+
+    def rate(n):
+        return round(n / elapsed_s, 3) if elapsed_s else 0.0
+
+    case.update(
+        {
+            "frames_sent": frames_sent,
+            "send_errors": sum(sent["send_errors"]),
+            "frames_received": total("frames_received"),
+            "frames_delivered": frames_delivered,
+            "frame_drop_rate": (
+                round(1 - frames_delivered / frames_sent, 6) if frames_sent else 0.0
+            ),
+            "packets_received": packets_received,
+            "packets_dropped": packets_dropped,
+            "packet_drop_rate": (
+                round(packets_dropped / (packets_received + packets_dropped), 6)
+                if packets_received
+                else 0.0
+            ),
+            "elapsed_s": round(elapsed_s, 6),
+            "packets_per_s": rate(packets_received),
+            "frames_per_s": rate(frames_delivered),
+            "bytes_per_s": rate(total("bytes_received")),
+            "latency_p50_s": _quantile(latencies_s, 0.5),
+            "latency_p99_s": _quantile(latencies_s, 0.99),
+            "cpu": {
+                "cores": _cpu_utilization(cpu_before, cpu_after),
+                "receiver_s": receiver_cpu_s,
+                "emulator_s": round(sent["cpu_s"], 3),
+            },
+        }
+    )
+    logging.info(
+        f"frames_per_s={case['frames_per_s']} packets_per_s={case['packets_per_s']} "
+        f"frame_drop_rate={case['frame_drop_rate']} "
+        f"latency_p50_s={case['latency_p50_s']} latency_p99_s={case['latency_p99_s']}"
+    )
+    return case
+
+
+def compare(results, baseline, tolerance):
+    """Returns a list of descriptions of the ways results are worse
+    than baseline by more than tolerance (a fraction)."""
+    baseline_cases = {
+        tuple(case[key] for key in CASE_KEY): case
+        for case in baseline["results"]
+        if "skipped" not in case
+    }
+    regressions = []
+    for case in results["results"]:
+        if "skipped" in case:
+            continue
+        key = tuple(case[k] for k in CASE_KEY)
+        expected = baseline_cases.get(key)
+        if expected is None:
+            continue
+        name = ",".join(f"{k}={v}" for k, v in zip(CASE_KEY, key))
+        for metric in ("packets_per_s", "frames_per_s"):
+            if case[metric] < expected[metric] * (1 - tolerance):
+                regressions.append(
+                    f"{name}: {metric}={case[metric]} (baseline {expected[metric]})"
+                )
+        for metric in ("latency_p50_s", "latency_p99_s"):
+            if (case[metric] is not None) and (expected[metric] is not None):
+                if case[metric] > expected[metric] * (1 + tolerance):
+                    regressions.append(
+                        f"{name}: {metric}={case[metric]} (baseline {expected[metric]})"
+                    )
+        for metric in ("frame_drop_rate", "packet_drop_rate"):
+            if case[metric] > expected[metric] + tolerance:
+                regressions.append(
+                    f"{name}: {metric}={case[metric]} (baseline {expected[metric]})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--transport",
+        nargs="+",
+        choices=TRANSPORTS,
+        default=list(TRANSPORTS),
+        help="Transports to measure.",
+    )
+    parser.add_argument(
+        "--sensors",
+        nargs="+",
+        type=int,
+        choices=(1, 2),
+        default=[1, 2],
+        help="Sensor counts to measure; 2 is stereo.",
+    )
+    parser.add_argument(
+        "--frame-size",
+        nargs="+",
+        type=int,
+        default=[1920 * 1080 * 2, 3840 * 2160 * 2],
+        help="Frame sizes, in bytes, to measure.",
+    )
+    parser.add_argument(
+        "--mtu",
+        nargs="+",
+        type=int,
+        default=[1500, 4096, 9000],
+        help="MTUs to measure.",
+    )
+    parser.add_argument(
+        "--frame-rate",
+        nargs="+",
+        type=int,
+        default=[30, 60, 0],
+        help="Frame rates (per sensor) to measure; 0 sends as fast as possible.",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=100,
+        help="Frames to send from each sensor in each case.",
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=4,
+        help="Receiver frame buffers.",
+    )
+    parser.add_argument(
+        "--hololink",
+        default="127.0.0.1",
+        help="IP address of the emulator; use the default for loopback or the emulator end of a veth pair.",
+    )
+    parser.add_argument(
+        "--coe-interface",
+        default="lo",
+        help="Interface the COE receiver listens on.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="Seconds to allow for each case.",
+    )
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Write JSON results here; '-' for stdout.",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Compare results to this earlier output; exit with status 1 on regression.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="With --baseline, the allowed fractional change before a case counts as a regression.",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=int,
+        default=logging.INFO,
+        help="Logging level to display",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+    hololink_module.logging_level(args.log_level)
+
+    results = {
+        "benchmark": "emulator_loopback",
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": {
+            "node": platform.node(),
+            "kernel": platform.release(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "arguments": vars(args),
+        "results": [],
+    }
+    for transport, sensors, frame_size, mtu, frame_rate in itertools.product(
+        args.transport, args.sensors, args.frame_size, args.mtu, args.frame_rate
+    ):
+        results["results"].append(
+            run_case(args, transport, sensors, frame_size, mtu, frame_rate)
+        )
+
+    text = json.dumps(results, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            logging.error(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+"""
+Control plane cost of sensor power-up sequences; no GPU (or HSB) is
+needed.
+
+hsb_gpio cases drive a reset/enable pattern--make the pins outputs,
+drive them low, then high--on HSB GPIO pins (Hololink.GPIO), with one
+call per pin ("per_pin") or one call per step ("bulk"), against the HSB
+emulator.  "cold" runs start with the pins as inputs and nothing
+cached, as after a reset; "warm" runs repeat the sequence right away.
+Control plane requests and the time taken are recorded.
+
+li_gpio_expander cases run the fr_imx* sensors' own GPIO expander code:
+"power_up" is configure_gpio_expander on a new sensor object, and
+"restart" is holding the sensor in reset (as stop does) and then
+configuring it again.  The expander is modelled, so only the number of
+I2C transactions is recorded; each one is several control plane
+requests on a real HSB.
+
+Cases that need APIs this tree doesn't have are recorded as skipped, so
+running this on an older tree gives "before" numbers; with --baseline,
+results are compared to such a run and the exit status is nonzero if
+any case got worse.
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import types
+
+import hololink as hololink_module
+
+# Same as the real HSBs; the emulator doesn't enumerate a pin count.
+GPIO_PIN_COUNT = 54
+# See src/hololink/core/hololink.cpp.
+GPIO_DIRECTION_BASE_REGISTER = 0x2C
+GPIO_REGISTER_ADDRESS_OFFSET = 4
+# (sensor package, camera class)
+SENSORS = (
+    ("fr_imx662", "Imx662Cam"),
+    ("fr_imx676", "Imx676Cam"),
+    ("fr_imx678", "Imx678Cam"),
+    ("fr_imx900", "Imx900Cam"),
+)
+# Results are compared with the baseline result with the same key.
+CASE_KEY = ("path", "api", "pins", "sensor", "phase")
+
+
+def serve(address, stop):
+    """Runs in the emulator child process until stop is set."""
+    import hololink.emulation as hemu
+
+    hsb = hemu.HSBEmulator()
+    # The data plane is only here so that we're enumerated.
+    data_plane = hemu.LinuxDataPlane(hsb, hemu.IPAddress(address), 0, 0)
+    hsb.start()
+    stop.wait()
+    data_plane.stop()
+    hsb.stop()
+
+
+# Like tests/conftest.py's CountingHololink; benchmarks don't depend on
+# the tests directory, so this keeps just what we need here.
+class CountingHololink(hololink_module.Hololink):
+    """Counts control plane requests."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = 0
+
+    def send_control(self, request):
+        self.requests += 1
+        super().send_control(request)
+
+
+def per_pin(gpio, pins):
+    for pin in pins:
+        gpio.set_direction(pin, gpio.OUT)
+    for pin in pins:
+        gpio.set_value(pin, gpio.LOW)
+    for pin in pins:
+        gpio.set_value(pin, gpio.HIGH)
+
+
+def bulk(gpio, pins):
+    gpio.set_directions({pin: gpio.OUT for pin in pins})
+    gpio.set_values({pin: gpio.LOW for pin in pins})
+    gpio.set_values({pin: gpio.HIGH for pin in pins})
+
+
+def make_inputs(hololink, pins):
+    """Put pins back to their reset state (inputs) behind GPIO's back,
+    then forget what we know about them."""
+    for bank in sorted(set(pin // 32 for pin in pins)):
+        hololink.write_uint32(
+            GPIO_DIRECTION_BASE_REGISTER + bank * GPIO_REGISTER_ADDRESS_OFFSET,
+            0xFFFF_FFFF,
+        )
+    # Older trees don't cache anything.
+    if hasattr(hololink, "invalidate_register_cache"):
+        hololink.invalidate_register_cache()
+
+
+def run_hsb_gpio(args):
+    context = multiprocessing.get_context("spawn")
+    stop = context.Event()
+    emulator = context.Process(target=serve, args=(args.hololink, stop), daemon=True)
+    emulator.start()
+    hololink = None
+    cases = []
+    try:
+        channel_metadata = hololink_module.Enumerator.find_channel(
+            channel_ip=args.hololink
+        )
+        metadata = hololink_module.Metadata(channel_metadata)
+        metadata.update(hololink_module.Metadata({"gpio_pin_count": GPIO_PIN_COUNT}))
+        hololink = CountingHololink(
+            peer_ip=metadata["peer_ip"],
+            control_port=metadata["control_port"],
+            serial_number=metadata["serial_number"],
+            sequence_number_checking=False,
+        )
+        hololink.start()
+        gpio = hololink.get_gpio(metadata)
+        for pins in args.pins:
+            pins = [int(pin) for pin in pins.split(",")]
+            for api, sequence in (("per_pin", per_pin), ("bulk", bulk)):
+                for phase in ("cold", "warm"):
+                    case = {
+                        "path": "hsb_gpio",
+                        "api": api,
+                        "pins": ",".join(str(pin) for pin in pins),
+                        "phase": phase,
+                    }
+                    logging.info(f"{case=}")
+                    cases.append(case)
+                    if (api == "bulk") and not hasattr(gpio, "set_directions"):
+                        case["skipped"] = "GPIO has no bulk API"
+                        continue
+                    requests, elapsed_s = 0, 0.0
+                    for _ in range(args.iterations):
+                        make_inputs(hololink, pins)
+                        if phase == "warm":
+                            sequence(gpio, pins)
+                        before = hololink.requests
+                        start = time.monotonic()
+                        sequence(gpio, pins)
+                        elapsed_s += time.monotonic() - start
+                        requests += hololink.requests - before
+                    case["requests"] = requests // args.iterations
+                    case["time_s"] = round(elapsed_s / args.iterations, 6)
+                    logging.info(f"requests={case['requests']} time_s={case['time_s']}")
+    finally:
+        if hololink is not None:
+            hololink.stop()
+        stop.set()
+        emulator.join(timeout=5)
+        if emulator.is_alive():
+            emulator.kill()
+        hololink_module.Hololink.reset_framework()
+    return cases
+
+
+class ExpanderBus:
+    """Stands in for the I2C bus on an fr_imx* board: the GPIO
+    expander's registers are modelled and everything else (e.g. the I2C
+    expander) just accepts writes.  Counts transactions."""
+
+    def __init__(self, expander_address):
+        self._expander_address = expander_address
+        # Input, output, polarity and configuration, at power-on.
+        self.registers = [0x00, 0xFF, 0x00, 0xFF]
+        self.transactions = 0
+
+    def get_i2c(self, *args, **kwargs):
+        return self
+
+    def i2c_transaction(
+        self, peripheral_address, write_bytes, read_byte_count, timeout=None
+    ):
+        self.transactions += 1
+        reply = bytearray(read_byte_count)
+        if peripheral_address == self._expander_address:
+            register = write_bytes[0]
+            if len(write_bytes) > 1:
+                self.registers[register] = write_bytes[1]
+            if read_byte_count:
+                reply[0] = self.registers[register]
+        return reply
+
+
+def run_li_gpio_expander(args):
+    cases = []
+    for sensor, camera_class in SENSORS:
+        package = importlib.import_module(f"hololink.sensors.{sensor}")
+        module = getattr(package, sensor)
+        li_gpio_expander = module.li_gpio_expander
+        bus = ExpanderBus(li_gpio_expander.LIGPIOExpander.GPIO_EXPANDER_ADDRESS)
+        camera = getattr(module, camera_class)(
+            types.SimpleNamespace(hololink=lambda: bus)
+        )
+        cam_rst = li_gpio_expander.GPIO_Expander_pin.CAM_RST
+
+        def restart():
+            camera._gpio_expander.set_output_gpio(cam_rst, 0)
+            camera.configure_gpio_expander()
+
+        for phase, sequence in (
+            ("power_up", camera.configure_gpio_expander),
+            ("restart", restart),
+        ):
+            before = bus.transactions
+            sequence()
+            case = {
+                "path": "li_gpio_expander",
+                "sensor": sensor,
+                "phase": phase,
+                "i2c_transactions": bus.transactions - before,
+            }
+            logging.info(f"{case=}")
+            cases.append(case)
+        # The camera is out of reset.
+        assert bus.registers[1] & (1 << cam_rst.value)
+        assert not (bus.registers[3] & (1 << cam_rst.value))
+    return cases
+
+
+def compare(results, baseline, tolerance):
+    """Returns a list of descriptions of the ways results are worse
+    than baseline: more requests or I2C transactions, or more time by
+    more than tolerance (a fraction)."""
+
+    def key(case):
+        return tuple(case.get(k) for k in CASE_KEY)
+
+    baseline_cases = {
+        key(case): case for case in baseline["results"] if "skipped" not in case
+    }
+    regressions = []
+    for case in results["results"]:
+        if "skipped" in case:
+            continue
+        expected = baseline_cases.get(key(case))
+        if expected is None:
+            continue
+        name = ",".join(f"{k}={case[k]}" for k in CASE_KEY if k in case)
+        for metric in ("requests", "i2c_transactions"):
+            if (metric in case) and (case[metric] > expected[metric]):
+                regressions.append(
+                    f"{name}: {metric}={case[metric]} (baseline {expected[metric]})"
+                )
+        metric = "time_s"
+        if (metric in case) and (case[metric] > expected[metric] * (1 + tolerance)):
+            regressions.append(
+                f"{name}: {metric}={case[metric]} (baseline {expected[metric]})"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--pins",
+        nargs="+",
+        default=["0,1,2,3", "0,1,40,41"],
+        help="Comma-separated HSB GPIO pins to drive in each hsb_gpio case.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20,
+        help="Runs of each hsb_gpio case; requests and time are averaged.",
+    )
+    parser.add_argument(
+        "--hololink",
+        default="127.0.0.1",
+        help="IP address of the emulator.",
+    )
+    parser.add_argument(
+        "--skip-hsb-gpio",
+        action="store_true",
+        help="Don't run the hsb_gpio cases (which need the emulator).",
+    )
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Write JSON results here; '-' for stdout.",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Compare results to this earlier output; exit with status 1 on regression.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="With --baseline, the allowed fractional increase in time before a case counts as a regression.",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=int,
+        default=logging.INFO,
+        help="Logging level to display",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+    hololink_module.logging_level(args.log_level)
+
+    results = {
+        "benchmark": "gpio_power_up",
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": {
+            "node": platform.node(),
+            "kernel": platform.release(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "arguments": vars(args),
+        "results": [],
+    }
+    if not args.skip_hsb_gpio:
+        results["results"].extend(run_hsb_gpio(args))
+    results["results"].extend(run_li_gpio_expander(args))
+
+    text = json.dumps(results, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            logging.error(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
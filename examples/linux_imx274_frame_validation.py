@@ -222,6 +222,16 @@ class InstrumentedTimeProfiler(holoscan.core.Operator):
                     )
                     self._crc_errors += 1
 
+        # The receiver tells us which parts of the frame never arrived.
+        missing_bytes = self.metadata.get("missing_bytes", 0)
+        if missing_bytes > 0:
+            missing_regions = self.metadata.get("missing_regions", [])
+            logging.info(
+                f"frame number {frame_number}: {missing_bytes} bytes missing in "
+                f"{len(missing_regions)} regions, "
+                f"first at offset {missing_regions[0][0]:#x}"
+            )
+
         # Save the number of bytes in the frame to compare to CSI calculated frame size
         self.metadata["received_frame_size"] = cp_frame.nbytes
         self.metadata["calculated_frame_size"] = self._calculated_frame_size
@@ -332,6 +342,9 @@ class HoloscanApplication(holoscan.core.Application):
             frame_context=frame_context,
             hololink_channel=self._hololink_channel,
             device=self._camera,
+            # Report missing data via metadata instead of
+            # clearing the whole buffer before each frame.
+            track_missing=True,
         )
 
         pixel_format = self._camera.pixel_format()
@@ -24,14 +24,17 @@ from . import (
     renesas_bajoran_lite_ts1,
     renesas_bajoran_lite_ts2,
     sensors,
+    telemetry,
 )
 from ._hololink import (
     APB_RAM,
     BL_I2C_BUS,
     CAM_I2C_BUS,
     CLNX_SPI_BUS,
+    CONTROL_BLOCK_WORDS,
     CPNX_SPI_BUS,
     CTRL_EVENT,
+    CTRL_EVT_HOST_UDP_PORT,
     CTRL_EVT_SW_EVENT,
     DP_ADDRESS_0,
     DP_ADDRESS_1,
@@ -104,16 +107,20 @@ from ._hololink import (
     TimeoutError,
     UnsupportedVersion,
     csi,
+    get_hsb_log_async,
     get_hsb_log_level,
     get_traditional_i2c,
     get_traditional_spi,
     hsb_log_debug,
+    hsb_log_dropped,
     hsb_log_error,
+    hsb_log_flush,
     hsb_log_info,
     hsb_log_trace,
     hsb_log_warn,
     infiniband_devices,
     log_timestamp_s,
+    set_hsb_log_async,
     set_hsb_log_level,
 )
 from .hololink_core import (
@@ -122,10 +129,16 @@ from .hololink_core import (
     UDP_PACKET_SIZE,
     ArpWrapper,
     Deserializer,
+    LocalIpAndMacCacheStats,
     Reactor,
+    ReceiverTelemetry,
     Serializer,
+    TelemetryServer,
+    clear_local_ip_and_mac_cache,
     gettid,
+    handle_local_ip_and_mac_netlink_messages,
     local_ip_and_mac,
+    local_ip_and_mac_cache_stats,
     local_ip_and_mac_from_socket,
     local_mac,
     round_up,
@@ -140,7 +153,9 @@ __all__ = [
     "BayerFormat",
     "CAM_I2C_BUS",
     "CLNX_SPI_BUS",
+    "CONTROL_BLOCK_WORDS",
     "CTRL_EVENT",
+    "CTRL_EVT_HOST_UDP_PORT",
     "CTRL_EVT_SW_EVENT",
     "CPNX_SPI_BUS",
     "CsiConverter",
@@ -194,6 +209,7 @@ __all__ = [
     "I2C_START",
     "ImGuiRenderer",
     "LEOPARD_EAGLE_BOARD_ID",
+    "LocalIpAndMacCacheStats",
     "METADATA_SIZE",
     "MICROCHIP_POLARFIRE_BOARD_ID",
     "Metadata",
@@ -204,6 +220,7 @@ __all__ = [
     "RD_BLOCK",
     "RD_DWORD",
     "Reactor",
+    "ReceiverTelemetry",
     "REQUEST_FLAGS_ACK_REQUEST",
     "RESPONSE_INVALID_CMD",
     "RESPONSE_SUCCESS",
@@ -212,6 +229,7 @@ __all__ = [
     "Serializer",
     "Synchronizable",
     "Synchronizer",
+    "TelemetryServer",
     "Timeout",
     "TimeoutError",
     "UDP_PACKET_SIZE",
@@ -220,6 +238,7 @@ __all__ = [
     "WR_DWORD",
     "core",
     "csi",
+    "get_hsb_log_async",
     "get_hsb_log_level",
     "get_traditional_i2c",
     "get_traditional_spi",
@@ -228,9 +247,14 @@ __all__ = [
     "hsb_log_info",
     "hsb_log_warn",
     "hsb_log_error",
+    "hsb_log_dropped",
+    "hsb_log_flush",
     "gettid",
     "infiniband_devices",
+    "clear_local_ip_and_mac_cache",
+    "handle_local_ip_and_mac_netlink_messages",
     "local_ip_and_mac",
+    "local_ip_and_mac_cache_stats",
     "local_ip_and_mac_from_socket",
     "local_mac",
     "operators",
@@ -238,7 +262,9 @@ __all__ = [
     "renesas_bajoran_lite_ts2",
     "round_up",
     "sensors",
+    "telemetry",
     "log_timestamp_s",
+    "set_hsb_log_async",
     "set_hsb_log_level",
 ]
 
@@ -0,0 +1,592 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+"""
+NumPy encoders and decoders for the pixel layouts HSB delivers.
+
+- CSI RAW8, RAW10 and RAW12, as decoded by CsiToBayerOp: RAW10 sends
+  4 pixels in 5 bytes (the upper 8 bits of each, then a byte with the
+  2 low bits of all four); RAW12 sends 2 pixels in 3 bytes.
+- The packetizer layouts, as decoded by PackedFormatConverterOp:
+  Csi10ToPacked10 puts 3 pixels in each little-endian 32-bit word,
+  {2'b0, p3[9:0], p2[9:0], p1[9:0]}; Csi12ToPacked12 puts 2 pixels
+  in 3 bytes, {p2[11:0], p1[11:0]} in network byte order.
+
+Frames are described the way CsiConverter.configure sees them: the
+image starts start_byte into the received data, and each line starts
+bytes_per_line (the received line bytes) after the previous one.
+Decoding produces a (pixel_height, pixel_width) uint16 image; with
+msb_aligned=True the values are shifted up to 16 bits, as
+CsiToBayerOp outputs them.  All the encoders and decoders accept an
+out= array to write into, so a caller decoding a stream of frames
+doesn't allocate an image per frame; working storage is limited to a
+few cache-sized blocks of lines.
+"""
+
+import sys
+
+import numpy as np
+
+from .sensors import csi
+
+# Lines are processed in blocks of about this many output bytes so
+# that intermediate values stay in cache.
+BLOCK_BYTES = 256 * 1024
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# For RAW10, the low 2 bits of each of the 4 pixels, indexed by the
+# fifth byte of the group.
+_LSB_10 = np.array(
+    [[(b >> (2 * k)) & 0x3 for k in range(4)] for b in range(256)], dtype=np.uint16
+)
+# For RAW12, the low 4 bits of each of the 2 pixels, indexed by the
+# third byte of the group.
+_LSB_12 = np.array(
+    [[(b >> (4 * k)) & 0xF for k in range(2)] for b in range(256)], dtype=np.uint16
+)
+# For packed 12-bit data, the parts of p1 and p2 in the middle byte.
+_MIDDLE_12 = np.array([[(b & 0xF) << 8, b >> 4] for b in range(256)], dtype=np.uint16)
+
+_BITS = {
+    csi.PixelFormat.RAW_8: 8,
+    csi.PixelFormat.RAW_10: 10,
+    csi.PixelFormat.RAW_12: 12,
+}
+
+
+def bits_per_pixel(pixel_format):
+    try:
+        return _BITS[pixel_format]
+    except KeyError:
+        raise ValueError(f"Unsupported {pixel_format=}.")
+
+
+def transmitted_line_bytes(pixel_format, pixel_width):
+    """Bytes in each line of CSI data, before any receiver padding;
+    the same as CsiToBayerOp.transmitted_line_bytes."""
+    bits = bits_per_pixel(pixel_format)
+    return pixel_width * bits // 8
+
+
+def packed_line_bytes(pixel_format, pixel_width):
+    """Bytes in each line after Csi10ToPacked10 or Csi12ToPacked12;
+    the same as PackedFormatConverterOp.transmitted_line_bytes."""
+    bits = bits_per_pixel(pixel_format)
+    if bits == 8:
+        return pixel_width
+    if bits == 10:
+        return (pixel_width + 2) // 3 * 4
+    return (pixel_width + 1) // 2 * 3
+
+
+def _check_width(pixel_format, pixel_width):
+    pixels_per_group = {8: 1, 10: 4, 12: 2}[bits_per_pixel(pixel_format)]
+    if pixel_width % pixels_per_group:
+        raise ValueError(
+            f"{pixel_format=} requires a pixel_width that is a multiple of {pixels_per_group}; got {pixel_width=}."
+        )
+
+
+def _buffer(buffer, start_byte, bytes_per_line, line_bytes, pixel_height):
+    """buffer as a flat uint8 array, checked to hold pixel_height lines."""
+    if bytes_per_line < line_bytes:
+        raise ValueError(f"{bytes_per_line=} is less than the {line_bytes=}.")
+    if isinstance(buffer, np.ndarray):
+        if not buffer.flags.c_contiguous:
+            raise ValueError("The CSI buffer must be contiguous.")
+        buffer = buffer.reshape(-1).view(np.uint8)
+    else:
+        buffer = np.frombuffer(buffer, dtype=np.uint8)
+    required = start_byte + bytes_per_line * (pixel_height - 1) + line_bytes
+    if pixel_height and buffer.size < required:
+        raise ValueError(
+            f"Buffer has {buffer.size} bytes but {required} are needed for {pixel_height} lines."
+        )
+    return buffer
+
+
+def _fields(buffer, offset, bytes_per_line, lines, groups, group_bytes, dtype):
+    """A (lines, groups) view of the dtype field at offset in each group."""
+    return np.ndarray(
+        (lines, groups),
+        dtype=dtype,
+        buffer=buffer,
+        offset=offset,
+        strides=(bytes_per_line, group_bytes),
+    )
+
+
+def _lines(buffer, start_byte, bytes_per_line, line_bytes, pixel_height):
+    """A (pixel_height, line_bytes) uint8 view of the lines in buffer."""
+    buffer = _buffer(buffer, start_byte, bytes_per_line, line_bytes, pixel_height)
+    return _fields(
+        buffer, start_byte, bytes_per_line, pixel_height, line_bytes, 1, np.uint8
+    )
+
+
+def _image(out, pixel_height, pixel_width, dtype=np.uint16):
+    """out, checked for use as a (pixel_height, pixel_width) image, or a
+    new one if out is None."""
+    if out is None:
+        return np.empty((pixel_height, pixel_width), dtype=dtype)
+    if out.dtype != dtype:
+        raise ValueError(f"out must be {np.dtype(dtype).name}; got {out.dtype}.")
+    image = out.reshape(pixel_height, pixel_width)
+    if not np.may_share_memory(image, out) or image.strides[1] != image.itemsize:
+        raise ValueError("out must be contiguous along each line.")
+    return image
+
+
+def _blocks(pixel_height, line_bytes):
+    """Yields (start, stop) line ranges for processing in cache-sized blocks."""
+    lines = max(1, BLOCK_BYTES // max(1, line_bytes))
+    for start in range(0, pixel_height, lines):
+        yield start, min(start + lines, pixel_height)
+
+
+def unpack(
+    data,
+    pixel_format,
+    pixel_width,
+    pixel_height,
+    start_byte=0,
+    bytes_per_line=None,
+    out=None,
+    msb_aligned=False,
+):
+    """Decode a CSI RAW8, RAW10 or RAW12 frame into a uint16 bayer
+    image; returns the image, which is out if that was given.
+
+    data is anything supporting the buffer protocol. bytes_per_line
+    defaults to transmitted_line_bytes(pixel_format, pixel_width);
+    pass the received_line_bytes the CsiConverter was configured with
+    to decode frames as received. With msb_aligned, values are
+    shifted up to use all 16 bits, matching CsiToBayerOp.
+    """
+    _check_width(pixel_format, pixel_width)
+    bits = bits_per_pixel(pixel_format)
+    line_bytes = transmitted_line_bytes(pixel_format, pixel_width)
+    if bytes_per_line is None:
+        bytes_per_line = line_bytes
+    buffer = _buffer(data, start_byte, bytes_per_line, line_bytes, pixel_height)
+    image = _image(out, pixel_height, pixel_width)
+    shift = 16 - bits if msb_aligned else 0
+    if bits == 8:
+        lines = _fields(
+            buffer, start_byte, bytes_per_line, pixel_height, line_bytes, 1, np.uint8
+        )
+        np.left_shift(lines, shift, out=image, dtype=np.uint16)
+    elif not _LITTLE_ENDIAN:
+        _unpack_groups(buffer, start_byte, bytes_per_line, image, bits, shift)
+    elif bits == 10:
+        _unpack_lanes_10(buffer, start_byte, bytes_per_line, image, shift)
+    else:
+        _unpack_lanes_12(buffer, start_byte, bytes_per_line, image, shift)
+    return image if out is None else out
+
+
+def _unpack_lanes_10(buffer, start_byte, bytes_per_line, image, shift):
+    # Each 5-byte group decodes into the four 16-bit lanes of a uint64,
+    # which, on a little-endian host, are the group's four pixels in
+    # the image: the first 4 bytes are spread out one per lane, and
+    # multiplying the fifth byte by lsb_spread puts a copy of it in
+    # each lane k, shifted so that its bits 2k..2k+1 land at the bottom.
+    pixel_height, pixel_width = image.shape
+    groups = pixel_width // 4
+    msb_shift = np.uint64(2 + shift)
+    lsb_spread = np.uint64(sum(1 << (14 * k + shift) for k in range(4)))
+    lsb_mask = np.uint64(0x0003000300030003 << shift)
+    scratch = None
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        n = stop - start
+        if scratch is None:
+            scratch = np.empty((2, n, groups), dtype=np.uint64)
+        value, temp = scratch[0, :n], scratch[1, :n]
+        target = image[start:stop].view(np.uint64)
+        offset = start_byte + start * bytes_per_line
+        words = _fields(buffer, offset, bytes_per_line, n, groups, 5, "<u4")
+        np.copyto(value, words)
+        for distance, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF)):
+            np.left_shift(value, np.uint64(distance), out=temp)
+            np.bitwise_or(value, temp, out=value)
+            np.bitwise_and(value, np.uint64(mask), out=value)
+        np.left_shift(value, msb_shift, out=target)
+        low = _fields(buffer, offset + 4, bytes_per_line, n, groups, 5, np.uint8)
+        np.copyto(temp, low)
+        np.multiply(temp, lsb_spread, out=temp)
+        np.bitwise_and(temp, lsb_mask, out=temp)
+        np.bitwise_or(target, temp, out=target)
+
+
+def _unpack_lanes_12(buffer, start_byte, bytes_per_line, image, shift):
+    # As _unpack_lanes_10, with each 3-byte group decoding into the two
+    # 16-bit lanes of a uint32.
+    pixel_height, pixel_width = image.shape
+    groups = pixel_width // 2
+    msb_shift = np.uint32(4 + shift)
+    lsb_spread = np.uint32((1 << shift) | (1 << (12 + shift)))
+    lsb_mask = np.uint32(0x000F000F << shift)
+    scratch = None
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        n = stop - start
+        if scratch is None:
+            scratch = np.empty((2, n, groups), dtype=np.uint32)
+        value, temp = scratch[0, :n], scratch[1, :n]
+        target = image[start:stop].view(np.uint32)
+        offset = start_byte + start * bytes_per_line
+        np.copyto(value, _fields(buffer, offset, bytes_per_line, n, groups, 3, "<u2"))
+        np.left_shift(value, np.uint32(8), out=temp)
+        np.bitwise_or(value, temp, out=value)
+        np.bitwise_and(value, np.uint32(0x00FF00FF), out=value)
+        np.left_shift(value, msb_shift, out=target)
+        low = _fields(buffer, offset + 2, bytes_per_line, n, groups, 3, np.uint8)
+        np.copyto(temp, low)
+        np.multiply(temp, lsb_spread, out=temp)
+        np.bitwise_and(temp, lsb_mask, out=temp)
+        np.bitwise_or(target, temp, out=target)
+
+
+def _unpack_groups(buffer, start_byte, bytes_per_line, image, bits, shift):
+    # Byte order independent version of the _unpack_lanes functions.
+    pixel_height, pixel_width = image.shape
+    pixels_per_group = 4 if bits == 10 else 2
+    groups = pixel_width // pixels_per_group
+    line_bytes = groups * (pixels_per_group + 1)
+    lines = _fields(
+        buffer, start_byte, bytes_per_line, pixel_height, line_bytes, 1, np.uint8
+    )
+    lsb = (_LSB_10 if bits == 10 else _LSB_12) << shift
+    scratch = None
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        source = lines[start:stop].reshape(stop - start, groups, pixels_per_group + 1)
+        target = image[start:stop].reshape(stop - start, groups, pixels_per_group)
+        if scratch is None:
+            scratch = np.empty(target.shape, dtype=np.uint16)
+        low = scratch[: stop - start]
+        np.left_shift(
+            source[..., :pixels_per_group],
+            bits - 8 + shift,
+            out=target,
+            dtype=np.uint16,
+        )
+        np.take(lsb, source[..., pixels_per_group], axis=0, out=low, mode="clip")
+        np.bitwise_or(target, low, out=target)
+
+
+def pack(bayer_image, pixel_format, bytes_per_line=None, out=None):
+    """Encode a (height, width) bayer image, with values in the range
+    of pixel_format, as CSI RAW8, RAW10 or RAW12; returns a
+    (height, bytes_per_line) uint8 array, which is out if that was
+    given. bytes_per_line defaults to the transmitted line bytes; any
+    padding after each line is zeroed when out is allocated here and
+    left unchanged otherwise.
+    """
+    pixel_height, pixel_width = bayer_image.shape
+    _check_width(pixel_format, pixel_width)
+    bits = bits_per_pixel(pixel_format)
+    line_bytes = transmitted_line_bytes(pixel_format, pixel_width)
+    if bytes_per_line is None:
+        bytes_per_line = line_bytes
+    if out is None:
+        out = np.zeros((pixel_height, bytes_per_line), dtype=np.uint8)
+    buffer = _buffer(out, 0, bytes_per_line, line_bytes, pixel_height)
+    lines = _fields(buffer, 0, bytes_per_line, pixel_height, line_bytes, 1, np.uint8)
+    if bits == 8:
+        np.copyto(lines, bayer_image, casting="unsafe")
+        return out
+    if (
+        _LITTLE_ENDIAN
+        and bayer_image.dtype == np.uint16
+        and bayer_image.strides[1] == bayer_image.itemsize
+    ):
+        _pack_lanes(bayer_image, buffer, bytes_per_line, bits)
+        return out
+    pixels_per_group = 4 if bits == 10 else 2
+    groups = pixel_width // pixels_per_group
+    low_bits = bits - 8
+    mask = (1 << low_bits) - 1
+    shifts = np.arange(pixels_per_group, dtype=np.uint16) * low_bits
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        source = bayer_image[start:stop].reshape(stop - start, groups, pixels_per_group)
+        target = lines[start:stop].reshape(stop - start, groups, pixels_per_group + 1)
+        np.right_shift(
+            source, low_bits, out=target[..., :pixels_per_group], casting="unsafe"
+        )
+        low = np.bitwise_or.reduce(np.left_shift(source & mask, shifts), axis=2)
+        np.copyto(target[..., pixels_per_group], low, casting="unsafe")
+    return out
+
+
+def _pack_lanes(bayer_image, buffer, bytes_per_line, bits):
+    # The inverse of _unpack_lanes_10 and _unpack_lanes_12: the pixels
+    # of each group are loaded as the 16-bit lanes of one integer, then
+    # their upper bytes, and separately their low bits, are gathered
+    # into the bottom of it by repeatedly or-ing in a shifted copy.
+    # Storing into the narrower CSI fields discards what's left above.
+    pixel_height, pixel_width = bayer_image.shape
+    low_bits = bits - 8
+    if bits == 10:
+        lane_type, pixels_per_group, msb_type = np.uint64, 4, "<u4"
+        msb_rounds = ((8, 0x0000FFFF0000FFFF), (16, None))
+        lsb_rounds = ((14, 0x0000000F0000000F), (28, None))
+    else:
+        lane_type, pixels_per_group, msb_type = np.uint32, 2, "<u2"
+        msb_rounds = ((8, None),)
+        lsb_rounds = ((12, None),)
+    lanes = np.iinfo(lane_type).max
+    byte_mask = lane_type(0x00FF00FF00FF00FF & lanes)
+    lsb_mask = lane_type(((1 << low_bits) - 1) * 0x0001000100010001 & lanes)
+    groups = pixel_width // pixels_per_group
+    group_bytes = pixels_per_group + 1
+
+    def gather(value, temp, rounds):
+        for distance, mask in rounds:
+            np.right_shift(value, lane_type(distance), out=temp)
+            np.bitwise_or(value, temp, out=value)
+            if mask is not None:
+                np.bitwise_and(value, lane_type(mask), out=value)
+
+    scratch = None
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        n = stop - start
+        if scratch is None:
+            scratch = np.empty((2, n, groups), dtype=lane_type)
+        value, temp = scratch[0, :n], scratch[1, :n]
+        source = bayer_image[start:stop].view(lane_type)
+        offset = start * bytes_per_line
+        np.right_shift(source, lane_type(low_bits), out=value)
+        np.bitwise_and(value, byte_mask, out=value)
+        gather(value, temp, msb_rounds)
+        msb = _fields(buffer, offset, bytes_per_line, n, groups, group_bytes, msb_type)
+        np.copyto(msb, value, casting="unsafe")
+        np.bitwise_and(source, lsb_mask, out=value)
+        gather(value, temp, lsb_rounds)
+        lsb = _fields(
+            buffer,
+            offset + pixels_per_group,
+            bytes_per_line,
+            n,
+            groups,
+            group_bytes,
+            np.uint8,
+        )
+        np.copyto(lsb, value, casting="unsafe")
+
+
+def unpack_packed(
+    data,
+    pixel_format,
+    pixel_width,
+    pixel_height,
+    start_byte=0,
+    bytes_per_line=None,
+    out=None,
+    msb_aligned=False,
+):
+    """Decode a frame in the Csi10ToPacked10 (RAW_10) or Csi12ToPacked12
+    (RAW_12) packetizer layout into a uint16 bayer image; RAW_8 data
+    isn't swizzled, so it decodes as with unpack. bytes_per_line
+    defaults to packed_line_bytes(pixel_format, pixel_width); otherwise
+    arguments are as for unpack.
+    """
+    bits = bits_per_pixel(pixel_format)
+    if bits == 8:
+        return unpack(
+            data,
+            pixel_format,
+            pixel_width,
+            pixel_height,
+            start_byte,
+            bytes_per_line,
+            out,
+            msb_aligned,
+        )
+    line_bytes = packed_line_bytes(pixel_format, pixel_width)
+    if bytes_per_line is None:
+        bytes_per_line = line_bytes
+    buffer = _buffer(data, start_byte, bytes_per_line, line_bytes, pixel_height)
+    image = _image(out, pixel_height, pixel_width)
+    shift = 16 - bits if msb_aligned else 0
+    if bits == 12 and _LITTLE_ENDIAN:
+        _unpack_packed_lanes_12(buffer, start_byte, bytes_per_line, image, shift)
+        return image if out is None else out
+    lines = _fields(
+        buffer, start_byte, bytes_per_line, pixel_height, line_bytes, 1, np.uint8
+    )
+    pixels_per_group = 3 if bits == 10 else 2
+    groups = -(-pixel_width // pixels_per_group)
+    # Partial groups at the end of a line are decoded into scratch
+    # and the real pixels copied out.
+    padded = groups * pixels_per_group != pixel_width
+    scratch = None
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        n = stop - start
+        if padded:
+            if scratch is None:
+                scratch = np.empty((stop - start, groups, pixels_per_group), np.uint16)
+            target = scratch[:n]
+        else:
+            target = image[start:stop].reshape(n, groups, pixels_per_group)
+        if bits == 10:
+            words = lines[start:stop].view("<u4")
+            mask = 0x3FF << shift
+            for k in range(3):
+                offset = 10 * k - shift
+                if offset < 0:
+                    shifted = np.left_shift(words, -offset)
+                else:
+                    shifted = np.right_shift(words, offset)
+                np.bitwise_and(shifted, mask, out=target[..., k], casting="unsafe")
+        else:
+            source = lines[start:stop].reshape(n, groups, 3)
+            middle = np.take(_MIDDLE_12 << shift, source[..., 1], axis=0, mode="clip")
+            np.left_shift(source[..., 2], shift, out=target[..., 0], dtype=np.uint16)
+            np.bitwise_or(target[..., 0], middle[..., 0], out=target[..., 0])
+            np.left_shift(
+                source[..., 0], 4 + shift, out=target[..., 1], dtype=np.uint16
+            )
+            np.bitwise_or(target[..., 1], middle[..., 1], out=target[..., 1])
+        if padded:
+            image[start:stop] = target.reshape(n, -1)[:, :pixel_width]
+    return image if out is None else out
+
+
+def _unpack_packed_lanes_12(buffer, start_byte, bytes_per_line, image, shift):
+    # Each 3-byte group decodes into the two 16-bit lanes of a uint32.
+    # With the first two bytes loaded as value = b0 | b1 << 8, p1 is
+    # (value & 0xF00) | b2, and p2 = b0 << 4 | b1 >> 4 is collected in
+    # the upper lane from value << 20 and value << 4.
+    pixel_height, pixel_width = image.shape
+    groups = -(-pixel_width // 2)
+    padded = groups * 2 != pixel_width
+    scratch = None
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        n = stop - start
+        if scratch is None:
+            scratch = np.empty((3 if padded else 2, n, groups), dtype=np.uint32)
+        value, temp = scratch[0, :n], scratch[1, :n]
+        target = scratch[2, :n] if padded else image[start:stop].view(np.uint32)
+        offset = start_byte + start * bytes_per_line
+        np.copyto(value, _fields(buffer, offset, bytes_per_line, n, groups, 3, "<u2"))
+        np.left_shift(value, np.uint32(20), out=temp)
+        np.left_shift(value, np.uint32(4), out=target)
+        np.bitwise_or(target, temp, out=target)
+        np.bitwise_and(target, np.uint32(0x0FFF0000), out=target)
+        np.bitwise_and(value, np.uint32(0x0F00), out=temp)
+        np.bitwise_or(target, temp, out=target)
+        low = _fields(buffer, offset + 2, bytes_per_line, n, groups, 3, np.uint8)
+        np.copyto(temp, low)
+        np.bitwise_or(target, temp, out=target)
+        if shift:
+            np.left_shift(target, np.uint32(shift), out=target)
+        if padded:
+            image[start:stop] = target.view(np.uint16)[:, :pixel_width]
+
+
+def pack_packed(bayer_image, pixel_format, bytes_per_line=None, out=None):
+    """Encode a bayer image in the Csi10ToPacked10 (RAW_10) or
+    Csi12ToPacked12 (RAW_12) packetizer layout; RAW_8 is encoded as
+    with pack. Pixels padding out the last group in a line are 0;
+    otherwise arguments are as for pack.
+    """
+    bits = bits_per_pixel(pixel_format)
+    if bits == 8:
+        return pack(bayer_image, pixel_format, bytes_per_line, out)
+    pixel_height, pixel_width = bayer_image.shape
+    line_bytes = packed_line_bytes(pixel_format, pixel_width)
+    if bytes_per_line is None:
+        bytes_per_line = line_bytes
+    if out is None:
+        out = np.zeros((pixel_height, bytes_per_line), dtype=np.uint8)
+    lines = _lines(out, 0, bytes_per_line, line_bytes, pixel_height)
+    pixels_per_group = 3 if bits == 10 else 2
+    groups = -(-pixel_width // pixels_per_group)
+    mask = (1 << bits) - 1
+    for start, stop in _blocks(pixel_height, pixel_width * 2):
+        n = stop - start
+        source = np.zeros((n, groups * pixels_per_group), dtype=np.uint32)
+        np.bitwise_and(bayer_image[start:stop], mask, out=source[:, :pixel_width])
+        source = source.reshape(n, groups, pixels_per_group)
+        if bits == 10:
+            words = source[..., 0] | (source[..., 1] << 10) | (source[..., 2] << 20)
+            lines[start:stop].view("<u4")[...] = words
+        else:
+            target = lines[start:stop].reshape(n, groups, 3)
+            p1, p2 = source[..., 0], source[..., 1]
+            np.right_shift(p2, 4, out=target[..., 0], casting="unsafe")
+            np.copyto(target[..., 1], ((p2 & 0xF) << 4) | (p1 >> 8), casting="unsafe")
+            np.copyto(target[..., 2], p1, casting="unsafe")
+    return out
+
+
+def demosaic(bayer_image, bayer_format, out=None):
+    """Bilinear demosaic of an RGGB or GBRG bayer image into a
+    (height, width, 3) RGB image of the same dtype; returns the image,
+    which is out if that was given. Each missing color is the rounded
+    mean of its nearest 2 or 4 neighbors of that color, with the image
+    mirrored at its edges.
+    """
+    height, width = bayer_image.shape
+    if height < 2 or width < 2:
+        raise ValueError(f"Bayer image {bayer_image.shape} is too small to demosaic.")
+    if bayer_format == csi.BayerFormat.RGGB:
+        # color at each (row % 2, column % 2); 1 is green
+        sites = ((0, 1), (1, 2))
+    elif bayer_format == csi.BayerFormat.GBRG:
+        sites = ((1, 2), (0, 1))
+    else:
+        raise ValueError(f"Unsupported {bayer_format=}.")
+    if out is None:
+        out = np.empty((height, width, 3), dtype=bayer_image.dtype)
+    elif out.shape != (height, width, 3):
+        raise ValueError(f"out must have shape {(height, width, 3)}; got {out.shape}.")
+    padded = np.pad(bayer_image, 1, mode="reflect").astype(np.uint32)
+
+    for row in range(2):
+        for column in range(2):
+
+            def neighbors(dy, dx):
+                return padded[
+                    1 + row + dy : 1 + height + dy : 2,
+                    1 + column + dx : 1 + width + dx : 2,
+                ]
+
+            center = neighbors(0, 0)
+            horizontal = neighbors(0, -1) + neighbors(0, 1)
+            vertical = neighbors(-1, 0) + neighbors(1, 0)
+            site = sites[row][column]
+            target = out[row::2, column::2]
+            target[..., site] = center
+            if site == 1:
+                # green: red and blue are either side, one pair horizontally
+                # and the other vertically.
+                red_in_row = sites[row][1 - column] == 0
+                horizontal = (horizontal + 1) >> 1
+                vertical = (vertical + 1) >> 1
+                target[..., 0] = horizontal if red_in_row else vertical
+                target[..., 2] = vertical if red_in_row else horizontal
+            else:
+                diagonal = (
+                    neighbors(-1, -1)
+                    + neighbors(-1, 1)
+                    + neighbors(1, -1)
+                    + neighbors(1, 1)
+                )
+                target[..., 1] = (horizontal + vertical + 2) >> 2
+                target[..., 2 - site] = (diagonal + 2) >> 2
+    return out
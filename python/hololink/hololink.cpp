@@ -356,7 +356,9 @@ PYBIND11_MODULE(_hololink, m)
     m.attr("BL_I2C_BUS") = BL_I2C_BUS;
     m.attr("CAM_I2C_BUS") = CAM_I2C_BUS;
     m.attr("CLNX_SPI_BUS") = CLNX_SPI_BUS;
+    m.attr("CONTROL_BLOCK_WORDS") = CONTROL_BLOCK_WORDS;
     m.attr("CTRL_EVENT") = CTRL_EVENT;
+    m.attr("CTRL_EVT_HOST_UDP_PORT") = CTRL_EVT_HOST_UDP_PORT;
     m.attr("CTRL_EVT_SW_EVENT") = CTRL_EVT_SW_EVENT;
     m.attr("CPNX_SPI_BUS") = CPNX_SPI_BUS;
     m.attr("DP_ADDRESS_0") = DP_ADDRESS_0;
@@ -398,7 +400,9 @@ PYBIND11_MODULE(_hololink, m)
     m.attr("RD_BLOCK") = RD_BLOCK;
     m.attr("RD_DWORD") = RD_DWORD;
     m.attr("REQUEST_FLAGS_ACK_REQUEST") = REQUEST_FLAGS_ACK_REQUEST;
+    m.attr("REQUEST_FLAGS_SEQUENCE_CHECK") = REQUEST_FLAGS_SEQUENCE_CHECK;
     m.attr("RESPONSE_INVALID_CMD") = RESPONSE_INVALID_CMD;
+    m.attr("RESPONSE_SEQUENCE_CHECK_FAIL") = RESPONSE_SEQUENCE_CHECK_FAIL;
     m.attr("RESPONSE_SUCCESS") = RESPONSE_SUCCESS;
     m.attr("SPI_CTRL") = SPI_CTRL;
     m.attr("WR_BLOCK") = WR_BLOCK;
@@ -445,9 +449,19 @@ PYBIND11_MODULE(_hololink, m)
     m.def("set_hsb_log_level", &logging_wrappers::set_log_level, "level"_a,
         "Set the HSB log level");
     m.def("log_timestamp_s", &hololink::logging::log_timestamp_s);
+    m.def("set_hsb_log_async", &hololink::logging::set_hsb_log_async, "enable"_a,
+        "Queue HSB log messages to a background thread instead of writing them from the caller");
+    m.def("get_hsb_log_async", &hololink::logging::get_hsb_log_async,
+        "True if HSB log messages are written by a background thread");
+    m.def("hsb_log_dropped", &hololink::logging::hsb_log_dropped,
+        "Number of HSB log messages dropped because a thread's queue was full");
+    m.def("hsb_log_flush", &hololink::logging::hsb_log_flush,
+        "Wait until all queued HSB log messages are written", py::call_guard<py::gil_scoped_release>());
 
     // Packetizer programs
     py::class_<PacketizerProgram, std::shared_ptr<PacketizerProgram>>(m, "PacketizerProgram")
+        .def("enable", &PacketizerProgram::enable, "hololink"_a, "sif_address"_a)
+        .def("disable", &PacketizerProgram::disable, "hololink"_a, "sif_address"_a)
         .def("get_output_size", &PacketizerProgram::get_output_size, "input_size"_a);
     m.def_submodule("csi")
         .def("get_packetizer_program", &csi::get_packetizer_program, "pixel_format"_a);
@@ -475,11 +489,18 @@ PYBIND11_MODULE(_hololink, m)
         .def("set_packetizer_program", &DataChannel::set_packetizer_program);
 
     py::register_exception<TimeoutError>(m, "TimeoutError");
+
+    // Returned by Hololink.write_uint32_async and read_uint32_async.
+    py::class_<std::shared_future<bool>>(m, "WriteFuture")
+        .def("get", [](std::shared_future<bool>& me) { return me.get(); });
+    py::class_<std::shared_future<uint32_t>>(m, "ReadFuture")
+        .def("get", [](std::shared_future<uint32_t>& me) { return me.get(); });
     py::register_exception<UnsupportedVersion>(m, "UnsupportedVersion");
 
     auto hololink_module = py::class_<Hololink, PyHololink, std::shared_ptr<Hololink>>(m, "Hololink")
-                               .def(py::init<const std::string&, uint32_t, const std::string&, bool>(), "peer_ip"_a,
-                                   "control_port"_a, "serial_number"_a, "sequence_number_checking"_a)
+                               .def(py::init<const std::string&, uint32_t, const std::string&, bool, bool, bool, bool>(), "peer_ip"_a,
+                                   "control_port"_a, "serial_number"_a, "sequence_number_checking"_a,
+                                   "skip_sequence_initialization"_a = false, "ptp_enable"_a = true, "block_enable"_a = true)
                                .def_static("from_enumeration_metadata", &Hololink::from_enumeration_metadata, "metadata"_a)
                                .def_static("reset_framework", &Hololink::reset_framework)
                                .def_static("enumerated", &Hololink::enumerated, "metadata"_a)
@@ -494,13 +515,63 @@ PYBIND11_MODULE(_hololink, m)
                                    [](Hololink& me, uint32_t address, uint32_t value, const std::shared_ptr<Timeout>& timeout, bool retry) {
                                        return me.write_uint32(address, value, timeout, retry);
                                    },
-                                   "address"_a, "value"_a, "timeout"_a = std::shared_ptr<Timeout>(), "retry"_a = true)
+                                   "address"_a, "value"_a, "timeout"_a = std::shared_ptr<Timeout>(), "retry"_a = true,
+                                   py::call_guard<py::gil_scoped_release>())
                                .def(
                                    "read_uint32",
                                    [](Hololink& me, uint32_t address, const std::shared_ptr<Timeout>& timeout) {
                                        return me.read_uint32(address, timeout);
                                    },
+                                   "address"_a, "timeout"_a = std::shared_ptr<Timeout>(),
+                                   py::call_guard<py::gil_scoped_release>())
+                               .def(
+                                   "write_uint32_block",
+                                   [](Hololink& me, const std::vector<std::pair<uint32_t, uint32_t>>& address_values, const std::shared_ptr<Timeout>& timeout, bool retry) {
+                                       Hololink::WriteData write_data;
+                                       for (const auto& [address, value] : address_values) {
+                                           write_data.queue_write_uint32(address, value);
+                                       }
+                                       return me.write_uint32(write_data, timeout, retry);
+                                   },
+                                   "address_values"_a, "timeout"_a = std::shared_ptr<Timeout>(), "retry"_a = true,
+                                   "Write each (address, value) pair, in order, with a single WR_BLOCK request when block transfers are enabled; "
+                                   "at most CONTROL_BLOCK_WORDS pairs fit in one request.",
+                                   py::call_guard<py::gil_scoped_release>())
+                               .def(
+                                   "read_uint32_block",
+                                   [](Hololink& me, const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& timeout) {
+                                       return me.read_uint32(addresses, timeout);
+                                   },
+                                   "addresses"_a, "timeout"_a = std::shared_ptr<Timeout>(),
+                                   "Read each of the given addresses, in order, with a single RD_BLOCK request when block transfers are enabled; "
+                                   "returns (ok, values).  At most CONTROL_BLOCK_WORDS addresses fit in one request.",
+                                   py::call_guard<py::gil_scoped_release>())
+                               .def(
+                                   "write_uint32_async",
+                                   [](Hololink& me, uint32_t address, uint32_t value, const std::shared_ptr<Timeout>& timeout, bool retry) {
+                                       return me.write_uint32_async(address, value, timeout, retry);
+                                   },
+                                   "address"_a, "value"_a, "timeout"_a = std::shared_ptr<Timeout>(), "retry"_a = true)
+                               .def(
+                                   "read_uint32_async",
+                                   [](Hololink& me, uint32_t address, const std::shared_ptr<Timeout>& timeout) {
+                                       return me.read_uint32_async(address, timeout);
+                                   },
                                    "address"_a, "timeout"_a = std::shared_ptr<Timeout>())
+                               .def("flush_control", &Hololink::flush_control)
+                               .def("set_control_window", &Hololink::set_control_window, "control_window"_a)
+                               .def("get_control_window", &Hololink::get_control_window)
+                               .def("set_i2c_event_enable", &Hololink::set_i2c_event_enable, "i2c_event_enable"_a)
+                               .def("get_i2c_event_enable", &Hololink::get_i2c_event_enable)
+                               .def("get_i2c_event_count", &Hololink::get_i2c_event_count)
+                               .def("get_i2c_event_fallback_count", &Hololink::get_i2c_event_fallback_count)
+                               .def("set_register_cache_enable", &Hololink::set_register_cache_enable, "register_cache_enable"_a)
+                               .def("get_register_cache_enable", &Hololink::get_register_cache_enable)
+                               .def("declare_host_owned", &Hololink::declare_host_owned, "address"_a, "size"_a)
+                               .def("get_cached_uint32", &Hololink::get_cached_uint32, "address"_a)
+                               .def("invalidate_register_cache", &Hololink::invalidate_register_cache)
+                               .def("get_register_cache_hits", &Hololink::get_register_cache_hits)
+                               .def("get_register_cache_elided_writes", &Hololink::get_register_cache_elided_writes)
                                .def("setup_clock", &Hololink::setup_clock, "clock_profile"_a)
                                .def("get_i2c", &Hololink::get_i2c, "i2c_bus"_a, "i2c_address"_a = I2C_CTRL)
                                .def("get_spi", &Hololink::get_spi, "bus_number"_a, "chip_select"_a,
@@ -601,6 +672,9 @@ PYBIND11_MODULE(_hololink, m)
             &Hololink::I2c::i2c_transaction, "peripheral_i2c_address"_a, "write_bytes"_a,
             "read_byte_count"_a, "timeout"_a = std::shared_ptr<Timeout>(),
             "ignore_nak"_a = false)
+        .def("i2c_write_batch",
+            &Hololink::I2c::i2c_write_batch, "peripheral_i2c_address"_a, "transactions"_a,
+            "timeout"_a = std::shared_ptr<Timeout>())
         .def("encode_i2c_request", &Hololink::I2c::encode_i2c_request,
             "sequencer"_a,
             "peripheral_i2c_address"_a,
@@ -621,7 +695,13 @@ PYBIND11_MODULE(_hololink, m)
                     .def("get_direction", &Hololink::GPIO::get_direction, "pin"_a)
                     .def("set_value", &Hololink::GPIO::set_value, "pin"_a, "value"_a)
                     .def("get_value", &Hololink::GPIO::get_value, "pin"_a)
-                    .def("get_supported_pin_num", &Hololink::GPIO::get_supported_pin_num);
+                    .def("get_supported_pin_num", &Hololink::GPIO::get_supported_pin_num)
+                    .def("set_directions", &Hololink::GPIO::set_directions, "pin_directions"_a,
+                        "Set the direction of each pin in the {pin: IN or OUT} dict, with one read-modify-write per 32-pin bank.")
+                    .def("set_values", &Hololink::GPIO::set_values, "pin_values"_a,
+                        "Set the value of each output pin in the {pin: LOW or HIGH} dict, with one read-modify-write per 32-pin bank.")
+                    .def("set_bank_directions", &Hololink::GPIO::set_bank_directions, "bank"_a, "mask"_a, "directions"_a)
+                    .def("set_bank_values", &Hololink::GPIO::set_bank_values, "bank"_a, "mask"_a, "values"_a);
     gpio.attr("IN") = Hololink::GPIO::IN;
     gpio.attr("OUT") = Hololink::GPIO::OUT;
     gpio.attr("LOW") = Hololink::GPIO::LOW;
@@ -33,10 +33,16 @@ from ._hololink_core import (
     UDP_PACKET_SIZE,
     ArpWrapper,
     Deserializer,
+    LocalIpAndMacCacheStats,
     Reactor,
+    ReceiverTelemetry,
     Serializer,
+    TelemetryServer,
+    clear_local_ip_and_mac_cache,
     gettid,
+    handle_local_ip_and_mac_netlink_messages,
     local_ip_and_mac,
+    local_ip_and_mac_cache_stats,
     local_ip_and_mac_from_socket,
     local_mac,
     round_up,
@@ -49,12 +55,18 @@ if hasattr(sys, "getdlopenflags"):
 __all__ = [
     "ArpWrapper",
     "Deserializer",
+    "LocalIpAndMacCacheStats",
     "DEFAULT_MTU",
     "PAGE_SIZE",
     "Reactor",
+    "ReceiverTelemetry",
     "Serializer",
+    "TelemetryServer",
     "UDP_PACKET_SIZE",
+    "clear_local_ip_and_mac_cache",
+    "handle_local_ip_and_mac_netlink_messages",
     "local_ip_and_mac",
+    "local_ip_and_mac_cache_stats",
     "local_ip_and_mac_from_socket",
     "local_mac",
     "round_up",
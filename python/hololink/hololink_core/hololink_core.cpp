@@ -20,6 +20,7 @@
 #include <hololink/core/networking.hpp>
 #include <hololink/core/reactor.hpp>
 #include <hololink/core/serializer.hpp>
+#include <hololink/core/telemetry.hpp>
 
 #include <unistd.h>
 
@@ -294,6 +295,21 @@ PYBIND11_MODULE(_hololink_core, m)
 
     m.def("local_ip_and_mac_from_socket", &local_ip_and_mac_from_socket, "socket_fd"_a);
 
+    py::class_<LocalIpAndMacCacheStats>(m, "LocalIpAndMacCacheStats")
+        .def_readonly("hits", &LocalIpAndMacCacheStats::hits)
+        .def_readonly("misses", &LocalIpAndMacCacheStats::misses)
+        .def_readonly("invalidations", &LocalIpAndMacCacheStats::invalidations)
+        .def_readonly("enabled", &LocalIpAndMacCacheStats::enabled);
+
+    m.def("local_ip_and_mac_cache_stats", &local_ip_and_mac_cache_stats);
+
+    m.def("clear_local_ip_and_mac_cache", &clear_local_ip_and_mac_cache);
+
+    m.def("handle_local_ip_and_mac_netlink_messages", [](py::buffer buffer) {
+        py::buffer_info info = buffer.request();
+        handle_local_ip_and_mac_netlink_messages(static_cast<const uint8_t*>(info.ptr), info.size * info.itemsize);
+    });
+
     m.attr("UDP_PACKET_SIZE") = UDP_PACKET_SIZE;
     m.attr("PAGE_SIZE") = PAGE_SIZE;
     m.attr("DEFAULT_MTU") = DEFAULT_MTU;
@@ -334,6 +350,39 @@ PYBIND11_MODULE(_hololink_core, m)
             "Time when the alarm should fire")
         .def_readonly("sequence", &Reactor::AlarmEntry::sequence, "Sequence number for ordering");
 
+    py::class_<ReceiverTelemetry, std::shared_ptr<ReceiverTelemetry>>(m, "ReceiverTelemetry")
+        .def(py::init<const std::string&, bool>(), "receiver"_a, "shared"_a = true)
+        .def("receiver", &ReceiverTelemetry::receiver)
+        .def("instance", &ReceiverTelemetry::instance)
+        .def("shm_name", &ReceiverTelemetry::shm_name)
+        .def(
+            "counters", [](const ReceiverTelemetry& me) {
+                auto snapshot = me.snapshot();
+                py::dict r;
+                for (unsigned i = 0; i < ReceiverTelemetry::COUNTER_COUNT; i++) {
+                    r[ReceiverTelemetry::counter_name(static_cast<ReceiverTelemetry::Counter>(i))] = snapshot.counters[i];
+                }
+                return r;
+            },
+            "Returns {name: value} for each counter")
+        .def(
+            "histograms", [](const ReceiverTelemetry& me) {
+                auto snapshot = me.snapshot();
+                py::dict r;
+                for (unsigned i = 0; i < ReceiverTelemetry::TIMER_COUNT; i++) {
+                    r[ReceiverTelemetry::timer_name(static_cast<ReceiverTelemetry::Timer>(i))]
+                        = py::make_tuple(snapshot.counts[i], snapshot.sums_ns[i] / 1e9, snapshot.buckets[i]);
+                }
+                return r;
+            },
+            "Returns {name: (count, sum_s, buckets)} for each timing histogram")
+        .def_static("prometheus_text", &ReceiverTelemetry::prometheus_text)
+        .def_static("bucket_limit_s", &ReceiverTelemetry::bucket_limit_s, "bucket"_a);
+
+    py::class_<TelemetryServer, std::shared_ptr<TelemetryServer>>(m, "TelemetryServer")
+        .def(py::init<uint16_t, const std::string&>(), "port"_a = 0, "address"_a = "127.0.0.1")
+        .def("get_port", &TelemetryServer::get_port);
+
     m.def("gettid", &gettid, "Provide the thread ID");
 
 } // PYBIND11_MODULE
@@ -24,6 +24,7 @@ _MODULES = {
     "BaseReceiverOp": "base_receiver_op",
     "CheckCrcOp": "compute_crc",
     "ComputeCrcOp": "compute_crc",
+    "CpuCsiToBayerOp": "cpu_csi_to_bayer",
     "CsiToBayerOp": "csi_to_bayer",
     "FusaCoeCaptureOp": "fusa_coe_capture",
     "ImageProcessorOp": "image_processor",
@@ -15,12 +15,14 @@
 
 # See README.md for detailed information.
 
+import ctypes
 import logging
 import socket
 
 import cuda.bindings.driver as cuda
 import cupy as cp
 import holoscan
+import numpy as np
 
 import hololink as hololink_module
 
@@ -34,6 +36,9 @@ class BaseReceiverOp(holoscan.core.Operator):
         frame_size=None,
         frame_context=None,
         trim=False,
+        pages=1,
+        host_memory=False,
+        huge_pages=False,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -44,12 +49,28 @@ class BaseReceiverOp(holoscan.core.Operator):
         self._ok = False
         self._count = 0
         self._frame_size = frame_size
+        # Receivers that queue up completed frames write each one to
+        # the next of these pages in turn; see _get_next_frame.
+        if pages < 1:
+            raise ValueError(f"Invalid {pages=}; at least 1 is required.")
+        self._pages = pages
+        self._page = 0
+        # With host_memory, no CUDA calls are made: the receiver
+        # owns the (optionally huge_pages backed) frame buffers and
+        # _get_next_frame sets self._frame_address to the host address
+        # of the frame, which we emit as a numpy array.
+        self._host_memory = host_memory
+        self._huge_pages = huge_pages
+        self._frame_address = 0
         aligned_frame_size = hololink_module.round_up(
             frame_size, hololink_module.PAGE_SIZE
         )
         self._metadata_size = hololink_module.METADATA_SIZE
         self._allocation_size = aligned_frame_size + self._metadata_size
-        self._frame_memory = self._allocate(self._allocation_size)
+        if self._host_memory:
+            self._frame_memory = 0
+        else:
+            self._frame_memory = self._allocate(self._allocation_size * self._pages)
         #
         self._frame_ready_condition = holoscan.conditions.AsynchronousCondition(
             self.fragment, name="frame_ready_condition"
@@ -61,16 +82,7 @@ class BaseReceiverOp(holoscan.core.Operator):
         spec.output("output")
 
     def start(self):
-        unowned_memory = cp.cuda.UnownedMemory(
-            self._frame_memory, self._allocation_size, self
-        )
-        self._cp_frame = cp.ndarray(
-            (self._frame_size,),
-            dtype=cp.uint8,
-            memptr=cp.cuda.MemoryPointer(unowned_memory, 0),
-        )
-        self._cp_frame[:] = 0xFF
-        logging.info(f"frame_size={self._frame_size} frame={self._frame_memory}")
+        self._map_frames()
         #
         self._data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._start_receiver()
@@ -87,6 +99,33 @@ class BaseReceiverOp(holoscan.core.Operator):
         )
         self._device.start()
 
+    def _map_frames(self):
+        self._page = 0
+        if self._host_memory:
+            self._cp_frames = None
+            self._cp_frame = None
+            logging.info(f"frame_size={self._frame_size} host_memory=True")
+            return
+        unowned_memory = cp.cuda.UnownedMemory(
+            self._frame_memory, self._allocation_size * self._pages, self
+        )
+        self._cp_frames = [
+            cp.ndarray(
+                (self._frame_size,),
+                dtype=cp.uint8,
+                memptr=cp.cuda.MemoryPointer(
+                    unowned_memory, page * self._allocation_size
+                ),
+            )
+            for page in range(self._pages)
+        ]
+        for cp_frame in self._cp_frames:
+            cp_frame[:] = 0xFF
+        self._cp_frame = self._cp_frames[0]
+        logging.info(
+            f"frame_size={self._frame_size} frame={self._frame_memory} pages={self._pages}"
+        )
+
     def received_address_offset(self):
         # This address is added to the address received from HSB;
         # HSB is configured to start with address 0.
@@ -102,6 +141,7 @@ class BaseReceiverOp(holoscan.core.Operator):
         self._frame_size = 0
         del self._cp_frame
         self._cp_frame = None
+        self._cp_frames = None
 
     def _stop(self):
         raise NotImplementedError()
@@ -115,16 +155,22 @@ class BaseReceiverOp(holoscan.core.Operator):
         self._frame_ready_condition.event_state = (
             holoscan.conditions.AsynchronousEventState.EVENT_WAITING
         )
+        # If more frames are queued up, make sure we're scheduled again.
+        if self._frames_pending():
+            self.frame_ready()
         self._count += 1
         self._ok = True
         # Publish the metadata from get_next_frame out to the pipeline.
         for key, value in metadata.items():
             self.metadata[key] = value
-        out = self._cp_frame
+        if self._host_memory:
+            out = self._host_frame(self._frame_address)
+        else:
+            out = self._cp_frames[self._page]
         if self._trim:
             bytes_written = metadata.get("bytes_written", self._frame_size)
             if (bytes_written >= 0) and (bytes_written <= self._frame_size):
-                out = self._cp_frame[:bytes_written]
+                out = out[:bytes_written]
         op_output.emit({"": out}, "output")
 
     def timeout(self, op_input, op_output, context):
@@ -136,9 +182,20 @@ class BaseReceiverOp(holoscan.core.Operator):
         return None
 
     def _get_next_frame(self, timeout_ms):
-        """Returns metadata: dict or None"""
+        """Returns metadata: dict or None; receivers using more than
+        one page set self._page to the page holding this frame."""
         raise NotImplementedError()
 
+    def _frames_pending(self):
+        """Returns True if _get_next_frame won't block."""
+        return False
+
+    def _host_frame(self, address):
+        """Returns a numpy view (without copying) of the frame
+        at the given host address."""
+        buffer = (ctypes.c_uint8 * self._frame_size).from_address(address)
+        return np.frombuffer(buffer, dtype=np.uint8)
+
     def _allocate(self, size, flags=0):
         (cu_result,) = cuda.cuInit(0)
         assert cu_result == cuda.CUresult.CUDA_SUCCESS
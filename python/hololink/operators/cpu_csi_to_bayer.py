@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+
+import holoscan
+import numpy as np
+
+import hololink as hololink_module
+
+from .. import csi_codec
+
+
+class CpuCsiToBayerOp(holoscan.core.Operator):
+    """Host memory version of CsiToBayerOp, for systems without a GPU:
+    receives CSI frames in a 1-dimensional host tensor and emits
+    (pixel_height, pixel_width, 1) uint16 bayer images, with pixel
+    values in the upper bits, as out_tensor_name. Sensors configure it
+    the same way they configure CsiToBayerOp.
+    """
+
+    def __init__(self, *args, out_tensor_name="", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._out_tensor_name = out_tensor_name
+        self._configured = False
+
+    def setup(self, spec):
+        logging.info("setup")
+        spec.input("input")
+        spec.output("output")
+
+    def start(self):
+        if not self._configured:
+            raise RuntimeError("CpuCsiToBayerOp is not configured.")
+
+    def stop(self):
+        pass
+
+    def compute(self, op_input, op_output, context):
+        in_message = op_input.receive("input")
+        csi_frame = np.from_dlpack(in_message.get(""))
+        if csi_frame.ndim != 1:
+            raise RuntimeError("Tensor must be one dimensional")
+        image = np.empty((self._pixel_height, self._pixel_width, 1), dtype=np.uint16)
+        csi_codec.unpack(
+            csi_frame,
+            self._pixel_format,
+            self._pixel_width,
+            self._pixel_height,
+            start_byte=self._start_byte,
+            bytes_per_line=self._bytes_per_line,
+            out=image,
+            msb_aligned=True,
+        )
+        op_output.emit({self._out_tensor_name: image}, "output")
+
+    def receiver_start_byte(self):
+        # HSB, in this mode, doesn't insert any stuff in the front of received data.
+        return 0
+
+    def received_line_bytes(self, transmitted_line_bytes):
+        # Bytes are padded to 8.
+        return hololink_module.round_up(transmitted_line_bytes, 8)
+
+    def transmitted_line_bytes(self, pixel_format, pixel_width):
+        return csi_codec.transmitted_line_bytes(pixel_format, pixel_width)
+
+    def configure(
+        self,
+        start_byte,
+        bytes_per_line,
+        pixel_width,
+        pixel_height,
+        pixel_format,
+        trailing_bytes=0,
+    ):
+        logging.info(
+            f"{start_byte=}, {bytes_per_line=}, {pixel_width=}, {pixel_height=}, {pixel_format=}, {trailing_bytes=}."
+        )
+        self._start_byte = start_byte
+        self._bytes_per_line = bytes_per_line
+        self._pixel_width = pixel_width
+        self._pixel_height = pixel_height
+        self._pixel_format = pixel_format
+        self._csi_length = start_byte + bytes_per_line * pixel_height + trailing_bytes
+        self._configured = True
+
+    def get_csi_length(self):
+        if not self._configured:
+            raise RuntimeError("CpuCsiToBayerOp is not configured.")
+        return self._csi_length
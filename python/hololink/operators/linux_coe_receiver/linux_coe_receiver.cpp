@@ -19,6 +19,7 @@
 
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h> // for missing_regions
 
 using pybind11::literals::operator""_a;
 
@@ -40,7 +41,9 @@ PYBIND11_MODULE(_linux_coe_receiver, m)
     // NOTE: pybind11 never implicitly release the GIL (see https://pybind11.readthedocs.io/en/stable/advanced/misc.html#global-interpreter-lock-gil),
     //       therefore for blocking function explicitly release the GIL using `py::call_guard<py::gil_scoped_release>()`.
     py::class_<LinuxCoeReceiver>(m, "LinuxCoeReceiver")
-        .def(py::init<CUdeviceptr, size_t, int, uint16_t>(), "cu_buffer"_a, "cu_buffer_size"_a, "socket"_a, "channel"_a)
+        .def(py::init<CUdeviceptr, size_t, int, uint16_t, unsigned, unsigned, unsigned, size_t, bool, bool, bool, bool>(), "cu_buffer"_a, "cu_buffer_size"_a, "socket"_a, "channel"_a,
+            "ring_block_size"_a = 0, "ring_block_count"_a = 0, "pages"_a = 1, "cu_page_size"_a = 0, "track_missing"_a = false, "fill_missing"_a = true,
+            "host_memory"_a = false, "huge_pages"_a = false)
         .def("run", &LinuxCoeReceiver::run, py::call_guard<py::gil_scoped_release>())
         .def("close", &LinuxCoeReceiver::close)
         .def(
@@ -50,7 +53,21 @@ PYBIND11_MODULE(_linux_coe_receiver, m)
                 return std::make_tuple(success, metadata);
             },
             py::call_guard<py::gil_scoped_release>(), "timeout_ms"_a)
-        .def("set_frame_ready", &LinuxCoeReceiver::set_frame_ready, "frame_ready"_a);
+        .def("set_frame_ready", &LinuxCoeReceiver::set_frame_ready, "frame_ready"_a)
+        .def("get_telemetry", &LinuxCoeReceiver::get_telemetry)
+        .def("get_ring_statistics", &LinuxCoeReceiver::get_ring_statistics)
+        .def("get_pages", &LinuxCoeReceiver::get_pages)
+        .def("get_host_memory", &LinuxCoeReceiver::get_host_memory)
+        .def("frames_pending", &LinuxCoeReceiver::frames_pending);
+
+    py::class_<LinuxCoeReceiverRingStatistics>(m, "LinuxCoeReceiverRingStatistics")
+        .def_readonly("ring_enabled", &LinuxCoeReceiverRingStatistics::ring_enabled)
+        .def_readonly("block_size", &LinuxCoeReceiverRingStatistics::block_size)
+        .def_readonly("block_count", &LinuxCoeReceiverRingStatistics::block_count)
+        .def_readonly("blocks_seen", &LinuxCoeReceiverRingStatistics::blocks_seen)
+        .def_readonly("kernel_packets", &LinuxCoeReceiverRingStatistics::kernel_packets)
+        .def_readonly("kernel_drops", &LinuxCoeReceiverRingStatistics::kernel_drops)
+        .def_readonly("freeze_count", &LinuxCoeReceiverRingStatistics::freeze_count);
 
     py::class_<LinuxCoeReceiverMetadata>(m, "LinuxCoeReceiverMetadata")
         .def_readonly("frame_packets_received", &LinuxCoeReceiverMetadata::frame_packets_received)
@@ -62,6 +79,12 @@ PYBIND11_MODULE(_linux_coe_receiver, m)
         .def_readonly("frame_end_ns", &LinuxCoeReceiverMetadata::frame_end_ns)
         .def_readonly("received_s", &LinuxCoeReceiverMetadata::received_s)
         .def_readonly("received_ns", &LinuxCoeReceiverMetadata::received_ns)
+        .def_readonly("page", &LinuxCoeReceiverMetadata::page)
+        .def_readonly("frame_memory", &LinuxCoeReceiverMetadata::frame_memory)
+        .def_readonly("ring_occupancy", &LinuxCoeReceiverMetadata::ring_occupancy)
+        .def_readonly("ring_overwrites", &LinuxCoeReceiverMetadata::ring_overwrites)
+        .def_readonly("missing_regions", &LinuxCoeReceiverMetadata::missing_regions)
+        .def_readonly("missing_bytes", &LinuxCoeReceiverMetadata::missing_bytes)
         .def_property_readonly("timestamp_s", [](LinuxCoeReceiverMetadata& me) {
             return me.frame_metadata.timestamp_s;
         })
@@ -21,7 +21,6 @@ import socket
 import threading
 
 import cuda.bindings.driver as cuda
-import cupy as cp
 import holoscan
 
 import hololink as hololink_module
@@ -36,6 +35,10 @@ class LinuxCoeReceiverOp(hololink_module.operators.BaseReceiverOp):
         pixel_width=None,
         coe_channel=0,
         rename_metadata=lambda original_name: original_name,
+        ring_block_size=1 << 22,
+        ring_block_count=0,
+        track_missing=False,
+        fill_missing=True,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -43,6 +46,17 @@ class LinuxCoeReceiverOp(hololink_module.operators.BaseReceiverOp):
         self._coe_interface = coe_interface
         self._pixel_width = pixel_width
         self._coe_channel = coe_channel
+        # With ring_block_count > 0, the receiver walks a memory-mapped
+        # TPACKET_V3 ring of that many blocks (each ring_block_size bytes)
+        # instead of calling recv() for each packet.
+        self._ring_block_size = ring_block_size
+        self._ring_block_count = ring_block_count
+        # track_missing skips clearing the receive buffer before each
+        # frame, publishing the regions we didn't receive (as
+        # "missing_regions" and "missing_bytes") instead; fill_missing
+        # sets just those regions to 0xFF.
+        self._track_missing = track_missing
+        self._fill_missing = fill_missing
         self._vlan_enabled = False
         if self._receiver_affinity is None:
             # By default, run us on the third core in the system;
@@ -73,18 +87,13 @@ class LinuxCoeReceiverOp(hololink_module.operators.BaseReceiverOp):
         self._crc_metadata = rename_metadata("crc")
         self._psn_metadata = rename_metadata("psn")
         self._bytes_written_metadata = rename_metadata("bytes_written")
+        self._ring_occupancy_metadata = rename_metadata("ring_occupancy")
+        self._ring_overwrites_metadata = rename_metadata("ring_overwrites")
+        self._missing_regions_metadata = rename_metadata("missing_regions")
+        self._missing_bytes_metadata = rename_metadata("missing_bytes")
 
     def start(self):
-        unowned_memory = cp.cuda.UnownedMemory(
-            self._frame_memory, self._allocation_size, self
-        )
-        self._cp_frame = cp.ndarray(
-            (self._frame_size,),
-            dtype=cp.uint8,
-            memptr=cp.cuda.MemoryPointer(unowned_memory, 0),
-        )
-        self._cp_frame[:] = 0xFF
-        logging.info(f"frame_size={self._frame_size} frame={self._frame_memory}")
+        self._map_frames()
         self._start_receiver()
         self._hololink_channel.configure_coe(
             self._coe_channel, self._frame_size, self._pixel_width, self._vlan_enabled
@@ -106,6 +115,14 @@ class LinuxCoeReceiverOp(hololink_module.operators.BaseReceiverOp):
             self._allocation_size,
             self._data_socket.fileno(),
             self._coe_channel,
+            ring_block_size=self._ring_block_size,
+            ring_block_count=self._ring_block_count,
+            pages=self._pages,
+            cu_page_size=self._allocation_size,
+            track_missing=self._track_missing,
+            fill_missing=self._fill_missing,
+            host_memory=self._host_memory,
+            huge_pages=self._huge_pages,
         )
 
         def _ready(receiver):
@@ -118,20 +135,36 @@ class LinuxCoeReceiverOp(hololink_module.operators.BaseReceiverOp):
         self._receiver_thread.start()
 
     def _run(self):
-        cuda.cuCtxSetCurrent(self._frame_context)
+        if not self._host_memory:
+            cuda.cuCtxSetCurrent(self._frame_context)
         if self._receiver_affinity:
             os.sched_setaffinity(0, self._receiver_affinity)
         self._receiver.run()
 
     def _stop(self):
-        self._data_socket.close()
         self._receiver.close()
         self._receiver_thread.join()
+        statistics = self._receiver.get_ring_statistics()
+        if statistics.ring_enabled:
+            logging.info(
+                f"blocks_seen={statistics.blocks_seen} "
+                f"kernel_packets={statistics.kernel_packets} "
+                f"kernel_drops={statistics.kernel_drops} "
+                f"freeze_count={statistics.freeze_count}"
+            )
+        self._data_socket.close()
+
+    def get_ring_statistics(self):
+        """Returns LinuxCoeReceiverRingStatistics, useful for sizing
+        ring_block_size and ring_block_count."""
+        return self._receiver.get_ring_statistics()
 
     def _get_next_frame(self, timeout_ms):
         ok, receiver_metadata = self._receiver.get_next_frame(timeout_ms)
         if not ok:
             return None
+        self._page = receiver_metadata.page
+        self._frame_address = receiver_metadata.frame_memory
         application_metadata = {
             self._frame_packets_received_metadata: receiver_metadata.frame_packets_received,
             self._frame_bytes_received_metadata: receiver_metadata.frame_bytes_received,
@@ -150,5 +183,17 @@ class LinuxCoeReceiverOp(hololink_module.operators.BaseReceiverOp):
             self._crc_metadata: receiver_metadata.crc,
             self._psn_metadata: receiver_metadata.psn,
             self._bytes_written_metadata: receiver_metadata.bytes_written,
+            self._ring_occupancy_metadata: receiver_metadata.ring_occupancy,
+            self._ring_overwrites_metadata: receiver_metadata.ring_overwrites,
         }
+        if self._track_missing:
+            application_metadata[self._missing_regions_metadata] = (
+                receiver_metadata.missing_regions
+            )
+            application_metadata[self._missing_bytes_metadata] = (
+                receiver_metadata.missing_bytes
+            )
         return application_metadata
+
+    def _frames_pending(self):
+        return self._receiver.frames_pending() > 0
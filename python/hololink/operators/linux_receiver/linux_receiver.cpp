@@ -19,6 +19,7 @@
 
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h> // for missing_regions
 
 using pybind11::literals::operator""_a;
 
@@ -40,7 +41,9 @@ PYBIND11_MODULE(_linux_receiver, m)
     // NOTE: pybind11 never implicitly release the GIL (see https://pybind11.readthedocs.io/en/stable/advanced/misc.html#global-interpreter-lock-gil),
     //       therefore for blocking function explicitly release the GIL using `py::call_guard<py::gil_scoped_release>()`.
     py::class_<LinuxReceiver>(m, "LinuxReceiver")
-        .def(py::init<CUdeviceptr, size_t, int, uint64_t>(), "cu_buffer"_a, "cu_buffer_size"_a, "socket"_a, "received_address_offset"_a)
+        .def(py::init<CUdeviceptr, size_t, int, uint64_t, unsigned, bool, unsigned, size_t, bool, bool, bool, bool>(), "cu_buffer"_a, "cu_buffer_size"_a, "socket"_a, "received_address_offset"_a,
+            "batch_size"_a = 1, "kernel_timestamps"_a = false, "pages"_a = 1, "cu_page_size"_a = 0, "track_missing"_a = false, "fill_missing"_a = true,
+            "host_memory"_a = false, "huge_pages"_a = false)
         .def("run", &LinuxReceiver::run, py::call_guard<py::gil_scoped_release>())
         .def("close", &LinuxReceiver::close)
         .def(
@@ -52,7 +55,12 @@ PYBIND11_MODULE(_linux_receiver, m)
             py::call_guard<py::gil_scoped_release>(), "timeout_ms"_a)
         .def("get_qp_number", &LinuxReceiver::get_qp_number)
         .def("get_rkey", &LinuxReceiver::get_rkey)
-        .def("set_frame_ready", &LinuxReceiver::set_frame_ready, "frame_ready"_a);
+        .def("get_batch_size", &LinuxReceiver::get_batch_size)
+        .def("get_pages", &LinuxReceiver::get_pages)
+        .def("get_host_memory", &LinuxReceiver::get_host_memory)
+        .def("frames_pending", &LinuxReceiver::frames_pending)
+        .def("set_frame_ready", &LinuxReceiver::set_frame_ready, "frame_ready"_a)
+        .def("get_telemetry", &LinuxReceiver::get_telemetry);
 
     py::class_<LinuxReceiverMetadata>(m, "LinuxReceiverMetadata")
         .def_readonly("frame_packets_received", &LinuxReceiverMetadata::frame_packets_received)
@@ -66,6 +74,12 @@ PYBIND11_MODULE(_linux_receiver, m)
         .def_readonly("packets_dropped", &LinuxReceiverMetadata::packets_dropped)
         .def_readonly("received_s", &LinuxReceiverMetadata::received_s)
         .def_readonly("received_ns", &LinuxReceiverMetadata::received_ns)
+        .def_readonly("page", &LinuxReceiverMetadata::page)
+        .def_readonly("frame_memory", &LinuxReceiverMetadata::frame_memory)
+        .def_readonly("ring_occupancy", &LinuxReceiverMetadata::ring_occupancy)
+        .def_readonly("ring_overwrites", &LinuxReceiverMetadata::ring_overwrites)
+        .def_readonly("missing_regions", &LinuxReceiverMetadata::missing_regions)
+        .def_readonly("missing_bytes", &LinuxReceiverMetadata::missing_bytes)
         .def_property_readonly("timestamp_s", [](LinuxReceiverMetadata& me) {
             return me.frame_metadata.timestamp_s;
         })
@@ -61,7 +61,9 @@ public:
     // Define a constructor that fully initializes the object.
     PyLinuxReceiverOp(holoscan::Fragment* fragment, const py::args& args,
         py::object hololink_channel, py::object device, py::object frame_context, size_t frame_size,
-        py::object receiver_affinity, py::object rename_metadata, const std::string& name, bool trim)
+        py::object receiver_affinity, py::object rename_metadata, const std::string& name, bool trim,
+        uint32_t batch_size, bool kernel_timestamps, uint32_t pages, bool track_missing,
+        bool fill_missing, bool host_memory, bool huge_pages)
         : LinuxReceiverOp(holoscan::ArgList {
             holoscan::Arg { "hololink_channel", py::cast<DataChannel*>(hololink_channel) },
             holoscan::Arg { "device_start", std::function<void()>([this]() {
@@ -75,7 +77,14 @@ public:
             holoscan::Arg {
                 "frame_context", reinterpret_cast<CUcontext>(frame_context.cast<int64_t>()) },
             holoscan::Arg { "frame_size", frame_size },
-            holoscan::Arg { "trim", trim } })
+            holoscan::Arg { "trim", trim },
+            holoscan::Arg { "batch_size", batch_size },
+            holoscan::Arg { "kernel_timestamps", kernel_timestamps },
+            holoscan::Arg { "pages", pages },
+            holoscan::Arg { "track_missing", track_missing },
+            holoscan::Arg { "fill_missing", fill_missing },
+            holoscan::Arg { "host_memory", host_memory },
+            holoscan::Arg { "huge_pages", huge_pages } })
         , device_(device)
     {
         add_positional_condition_and_resource_args(this, args);
@@ -148,9 +157,11 @@ PYBIND11_MODULE(_linux_receiver_op, m)
     py::class_<LinuxReceiverOp, PyLinuxReceiverOp, holoscan::Operator,
         std::shared_ptr<LinuxReceiverOp>>(m, "LinuxReceiverOp")
         .def(py::init<holoscan::Fragment*, const py::args&, py::object, py::object, py::object,
-                 size_t, py::object, py::object, const std::string&, bool>(),
+                 size_t, py::object, py::object, const std::string&, bool, uint32_t, bool, uint32_t, bool, bool, bool, bool>(),
             "fragment"_a, "hololink_channel"_a, "device"_a, "frame_context"_a, "frame_size"_a,
-            "receiver_affinity"_a = py::none(), "rename_metadata"_a = py::none(), "name"_a = "linux_receiver"s, "trim"_a = false)
+            "receiver_affinity"_a = py::none(), "rename_metadata"_a = py::none(), "name"_a = "linux_receiver"s, "trim"_a = false,
+            "batch_size"_a = 1, "kernel_timestamps"_a = false, "pages"_a = 1, "track_missing"_a = false,
+            "fill_missing"_a = true, "host_memory"_a = false, "huge_pages"_a = false)
         .def("get_next_frame", &LinuxReceiverOp::get_next_frame, "timeout_ms"_a)
         .def("setup", &LinuxReceiverOp::setup, "spec"_a)
         .def("start", &LinuxReceiverOp::start)
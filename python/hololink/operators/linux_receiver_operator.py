@@ -36,10 +36,25 @@ class LinuxReceiverOperator(hololink_module.operators.BaseReceiverOp):
         *args,
         receiver_affinity=None,
         rename_metadata=lambda original_name: original_name,
+        batch_size=1,
+        kernel_timestamps=False,
+        track_missing=False,
+        fill_missing=True,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
         self._receiver_affinity = receiver_affinity
+        # batch_size > 1 fetches up to that many packets with each
+        # recvmmsg call; kernel_timestamps selects per-packet
+        # SO_TIMESTAMPNS receive times instead of one timestamp per batch.
+        self._batch_size = batch_size
+        self._kernel_timestamps = kernel_timestamps
+        # track_missing skips clearing the receive buffer before each
+        # frame, publishing the regions we didn't receive (as
+        # "missing_regions" and "missing_bytes") instead; fill_missing
+        # sets just those regions to 0xFF.
+        self._track_missing = track_missing
+        self._fill_missing = fill_missing
         if self._receiver_affinity is None:
             # By default, run us on the third core in the system;
             # run with HOLOLINK_AFFINITY=<n> to use a different core or
@@ -66,6 +81,10 @@ class LinuxReceiverOperator(hololink_module.operators.BaseReceiverOp):
         self._crc_metadata = rename_metadata("crc")
         self._psn_metadata = rename_metadata("psn")
         self._bytes_written_metadata = rename_metadata("bytes_written")
+        self._ring_occupancy_metadata = rename_metadata("ring_occupancy")
+        self._ring_overwrites_metadata = rename_metadata("ring_overwrites")
+        self._missing_regions_metadata = rename_metadata("missing_regions")
+        self._missing_bytes_metadata = rename_metadata("missing_bytes")
 
     def _start_receiver(self):
         self._check_buffer_size(self._frame_size)
@@ -75,6 +94,14 @@ class LinuxReceiverOperator(hololink_module.operators.BaseReceiverOp):
             self._frame_size,
             self._data_socket.fileno(),
             self.received_address_offset(),
+            batch_size=self._batch_size,
+            kernel_timestamps=self._kernel_timestamps,
+            pages=self._pages,
+            cu_page_size=self._allocation_size,
+            track_missing=self._track_missing,
+            fill_missing=self._fill_missing,
+            host_memory=self._host_memory,
+            huge_pages=self._huge_pages,
         )
 
         def _ready(receiver):
@@ -90,7 +117,8 @@ class LinuxReceiverOperator(hololink_module.operators.BaseReceiverOp):
         )
 
     def _run(self):
-        cuda.cuCtxSetCurrent(self._frame_context)
+        if not self._host_memory:
+            cuda.cuCtxSetCurrent(self._frame_context)
         if self._receiver_affinity:
             os.sched_setaffinity(0, self._receiver_affinity)
         self._receiver.run()
@@ -105,6 +133,8 @@ class LinuxReceiverOperator(hololink_module.operators.BaseReceiverOp):
         ok, receiver_metadata = self._receiver.get_next_frame(timeout_ms)
         if not ok:
             return None
+        self._page = receiver_metadata.page
+        self._frame_address = receiver_metadata.frame_memory
         application_metadata = {
             self._frame_packets_received_metadata: receiver_metadata.frame_packets_received,
             self._frame_bytes_received_metadata: receiver_metadata.frame_bytes_received,
@@ -120,9 +150,21 @@ class LinuxReceiverOperator(hololink_module.operators.BaseReceiverOp):
             self._crc_metadata: receiver_metadata.crc,
             self._psn_metadata: receiver_metadata.psn,
             self._bytes_written_metadata: receiver_metadata.bytes_written,
+            self._ring_occupancy_metadata: receiver_metadata.ring_occupancy,
+            self._ring_overwrites_metadata: receiver_metadata.ring_overwrites,
         }
+        if self._track_missing:
+            application_metadata[self._missing_regions_metadata] = (
+                receiver_metadata.missing_regions
+            )
+            application_metadata[self._missing_bytes_metadata] = (
+                receiver_metadata.missing_bytes
+            )
         return application_metadata
 
+    def _frames_pending(self):
+        return self._receiver.frames_pending() > 0
+
     def _check_buffer_size(self, data_memory_size):
         receiver_buffer_size = self._data_socket.getsockopt(
             socket.SOL_SOCKET, socket.SO_RCVBUF
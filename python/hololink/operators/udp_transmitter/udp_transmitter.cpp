@@ -53,13 +53,15 @@ public:
     using UdpTransmitterOp::UdpTransmitterOp;
 
     // Define a constructor that fully initializes the object.
-    PyUdpTransmitterOp(holoscan::Fragment* fragment, const py::args& args, const std::string& dst_ip, uint16_t dst_port, uint16_t max_buffer_size, uint16_t queue_size, bool lossy, const std::string& name)
+    PyUdpTransmitterOp(holoscan::Fragment* fragment, const py::args& args, const std::string& dst_ip, uint16_t dst_port, uint16_t max_buffer_size, uint16_t queue_size, bool lossy, uint16_t segment_size, uint16_t batch_size, const std::string& name)
         : UdpTransmitterOp(holoscan::ArgList {
             holoscan::Arg { "ip", dst_ip },
             holoscan::Arg { "port", dst_port },
             holoscan::Arg { "max_buffer_size", max_buffer_size },
             holoscan::Arg { "queue_size", queue_size },
-            holoscan::Arg { "lossy", lossy } })
+            holoscan::Arg { "lossy", lossy },
+            holoscan::Arg { "segment_size", segment_size },
+            holoscan::Arg { "batch_size", batch_size } })
     {
         add_positional_condition_and_resource_args(this, args);
         name_ = name;
@@ -77,16 +79,29 @@ PYBIND11_MODULE(_udp_transmitter, m)
     m.attr("__version__") = "dev";
 #endif
 
+    py::class_<UdpTransmitterOp::Metrics>(m, "UdpTransmitterMetrics")
+        .def_readonly("tensors_sent", &UdpTransmitterOp::Metrics::tensors_sent)
+        .def_readonly("tensors_dropped", &UdpTransmitterOp::Metrics::tensors_dropped)
+        .def_readonly("send_errors", &UdpTransmitterOp::Metrics::send_errors)
+        .def_readonly("datagrams_sent", &UdpTransmitterOp::Metrics::datagrams_sent)
+        .def_readonly("bytes_sent", &UdpTransmitterOp::Metrics::bytes_sent)
+        .def_readonly("last_send_latency_s", &UdpTransmitterOp::Metrics::last_send_latency_s)
+        .def_readonly("max_send_latency_s", &UdpTransmitterOp::Metrics::max_send_latency_s)
+        .def_readonly("total_send_latency_s", &UdpTransmitterOp::Metrics::total_send_latency_s);
+
     py::class_<UdpTransmitterOp, PyUdpTransmitterOp, holoscan::Operator,
         std::shared_ptr<UdpTransmitterOp>>(m, "UdpTransmitterOp")
-        .def(py::init<holoscan::Fragment*, const py::args&, const std::string&, uint16_t, uint16_t, uint16_t, bool, const std::string&>(),
+        .def(py::init<holoscan::Fragment*, const py::args&, const std::string&, uint16_t, uint16_t, uint16_t, bool, uint16_t, uint16_t, const std::string&>(),
             "fragment"_a,
             "ip"_a,
             "port"_a,
             "max_buffer_size"_a = 65507,
             "queue_size"_a = 1,
             "lossy"_a = true,
-            "name"_a = "udp_transmitter"s);
+            "segment_size"_a = 0,
+            "batch_size"_a = 64,
+            "name"_a = "udp_transmitter"s)
+        .def("get_metrics", &UdpTransmitterOp::get_metrics);
 
 } // PYBIND11_MODULE
 
@@ -30,6 +30,7 @@ _MODULES = [
     "fr_imx676",
     "fr_imx678",
     "fr_imx900",
+    "register_table",
 ]
 
 _OBJECTS = {
@@ -66,6 +66,8 @@ class Imx676Cam:
     #configure reset pin on gpio expander
     def configure_gpio_expander(self):
         logging.info("Configure GPIO expander")
+        # The expander may have been reset since we last looked.
+        self._gpio_expander.invalidate()
         self._i2c_expander.configure(self._i2c_expander_configuration.value)
         self._gpio_expander.set_direction_gpio(li_gpio_expander.GPIO_Expander_pin.CAM_RST, "OUTPUT")
         self._gpio_expander.set_output_gpio(li_gpio_expander.GPIO_Expander_pin.CAM_RST, 0)
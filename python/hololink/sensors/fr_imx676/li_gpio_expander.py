@@ -46,8 +46,18 @@ class GPIO_Expander_pin(Enum):
 class LIGPIOExpander:
     GPIO_EXPANDER_ADDRESS = 0x20
 
+    # Only the host changes these, so once we know what's in them, we
+    # don't have to read them again.
+    CACHED_REGISTERS = (OUTPUT_PORT_REGISTER, CONFIGURATION_REGISTER)
+
     def __init__(self, hololink, i2c_address):
         self._i2c = hololink.get_i2c(i2c_address)
+        self._cache = {}
+
+    def invalidate(self):
+        """Forget the cached register values, e.g. after the expander
+        is power cycled."""
+        self._cache = {}
 
     def set_register(self, register, value, timeout=None):
         logging.debug(
@@ -65,7 +75,14 @@ class LIGPIOExpander:
             read_byte_count,
             timeout=timeout,
         )
-    
+        if register in self.CACHED_REGISTERS:
+            self._cache[register] = value
+
+    def get_cached_register(self, register):
+        if register not in self._cache:
+            self._cache[register] = self.get_register(register)
+        return self._cache[register]
+
     def get_register(self, register):
         logging.debug("get_gpio_expander_register(register=%d(0x%X))"
                       % (register, register))
@@ -86,26 +103,45 @@ class LIGPIOExpander:
         return r
 
 
+    def update_register(self, register, mask, value):
+        """Set the bits in mask to those in value with one
+        read-modify-write (or none, if we already know the register
+        has those bits)."""
+        current = self.get_cached_register(register)
+        updated = (current & ~mask) | (value & mask)
+        if updated != current:
+            self.set_register(register, updated)
+
+    def set_direction_gpios(self, directions):
+        """directions is {GPIO_Expander_pin: "OUTPUT" or "INPUT"}."""
+        mask, value = 0, 0
+        for gpio, direction in directions.items():
+            if direction == "OUTPUT":
+                pass
+            elif direction == "INPUT":
+                value |= (1 << gpio.value)
+            else:
+                logging.error("Incorrect GPIO direction")
+                return
+            mask |= (1 << gpio.value)
+        self.update_register(CONFIGURATION_REGISTER, mask, value)
+
+    def set_output_gpios(self, values):
+        """values is {GPIO_Expander_pin: 0 or 1}."""
+        mask, value = 0, 0
+        for gpio, output in values.items():
+            if output == 1:
+                value |= (1 << gpio.value)
+            elif output == 0:
+                pass
+            else:
+                logging.error("Incorrect GPIO output state")
+                return
+            mask |= (1 << gpio.value)
+        self.update_register(OUTPUT_PORT_REGISTER, mask, value)
+
     def set_direction_gpio(self, gpio, direciton):
-        gpio_sate = self.get_register(CONFIGURATION_REGISTER)
-        
-        if direciton == "OUTPUT":
-            gpio_sate &= ~(1 << gpio.value)
-            self.set_register(CONFIGURATION_REGISTER, gpio_sate)
-        elif direciton == "INPUT":
-            gpio_sate |= (1 << gpio.value)
-            self.set_register(CONFIGURATION_REGISTER, gpio_sate)
-        else:
-            logging.error("Incorrect GPIO direction")
+        self.set_direction_gpios({gpio: direciton})
 
     def set_output_gpio(self, gpio, value):
-        gpio_value = self.get_register(OUTPUT_PORT_REGISTER)
-
-        if value == 1:
-            gpio_value |= (1 << gpio.value)
-            self.set_register(OUTPUT_PORT_REGISTER, gpio_value)
-        elif value == 0:
-            gpio_value &= ~(1 << gpio.value)
-            self.set_register(OUTPUT_PORT_REGISTER, gpio_value)
-        else:
-            logging.error("Incorrect GPIO output state")
+        self.set_output_gpios({gpio: value})
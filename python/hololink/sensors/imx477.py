@@ -20,6 +20,8 @@ import time
 
 import hololink as hololink_module
 
+from . import register_table
+
 # Camera info
 DRIVER_NAME = "IMX477"
 
@@ -929,11 +931,12 @@ class Imx477:
 
     def configure(self):
         self.set_mode()
-        for reg, val in self._mode:
-            if reg == IMX477_TABLE_WAIT_MS or reg == IMX477_TABLE_END:
-                time.sleep(val / 1000)  # the val is in ms
-            else:
-                self.set_register(reg, val)
+        plan = register_table.plan(
+            (DRIVER_NAME, self._width, self._height),
+            self._mode,
+            (IMX477_TABLE_WAIT_MS, IMX477_TABLE_END),
+        )
+        plan.replay(self._i2c, CAM_I2C_ADDRESS)
 
     def set_pattern(self):
         """Set camera mode. Currently supports RAW8 Pixel format only"""
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+"""
+Sensor mode tables are lists of (register, value) pairs, with
+special register values that mean "wait this many milliseconds".
+Writing these one register at a time costs several control plane
+round trips per entry; here we compile a table into a plan that
+writes each run of consecutive registers as a single I2C transaction,
+and sends all the transactions between waits to HSB as one batch.
+"""
+
+import logging
+import time
+
+# encode_i2c_request won't write more than this many bytes,
+# which includes the register address.
+MAX_WRITE_BYTES = 256
+
+
+class RegisterTablePlan:
+    """
+    A compiled register table: a list of steps, each either
+    ("write", transactions) where transactions is a list of
+    bytearrays to write, or ("wait", milliseconds).
+    """
+
+    def __init__(self, steps, register_count):
+        self._steps = steps
+        self._register_count = register_count
+
+    def steps(self):
+        return self._steps
+
+    def register_count(self):
+        """How many register writes the original table had."""
+        return self._register_count
+
+    def transaction_count(self):
+        """How many I2C transactions replay() executes."""
+        return sum(
+            len(transactions) for op, transactions in self._steps if op == "write"
+        )
+
+    def replay(self, i2c, peripheral_i2c_address, timeout=None):
+        for op, arg in self._steps:
+            if op == "wait":
+                time.sleep(arg / 1000)  # arg is in ms
+            else:
+                i2c.i2c_write_batch(peripheral_i2c_address, arg, timeout=timeout)
+
+
+def compile_table(
+    table, wait_registers, register_bytes=2, max_write_bytes=MAX_WRITE_BYTES
+):
+    """
+    Compile a list of (register, value) pairs with 8-bit values
+    into a RegisterTablePlan.  Entries whose register is in
+    wait_registers are delays of value milliseconds; writes
+    are never moved across those.  Otherwise, successive entries
+    whose registers are consecutive are merged into a single
+    I2C transaction, relying on the peripheral's address
+    auto-increment.  Table order is always preserved.
+    """
+    steps = []
+    transactions = []
+    register_count = 0
+    next_register = None
+    for register, value in table:
+        if register in wait_registers:
+            if len(transactions) > 0:
+                steps.append(("write", transactions))
+                transactions = []
+            next_register = None
+            steps.append(("wait", value))
+            continue
+        register_count += 1
+        if (register == next_register) and (len(transactions[-1]) < max_write_bytes):
+            transactions[-1].append(value)
+        else:
+            transaction = bytearray(register.to_bytes(register_bytes, "big"))
+            transaction.append(value)
+            transactions.append(transaction)
+        next_register = register + 1
+    if len(transactions) > 0:
+        steps.append(("write", transactions))
+    r = RegisterTablePlan(steps, register_count)
+    logging.debug(
+        f"compile_table: {register_count=} transaction_count={r.transaction_count()}"
+    )
+    return r
+
+
+_plans = {}
+
+
+def plan(key, table, wait_registers, register_bytes=2):
+    """
+    Return the plan for table, compiling it on the first call with
+    a given key; use something like (sensor, mode) for that key,
+    including anything else that changes the table content.
+    """
+    r = _plans.get(key)
+    if r is None:
+        r = compile_table(table, wait_registers, register_bytes)
+        _plans[key] = r
+    return r
+
+
+def clear_plans():
+    _plans.clear()
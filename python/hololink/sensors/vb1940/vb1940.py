@@ -23,6 +23,7 @@ from enum import Enum
 
 import hololink as hololink_module
 
+from .. import register_table
 from . import vb1940_mode
 
 # Camera info
@@ -34,6 +35,8 @@ CAM_I2C_ADDRESS = 0x10
 EEPROM_I2C_ADDRESS = 0x51
 EEPROM_MAX_PAGE_NUM = 256
 EEPROM_PAGE_SIZE = 64
+# The most we can read in one I2C transaction.
+EEPROM_READ_SIZE = 256
 CALIB_SIZE = 256
 VCL_EN_I2C_ADDRESS_1 = 0x70
 VCL_EN_I2C_ADDRESS_2 = 0x71
@@ -173,11 +176,7 @@ class Vb1940Cam(hololink_module.Synchronizable):
         # RGB
         if part == 0 or part == 2:
             # get raw data
-            rgb_pages = range(calib_pages)
-            rgb_calib_data = []
-            for page in rgb_pages:
-                data = self.get_eeprom_page(page)
-                rgb_calib_data.extend(data)
+            rgb_calib_data = self.get_eeprom_buffer(0, CALIB_SIZE)
             # convert into double
             rgb_calib_data_parsed = []
             for i in range(CALIB_SIZE // step):
@@ -198,11 +197,9 @@ class Vb1940Cam(hololink_module.Synchronizable):
         # IR
         if part == 1 or part == 2:
             # get raw data
-            ir_pages = range(calib_pages, calib_pages * 2)
-            ir_calib_data = []
-            for page in ir_pages:
-                data = self.get_eeprom_page(page)
-                ir_calib_data.extend(data)
+            ir_calib_data = self.get_eeprom_buffer(
+                calib_pages * EEPROM_PAGE_SIZE, CALIB_SIZE
+            )
             # convert into double
             ir_calib_data_parsed = []
             for i in range(CALIB_SIZE // step):
@@ -298,6 +295,22 @@ class Vb1940Cam(hololink_module.Synchronizable):
             page_offset + data_len
         ) <= EEPROM_PAGE_SIZE, f"{page_offset=} + {data_len=} should not be greater than {EEPROM_PAGE_SIZE=}."
         register = (page_num << 6) + page_offset
+        return self.get_eeprom_buffer(register, data_len)
+
+    def get_eeprom_buffer(self, register, data_len):
+        """
+        Sequential read of EEPROM.
+        Unlike writes, reads aren't limited to a single page: the
+        internal byte address counter carries on into the next page,
+        so up to EEPROM_READ_SIZE bytes can be fetched in one I2C
+        transaction.
+        """
+        assert (
+            data_len <= EEPROM_READ_SIZE
+        ), f"{data_len=} should not be greater than {EEPROM_READ_SIZE=}."
+        assert (
+            register + data_len
+        ) <= EEPROM_MAX_PAGE_NUM * EEPROM_PAGE_SIZE, f"{register=} + {data_len=} is past the end of EEPROM."
         write_bytes = bytearray(100)
         serializer = hololink_module.Serializer(write_bytes)
         serializer.append_uint16_be(register)
@@ -309,7 +322,7 @@ class Vb1940Cam(hololink_module.Synchronizable):
         r = deserializer.next_buffer(read_byte_count)
         assert len(r) == read_byte_count, "read %d != %d" % (len(r), read_byte_count)
         logging.debug(
-            "get_eeprom_page(register=%d(0x%X),buffer=%s)"
+            "get_eeprom_buffer(register=%d(0x%X),buffer=%s)"
             % (register, register, bytearray(r))
         )
         return list(bytearray(r))
@@ -372,139 +385,64 @@ class Vb1940Cam(hololink_module.Synchronizable):
         logging.debug("##secure boot-end boot")
         self.set_register_8(BOOT_REG, 0x10)
 
-    def write_certificate(self):
-        start_addr = vb1940_mode.VB1940_CERTIFICATE_START_ADDR
-        data_size = len(vb1940_mode.VB1940_CERTIFICATE)
+    def write_data_in_pages(self, start_addr, data):
+        # set_register_buffer copies each page into its request;
+        # slicing a memoryview avoids copying the page before that.
+        data = memoryview(data)
         page_size = vb1940_mode.VB1940_PAGE_SIZE
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.VB1940_CERTIFICATE[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
+        for offset in range(0, len(data), page_size):
+            self.set_register_buffer(
+                start_addr + offset, data[offset : offset + page_size]
+            )
+
+    def write_certificate(self):
+        self.write_data_in_pages(
+            vb1940_mode.VB1940_CERTIFICATE_START_ADDR, vb1940_mode.VB1940_CERTIFICATE
+        )
 
     def write_fw(self):
-        start_addr = vb1940_mode.VB1940_FWP_START_ADDR
-        data_size = len(vb1940_mode.VB1940_FW)
-        page_size = vb1940_mode.VB1940_PAGE_SIZE
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.VB1940_FW[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
+        self.write_data_in_pages(
+            vb1940_mode.VB1940_FWP_START_ADDR, vb1940_mode.VB1940_FW
+        )
 
     def write_vt_patch(self):
-        page_size = vb1940_mode.VB1940_PAGE_SIZE
         logging.debug("VT_PATCH: LEDC_RAM")
-        start_addr = vb1940_mode.LDEC_RAM_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.LDEC_RAM_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.LDEC_RAM_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.LDEC_RAM_CONTENT_START_ADDR, vb1940_mode.LDEC_RAM_CONTENT
+        )
         logging.debug("VT_PATCH: RD_RAM_SEQ_1")
-        start_addr = vb1940_mode.RD_RAM_SEQ_1_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.RD_RAM_SEQ_1_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.RD_RAM_SEQ_1_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.RD_RAM_SEQ_1_CONTENT_START_ADDR,
+            vb1940_mode.RD_RAM_SEQ_1_CONTENT,
+        )
         logging.debug("VT_PATCH: GT_RAM_PAT")
-        start_addr = vb1940_mode.GT_RAM_PAT_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.GT_RAM_PAT_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.GT_RAM_PAT_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.GT_RAM_PAT_CONTENT_START_ADDR, vb1940_mode.GT_RAM_PAT_CONTENT
+        )
         logging.debug("VT_PATCH: GT_RAM_SQE_1")
-        start_addr = vb1940_mode.GT_RAM_SEQ_1_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.GT_RAM_SEQ_1_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.GT_RAM_SEQ_1_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.GT_RAM_SEQ_1_CONTENT_START_ADDR,
+            vb1940_mode.GT_RAM_SEQ_1_CONTENT,
+        )
         logging.debug("VT_PATCH: GT_RAM_SQE_2")
-        start_addr = vb1940_mode.GT_RAM_SEQ_2_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.GT_RAM_SEQ_2_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.GT_RAM_SEQ_2_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.GT_RAM_SEQ_2_CONTENT_START_ADDR,
+            vb1940_mode.GT_RAM_SEQ_2_CONTENT,
+        )
         logging.debug("VT_PATCH: GT_RAM_SQE_3")
-        start_addr = vb1940_mode.GT_RAM_SEQ_3_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.GT_RAM_SEQ_3_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.GT_RAM_SEQ_3_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.GT_RAM_SEQ_3_CONTENT_START_ADDR,
+            vb1940_mode.GT_RAM_SEQ_3_CONTENT,
+        )
         logging.debug("VT_PATCH: GT_RAM_SQE_4")
-        start_addr = vb1940_mode.GT_RAM_SEQ_4_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.GT_RAM_SEQ_4_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.GT_RAM_SEQ_4_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
-
+        self.write_data_in_pages(
+            vb1940_mode.GT_RAM_SEQ_4_CONTENT_START_ADDR,
+            vb1940_mode.GT_RAM_SEQ_4_CONTENT,
+        )
         logging.debug("VT_PATCH: RD_RAM_PAT")
-        start_addr = vb1940_mode.RD_RAM_PAT_CONTENT_START_ADDR
-        data_size = len(vb1940_mode.RD_RAM_PAT_CONTENT)
-        page_count = (data_size + page_size - 1) // page_size
-        for id in range(page_count):
-            offset = id * page_size
-            register = start_addr + offset
-            data_buffer = vb1940_mode.RD_RAM_PAT_CONTENT[
-                offset : offset + min(data_size - offset, page_size)
-            ]
-            if data_buffer:
-                self.set_register_buffer(register, data_buffer)
+        self.write_data_in_pages(
+            vb1940_mode.RD_RAM_PAT_CONTENT_START_ADDR, vb1940_mode.RD_RAM_PAT_CONTENT
+        )
 
     def setup_clock(self):
         # set the clock driver.
@@ -757,14 +695,17 @@ class Vb1940Cam(hololink_module.Synchronizable):
         else:
             logging.error(f"{mode_set} mode is not present.")
 
-        for reg, val in mode_list:
-            if reg == vb1940_mode.VB1940_TABLE_WAIT_MS:
-                logging.debug(f"sleep {val} ms")
-                time.sleep(val / 1000)  # the val is in ms
-            else:
-                if reg == 0xAC6 and (self._vsync.is_enabled()):
-                    val = 0x01
-                self.set_register_8(reg, val)
+        vsync = self._vsync.is_enabled()
+        if vsync:
+            mode_list = [
+                (reg, 0x01 if reg == 0xAC6 else val) for reg, val in mode_list
+            ]
+        plan = register_table.plan(
+            (DRIVER_NAME, mode_set.value, vsync),
+            mode_list,
+            (vb1940_mode.VB1940_TABLE_WAIT_MS,),
+        )
+        plan.replay(self._i2c, CAM_I2C_ADDRESS)
 
     def set_exposure_reg(self, value=0x0014):
         # The minimum integration time is 30us(4lines).
@@ -0,0 +1,1037 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+"""
+VB1940 firmware, certificate, and VT patch contents, as bytes.
+vb1940_mode only imports this when one of these is first used;
+the start addresses for each are in vb1940_mode.
+"""
+
+VB1940_CERTIFICATE = (
+    b"\x30\x81\xaa\x83\x01\x01\x94\x40\x79\xd1\xee\x6c\xcc\x71\xba\xf7\x6c\x1c\x33\x43\x26\xa4\x00\xe2\x79\xa1\x77\x39\x47\x42\x36\x84"
+    b"\x43\xb1\x29\x3e\x70\xd8\xe2\x5b\x18\x45\xd0\x9b\xae\xe9\xf3\x2c\x13\xaa\x4a\xd5\xcb\xa5\x05\xb1\x9f\x77\xdb\x1d\x42\x72\xca\x67"
+    b"\x7a\x0f\x51\x7f\xe0\xb0\xbd\xda\x8a\x04\x53\x39\x34\x30\x8b\x10\xbd\x9e\xb0\x96\xc4\xc3\x75\x2f\x2f\x75\xdd\xae\xc0\xb6\x79\xe6"
+    b"\x84\x01\xad\x87\x20\x10\xad\x09\xaf\x22\x1e\x43\x8a\x92\x7a\x25\xdf\x4c\x11\x1d\xf2\x23\x18\xd1\xf0\x8f\x9b\xc6\xd6\x6a\x4f\xb7"
+    b"\x47\xf8\x45\x3c\x0f\x85\x01\x00\x82\x01\xdb\x30\x20\x04\x04\x65\x74\x74\x6d\x31\x18\x04\x04\x64\x62\x67\x72\x04\x04\x6f\x6c\x62"
+    b"\x74\x04\x04\x70\x72\x6f\x76\x04\x04\x76\x74\x72\x70\x30\x44\x02\x20\x50\xc4\xb3\x16\x17\x1b\x56\x38\x63\xfd\x84\x3e\x52\xfc\xbf"
+    b"\xcf\xed\x32\xdd\xaa\x1f\x47\x3b\x4d\xb2\x3f\x96\x00\x23\x27\x2f\xc8\x02\x20\x78\xec\x44\x68\x58\x97\x35\xd5\xdf\x38\x8b\x58\x97"
+    b"\x29\xab\xdd\xa5\xf9\xe5\x7b\x2e\x96\xb6\xe4\xd9\xef\x4c\x5b\xc4\x34\x32\xe8\x30\x81\x8c\x83\x01\x01\x8a\x04\x53\x39\x34\x30\x8b"
+    b"\x10\xbd\x9e\xb0\x96\xc4\xc3\x75\x2f\x2f\x75\xdd\xae\xc0\xb6\x79\xe6\x81\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x84\x01\xad\x87\x20\x10\xad\x09\xaf\x22\x1e\x43\x8a\x92\x7a\x25\xdf\x4c\x11\x1d\xf2\x23\x18\xd1\xf0\x8f\x9b\xc6\xd6"
+    b"\x6a\x4f\xb7\x47\xf8\x45\x3c\x0f\x92\x10\xa1\xa7\xa4\x66\x77\x57\xb2\x70\x05\xa0\x42\x86\x00\xd6\xd0\x59\x85\x01\x00\x82\x01\xdb"
+    b"\x30\x20\x04\x04\x65\x74\x74\x6d\x31\x18\x04\x04\x64\x62\x67\x72\x04\x04\x6f\x6c\x62\x74\x04\x04\x70\x72\x6f\x76\x04\x04\x76\x74"
+    b"\x72\x70\x30\x46\x02\x21\x00\xa4\x65\x78\xac\xdf\x5b\xec\x56\x10\xfa\x84\x66\xfa\x5c\x03\xc4\x45\xbd\x35\x31\x61\x0b\xc9\x3b\x06"
+    b"\x51\x9b\xbf\xd9\x15\xdb\x0e\x02\x21\x00\xe7\xcc\x06\x2b\x86\x6f\xb9\x4c\x17\xbb\x7e\x58\x68\x3c\x81\xeb\xdf\x27\x86\xfc\xf9\x49"
+    b"\xb1\x5b\x03\x83\xac\x31\x4e\x37\x4a\x4b"
+)
+
+VB1940_FW = (
+    b"\xec\xec\xe8\x0f\x47\x10\xcd\x04\xc7\xc4\x97\xf9\x8c\xd4\xda\xed\x06\xc9\x54\xc2\xcd\x59\x2c\xca\xd3\x80\x31\x9b\x5b\x11\xcb\xe2"
+    b"\xf1\x64\x54\x0b\x90\xd2\x9e\xae\x2a\x58\x69\xf0\xff\x8e\xb0\x07\xc5\x41\xec\x3a\x66\x3b\x4e\x98\x6e\xab\x4e\xa8\x8d\x65\x0c\xfe"
+    b"\xee\x86\x18\x34\x45\xad\x84\x5c\xbc\xa4\x32\x5e\xdc\xe3\xb8\x9e\x54\x86\x1e\x2d\x91\x1e\x96\xb2\xb0\x37\x29\x30\x4d\x9f\x42\x35"
+    b"\x3c\xed\x52\xf7\x73\x65\x6f\x13\xd9\xc0\xbc\xd3\xd8\x59\x39\xae\x58\xa5\x70\xa6\x24\xaf\x78\x77\xcc\x9c\x9d\xcf\xc8\x52\xba\x33"
+    b"\x39\x9a\xe8\x60\xd1\x73\xb7\x48\xd0\x9b\xae\xcd\x78\x81\x52\xcf\x37\x63\xdc\x16\x52\xb0\x94\xa4\x80\x61\x4e\xa2\x07\x12\x9f\x85"
+    b"\x78\x29\xee\xda\x34\x2b\x8b\xa1\x7c\xfd\x2d\xc1\x21\xac\xdd\x4f\x87\x66\x23\x81\x58\x91\x47\x9c\x12\x8a\xc4\xc5\xca\x83\x0a\xc8"
+    b"\x63\x75\x94\x9c\x38\x0b\x0c\x1e\xa6\x47\xc2\x23\xbe\x0a\x42\x67\xad\x8f\x65\xbd\x82\x70\x0f\xf9\x8f\x4b\x9d\x00\x75\x29\x49\x65"
+    b"\x70\x5f\x4f\xd3\x63\x66\x2b\x02\xe6\x0d\xf5\xd1\x29\x4d\x80\x5c\xfd\xa7\xbc\xdd\x55\x51\x50\x25\x2d\xd1\xa3\x76\x0d\xf5\xcb\x03"
+    b"\x0d\xaa\x93\x12\x2a\x4b\x62\x2e\x9c\xee\x85\x11\x41\x93\x87\xab\x39\xa4\xf6\x05\x45\x0d\xd5\x75\xf2\xf5\x30\xf2\xd7\x94\x6d\x2e"
+    b"\x1f\x63\xb3\x75\x15\x70\x02\x28\xd3\x3f\xb4\xa9\x79\xe7\xf8\xd5\xf7\x3c\xd3\x0e\x7f\x5e\xcc\xef\x86\x62\x16\x54\x63\xe5\x3a\x89"
+    b"\xcb\x4e\x5f\x55\x93\x87\x6c\xac\x40\x10\x7b\x5a\xd6\xbf\xab\xf8\x96\xa4\x21\x8c\x35\x7f\xcb\x1c\x60\xc7\xbe\x91\x97\xbf\xb5\xd8"
+    b"\x20\x55\x72\xf0\x7d\xa0\xc7\xf4\x6b\x1b\xf9\xd9\x44\x52\xac\x34\x3d\x48\x73\xfb\xa8\xfc\x4f\x08\xa6\x14\x86\x57\xea\xdd\xe5\xa3"
+    b"\x24\x44\xe4\x55\xda\x96\x42\x03\xa9\xd4\xa4\x29\x2b\x49\xb8\xe3\x3f\xd3\x6d\xbb\x0e\x71\xc4\x8c\x3e\x5c\x9a\x57\xe5\x69\xc6\x3c"
+    b"\xc3\x9a\x2f\xa0\x38\x49\x73\xe0\x44\x6a\x6e\x67\xfb\xed\x10\x87\x2e\xa8\x4f\xdc\xc2\x47\x8d\xea\x1e\x9e\x76\x35\xb3\xa5\x86\x56"
+    b"\x28\x7f\x60\xb0\x8a\xb9\x09\x08\xdb\xdb\x32\x50\x4d\x76\xe2\x92\xeb\xca\x53\x7e\x0c\xf1\x1f\xc8\xff\x0a\x42\x9a\x22\x34\xe2\x0c"
+    b"\xe0\x35\x78\x6e\x4d\x52\xf9\xac\x07\xa4\xcb\x5d\xb0\xf3\x47\xa1\xf0\x6e\x90\xde\x26\xad\x73\xdd\x1a\xae\x0a\xc0\x2c\xdb\x8a\xe8"
+    b"\xbc\xa3\x11\x41\x35\xd5\xfb\x21\x95\x8f\x26\x8e\x15\xd3\xeb\xe7\x2d\x03\xcc\x20\x1f\x79\xe2\xe8\x5d\x9e\xb2\xf9\x4d\xb3\x0c\xf4"
+    b"\x9c\xd6\xa9\xa6\xe6\x0d\x78\x85\x1c\x16\x99\x33\xd5\x81\x7d\x21\x53\x70\xb0\xd7\x49\x41\xb5\xbc\x0b\x39\x5d\x8d\xff\xd8\x1e\xd8"
+    b"\xc5\xbd\x4d\x2f\x58\x5b\x13\x3e\xc2\x0c\xde\x02\xdf\x06\x78\x00\xd7\x49\xa9\x7e\x6d\xf2\x20\xf5\x06\xcb\x0b\xdb\x28\x35\x85\x11"
+    b"\x6d\x02\xea\x6f\x2d\xfb\xa2\x8c\xe6\xbf\x35\x49\x68\x5d\x40\xbf\x76\x35\xca\x69\xbc\xcb\xbb\xd3\x4f\x3e\xaa\x2b\x4e\x19\xbf\x05"
+    b"\x9e\x87\xbf\x7b\x9e\xe2\x81\x0e\xc1\x49\x63\x0c\x73\x54\xee\xa9\xf8\x96\x17\x80\xf7\xe3\x1b\x59\xdd\x96\x3f\x42\xed\x5a\x74\xec"
+    b"\x94\x8b\xf0\x98\x30\x39\x46\x0a\xe0\x05\xd1\x3f\x71\x65\x51\xcc\x1c\x53\xa0\x4d\xae\x62\x4e\x2a\xfa\x53\x44\x2f\x6f\x43\xf4\x28"
+    b"\x78\xaf\x06\x8d\xf3\xa2\x73\xfd\x81\x00\x7b\x09\x2e\xc1\xb7\xaa\x22\x58\x8e\x8b\x89\x53\xad\x2e\xd8\x5b\x48\xdc\x59\xe0\x2c\x10"
+    b"\x07\xa6\xbe\x46\xa9\xd6\x1a\xe7\x1f\xc6\xb8\xcf\x05\xbf\x93\x5a\xa9\xee\x05\xc6\xef\x60\x6b\x37\x17\x68\xf8\x4d\xc4\xe8\xd1\x67"
+    b"\x5f\x23\x1e\x62\x14\xf9\x63\x71\xbc\x61\x9b\xa9\xa8\x17\x42\x2b\x20\x5e\x40\x49\x8c\xdd\x69\xaf\xaf\x9f\xe3\xee\x43\x12\xa3\x88"
+    b"\x17\xe3\x54\x92\xf1\xcc\x63\x83\x7a\xa1\x5a\xde\x63\xd6\xf1\x04\x66\x5e\x2a\x29\x82\xcb\x3e\xb1\x44\x5b\x2f\x5c\xe9\x6f\xcf\x96"
+    b"\x6c\x58\x52\xff\x68\x62\xbc\xf1\x70\x2b\xf4\xb6\x23\x0a\x16\x78\x1b\x42\x99\x6a\xad\x6a\xfc\xf3\x9a\xe4\x24\xe8\x79\x26\x17\xf8"
+    b"\x4e\x70\xf6\xb8\x47\x16\xee\xaf\xf1\x6c\xed\x6f\x61\xd5\x1e\x42\xce\xd4\x08\xa3\x75\xfd\x31\x01\x41\xda\x20\xae\x5e\x52\x2a\x54"
+    b"\x24\x83\x50\xc6\x1d\x56\x7c\xd8\xb7\xbe\xb7\xef\xd7\xc3\x23\xb9\x9b\xd3\x12\xe8\xea\xb1\x65\x3b\xe3\x7d\x64\xa5\x41\x46\x01\x30"
+    b"\x42\x82\x58\x65\x32\x67\xcf\x67\x3f\xb3\x2f\x36\x9f\x98\x45\xae\x54\xda\x7c\x4e\x4f\xe3\xe3\x8e\xe5\xc0\x2e\x20\xd3\xa8\x6c\xd3"
+    b"\x63\x7e\x0d\x62\x76\x4c\x9a\xdf\xa5\x90\x4f\x32\x9b\x88\xcc\xa8\x00\x64\x60\x2e\x22\x0c\xb9\x7e\xa6\x07\x1a\x94\x8c\x53\x47\xc6"
+    b"\x1d\xf1\x83\x79\xed\x79\x93\xfb\x28\x54\x44\x56\xa5\xd3\x27\xeb\xc4\x3f\xaf\x36\xc2\x40\xe6\x14\xd9\x9f\x25\x9f\x2b\xf3\x9b\xa1"
+    b"\xb6\x28\x9c\xbc\x93\xae\x8a\xde\xfb\x3f\x34\x4c\x3b\x18\x3f\x92\x98\x96\x24\x41\x9a\xfb\x6a\x67\xe4\x95\x89\xbc\x05\x21\x78\x96"
+    b"\xc3\x9e\xab\x1f\x9a\x4f\x21\x79\x68\xc5\xc2\x1b\xb3\x09\x6f\xf7\x9c\x16\x39\x00\x5a\x54\xaf\xd1\x44\x82\xfc\xed\x03\xa5\xc8\x25"
+    b"\x83\xc0\x73\xca\x7c\xda\x69\x0e\x46\x19\x90\x9e\x0f\x71\x81\x96\x38\x40\x43\x84\x43\xf7\xf1\x11\x90\x7c\x05\x9c\x6c\x90\xec\xa7"
+    b"\x54\x33\x4e\xaa\xc8\x32\xa3\x46\xb0\x7c\xc5\x3d\x6f\x46\x3e\x01\x7d\xcd\xb8\x02\xb3\x1c\x87\x74\x38\x57\x14\xa7\xd8\xc2\x98\xf1"
+    b"\xc9\xc8\xcd\xac\x51\xb0\xc7\x3a\xe7\x3d\xdd\xa8\xfd\xce\x7f\x77\x64\x34\x7f\xeb\xed\xc6\x7b\x77\x69\x59\xe4\xb8\xe9\x8c\x5b\x6a"
+    b"\x09\xe4\x5a\x10\x3a\x7a\x77\x09\x0b\x4e\xaa\xef\x3f\x33\x41\x6a\xdd\xe7\x4c\x4b\x10\xbf\x7f\x4b\x41\xb5\xc8\xdf\x93\x92\x72\xde"
+    b"\x99\xa5\x04\x52\x97\xe4\xda\xa6\x81\x5c\xc9\x82\x9b\x65\xd8\x7f\x48\x9d\xa6\x50\x0a\xc4\xef\x49\x78\x58\x5d\xc1\xa4\x6c\x5f\x0b"
+    b"\xb9\xd0\x12\x73\x39\x5f\xc4\x90\xee\xc6\x55\x06\xc0\xa7\x91\x1b\x90\xf9\xc9\x71\x2d\xc6\xb3\xc0\x0b\x44\x1f\x6b\x56\xfa\x31\x78"
+    b"\x70\x08\xa9\x11\x25\x5c\xd0\xca\xa0\x5f\x18\x00\xf8\x9e\xf9\xca\x0d\xf1\x42\xad\x90\xc6\x1f\x2f\xc8\x68\xb8\xd0\x5f\x44\x53\xaf"
+    b"\x98\xbd\xed\x7f\xb2\x4e\xa3\xd2\x11\x4b\x5e\x8f\xf1\x78\x7d\xef\xc4\x14\xf4\x9c\xa8\x1e\xc2\x8f\x73\x79\x2e\x73\xcd\x55\x1b\xf6"
+    b"\x85\xec\x6c\x4b\xf7\xc9\x3c\xaf\x31\xa1\xe2\x08\x3b\x6b\xe7\x02\x6b\xf2\x0f\x4d\x7b\x2c\x36\x65\xea\x72\xdd\x1b\x95\x53\xa8\xf0"
+    b"\x84\x74\x7e\x43\xb2\x32\x55\xd2\xa6\x77\x78\xf3\xc4\x47\x41\x5a\xcb\x84\xe8\x21\x83\xd7\x2f\xd1\xdc\x4a\xc4\x6b\x80\xd3\x9b\x0c"
+    b"\x4b\x1b\xf1\x6f\x62\x8a\xf3\x10\xd7\x14\xdb\x52\x38\xe5\x9f\x3b\x9d\xa7\x98\xe3\xa5\xc1\x1d\xe1\x03\x6e\xdd\x59\x2f\xca\x34\xf5"
+    b"\xe2\x9e\x84\x11\xe3\x85\xb1\x95\xe9\x5a\x6d\xd4\x93\xe1\x45\x24\x17\x6e\x5e\x59\x73\xac\xc5\x39\x0c\xd0\xcd\xd2\x86\x49\x14\x56"
+    b"\xde\xb4\xed\x1c\xff\xd1\x17\xf5\xaf\x1d\x73\xdb\x4d\xb9\xb4\x16\x19\x35\xd9\xe9\x76\xda\x7a\x6e\xfa\xc9\x04\x80\x4c\xd6\xe9\x9b"
+    b"\x49\xa5\xb1\xb4\xcf\x08\x00\x14\x4d\xde\x2f\x15\xc1\x21\xb5\x4e\x2f\xd5\x5a\x03\x6e\x0b\xec\x3e\xd1\x0d\xa5\x34\xd1\xea\x14\x8f"
+    b"\xbc\x18\x01\xd2\x8f\xca\xea\x8e\xb8\x4c\xd0\xbc\x16\xb0\xb0\xc9\x1c\xc2\xf1\x4d\x8d\x5f\x6f\x1d\x3a\xa2\x50\xc1\xf0\xcd\x5c\x07"
+    b"\x3a\xab\x13\xd7\x80\x88\xfb\x05\x80\xdd\x09\xd7\xf3\x58\x61\xd7\xcf\x11\x51\xbc\x26\x6b\xb5\x85\x02\x73\x52\x07\xf7\xa7\xb0\x98"
+    b"\xe5\xbc\xb0\x05\x8a\xcf\x45\xfe\x66\xc8\xe7\xb4\x7e\x88\x69\xd6\xdb\x24\x34\x3b\xb4\x2e\x1b\x5f\xd2\x4f\x5f\x3f\xa9\xaa\x43\xf6"
+    b"\x2a\xba\x1b\x9c\xab\xa0\x37\xc0\x40\x10\x5d\x8b\x5d\x00\x25\x67\xb1\xa3\x9c\x26\xbb\xa5\x1f\x8b\x19\xa0\x49\x66\x87\x68\x24\xd5"
+    b"\x26\x1a\x94\x9e\x12\x9c\x21\x96\x3e\xa3\xc3\x66\x1d\x32\xf0\xcc\xe9\x16\x44\x61\xf2\xcc\x51\x52\x28\xa4\x80\x72\xdd\x5b\xd7\x6d"
+    b"\xd8\x4d\xe7\x14\x04\xf1\x69\x7c\x96\x02\x4f\xc0\x7d\x29\xb6\x95\x5f\xd5\xd9\x6c\x7e\xb6\x0f\xb9\x0d\x82\x9b\x47\x8a\x82\xc2\xc5"
+    b"\x33\xb4\x6e\x69\x5d\xc8\x26\x59\x30\xe0\x87\x9e\x6c\x50\x37\xe1\x41\x20\xe5\x52\xb2\x44\x93\x94\x9b\x50\xd1\x47\x82\x7b\xf4\x44"
+    b"\xb5\xc7\x27\x5b\x84\x93\xf2\xb4\x04\x7b\x70\x15\x53\x40\x54\x16\x17\x12\xdc\xd5\x48\x5c\x6a\xd4\x8b\x1b\x66\xba\x09\x77\x03\x9c"
+    b"\x4c\x4f\x48\x68\xfb\x61\xf5\x9e\xc8\xa2\xfc\xab\x6e\x3e\x1d\x79\x4e\x31\x5e\x9a\xad\x11\x38\xdb\x8c\x3a\x69\xf9\xc8\x1f\x1c\x74"
+    b"\xbb\xac\xc5\xc8\x11\x4c\xf2\xfa\xee\x95\xb9\xb1\xf0\x91\xf8\xcd\x06\x7b\x04\x0b\x6c\xc6\x42\x41\x4c\xbe\xcb\x83\xae\x93\x6b\xaa"
+    b"\x81\x1b\xc0\x0e\x61\xdb\x77\x62\xd4\xf1\x7c\x10\xc1\xe6\x9f\xf8\x32\xfa\x82\x66\x5f\x63\x58\x95\xb6\xba\x82\x1f\xc4\x36\xbc\x3b"
+    b"\xad\x87\x83\x2b\x30\x9e\xbc\xc1\x65\x7f\x03\x95\x09\xd5\xf6\x1e\xe0\x4d\x0e\x0d\xad\x40\x50\x16\xbc\x07\xbe\x43\x5f\x36\xca\x19"
+    b"\x09\x68\x68\xe4\x45\xf5\x30\x78\xe2\x45\xf1\xdf\xc6\xbf\xe6\xb0\x27\x5b\xd3\x08\xa2\x51\x53\x33\xae\xae\xa0\xfd\xfd\x7e\x55\x17"
+    b"\x8c\xd7\x45\xb9\x6c\x6f\xd2\x88\x5d\x61\x3c\xd6\x31\xe2\x11\x87\xbf\xba\xa8\x56\xc6\xa6\x32\x0e\x3a\x9b\xd2\x12\xe3\x56\x33\xa0"
+    b"\x77\x7e\xe2\x78\x75\xce\x2e\x49\x2e\x79\xa9\xf9\xfb\x5b\x5b\x40\x36\xd0\x96\xf4\x21\x00\x43\xbd\x37\xe4\x02\x13\x4c\x99\xd1\x83"
+    b"\x71\x09\xdf\x2a\x70\xcf\x7f\x2c\x69\x97\xb1\xdf\x67\x83\xa9\x19\xa5\xc9\x60\xbf\xec\xd6\xbd\x66\x38\x90\x88\x68\x3c\x53\x8f\x17"
+    b"\x05\x0b\x32\x6c\x2b\x75\x3a\xd6\xf2\xa6\x5d\xf8\x82\x3d\x1e\xd7\x7d\xce\x1c\xa5\xf6\xde\xd4\x13\xaa\x61\x20\xfd\x61\xe4\x45\x06"
+    b"\xbc\xee\x9f\xdb\x38\x17\xb5\x19\xfb\x77\xc9\x8b\x4a\x13\x79\xd8\xe6\xca\x05\x37\x22\x3b\xdc\xe2\xb2\x42\xe7\x58\x58\x03\x43\xc4"
+    b"\xdd\x7b\x0e\x30\xa2\x78\x48\x06\x14\x15\x93\x8c\x5a\xed\x32\x6f\x25\xb0\x47\x20\xba\x2c\xac\xb5\x99\xe4\x43\xa2\xa0\x58\xf0\x65"
+    b"\xa5\xc0\x18\xc8\x46\xf4\x6f\x49\x70\xb6\xc3\xfd\xce\xb2\xca\x4a\x92\xb9\xdb\x35\x3b\x1b\x3c\x57\x9a\x35\x5a\x78\xe7\x63\xd6\x3b"
+    b"\x86\x84\x8c\x52\x35\xa7\x24\xe3\xcf\xd4\x50\x6b\x18\x49\x5b\xd2\xcb\xbd\xb4\xc5\xa4\x76\x52\x29\x88\x05\x1e\xc7\x38\x16\x9d\x91"
+    b"\x20\x60\x84\x0e\x6e\x8f\x70\xfc\x30\x62\x8b\x87\x63\x3f\xa0\x00\x58\xbc\x0d\x97\xb3\x61\x2f\xd4\x08\xf9\xf8\x53\xe0\x90\xa9\x4d"
+    b"\x25\x83\x3f\x44\x96\xc4\x63\x81\x1f\x38\x3f\x4f\x2c\x2b\xe3\xcf\xc0\x1b\x3e\xbc\x2e\x38\xda\xc8\xa3\xc0\x7a\x34\x72\xaf\xba\x86"
+    b"\x55\x8f\x57\x20\x9d\x60\x65\x5d\x48\xe9\xca\x7e\x70\xf2\xb6\x76\x63\xd7\x9a\x1b\xea\x8f\x17\x35\x1c\x9a\xa9\xf2\x9b\x0a\x76\xc2"
+    b"\xbc\xa3\xcf\xbe\xc5\x75\xe5\x74\xfa\x00\x49\x19\x00\xf1\xed\x2f\x8d\x3d\xb2\xda\xba\x1d\x9e\x5a\xfa\xc1\x9e\xfa\xfd\x3c\xf1\xb3"
+    b"\x84\xb8\xac\xa4\xb2\xb4\xab\xdd\xe7\x3d\xdc\x7b\xb5\xa5\xe1\x47\x70\x74\x03\xfd\x6a\x02\xba\x23\xcb\x5a\x5b\x0b\x2e\xe5\x73\x8c"
+    b"\x26\x54\x61\x2d\xd7\x9b\x6c\x46\x00\x9b\x27\x10\xef\x91\xed\xda\x36\x48\xbc\xde\x28\xbe\x6f\x69\x4e\x95\x35\xaf\xf4\xc4\x2d\xc7"
+    b"\x9b\xfd\xad\xf4\x79\xf1\x29\x88\xe3\xe4\x7c\x82\xab\x63\x47\x2b\x56\xb8\x18\x75\x0d\x3d\xfe\x89\x10\xdc\xf6\x77\x52\x35\xa0\x0b"
+    b"\x84\x08\x89\x0e\x3d\x9a\xcf\x2b\x0a\x4c\xda\x7d\x53\xf7\x8f\xe5\x08\x0b\xdf\x2e\xb9\x3a\xa4\x5d\xc1\x14\x5b\x91\xed\xa1\xb3\xe8"
+    b"\x2b\x4a\xaa\x0a\x7a\x5f\xbb\x43\x0d\x31\x42\x9e\x63\x1b\x50\x89\x1a\x2e\x97\xb8\xdb\x5d\xfc\x6f\xe1\x4f\xb5\x76\x15\x91\x88\xa1"
+    b"\x40\xc8\x7f\x81\xea\xc0\x8c\xd3\x05\x91\x1e\x65\xc3\xf4\x81\x29\x46\x06\xab\xab\x67\xed\x64\x6a\x6b\x3b\xd2\xca\x5b\x55\xdb\x52"
+    b"\x45\x8a\xda\x5d\x13\x5b\xf7\xbd\x3c\xca\x3c\x3d\xc3\x65\x8f\xe9\xe1\x1b\x39\xb1\x88\x3d\xb8\x0b\xf7\x09\x37\xb8\x26\xd8\x2b\x44"
+    b"\xd3\x2c\x4c\xc5\x28\x87\xe2\xe2\xd1\xba\x44\x5a\x0c\x09\x1a\x01\xce\x49\xc3\x7b\x45\x05\x5a\x32\xa9\x98\x8d\xc1\x04\xd7\x31\x67"
+    b"\xe9\x48\x4d\x7d\x2a\x1d\x53\x34\xc1\x3c\x2a\x25\xef\x3b\xad\xc1\x35\x98\x7a\x64\xc2\xe0\x21\xbe\xa9\xa0\x33\x7e\x14\xe2\x06\x2f"
+    b"\xad\xaa\x13\xe3\x96\x12\x6f\x9b\x49\x66\x3b\x9c\x16\x53\x73\xe8\xe5\xea\xef\x7f\x52\xdd\x05\x03\xfd\xde\x08\x77\x44\x37\x2d\x7a"
+    b"\x16\xb2\xf6\xbe\x5d\xdc\x6a\x6f\x4b\x93\x1d\x02\xf5\x10\x39\x07\x2d\x56\xd5\x45\xc9\xb0\x49\x5a\x45\xac\xe2\x48\xaf\xe0\x3a\x45"
+    b"\x4a\x13\xf3\xb5\x39\x89\x0c\xdd\xb1\xe6\x9a\x66\xa2\xda\x61\xab\x3a\x00\xea\x1d\x90\x0d\x10\x88\x10\x30\x56\x27\xb3\x9b\x46\x96"
+    b"\xd2\x39\x7a\xcb\xc3\x6e\x80\x0b\xed\x7c\x75\x05\xe9\x92\xe5\x4b\xf1\xfc\xbf\xb2\x4f\xcb\x8f\xa4\xcf\x20\x02\x2e\x74\xf5\xd0\x10"
+    b"\x6a\xff\xb2\xf5\xcf\xd0\x3e\x67\xd2\x00\x42\xfc\x51\x5e\xe4\xf4\xf6\x2a\x12\x7a\x75\x21\xc0\x3e\x51\x9e\x75\xc5\xb4\xbc\xbd\x69"
+    b"\xba\xde\xc7\x6b\x34\x6d\xf0\xf8\xa3\x00\xcc\xa2\x49\x0f\x0b\xff\xfd\x19\x9c\xcf\x44\xb6\xeb\x28\x47\x8e\xf6\xbd\xe4\x4b\xc4\x96"
+    b"\x23\x2d\x4f\xa3\x94\x08\xf7\x43\xa3\xd8\x38\xff\x14\xff\xd9\xce\x1f\x20\x6e\x3a\x22\x2d\x3c\x65\x6a\xd6\x90\xa6\xf4\x35\x44\xd5"
+    b"\xae\x63\x26\xd6\xc7\xa1\x05\x4f\xed\xd5\x62\xe3\x7f\xa6\xdc\x23\xa2\x5c\xc4\xff\xad\x26\xcf\x6f\x49\x6a\x3f\xfd\x9a\x73\x9a\xd7"
+    b"\x78\x8f\x2a\xa8\x46\x23\x0d\x14\x83\x57\x6e\x71\x5c\x98\x57\xde\x43\x92\x73\x42\x6b\x39\x03\xdc\xdb\x79\xcc\xbf\x86\xbf\x11\x77"
+    b"\x22\x3f\x53\x29\x53\xff\x8d\x5c\x66\xed\x58\xcc\x11\x4b\x9d\x69\x89\xff\x66\x61\xf9\xf6\x9c\xae\xf5\x26\xae\x9f\xfa\x42\x9e\x18"
+    b"\xf1\x5e\x9c\x21\xc5\x2d\x22\x80\x62\x46\xa9\xe7\xb5\xd7\xb4\xe7\x9f\xc8\xb0\xf6\xe5\xc1\x0c\x5f\xb0\xe2\x09\xca\xde\x3a\x07\xef"
+    b"\x80\xc4\x3b\x9e\xcb\xb8\x9f\x06\x24\xe0\x2c\xe0\x71\x0d\xe6\x2e\x24\xf8\x17\x4a\xe4\xf9\xe1\xa6\xd4\x64\xb2\xa6\xcb\xc4\x41\xbc"
+    b"\x19\x7a\x80\xf3\x0c\xb6\xcb\xf8\xae\x60\xe0\xe7\x73\x06\x57\x55\x96\x49\x1e\xa8\x59\x8d\x33\x29\x25\x94\xc8\xd2\xc1\x8e\x11\x9b"
+    b"\xad\xc4\x10\xa6\xfa\xd6\xc9\x8f\xf1\x11\x55\xb2\x4a\xda\x31\xa4\x2b\x97\xca\xbd\xc9\xe5\x9f\x89\x90\x57\x5e\xf5\xe7\x42\x3c\x05"
+    b"\xd2\x8e\xbd\x24\x5c\x2b\x6a\x56\x06\x29\xb8\xb3\xfc\xb7\xf5\xb0\xb7\x8a\x2a\x83\xc9\x58\xf7\x32\xd2\x29\xf1\x97\x2e\xf1\xb6\x11"
+    b"\xdc\x25\x11\x50\xd9\xcd\x18\x98\xde\x03\x34\x92\xa8\x7c\x77\xe6\xb6\x0b\xf6\x70\x51\xaf\x28\xbb\xa6\xd6\xda\x63\xa7\xa3\x58\xe5"
+    b"\xa4\x45\x5b\x51\x30\x22\x6d\xa9\x47\x5b\x8e\x0b\xe7\x97\x64\xef\xb6\xa1\xf3\x26\x23\x80\xf2\x74\x2a\x5a\x2e\x26\x38\xdc\x28\x77"
+    b"\xe5\xe3\x9f\x45\x37\x4d\xcc\x7a\x1c\xed\x46\xfe\xf5\x77\x96\x04\x7a\x8e\x45\x9f\xed\xa0\x25\x16\x4e\x91\x7a\x3e\x41\x76\x14\x01"
+    b"\xee\x04\x84\xd1\x51\x26\x1f\x7e\x26\x76\xab\xe0\xec\x84\x0a\x93\xdb\x44\xff\x38\xab\x63\x55\x8c\xd2\x65\x0a\xab\xda\x62\xc0\x52"
+    b"\x32\xfa\x5e\x85\x2d\xc1\xe0\x4f\x4a\x58\xd3\xbd\xf7\x70\xdb\x96\x42\x17\xe2\x7d\xe4\x00\xea\xe1\x51\x08\xf6\x4c\xe5\xf3\xe3\x0d"
+    b"\xc7\x87\x0e\x7f\xbb\x0b\xf7\x39\x69\xc7\xdd\xa7\x67\x44\x24\x55\x10\x56\x11\x36\xb4\xc7\x6c\x80\xf5\x75\xc9\xc9\x17\xff\xd1\xaf"
+    b"\xc6\x88\x72\xc6\x71\x23\xe8\xdf\xa8\xcd\x95\x06\x3b\x68\x1f\x3f\x71\x20\xf7\xe9\xd1\x0f\xcd\x56\xd8\x64\xd9\xb2\x41\xd8\x7f\xfe"
+    b"\x3b\x01\x2a\x48\x46\xb7\x3a\xe6\xf7\xe1\x2b\x59\x54\x2c\x44\xa9\xe6\x59\xff\x32\x03\x2d\x46\xcb\x0f\xbf\x8e\xa7\x88\xbf\xd1\xdf"
+    b"\x1c\x80\xfd\x6c\x80\xfb\x65\xa0\x67\x08\x55\x2f\xfa\x3b\xfa\x38\x4d\x7c\xc2\x1a\xe4\xf3\xba\x2c\xf9\x3e\x7a\x80\x2f\xae\x6b\xf0"
+    b"\x5c\xc9\x89\xea\x57\xc3\x0d\x0a\x4a\x39\x23\x1c\x7f\x78\x6b\xfc\x06\xf2\x00\xfb\xf6\x9f\xab\xe3\x3d\xf5\x88\xa9\x94\x87\xed\xae"
+    b"\xc6\x43\x61\xe9\x2c\xe8\x8e\xd4\xed\xc6\x73\xed\x53\xd4\xce\xa7\x18\xb9\x3c\xb5\x1e\x00\x00\x6a\x90\xdb\x48\xfa\x7d\xa8\x18\x9f"
+    b"\x86\xae\x9a\xa5\x8a\x17\x5e\xac\x2a\xfb\xc7\x0f\xbe\x41\xd4\xcf\xb2\xc4\x18\xb6\x35\x06\xb0\xa9\xb1\x87\x80\xf6\x3a\xb4\xb5\x98"
+    b"\x4c\xfe\xd2\x83\xdd\xf4\xbb\x3e\x72\x90\x90\xa2\x4e\xda\x86\x5b\x32\xfe\x2a\x0a\x4e\xfd\x4f\xe4\xd8\xa5\x89\xe9\x7d\xfb\x3a\x4b"
+    b"\x87\x68\x55\xd9\xf2\x40\x1f\x04\xb9\x78\xd3\x0d\x4c\x79\xad\x42\xfd\xe0\xaf\x86\xab\xe5\x2f\x0b\x78\x70\xdf\x53\xc3\xf5\xd6\xee"
+    b"\xb7\x2f\x64\xa0\x4f\x69\x97\xfe\xa6\x57\x3f\x06\xac\x0d\x18\xae\x1f\x89\xcf\x98\x9d\xd7\x87\xd0\xb7\x0a\x93\xd4\xff\x3a\xc4\x5a"
+    b"\x80\xa9\xcf\x3d\x6a\x59\x3c\x32\xe3\xcf\xb7\x24\x23\x1d\xd3\xa2\x01\x58\x3d\x7b\x4e\xaf\x47\x48\x47\x69\xa2\x7e\xfd\x67\xf2\x70"
+    b"\xa2\xdc\x67\x7e\xdd\xf7\xa3\x35\x4d\xc9\x7c\x6d\x91\x1d\x21\x3f\x1c\xf8\xc4\xcd\x01\x8a\x5f\xa9\xb8\xce\x74\xf8\xb2\xd7\x97\xcf"
+    b"\x47\x56\x08\xae\x0d\xff\x55\x83\x55\x65\x3e\x50\xbf\x3f\x38\x21\x9d\xd9\x4e\x3b\xa8\x4c\xd4\x68\x7b\x4d\x1e\xb1\xe7\x4f\x97\xf1"
+    b"\x00\x2d\x7f\x6c\x3b\xd4\xa5\x99\x5f\x2c\x21\xc5\xdd\x17\x42\xde\xb2\x1c\x38\xa5\x49\x58\xee\x6d\xad\xda\x18\xa6\x5b\xdb\xf1\xfc"
+    b"\x72\xcc\xb3\xd3\xef\x2a\x8a\x6e\x21\x9d\xd2\x87\xa2\xb5\x47\xc0\xe0\xe1\xff\x7a\x74\xa7\x1d\x84\x16\xaa\x3f\xe7\x6b\x28\x03\x8a"
+    b"\x19\x08\x5d\x6e\x98\xce\x22\x14\x92\xcf\x82\xd1\x2b\xf6\x91\x22\x3a\x22\x8f\x6a\xf4\x9a\x25\x53\x0d\x63\xe5\x8c\x68\x2e\x20\x59"
+    b"\x87\xf8\xc4\x98\x16\x04\x9c\x12\x12\x7d\xfa\xb4\xa8\x13\x83\x56\xb5\x2f\x2f\x8c\x1d\xfe\x4b\x49\x8f\x35\x14\x04\xa9\x14\x54\x51"
+    b"\xd9\x2d\xf3\xca\x79\x09\x6c\x09\xb0\xb2\x98\x26\x17\xa6\x31\xfc\xb1\xdf\x00\x5a\x2b\xf5\x19\x27\xa5\x6b\xf5\x9d\x6b\xf3\xda\x7e"
+    b"\xe4\xa1\x36\x18\x1d\xac\x1c\x0a\x5f\x67\x44\x12\x43\x77\x9d\x97\xf1\xfb\x24\x98\x9b\x81\x04\x1f\xd4\x1d\x53\xcb\x68\x8f\x2f\xaf"
+    b"\x89\xf9\xcb\x6c\x62\x23\x17\xd1\xd5\xa3\xc2\x0d\x20\x72\xfa\x3e\x3c\x75\x3c\xfb\x9b\x65\x89\x5e\x38\xcf\x79\x97\xee\xab\x98\xa6"
+    b"\xc2\xed\xd2\x18\xdc\x17\x0c\x95\x44\x1d\x5c\x4c\xbd\xc1\xf5\xb0\xc1\x5f\x03\x68\x10\x64\x7a\xa2\x4f\x49\x8d\xd1\x6d\x59\xe8\xc7"
+    b"\x22\x73\x19\x05\x5d\x1a\x66\x2e\xba\x49\x1d\x36\x83\xdc\x3e\x32\xa7\xb8\xb6\xf4\x32\x7c\x8b\x33\x05\x07\x33\xe9\xc4\xd3\x4d\xd1"
+    b"\x95\xd4\xbd\x50\x60\xa4\xab\xf9\x15\xd0\xa5\x35\x76\xb2\x76\xd3\xc9\xed\x31\x2f\x69\x18\x10\xa6\xd7\x31\x84\x51\x2a\x04\x03\xae"
+    b"\x2c\x83\xf3\x9a\x46\xc6\x3f\xe9\x28\xf5\x54\xed\x92\x81\x5d\xb6\x00\xf9\xee\x5f\x92\x9b\x5a\x96\xed\x34\x0f\xca\x01\x4f\xfd\x5f"
+    b"\xae\x09\x93\xc3\x22\x67\xb4\xde\xce\xd7\xca\xc7\xf4\x5d\x66\xbd\xef\x9c\x28\x73\x19\xc2\xc2\x06\x4f\x9b\xe3\xc7\x69\x28\xde\x5c"
+    b"\x4d\x71\x82\x85\x32\x0a\xf3\x0a\xbd\x63\xc1\xd9\xcc\xd1\x4a\x41\x93\xdd\x46\x92\x79\x22\x77\xac\x1d\x08\xbc\x2e\xe8\x23\xbb\x0f"
+    b"\x96\x63\x5d\xa5\xdd\x9b\x22\xe6\x6e\x12\x65\xbc\xda\x70\xbd\x1c\x2d\xd5\xbc\x23\xc5\x8d\xa7\x1b\x76\xbf\x53\x9d\x9f\x96\x73\xa0"
+    b"\x98\x41\xce\x5e\xd1\x17\xcd\xdf\x88\x09\x67\xaf\x19\xdc\x36\x24\xd2\x1b\xf0\x91\x2f\x6d\x30\xc6\xc7\xfe\x74\x23\x72\x64\x06\x57"
+    b"\x54\xfb\x7c\x35\xc5\xb0\x6a\xf4\xa3\x04\x24\xdd\xbf\xea\xc3\x19\x62\xb6\x90\x98\x20\x22\xc3\xb2\xc1\xcb\x13\xca\x25\x9e\xb4\x78"
+    b"\x8d\xe6\x52\x28\x86\xa9\xfe\x81\x82\x80\xcf\xd5\x91\xec\xc9\x99\x26\xf5\xa0\xb1\x9c\xe1\xe4\x90\x31\xc4\x78\xb8\x3d\x99\xfb\x13"
+    b"\xff\x70\x49\x94\xa4\xed\x86\x78\x14\xf6\x4a\x04\x01\x94\x30\x96\x6f\x6e\x18\x9c\xa5\x31\xf8\xae\x2e\x83\xfc\x59\xb5\x44\xef\x55"
+    b"\x83\xbd\x8e\x70\x5b\x00\x16\xd9\x6b\x8e\xbb\x54\xf8\x0e\xeb\x44\x5a\xd0\x42\x4f\x01\xe1\x64\xf3\x43\xe2\x37\xcf\xe8\xc6\xa4\x69"
+    b"\x4d\xee\xce\x45\x5c\x2d\xaf\x80\xee\x26\xff\x14\xfd\x8d\x26\x72\xce\x8a\xe9\x5e\x9a\x42\x47\x32\x68\x17\xb9\x6e\xff\x33\xc4\xff"
+    b"\x46\x4d\x2f\x73\x2d\x60\x33\x4d\xa7\x08\xc7\xea\x46\x40\x0b\x9b\x58\x0d\xd4\x19\xe2\x6a\x41\xb6\x13\x53\x57\x6c\x67\xdd\x93\x12"
+    b"\x05\x46\x74\x84\x84\x41\x05\x31\x74\xdf\x4a\x7a\x3a\xb0\x02\x28\xef\xd5\x67\x9d\xc0\x5f\x7c\x0a\xa5\x21\xf5\x3e\x9c\xca\x87\x65"
+    b"\x5a\x47\x66\x3b\xf2\x79\x7b\xcf\x73\x89\xe3\x51\x88\x8d\x43\x1a\x0d\x6e\x8a\x17\x90\xb7\xc1\x68\xde\x60\x5c\x57\x84\x3e\xc0\x79"
+    b"\x3b\x38\x71\x55\x06\xa7\x5c\x3e\x72\x77\xb6\xa4\x93\xaf\xa8\xb8\xf8\xa5\xf9\x3c\xb1\x26\xc4\xae\xa4\x1b\x1d\x68\xa4\xac\x2a\x0e"
+    b"\x1e\x83\x6f\x40\xe9\x1d\xa6\x64\xf2\xc5\xb4\x8f\x53\x71\xb4\x3e\x74\x6d\xfc\x9d\xc9\xf6\xa5\x54\xc7\x4b\xbc\x8b\x6a\x4f\x69\x3e"
+    b"\x2f\xbd\xab\x3c\x74\x07\xfc\xda\x6f\xc1\x98\x27\x04\x06\x9f\x52\x71\x0b\x17\xd2\x6a\x85\xcb\xdf\xce\xfe\xca\x4b\xd3\x6b\x6b\x49"
+    b"\x08\xfe\xe2\xd7\x6f\x47\x1e\xba\x9b\x65\x7f\x46\x92\x38\x10\x68\x8a\x94\x6f\xab\x6f\x2e\x94\xec\x31\x3a\x95\xe5\xcd\x64\x5e\x2b"
+    b"\x5c\x50\xd6\x0a\x0c\xd9\x23\x85\x1a\xe6\x2d\x20\x2c\x86\xee\xee\x2c\x57\x81\xa1\xda\x65\x61\x53\x4f\x5d\x41\xef\xec\xc8\x63\xa2"
+    b"\xdf\xd4\x62\x62\x93\xbd\xb0\x3c\xdc\x4b\x7b\x4c\x9a\xe0\x46\x4f\x96\x01\x20\x29\xe9\xaf\x4c\x48\x89\xfa\xcd\xbb\xe4\xd3\x64\x2b"
+    b"\x75\x40\x87\xa2\xa9\x8a\xf7\xca\x3a\xf2\x63\x16\xdd\x48\xd8\xd7\x4a\xd8\x41\xc1\xff\xaf\xf1\xba\xa2\x91\xee\x6d\xaf\xcd\xec\x02"
+    b"\x50\x20\x0a\x95\xa9\x7b\xc8\xfb\x17\xf5\x63\x48\xd6\x80\xfe\x5d\xf1\x1b\xff\xa5\xa9\xfe\xfa\x54\xbf\x7e\x26\x84\x59\x8b\x6f\x36"
+    b"\xbe\x93\x77\xa5\xa5\x18\x0c\x39\x3d\x62\xf6\xdd\x22\xf9\xf7\x52\xea\x47\x3f\xb1\xed\x2a\x2a\x35\xb9\xf9\xf5\xff\xb9\x68\xd8\x46"
+    b"\x8d\x6f\xb4\x59\x29\xcb\x3b\xc8\x9b\x52\xbc\x0e\xcc\xf0\x2d\xb1\x55\x19\x77\x7c\x84\x06\x00\xc5\x0d\x16\x31\xaa\xfe\x6b\x58\xab"
+    b"\xc7\x33\xbc\x27\x04\xb6\xb5\x95\x78\xb4\x17\x5c\xc2\xc9\xc6\xd6\x4d\xb7\x06\x38\x77\x54\xb4\x8c\x3b\xb2\x65\x2c\x1b\x4a\x04\x7a"
+    b"\x73\x00\x38\xc0\xaa\x91\x47\x63\x60\x8c\x11\x40\xa0\xb6\x0b\xca\x00\xab\xe1\xd5\x56\x75\xed\xaa\x83\xeb\xbf\x34\x39\x1a\x1f\x8e"
+    b"\x20\x70\xef\x12\x1f\x02\x2d\xa6\xc9\xca\x37\x71\x5d\x71\x3d\x0a\xec\x40\x9b\x25\xff\x25\xa6\x61\x28\x13\xb8\x55\x68\xae\xd5\x1a"
+    b"\xe2\xe8\x98\x05\x93\x79\xaf\x19\x55\x39\x6b\x1a\x69\x37\x4e\x86\x02\xdf\xcb\xec\x14\xd4\xe3\xb6\x93\xec\x17\x08\x31\xb2\xa8\xd0"
+    b"\x28\xe6\x44\x71\x3e\x26\xe7\x01\xb0\x27\x5d\x81\x9c\xbd\xf1\xeb\x0b\x1e\xa8\xe4\x80\x4b\x5c\x79\x79\x3a\xb7\x64\x54\x7d\x4b\xf9"
+    b"\xa9\x1b\x83\x69\x6d\xc6\xf2\xe6\x02\x7b\xff\x69\xc0\x12\x4c\x23\xcf\xd6\x62\x85\x44\xc3\x76\x94\x25\xbe\x4d\xb8\x98\x38\xd4\x23"
+    b"\xf7\x7f\x07\xcc\x4a\x2b\x50\x30\x0c\x39\xc7\xba\xea\x97\xad\xfd\x3f\xde\xbe\x05\xd6\x34\x50\xbd\xbd\x7b\x0f\x17\x1f\x5c\x68\x23"
+    b"\x82\x07\xdf\xe5\xa9\x65\x6e\x23\xe5\x43\x00\xf2\x6f\xfb\x7d\x3f\xa1\x33\xfc\x6a\xef\x87\x5f\xe0\x58\x64\x09\x97\x4c\xaf\x81\xac"
+    b"\x97\xd4\xba\xbd\x1a\x05\xc8\x89\xf9\xa4\x96\x37\xb6\xfe\xa2\xa2\xfc\xa8\x5d\x21\x96\x63\x2b\x89\x0c\x11\xd6\x54\x52\x9a\xb3\x5e"
+    b"\x2e\xa4\x80\x02\x9a\x7d\xf2\x59\x1f\x3b\x27\x08\x88\x66\x4b\x50\xbf\x7b\xfc\x21\xb0\x68\xbe\x70\xea\x93\xb1\x5f\xcb\x61\xf0\x44"
+    b"\x40\xf6\x93\xf0\x96\x31\xd8\x3b\x0e\x56\x79\x0e\xae\x7e\x46\x73\xa3\x77\x93\x32\xbb\x96\x66\x17\xc7\xdd\x3c\x26\x73\x75\xdd\x63"
+    b"\xc7\x85\xa0\x2c\x9c\x63\x10\xe7\x26\x6c\x4e\x83\x49\x77\x5e\xc1\xd5\xab\xfd\x73\xcf\x34\xb1\x21\x58\x80\x02\x9d\xb7\x1b\x27\x22"
+    b"\x8e\x73\x74\xc3\x10\x9d\x37\x85\x2e\x27\x21\x11\x6b\x43\xd2\xda\x87\x99\x3a\x70\x14\x81\x6b\x95\x56\xf0\x1b\x72\x24\x28\x4e\xf9"
+    b"\xcb\x1d\x79\xf5\xc6\x31\xb6\x75\xa1\xba\x7e\x90\x4a\xa1\x82\x27\xe3\x8c\x4f\x67\x89\xdd\xf2\x68\xd2\x39\x43\xf6\x1d\x30\xfb\xf9"
+    b"\x6d\xfe\xbb\x90\x0e\xc5\x55\x2b\xc9\xbc\x0a\x1a\x87\x9a\x43\x00\xd8\xc2\x85\xb0\xc2\xe9\xd5\x1a\x44\x5f\x70\xcc\xf5\x38\x6e\x05"
+    b"\xd8\xcb\x6b\x72\x21\xee\x11\x2d\x87\xa7\x64\xcf\xf3\xcc\x23\x54\x34\xfc\xdb\xb1\x9b\x7f\xfc\xf9\x28\x8d\x2f\xd0\x9e\x9c\x64\x28"
+    b"\x9d\x99\xba\xd4\xcd\x08\xb2\x1c\x49\x0a\x18\xe6\xf5\xec\xc9\x96\x21\x7f\x53\x96\x95\xd5\xd6\xe1\x6d\xeb\xa4\xe9\x55\xfd\x91\x0b"
+    b"\xcf\x95\x31\xc7\xfe\x76\x17\xbe\xe6\x4a\x1f\x81\xa1\x3c\x42\x3e\xe4\xe6\x29\x23\x65\x86\x88\x4f\x6b\x27\xdb\x4c\xdd\xcd\x38\x69"
+    b"\x0d\x59\xfe\x23\xe9\x2f\x97\xec\x11\x70\x6e\x5f\xe6\xef\xb4\x84\xba\x1b\x5e\x23\x3d\xe3\xae\xb1\xbc\xc4\xe9\x56\xc3\xb3\xfc\xf3"
+    b"\x26\x59\xed\xcb\xb0\xd3\x1f\x2f\x51\xf6\x7b\xb9\xac\xac\xeb\x12\xf5\xc3\xb5\x84\xea\x46\x18\xc2\x0f\xc1\x99\xcd\x84\xce\xe0\x5f"
+    b"\x0b\x69\x4e\x22\xd4\x4f\x00\x39\x91\xda\x6e\x79\x2a\xf7\xf2\xc5\x73\xb1\x53\xfa\x8e\xa5\xae\x4a\xc5\x93\x3a\x4e\xec\xcb\x3b\xcb"
+    b"\xb2\x9b\x41\x6f\xb3\xd5\x63\x55\x05\x7c\xf3\x97\x4d\xed\xa2\x95\x21\x8e\x12\x4b\xc2\xc7\xce\x0c\x19\x56\xe5\x31\xd1\xf0\xba\xef"
+    b"\xeb\xa1\x17\x32\x0d\x49\xca\xdd\xfd\xa4\x4f\x18\x02\xd9\xd2\x4e\x08\x05\x51\xb9\x81\x1b\x50\x41\x6d\xff\xa0\xfd\x3b\x54\x8a\x11"
+    b"\x8d\xa6\xad\xa2\xdc\x8a\xc7\x2e\x66\x96\x6a\x09\x89\x89\x88\x85\x8e\xeb\x5a\xfe\x0c\x6a\xb3\xc9\x98\xd3\xc8\xa7\xc4\xd9\x4c\x93"
+    b"\x48\x7d\xf5\x0e\x59\xa5\x7a\xdb\x8b\x72\x40\x14\x62\x10\x39\x47\xb9\x67\x15\x05\x93\x5b\x30\x1c\x94\xba\x8b\xd3\x38\x7d\x53\x9b"
+    b"\x4c\x7c\x62\x43\x4a\x48\x6b\x90\x58\x0a\x87\x2a\xf3\xb6\x96\xc8\xf6\x0c\xe2\xe0\xbe\x5e\x97\x65\x20\xdf\x0c\xb5\xa1\xbd\x4e\xa6"
+    b"\x93\x52\xd2\x8d\xb7\x33\x79\xed\xd3\xc4\xbc\xea\xc3\x16\x11\xcc\x5a\x16\x7b\x33\x10\x47\xcf\x54\xa1\x26\xd9\xe1\xf8\x1c\x34\x2b"
+    b"\x21\x5e\x8e\x51\x82\x8a\xaa\xa5\x77\xcc\xdd\x7f\x09\x91\x2e\xa3\x3e\x91\xd6\x54\xab\xa9\x43\xdf\xaf\xea\xe3\x22\x66\xdc\x1b\x93"
+    b"\xcd\x0f\xdb\x9e\x1f\x73\xac\xcf\x20\x5c\x53\xd9\xf6\x1c\xf9\x7c\x00\xdb\x1b\x69\x5b\xe8\x19\xa0\xdf\x33\xf9\x10\xab\x2a\x51\x7a"
+    b"\xab\xcb\x80\xf7\x3c\xc5\x6a\x12\xe7\xde\x79\xe1\x15\xf7\xcf\x93\x23\xa7\x19\x59\x75\x7e\xf6\x6b\xc8\xb5\x22\xb7\xcb\xfb\x1b\xb1"
+    b"\x17\xba\x27\xda\xb5\x9d\x0c\x4e\x4e\x15\x12\x6c\x8c\x3c\x1a\x63\xd3\x8f\x9b\xa6\xdf\x98\x1e\xb7\x62\xdc\xce\xa1\x4e\xb3\x71\xbe"
+    b"\x5b\xda\xcb\xf5\xdd\x73\x6d\xb8\xfd\x01\x69\x28\x94\xde\x24\x6d\xc5\x98\xdb\x82\x67\x37\x81\xe3\x3f\x4f\x99\xe7\x33\x4d\x3d\x2d"
+    b"\x5f\x8e\xa1\xa4\x69\x7b\x95\x95\x85\xb3\xbd\x86\xd8\xa5\x3a\x2e\x91\xe1\x59\x65\x73\x7f\xe8\x31\xf0\xd2\x17\xa0\x73\x3a\x11\x6f"
+    b"\xbe\x9f\xcc\xb7\xd0\xd0\xa0\x8e\x9a\xce\xf1\xc2\xf6\x60\xba\x19\xa4\x42\x87\x98\x31\xda\x5d\x7c\x6a\x59\x84\x64\xff\x76\x42\xc5"
+    b"\x12\x2a\x68\x6a\x42\x9b\x5c\xbc\xc7\x75\x31\x11\x5b\x9a\x59\x96\x3a\xb4\x19\x7d\x95\x2e\xb4\x0a\xd0\x19\x69\xe0\x97\x2d\xdf\x82"
+    b"\x54\x9c\xca\x92\x6b\x57\x47\xa9\x77\x19\x10\x05\x0b\xdd\x7f\x6d\xc4\xd8\xff\x78\xeb\x05\xff\x02\x9c\x10\x40\xa2\x74\xd4\xad\x0b"
+    b"\xf6\x77\x3b\xa1\xe4\x67\xef\x92\xcd\x2e\xd8\x3e\x4b\xea\xe4\x51\x8b\x2a\x6c\x74\x83\xc1\xad\x1e\xf9\x77\x14\x85\xcc\x01\xc1\x84"
+    b"\x5e\x17\xee\x9c\x1e\x61\xc6\x42\xbc\x1b\x29\x0e\x45\xe9\x40\x6e\x42\xe5\x16\x7a\xce\x9c\x15\xef\xf2\x0f\x6f\xd5\x18\x8b\xed\x32"
+    b"\x4d\xc6\x44\x27\x35\x9f\x11\xf3\x3c\xe9\x3c\x59\xd3\xaf\x58\x29\x41\xc9\x28\xd3\xf5\x5f\x03\xd6\x38\xa5\xca\x37\xd8\x39\x8d\xf9"
+    b"\x13\x77\x64\x98\xe8\x62\x3d\x50\xe2\xfe\xad\xb9\x8c\x69\x97\x5b\xcc\x63\xb8\xf9\xce\xf8\x2a\x4f\x5d\x9f\x9a\x4a\xed\x42\x33\x92"
+    b"\x64\x2f\x73\x96\xb9\x92\x08\x80\xe2\x6d\xac\xfa\xb1\xbe\xb3\xa1\x44\xa8\xd7\xbf\x7a\x61\xff\x72\x62\x74\x0b\xe1\x4f\xc3\x16\xdc"
+    b"\x5a\x2e\x85\x1b\x2d\x69\x25\x6d\x54\x99\x1e\xbf\xe8\x07\x18\x14\x34\x01\x14\x34\x8f\x3a\x03\x49\x55\xea\x49\x76\x77\x5b\x6b\xf5"
+    b"\x22\x7d\x71\xa9\x17\xb4\xf8\x9e\x8f\x45\xfa\x22\x03\x94\x74\x40\x22\xbd\x18\x79\xdc\xf8\x0e\xe6\x9c\xc8\x75\x5e\x6d\x60\x50\x63"
+    b"\x66\xe8\x19\x6c\x08\x5e\xef\x87\x0f\xd6\x38\x61\xed\xb8\x33\xe9\x5b\x15\x54\x06\xe9\xce\x44\x00\xce\xea\x42\x45\x6b\x7d\x8f\xe1"
+    b"\x79\xbb\x53\x17\x45\xbe\x3a\xc9\x3c\xe4\x26\x5e\xbb\x9a\x3a\xfd\x15\x5d\x3f\x77\x70\xb5\x10\xa8\x45\x0f\x16\x4b\xc4\x58\x95\x01"
+    b"\x11\xbf\xe4\x7f\x75\xf6\x88\xf9\xd2\x8f\xff\x92\xab\xe3\x34\x69\x7a\xb7\x87\x34\x95\xd9\x78\xc2\xd3\xc4\xa0\xcb\x3f\xe1\x4e\xe4"
+    b"\x8e\x7d\x1c\x22\x71\x90\x6c\x02\x32\x92\x82\xc4\x4a\x33\xaa\x2e\xb1\x67\x19\x77\xa1\xd0\xfd\xcf\xc0\x74\x91\x38\x75\x3c\x08\x86"
+    b"\xc8\x3d\x82\x07\x2e\xec\xe5\xc3\x06\x8f\x02\x1f\xb5\x9e\x83\x34\x09\x31\xd5\x19\xd0\xc7\xf8\x89\xf8\x4f\x5f\x10\x89\x95\x3c\xe2"
+    b"\x2e\x31\xce\xeb\x42\xcd\xb0\x7d\x1a\xc7\x08\x42\xff\x6d\x56\x82\xc2\x4c\x5a\x94\x99\x28\x44\x00\x6d\x91\x70\xdd\x0b\xb0\x1d\x20"
+    b"\x10\xf1\x40\x45\xc8\x47\xa4\xb3\xc9\x07\xf2\x02\x36\x20\x96\x80\x75\xe9\x2f\x31\xd4\x73\xc7\x96\x8b\x85\xb7\xc6\xe3\x20\xf7\x91"
+    b"\xfb\x4c\x6e\x18\x1d\x84\x86\xcd\x4e\x9f\xab\xa9\x87\x5c\x94\xf3\x81\xa6\x46\x3c\x81\x88\x64\xe6\xf5\x6e\x15\xa6\x68\x56\x82\x0d"
+    b"\x4a\xdf\xf7\xe8\x73\x21\x33\x35\xf6\xe8\x5a\x3d\x27\x52\x04\x02\x70\xf9\x57\x71\x39\x15\x1b\x55\xf9\xa2\x64\x89\xc4\xdf\x77\x30"
+    b"\xfc\x15\x93\xb1\x15\x5e\x8e\xa2\x3b\x06\x4e\x1f\x74\xde\x2f\x94\xcd\xb6\x48\xb6\x6e\xfa\x91\x77\x72\x41\x78\x71\x6a\xa1\x17\xae"
+    b"\x9c\x89\x6b\x31\x0b\x24\x3a\x35\x0d\x0b\x35\x4c\xc3\x36\x40\x37\x40\x67\xd5\x17\xa6\x41\xe3\x54\xc9\x56\x4d\x76\x15\x62\x79\x1c"
+    b"\x17\x34\xbb\xbd\x84\x3b\x54\x26\x93\x0a\x08\x09\x65\xcd\x5b\x05\xa5\xd2\xce\xb4\x50\xa3\xfa\x90\x75\x4d\x22\x31\xc9\xb5\x74\x13"
+    b"\x57\x9a\xbd\x10\xe8\x29\x27\xb8\x3a\x44\xc2\x45\xa3\xd8\xad\xcb\x86\x3d\xb4\x2d\x6c\x0b\xb4\x17\x85\x00\x7e\x19\x68\x72\x09\x5a"
+    b"\xef\x7f\x7e\x04\x90\xd4\x73\xd8\xf8\xbf\x33\x1b\x44\x2f\xdd\x64\xac\x7c\x0c\x3f\x64\xda\xf9\x99\x18\x8f\x61\x42\x2c\x25\xf2\xdd"
+    b"\x72\xb7\x2d\xb1\x3c\x68\xce\xca\xe2\x57\x88\x80\x12\xa9\x0f\xa2\x55\x99\xfb\x53\xff\x38\x71\xfd\x6c\x4a\x22\xe6\x58\x9d\x28\xc9"
+    b"\x09\x58\x97\x51\xcf\x0a\x17\xb7\x9b\xc2\x6f\x05\x4f\x6a\x5a\x25\x4f\x9a\xa8\xb8\xb1\xa0\xb2\x26\x64\xb2\x73\xb1\x51\x5e\xb8\x9e"
+    b"\xbe\x66\x6b\x34\xfa\x37\x30\x5d\x74\x1b\x36\x24\xeb\xd0\x17\x0b\xa9\x29\x45\x06\x50\x57\x23\x79\x41\xdb\xb2\xd2\xe2\x28\xf9\xfd"
+    b"\x8a\xb6\x67\xfb\x9a\x14\xc4\xfb\x15\xf0\xc4\x1f\x63\x95\x07\xba\x16\xa7\xfe\xbf\x61\x97\xd0\xa0\x5e\x74\x9b\x01\xed\x35\xbb\x33"
+    b"\x2f\xf1\x40\xf9\x54\x6f\x4f\x51\xc2\x72\x42\xe3\x76\xaa\x7e\x89\x40\xcd\x0b\xa1\x4e\x50\xa9\xbe\x3a\xa8\xcc\x0f\x36\xf0\xac\xcf"
+    b"\xdd\x4a\x70\xff\x69\x68\x1a\xde\x2c\x60\xfe\x77\x4f\x0e\xb2\xd0\xd8\xf0\x81\x81\x63\x76\xb5\x4d\x50\x25\x08\x3b\xdd\x43\x6b\xfb"
+    b"\xf3\xdb\x50\x76\x7c\x0c\x5c\xe7\x25\xb4\x2f\x9d\xa9\xa8\xdf\x87\xe9\x73\xa8\x57\x5e\x1a\x3c\x79\x98\x9f\x58\x6d\x58\xee\xd4\x1b"
+    b"\x29\x2d\xec\xa0\xc5\xdf\x14\x8b\xb4\x00\xf7\xaa\x1b\x8e\xc0\x0b\x5a\x74\x81\xbd\xbf\xe4\xaf\x43\x2b\xfd\xdc\x61\xc0\x95\x43\x02"
+    b"\xa7\x70\xc8\x40\x45\x54\x8f\x0c\x19\x6d\xf5\xbd\xb4\x7d\x2a\xb7\xf9\x9d\x1e\x5e\x57\x4f\x9c\xb7\x51\xf9\x73\x53\x9e\x64\xce\x49"
+    b"\xf1\x54\x35\x0e\x97\xd0\xeb\xe0\x8b\xeb\x29\xc1\x7e\x7c\xc1\xd8\x4d\xd3\xe0\x15\x3f\x10\xc3\x7e\xb3\x29\xf9\x1b\x3d\xad\xa6\x6b"
+    b"\xa5\x16\x0f\xa6\xc9\x32\x9e\xcd\xdf\x18\x64\x81\x22\x62\x42\xb5\x00\xf4\x46\x69\x1f\xf1\x25\x5d\x88\xd6\x05\x15\xcf\x33\x23\xac"
+    b"\x25\x7e\xac\x55\xc7\x5d\x40\xe6\x5b\x1c\x73\x18\x4f\x0f\x85\xe6\x9d\x9e\x2a\x9f\xdf\xbb\xe9\x38\xad\xab\x61\x8a\x65\xd5\xfc\x73"
+    b"\x85\x20\xe9\xa4\xbc\x3b\x9c\x35\xe9\x29\x2c\x56\xed\x05\x4f\xf2\xbb\xa2\x9f\xed\xcf\x9f\xf5\x59\xe6\xc6\x97\x58\x66\x9f\xab\xd2"
+    b"\x39\x0c\x1a\xfa\x3f\xd4\x27\xed\x18\x36\xf7\x23\x36\xf5\x9e\x72\x9f\x46\xed\x1c\xb0\xa8\x5a\xfd\xe7\x5d\xb0\xab\x4e\xab\x31\x6d"
+    b"\x62\xab\x69\xff\x7a\x74\xa5\x06\xd0\xea\x50\x6f\x4d\x9a\x7f\xfb\x90\x86\x2b\xf4\xea\xa5\xfe\x82\x8a\xf5\x54\x12\x5f\x19\xf0\xf9"
+    b"\x4b\xaf\x13\x86\xb8\xd8\xdd\xd8\xda\x63\xc5\xa1\xa2\x53\xcb\xf0\x3d\x1e\x66\x31\x58\x3f\xc1\x50\x52\xed\xb8\xd4\xc1\xed\xdc\xb7"
+    b"\xce\x4d\x85\x55\xd6\x2b\x4f\xc5\xb4\xeb\x4f\x61\x4e\x33\x9b\xde\x6d\x42\x8f\x4d\x90\xf1\x64\xd2\x43\xb1\x7c\x52\x7d\xe3\xa1\x27"
+    b"\xa2\x6d\x6f\x80\x60\xf1\xf1\x2b\xdc\x4b\xa1\x7c\x58\x05\x49\xc9\x11\x1c\xd4\xea\x53\x43\x88\xc0\x32\xdf\xbc\xfe\x68\x8a\xa6\x18"
+    b"\x36\x6b\x07\xfc\x16\x96\x9b\xe0\xb6\x13\x98\xae\x11\x31\xd2\xd6\x8a\xd4\xf7\x72\x12\x32\xf3\x45\x87\x1e\x51\x9e\x59\x33\xce\xda"
+    b"\x22\x82\x46\x49\x07\x58\x09\xa6\xa5\x46\x01\x6f\x91\xcc\xee\xa5\x21\x72\xc9\xd8\x17\xbb\x5a\x38\x12\xc8\x9d\xdc\xcb\x11\x35\xcf"
+    b"\x66\x74\xb5\xa7\x81\x89\x6e\x36\x5d\xef\x07\x33\x0e\xb2\x42\xd0\xe2\x77\xa6\xbe\x87\xd3\x30\xb2\x74\xeb\x23\x3f\x2c\x68\x3a\xe4"
+    b"\x8a\xcd\x9a\xd1\xeb\x65\x23\x5c\x4c\x81\xae\x1b\xe5\xa6\xce\xbf\xae\xf3\xa9\x58\x6b\x62\xe7\xf2\xae\x3a\x7c\xab\x25\xff\x11\xae"
+    b"\x72\x1a\xd9\x4b\xc7\x79\xdc\xbc\xa5\x0a\x20\x29\xea\xff\xa2\xf3\xe3\xce\xda\x94\xa4\x8a\x7d\xcf\x9d\xfe\x99\x2f\xf4\x76\x7b\xa6"
+    b"\xba\x06\xfb\x92\x03\xf4\xbb\x06\x47\x08\xc4\xa7\x29\x24\x4d\xf8\x80\xb6\xb1\xb7\xcc\xce\x42\xc8\x0f\xfc\xf9\x3b\x61\xe6\x8c\xf7"
+    b"\xbc\xae\xb9\xf4\x3a\xd9\xdd\x19\x73\xea\x96\xc6\x3e\xe2\x2d\x5c\x42\x38\xb0\x18\xc5\xfd\x8f\x6c\x24\xc3\xef\x6a\x37\x34\x3a\x38"
+    b"\xc6\x3a\xb8\x50\xf1\x7b\xbf\xf2\xe3\xdc\x59\x9e\xf4\x48\xaf\xf7\xf7\xe2\xf0\xd0\x31\x0e\x34\x93\x81\xa0\x84\x31\x5c\x36\x6a\x87"
+    b"\xb1\x61\xe1\x7b\x76\xf8\xd4\x49\x64\x61\xcc\x71\xbc\xe5\x2e\xc7\x26\x4a\xf9\xf9\x76\x0f\x13\x90\xdc\xa9\x20\x6f\xe0\x43\xee\x7c"
+    b"\x50\xa4\x66\x07\xfd\xbf\x53\x65\x7f\x6e\xe3\xe7\x33\x31\x61\x69\x41\x2f\x0a\x3a\x19\xdc\xca\xaf\x81\xf1\x36\x16\xf0\xb9\x3e\x1d"
+    b"\x2d\x28\xa0\x02\x29\x88\xa8\x59\x8f\xf1\x4a\x5c\xd5\x97\x5d\x29\x9f\x8f\xdf\xaf\xd9\xde\x52\x37\x30\x71\xd0\xbd\x4c\xbb\xbe\x53"
+    b"\x70\x6b\x80\x24\xa5\x5b\x6b\xcb\x3b\xbe\x4d\x56\x0e\x65\x26\x46\xf0\x72\x2e\xe1\xc9\xe1\xd4\x2f\xed\x08\xbe\x6c\x92\xfb\x6c\x1a"
+    b"\xa1\x45\xb2\xa4\x74\x8b\x20\x4f\x1d\xa2\x53\x09\xa5\x5f\x72\x0a\x76\x51\xbd\xd9\xa0\xc7\x21\xd3\x08\x4c\x9d\xdf\x04\x69\xdc\x1b"
+    b"\xa7\xc2\x4c\x0d\x17\xf1\x85\x3e\x0d\x95\x9f\x97\xd4\x1a\x58\xd2\x28\x19\xeb\x5a\x70\x3c\xce\x26\x60\xd7\xc9\x22\xb4\x36\xda\x5b"
+    b"\xb0\xcb\xff\x77\xee\xaa\xf1\x29\xba\x06\x08\x84\x84\x3f\xdb\xa4\xba\x1c\x4f\xd0\xb9\xe9\x4a\x11\xe6\xae\x3f\x99\x04\x28\x7e\x1e"
+    b"\xd2\x67\x36\x1e\x1c\xe2\xe8\x7e\x88\xf4\x13\x34\x43\x94\x3f\x74\x15\x8f\x73\xa5\xe3\xa7\xe0\xd5\x43\xf8\x78\x4f\x75\x3c\xe8\xef"
+    b"\x14\x0e\x53\x89\xbd\x6c\x4a\xc4\xab\x2c\xf7\x65\xd9\x95\x95\xce\xed\x39\xe2\xa7\xd0\xa3\x3b\x70\x53\x57\x65\xaf\xef\x80\x14\x0b"
+    b"\x2d\x02\x7d\xe0\x63\xc2\x27\x17\xdd\x3f\xbe\xd9\x1c\x46\x1d\x1b\xaa\x85\x58\x0d\xdc\xb2\xd9\x37\x0d\x44\xbe\x7e\x3e\x09\x9c\x58"
+    b"\xe7\xc0\x18\xdc\x9d\xe5\xe1\x47\x06\x77\x0e\x74\x5d\x47\x76\xa3\x07\x10\x33\x0f\x5a\xc2\x96\x13\x2c\xf2\x41\xcb\x9b\xc8\x80\x95"
+    b"\xd7\x8c\x6d\xb2\x4f\x2b\x14\xd5\x78\x61\xff\xb6\xeb\x89\xb8\xc3\xd2\x11\x7a\x2a\xb4\x78\x37\x03\x7b\xee\xd4\xa7\x21\xab\xa8\xbd"
+    b"\xdb\x84\x4c\x45\xaf\x85\x9d\xf0\x3f\x30\x02\x25\xe7\x7d\x02\x35\xf9\xc4\x7f\x15\xe4\x57\x77\x7d\x74\xe6\x93\x62\xb8\x52\xb7\x2e"
+    b"\x45\x7c\xb4\xfc\xfd\x01\xe4\x58\xa7\x42\xdf\xbf\xa6\x69\xcd\x56\xb3\xea\xb5\x5a\x31\x4c\xc3\xae\xab\xc3\xb8\xce\xd4\x67\x30\xd2"
+    b"\x53\x71\x43\x37\x99\x5e\xf2\x51\x73\x68\xc4\xf5\xf3\x8a\xbd\xee\x54\x05\xe7\xe4\xb6\xf7\xcf\x5c\x5d\xaa\x31\x88\x89\x8b\x28\xb8"
+    b"\x52\xee\xc3\x19\x6f\x29\x32\x80\x99\x2b\x2e\xa9\x1c\x71\xf6\xc7\xcb\xe1\x57\x0a\xae\xcd\xaf\x30\x32\x34\x5a\x03\x73\x25\x17\xfa"
+    b"\x61\x25\xfd\x50\x7f\x4a\xac\xe5\x79\x7d\x04\xbc\x61\xa8\x76\xe0\xda\x71\x3d\x83\xbd\x84\x51\x3f\x8a\x7e\x35\x83\xce\x24\xec\x9a"
+    b"\x08\x1e\x32\x52\x1f\xbc\x42\x73\x76\x03\xd4\x1e\x7c\x97\xdd\xd4\x24\x68\x23\x7f\xf2\xba\xb3\x7a\xb1\xce\x7b\x98\x93\x0c\x3a\x7b"
+    b"\xa9\xcd\xc4\xe9\x35\x09\xf6\x3a\x8b\x25\x51\xe1\x12\xb7\xe8\xfe\x12\x75\x81\xd8\x55\x9b\xe6\xb3\x43\x09\xe4\x8b\x05\x0a\x97\xbc"
+    b"\x20\xa7\x05\x9a\x0b\xc6\x60\x25\xf5\xab\x09\x4c\xb1\xc3\x92\x74\x91\x99\xa8\x04\xfd\xdd\x0d\xa3\x6c\xaf\x6f\xc7\x3e\x75\x0b\xf0"
+    b"\x22\x4b\xa6\xd4\x35\xcb\xad\xee\xc8\xba\xf6\xe5\xe4\xe2\xe9\xb1\x0e\x0e\x1a\xd9\x71\x15\xd9\x41\xae\x01\x35\x1d\x94\x2b\x46\xcf"
+    b"\xab\x9a\xca\x34\xb1\xab\x4d\x20\x53\x07\x9f\x0f\xa3\xfe\xc3\x89\x48\x39\xd0\x11\xdc\x09\x86\x79\x60\xbf\xce\xb0\x56\x96\xbc\x98"
+    b"\xa9\x5f\x33\x2d\xa8\xdb\x99\x91\xbe\xd8\xa9\x24\xee\x5d\x71\xaf\x8f\xd0\x7f\x44\xd7\x7b\x81\xdb\xd9\x3f\xf8\x72\x91\x84\x78\x72"
+    b"\xae\xcb\x2d\x4d\x2c\x2e\x62\x7f\x27\xf2\x01\x7d\xee\x9a\x1c\x10\x61\x9d\x20\xf1\x57\x8d\xc0\x97\x06\x6c\x35\x25\xf7\x80\xdf\x85"
+    b"\x8e\x85\x33\x09\x65\xf6\x71\x18\x2b\xb9\x1a\x83\xc6\x23\x07\x49\xe7\x78\xb4\xc6\x87\x01\x58\x53\xfc\xc9\x5e\xc5\x7b\x76\x33\xb1"
+    b"\x1b\xb4\xe2\x53\x1c\x48\x6a\xa0\x17\xd3\x7a\x7f\x43\x24\x3e\x0f\x87\xaa\xc8\xa4\xb4\x62\x2e\x06\x8e\x12\x49\x23\x5a\xbc\x03\x35"
+    b"\x2d\x39\x1c\xbb\x9f\x7c\xcb\xb3\x52\xa8\x0e\xfc\x44\x7c\xa1\x81\x50\xc1\xdf\xd1\xf6\x2e\x3b\x45\x49\x9b\xce\xa6\xf1\x42\xa4\xa8"
+    b"\xb4\xe4\x63\xda\xcd\x73\x37\xee\x2b\xb4\x09\x79\x6d\x7b\xa6\xda\x77\xbf\x8d\xcf\xcc\xb3\x91\xb2\x68\x99\x43\x8d\x6a\xea\x06\x3f"
+    b"\x5e\x7e\x4a\x94\x42\x9c\xa7\xf7\x24\x3c\xa1\xea\xbc\xab\xde\xed\x01\xde\x1d\x6c\x2b\x01\x4e\x61\xb4\xcc\xc3\xac\x20\x7d\x1f\x0b"
+    b"\xbe\x8f\x51\xea\xa3\xc0\xa3\xd1\xb3\xc4\xc7\x05\x85\xb1\xbe\x8d\x9e\xba\x66\xf4\x17\x45\x0e\x5e\x2a\xb6\xf7\x5f\x94\x8f\x74\xaf"
+    b"\xbc\xf1\x1b\xac\x80\x29\x6b\x10\xcf\xb5\xfa\xd4\x58\x76\xbd\x39\xe9\xeb\x60\xee\x91\x55\xfd\x41\x50\x98\xb8\x0c\x0c\x41\x77\x49"
+    b"\xe2\x1e\x66\x22\xfd\x34\x80\x06\x1c\x18\x5e\x8f\x7a\xc2\x3e\x06\x13\xe4\xf2\xf6\x29\x89\xc3\xa5\x06\x5b\xe5\x97\x08\xac\xba\xe4"
+    b"\xd9\x7f\xbf\x37\xb3\x76\xa7\xf6\xbc\xf6\x04\x87\x67\x7c\x9a\x8f\xb3\x1b\x7f\x70\xad\xd7\xe1\xcc\xd5\x9d\xe8\xcb\x87\x59\x02\xc8"
+    b"\xac\x24\x23\x68\x6b\x15\xc2\x53\x9d\x83\x83\xc9\x9c\xcd\x22\x3e\xb9\x7d\x7d\x24\x62\x60\x38\x97\x18\xe9\x4d\x65\x16\x61\xea\x71"
+    b"\xdd\x5a\x50\x58\x71\xae\x04\x03\x5f\x79\x54\xf7\x73\x79\xbe\x2c\x7e\xd2\x1d\xad\xf6\x8a\xe6\x72\x79\x0c\x0f\x46\x6e\x2a\x92\x3f"
+    b"\x26\x30\x79\x23\xe8\x22\x8f\x52\x2c\x06\x93\xb4\x51\x56\x77\x58\x25\xee\x72\xd3\x97\x3f\x4a\x5c\x9a\xff\x46\xb7\xa7\x99\x71\x63"
+    b"\xd4\x78\x14\x9d\xf6\x04\x74\x9a\x84\x45\x16\x68\xd9\x54\x18\x65\xd1\xed\x48\x2f\x42\x8f\x38\x11\x40\xdc\x08\x7d\x17\x50\xae\x27"
+    b"\xfa\x4a\xe5\xb4\xc6\xf7\x7c\x2a\x4e\xc3\x2d\x91\x59\x3c\x46\xf3\x2c\xd9\x7b\x3b\x76\x60\x55\x33\x9f\xbe\x37\xf7\x5b\x54\x03\xd9"
+    b"\x4c\x70\x6e\xb9\xd9\x9c\x0e\x58\x90\xa8\x9e\x83\x6a\xd2\x23\x62\x23\x6e\xb1\xff\x6c\x57\x5a\xc3\x4c\xd9\x4e\xfe\x67\x23\xc1\x9a"
+    b"\x11\x0e\x24\xc5\xe5\x43\x62\xa7\x83\x4e\x96\x6a\xc6\xe4\xde\x03\x58\x44\x26\xef\xc8\xd3\x34\xcd\xed\x6f\x63\x16\x5b\x7b\x8f\x46"
+    b"\xed\xda\xba\x27\xa5\x15\xa5\x7a\x88\x9f\xaa\x2d\xab\x0d\x2e\xf7\x69\x06\x71\xe3\x9b\xfc\xbc\xc1\xca\xf0\x58\xa4\x3f\x5b\x04\x75"
+    b"\x7b\xfd\xb9\xc1\xdc\xeb\x8f\x28\x26\xb0\x9a\xe6\xdf\x89\x3c\xa1\x4e\xf8\x15\xd2\xd0\xcd\xbe\x74\x11\x9d\xe4\x14\x7c\xec\x11\x73"
+    b"\x14\x83\xc9\x25\x28\xa2\xff\xcf\xab\xc9\x86\x53\xf8\x00\x28\x33\x9e\x91\x96\x03\xa1\xb7\xd0\xf0\x16\x5b\x0f\x65\xf1\xd3\xc5\x6e"
+    b"\xbc\xc0\xa8\xeb\x64\x12\x80\xb7\xe0\xff\xda\x7c\x09\xea\xf0\x2b\x75\xd4\x8e\x67\xd9\xbc\x74\x4a\x1d\x63\x01\xa6\x4c\xb6\x50\x7c"
+    b"\x8c\x03\x8b\xf7\x7d\x98\x46\xa6\xc2\x53\x6f\x9f\xfb\x93\x8f\xd3\x6b\x08\xf6\x60\x62\x1b\xab\x9f\x18\xe7\xba\xe0\xe3\xb4\x17\xe2"
+    b"\x46\x61\x18\x30\x14\x18\x96\x83\x02\x48\x93\x2b\x18\xf7\xfb\x42\x95\xb9\xed\x96\xc5\x90\xe4\x6d\x3d\x11\xdf\xbd\x33\xf6\x4c\x92"
+    b"\xa1\x3c\x0c\x97\x03\x57\xa5\xff\x62\xa1\x5d\xe3\x85\xe3\x43\xe7\x1f\x98\x14\x41\x5c\x9f\x29\x0c\x02\x1c\xd4\xe0\x58\x1e\xd2\xe5"
+    b"\xaf\xdb\x0c\xd6\xbf\x5d\xee\x54\x03\x9a\x82\xaf\xb3\xc6\x7f\xd8\xac\x6e\xc5\xb9\xaa\xdb\x1e\x3f\x8a\x10\xd0\xe5\xe1\x46\xe8\x7b"
+    b"\x46\xcd\x78\x88\x6f\x64\x50\x28\x5f\x5b\xf7\xdc\xc8\x97\xeb\x56\xe2\x14\xe8\x26\x4e\x70\xa4\xaa\x6b\xfa\x3c\xb6\x24\x35\x60\x97"
+    b"\xae\xe6\x15\x00\x8c\xb1\xf2\xbd\xf5\x7f\x8c\xbe\xc9\x8d\xd4\xd7\xc3\x28\xa1\xfb\x04\x9d\xd2\xcc\x64\xa7\xd3\xbe\x8d\x92\xdf\xec"
+    b"\x1b\x18\x63\x38\x96\x40\x80\x7b\x51\x08\x9d\x0c\xf8\x92\x1a\x43\x62\x03\x22\xaa\xee\x43\x9b\x9e\x84\x4c\x40\x44\x89\x99\x31\xe6"
+    b"\x02\x66\x13\xc7\xa6\xf0\x30\x7a\x44\x07\x85\x6b\x80\xca\xe7\x34\xb6\x97\x0c\xb4\xea\xdc\x00\x30\xfd\xa2\xd0\xeb\x45\x1d\xde\x05"
+    b"\x7e\x7d\x36\xf7\xbc\x2d\x10\xa2\xbd\x9e\xa7\x45\xed\x6f\x0d\x0f\xaa\x02\x81\x97\xf9\xe6\xf2\x86\x4e\x0f\x44\x5e\x7e\x1a\x5d\x3b"
+    b"\x7d\xf3\xf8\xb1\xa3\x45\x16\xb9\x9b\x77\xa2\x8c\x73\x13\x58\x65\x73\x73\x39\x07\x20\x8d\x47\x13\x1b\xcd\x8f\x10\x9c\xff\x66\xfb"
+    b"\x89\x75\xa8\xb3\xbf\x81\x92\x6f\xfc\x0a\x51\x7d\x10\xbd\x71\x1a\xac\xd3\x27\x79\x35\xaf\x63\xf7\x4b\x53\xe0\xc8\x15\x5f\x6a\x5a"
+    b"\x1a\xcc\x7e\x3c\x82\xde\x15\xda\xd3\xde\xd8\xbd\x43\xe1\xf9\x3d\x04\x95\xcd\xa2\x13\x86\xb8\xf3\xad\x97\x55\xe5\xee\x22\x4b\x2f"
+    b"\x29\xf8\xc4\xbe\x7a\xb5\x4f\xe7\xf9\xd0\x48\x8b\x75\xae\x17\x02\x77\x94\x55\x8d\x35\x28\x86\x09\x85\xb7\xc0\x93\xbc\x5d\x9f\x18"
+    b"\x96\x2c\xbb\x95\xd3\x38\x8b\x4f\x58\x94\xad\x2c\x6d\x67\xd8\xa0\x39\x60\x7e\xeb\x0e\x2d\x34\x9e\x54\xad\xca\xf4\x5b\x74\xe9\xae"
+    b"\x9f\x31\xca\x3a\xdd\x05\xc4\x7d\x2f\xe6\x97\x8d\xb2\x34\xdc\xa4\x5b\x7f\x9c\xc4\xbc\x85\x92\xb1\x38\x24\xf3\x1b\x7d\xca\xc3\xf4"
+    b"\x47\xa8\x70\x37\xac\x64\x17\x73\x78\xff\x8e\xbd\x3d\x4c\x98\x9b\xe8\xd5\x6e\x49\xe6\xca\x74\xe1\xc1\x93\x65\xc3\x0b\x6f\x34\x07"
+    b"\x09\x56\x66\x25\x9f\xef\x07\x23\xbc\x17\x15\x8e\x66\x90\xae\x5a\x70\x3f\xd9\x40\x77\x7a\x32\x7b\x65\x90\x60\x2d\xb2\x7d\x32\xad"
+    b"\xc3\x43\x0b\x6e\xd1\x11\x18\xa2\x28\x8b\xd5\x27\x3b\x98\x99\x05\xb3\x16\x8a\xe9\x1d\xac\x77\xa9\x8b\xcf\xab\x9a\x51\x88\x3d\x32"
+    b"\x66\x4f\xcd\x30\xaf\xa9\xab\xb0\x5e\x0d\xd7\x64\xda\x48\x39\x3b\x4f\x24\xbb\xb8\x95\x10\x32\x41\xb8\xa5\x4b\x0f\x8a\xa4\x8c\xd8"
+    b"\xc3\xdc\x5f\xcb\xeb\xad\x41\x6d\x27\x03\x5f\x4a\x9a\x5d\xac\xa5\x40\x23\x6a\xbf\x00\x6d\xb0\x2f\xa2\x1e\xa5\xc2\x29\x94\x40\x57"
+    b"\x71\xa1\x98\xb9\xa9\xbd\x6b\xb7\xb4\x94\x7c\x57\xa1\x9b\xb9\x75\x44\x37\x9d\x62\x9f\xe3\xe4\x56\xc6\x3a\x4d\x49\xc8\x49\x79\x6e"
+    b"\x0b\x06\x9a\xf4\x0d\xa6\x03\xa1\xca\x00\xb9\x59\xbb\x4b\xd1\xa9\xf8\xaa\xdd\xfc\xc8\x97\x57\x01\x7c\x5b\xdf\xe2\x51\xbe\x12\xdd"
+    b"\x20\x57\xd2\xeb\x13\x1d\x6e\xbb\xb4\x9a\x64\x5c\x28\x33\xb9\x21\xdd\x04\x2e\xcf\x68\x57\x7c\x23\x9b\xb4\x7c\x65\xf4\x6b\x22\xc3"
+    b"\x09\x98\x6e\x7b\xc3\x82\xa9\x66\xe3\x39\xc6\xab\x3f\xd2\xb6\xc6\x9e\x95\x89\x3b\x0b\xc0\xda\xcb\x29\xb0\x08\xaf\x74\x44\x27\x45"
+    b"\x00\x28\xba\x16\xb4\x5f\xcc\xe4\x81\x5d\x09\xab\xbf\x06\x8f\x90\x0f\x47\xda\x98\x53\x90\x82\xe9\x19\xb3\xb9\x69\x5e\x34\xe2\x76"
+    b"\x8c\x29\x81\x22\xc7\xef\x6e\x98\xef\xcb\x08\x9c\x42\x36\x37\xeb\x8f\x7f\xa5\x67\x41\x7b\xa3\xf4\x78\x06\x0a\x92\xd8\x4d\xbb\xaf"
+    b"\x40\x5c\x17\x99\x15\x3e\x39\xd4\x20\xb8\x44\x5b\x24\xd6\xf3\xc5\x50\x0d\x4f\xdc\x88\x85\xad\xdb\xff\x65\x7a\xd1\x86\x50\xe3\x81"
+    b"\x72\xb9\x3b\x7b\x34\xd4\x54\xcb\x72\x65\x82\x63\xfc\x43\x20\xd2\x8a\xfd\x97\x98\x55\x9a\x99\xfc\x35\xd6\x11\x5f\xc2\xc0\x26\xf4"
+    b"\x1f\xcd\x15\xa6\x1d\x7a\x00\x9c\xcc\x1e\x6a\x1d\x2e\x19\x90\x6b\x1b\xc0\x94\x23\xca\xf6\x27\xee\xdd\x10\x3b\xc9\x6d\x4e\x34\xb6"
+    b"\xfe\x49\x63\x00\x6b\xf7\x11\x7b\xaa\x4d\x4d\xa9\x1b\x55\x6e\x84\x47\x5c\x01\x89\x3a\xa2\x87\x02\xb8\x51\x1f\xac\xff\x62\x9d\x19"
+    b"\x3a\x5d\xba\x5c\x67\x5c\x1a\x0d\x80\x8a\x64\x92\xd8\xfe\x6e\x31\x27\x4e\x0b\x63\xab\xd9\xbc\x20\x6b\xfc\xc6\x9b\x4f\x7c\x0a\x99"
+    b"\xf0\x8d\xe4\xe3\xf3\x86\x2a\x48\x6b\x07\x08\xd8\x73\x10\x89\xc0\xf0\x61\xf2\xef\xe8\x1c\x2b\x9c\x24\x84\x7d\x69\x3c\xbf\x52\xd7"
+    b"\xd4\x27\x17\xbd\xe8\x71\x90\xa4\x7b\xf1\x74\xef\xca\xa5\xce\x05\x11\xa4\xcb\x92\x23\x1b\x5f\xe6\xee\xf1\x4b\xc8\x23\x0b\xe7\x6f"
+    b"\x29\x7b\xce\xfb\x74\xc3\xc6\x3c\xbd\x84\x2a\xbe\x46\x1c\x0a\xb8\x3f\xee\x0a\x8f\xcb\x43\x85\x5c\x4e\x7e\x73\x0c\xee\x18\x41\x91"
+    b"\x19\xec\xc9\x8a\xc5\x17\x17\x1c\x41\xf7\x4b\x0d\xf9\x52\xca\xe8\x5a\x4d\xf8\x63\xc4\xb1\x56\xd6\x3f\x0b\x29\xbd\xa7\xb1\x38\xb0"
+    b"\x54\x24\x52\x70\x69\x4b\x57\x2f\x11\xde\x9f\xbe\x4b\x35\xf2\x76\xce\xa9\x5a\x68\xd6\x54\xed\x09\x20\x51\x75\x94\xfc\x7f\x4e\xa7"
+    b"\x50\x0c\x29\x0d\xe8\x06\x3c\xfe\x27\x4a\xeb\xfd\xfb\xc5\x23\x2d\x46\xeb\xb9\xf1\xe8\xcd\x2d\xaa\xa4\x1c\x77\x0f\xe7\xab\xb7\xf8"
+    b"\x04\x84\x4d\x11\xe2\xb1\xf8\xfd\x92\x2f\x8c\xc5\xe5\x61\x80\x94\xa2\x80\xa2\x30\x57\x41\xd9\x2c\x69\x94\x6b\x32\xa6\x8a\xa6\x71"
+    b"\x38\xa8\x28\xa1\x38\xe2\xd0\xf2\xe7\xf0\xe6\xe7\xd4\xde\x03\x08\xdd\x43\x8e\x0f\x0f\xd6\x61\x57\x10\xce\xb0\x81\x01\x6a\x8d\xe3"
+    b"\xc8\x17\x8b\xf5\xe5\xfb\x7a\x5f\x49\x45\xa4\x00\xa6\xac\x97\xfd\x17\xc0\x1f\x8c\x5e\x1f\xa4\x5c\x41\xfd\x10\xde\x4d\xc0\x0e\x10"
+    b"\xcc\xce\xd6\xd4\x2a\x55\x45\xeb\x22\xba\xd6\x6c\xc4\xfb\x29\x7d\x89\xa7\x3c\xce\x32\xfc\xdb\x36\x49\x41\x87\xab\xfe\x64\xeb\xca"
+    b"\x0a\xf3\x41\xef\x33\x44\x41\x4a\xe1\xf9\x17\x1c\xc6\x96\x5a\x5c\xc5\xa3\x45\x8a\x81\x60\x27\x9f\x0c\xb7\xa4\x54\x7b\x6c\xa2\x0f"
+    b"\x1d\x4e\xb3\x52\x4a\x2e\x69\x35\xf8\xb8\x84\x1e\x62\x53\x19\x76\x9a\x77\x82\x98\x27\xb5\x36\x54\x5f\x35\xdd\x86\x8d\xe5\x34\xdf"
+    b"\xbb\x31\xe7\xea\x76\xc0\x48\xfc\xb5\xb8\x00\xfe\x9e\xf4\x0a\x63\x57\xa2\x89\x85\x0a\xe2\x1a\x1c\xd4\x0b\xda\xe5\xbf\x21\x03\xcd"
+    b"\x29\xb6\xa8\x2a\x60\x88\x45\x30\xf9\x65\x55\x1a\x31\x9d\xba\x81\xb4\xbe\xe4\xf1\x94\x1a\x7f\xc4\xbf\x25\x2e\xa7\xb1\x1c\xec\x97"
+    b"\x6a\x92\x41\x2e\x9e\x89\x3f\x18\x15\x13\x7c\xe9\x14\x53\x69\x43\x19\x3f\xb0\x3c\x18\xd7\x49\xa6\xb1\xdf\xe3\x3f\x58\xb6\x4b\xbd"
+    b"\xa9\x2d\xf4\x22\xbf\xb0\x26\x5c\xbb\x98\x64\x12\x61\x38\x01\x9c\x78\xd5\xaf\x45\x2b\xf9\x2c\x13\xaa\x04\xc8\xde\x6c\x21\x6e\x70"
+    b"\xce\x4e\x93\x88\xc5\x5a\xf4\x15\x5f\x86\xfc\x98\x74\x2e\xf1\x67\x43\xb4\xf9\x05\x5a\x24\xac\x09\x04\x2e\x97\xd0\xc9\x91\x59\xea"
+    b"\x43\x58\xdc\x18\xab\x56\x1a\x52\x5b\xad\x7a\x26\x39\xd1\x1b\x7f\x9a\x23\x98\x6b\xf4\xe2\xb7\xa3\x5e\x15\xcf\xc7\x2c\x98\x6f\xf3"
+    b"\xdd\xfa\xaa\xad\xa7\x56\xf6\xf7\x7e\xa6\xf7\x2c\x29\x99\xf2\x29\xde\x7a\xec\x17\xa1\x9d\x33\xa4\x36\x53\x47\x13\x63\xac\x29\xc4"
+    b"\xe0\xe0\x4c\x10\x90\xf5\x06\xdd\x37\xdb\x10\x93\x63\x90\xe8\xa9\x45\x47\x3e\x3f\x7b\xeb\x45\x75\x11\x8f\x88\x30\xa2\x62\x9b\x73"
+    b"\x15\xfe\x80\x34\x76\xf1\xeb\x58\x34\xa8\x5f\xec\xb4\xd9\xd5\xba\x04\xf7\x9e\x15\x21\x84\xa7\xaf\x63\xaa\x76\x75\x3e\x87\x84\xef"
+    b"\xc2\xb1\xaf\xee\xd8\x00\x92\xba\xc2\xc9\x99\x73\x88\xe3\x37\x26\xdf\x74\xf3\x88\x45\x48\xd0\x06\x48\xd0\x25\x57\x36\x7d\x68\x6f"
+    b"\x82\x29\xa1\x00\xc0\x49\x98\x91\x0f\x01\xdb\x3b\x8f\x70\xeb\x17\xfb\xff\x02\xc2\x17\x7f\x34\x48\xc7\x41\x7c\x66\x89\xb1\xd8\xda"
+    b"\xa5\x79\xec\xbf\xe9\x86\x63\xf1\x8d\x08\xfc\xca\xd6\xbd\xa9\x87\x36\x32\x92\x3a\x60\x50\x11\x4d\x6c\xff\xb7\x53\xfa\x7f\x8d\x9f"
+    b"\xfc\x8d\xb2\xe1\x70\x5e\x32\x78\xf6\x23\x66\x52\xc5\x7f\x0c\x30\xa6\xfa\xb8\x3c\x57\xc0\x58\xf6\xea\xe6\x60\x45\xc0\xbe\x88\xc3"
+    b"\x6a\x7a\xfa\xc0\x3a\x42\xa0\x16\x41\xee\x91\x96\xd8\x69\x3e\xed\x78\x79\x7a\xf1\x67\x5a\x0e\x70\x6c\x95\x75\xbc\x79\x77\x59\xcc"
+    b"\xaf\xa1\xd3\xa2\x2c\x9b\x48\xf0\xc7\xcf\xc6\xb4\x32\xc4\xd4\x27\x77\xd8\x11\xa6\x21\xfc\xd4\x06\x85\xcf\x53\x65\x7b\x44\x34\xe9"
+    b"\x6f\xb6\xed\x4f\xba\xbe\xca\x34\xe2\x55\x0e\xc8\xd0\x8a\xc8\x07\x94\x5c\x85\xbe\x32\xe4\xca\x7f\xb3\x10\xf7\x8e\xed\x7c\xc6\x25"
+    b"\xe9\x04\x77\x8a\x57\xf4\xad\x82\x67\x9f\x47\x64\x28\x10\xcb\xa4\x56\xe6\xd8\xe8\xb4\x02\x37\x66\xa0\xb6\x46\xb7\xdb\x91\x94\xce"
+    b"\x84\x97\x74\x4d\xd3\xc3\x79\x90\x28\x30\x3b\xf3\x42\x02\x2a\x75\xef\x62\x42\x5f\x41\xd9\x95\xcc\xcf\x67\xc8\xe8\xa1\xec\x3f\x1a"
+    b"\xfe\xf8\x25\x49\x5a\x18\x99\x46\x10\x26\xbd\x3e\x92\x5e\xfb\x3d\xec\x3d\x88\xf6\xf8\x6b\x46\xef\xa4\x36\xf7\x65\xa0\xb8\xea\xd2"
+    b"\x86\xa9\xe7\x5b\x0b\x2c\x9b\xcf\x3b\x8b\xd1\xfe\x91\x25\x2d\x78\x85\x1d\x79\x15\x22\xa8\x59\x8c\xd4\xa7\xdf\xe1\xe3\x38\x5f\x6b"
+    b"\x50\x99\x52\xda\x4c\x7a\x07\x81\x7e\x62\x2f\x07\xa0\x81\x3c\x5e\x74\x39\x40\x5f\x4f\x3e\x6d\x11\x76\xa9\xfe\xca\xd7\x7a\x7b\xca"
+    b"\x4d\x74\xd0\x3b\x03\x4e\x89\x15\x31\x60\xed\xaf\xbc\x0f\x8c\xfd\xc4\x4b\xe6\x4e\x3a\x27\xe3\x0f\x23\xec\xf5\xce\xde\x7f\x8d\xfd"
+    b"\x01\x31\xea\x36\x56\x6f\xd4\x5b\x20\x4b\xd0\xfb\xae\xd0\x25\xbd\x4f\xa5\xb2\x47\x82\x1e\x15\x8a\x17\xd2\xf2\x39\xcf\x5e\xe7\xd3"
+    b"\x16\x98\x5a\x4e\x60\xb8\x7b\x73\xb1\x5b\xf2\x17\xa8\x51\x5b\xf8\x2e\x73\xe9\xdc\xba\x1e\xb3\x12\x0a\xf4\x2b\x9b\x12\x9c\x53\xd8"
+    b"\x32\x77\x1d\x05\xf7\xd4\x8c\xdb\x24\x36\xde\x8b\x29\xc4\xc7\x5e\x32\x3b\x50\x96\x1e\x5c\x46\xbe\x53\xe1\xdc\xce\x18\xe4\xd8\x7c"
+    b"\x0a\x59\x24\xcb\x8c\xf8\xaa\x84\xbc\x5c\xf8\xa2\x5d\x80\x4d\xd0\xd7\x31\xee\xf2\xc8\xb0\xea\xa7\xce\x3a\xc5\x06\x64\x69\x4e\xa9"
+    b"\x2d\x67\x6d\xfc\x48\x58\x4d\x4b\x17\xa1\x04\x3b\xd8\x36\xe7\x5c\xa2\xe5\xed\x93\x58\xf0\xa8\x1e\x75\x49\x57\xc5\xb1\xfb\x7f\x95"
+    b"\xb4\x3c\xa4\x4c\xb4\x61\xe8\x48\xb3\x90\x0d\xdf\x49\x65\xad\xc8\x40\x4c\xac\xd4\x03\x0d\x29\xab\xaa\x4d\x1c\xfa\x6b\xc1\xb4\x4a"
+    b"\xb6\xc5\x9d\x61\x64\x10\xf4\xc8\xaa\x2e\x26\x66\x74\x93\xa9\xff\x5c\x46\x7f\xe3\x24\x54\x40\x42\x87\x67\xa3\x68\xa0\x41\xd1\x38"
+    b"\x6d\x63\xed\xe8\xce\x94\xdc\xac\xce\x16\xc7\x75\x24\x2b\x00\x5f\x6f\x23\x32\x45\x85\xdf\x28\x91\xf7\xbb\xf9\x81\x9b\x1d\xed\x69"
+    b"\x7d\xc5\x74\x7b\x17\x4c\x62\x87\x7c\x7e\xdb\xb4\xae\xf1\xc2\x54\x8c\xa4\xcc\x4b\x2c\xb9\x82\x2f\xa4\x70\x7d\x09\x42\x93\x15\xba"
+    b"\x79\xc8\x4d\xae\x30\xb7\xd3\x0a\x0d\xf1\xa6\x6a\x51\x4b\xf9\x6a\xfd\xdc\xb7\x3a\xe4\x1f\x17\xf9\x13\x76\x3a\x01\xe8\x23\xeb\xd1"
+    b"\x6d\x21\x5a\x76\x3a\x4c\x53\xc7\x09\x07\xc5\xc9\x0f\xe9\xed\x49\x76\xaf\x36\x07\x38\x35\x3e\x0e\xa1\x57\x11\x14\xa3\x74\x40\x03"
+    b"\x68\x9f\x5b\x5a\xed\xce\x9a\xc8\x63\xf5\x79\xc1\xfd\xa8\x47\x7b\x66\xe7\xfa\xf7\xd5\x74\x7a\xe3\xa2\x1b\xf1\x25\x4b\x21\x3d\x09"
+    b"\xc0\xc6\x0b\xc3\xa5\x5b\x6d\xea\x54\x63\x6d\xa6\x63\x97\xbd\x11\x7b\xbf\xd0\xb5\x68\x14\x4d\x7b\x75\x2b\x26\x47\x1a\x63\xb8\xde"
+    b"\x8e\x35\x8a\xcb\xd1\xc9\x23\x39\x3b\xd6\x38\x22\x53\xe5\x15\x7f\x7c\xd8\x4e\xb3\xdc\x74\xd1\xaa\xc0\xa0\xf6\xba\xc7\x24\x4b\xbc"
+    b"\xd4\x3e\x28\xc3\x4c\x7d\x3f\xac\x8c\xc0\x6f\x6f\x7f\x2f\xcd\xc8\x90\xe4\xf6\x0f\x4b\x08\xac\x79\x25\x5f\x53\x59\x2b\x0c\x77\xf1"
+    b"\x9d\x51\x2c\x71\xf0\x4c\x30\x02\x59\x7a\xe7\x8a\x81\x05\x83\x63\xea\xc0\xd8\xed\x92\x93\x17\x7c\xaf\x15\x31\x4f\x02\xa9\xa1\x3c"
+    b"\x4a\x4c\x0b\x55\x6c\x01\x68\x1d\xa9\x4e\xc9\xbb\xf9\x0d\x2b\x3d\x11\x37\xdc\x12\x0f\x05\x91\xf2\x77\xd1\x47\xfb\x0a\xe9\x25\xac"
+    b"\x4f\x3e\x75\xf1\x59\x41\xe9\x6e\xfa\xbc\xfd\x84\x72\xaf\x01\xd8\x4f\x4b\x48\x20\x84\xe1\xfa\x22\xc3\xe2\xce\x6c\x06\x83\xa7\x31"
+    b"\x67\xc8\xeb\xee\xed\xfa\xde\x04\x6f\x25\x53\xf2\xaa\x90\x57\xf7\xec\xf7\xfd\x2a\x01\x45\x82\xd5\xb0\x12\xa6\x32\xc7\x9c\xb6\x79"
+    b"\x63\xf0\x3b\x2c\x1d\x83\x57\x9e\x0c\x55\x70\x49\xb4\xb6\x48\xb0\x84\xef\xe0\x63\x6a\xfd\xf6\x5b\x57\x50\xf4\x10\x15\x0a\x0f\xff"
+    b"\x57\xfd\x26\x9c\x6f\x16\xcc\x9c\xd6\x4b\x46\x3b\xef\x61\x2f\xef\xb8\x0c\xa7\xca\x8f\xae\xd2\x59\x33\x64\xca\xd8\x5b\x2c\xbf\xcd"
+    b"\x3a\x0e\x67\x8e\xdc\xf8\x85\xe2\xe9\x88\x34\x49\xec\x30\xed\xc7\xb5\x13\xce\xb5\xdd\x9f\x08\xad\xee\x0b\xfe\xe2\xcf\x03\x92\x5c"
+    b"\x8a\x4c\x24\xcf\xcc\xbf\x75\xb8\xe8\x91\x1e\x3a\xa3\x92\x86\x3e\xd9\xeb\x08\x7b\xe8\x98\x3d\x6e\x70\x5f\x86\x98\xe2\xd3\x87\xc5"
+    b"\xa4\x86\xc7\xbe\xa1\xb6\x33\x9f\x0b\x26\x12\x94\xe5\x61\x95\x6a\xbb\xed\x66\x74\x8e\x39\xaf\x30\xac\x56\xc7\xa3\xff\xff\xd2\xae"
+    b"\x74\x87\xfd\xdd\x52\x93\xc4\x9f\x8f\xcc\xd2\x03\xbc\x26\x4f\x47\x64\x8f\xb3\xab\xb5\x50\xd5\x32\x72\x1b\x0e\x91\xa1\xf3\x7d\x33"
+    b"\x8a\x46\xb4\xd4\x28\x1f\x23\xdf\x29\x1e\xe3\x9e\x75\xcf\xb6\xfe\x91\x8d\xce\x1d\x86\x8d\x28\x75\x59\x7a\x7e\x9f\x3f\x47\x17\x52"
+    b"\x79\xe5\x5d\xaa\x4f\x40\xa4\xd6\x59\x8a\xc3\x25\x8a\x44\x5e\xb4\xf7\x45\x5c\x93\x4f\xfe\x86\x87\xfd\xae\x9a\xa1\x9f\xdd\x0d\x19"
+    b"\xcf\x73\xef\x9c\xb1\x8b\xc3\xfe\xf2\x04\xb2\xd1\xd7\x69\x2b\x5a\xbf\x90\x17\x3b\xe5\xde\x61\xb4\xe2\x23\x96\x0e\x22\x40\x5d\x33"
+    b"\x0d\x19\xff\x2d\xdc\x22\x72\xc8\x58\xc5\x92\x23\xc2\x24\x13\x20\x5b\xfa\x86\xde\xe7\x55\x66\x7a\xff\xc7\x88\x73\x27\xee\x72\x6b"
+    b"\x52\x53\x4a\x6e\x7f\x10\x1a\xb3\x67\xb2\xbe\x96\x65\x95\x31\x04\x79\x79\x30\x92\xcd\x34\x98\xe6\x65\x42\x44\x4e\x5c\x2f\x0c\xed"
+    b"\x6b\xac\x4d\x23\x73\x32\x8e\x03\x87\x5a\x69\x50\xc5\x74\xfa\x49\x6e\xf7\xf5\xf4\xc3\x04\xb6\xe7\x1e\x09\xc1\x3a\x26\xb2\xd2\x0b"
+    b"\x7f\x9d\x0c\x25\xce\x51\xc1\x6a\xad\xea\xa8\x2a\x70\x25\x1a\x11\xfe\xca\xac\x97\x21\x4d\xab\x57\x06\xa8\x02\xc8\x49\x1e\xf0\x66"
+    b"\xc2\x83\x2b\x5a\x27\xaf\x13\xd1\xac\x76\x51\x40\x59\x8a\xea\x61\xf6\x1f\xe3\x5a\x77\xe8\xfb\xf2\x4c\xb5\xe0\xa3\x4e\x80\xb0\x15"
+    b"\x06\x20\x03\x26\xbc\x0c\x68\x5f\x9d\xf8\xcc\x52\x65\xb2\xd3\x02\x58\x39\x46\xe5\x8e\xc4\x46\x25\x94\x29\xc9\xf5\xbd\x7a\x93\x80"
+    b"\xaf\x5f\x54\xb6\x35\x03\xa3\x74\x60\xe5\xcc\xff\x31\x05\x94\x21\x97\x5a\xa4\x96\x88\xd7\x3a\x13\x43\xe8\x7f\x83\xb3\x37\x87\x22"
+    b"\x36\x17\x91\xbc\x91\x36\x52\x12\x86\xd2\x4d\xaf\xba\x91\x6b\x56\xb4\xaf\x7b\xb6\xb3\x08\x63\x7c\x3c\x74\x49\x6c\x1b\xa5\x8f\x59"
+    b"\x74\xb1\xa4\xd9\x90\x01\x35\xf0\x11\x1d\xab\x31\x14\xa5\x87\x38\xf3\xdf\xfd\x0d\x35\x67\x85\x9e\xd3\x9e\x28\x7a\xe5\xd5\x1f\x65"
+    b"\xab\x3d\x6e\x07\x3f\x63\xb7\x5d\x39\xae\x05\x4a\x36\x43\x08\x35\x00\xaf\x22\x57\xf2\x68\xb4\x34\x19\x3a\x54\xe8\x6a\x08\x82\x75"
+    b"\x88\xcc\x1d\x7a\x2f\x42\x5c\xf3\xf7\xd0\x8e\x8b\xe3\x25\xed\xd9\x24\x25\xae\xcb\xd2\x2e\x86\x1b\x7a\x49\x24\x51\x97\xa2\xc7\x7c"
+    b"\x91\x2e\x58\x80\x1e\xce\xa1\x82\x3b\x91\x39\x05\x2d\x09\xfb\x29\x22\xbc\x5f\xc3\xea\xb8\xa8\x0a\xec\xe9\x2f\x98\x7f\xaf\xf1\xb7"
+    b"\x9a\xa5\xdd\x6f\xaf\xd9\xa5\xc4\x61\xa1\x86\x9d\xe0\xe8\x3a\x0e\x1f\xff\x89\xfd\x7f\xdc\x52\xdc\x7a\x7f\xa3\x68\xed\xdb\x57\xc9"
+    b"\xdb\x35\xb1\x3d\xbf\xcd\xf7\xca\xcd\x23\xb3\x45\xc0\x1d\xec\x06\x75\xeb\x77\x67\x45\x29\x75\x9a\x31\xd7\x62\x15\xb1\x24\x5a\xd9"
+    b"\x53\xf4\x49\xad\x97\xdd\x5b\x2b\x0f\x01\x5b\xf6\x75\xb5\x50\x4f\xdc\x9c\xc6\x13\x97\x28\x48\x7e\xae\x21\xe1\x20\x7f\x91\x13\x9f"
+    b"\x08\xa1\x38\x05\x87\x4a\x60\xb8\xd0\x03\xe7\x63\x80\x30\x00\x90\x14\x72\x14\xf1\x46\x4b\x28\x3f\x02\x32\x8c\x6c\xbb\x4c\xa8\xf5"
+    b"\x97\x4e\xdc\x48\x9a\xff\xcf\x4f\x9a\x84\x43\x94\xb7\x44\x78\xf8\xec\xea\x15\xff\xbc\x78\x7d\xa5\x0c\x80\x38\xd3\xd6\x5b\x48\xfa"
+    b"\x7f\x8e\xfd\x8b\xd0\xe0\x70\xc7\x36\xe5\x93\xa1\xe8\xa5\x0d\x67\xa4\x7b\x18\x10\xa8\x17\x88\xcf\xb4\x98\x8b\x36\x20\x8e\x3a\x72"
+    b"\xc3\x0b\xe9\x29\x15\x4e\xd6\xc5\x47\xc1\xef\xc2\xc5\x98\xa6\xa4\x42\xa1\x91\x66\xcb\xc7\x37\x2a\x15\x6a\xef\x15\x09\xe5\x2c\x17"
+    b"\xbd\x49\xd5\xe3\x0c\x81\x3b\x02\x6a\x52\x1e\x2a\x14\x03\x86\x7e\xce\x50\x16\xcc\x31\x22\x31\xa5\x53\x11\xee\x86\x1b\xfe\x27\x55"
+    b"\x35\xc2\x78\xd6\x82\xfd\x8b\x00\x0c\x56\xf9\x5b\xb5\xba\xbc\xd3\xec\xf7\x3a\xd4\xb8\x73\xad\x6a\xe9\x07\x1b\x3e\x50\xe5\x1c\x8d"
+    b"\x09\x70\x2a\x60\x0a\x58\xb7\xea\xf9\x84\x82\x70\xa7\x94\xfb\x7b\x3b\x26\xed\x11\x64\xe3\x80\x16\x73\xc7\x54\xea\x41\xc9\x58\xc8"
+    b"\x10\xb4\x14\xeb\x25\x13\x82\x7f\xa3\x6f\x91\x30\xbe\x3f\x72\x81\x25\xe4\x78\xcd\x98\x7d\x6c\x14\xb4\xd8\xf7\x4a\x6b\x3c\xb6\x91"
+    b"\xc8\x91\x92\x5b\x34\x69\x5e\xc1\x64\xfd\x16\xdd\xa3\x09\x0d\x58\x73\xa7\xf7\xcc\xcd\x66\xf9\x58\x6c\xc5\xaf\xd8\x19\x39\x09\x87"
+    b"\x25\xd6\x3f\xdb\x8b\x1a\xc6\x28\x41\xc6\x57\x39\x14\x73\x61\x62\x07\x98\xcb\x52\xb8\x89\x79\xc4\xd7\xfa\x89\x46\xe5\x93\xc6\xb0"
+    b"\x2c\x23\xaf\x63\xdc\xd0\xb4\xec\xf4\x10\xef\x14\x27\x4c\xf1\xb2\xbc\x28\x59\xf3\xea\xc2\xae\xcc\x93\x5a\xd7\xed\x72\xe7\xab\x4c"
+    b"\xec\x21\x5c\x70\x3c\x11\xb5\x9f\x77\x55\x49\x91\x0b\x26\x8b\x47\xca\x41\x15\x6e\x46\x46\x14\x23\x56\x97\x19\x31\xca\x6b\xf2\x6f"
+    b"\x94\x40\xc8\x27\x1f\xe6\x64\x83\x9d\x11\xda\xbf\xd3\x39\x05\xa1\x69\xd8\x74\x1f\x26\xfc\x5a\xd2\x4f\x2a\x49\xd9\x33\xcb\xb1\xe8"
+    b"\x38\x58\x79\xcb\x73\x67\x21\xea\x16\x67\x92\xef\x2f\x90\xda\xbb\xec\x88\x6b\x7c\x5a\x9e\x3f\x4f\x6c\x3b\xcc\x7e\x64\x7e\x59\x98"
+    b"\x7c\xb6\xc9\xfa\x67\x16\x55\x96\xb2\x65\x87\x69\x66\x57\x23\xd4\x0f\xf6\xde\x27\x38\x82\x4e\x55\xf5\xb9\xc6\xad\x9e\x83\xd9\x8f"
+    b"\xab\x7c\xa4\xd2\x41\xbb\xaa\xeb\xd5\xa3\x25\x1c\x87\x12\x97\xc1\x0a\xe8\x0f\x9e\x25\xd1\x61\x80\x80\x75\x38\xe3\x73\xed\x93\x74"
+    b"\x94\x0e\x47\x96\xb0\x83\xa6\x01\x7a\x50\x5c\x21\x9e\x43\x82\x64\x00\x4f\xeb\x52\xb3\x1b\x21\x17\x7f\xfb\x4d\xd2\xe6\x55\x2e\x64"
+    b"\x8f\x1d\x96\x7d\xd7\xb7\x48\xe7\x97\x2b\xc0\xea\xb8\x16\x49\xb4\xc9\xba\x10\xa7\x1c\x75\xb9\x39\xcf\x9f\xda\x01\x9b\xfb\xa4\xcc"
+    b"\x54\x19\xc6\x2c\xfa\x89\x24\xab\xc6\xa1\xe4\xfb\x2f\x86\xe2\xf9\xe4\x0c\xb3\x60\x33\xa9\x41\xb3\x52\x64\x8b\x0b\x18\xc0\xd5\xc0"
+    b"\xc5\x32\xdc\xfd\x99\x30\x24\x9a\xc1\x40\x48\x27\xe1\x6a\xd4\x9a\x3d\x3a\x29\xa1\xb2\xd5\xbb\x24\xf1\xb7\x17\x58\x61\x74\x51\x09"
+    b"\x6d\x25\x25\xef\xb9\x73\x6b\x3e\xf7\x77\xba\xdf\x39\xbb\x68\x92\x2f\x28\xfb\xd3\xed\x04\x14\x48\x32\x6d\xcd\x3d\xa7\x3a\x72\x00"
+    b"\xaa\x3a\xbb\x2d\xed\xa5\x83\x06\xa3\x8e\x8a\x71\x77\x54\xa5\x10\x02\xda\xe7\x5b\x1b\xe2\x9d\x98\x83\x07\xa6\xe2\x03\x62\x56\xa8"
+    b"\xee\xe7\xe6\x0f\x7b\x57\x0d\x2e\x59\x56\xfb\x60\x27\x86\xcc\x79\xaa\xa7\x29\x44\x1f\xfe\x87\x25\xdf\x1e\xbc\x69\xcc\xda\xb9\x85"
+    b"\xeb\x03\xf3\x17\xba\x2b\x07\x7e\x2f\xe8\x87\x32\x12\xa7\x9f\x33\x6b\xc5\xed\x5c\xfa\x51\x6e\xde\x67\x2e\x3c\x86\x90\x16\xcb\x33"
+    b"\x93\x56\xc5\x87\x3c\x5e\xd7\x5c\xee\xb3\x25\x83\xe0\xc9\x9b\xfc\xe9\x2d\xaa\x4b\xc0\x60\x92\xac\x25\xa6\x99\xc0\xbf\x0d\xaf\x77"
+    b"\x01\x5f\x9e\x06\xe2\x70\xe2\xaf\x68\x63\xd2\x86\x72\x2c\x0c\xa0\x73\x5f\x83\x71\x69\x5b\x09\x8f\x5a\xf5\x0f\xea\x74\xb3\xe1\x5d"
+    b"\xb8\xc7\xba\x91\xdc\x1b\xe5\x41\xda\x93\xaa\xfc\xa5\xf8\xd5\xc7\xdc\x5c\xb0\x8d\x6a\x0e\xc8\x59\x49\xb2\x4a\xab\x9a\x89\x10\x9b"
+    b"\xcd\x36\x79\xb9\xb8\x73\xd2\x24\xdf\xc5\x14\xea\xb1\xd2\xd5\xd7\xcb\x3d\x09\x04\xc7\xef\x44\x34\xd3\x87\xa7\x8d\x92\xfa\xd4\x55"
+    b"\xc2\x2d\xf4\x0c\xd6\x18\x76\x51\x6b\x9b\xf9\x26\x0f\xf5\xda\x4c\x95\x18\x0f\x5f\x0f\xe9\x2d\xe3\xfc\xaf\x6f\xd1\x40\x11\x39\x83"
+    b"\x6d\x0c\x66\x64\xf7\x8e\xc2\x5e\x97\x85\x7d\x3f\x3c\x3f\x79\xf4\xf7\x09\x91\x26\x45\x64\x3d\xc2\xc5\xe4\x91\x0b\x86\xe3\xaa\x55"
+    b"\x49\x91\x4a\x01\x3f\xab\x86\x6b\x0d\x10\x64\x14\x17\xf2\x35\x15\x7b\xa1\x05\xee\x6d\xa8\x91\xab\x7f\x77\x0b\xbe\x3a\x09\x6b\xd7"
+    b"\x55\x18\x6f\xa2\x98\x88\x15\x3a\x30\x9a\x60\x3c\x85\x65\x52\xd5\x2d\x2d\x67\xd8\x4b\x46\x58\xaa\xe6\xf8\xe3\x4d\x4e\x86\x45\x17"
+    b"\xcf\x86\xed\xd0\x12\x19\x38\x4e\xcf\xd7\x68\x89\x5a\xa6\x6c\x16\xa0\x85\x7e\x4c\x40\xce\x7f\xb8\x29\xff\x04\x55\x8b\x41\xc0\xd3"
+    b"\x84\x87\x88\x8d\x2f\x27\xe3\x5f\x11\x93\x72\x75\x6d\x02\x32\x63\xba\x43\xe5\x92\x4c\xef\x1b\xa3\x8c\xa6\xee\x88\x98\xbd\xa4\x68"
+    b"\x73\x87\x49\xbd\x0b\xfa\xa7\xa8\x9e\x67\x98\xed\xa6\x8a\xb5\xa8\xe0\x4e\x5c\x0e\x06\x88\x6c\x2f\xc6\x78\x0f\x55\xe6\x81\x72\x05"
+    b"\xb3\x8a\xa9\x7c\x7f\xb5\xf0\x1d\xa3\x04\xc4\x9f\x73\x7a\xb6\xfd\x90\xc5\x10\x19\x6e\xec\x35\x22\x51\x92\xb4\x7e\xdf\x5c\xcf\x5f"
+    b"\x88\x24\xd9\x76\x6d\xa6\xb9\xa6\x31\xfd\x04\xb5\xa9\xaa\xf5\xcc\xeb\xce\x08\xf6\x80\x2c\x21\xa6\x66\xbc\x77\x32\x92\xe5\x89\x3e"
+    b"\xb5\x34\xf0\x07\x7f\xb1\xa1\xd2\x54\x92\xb7\x64\x32\x03\xe5\xe8\x3f\xbf\x2d\x21\xc7\x67\xf0\x73\x11\x54\x1e\xbf\x53\xb6\x63\xc1"
+    b"\xcf\x8b\x8d\x6a\xd5\xaa\xad\xe5\x24\x80\x0c\x9e\x07\x7b\x5d\x9c\x0c\x7c\xbb\xf9\xca\x8e\x73\xe6\xb2\x2e\x0e\x65\xe8\x71\xdb\x27"
+    b"\x33\xe6\xbb\x11\x33\x63\x53\x75\x88\x4f\xd6\x74\x52\x65\x9b\x7b\xc3\x8d\x2e\x55\x34\xb3\x1a\xca\x67\x32\xc9\x8e\x59\xf6\xad\xf9"
+    b"\x23\x1a\x83\xd4\x5f\xd6\x76\x69\xd8\x33\x3b\x46\x3c\xf5\x9e\xcb\xc5\xb1\x01\x1e\x17\x6c\x8d\xbe\xd9\x9d\xc4\x0a\xdb\x79\xfb\x76"
+    b"\x99\xfb\x98\xb9\x0c\x97\x54\x07\xaa\xb1\x3b\x18\x8a\x41\x1a\xb3\xc0\x3b\x66\xd3\xd0\x06\x0e\xc4\x84\x8b\xb8\xf5\x39\x4d\xec\x42"
+    b"\xa4\xba\x7d\x3f\x12\x54\x83\x0c\xf2\xe2\xa8\x28\x65\x94\xfb\xcc\xb8\xd9\x42\x12\xd6\x0d\x9a\x8a\xeb\xa4\x75\xc4\x34\x1c\xea\x91"
+    b"\x4a\x90\x18\x4b\xcd\x0a\x5c\xfb\xa1\xcb\x46\x0b\x2c\x0e\x60\x9d\xbc\x12\xf6\xfb\xdd\x0e\xee\x98\xb7\x4d\x30\x3a\xf3\x82\x62\x6e"
+    b"\x6c\x63\x5b\x6d\xf4\xf4\xc5\x2c\x75\xf2\x34\x12\xdf\xe8\x8f\x34\xc5\x38\xda\xfc\x6f\x55\xdf\x4e\x66\xab\x77\x5b\xd7\x5c\xff\x25"
+    b"\xd6\x81\x3b\xb2\x3f\x40\xb2\x4f\x0d\x24\x44\x60\x11\x93\x60\xa4\xb5\x07\xb9\xa1\x45\x9a\x5b\x0b\x60\xeb\x2f\x02\x6a\x1e\x1c\x67"
+    b"\x2c\x1d\x6b\xe8\xae\xdc\x73\x51\xa4\x63\xdf\x1c\xeb\x30\x3a\x0e\xa5\xe7\x58\x81\x8f\xf9\xf8\x9e\x04\xd5\x0c\x68\x96\xe4\x67\x34"
+    b"\x88\x82\xad\x30\xe1\x5b\xf7\xda\x29\xd9\x49\xa6\xa9\x63\x06\xcb\xa3\xe0\xb2\x40\xfa\xcc\x3a\x50\x94\x6c\x41\x65\x27\x26\x1a\x42"
+    b"\xcc\xc1\x0b\x2f\x76\xfb\x3b\xcd\x5a\xe8\x5b\xf6\x34\x16\x31\xbd\x98\x56\x2c\x60\x36\xf7\xa0\x95\x7e\x62\x99\x1f\x66\x28\x7b\x91"
+    b"\xf0\x2e\xcf\x7e\x60\xbb\x69\x63\xc5\x21\x25\xaf\x85\xc9\x9b\x98\xc1\x19\x8b\x9b\x87\x1e\xe7\xcc\x6d\x5c\xa5\x03\x38\x78\x4f\x26"
+    b"\xe8\x12\x4f\xd3\x52\x43\x49\x5a\x08\xc3\xcb\x6e\x6f\x7f\x20\x1c\x90\xc6\xf7\x4b\xf8\x76\x97\xd6\x1d\x1d\x26\xe3\x33\x61\x77\xde"
+    b"\xae\xe5\xce\xdc\xb3\x0b\x36\x1e\xb8\x1c\xf0\x70\x5e\xd4\x20\x3d\x94\x65\xe8\x48\xe6\x4a\x08\xf0\x51\x62\xb7\xc3\x41\x7a\x98\xa5"
+    b"\x16\x6c\x3c\x33\x28\x88\x66\xc9\xa6\xd7\x4d\x90\xa0\xe9\xd3\xd8\x9a\xe4\x68\x2d\x53\x2a\x2f\xba\x15\xf4\xae\x02\x88\xa0\x68\x6a"
+    b"\x0f\x8a\xf7\x19\xa9\xd2\x69\xe0\x51\x18\xea\x7b\xc0\x96\xc4\x43\x31\x77\xeb\x24\x82\xb8\xf3\x99\x66\x60\x91\x71\xe0\x5e\xad\xc8"
+    b"\x4d\xda\x2f\x79\x20\x44\x3a\xab\x9b\x9d\x73\x4a\x17\xe5\xa1\xae\xe1\x9b\xd0\x30\xec\xa6\x89\xb1\x34\xd0\x88\xd6\x82\x29\x56\x4f"
+    b"\x3c\xf1\x44\x80\x79\xe4\x35\x92\x13\x6a\xe3\x33\xcd\x81\x17\x20\x96\xa5\x7b\x95\xef\xef\x20\xac\xe0\xc2\x8d\x47\x77\x55\x15\x6c"
+    b"\xd6\x97\x1d\xd8\x13\x84\xf8\x3f\xc1\x2c\x92\xf5\x01\xf3\x0f\x77\x72\xc4\xfa\x3e\x79\x93\x7b\x9b\x3c\x80\xdf\x72\x2d\xbf\x09\x0d"
+    b"\x0c\xbd\x52\x1f\x66\xad\x33\x27\x2a\x65\x1a\x14\x80\x9e\x35\x04\x73\xcc\x1a\xec\x15\x01\xd9\xa4\x72\xb8\x91\x1e\x73\x2d\x16\xea"
+    b"\x83\xf6\xe9\xac\xe6\xb5\xc6\xc6\x39\xc6\x66\xf7\x6e\x97\x1e\x5a\x48\x8e\x96\x4f\x82\xa0\xdc\x18\x17\x69\x6c\x04\x47\xb6\x85\x4e"
+    b"\x5a\x5d\x63\x21\x10\xc4\x9f\x4b\xfc\x87\x86\x27\xaf\x17\x6e\x10\x88\x59\x70\xd7\x30\x47\x37\x26\x84\xd4\x7f\x80\x16\xdb\x3f\x2c"
+    b"\xb6\x0b\xa2\x55\x53\x76\x33\x18\x36\xfe\x12\xab\x78\x15\xba\xe2\xfe\x14\x83\x48\x70\x73\x8f\xe5\xbe\x4a\x44\x28\x39\x54\x6c\xc8"
+    b"\x5f\x81\xb8\xf6\x8d\x08\x09\x41\x96\x5a\x16\xed\x4d\x17\x6e\x95\x51\x9e\xe3\x59\x23\x46\xef\xe8\x63\x47\x0e\xd6\xfa\x8b\x66\xf3"
+    b"\x61\x29\xa3\x12\xa7\x1b\x21\xbe\xdc\xe1\x72\xa1\x33\x2a\x31\x66\x46\xa4\xf8\xca\xb8\x1b\x7e\x4b\x33\x27\xd3\x84\x86\xef\x7c\x4b"
+    b"\xfa\x57\xcf\x77\x8a\xe0\xb0\xdc\x4c\x8c\x5b\x36\x5d\x73\x16\xc4\xb1\xe8\x36\x94\x4c\x9d\xe9\xa2\x1d\x38\xa5\x8c\xd4\x38\x10\x83"
+    b"\x44\x3a\x7b\x90\xc8\x57\xde\x2a\x5e\x9b\x31\xa7\xbf\x5b\xed\xe1\x5d\x6c\x03\xba\x14\x46\x2c\x77\x5d\x01\xbd\xd6\x61\xfe\x3d\xa2"
+    b"\x2a\xb7\x59\x1d\x5d\x86\x62\x80\xce\xe2\x6a\x19\x8a\x7d\x90\x41\x3b\x55\xe7\xa2\x88\x76\x38\x93\xf5\xce\x7e\x2d\xa7\x8c\xe9\xf5"
+    b"\x83\xaf\xc6\xff\x62\x48\x85\xe0\xc9\x42\x89\x8d\xc7\xfe\x15\x3c\x38\x89\xb4\x69\x31\x5b\x3e\x5c\xa7\x93\xe9\xe8\x6d\x17\xb0\xc7"
+    b"\x46\x1c\xeb\x54\xc3\x22\xd6\xc6\x22\x42\x99\x9b\x86\x33\x0f\xbf\x5b\xd2\xa3\x7b\x05\x77\xec\xbf\x43\x05\xc8\x7f\x72\x4a\x96\x09"
+    b"\xcb\xe0\x8c\xec\x74\x8a\xd3\x9e\x0d\x8d\x3c\xc7\x00\x46\x63\x58\xd3\x69\xc9\xa4\xc7\x9c\x10\x52\x5f\x52\x03\x05\xb9\x92\x10\x51"
+    b"\xd1\x14\x01\x0f\x16\xed\x11\xe1\x39\x2e\xdb\x36\xc9\x8f\xbe\xb3\xc2\xde\x4e\x2a\xa9\xc8\x6e\xf8\xd1\xd7\x71\x50\xd9\x38\xa4\xee"
+    b"\xd2\x5c\xb9\xf5\xf8\xa9\x2a\xb4\x3e\xfd\x84\xe3\xfb\x67\xae\xc5\x7e\x48\x03\x4d\xae\x73\x5a\xa0\x52\x08\xa4\x56\xcc\x07\x37\xc4"
+    b"\xd0\x0a\x16\xd1\x49\x81\x16\x00\x56\x79\xf2\xd9\x26\xf4\x30\xca\x06\x5c\x03\x52\x28\xa8\x56\xea\xb1\xf6\x66\x0b\x67\xf3\x68\x8a"
+    b"\xe4\x63\xec\xd4\xd3\x80\x87\x63\x45\x6d\x61\x7a\x4b\x34\xde\x2b\xf9\x76\xe4\xc8\xbe\x4b\x8c\x0b\xbf\x63\x4c\x5c\x4b\xc1\x6d\x78"
+    b"\xf6\x4e\xc1\x2d\xec\x9f\xa2\x9f\x21\x5c\xc4\x9f\x7b\x3b\xd1\x33\xbc\x03\xba\x29\xa4\x2a\x4a\xe8\x43\xd8\xc3\xe5\xe7\x4b\x9e\x7f"
+    b"\x72\xfd\xe3\x44\xa4\x6c\x3d\xd3\x93\x6d\x2c\x59\x43\x80\x54\x43\x06\x80\xa3\xc5\xdb\x52\x7a\xdc\xa7\x34\x9b\x99\xb3\xa3\x5c\x1e"
+    b"\xbb\x3d\xd6\x65\x42\x82\xfb\xc3\xd5\x15\xcb\x27\x39\x25\x91\x70\xb1\x29\x9c\xaf\x56\xdd\xa1\xb3\xc0\x00\x5a\xc3\x17\xde\x7c\x3a"
+    b"\x5d\xdc\xba\x6c\xc4\x5f\x2d\xee\x6e\x28\xee\xe0\x28\x5c\x03\xa0\x11\xe3\x47\x95\xf2\x0d\x7f\x10\x25\x85\xfe\xcb\x93\x8f\x17\x99"
+    b"\x39\xf6\xc2\x03\x48\x9c\xe4\x68\xc6\xea\x0c\x07\x96\xf1\x6d\xa6\x0e\xd1\xb5\xcb\x41\x89\x33\xff\x5d\x75\x50\x54\xf0\xdc\x9d\xec"
+    b"\xff\x95\x3d\x96\xa1\xfe\x0d\x53\x44\x78\x69\x8b\x53\x97\xac\x53\xd5\x0a\x21\x0c\xfd\x50\x86\x1d\xd1\x46\x14\x47\x6f\xb7\x4c\x7b"
+    b"\x19\xe9\x1b\x76\xd4\xa9\xa6\xeb\x6c\x8c\x1b\xe5\x9f\xd5\xa1\x0a\xca\x09\xba\x45\x63\x72\xf5\x85\xab\x44\x76\xf2\x80\xb0\xc3\xf3"
+    b"\x43\xdd\x5f\xf7\xdc\x2c\x2e\xec\xf0\xc9\x27\xfe\xb8\x0e\xc3\xc0\x25\xce\x40\x38\x6f\x4e\x8c\x3e\x10\x1a\xb9\xbe\xf5\xd6\x0d\x4c"
+    b"\x8f\x97\x80\xdb\xd1\xe5\xe8\x66\xd7\xde\xb1\x0c\x9d\x79\x93\xd8\x87\xf8\x6b\xba\x58\x4c\x34\x72\x93\x46\x5c\x7f\xdf\x63\x59\x61"
+    b"\x06\x00\x38\xac\x92\xd2\x3c\xd0\x5c\x8a\x4f\x85\x77\x76\x8c\x92\x03\xf1\x3f\x1a\xaf\xe2\x85\x20\xff\xcd\x35\x02\x49\x11\xa7\xe9"
+    b"\x79\xf3\x15\xf5\x9b\x88\x12\x66\x22\xed\x7b\xe1\x23\xaa\xd1\xb0\x3a\xbb\x02\x69\xee\x78\x0a\xd1\xef\x0c\x3a\x97\x14\xd8\x5e\x92"
+    b"\x2b\x99\x47\x64\x44\x71\xf8\x5f\x7a\x4c\x97\xc5\x91\xa3\xa4\xce\xa4\xf8\x98\xdd\x39\x66\xd2\xe4\x1b\xe2\x2e\x66\x5e\x47\xcb\x53"
+    b"\x8b\x24\xdf\xaf\x07\x54\x93\xcf\xe8\x0d\x4f\x63\xc7\xc8\x50\x6d\xcf\x26\x15\x60\x21\xbc\x46\x77\x38\x58\x53\x1d\x75\x32\xfc\xe1"
+    b"\xc6\xeb\xd1\x60\xf9\xb0\x3e\xd0\xe2\x5b\x2a\xe4\xe4\x56\x91\xdf\x07\x3c\xa1\x85\xa9\xc7\x44\xe0\x13\x9d\x72\x02\xc3\xde\xd4\x5d"
+    b"\xdc\x22\x4e\x56\x3d\x71\x45\x4d\x1f\xec\xdd\x24\xf6\x51\xfd\x3f\x7b\x99\xf9\xdf\x7a\xf0\xaa\x77\xf7\x18\xba\xc9\x19\x51\x28\xd5"
+    b"\xad\x7b\x58\xad\x89\xc9\x73\x76\x04\xdd\x14\x14\x49\x22\x67\xd0\x97\x01\x49\x76\x20\xee\x57\xea\xda\x4f\x88\xe1\xf3\x82\x71\x45"
+    b"\x10\x2f\xa4\x9e\xdf\x91\xfd\xf8\x67\x3d\x07\x07\x09\x73\x82\xdb\xa4\xe0\x1f\xc0\xfb\xfc\xac\xf8\x42\x38\xcf\xe8\x94\x27\x05\x9e"
+    b"\x59\x57\xad\x34\x7f\x98\x50\x03\xb9\x7a\x64\x85\x49\x0d\xc8\xfe\x6b\x42\x02\x86\x34\x5a\x54\x61\xf5\x35\x28\x77\x29\xc6\x97\x55"
+    b"\xdb\x37\xd1\x3a\xe6\xb0\x07\x3c\x63\xa2\xfa\x26\x13\x20\x86\xd6\x69\x76\x02\x4f\xc6\x0b\x54\x6a\x18\xc7\xeb\x33\x06\x63\x4e\x22"
+    b"\x36\x34\x66\xff\xc6\x25\xaa\x95\xf7\x4f\x3f\x78\xa7\x62\x2e\x4b\xea\x6c\x1d\xeb\x44\x24\xef\x81\xf1\x5c\x64\x4c\x68\x7f\xa7\x71"
+    b"\x54\x72\x06\x6c\xf7\x6b\x74\xb0\xb6\x07\x1c\x2b\x8b\x73\x24\x18\x9c\xc2\xa0\x7f\xb1\x4d\x70\x31\xbf\x9f\x1d\x46\xe0\xff\xf8\x02"
+    b"\x13\xdb\xf7\xa9\x0f\xd0\x14\x50\x2b\x42\x16\xbc\x17\x8d\x2f\xb1\xec\x8d\xca\xc3\x93\x7c\xc0\xed\xb8\x32\xae\xd1\x8a\xff\x05\x1d"
+    b"\x89\xa1\xf2\xaf\x0e\xae\xbf\x74\xbe\x2e\xc6\x8e\x60\x35\xf3\xef\x36\xb5\x9c\xb4\x37\x73\x20\x0e\x64\x3d\x00\x6f\x17\x1e\x2d\xe3"
+    b"\xdf\xc3\xfa\x27\xe7\xc0\xea\x90\xe7\x9d\x98\xe5\x4a\xf1\x75\xf7\xee\x6f\x12\xb1\x78\x16\xd0\x80\x50\x64\x7e\x7a\x3f\x4e\x37\x80"
+    b"\xb3\x85\xc5\x71\x86\x66\x89\xde\xd9\xea\x7d\xf0\x09\x18\xeb\x3c\xb3\x14\x1e\x4a\xce\xee\x3b\x27\x3c\xcd\x16\xab\x5e\x6e\xa2\x1d"
+    b"\xf3\xf9\xf6\x53\xf3\xf0\x66\x05\xcf\x58\xfc\x05\xad\x70\x0b\x3c\x1a\x80\x77\x29\x05\x8d\x1f\x45\xe8\x86\x02\x91\x60\x1c\x10\x58"
+    b"\xee\x4c\x8b\xf5\xb9\xff\x4d\x65\x64\xd5\xfe\x32\x6e\x9f\x99\x37\xe7\xfc\xc9\x0b\x36\x33\x3c\x50\xf5\x6f\xb1\x09\xf7\xec\xf7\x5d"
+    b"\x69\xcf\x1e\x9f\x92\x82\xf0\x95\x74\x10\x0c\xc5\xf7\x00\x4d\xbe\x7e\x5f\xdb\x1a\x14\xcd\xc7\x5f\x94\xb3\xef\x42\x30\x27\x90\x58"
+    b"\xb8\x0a\x13\xf7\x58\x34\x2d\x8e\x2d\x26\x99\x9f\x96\xf2\x00\xdc\x57\x27\x82\xd8\x53\x85\x47\x57\x09\x07\xb8\x8a\x2b\xc6\xf5\x69"
+    b"\xc4\x83\x19\x0e\xf1\x9f\xae\x87\x05\xc3\xcf\xa6\xfe\x8f\x46\x65\x32\xdc\x6e\xab\x28\x2c\x6d\xe3\x84\xe9\x03\x7f\x43\x98\xd6\x40"
+    b"\x40\xc4\xe9\xce\xfb\xcd\x3f\xa3\x12\x6c\x9a\x56\x4e\x24\x1f\x86\x81\x9e\x89\x93\xae\x04\xd7\x5f\xf4\xbe\x87\x52\x80\x5d\x40\xe0"
+    b"\x43\xd6\x01\xc7\x73\x27\x8c\x31\x91\x3d\xc1\x54\x37\x4a\xc7\x7e\x71\x28\x03\xe4\xe2\xc7\x9c\xa2\xe5\x23\xc8\x2f\x20\xad\x08\x4d"
+    b"\x62\x81\xbf\x04\xff\xda\x33\x20\x36\x68\x0d\x71\x7e\xf7\x45\x99\xb7\x42\xab\x3d\xf7\x81\xdb\x85\x34\x76\xb5\x88\x24\x15\x71\x2d"
+    b"\xd7\xe8\x48\x46\xa2\xca\xf5\x73\x15\xd0\x3d\xa4\x4e\x7d\x5a\x9e\x3b\xa1\x50\xe1\xc4\xb4\x99\xc2\x1d\xd4\xaa\xd2\xa7\x14\xd9\x5f"
+    b"\xf6\xc8\xbb\x61\x1d\xee\x90\x26\xd8\xd4\x6e\x5c\x04\x06\xfd\x58\x04\xaa\x35\x8a\x86\xea\x6b\xb8\xd7\x65\x56\x47\x90\x86\x45\x01"
+    b"\xee\x64\xb0\x5e\x4e\x37\x0d\x8d\x3b\xfa\x11\x2b\xc2\x28\x89\x9d\x64\x5d\xc0\xc8\xf9\xbd\xa8\xf6\x69\x4d\xa7\xfe\xcd\x0f\xa9\x9a"
+    b"\xb2\xe9\x01\x73\x74\xa5\xb7\xdc\xd4\x37\x1d\x09\xfa\x23\xea\x21\x81\x94\xd8\xff\x49\x83\xba\x6b\x51\x9d\xdb\x8b\xdd\xd1\x51\xf0"
+    b"\x83\x1e\x03\x69\xcf\x47\x43\x8a\xa9\xc8\xf4\x7a\xe9\x32\x34\xa7\x1d\xac\xc2\x1e\x73\x5a\x02\x5d\xf1\xd8\x07\x2e\x04\x98\x5d\xa5"
+    b"\xae\xa8\x2f\x98\x64\xbd\xf0\x2f\xbb\x22\x45\x1c\x3d\x79\x1d\x77\xad\x15\xdc\x23\xe8\x0d\x63\x47\x83\xa6\x91\xc6\x73\x9a\x97\x93"
+    b"\x17\xce\x39\xfc\xba\xff\x18\x96\xa2\x1c\xa0\xae\xaf\x22\x30\x03\xd1\xe8\xda\x05\x56\x70\x40\xf0\x51\x6b\x7d\xfd\x69\x5a\x14\xbe"
+    b"\x73\xd7\x32\xff\x07\x4c\x48\x4e\x3c\xa1\x4d\x25\x6d\x69\xf8\x7c\x40\x53\xae\x8e\x74\x7c\xe2\xc5\xde\xbd\x58\x32\xc6\xb0\x38\x5d"
+    b"\xf8\xbf\x22\x91\x3e\x26\xb2\x97\x6d\xf5\xc9\xb4\xc8\x85\x88\xa0\xc8\x5e\xed\xfa\x10\xbe\xe7\xf8\x1a\x03\x16\x2a\xfa\x0e\x3c\xd6"
+    b"\x53\x12\xa5\x32\x69\xfd\x97\x17\xe4\x01\x3d\xd8\x57\xb3\x07\x2d\x21\x6c\x73\x75\xa3\x91\x86\x53\xfc\x8e\xa1\x22\xe7\x3a\xa2\x92"
+    b"\x24\xcc\x34\x2d\x0b\x1b\x87\x90\x52\xe4\x0b\x35\x27\xf6\x4f\xbd\x90\x2a\x64\x65\x47\x54\x80\x16\x82\x26\xaa\xf6\xef\x64\xb4\x07"
+    b"\x35\x16\xb8\x95\x4c\x73\x5c\x5f\x68\x7e\x19\x64\x7b\xeb\x19\x84\x29\x8d\x8b\x84\xb9\x23\x37\x67\xa2\xfe\xab\x61\xca\x52\x24\x7d"
+    b"\xcd\x0c\x54\x40\xbd\x96\x75\x45\xa9\xaa\x6d\x7f\x95\xaf\xe6\x49\x87\x26\xb5\xf4\xcc\xbe\x51\xf0\x1c\x1d\x7d\x67\x0c\x01\xae\x19"
+    b"\x67\xe3\x92\x69\x5f\x9a\x87\x66\x48\xcf\xb8\x75\xdf\x03\x4d\x24\x29\xc6\x12\xd4\x63\xfc\x7b\x2f\x54\x7b\x3a\xfc\x00\xb2\x7b\x90"
+    b"\x16\x6f\xab\xb8\x8b\x85\x0d\xb7\xd4\x38\x48\x39\x30\xc4\x67\x80\x5e\x3c\x58\x5c\x71\x5c\xd4\x86\x62\x34\x92\xc1\x08\x76\x59\x55"
+    b"\xdc\xf3\xcb\x59\xd7\x8c\x48\x82\x52\xe1\x61\xcf\x50\x47\xa9\x52\x91\x74\xd2\x9f\xbc\x9f\x89\x11\x73\x12\xa8\xc2\x35\x47\xfd\x3b"
+    b"\x5a\xc4\xa6\x3f\xc7\xa0\x57\xc2\xc3\x8e\xd4\xfe\xe8\x18\x3e\x76\x29\x2f\xc6\x79\xbc\x11\xa9\x4f\xd3\x4f\xd1\xa3\x44\xbd\xba\x72"
+    b"\x4e\xf1\x41\x88\x57\x61\xe5\x47\xaa\x42\x16\x2e\xa0\xfe\xe2\x7a\x4c\x6e\x75\x77\x7b\x9b\x43\x70\x7a\xaf\x18\x53\x1f\xc1\xa3\x64"
+    b"\x66\x2e\x2c\xd0\xae\xe6\x59\x05\x14\xbe\x40\xb9\x0b\x60\xe4\x07\xe5\x66\x8c\xeb\xee\x34\x4a\x12\x74\x36\xc4\x1c\xcd\xc3\x6b\x6b"
+    b"\x67\x63\x81\xf6\x43\x4e\x7b\x35\xd4\x2d\xcb\xbf\x5d\x39\x83\x97\xf7\x96\x74\x7b\x1d\xdc\x57\xcf\x3d\x32\x07\x43\x9b\x5b\xe2\x5b"
+    b"\x9b\x81\x6b\xf5"
+)
+
+LDEC_RAM_CONTENT = (
+    b"\xb7\x0a\x00\x00\x3d\x03\x00\x00\x00\x60\x00\x00\x01\x24\x00\x00\x17\x80\x00\x00\x7f\x3c\x00\x00\x18\x9c\x00\x00\x2d\x9c\x00\x00"
+    b"\x1d\x80\x00\x00\x1e\x80\x00\x00\x1b\xbc\x00\x00\x06\x68\x00\x00\x20\x29\x00\x00\x0c\x81\x00\x00\x0d\x81\x00\x00\x0e\x81\x00\x00"
+    b"\x0f\x81\x00\x00\x01\xdc\x00\x00\x0f\x85\x00\x00\x10\x81\x00\x00\x11\x81\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x15\x85\x00\x00"
+    b"\x25\x85\x00\x00\x16\x85\x00\x00\x26\x85\x00\x00\x23\x85\x00\x00\x24\x85\x00\x00\x17\x81\x00\x00\x22\x81\x00\x00\x05\x68\x00\x00"
+    b"\x20\x29\x00\x00\x31\x85\x00\x00\x32\x85\x00\x00\x33\x85\x00\x00\x34\x85\x00\x00\x35\x85\x00\x00\x29\x81\x00\x00\x2e\xdc\x00\x00"
+    b"\x21\x7c\x00\x00\x94\x3f\x00\x00\x80\xff\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x03\xad\x00\x00\x00\x8d\x00\x00\x04\xad\x00\x00"
+    b"\x01\x8d\x00\x00\x1a\xad\x00\x00\x18\x8d\x00\x00\x1b\xad\x00\x00\x19\x8d\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x08\x85\x00\x00"
+    b"\x1d\x7c\x00\x00\xa8\x3f\x00\x00\x02\xac\x00\x00\x02\xcc\x00\x00\x1f\x7c\x00\x00\x98\x3f\x00\x00\x80\xff\x00\x00\x04\x7c\x00\x00"
+    b"\xa0\x3f\x00\x00\x8e\xab\x00\x00\x14\x8c\x00\x00\x15\x88\x00\x00\x16\xb0\x00\x00\x01\xd0\x00\x00\x8e\xaf\x00\x00\x05\x68\x00\x00"
+    b"\x20\x29\x00\x00\x26\x8d\x00\x00\x03\xa8\x00\x00\x83\x4d\x00\x00\xff\x2d\x00\x00\x82\x0d\x00\x00\x17\x8c\x00\x00\x04\x7c\x00\x00"
+    b"\xa0\x3f\x00\x00\x8d\x87\x00\x00\x0a\x84\x00\x00\x03\x7c\x00\x00\x82\x3f\x00\x00\x81\xff\x00\x00\x01\x74\x00\x00\xa0\x36\x00\x00"
+    b"\x9b\xba\x00\x00\xad\xae\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00\x03\x1b\x00\x00\x39\x98\x00\x00\x19\xac\x00\x00\x13\x8c\x00\x00"
+    b"\x03\xb0\x00\x00\x12\x90\x00\x00\x83\x4d\x00\x00\x84\x11\x00\x00\x06\x12\x00\x00\x07\x98\x00\x00\x08\x98\x00\x00\x04\x7c\x00\x00"
+    b"\xa0\x3f\x00\x00\x98\xaf\x00\x00\x02\x74\x00\x00\xa0\x36\x00\x00\x8d\xaa\x00\x00\x82\x0d\x00\x00\x83\x4d\x00\x00\x03\x12\x00\x00"
+    b"\x17\x90\x00\x00\x03\xb8\x00\x00\x39\xac\x00\x00\x86\x0d\x00\x00\x9b\xbb\x00\x00\x03\x3b\x00\x00\x06\x5b\x00\x00\x7f\x3b\x00\x00"
+    b"\x86\x0d\x00\x00\x14\x90\x00\x00\x15\x8c\x00\x00\x16\xb8\x00\x00\x81\xd8\x00\x00\x17\x8c\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00"
+    b"\x0e\xad\x00\x00\x03\xb8\x00\x00\x83\x4d\x00\x00\xff\x2d\x00\x00\x86\x0d\x00\x00\x17\xb0\x00\x00\x14\x90\x00\x00\x15\x8c\x00\x00"
+    b"\x16\xbc\x00\x00\x81\xdc\x00\x00\x17\x8c\x00\x00\x21\x7c\x00\x00\xb2\x3f\x00\x00\x80\xff\x00\x00\x03\x68\x00\x00\x20\x29\x00\x00"
+    b"\x02\xad\x00\x00\x00\x8d\x00\x00\x04\x68\x00\x00\x00\x29\x00\x00\x02\xad\x00\x00\x00\x8d\x00\x00\x03\x68\x00\x00\x00\x29\x00\x00"
+    b"\x02\xad\x00\x00\x00\x8d\x00\x00\x03\x68\x00\x00\x10\x29\x00\x00\x02\xad\x00\x00\x00\x8d\x00\x00\x03\x68\x00\x00\x30\x29\x00\x00"
+    b"\x02\xad\x00\x00\x00\x8d\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x08\x85\x00\x00\x0d\x85\x00\x00\x0a\x84\x00\x00\x01\x70\x00\x00"
+    b"\x20\x32\x00\x00\x15\xae\x00\x00\x11\xb4\x00\x00\x00\xbe\x00\x00\x81\xdc\x00\x00\x18\xae\x00\x00\x85\x0d\x00\x00\x00\xbe\x00\x00"
+    b"\x18\xae\x00\x00\x82\xdc\x00\x00\x15\xae\x00\x00\xfe\x2d\x00\x00\x85\x0d\x00\x00\x81\x2d\x00\x00\x00\xae\x00\x00\x03\x7c\x00\x00"
+    b"\x82\x3f\x00\x00\x81\xff\x00\x00\x12\xb0\x00\x00\x14\x8c\x00\x00\x15\x90\x00\x00\x16\xb0\x00\x00\x84\xd0\x00\x00\x12\xb0\x00\x00"
+    b"\x04\x52\x00\x00\x01\x32\x00\x00\x84\x0d\x00\x00\x80\xff\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x00\xb1\x00\x00\x01\xd0\x00\x00"
+    b"\xfb\xc0\x00\x00\x01\xb9\x00\x00\x00\x99\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x19\x81\x00\x00\x17\x81\x00\x00\x1c\xac\x00\x00"
+    b"\x04\xcc\x00\x00\x17\xac\x00\x00\x02\xcc\x00\x00\x33\x80\x00\x00\x1a\x81\x00\x00\x1b\xac\x00\x00\x03\xcc\x00\x00\x1c\xac\x00\x00"
+    b"\x01\xcc\x00\x00\x90\xc0\x00\x00\x17\xac\x00\x00\x89\xcc\x00\x00\x04\x7c\x00\x00\xa0\x3f\x00\x00\x8d\x83\x00\x00\x21\x7c\x00\x00"
+    b"\xb2\x3f\x00\x00\x80\xff\x00\x00\x23\x7c\x00\x00\x8a\x3f\x00\x00\x80\xff\x00\x00\x1b\xac\x00\x00\x83\xcc\x00\x00\x1c\xac\x00\x00"
+    b"\x81\xcc\x00\x00\xb2\xc0\x00\x00\x1a\xad\x00\x00\x02\xcc\x00\x00\x10\xac\x00\x00\x0f\x8c\x00\x00\x17\xac\x00\x00\x1a\xcc\x00\x00"
+    b"\x04\x7c\x00\x00\xa0\x3f\x00\x00\x8d\x83\x00\x00\x21\x7c\x00\x00\x94\x3f\x00\x00\x80\xff\x00\x00\x1d\x7c\x00\x00\xa8\x3f\x00\x00"
+    b"\x02\xac\x00\x00\x02\xcc\x00\x00\x1f\x7c\x00\x00\x98\x3f\x00\x00\x80\xff\x00\x00\x04\x7c\x00\x00\xa0\x3f\x00\x00\x8e\xab\x00\x00"
+    b"\x14\x88\x00\x00\x15\x8c\x00\x00\x16\xb0\x00\x00\x81\xd0\x00\x00\x8e\xaf\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x26\x8d\x00\x00"
+    b"\x33\x80\x00\x00\x1a\x81\x00\x00\x04\x7c\x00\x00\xa0\x3f\x00\x00\x8e\xbb\x00\x00\x06\x5b\x00\x00\x03\xa8\x00\x00\x02\x1b\x00\x00"
+    b"\x0b\xcf\x00\x00\x1d\x7c\x00\x00\xa8\x3f\x00\x00\x02\xac\x00\x00\x02\xcc\x00\x00\x1f\x7c\x00\x00\x98\x3f\x00\x00\x80\xff\x00\x00"
+    b"\x05\x68\x00\x00\x20\x29\x00\x00\x37\x81\x00\x00\x39\x81\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x13\x81\x00\x00\x12\xb9\x00\x00"
+    b"\x17\xac\x00\x00\x81\xd9\x00\x00\x13\x85\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x04\xb9\x00\x00\x17\xac\x00\x00\x01\xcf\x00\x00"
+    b"\x06\x85\x00\x00\x05\xb9\x00\x00\x01\xcf\x00\x00\x06\x81\x00\x00\x17\xac\x00\x00\x39\xb8\x00\x00\x02\x3b\x00\x00\x1c\xb4\x00\x00"
+    b"\x01\xd4\x00\x00\x01\x38\x00\x00\x17\xcf\x00\x00\x01\x74\x00\x00\xa0\x36\x00\x00\x9b\xba\x00\x00\xad\xae\x00\x00\x83\x4d\x00\x00"
+    b"\x81\x2d\x00\x00\x03\x1b\x00\x00\x39\x98\x00\x00\x19\xb8\x00\x00\x13\x98\x00\x00\x03\xb8\x00\x00\x12\x98\x00\x00\x1c\xac\x00\x00"
+    b"\x86\xcc\x00\x00\x0f\xac\x00\x00\x04\xcc\x00\x00\x1e\xac\x00\x00\xff\x2d\x00\x00\x1e\x8c\x00\x00\x3c\x80\x00\x00\x04\x68\x00\x00"
+    b"\x20\x29\x00\x00\x02\xad\x00\x00\x23\x84\x00\x00\x1c\xac\x00\x00\x0e\xcc\x00\x00\x23\x80\x00\x00\x12\xac\x00\x00\x04\x68\x00\x00"
+    b"\x20\x29\x00\x00\x1b\xb5\x00\x00\x84\x36\x00\x00\x85\x56\x00\x00\x83\x16\x00\x00\x17\xb8\x00\x00\x14\x98\x00\x00\x15\x94\x00\x00"
+    b"\x16\xb4\x00\x00\x81\xd4\x00\x00\x23\x84\x00\x00\x1e\xac\x00\x00\x03\xcc\x00\x00\x07\x6c\x00\x00\x9f\x2d\x00\x00\x80\xed\x00\x00"
+    b"\x17\xb8\x00\x00\x13\xac\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x18\xb5\x00\x00\x85\x0d\x00\x00\xff\x2d\x00\x00\x14\x8c\x00\x00"
+    b"\x39\xb4\x00\x00\x15\x94\x00\x00\x16\xb0\x00\x00\x3d\x90\x00\x00\x83\x4d\x00\x00\x85\x0d\x00\x00\x85\xd0\x00\x00\x00\x20\x00\x00"
+    b"\x12\xb4\x00\x00\x85\x0d\x00\x00\x05\x10\x00\x00\x01\xc4\x00\x00\x00\x20\x00\x00\x06\xcf\x00\x00\x3c\xb4\x00\x00\x04\xd4\x00\x00"
+    b"\x04\x68\x00\x00\x20\x29\x00\x00\x15\x81\x00\x00\x16\x81\x00\x00\x02\x74\x00\x00\xa0\x36\x00\x00\x8d\xb2\x00\x00\x04\x52\x00\x00"
+    b"\x01\x32\x00\x00\x84\x0d\x00\x00\x12\xb0\x00\x00\x84\x0d\x00\x00\x02\x7c\x00\x00\xb8\x3f\x00\x00\x80\xff\x00\x00\x01\xcf\x00\x00"
+    b"\x8e\x82\x00\x00\x13\xac\x00\x00\x14\x8c\x00\x00\x39\xb4\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x19\xb1\x00\x00\x05\x16\x00\x00"
+    b"\x15\x94\x00\x00\x16\xb0\x00\x00\x3e\x90\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00\x85\x0d\x00\x00\x85\xd0\x00\x00\x00\x20\x00\x00"
+    b"\x12\xb4\x00\x00\x85\x0d\x00\x00\x05\x10\x00\x00\x01\xc4\x00\x00\x00\x20\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x01\xcf\x00\x00"
+    b"\x16\x85\x00\x00\x23\xac\x00\x00\xbe\xcc\x00\x00\x18\xac\x00\x00\x39\xb4\x00\x00\x81\xce\x00\x00\x15\x85\x00\x00\x39\xb4\x00\x00"
+    b"\x82\x36\x00\x00\x15\x94\x00\x00\x1b\xb1\x00\x00\x14\x8c\x00\x00\x16\xbc\x00\x00\x03\xdc\x00\x00\x18\xac\x00\x00\x81\x2d\x00\x00"
+    b"\x01\xc4\x00\x00\x17\xac\x00\x00\x14\x8c\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x85\x0d\x00\x00\x16\xb4\x00\x00\x12\xb8\x00\x00"
+    b"\x04\x68\x00\x00\x20\x29\x00\x00\x01\xd4\x00\x00\x86\x0d\x00\x00\x04\x52\x00\x00\x04\x1b\x00\x00\x01\xcf\x00\x00\x23\x81\x00\x00"
+    b"\x7d\x3b\x00\x00\x01\xcf\x00\x00\x27\x85\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x01\x7c\x00\x00\xa0\x3f\x00\x00\x39\xb4\x00\x00"
+    b"\x82\x36\x00\x00\x15\x94\x00\x00\x2e\xb0\x00\x00\x01\x2e\x00\x00\x14\x8c\x00\x00\x16\xbc\x00\x00\x03\xdc\x00\x00\x18\xac\x00\x00"
+    b"\x81\x2d\x00\x00\x01\xc4\x00\x00\x17\xac\x00\x00\x14\x8c\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x85\x0d\x00\x00\x16\xb4\x00\x00"
+    b"\x12\xb8\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x01\xd4\x00\x00\x86\x0d\x00\x00\x04\x52\x00\x00\x04\x1b\x00\x00\x01\xcf\x00\x00"
+    b"\x1f\x85\x00\x00\x1c\xac\x00\x00\x03\xcc\x00\x00\x0b\x6c\x00\x00\xb2\x2d\x00\x00\x80\xed\x00\x00\x02\x74\x00\x00\xa0\x36\x00\x00"
+    b"\x80\x82\x00\x00\x81\x82\x00\x00\x1a\xac\x00\x00\x01\xcc\x00\x00\x2b\xc4\x00\x00\x30\xac\x00\x00\x39\xb4\x00\x00\x85\x0d\x00\x00"
+    b"\x2e\xb4\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x85\x0d\x00\x00\x18\xb4\x00\x00\x81\xd5\x00\x00\x20\x85\x00\x00\x30\xac\x00\x00"
+    b"\x39\xb4\x00\x00\x85\x0d\x00\x00\x18\xb5\x00\x00\x1a\xb8\x00\x00\x86\x16\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x85\x19\x00\x00"
+    b"\x18\xb4\x00\x00\x02\xd7\x00\x00\x25\x81\x00\x00\x26\x81\x00\x00\x81\xd5\x00\x00\x25\x85\x00\x00\x18\xb1\x00\x00\x06\x1a\x00\x00"
+    b"\x19\xb1\x00\x00\x06\x1a\x00\x00\x01\xd7\x00\x00\x26\x85\x00\x00\x1b\xb9\x00\x00\x14\x8c\x00\x00\x15\x98\x00\x00\x16\xb0\x00\x00"
+    b"\x02\xd0\x00\x00\x39\xac\x00\x00\x83\xc0\x00\x00\x06\x5b\x00\x00\x01\x3b\x00\x00\x86\x0d\x00\x00\x81\xce\x00\x00\x24\x81\x00\x00"
+    b"\x23\xad\x00\x00\x09\xcc\x00\x00\x1c\xb5\x00\x00\x03\x70\x00\x00\x20\x32\x00\x00\x05\xae\x00\x00\x83\xcc\x00\x00\x09\x78\x00\x00"
+    b"\x00\x3b\x00\x00\x00\xfb\x00\x00\x18\xd4\x00\x00\x1a\xac\x00\x00\x01\xcc\x00\x00\x92\xc0\x00\x00\x24\xb5\x00\x00\x10\xd4\x00\x00"
+    b"\x1d\xb5\x00\x00\x04\x70\x00\x00\x00\x32\x00\x00\x05\xae\x00\x00\x02\xcc\x00\x00\x04\xd4\x00\x00\x09\xc4\x00\x00\x1a\xb9\x00\x00"
+    b"\x1d\x99\x00\x00\x86\xc0\x00\x00\x83\xd4\x00\x00\x24\x85\x00\x00\x20\x81\x00\x00\x3f\x84\x00\x00\xff\x36\x00\x00\x1d\x95\x00\x00"
+    b"\x03\x70\x00\x00\x20\x32\x00\x00\x09\xc4\x00\x00\x83\xd4\x00\x00\x3f\x84\x00\x00\x23\x85\x00\x00\x1f\x81\x00\x00\xff\x36\x00\x00"
+    b"\x1c\x95\x00\x00\x02\xc4\x00\x00\x1a\xb9\x00\x00\x1c\x99\x00\x00\x03\x68\x00\x00\x20\x29\x00\x00\x00\xb1\x00\x00\x06\xad\x00\x00"
+    b"\x01\x78\x00\x00\x20\x3b\x00\x00\x03\x1b\x00\x00\x2b\xaf\x00\x00\x81\xd1\x00\x00\x21\x80\x00\x00\x01\x78\x00\x00\x20\x3b\x00\x00"
+    b"\x3f\xaf\x00\x00\x11\xb4\x00\x00\x85\x15\x00\x00\x81\xd2\x00\x00\x22\x80\x00\x00\x18\xb8\x00\x00\x01\x74\x00\x00\xa0\x36\x00\x00"
+    b"\x28\x6c\x00\x00\xa1\x2d\x00\x00\x80\xfd\x00\x00\x00\x91\x00\x00\x06\xad\x00\x00\x01\x78\x00\x00\x20\x3b\x00\x00\x03\x1b\x00\x00"
+    b"\x28\xaf\x00\x00\x81\xd1\x00\x00\x21\x84\x00\x00\x01\x78\x00\x00\x20\x3b\x00\x00\x3d\xaf\x00\x00\x11\xb8\x00\x00\x86\x19\x00\x00"
+    b"\x01\xd3\x00\x00\x22\x84\x00\x00\x0f\xb5\x00\x00\x87\xd4\x00\x00\x04\x6c\x00\x00\xa0\x2d\x00\x00\x9c\xb5\x00\x00\x03\xd4\x00\x00"
+    b"\x3f\x84\x00\x00\xa3\x85\x00\x00\x9f\x81\x00\x00\x1a\xac\x00\x00\x01\xcc\x00\x00\x38\xc4\x00\x00\x04\x68\x00\x00\x00\x29\x00\x00"
+    b"\x00\xb1\x00\x00\x06\xad\x00\x00\x01\x78\x00\x00\x20\x3b\x00\x00\x03\x1b\x00\x00\x2b\xaf\x00\x00\x81\xd1\x00\x00\x08\x81\x00\x00"
+    b"\x01\x78\x00\x00\x20\x3b\x00\x00\x3f\xaf\x00\x00\x11\xb4\x00\x00\x85\x15\x00\x00\x81\xd2\x00\x00\x09\x81\x00\x00\x2d\xb8\x00\x00"
+    b"\x01\x74\x00\x00\xa0\x36\x00\x00\x28\x6c\x00\x00\xa1\x2d\x00\x00\x80\xfd\x00\x00\x00\x91\x00\x00\x06\xad\x00\x00\x01\x78\x00\x00"
+    b"\x20\x3b\x00\x00\x03\x1b\x00\x00\x28\xaf\x00\x00\x81\xd1\x00\x00\x08\x85\x00\x00\x01\x78\x00\x00\x20\x3b\x00\x00\x3d\xaf\x00\x00"
+    b"\x11\xb8\x00\x00\x86\x19\x00\x00\x01\xd3\x00\x00\x09\x85\x00\x00\x0f\xb5\x00\x00\x87\xd4\x00\x00\x04\x6c\x00\x00\xa0\x2d\x00\x00"
+    b"\x9d\xb5\x00\x00\x03\xd4\x00\x00\x3f\x84\x00\x00\xa4\x85\x00\x00\xa0\x81\x00\x00\x03\x68\x00\x00\x30\x29\x00\x00\x09\xb8\x00\x00"
+    b"\x01\x74\x00\x00\xa0\x36\x00\x00\x28\x6c\x00\x00\xa1\x2d\x00\x00\x80\xfd\x00\x00\x00\x91\x00\x00\x03\xb4\x00\x00\x18\xb8\x00\x00"
+    b"\x14\x98\x00\x00\x15\x94\x00\x00\x16\xb4\x00\x00\x08\xd4\x00\x00\x01\x3b\x00\x00\x18\x98\x00\x00\x39\xb4\x00\x00\x81\x36\x00\x00"
+    b"\x83\xda\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00\xa7\x82\x00\x00\x1a\xb4\x00\x00\x01\xd4\x00\x00\x23\xc4\x00\x00\x18\xb4\x00\x00"
+    b"\x30\xb8\x00\x00\x05\xd7\x00\x00\x2d\x80\x00\x00\x04\x68\x00\x00\x00\x29\x00\x00\x05\x85\x00\x00\x88\xc0\x00\x00\x03\xb4\x00\x00"
+    b"\x2d\xb8\x00\x00\x14\x98\x00\x00\x15\x94\x00\x00\x16\xb4\x00\x00\x02\xd4\x00\x00\x01\x3b\x00\x00\x2d\x98\x00\x00\x03\x68\x00\x00"
+    b"\x30\x29\x00\x00\x18\xb4\x00\x00\x30\xb8\x00\x00\x0e\xac\x00\x00\x03\x1b\x00\x00\x1a\xac\x00\x00\x83\x4d\x00\x00\x03\x1b\x00\x00"
+    b"\x04\xd7\x00\x00\x0e\xac\x00\x00\x09\x8c\x00\x00\x05\x85\x00\x00\x85\xc0\x00\x00\x09\xb8\x00\x00\x05\xad\x00\x00\x81\xcc\x00\x00"
+    b"\x01\x3b\x00\x00\x09\x98\x00\x00\x00\x80\x00\x00\x05\x80\x00\x00\x01\x80\x00\x00\x17\xb8\x00\x00\x04\xd8\x00\x00\x18\x80\x00\x00"
+    b"\x03\x68\x00\x00\x20\x29\x00\x00\x05\x85\x00\x00\x39\xa8\x00\x00\x01\xd9\x00\x00\x05\x84\x00\x00\x0d\x78\x00\x00\x29\x3b\x00\x00"
+    b"\x00\xfb\x00\x00\x00\x20\x00\x00\x00\x20\x00\x00\x00\x20\x00\x00\x00\x80\x00\x00\x05\x80\x00\x00\x20\x80\x00\x00\x03\x68\x00\x00"
+    b"\x20\x29\x00\x00\x00\x81\x00\x00\x04\x68\x00\x00\x00\x29\x00\x00\x00\x81\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x30\xad\x00\x00"
+    b"\x01\xcc\x00\x00\x87\xc0\x00\x00\xff\x2d\x00\x00\x30\x8d\x00\x00\x04\xcc\x00\x00\x33\x85\x00\x00\x02\x7c\x00\x00\xa0\x3f\x00\x00"
+    b"\x8f\x83\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x07\xad\x00\x00\x03\xcc\x00\x00\x0d\x7c\x00\x00\xa2\x3f\x00\x00\x80\xff\x00\x00"
+    b"\x02\x68\x00\x00\x20\x29\x00\x00\x29\xac\x00\x00\x01\xcc\x00\x00\x81\xc0\x00\x00\xff\x2d\x00\x00\x29\x8c\x00\x00\x80\x15\x00\x00"
+    b"\x2c\xac\x00\x00\x8d\xcc\x00\x00\x2a\xb0\x00\x00\x02\xd0\x00\x00\x0b\xad\x00\x00\x81\xc0\x00\x00\x0c\xad\x00\x00\x14\x94\x00\x00"
+    b"\x15\x8c\x00\x00\x16\xb0\x00\x00\x81\xd0\x00\x00\x80\x0e\x00\x00\x29\x8c\x00\x00\x27\x84\x00\x00\x28\x84\x00\x00\x00\xb1\x00\x00"
+    b"\x01\x78\x00\x00\x00\x3b\x00\x00\x00\xb7\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x86\x1a\x00\x00\x10\xaf\x00\x00\x81\xd1\x00\x00"
+    b"\x21\x80\x00\x00\x08\xaf\x00\x00\x11\xb4\x00\x00\x85\x15\x00\x00\x81\xd2\x00\x00\x22\x80\x00\x00\x18\xb8\x00\x00\x29\xac\x00\x00"
+    b"\x1f\xcc\x00\x00\x27\x80\x00\x00\x28\x80\x00\x00\x11\x81\x00\x00\x17\x81\x00\x00\x13\x81\x00\x00\x12\x81\x00\x00\x14\x81\x00\x00"
+    b"\x15\x81\x00\x00\x16\x81\x00\x00\x01\x74\x00\x00\x80\x36\x00\x00\x25\x6c\x00\x00\xb8\x2d\x00\x00\x80\xfd\x00\x00\x00\x91\x00\x00"
+    b"\x03\xad\x00\x00\x03\xce\x00\x00\x04\xad\x00\x00\x01\x8d\x00\x00\x8b\xc0\x00\x00\x04\xd0\x00\x00\x01\x81\x00\x00\x18\x81\x00\x00"
+    b"\x19\x81\x00\x00\x86\xc0\x00\x00\x01\x2e\x00\x00\x01\x8d\x00\x00\x81\x2d\x00\x00\x18\x8d\x00\x00\x81\x2d\x00\x00\x19\x8d\x00\x00"
+    b"\x01\x7c\x00\x00\x80\x3f\x00\x00\x80\xab\x00\x00\x82\x1b\x00\x00\x0f\xaf\x00\x00\x81\xd1\x00\x00\x21\x84\x00\x00\x07\xaf\x00\x00"
+    b"\x11\xb8\x00\x00\x86\x19\x00\x00\x01\xd3\x00\x00\x22\x84\x00\x00\x29\xac\x00\x00\x05\xcc\x00\x00\x18\xb8\x00\x00\x01\x3b\x00\x00"
+    b"\x01\xd8\x00\x00\x81\xc0\x00\x00\x18\x98\x00\x00\x1c\xb8\x00\x00\x05\xd8\x00\x00\x1b\xb8\x00\x00\x03\xd8\x00\x00\x0f\x78\x00\x00"
+    b"\x0a\x3b\x00\x00\x00\xfb\x00\x00\x07\xb8\x00\x00\x03\x68\x00\x00\x00\x29\x00\x00\x28\x6c\x00\x00\xa1\x2d\x00\x00\x01\x74\x00\x00"
+    b"\xa0\x36\x00\x00\x80\xfd\x00\x00\x00\x91\x00\x00\x02\x6c\x00\x00\xa0\x2d\x00\x00\x93\xb9\x00\x00\x84\xd8\x00\x00\x94\xb9\x00\x00"
+    b"\x02\xd8\x00\x00\x00\x81\x00\x00\x90\xc0\x00\x00\x1c\xb8\x00\x00\x0e\xd8\x00\x00\x90\xb9\x00\x00\x02\x30\x00\x00\x04\x5b\x00\x00"
+    b"\x06\x5b\x00\x00\x09\xda\x00\x00\x01\x70\x00\x00\x00\x32\x00\x00\x12\xae\x00\x00\x2f\xb8\x00\x00\x86\x0d\x00\x00\xff\x2d\x00\x00"
+    b"\x17\xb8\x00\x00\x01\xcf\x00\x00\x00\x81\x00\x00\x81\xd4\x00\x00\x0b\x84\x00\x00\x07\xb8\x00\x00\x05\xad\x00\x00\x86\xcc\x00\x00"
+    b"\x1e\xac\x00\x00\x83\xcc\x00\x00\x39\xb4\x00\x00\x01\xd7\x00\x00\x3c\x84\x00\x00\x01\x3b\x00\x00\x07\x98\x00\x00\x08\xb8\x00\x00"
+    b"\x03\x68\x00\x00\x10\x29\x00\x00\x28\x6c\x00\x00\xa1\x2d\x00\x00\x01\x74\x00\x00\xa0\x36\x00\x00\x80\xfd\x00\x00\x00\x91\x00\x00"
+    b"\x02\x6c\x00\x00\xa0\x2d\x00\x00\x93\xb9\x00\x00\x84\xd8\x00\x00\x94\xb9\x00\x00\x02\xd8\x00\x00\x00\x81\x00\x00\x90\xc0\x00\x00"
+    b"\x1c\xb8\x00\x00\x0e\xd8\x00\x00\x90\xb9\x00\x00\x02\x30\x00\x00\x04\x5b\x00\x00\x06\x5b\x00\x00\x09\xda\x00\x00\x01\x70\x00\x00"
+    b"\x00\x32\x00\x00\x12\xae\x00\x00\x2f\xb8\x00\x00\x86\x0d\x00\x00\xff\x2d\x00\x00\x17\xb8\x00\x00\x01\xcf\x00\x00\x00\x81\x00\x00"
+    b"\x81\xd4\x00\x00\x0b\x80\x00\x00\x08\xb8\x00\x00\x05\xad\x00\x00\x86\xcc\x00\x00\x1e\xac\x00\x00\x83\xcc\x00\x00\x39\xb4\x00\x00"
+    b"\x01\xd7\x00\x00\x3c\x84\x00\x00\x01\x3b\x00\x00\x08\x98\x00\x00\x17\xb8\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x08\xad\x00\x00"
+    b"\x81\xc5\x00\x00\x01\x3b\x00\x00\x17\x98\x00\x00\x1c\xb8\x00\x00\x28\xd8\x00\x00\x17\xb8\x00\x00\x2f\xa8\x00\x00\x05\x6c\x00\x00"
+    b"\xa0\x2d\x00\x00\xad\xb1\x00\x00\x04\x11\x00\x00\x04\xd3\x00\x00\x02\x74\x00\x00\xa0\x36\x00\x00\x8e\x86\x00\x00\x83\xc0\x00\x00"
+    b"\x01\x32\x00\x00\x01\xd3\x00\x00\xa9\x81\x00\x00\x01\x2d\x00\x00\x2e\xb4\x00\x00\x14\x8c\x00\x00\x15\x94\x00\x00\x85\x56\x00\x00"
+    b"\x81\x36\x00\x00\x85\x11\x00\x00\x16\xac\x00\x00\x85\xcc\x00\x00\x17\xb4\x00\x00\x03\xd6\x00\x00\x02\x6c\x00\x00\xa0\x2d\x00\x00"
+    b"\x8f\x85\x00\x00\x0b\xd9\x00\x00\x20\x84\x00\x00\x18\x80\x00\x00\x05\x84\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x1d\xb8\x00\x00"
+    b"\x7f\x3b\x00\x00\x1d\x98\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x07\x85\x00\x00\x1b\xb8\x00\x00\x83\xd8\x00\x00\x11\x78\x00\x00"
+    b"\x04\x3b\x00\x00\x00\xfb\x00\x00\x03\xb4\x00\x00\x17\xb8\x00\x00\x96\xda\x00\x00\x17\x80\x00\x00\x00\x84\x00\x00\x10\xb8\x00\x00"
+    b"\x24\x98\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x29\x85\x00\x00\x2f\xa8\x00\x00\x09\xc1\x00\x00\x20\x84\x00\x00\x18\x80\x00\x00"
+    b"\x05\x84\x00\x00\x1d\xb8\x00\x00\x7f\x3b\x00\x00\x1d\x98\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x07\x85\x00\x00\x02\xb8\x00\x00"
+    b"\x3e\x80\x00\x00\x01\xd8\x00\x00\x3e\x84\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00\x0f\xb8\x00\x00\x03\x81\x00\x00\x2c\x80\x00\x00"
+    b"\x1c\xd8\x00\x00\x17\xb8\x00\x00\x03\xb4\x00\x00\x06\x5b\x00\x00\x05\x1b\x00\x00\x05\x70\x00\x00\x20\x32\x00\x00\x26\xae\x00\x00"
+    b"\x17\xcf\x00\x00\x07\xad\x00\x00\x03\x24\x00\x00\x81\x4d\x00\x00\x83\x4d\x00\x00\x01\x24\x00\x00\x05\xcc\x00\x00\x03\x85\x00\x00"
+    b"\x1d\xac\x00\x00\x81\x2d\x00\x00\x1d\x8c\x00\x00\x8f\xc0\x00\x00\x02\xad\x00\x00\x86\xcc\x00\x00\x08\x85\x00\x00\x03\x85\x00\x00"
+    b"\x1d\xac\x00\x00\x81\x2d\x00\x00\x1d\x8c\x00\x00\x87\xc0\x00\x00\x08\x81\x00\x00\x1b\x68\x00\x00\x0e\x29\x00\x00\x00\xe9\x00\x00"
+    b"\x12\x78\x00\x00\x15\x3b\x00\x00\x00\xfb\x00\x00\x13\x78\x00\x00\x21\x3b\x00\x00\x00\xfb\x00\x00\x03\xb4\x00\x00\x17\xb8\x00\x00"
+    b"\x87\xda\x00\x00\x17\x80\x00\x00\x00\x84\x00\x00\x10\xb8\x00\x00\x24\x98\x00\x00\x0c\xac\x00\x00\x83\x4d\x00\x00\x0c\x8c\x00\x00"
+    b"\x13\xac\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00\x12\xb4\x00\x00\x83\x12\x00\x00\x39\xac\x00\x00\x84\x11\x00\x00\x83\x1a\x00\x00"
+    b"\x04\x74\x00\x00\xa0\x36\x00\x00\x98\xae\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x0d\xb5\x00\x00\x85\x0d\x00\x00\x83\x4d\x00\x00"
+    b"\x84\x11\x00\x00\x04\x0c\x00\x00\x14\x8c\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00\x9b\xb2\x00\x00\x03\x32\x00\x00\x04\x52\x00\x00"
+    b"\x04\x13\x00\x00\x15\x90\x00\x00\x16\xb8\x00\x00\x81\xd8\x00\x00\x00\x0e\x00\x00\x14\x8c\x00\x00\x12\xb4\x00\x00\x15\x94\x00\x00"
+    b"\x03\x10\x00\x00\x16\xac\x00\x00\x81\xcc\x00\x00\xfe\x32\x00\x00\x1f\x90\x00\x00\x17\xb8\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00"
+    b"\x83\x82\x00\x00\x46\xda\x00\x00\x3c\xac\x00\x00\x44\xcc\x00\x00\x87\xae\x00\x00\x03\x30\x00\x00\x84\x4d\x00\x00\x83\x4d\x00\x00"
+    b"\x10\xb0\x00\x00\x94\xba\x00\x00\x06\x5b\x00\x00\x04\x52\x00\x00\x06\x52\x00\x00\x0f\x90\x00\x00\x83\xd0\x00\x00\x13\x74\x00\x00"
+    b"\x8d\x36\x00\x00\x80\xf6\x00\x00\x01\xcc\x00\x00\x86\xc0\x00\x00\x82\xae\x00\x00\x04\xcc\x00\x00\x88\x82\x00\x00\x13\x7c\x00\x00"
+    b"\x8d\x3f\x00\x00\x80\xff\x00\x00\x88\x86\x00\x00\x83\x86\x00\x00\x1e\xac\x00\x00\x81\x2d\x00\x00\x1e\x8c\x00\x00\x1e\xb8\x00\x00"
+    b"\x03\xd8\x00\x00\x11\x78\x00\x00\x01\x3b\x00\x00\x00\xfb\x00\x00\x3c\xb8\x00\x00\x83\xd8\x00\x00\x11\x78\x00\x00\x01\x3b\x00\x00"
+    b"\x00\xfb\x00\x00\x17\xb8\x00\x00\x1f\xac\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00\x84\xd9\x00\x00\x01\x84\x00\x00\x0a\xac\x00\x00"
+    b"\x83\x4d\x00\x00\x0a\x8c\x00\x00\x17\xb8\x00\x00\x01\x68\x00\x00\x20\x29\x00\x00\x39\xb4\x00\x00\x13\xac\x00\x00\x14\x94\x00\x00"
+    b"\x15\x8c\x00\x00\x16\xb0\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00\x85\x0d\x00\x00\x07\xd0\x00\x00\x00\x20\x00\x00\x12\xb4\x00\x00"
+    b"\x01\x68\x00\x00\x20\x29\x00\x00\x85\x0d\x00\x00\x05\x10\x00\x00\x01\xc4\x00\x00\x00\x20\x00\x00\x10\xcf\x00\x00\x0f\xac\x00\x00"
+    b"\x0e\xcc\x00\x00\x0a\xac\x00\x00\x39\xb0\x00\x00\x06\xcc\x00\x00\x03\x68\x00\x00\x00\x29\x00\x00\x05\x85\x00\x00\x07\x90\x00\x00"
+    b"\x06\x8d\x00\x00\x85\xc0\x00\x00\x03\x68\x00\x00\x10\x29\x00\x00\x05\x85\x00\x00\x08\x90\x00\x00\x06\x8d\x00\x00\x03\x68\x00\x00"
+    b"\x00\x29\x00\x00\x05\xb5\x00\x00\x0b\xd4\x00\x00\x03\x68\x00\x00\x10\x29\x00\x00\x05\xb5\x00\x00\x07\xd4\x00\x00\x04\x68\x00\x00"
+    b"\x20\x29\x00\x00\x02\xb5\x00\x00\x03\xd4\x00\x00\x1b\x7c\x00\x00\x82\x3f\x00\x00\x80\xff\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00"
+    b"\x2d\x81\x00\x00\x3f\x80\x00\x00\xf8\xc0\x00\x00\x1b\xb8\x00\x00\x85\xd8\x00\x00\x1d\xb8\x00\x00\xf4\xd8\x00\x00\x18\x78\x00\x00"
+    b"\x04\x3b\x00\x00\x00\xfb\x00\x00\x17\xb8\x00\x00\x03\xb4\x00\x00\x06\x5b\x00\x00\x05\x1b\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00"
+    b"\x12\x81\x00\x00\x13\x81\x00\x00\x22\x81\x00\x00\x23\x81\x00\x00\x02\xac\x00\x00\x0a\xcc\x00\x00\x00\x3c\x00\x00\x00\x2c\x00\x00"
+    b"\x06\x74\x00\x00\xa0\x36\x00\x00\x86\xb2\x00\x00\x01\xd0\x00\x00\xde\xc0\x00\x00\x15\x74\x00\x00\x90\x36\x00\x00\x80\xf6\x00\x00"
+    b"\x04\xad\x00\x00\x88\xd9\x00\x00\x12\x85\x00\x00\x1d\x85\x00\x00\x05\xad\x00\x00\x83\x4d\x00\x00\x04\xbc\x00\x00\x87\x0d\x00\x00"
+    b"\x14\x8d\x00\x00\x33\x84\x00\x00\x2c\xb1\x00\x00\x84\x15\x00\x00\x86\xda\x00\x00\x32\x81\x00\x00\x25\xb5\x00\x00\x81\x16\x00\x00"
+    b"\x25\x95\x00\x00\x34\x81\x00\x00\x35\x81\x00\x00\x07\xb5\x00\x00\x0f\xb1\x00\x00\x05\x12\x00\x00\x0d\xb5\x00\x00\x05\x0e\x00\x00"
+    b"\x3d\x8d\x00\x00\x3c\x85\x00\x00\x3c\x81\x00\x00\x06\xad\x00\x00\x3e\xb1\x00\x00\x3f\xbd\x00\x00\x84\x0d\x00\x00\x0e\xb1\x00\x00"
+    b"\x84\x0d\x00\x00\x0c\xb1\x00\x00\x84\x0d\x00\x00\x88\xd9\x00\x00\x13\x85\x00\x00\x06\x34\x00\x00\x1c\x95\x00\x00\x87\x53\x00\x00"
+    b"\x04\xb4\x00\x00\x05\x12\x00\x00\x15\x91\x00\x00\x33\x84\x00\x00\x2a\xb1\x00\x00\x84\x15\x00\x00\x84\xda\x00\x00\x31\x81\x00\x00"
+    b"\x24\x85\x00\x00\x34\x81\x00\x00\x35\x81\x00\x00\x2b\xb1\x00\x00\x04\x52\x00\x00\x01\x32\x00\x00\x84\x15\x00\x00\x82\xda\x00\x00"
+    b"\x24\x81\x00\x00\x31\x85\x00\x00\x10\xb1\x00\x00\x84\x0d\x00\x00\x11\xb5\x00\x00\x85\x1f\x00\x00\x3d\x9d\x00\x00\x3c\x85\x00\x00"
+    b"\x3c\x81\x00\x00\x3e\xb1\x00\x00\x3f\xbd\x00\x00\x84\x0d\x00\x00\x2d\xb1\x00\x00\x04\x52\x00\x00\x01\x32\x00\x00\x84\x15\x00\x00"
+    b"\x89\xda\x00\x00\x25\xb1\x00\x00\x7f\x32\x00\x00\x25\x91\x00\x00\x05\xd0\x00\x00\x32\x85\x00\x00\x24\xb1\x00\x00\x02\xd0\x00\x00"
+    b"\x34\x85\x00\x00\x35\x85\x00\x00\x37\x8c\x00\x00\x38\x9c\x00\x00\x01\xb1\x00\x00\x07\x0e\x00\x00\x3d\x8d\x00\x00\x3c\x85\x00\x00"
+    b"\x3c\x81\x00\x00\x37\xac\x00\x00\x3e\xb1\x00\x00\x3f\xbd\x00\x00\x00\xb5\x00\x00\x05\x12\x00\x00\x84\x0d\x00\x00\x87\xd9\x00\x00"
+    b"\x12\x85\x00\x00\x1d\x81\x00\x00\x32\x81\x00\x00\x87\x4f\x00\x00\x04\xbc\x00\x00\x87\x0d\x00\x00\x14\x8d\x00\x00\x2c\xb1\x00\x00"
+    b"\x84\x0d\x00\x00\x88\xd9\x00\x00\x32\x81\x00\x00\x25\xb1\x00\x00\x01\x12\x00\x00\x25\x91\x00\x00\x34\xb1\x00\x00\x82\xd0\x00\x00"
+    b"\x34\x81\x00\x00\x35\x81\x00\x00\x02\x74\x00\x00\xa0\x36\x00\x00\x8d\xb2\x00\x00\x84\x0d\x00\x00\x81\xd9\x00\x00\x8e\x82\x00\x00"
+    b"\x02\xac\x00\x00\x13\xcc\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x00\xb6\x00\x00\x08\x95\x00\x00\x01\xb6\x00\x00\x09\x95\x00\x00"
+    b"\x02\xb6\x00\x00\x0a\x95\x00\x00\x03\xb6\x00\x00\x0b\x95\x00\x00\x12\xb6\x00\x00\x2b\x94\x00\x00\x15\xb6\x00\x00\x2b\x95\x00\x00"
+    b"\x00\x34\x00\x00\x1e\x95\x00\x00\x16\x7c\x00\x00\xb2\x3f\x00\x00\x80\xff\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x04\xb6\x00\x00"
+    b"\x08\x95\x00\x00\x05\xb6\x00\x00\x09\x95\x00\x00\x06\xb6\x00\x00\x0a\x95\x00\x00\x07\xb6\x00\x00\x0b\x95\x00\x00\x14\xb6\x00\x00"
+    b"\x2b\x94\x00\x00\x17\xb6\x00\x00\x2b\x95\x00\x00\x01\x34\x00\x00\x1e\x95\x00\x00\x16\x7c\x00\x00\xb2\x3f\x00\x00\x80\xff\x00\x00"
+    b"\x02\xac\x00\x00\x83\xcc\x00\x00\x02\x34\x00\x00\x1c\x95\x00\x00\x88\xc0\x00\x00\x22\xad\x00\x00\x23\xb1\x00\x00\x84\x55\x00\x00"
+    b"\x85\x56\x00\x00\x83\xd4\x00\x00\x02\x38\x00\x00\x1c\x99\x00\x00\x80\xc0\x00\x00\x1d\xb8\x00\x00\x13\x74\x00\x00\x99\x36\x00\x00"
+    b"\x82\xd8\x00\x00\x18\x74\x00\x00\x84\x36\x00\x00\x80\xf6\x00\x00\x38\xb0\x00\x00\x03\xad\x00\x00\x03\x12\x00\x00\x0b\xad\x00\x00"
+    b"\x03\x12\x00\x00\x09\xad\x00\x00\x03\x0e\x00\x00\x3d\x8d\x00\x00\x3c\x85\x00\x00\x3c\x81\x00\x00\x37\xac\x00\x00\x00\x20\x00\x00"
+    b"\x3e\xb1\x00\x00\x3f\xb5\x00\x00\x03\x12\x00\x00\x02\xad\x00\x00\x03\x12\x00\x00\x0a\xad\x00\x00\x03\x12\x00\x00\x08\xad\x00\x00"
+    b"\x03\x0e\x00\x00\x8d\xd9\x00\x00\x1e\xb1\x00\x00\x02\xd0\x00\x00\x22\x85\x00\x00\x81\xc0\x00\x00\x23\x85\x00\x00\x1c\x91\x00\x00"
+    b"\x13\x85\x00\x00\x31\x81\x00\x00\x1a\x85\x00\x00\x85\x52\x00\x00\x04\xb4\x00\x00\x05\x12\x00\x00\x15\x91\x00\x00\x2b\xb0\x00\x00"
+    b"\x84\x0d\x00\x00\x85\xd9\x00\x00\x25\xa4\x00\x00\x2c\x84\x00\x00\x1e\xb5\x00\x00\x2a\x94\x00\x00\x01\x24\x00\x00\x04\x52\x00\x00"
+    b"\x01\x32\x00\x00\x84\x0d\x00\x00\x2a\xb1\x00\x00\x84\x0d\x00\x00\x8f\xd9\x00\x00\x31\x81\x00\x00\x24\xb5\x00\x00\x81\x36\x00\x00"
+    b"\x24\x95\x00\x00\x25\xb4\x00\x00\x87\xd4\x00\x00\x02\x64\x00\x00\xa0\x24\x00\x00\x87\xb4\x00\x00\x01\x24\x00\x00\x03\xd4\x00\x00"
+    b"\x34\xb5\x00\x00\x81\xd4\x00\x00\x35\x81\x00\x00\x34\x81\x00\x00\x2b\xb5\x00\x00\x05\x12\x00\x00\x04\x52\x00\x00\x01\x32\x00\x00"
+    b"\x84\x11\x00\x00\x05\xda\x00\x00\x24\xb5\x00\x00\xff\x36\x00\x00\x24\x95\x00\x00\x01\xd4\x00\x00\x31\x85\x00\x00\x02\x74\x00\x00"
+    b"\xa0\x36\x00\x00\x8d\xb2\x00\x00\x84\x0d\x00\x00\x81\xd9\x00\x00\x8e\x82\x00\x00\x80\xff\x00\x00\x17\xb8\x00\x00\x03\xb0\x00\x00"
+    b"\x05\x68\x00\x00\x20\x29\x00\x00\x06\x5b\x00\x00\x01\x1b\x00\x00\x04\x1b\x00\x00\x2f\xb4\x00\x00\x14\x94\x00\x00\x2e\xad\x00\x00"
+    b"\x15\x8c\x00\x00\x16\xb0\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x85\x0d\x00\x00\x83\xd0\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00"
+    b"\x17\xb8\x00\x00\x81\xd9\x00\x00\x33\x81\x00\x00\x1f\xad\x00\x00\x20\xb5\x00\x00\x17\xb8\x00\x00\x03\xb0\x00\x00\x06\x5b\x00\x00"
+    b"\x04\x1b\x00\x00\x01\x80\x00\x00\x16\x81\x00\x00\x17\x81\x00\x00\x18\x81\x00\x00\x81\xd9\x00\x00\x01\x84\x00\x00\x81\xda\x00\x00"
+    b"\x16\x85\x00\x00\x02\xac\x00\x00\x03\xcc\x00\x00\x21\xb5\x00\x00\x81\xda\x00\x00\x18\x85\x00\x00\x07\xad\x00\x00\x0f\xb1\x00\x00"
+    b"\x03\x0e\x00\x00\x0d\xb1\x00\x00\x03\x0e\x00\x00\x11\xb1\x00\x00\x03\x0e\x00\x00\x02\xbc\x00\x00\x01\xdc\x00\x00\x00\x2c\x00\x00"
+    b"\x03\xb1\x00\x00\x03\x0e\x00\x00\x3d\x8d\x00\x00\x3c\x85\x00\x00\x3c\x81\x00\x00\x06\xad\x00\x00\x00\x20\x00\x00\x3e\xb1\x00\x00"
+    b"\x03\x0e\x00\x00\x0e\xb1\x00\x00\x03\x0e\x00\x00\x0c\xb1\x00\x00\x03\x0e\x00\x00\x10\xb1\x00\x00\x03\x0e\x00\x00\x02\xbc\x00\x00"
+    b"\x01\xdc\x00\x00\x00\x2c\x00\x00\x02\xb1\x00\x00\x03\x0e\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x1a\xb6\x00\x00\x39\xbd\x00\x00"
+    b"\x15\xdc\x00\x00\x00\x7e\x00\x00\x87\x52\x00\x00\x04\x52\x00\x00\x81\xd3\x00\x00\x8a\xc0\x00\x00\x14\x8c\x00\x00\x15\x94\x00\x00"
+    b"\x16\xb0\x00\x00\x06\xd0\x00\x00\x83\x4d\x00\x00\x83\x16\x00\x00\x3a\x95\x00\x00\x1a\xb1\x00\x00\x39\x91\x00\x00\x86\xc0\x00\x00"
+    b"\x39\x81\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x16\x00\x00\x81\xda\x00\x00\x17\x85\x00\x00\x02\xbc\x00\x00\x1c\xdc\x00\x00"
+    b"\x06\x70\x00\x00\x20\x32\x00\x00\x1b\xb6\x00\x00\x02\xad\x00\x00\x37\xbd\x00\x00\x15\xdc\x00\x00\x00\x7e\x00\x00\x87\x52\x00\x00"
+    b"\x04\x52\x00\x00\x01\xde\x00\x00\x8a\xc0\x00\x00\x14\x8c\x00\x00\x15\x94\x00\x00\x16\xb0\x00\x00\x06\xd0\x00\x00\x83\x4d\x00\x00"
+    b"\x83\x16\x00\x00\x38\x95\x00\x00\x1a\xb1\x00\x00\x37\x91\x00\x00\x86\xc0\x00\x00\x37\x81\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00"
+    b"\x83\x16\x00\x00\x81\xda\x00\x00\x19\x85\x00\x00\xaf\xc0\x00\x00\x07\xad\x00\x00\x0f\xb1\x00\x00\x03\x0e\x00\x00\x3d\x8d\x00\x00"
+    b"\x3c\x85\x00\x00\x3c\x81\x00\x00\x06\xad\x00\x00\x00\x20\x00\x00\x3e\xb1\x00\x00\x03\x0e\x00\x00\x0e\xb1\x00\x00\x03\x0e\x00\x00"
+    b"\x06\x70\x00\x00\x20\x32\x00\x00\x19\xb6\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x16\x00\x00\x81\xda\x00\x00\x18\x85\x00\x00"
+    b"\x06\xad\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x1b\xb6\x00\x00\x37\xbd\x00\x00\x15\xdc\x00\x00\x00\x7e\x00\x00\x87\x52\x00\x00"
+    b"\x04\x52\x00\x00\x01\xde\x00\x00\x8a\xc0\x00\x00\x14\x8c\x00\x00\x15\x94\x00\x00\x16\xb0\x00\x00\x06\xd0\x00\x00\x83\x4d\x00\x00"
+    b"\x83\x16\x00\x00\x38\x95\x00\x00\x1a\xad\x00\x00\x37\x8d\x00\x00\x86\xc0\x00\x00\x37\x81\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00"
+    b"\x83\x16\x00\x00\x81\xda\x00\x00\x19\x85\x00\x00\x2f\xb0\x00\x00\x01\x32\x00\x00\x2e\xb4\x00\x00\x14\x90\x00\x00\x15\x94\x00\x00"
+    b"\x85\x56\x00\x00\x81\x36\x00\x00\x05\x12\x00\x00\x16\xac\x00\x00\x02\xcc\x00\x00\x03\xb4\x00\x00\x05\x12\x00\x00\x17\xb4\x00\x00"
+    b"\x03\xd6\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x0f\x85\x00\x00\x17\xb8\x00\x00\x03\xb0\x00\x00\x06\x5b\x00\x00\x04\x1b\x00\x00"
+    b"\x04\x68\x00\x00\x20\x29\x00\x00\x0f\x81\x00\x00\x0e\xb5\x00\x00\x83\xda\x00\x00\x10\xbc\x00\x00\x01\xdc\x00\x00\x0f\x85\x00\x00"
+    b"\x04\x68\x00\x00\x20\x29\x00\x00\x0d\xbd\x00\x00\x11\x81\x00\x00\x10\xb5\x00\x00\x18\xb8\x00\x00\x04\xdc\x00\x00\x24\xbc\x00\x00"
+    b"\x02\xdc\x00\x00\x81\xda\x00\x00\x11\x85\x00\x00\x17\xb8\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x37\xb5\x00\x00\x84\xd4\x00\x00"
+    b"\x38\xb5\x00\x00\x02\xd7\x00\x00\x19\x85\x00\x00\x37\x81\x00\x00\x39\xb5\x00\x00\x84\xd4\x00\x00\x3a\xb5\x00\x00\x02\xd7\x00\x00"
+    b"\x17\x85\x00\x00\x39\x81\x00\x00\x1c\xb0\x00\x00\x15\xd0\x00\x00\x2d\xad\x00\x00\x18\xb8\x00\x00\x04\xcf\x00\x00\x25\x81\x00\x00"
+    b"\x32\x85\x00\x00\x34\x85\x00\x00\x35\x85\x00\x00\x04\x68\x00\x00\x10\x29\x00\x00\x09\x81\x00\x00\x07\xb5\x00\x00\x81\x3e\x00\x00"
+    b"\x01\xdc\x00\x00\x82\xc0\x00\x00\x01\xd7\x00\x00\x09\x85\x00\x00\x0a\x81\x00\x00\x08\xb5\x00\x00\x1c\xd7\x00\x00\x0a\x85\x00\x00"
+    b"\x9a\xc0\x00\x00\x04\x68\x00\x00\x10\x29\x00\x00\x18\xb8\x00\x00\x02\x81\x00\x00\x00\xb5\x00\x00\x81\x3e\x00\x00\x01\xdc\x00\x00"
+    b"\x82\xc0\x00\x00\x01\xd7\x00\x00\x02\x85\x00\x00\x03\x81\x00\x00\x01\xb5\x00\x00\x01\xd7\x00\x00\x03\x85\x00\x00\x04\xad\x00\x00"
+    b"\x81\xd9\x00\x00\x06\x85\x00\x00\x05\xb1\x00\x00\x03\x0e\x00\x00\x81\xd9\x00\x00\x06\x81\x00\x00\x04\x68\x00\x00\x20\x29\x00\x00"
+    b"\x1e\xad\x00\x00\x81\xcc\x00\x00\x13\x81\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00\x95\xae\x00\x00\xa5\xb2\x00\x00\x84\x4d\x00\x00"
+    b"\xa3\xb2\x00\x00\xa4\xba\x00\x00\x04\x53\x00\x00\x97\x92\x00\x00\x04\x52\x00\x00\x84\x4d\x00\x00\x83\x4d\x00\x00\x05\x70\x00\x00"
+    b"\x20\x32\x00\x00\x33\xba\x00\x00\x86\x4d\x00\x00\x83\x4d\x00\x00\xa2\x8e\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x34\xb5\x00\x00"
+    b"\x33\xb1\x00\x00\x05\x4e\x00\x00\x83\x4d\x00\x00\x04\x78\x00\x00\x20\x3b\x00\x00\x15\xbf\x00\x00\x87\x4d\x00\x00\x83\x4d\x00\x00"
+    b"\x25\xbf\x00\x00\x87\x4d\x00\x00\x83\x4d\x00\x00\x23\xbf\x00\x00\x87\x4d\x00\x00\x83\x4d\x00\x00\x24\xbf\x00\x00\x87\x4d\x00\x00"
+    b"\x83\x4d\x00\x00\x06\x7c\x00\x00\xa0\x3f\x00\x00\x8c\x8f\x00\x00\x32\xb9\x00\x00\x04\x4e\x00\x00\x85\x4d\x00\x00\x83\x4d\x00\x00"
+    b"\x91\x8f\x00\x00\x06\x4f\x00\x00\x84\x4d\x00\x00\x83\x4d\x00\x00\x8d\x8f\x00\x00\x35\xad\x00\x00\x83\x4d\x00\x00\x86\x4d\x00\x00"
+    b"\x83\x4d\x00\x00\x8f\x8f\x00\x00\x85\x56\x00\x00\x31\xad\x00\x00\x86\x4d\x00\x00\x83\x59\x00\x00\x86\x5a\x00\x00\x06\x57\x00\x00"
+    b"\x04\x4e\x00\x00\x85\x4d\x00\x00\x83\x4d\x00\x00\x90\x8f\x00\x00\x84\x4e\x00\x00\x83\x4d\x00\x00\x8e\x8f\x00\x00\x04\x7c\x00\x00"
+    b"\xa0\x3f\x00\x00\x9f\xaf\x00\x00\xa0\xb3\x00\x00\x83\x4d\x00\x00\x04\x52\x00\x00\x84\x4d\x00\x00\xa1\x8f\x00\x00\x03\x7c\x00\x00"
+    b"\x82\x3f\x00\x00\x81\xff\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x04\xb6\x00\x00\x08\x95\x00\x00"
+    b"\x05\xb6\x00\x00\x09\x95\x00\x00\x06\xb6\x00\x00\x0a\x95\x00\x00\x07\xb6\x00\x00\x0b\x95\x00\x00\x14\xb6\x00\x00\x2b\x94\x00\x00"
+    b"\x07\xad\x00\x00\x0f\xb1\x00\x00\x03\x0e\x00\x00\x0d\xb1\x00\x00\x03\x0e\x00\x00\x11\xb1\x00\x00\x03\x0e\x00\x00\x03\xb1\x00\x00"
+    b"\x03\x0e\x00\x00\x0b\xb1\x00\x00\x03\x0e\x00\x00\x09\xb1\x00\x00\x80\x35\x00\x00\x03\x0e\x00\x00\x3d\x8d\x00\x00\x3c\x85\x00\x00"
+    b"\x3c\x81\x00\x00\x06\xad\x00\x00\x0e\xb1\x00\x00\x03\x0e\x00\x00\x0c\xb1\x00\x00\x03\x0e\x00\x00\x10\xb1\x00\x00\x03\x0e\x00\x00"
+    b"\x02\xb1\x00\x00\x03\x0e\x00\x00\x0a\xb1\x00\x00\x03\x0e\x00\x00\x3e\xb1\x00\x00\x03\x1a\x00\x00\x3d\x95\x00\x00\x3c\x85\x00\x00"
+    b"\x3c\x81\x00\x00\x00\x20\x00\x00\x00\x20\x00\x00\x00\x20\x00\x00\x3e\xb5\x00\x00\x85\x0d\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00"
+    b"\x18\xb6\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x16\x00\x00\x2b\xb0\x00\x00\x14\x90\x00\x00\x2a\xad\x00\x00\x15\x8c\x00\x00"
+    b"\x16\xac\x00\x00\x01\xcc\x00\x00\x2a\xb1\x00\x00\x06\x0e\x00\x00\x08\xb1\x00\x00\x03\x0e\x00\x00\x07\xb9\x00\x00\x0f\xb1\x00\x00"
+    b"\x06\x1a\x00\x00\x0d\xb1\x00\x00\x06\x1a\x00\x00\x11\xb1\x00\x00\x06\x1a\x00\x00\x01\xb1\x00\x00\x06\x1a\x00\x00\x3d\x99\x00\x00"
+    b"\x3c\x85\x00\x00\x3c\x81\x00\x00\x06\xb9\x00\x00\x0e\xb1\x00\x00\x06\x1a\x00\x00\x0c\xb1\x00\x00\x06\x1a\x00\x00\x10\xb1\x00\x00"
+    b"\x06\x1a\x00\x00\x00\xb1\x00\x00\x06\x1a\x00\x00\x3e\xb1\x00\x00\x06\x1a\x00\x00\x2c\xb1\x00\x00\x06\x1a\x00\x00\x14\x8c\x00\x00"
+    b"\x15\x98\x00\x00\x16\xb0\x00\x00\x01\xd0\x00\x00\x06\x0c\x00\x00\x02\x78\x00\x00\x20\x3b\x00\x00\x0d\xb3\x00\x00\x84\x0d\x00\x00"
+    b"\x14\x94\x00\x00\x15\x8c\x00\x00\x16\xb8\x00\x00\x01\xd8\x00\x00\x82\xc0\x00\x00\x80\x2e\x00\x00\x80\xc0\x00\x00\x1f\x8d\x00\x00"
+    b"\x20\x95\x00\x00\x80\xff\x00\x00\x05\x68\x00\x00\x20\x29\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x02\xb6\x00\x00\x14\x94\x00\x00"
+    b"\x06\xb6\x00\x00\x15\x94\x00\x00\x16\xb4\x00\x00\x8b\xd4\x00\x00\x00\xb6\x00\x00\x08\x95\x00\x00\x01\xb6\x00\x00\x09\x95\x00\x00"
+    b"\x02\xb6\x00\x00\x0a\x95\x00\x00\x03\xb6\x00\x00\x0b\x95\x00\x00\x12\xb6\x00\x00\x2b\x94\x00\x00\x0a\xc4\x00\x00\x04\xb6\x00\x00"
+    b"\x08\x95\x00\x00\x05\xb6\x00\x00\x09\x95\x00\x00\x06\xb6\x00\x00\x0a\x95\x00\x00\x07\xb6\x00\x00\x0b\x95\x00\x00\x14\xb6\x00\x00"
+    b"\x2b\x94\x00\x00\x03\xad\x00\x00\x0b\xb1\x00\x00\x03\x0e\x00\x00\x09\xb1\x00\x00\x03\x0e\x00\x00\x3d\x8d\x00\x00\x3c\x85\x00\x00"
+    b"\x3c\x81\x00\x00\x02\xad\x00\x00\x0a\xb1\x00\x00\x03\x0e\x00\x00\x08\xb1\x00\x00\x03\x0e\x00\x00\x3e\xb1\x00\x00\x03\x0e\x00\x00"
+    b"\x2b\xb0\x00\x00\x14\x90\x00\x00\x2a\xb5\x00\x00\x15\x94\x00\x00\x16\xb4\x00\x00\x01\xd4\x00\x00\x2a\xb1\x00\x00\x03\x0e\x00\x00"
+    b"\x00\xb1\x00\x00\x2c\xb5\x00\x00\x05\x12\x00\x00\x14\x8c\x00\x00\x15\x90\x00\x00\x16\xb4\x00\x00\x01\xd4\x00\x00\x04\x0c\x00\x00"
+    b"\x02\x78\x00\x00\x20\x3b\x00\x00\x0d\xb3\x00\x00\x84\x0d\x00\x00\x1f\x8d\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x02\xb6\x00\x00"
+    b"\x0a\x95\x00\x00\x03\xb6\x00\x00\x0b\x95\x00\x00\x19\xb6\x00\x00\x36\x95\x00\x00\x20\x78\x00\x00\x3b\x3b\x00\x00\x00\xfb\x00\x00"
+    b"\x21\x95\x00\x00\x06\x70\x00\x00\x20\x32\x00\x00\x06\xb6\x00\x00\x0a\x95\x00\x00\x07\xb6\x00\x00\x0b\x95\x00\x00\x18\xb6\x00\x00"
+    b"\x36\x95\x00\x00\x20\x78\x00\x00\x3b\x3b\x00\x00\x00\xfb\x00\x00\x20\x95\x00\x00\x21\xb1\x00\x00\x14\x94\x00\x00\x15\x90\x00\x00"
+    b"\x16\xb8\x00\x00\x1f\xad\x00\x00\x12\xd8\x00\x00\x00\x16\x00\x00\x10\xc4\x00\x00\x03\xad\x00\x00\x0b\xb1\x00\x00\x03\x0e\x00\x00"
+    b"\x3d\x8d\x00\x00\x3c\x85\x00\x00\x3c\x81\x00\x00\x02\xad\x00\x00\x0a\xb1\x00\x00\x03\x0e\x00\x00\x3e\xb1\x00\x00\x03\x0e\x00\x00"
+    b"\x36\xb5\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x16\x00\x00\x00\xfb\x00\x00\x14\x94\x00\x00\x15\x8c\x00\x00\x16\xb8\x00\x00"
+    b"\x01\xd8\x00\x00\x82\xc0\x00\x00\x80\x2e\x00\x00\x80\xc0\x00\x00\x1f\x8d\x00\x00\x80\xff\x00\x00\x01\x68\x00\x00\x00\x29\x00\x00"
+    b"\x11\xad\x00\x00\x12\x8d\x00\x00\x09\xad\x00\x00\x13\xb5\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x0e\x00\x00\x01\x24\x00\x00"
+    b"\x0a\x8d\x00\x00\x01\xad\x00\x00\x16\xb5\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x0e\x00\x00\x02\x8d\x00\x00\x0b\xad\x00\x00"
+    b"\x13\xb5\x00\x00\x83\x0e\x00\x00\x14\xb5\x00\x00\x83\x0e\x00\x00\x0c\x8d\x00\x00\x03\xad\x00\x00\x16\xb5\x00\x00\x83\x0e\x00\x00"
+    b"\x17\xb5\x00\x00\x83\x0e\x00\x00\x04\x8d\x00\x00\x80\xff\x00\x00\x01\x68\x00\x00\x20\x29\x00\x00\x37\xad\x00\x00\x01\x10\x00\x00"
+    b"\x81\xcc\x00\x00\x00\x10\x00\x00\x04\x11\x00\x00\x01\xae\x00\x00\x07\xcc\x00\x00\x3e\xad\x00\x00\x3f\x8d\x00\x00\x3c\xad\x00\x00"
+    b"\x3d\x8d\x00\x00\x1b\xac\x00\x00\x08\xcc\x00\x00\x80\xff\x00\x00\x3e\xad\x00\x00\x3d\x8d\x00\x00\x3c\xad\x00\x00\x3f\x8d\x00\x00"
+    b"\x1b\xac\x00\x00\x01\xcc\x00\x00\x80\xff\x00\x00\x37\xad\x00\x00\x03\x11\x00\x00\x83\x4d\x00\x00\x37\x8d\x00\x00\x00\xad\x00\x00"
+    b"\x01\x8e\x00\x00\x09\xcc\x00\x00\x27\xad\x00\x00\x28\x8e\x00\x00\x2a\xad\x00\x00\x2b\x8e\x00\x00\x15\xad\x00\x00\x16\x8e\x00\x00"
+    b"\x18\xad\x00\x00\x19\x8e\x00\x00\x88\xc0\x00\x00\x27\xad\x00\x00\x2b\x8e\x00\x00\x2a\xad\x00\x00\x28\x8e\x00\x00\x15\xad\x00\x00"
+    b"\x19\x8e\x00\x00\x18\xad\x00\x00\x16\x8e\x00\x00\x09\xad\x00\x00\x0a\x8e\x00\x00\x0c\xad\x00\x00\x0d\x8e\x00\x00\x0f\xad\x00\x00"
+    b"\x10\x8e\x00\x00\x12\xad\x00\x00\x13\x8e\x00\x00\x21\xad\x00\x00\x22\x8e\x00\x00\x24\xad\x00\x00\x25\x8e\x00\x00\x1b\xad\x00\x00"
+    b"\x2d\xb5\x00\x00\x2e\x96\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x0e\x00\x00\x1c\x8e\x00\x00\x03\xad\x00\x00\x31\xb5\x00\x00"
+    b"\x32\x96\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x83\x0e\x00\x00\x04\x8e\x00\x00\x1e\xad\x00\x00\x2d\xb5\x00\x00\x83\x0e\x00\x00"
+    b"\x30\xb5\x00\x00\x83\x0e\x00\x00\x1f\x8e\x00\x00\x06\xad\x00\x00\x31\xb5\x00\x00\x83\x0e\x00\x00\x34\xb5\x00\x00\x83\x0e\x00\x00"
+    b"\x07\x8e\x00\x00\x24\x74\x00\x00\xa4\x36\x00\x00\x80\xf6\x00\x00\x01\x68\x00\x00\x20\x29\x00\x00\x37\xad\x00\x00\x03\x11\x00\x00"
+    b"\x3a\xb5\x00\x00\x39\x95\x00\x00\x3a\x81\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00\x94\x82\x00\x00\x1b\xb4\x00\x00\xf1\xd4\x00\x00"
+    b"\x1c\xb4\x00\x00\xef\xd4\x00\x00\x01\xb6\x00\x00\x15\xad\x00\x00\x02\xd4\x00\x00\x19\xb6\x00\x00\x81\xc0\x00\x00\x16\xb6\x00\x00"
+    b"\x14\x8c\x00\x00\x15\x94\x00\x00\x16\xb4\x00\x00\x65\xd4\x00\x00\x01\xb6\x00\x00\x18\xad\x00\x00\x02\xd4\x00\x00\x16\xb6\x00\x00"
+    b"\x81\xc0\x00\x00\x19\xb6\x00\x00\x14\x8c\x00\x00\x15\x94\x00\x00\x16\xb4\x00\x00\xdb\xd4\x00\x00\x01\xae\x00\x00\x08\xcc\x00\x00"
+    b"\x00\xad\x00\x00\x03\xcc\x00\x00\x15\xad\x00\x00\x16\xb6\x00\x00\x8b\xc0\x00\x00\x18\xad\x00\x00\x16\xb6\x00\x00\x88\xc0\x00\x00"
+    b"\x00\xad\x00\x00\x03\xcc\x00\x00\x16\xae\x00\x00\x15\xb5\x00\x00\x83\xc0\x00\x00\x16\xae\x00\x00\x18\xb5\x00\x00\x80\xc0\x00\x00"
+    b"\x14\x8c\x00\x00\x15\x94\x00\x00\x16\xb8\x00\x00\xc5\xd8\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x85\x0d\x00\x00\x03\xb4\x00\x00"
+    b"\x19\xb8\x00\x00\x06\x5b\x00\x00\x01\x3b\x00\x00\x05\x1b\x00\x00\x7e\x3b\x00\x00\x1a\xb4\x00\x00\x01\xd4\x00\x00\x88\xc0\x00\x00"
+    b"\x30\xb4\x00\x00\x14\x98\x00\x00\x15\x94\x00\x00\x16\xb0\x00\x00\x87\xd0\x00\x00\x85\x56\x00\x00\x81\x36\x00\x00\x05\x1b\x00\x00"
+    b"\x14\x8c\x00\x00\x15\x98\x00\x00\x16\xb4\x00\x00\x8a\xd4\x00\x00\x3a\xb5\x00\x00\x81\x36\x00\x00\x3a\x95\x00\x00\x38\xb5\x00\x00"
+    b"\x02\xd4\x00\x00\x39\x85\x00\x00\x83\xc0\x00\x00\x04\x74\x00\x00\xa0\x36\x00\x00\x94\x86\x00\x00\x80\xff\x00\x00\x00\x20\x00\x00"
+    b"\x00\x20\x00\x00\x00\x20\x00\x00\x18\xb8\x00\x00\x10\xad\x00\x00\x02\x30\x00\x00\x84\x4d\x00\x00\x83\x4d\x00\x00\x17\xce\x00\x00"
+    b"\x92\xae\x00\x00\x07\xcf\x00\x00\x00\x30\x00\x00\x11\x85\x00\x00\x13\x85\x00\x00\x12\x85\x00\x00\x15\x85\x00\x00\x17\x85\x00\x00"
+    b"\x80\xff\x00\x00\x81\x2d\x00\x00\x05\xcf\x00\x00\x00\x30\x00\x00\x13\x85\x00\x00\x15\x85\x00\x00\x17\x85\x00\x00\x80\xff\x00\x00"
+    b"\x81\x2d\x00\x00\x05\xcf\x00\x00\x00\x30\x00\x00\x13\x85\x00\x00\x15\x85\x00\x00\x17\x85\x00\x00\x80\xff\x00\x00\x03\xb1\x00\x00"
+    b"\x10\xad\x00\x00\x81\x4d\x00\x00\x83\x4d\x00\x00\x9f\xcc\x00\x00\x92\xae\x00\x00\x83\x2d\x00\x00\x0d\xcf\x00\x00\x1f\x70\x00\x00"
+    b"\x2f\x32\x00\x00\x80\xa6\x00\x00\x02\xc4\x00\x00\x1f\x70\x00\x00\x2d\x32\x00\x00\x01\x24\x00\x00\x11\x85\x00\x00\x13\x85\x00\x00"
+    b"\x14\x85\x00\x00\x15\x85\x00\x00\x16\x85\x00\x00\x80\xff\x00\x00\x81\x2d\x00\x00\x0d\xcf\x00\x00\x1f\x70\x00\x00\x2d\x32\x00\x00"
+    b"\x80\xa6\x00\x00\x02\xc4\x00\x00\x1f\x70\x00\x00\x2f\x32\x00\x00\x01\x24\x00\x00\x11\x85\x00\x00\x13\x85\x00\x00\x14\x85\x00\x00"
+    b"\x15\x85\x00\x00\x16\x85\x00\x00\x80\xff\x00\x00\x80\xff\x00\x00\x00\x6c\x00\x00\x80\x2d\x00\x00\x02\x8d\x00\x00\x05\x81\x00\x00"
+    b"\x06\x81\x00\x00\x9c\xba\x00\x00\x9d\x9a\x00\x00\x03\xb1\x00\x00\x07\xad\x00\x00\x83\xcc\x00\x00\x24\x78\x00\x00\x28\x3b\x00\x00"
+    b"\x00\xfb\x00\x00\x80\xff\x00\x00\x07\xad\x00\x00\xf0\xcc\x00\x00\x02\xad\x00\x00\x22\xcc\x00\x00\x8a\xae\x00\x00\x6c\xcf\x00\x00"
+    b"\x80\xae\x00\x00\x85\x0d\x00\x00\x8f\xb1\x00\x00\x93\xae\x00\x00\x0a\xcc\x00\x00\x01\x24\x00\x00\x93\xae\x00\x00\x83\x4d\x00\x00"
+    b"\x08\x8d\x00\x00\x02\x85\x00\x00\x05\x85\x00\x00\x0e\x85\x00\x00\x06\x81\x00\x00\x01\x34\x00\x00\x80\xff\x00\x00\x80\xba\x00\x00"
+    b"\x8d\xa6\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00\x81\x24\x00\x00\x01\x12\x00\x00\xff\x2d\x00\x00\x01\xcc\x00\x00\xed\xc0\x00\x00"
+    b"\x8e\xa6\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00\x81\x24\x00\x00\x01\x12\x00\x00\xff\x2d\x00\x00\x71\xcc\x00\x00\xe5\xc0\x00\x00"
+    b"\x95\xcc\x00\x00\x8a\xae\x00\x00\x8c\xb2\x00\x00\x84\x0d\x00\x00\x03\xcf\x00\x00\x02\x2c\x00\x00\x02\x8d\x00\x00\x90\xc0\x00\x00"
+    b"\x08\xb9\x00\x00\x80\xb2\x00\x00\x8e\xae\x00\x00\x01\xd8\x00\x00\x8d\xae\x00\x00\x82\xd0\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00"
+    b"\x00\xb1\x00\x00\x03\x12\x00\x00\x06\x5b\x00\x00\x08\x99\x00\x00\x00\x74\x00\x00\x80\xff\x00\x00\x02\x30\x00\x00\x33\xce\x00\x00"
+    b"\x82\xae\x00\x00\x18\xcf\x00\x00\x80\xae\x00\x00\x85\x0d\x00\x00\x87\xb1\x00\x00\x11\xac\x00\x00\x03\x12\x00\x00\x96\xae\x00\x00"
+    b"\x12\xcc\x00\x00\x01\x24\x00\x00\x02\x68\x00\x00\x20\x29\x00\x00\x03\x2c\x00\x00\x02\x8d\x00\x00\x96\xae\x00\x00\x83\x4d\x00\x00"
+    b"\x08\x8d\x00\x00\x08\xad\x00\x00\x9b\xba\x00\x00\x81\xcc\x00\x00\x9c\xba\x00\x00\x9d\x9a\x00\x00\x05\x81\x00\x00\x06\x85\x00\x00"
+    b"\x00\x74\x00\x00\x80\xff\x00\x00\xa5\xc0\x00\x00\x80\xba\x00\x00\x85\xa6\x00\x00\x9b\xaa\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00"
+    b"\x81\x24\x00\x00\x01\x12\x00\x00\xff\x2d\x00\x00\x01\xcc\x00\x00\xe4\xc0\x00\x00\x7f\x29\x00\x00\x7a\xc8\x00\x00\x86\xa6\x00\x00"
+    b"\x9c\xaa\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00\x81\x24\x00\x00\x01\x12\x00\x00\xff\x2d\x00\x00\x01\xcc\x00\x00\xd9\xc0\x00\x00"
+    b"\x7f\x29\x00\x00\x7a\xc8\x00\x00\xe9\xc0\x00\x00\x84\xb2\x00\x00\x82\xae\x00\x00\x84\x0d\x00\x00\x12\xcf\x00\x00\x02\x81\x00\x00"
+    b"\x07\x81\x00\x00\x05\x74\x00\x00\xa0\x36\x00\x00\xaf\xae\x00\x00\x02\xcc\x00\x00\xb3\x86\x00\x00\x0f\x81\x00\x00\xb0\x8e\x00\x00"
+    b"\x05\x81\x00\x00\x06\x81\x00\x00\x03\xb1\x00\x00\x07\xad\x00\x00\x83\xcc\x00\x00\x24\x6c\x00\x00\xa8\x2d\x00\x00\x80\xed\x00\x00"
+    b"\x80\xff\x00\x00\x08\xb9\x00\x00\x80\xb2\x00\x00\x86\xae\x00\x00\x01\xd8\x00\x00\x85\xae\x00\x00\x82\xd0\x00\x00\x83\x4d\x00\x00"
+    b"\x81\x2d\x00\x00\x00\xb1\x00\x00\x03\x12\x00\x00\x9d\xae\x00\x00\x87\xcc\x00\x00\x06\x5b\x00\x00\x08\x99\x00\x00\x08\xb9\x00\x00"
+    b"\x9b\xae\x00\x00\x83\xd8\x00\x00\x9c\xae\x00\x00\x81\xc0\x00\x00\xff\x2d\x00\x00\x9d\x8e\x00\x00\x00\x74\x00\x00\x80\xff\x00\x00"
+    b"\x00\x20\x00\x00\x00\x6c\x00\x00\x80\x2d\x00\x00\x01\x8d\x00\x00\x03\x81\x00\x00\x04\x81\x00\x00\x93\xba\x00\x00\x0a\x99\x00\x00"
+    b"\x02\xb1\x00\x00\x00\x74\x00\x00\x80\xff\x00\x00\x0f\x81\x00\x00\x05\xad\x00\x00\xf3\xcc\x00\x00\x02\xd8\x00\x00\x0a\xac\x00\x00"
+    b"\x06\x8d\x00\x00\x06\xad\x00\x00\x83\x16\x00\x00\x01\xad\x00\x00\x1f\xcc\x00\x00\x9c\xae\x00\x00\x6a\xcf\x00\x00\xa8\xb2\x00\x00"
+    b"\xae\xae\x00\x00\x09\xcc\x00\x00\x01\x24\x00\x00\xae\xae\x00\x00\x83\x4d\x00\x00\x07\x8d\x00\x00\x01\x85\x00\x00\x03\x85\x00\x00"
+    b"\x04\x81\x00\x00\x80\x34\x00\x00\x80\xff\x00\x00\x81\xba\x00\x00\xa2\xa6\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00\x81\x24\x00\x00"
+    b"\x01\x12\x00\x00\xff\x2d\x00\x00\x01\xcc\x00\x00\xee\xc0\x00\x00\xa5\xa6\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00\x81\x24\x00\x00"
+    b"\x01\x12\x00\x00\xff\x2d\x00\x00\x71\xcc\x00\x00\xe6\xc0\x00\x00\x95\xcc\x00\x00\x9c\xae\x00\x00\x9f\xb2\x00\x00\x84\x0d\x00\x00"
+    b"\x03\xcf\x00\x00\x02\x2c\x00\x00\x01\x8d\x00\x00\x90\xc0\x00\x00\x07\xb9\x00\x00\x81\xb2\x00\x00\xa5\xae\x00\x00\x01\xd8\x00\x00"
+    b"\xa2\xae\x00\x00\x82\xd0\x00\x00\x83\x4d\x00\x00\x81\x2d\x00\x00\x00\xb1\x00\x00\x03\x12\x00\x00\x06\x5b\x00\x00\x07\x99\x00\x00"
+    b"\x00\x74\x00\x00\x80\xff\x00\x00\x02\x30\x00\x00\x32\xce\x00\x00\x84\xae\x00\x00\x14\xcf\x00\x00\x96\xb2\x00\x00\x11\xac\x00\x00"
+    b"\x03\x12\x00\x00\xb2\xae\x00\x00\x10\xcc\x00\x00\x01\x24\x00\x00\x03\x2c\x00\x00\x01\x8d\x00\x00\xb2\xae\x00\x00\x83\x4d\x00\x00"
+    b"\x07\x8d\x00\x00\x07\xad\x00\x00\x8d\xba\x00\x00\x81\xcc\x00\x00\x93\xba\x00\x00\x0a\x99\x00\x00\x03\x81\x00\x00\x04\x85\x00\x00"
+    b"\x00\x74\x00\x00\x80\xff\x00\x00\xa2\xc0\x00\x00\x81\xba\x00\x00\x8a\xa6\x00\x00\x38\x88\x00\x00\x8d\xaa\x00\x00\x02\xd8\x00\x00"
+    b"\x81\x44\x00\x00\x81\x24\x00\x00\x01\x12\x00\x00\xff\x2d\x00\x00\x02\xcc\x00\x00\x38\xa8\x00\x00\xe4\xc0\x00\x00\x7f\x29\x00\x00"
+    b"\x79\xc8\x00\x00\x90\xa6\x00\x00\x93\xaa\x00\x00\x02\xd8\x00\x00\x81\x44\x00\x00\x81\x24\x00\x00\x01\x12\x00\x00\xff\x2d\x00\x00"
+    b"\x02\xcc\x00\x00\x38\xa8\x00\x00\xd8\xc0\x00\x00\x7f\x29\x00\x00\x79\xc8\x00\x00\xe6\xc0\x00\x00\x87\xb2\x00\x00\x84\xae\x00\x00"
+    b"\x84\x0d\x00\x00\x08\xcf\x00\x00\x01\x81\x00\x00\x05\x81\x00\x00\x0f\x85\x00\x00\x03\x81\x00\x00\x04\x81\x00\x00\x02\xb1\x00\x00"
+    b"\x00\x74\x00\x00\x80\xff\x00\x00\x07\xb9\x00\x00\x81\xb2\x00\x00\x90\xae\x00\x00\x01\xd8\x00\x00\x8a\xae\x00\x00\x82\xd0\x00\x00"
+    b"\x83\x4d\x00\x00\x81\x2d\x00\x00\x00\xb1\x00\x00\x03\x12\x00\x00\x0a\xad\x00\x00\x87\xcc\x00\x00\x06\x5b\x00\x00\x07\x99\x00\x00"
+    b"\x07\xb9\x00\x00\x8d\xae\x00\x00\x83\xd8\x00\x00\x93\xae\x00\x00\x81\xc0\x00\x00\xff\x2d\x00\x00\x0a\x8d\x00\x00\x00\x74\x00\x00"
+    b"\x80\xff\x00\x00"
+)
+
+RD_RAM_SEQ_1_CONTENT = (
+    b"\xdf\x99\x00\x00\x45\x03\xd2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x02\x01\x00\x00\x80\x01\x00\x00\x00\x02\x00\x00"
+    b"\x80\x02\x00\x00\x01\x03\x00\x00\x80\x03\x00\x00\x00\x04\x00\x00\x82\x04\x00\x00\x00\x04\x00\x00\x00\x05\x00\x00\x82\x05\x00\x00"
+    b"\x0a\x05\x00\x00\x00\x06\x00\x00\x82\x06\x00\x00\x0b\x06\x00\x00\x04\x07\x00\x00\x82\x07\x00\x00\x02\x08\x00\x00\x82\x08\x00\x00"
+    b"\x04\x09\x00\x00\x82\x09\x00\x00\x8a\x08\x00\x00\x00\x0a\x00\x00\x82\x0a\x00\x00\x00\x0a\x00\x00\x80\x08\x00\x00\x02\x0b\x00\x00"
+    b"\x80\x08\x00\x00\x80\x08\x20\x00\x81\x08\x00\x00\x8a\x0b\x00\x00\x00\x0c\x00\x00\x82\x0c\x00\x00\x0b\x0c\x00\x00\x02\x0d\x00\x00"
+    b"\x00\x0c\x00\x00\x80\x0d\x00\x00\x02\x0e\x00\x00\xa7\x0d\x00\x00\xab\x0e\x00\x00\x02\x0f\x00\x00\x89\x0f\x00\x00\x02\x10\x00\x00"
+    b"\x82\x10\x00\x00\x02\x10\x00\x00\x82\x10\x00\x00\x02\x10\x00\x00\x82\x10\x00\x00\x01\x10\x00\x00\xaa\x0f\x00\x00\x02\x11\x00\x00"
+    b"\x80\x11\x00\x00\x81\x11\x11\x00\x01\x11\x11\x00\x03\x11\x10\x00\x03\x11\x0f\x00\x03\x11\x0e\x00\x03\x11\x0d\x00\x27\x11\x0c\x00"
+    b"\x00\x12\x0c\x00\x80\x12\x0c\x00\x00\x13\x0c\x00\x80\x13\x0c\x00\x00\x14\x0c\x00\x80\x14\x0c\x00\x00\x15\x0c\x00\x80\x15\x0c\x00"
+    b"\x00\x16\x0c\x00\x82\x16\x0c\x00\x01\x16\x0c\x00\x00\x17\x0c\x00\x81\x17\x0c\x00\x00\x18\x0c\x00\x80\x18\x0c\x00\x00\x19\x0c\x00"
+    b"\x81\x19\x0c\x00\x1d\x1a\x0c\x00\x80\x1a\x0c\x00\x02\x1b\x0c\x00\x8a\x1a\x0c\x00\x80\x1b\x0c\x00\x02\x1c\x0c\x00\x8c\x1c\x0c\x00"
+    b"\x09\x1d\x0c\x00\x88\x1d\x0c\x00\x05\x1e\x0c\x00\x82\x1e\x0c\x00\x05\x1f\x0c\x00\x89\x1f\x0c\x00\x08\x20\x0c\x00\xb5\x20\x0c\x00"
+    b"\x02\x21\x0c\x00\x9f\x21\x0c\x00\x02\x22\x0c\x00\x82\x22\x0c\x00\x02\x22\x0c\x00\x02\x23\x0c\x00\x03\x22\x0c\x00\x04\x22\x04\x00"
+    b"\x82\x23\x04\x00\x03\x22\x04\x00\x04\x22\x05\x00\x82\x23\x05\x00\x03\x22\x05\x00\x04\x22\x06\x00\x02\x24\x06\x00\x03\x22\x06\x00"
+    b"\x04\x22\x07\x00\x02\x24\x07\x00\x03\x22\x07\x00\x04\x22\x08\x00\x82\x24\x08\x00\x03\x22\x08\x00\x04\x22\x09\x00\x82\x24\x09\x00"
+    b"\x03\x22\x09\x00\x04\x22\x0a\x00\x02\x24\x0a\x00\x03\x22\x0a\x00\x04\x22\x0b\x00\x82\x24\x0b\x00\x39\x22\x0b\x00\x21\x25\x0b\x00"
+    b"\x80\x25\x0b\x00\x01\x26\x0b\x00\x80\x26\x0b\x00\x01\x27\x0b\x00\x80\x27\x0b\x00\x00\x26\x0b\x00\x00\x28\x0b\x00\x82\x28\x0b\x00"
+    b"\x00\x28\x0b\x00\x00\x29\x0b\x00\x80\x29\x0b\x00\x01\x2a\x0b\x00\x80\x2a\x0b\x00\x01\x29\x0b\x00\x02\x2b\x0b\x00\x83\x2b\x0b\x00"
+    b"\x84\x2b\x02\x00\x02\x2c\x02\x00\x83\x2b\x02\x00\x82\x2c\x03\x00\x81\x2b\x03\x00\x01\x2d\x03\x00\x80\x2d\x03\x00\x01\x2e\x03\x00"
+    b"\x82\x2e\x03\x00\x01\x2f\x03\x00\x84\x2f\x03\x00\x00\x00\x83\x01"
+)
+
+GT_RAM_PAT_CONTENT = (
+    b"\xec\x88\x4b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x80\x00\x88\x08\x00\x00\x00"
+    b"\x00\x80\x00\x08\x00\x00\x00\x00\x20\x80\x00\x08\x00\x00\x00\x00\x04\x80\x00\x08\x00\x00\x00\x00\x04\x82\x00\x08\x00\x00\x00\x00"
+    b"\x40\x80\x00\x08\x00\x00\x00\x00\x00\x84\x00\x08\x00\x00\x00\x00\x00\x80\x01\x08\x00\x00\x00\x00\x08\x80\x03\x08\x00\x00\x00\x00"
+    b"\x00\x80\x03\x08\x00\x00\x00\x00\x04\x80\x03\x08\x00\x00\x00\x00\x14\x80\x03\x08\x00\x00\x00\x00\x04\x82\x03\x08\x00\x00\x00\x00"
+    b"\x04\x80\x03\x08\x04\x00\x00\x00\x00\x80\x03\x48\x00\x00\x00\x00\x01\x80\x03\x08\x00\x00\x00\x00\x10\x80\x03\x08\x00\x00\x00\x00"
+    b"\x00\x80\x03\x08\x02\x00\x00\x00\x01\x80\x03\x08\x02\x00\x00\x00\x01\x84\x03\x08\x02\x00\x00\x00\x01\x80\x03\x08\x0a\x00\x00\x00"
+    b"\x21\x80\x03\x08\x02\x00\x00\x00\x05\x80\x03\x08\x02\x00\x00\x00\x45\x80\x03\x08\x02\x00\x00\x00\x05\x82\x03\x0c\x02\x00\x00\x00"
+    b"\x05\x80\x03\x0c\x02\x00\x00\x00\x05\x80\x03\x0c\x06\x00\x00\x00\x05\x80\x03\x0c\x00\x00\x00\x00\x01\x80\x03\x0c\x00\x00\x00\x00"
+    b"\x01\x80\x03\x1c\x00\x00\x00\x00\x00\x80\x03\x0c\x00\x00\x00\x00\x20\x80\x03\x0c\x00\x00\x00\x00\x40\x80\x03\x0c\x00\x00\x00\x00"
+    b"\x00\x80\x00\x2c\x00\x00\x00\x00\x00\x80\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x08\x01\x00\x00\x00\x08\x80\x02\x08\x00\x00\x00\x00"
+    b"\x00\x80\x02\x08\x00\x00\x00\x00\x10\x80\x02\x08\x00\x00\x00\x00\x20\x80\x02\x08\x00\x00\x00\x00\x04\x80\x02\x08\x00\x00\x00\x00"
+    b"\x44\x80\x02\x08\x00\x00\x00\x00\x04\x82\x02\x08\x00\x00\x00\x00\x04\x80\x02\x08\x04\x00\x00\x00\x08\x80\x03\x0c\x00\x00\x00\x00"
+    b"\x10\x80\x03\x0c\x00\x00\x00\x00\x00\x80\x03\x2c\x00\x00\x00\x00\x00\x80\x00\x08\x08\x00\x00\x00\x20\x80\x03\x08\x00\x00\x00\x00"
+    b"\x44\x80\x03\x08\x00\x00\x00\x00\x04\x82\x03\x0c\x00\x00\x00\x00\x04\x80\x03\x0c\x00\x00\x00\x00\x04\x80\x03\x0c\x04\x00\x00\x00"
+    b"\x00\x80\x03\x4c\x00\x00\x00\x00\x02\x80\x00\x08\x08\x00\x00\x00\x02\x80\x00\x08\x00\x00\x00\x00\x02\x80\x01\x08\x00\x00\x00\x00"
+    b"\x0a\x80\x03\x08\x00\x00\x00\x00\x02\x80\x03\x08\x00\x00\x00\x00\x06\x80\x03\x08\x00\x00\x00\x00\x16\x80\x03\x08\x00\x00\x00\x00"
+    b"\x06\x82\x03\x0c\x00\x00\x00\x00\x06\x80\x03\x0c\x00\x00\x00\x00\x06\x80\x03\x0c\x04\x00\x00\x00\x02\x80\x03\x4c\x00\x00\x00\x00"
+    b"\x02\x80\x03\x0c\x00\x00\x00\x00\x03\x80\x03\x1c\x00\x00\x00\x00\x03\x80\x03\x0c\x00\x00\x00\x00\x0a\x80\x03\x0c\x00\x00\x00\x00"
+    b"\x12\x80\x03\x0c\x00\x00\x00\x00\x02\x80\x00\x2c\x00\x00\x00\x00\x02\x80\x00\x0c\x00\x00\x00\x00\x02\x84\x00\x08\x00\x00\x00\x00"
+)
+
+GT_RAM_SEQ_1_CONTENT = (
+    b"\x42\x00\x00\x00\x29\x00\x00\x00\x00\xc2\x00\x00\x01\x13\x00\x00\x00\x2f\x00\x00\x00\x0c\x00\x00\x00\xdc\x00\x00\x02\x03\x00\x00"
+    b"\x20\x00\x00\x00\x00\x00\x00\x00\x02\x10\x00\x00\x02\x20\x00\x00\xd2\x31\x00\x00\x02\x40\x00\x00\x73\x31\x00\x00\xd5\x51\x00\x00"
+    b"\x02\x60\x00\x00\xd2\x51\x00\x00\xa9\x33\x00\x00\x02\x70\x00\x00\xb8\x30\x00\x00\x02\x80\x00\x00\xa3\x31\x00\x00\x2e\x90\x00\x00"
+    b"\x02\xa0\x00\x00\xc0\xb4\x00\x00\xbb\xc0\x00\x00\x02\xd0\x00\x00\x16\xc1\x00\x00\x02\xe0\x00\x00\xb8\xc0\x00\x00\x02\xf0\x00\x00"
+    b"\x16\xc1\x00\x00\xa9\xb3\x00\x00\x02\x00\x01\x00\x74\xb1\x00\x00\x02\xa0\x00\x00\x05\xb4\x00\x00\x4c\x13\x01\x00\xbb\xb0\x00\x00"
+    b"\x02\x20\x01\x00\x89\xb0\x00\x00\x19\x31\x01\x00\xbb\x40\x01\x00\x02\x50\x01\x00\x16\x41\x01\x00\x02\x60\x01\x00\xd2\x41\x01\x00"
+    b"\x02\x70\x01\x00\xc0\x44\x01\x00\xbb\x80\x01\x00\x02\x90\x01\x00\x16\x81\x01\x00\x02\xa0\x01\x00\xb8\xb0\x01\x00\x02\xc0\x01\x00"
+    b"\xb9\xb0\x01\x00\x5c\xd0\x01\x00\xd6\xe1\x01\x00\x48\xf1\x01\x00\x19\xe1\x01\x00\x19\x01\x02\x00\x02\x10\x02\x00\x05\x04\x02\x00"
+    b"\x4c\xe3\x01\x00\xbb\x00\x02\x00\x02\x20\x02\x00\x89\x00\x02\x00\x02\x30\x02\x00\x16\x41\x02\x00\x02\x80\x00\x00\x06\x30\x00\x00"
+    b"\x02\x50\x02\x00\x06\x10\x00\x00\x00\x00\x60\x00"
+)
+
+GT_RAM_SEQ_2_CONTENT = (
+    b"\x2d\x00\x00\x00\xbf\x00\x00\x00\x00\x4a\x00\x00\x03\x21\x00\x00\x00\x3f\x00\x00\x00\x1e\x00\x00\x00\xcb\x00\x00\x02\x03\x00\x00"
+    b"\x74\x00\x00\x00\x00\x00\x00\x00\x02\x10\x00\x00\x02\x20\x00\x00\xd2\x31\x00\x00\x02\x60\x02\x00\x7c\x75\x02\x00\x02\x80\x02\x00"
+    b"\x95\x76\x02\x00\x02\x90\x02\x00\xc0\x74\x02\x00\xbb\xa0\x02\x00\x02\xb0\x02\x00\x16\xa1\x02\x00\x02\xc0\x02\x00\xb8\xa0\x02\x00"
+    b"\x02\xd0\x02\x00\x16\xa1\x02\x00\xfe\x7f\x02\x00\xfe\x7f\x02\x00\xfe\x7f\x02\x00\xfe\x7f\x02\x00\x22\x73\x02\x00\x2e\xb0\x00\x00"
+    b"\x02\xe0\x02\x00\x05\x04\x02\x00\x4c\xe3\x01\x00\xbb\x00\x02\x00\x02\xf0\x02\x00\x89\x00\x02\x00\x48\xf1\x01\x00\x19\xe1\x01\x00"
+    b"\x19\x01\x02\x00\x02\x10\x02\x00\x05\x04\x02\x00\x4c\xe3\x01\x00\xbb\x00\x02\x00\x02\x20\x02\x00\x89\x00\x02\x00\x02\x00\x03\x00"
+    b"\x16\x01\x02\x00\x02\x80\x00\x00\x06\x30\x00\x00\x02\x50\x02\x00\x5a\x10\x00\x00\x00\x00\x60\x00"
+)
+
+GT_RAM_SEQ_3_CONTENT = (
+    b"\x1f\x00\x00\x00\x06\x00\x00\x00\x00\x1e\x00\x00\x02\x07\x00\x00\x00\xba\x00\x00\x03\x03\x00\x00\x00\x29\x00\x00\x02\x03\x00\x00"
+    b"\xdc\x00\x00\x00\x00\x00\x00\x00\x02\x10\x00\x00\x02\x10\x03\x00\xa3\x31\x00\x00\x2e\x90\x00\x00\x02\x20\x03\x00\xc0\xb4\x00\x00"
+    b"\xbb\xc0\x00\x00\x02\x30\x03\x00\x16\xc1\x00\x00\x02\x40\x03\x00\xb8\x50\x03\x00\x02\x60\x03\x00\x16\x51\x03\x00\x02\x70\x03\x00"
+    b"\x74\x01\x02\x00\x48\xf1\x01\x00\x19\xe1\x01\x00\x19\x01\x02\x00\x02\x10\x02\x00\x05\x04\x02\x00\x4c\xe3\x01\x00\xbb\x00\x02\x00"
+    b"\x02\x20\x02\x00\x45\x01\x02\x00\x02\x30\x02\x00\x16\x41\x02\x00\x02\x80\x00\x00\x06\x30\x00\x00\x09\x10\x00\x00\x00\x00\x60\x00"
+)
+
+GT_RAM_SEQ_4_CONTENT = (
+    b"\x20\x00\x00\x00\xc7\x00\x00\x00\x00\x86\x00\x00\x02\x07\x00\x00\x00\xba\x00\x00\x03\x03\x00\x00\x00\x29\x00\x00\x02\x03\x00\x00"
+    b"\xdc\x00\x00\x00\x00\x00\x00\x00\x02\x10\x00\x00\x02\x80\x03\x00\xa3\x91\x03\x00\x2e\xa0\x03\x00\x02\xb0\x03\x00\xc0\xc4\x03\x00"
+    b"\xbb\xd0\x03\x00\x02\xe0\x03\x00\x16\xd1\x03\x00\x02\xf0\x03\x00\xb8\x00\x04\x00\x02\x10\x04\x00\x16\x01\x04\x00\x02\x20\x04\x00"
+    b"\x74\x31\x04\x00\x48\x41\x04\x00\x19\x51\x04\x00\x19\x31\x04\x00\x02\x60\x04\x00\x05\x34\x04\x00\x4c\x53\x04\x00\xbb\x30\x04\x00"
+    b"\x02\x70\x04\x00\x45\x31\x04\x00\x02\x80\x04\x00\x16\x91\x04\x00\x02\xa0\x04\x00\x06\x90\x03\x00\x02\x50\x02\x00\x06\x10\x00\x00"
+    b"\x00\x00\x60\x00"
+)
+
+RD_RAM_PAT_CONTENT = (
+    b"\x27\x83\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x02\x80\x00\x00\x00\xd0\x06\x00\x04\x00\x00\x00\x00\x00\x00"
+    b"\x86\x02\x80\xc0\x01\x00\xd0\x06\x00\x04\x00\x00\x00\x00\x00\x00\xb6\x02\x81\xc0\x01\x00\xd0\x06\x00\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb6\x00\x80\xc0\x01\x00\xd0\x06\x00\x04\x00\x01\x00\x00\x00\x00\xb6\x00\x80\x20\x00\x00\xd0\x06\x00\x04\x00\x01\x00\x00\x00\x00"
+    b"\xf6\x00\x84\x20\x00\x00\xd0\x06\x00\x04\x00\x01\x00\x00\x00\x00\xf6\x00\x84\x20\x00\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00"
+    b"\xf6\x00\x80\x20\x00\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00\xf6\x00\x80\x80\x00\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00"
+    b"\xf6\x00\xa0\x80\x00\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00\xf6\x00\x80\x40\x00\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00"
+    b"\xf6\x14\x80\x40\x00\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00\xf6\x00\x80\x80\x01\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00"
+    b"\xf6\x40\x80\x80\x01\x00\xd0\x06\x02\x04\x00\x00\x00\x00\x00\x00\xf6\x00\x80\x80\x01\x00\xd0\x06\x00\x04\x00\x00\x00\x00\x00\x00"
+    b"\x76\x00\x80\x80\x01\x00\xd0\x06\x00\x04\x00\x00\x00\x00\x00\x00\x76\x00\x80\x80\x01\x00\xd0\x04\x00\x04\x00\x00\x00\x00\x00\x00"
+    b"\x76\x00\x80\x80\x01\x00\xd0\x04\x00\x00\x00\x00\x00\x00\x00\x00\x76\x00\xc0\x80\x01\x00\xd0\x04\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x76\x80\xc0\x80\x01\x00\xd0\x04\x00\x00\x00\x00\x00\x00\x00\x00\x76\x00\x80\xc0\x01\x00\xd0\x04\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x76\x28\x90\xc0\x01\x00\xd0\x04\x00\x00\x00\x00\x00\x00\x00\x00\x76\x00\x82\x80\x01\x00\xd0\x04\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x76\x00\x80\x80\x01\x00\xd8\x04\x00\x00\x00\x00\x00\x00\x00\x00\x76\x00\x80\x20\x00\x00\xd8\x04\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x76\x00\xa0\x20\x00\x00\xd8\x04\x00\x00\x00\x00\x00\x00\x00\x00\x76\x04\x80\x20\x00\x00\xd8\x04\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x76\x00\x80\x40\x00\x00\xd8\x04\x00\x00\x00\x00\x00\x00\x00\x00\x76\x00\xa0\x40\x00\x00\xd8\x04\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x76\x00\x80\x40\x60\x00\xd8\x04\x01\x00\x00\x00\x00\x00\x00\x00\x72\x00\x80\x40\x60\x00\xd8\x04\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\x70\x00\x80\x40\x60\x00\x98\x04\x01\x00\x00\x00\x00\x00\x00\x00\x70\x00\x80\x40\x60\x00\x98\x14\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\x70\x00\x80\x40\x60\x00\x98\x54\x01\x00\x00\x00\x00\x00\x00\x00\xf0\x01\x80\x40\x60\x00\x98\x04\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\xf0\x01\x80\x40\x60\x00\x98\x84\x01\x00\x00\x00\x00\x00\x00\x00\xf0\x01\x80\x40\x60\x00\x08\x14\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\xf0\x01\x80\x40\x60\x00\x08\x14\x01\x04\x00\x00\x00\x00\x00\x00\xf0\x01\x80\x20\x60\x00\x08\x14\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xf1\x09\x80\x20\x60\x00\x28\x54\x01\x04\x00\x00\x00\x00\x00\x00\x71\x09\x80\x20\x60\x00\x28\x54\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\x71\x09\x80\x20\x60\x00\x28\x55\x01\x04\x00\x00\x00\x00\x00\x00\x71\x01\x80\x20\x60\x00\x28\x15\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\x71\x01\x80\x20\x60\x00\x28\x17\x01\x04\x00\x00\x00\x00\x00\x00\x71\x00\x80\x20\x60\x00\x28\x17\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\x71\x00\x80\x20\x60\x00\x28\x57\x01\x04\x00\x00\x00\x00\x00\x00\x71\x00\x90\x20\x60\x00\x28\x17\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\x31\x00\x90\x20\x60\x00\x28\x57\x01\x04\x00\x00\x00\x00\x00\x00\x31\x00\x80\x20\x60\x00\x28\x57\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x40\x60\x00\x28\x17\x01\x04\x00\x00\x00\x00\x00\x00\x31\x40\x80\x40\x60\x00\x28\x17\x01\x04\xf0\x00\x00\x00\x00\x00"
+    b"\x31\x40\x80\x40\x60\x00\x28\x07\x01\x04\xf0\x00\x00\x00\x00\x00\x31\x00\x80\x40\x60\x00\x28\x07\x01\x04\xf0\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x60\x60\x00\x28\x07\x01\x04\xf0\x00\x00\x00\x00\x00\x31\x80\xa0\x60\x60\x00\x28\x07\x01\x04\xf0\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\xf0\x00\x00\x00\x00\x00\x31\x10\x80\x20\x60\x00\x28\x07\x01\x04\xff\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\xff\x00\x00\x00\x00\x00\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\xef\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\xcf\x00\x00\x00\x00\x00\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\x8f\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\x8e\x00\x00\x00\x00\x00\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\x0e\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\x0c\x00\x00\x00\x00\x00\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\x08\x00\x00\x00\x00\x00"
+    b"\x31\x00\x80\x20\x60\x00\x28\x07\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x00\x80\x20\x60\x00\x28\x07\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x00\x80\x20\x60\x00\x28\x07\x01\x00\x00\x00\x00\x00\x00\x00\xb1\x01\x80\x20\x60\x00\x28\x07\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x01\x80\x20\x60\x00\x28\x87\x01\x00\x00\x00\x00\x00\x00\x00\xb1\x01\x80\x3c\x60\x00\x28\x07\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x01\x80\x20\x64\x00\x28\x07\x01\x00\x00\x00\x00\x00\x00\x00\xb1\x01\x80\x20\x68\x00\x28\x07\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x01\x80\x20\x70\x00\x28\x07\x01\x00\x00\x00\x00\x00\x00\x00\xb1\x01\x80\x20\x60\x00\x20\x07\x01\x00\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x01\x80\x20\x60\x00\x20\x27\x01\x00\x00\x00\x00\x00\x00\x00\xb1\x01\x80\x20\x60\x00\x20\x27\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x01\x80\x20\x60\x00\x20\x67\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x01\x90\x20\x60\x00\x20\x67\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x01\x90\x20\x60\x00\x20\x27\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x00\x80\x20\x60\x00\x20\x27\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x04\x80\x20\x60\x00\x20\x67\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x00\x80\x01\x60\x00\x20\x27\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x00\x90\x01\x60\x00\x20\x27\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x00\x90\x01\x60\x00\x20\x67\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x00\x80\x01\x60\x00\x20\x67\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x00\x80\x03\x60\x00\x20\x07\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x00\x80\x01\x60\x00\x20\x07\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x00\x80\x01\x62\x00\x20\x07\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x08\x80\x01\x60\x00\x20\x07\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x20\x80\x01\x62\x00\x20\x06\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\xb1\x22\x80\x01\x62\x00\x20\x06\x01\x04\x00\x00\x00\x00\x00\x00\xb1\x02\x80\x01\x60\x00\x20\x06\x01\x04\x00\x00\x00\x00\x00\x00"
+    b"\x86\x02\x8a\x01\x00\x00\xc0\x06\x00\x04\x00\x00\x00\x00\x00\x00\x86\x02\x80\x01\x00\x00\xc0\x06\x00\x04\x00\x00\x00\x00\x00\x00"
+    b"\x86\x02\x80\x00\x00\x00\xc0\x06\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
@@ -1,31652 +1,285 @@
-"""
-SPDX-FileCopyrightText: Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
-SPDX-License-Identifier: Apache-2.0
-
-Licensed under the Apache License, Version 2.0 (the "License");
-you may not use this file except in compliance with the License.
-You may obtain a copy of the License at
-
-http://www.apache.org/licenses/LICENSE-2.0
-
-Unless required by applicable law or agreed to in writing, software
-distributed under the License is distributed on an "AS IS" BASIS,
-WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-See the License for the specific language governing permissions and
-limitations under the License.
-"""
-
-from collections import namedtuple
-from enum import Enum
-
-import hololink
-
-# values are on hex number system to be consistent with rest of the list
-VB1940_TABLE_WAIT_MS = "vb1940-table-wait-ms"
-VB1940_WAIT_MS = 0x0A
-VB1940_WAIT_MS_START = 0x64
-
-VB1940_PAGE_SIZE = 128
-
-REG_AG = 0x0CA1  # ctx1
-REG_EXP = 0x0CA2  # ctx1
-
-
-vb1940_start = [
-    (0x516, 0x01),  # start streaming
-    (VB1940_TABLE_WAIT_MS, VB1940_WAIT_MS_START),
-]
-
-vb1940_stop = [
-    (0x517, 0x01),  # stop streaming
-    (VB1940_TABLE_WAIT_MS, VB1940_WAIT_MS),
-]
-
-VB1940_CERTIFICATE_START_ADDR = 0x1AA8
-VB1940_CERTIFICATE = [
-    0x30,
-    0x81,
-    0xAA,
-    0x83,
-    0x01,
-    0x01,
-    0x94,
-    0x40,
-    0x79,
-    0xD1,
-    0xEE,
-    0x6C,
-    0xCC,
-    0x71,
-    0xBA,
-    0xF7,
-    0x6C,
-    0x1C,
-    0x33,
-    0x43,
-    0x26,
-    0xA4,
-    0x00,
-    0xE2,
-    0x79,
-    0xA1,
-    0x77,
-    0x39,
-    0x47,
-    0x42,
-    0x36,
-    0x84,
-    0x43,
-    0xB1,
-    0x29,
-    0x3E,
-    0x70,
-    0xD8,
-    0xE2,
-    0x5B,
-    0x18,
-    0x45,
-    0xD0,
-    0x9B,
-    0xAE,
-    0xE9,
-    0xF3,
-    0x2C,
-    0x13,
-    0xAA,
-    0x4A,
-    0xD5,
-    0xCB,
-    0xA5,
-    0x05,
-    0xB1,
-    0x9F,
-    0x77,
-    0xDB,
-    0x1D,
-    0x42,
-    0x72,
-    0xCA,
-    0x67,
-    0x7A,
-    0x0F,
-    0x51,
-    0x7F,
-    0xE0,
-    0xB0,
-    0xBD,
-    0xDA,
-    0x8A,
-    0x04,
-    0x53,
-    0x39,
-    0x34,
-    0x30,
-    0x8B,
-    0x10,
-    0xBD,
-    0x9E,
-    0xB0,
-    0x96,
-    0xC4,
-    0xC3,
-    0x75,
-    0x2F,
-    0x2F,
-    0x75,
-    0xDD,
-    0xAE,
-    0xC0,
-    0xB6,
-    0x79,
-    0xE6,
-    0x84,
-    0x01,
-    0xAD,
-    0x87,
-    0x20,
-    0x10,
-    0xAD,
-    0x09,
-    0xAF,
-    0x22,
-    0x1E,
-    0x43,
-    0x8A,
-    0x92,
-    0x7A,
-    0x25,
-    0xDF,
-    0x4C,
-    0x11,
-    0x1D,
-    0xF2,
-    0x23,
-    0x18,
-    0xD1,
-    0xF0,
-    0x8F,
-    0x9B,
-    0xC6,
-    0xD6,
-    0x6A,
-    0x4F,
-    0xB7,
-    0x47,
-    0xF8,
-    0x45,
-    0x3C,
-    0x0F,
-    0x85,
-    0x01,
-    0x00,
-    0x82,
-    0x01,
-    0xDB,
-    0x30,
-    0x20,
-    0x04,
-    0x04,
-    0x65,
-    0x74,
-    0x74,
-    0x6D,
-    0x31,
-    0x18,
-    0x04,
-    0x04,
-    0x64,
-    0x62,
-    0x67,
-    0x72,
-    0x04,
-    0x04,
-    0x6F,
-    0x6C,
-    0x62,
-    0x74,
-    0x04,
-    0x04,
-    0x70,
-    0x72,
-    0x6F,
-    0x76,
-    0x04,
-    0x04,
-    0x76,
-    0x74,
-    0x72,
-    0x70,
-    0x30,
-    0x44,
-    0x02,
-    0x20,
-    0x50,
-    0xC4,
-    0xB3,
-    0x16,
-    0x17,
-    0x1B,
-    0x56,
-    0x38,
-    0x63,
-    0xFD,
-    0x84,
-    0x3E,
-    0x52,
-    0xFC,
-    0xBF,
-    0xCF,
-    0xED,
-    0x32,
-    0xDD,
-    0xAA,
-    0x1F,
-    0x47,
-    0x3B,
-    0x4D,
-    0xB2,
-    0x3F,
-    0x96,
-    0x00,
-    0x23,
-    0x27,
-    0x2F,
-    0xC8,
-    0x02,
-    0x20,
-    0x78,
-    0xEC,
-    0x44,
-    0x68,
-    0x58,
-    0x97,
-    0x35,
-    0xD5,
-    0xDF,
-    0x38,
-    0x8B,
-    0x58,
-    0x97,
-    0x29,
-    0xAB,
-    0xDD,
-    0xA5,
-    0xF9,
-    0xE5,
-    0x7B,
-    0x2E,
-    0x96,
-    0xB6,
-    0xE4,
-    0xD9,
-    0xEF,
-    0x4C,
-    0x5B,
-    0xC4,
-    0x34,
-    0x32,
-    0xE8,
-    0x30,
-    0x81,
-    0x8C,
-    0x83,
-    0x01,
-    0x01,
-    0x8A,
-    0x04,
-    0x53,
-    0x39,
-    0x34,
-    0x30,
-    0x8B,
-    0x10,
-    0xBD,
-    0x9E,
-    0xB0,
-    0x96,
-    0xC4,
-    0xC3,
-    0x75,
-    0x2F,
-    0x2F,
-    0x75,
-    0xDD,
-    0xAE,
-    0xC0,
-    0xB6,
-    0x79,
-    0xE6,
-    0x81,
-    0x10,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x84,
-    0x01,
-    0xAD,
-    0x87,
-    0x20,
-    0x10,
-    0xAD,
-    0x09,
-    0xAF,
-    0x22,
-    0x1E,
-    0x43,
-    0x8A,
-    0x92,
-    0x7A,
-    0x25,
-    0xDF,
-    0x4C,
-    0x11,
-    0x1D,
-    0xF2,
-    0x23,
-    0x18,
-    0xD1,
-    0xF0,
-    0x8F,
-    0x9B,
-    0xC6,
-    0xD6,
-    0x6A,
-    0x4F,
-    0xB7,
-    0x47,
-    0xF8,
-    0x45,
-    0x3C,
-    0x0F,
-    0x92,
-    0x10,
-    0xA1,
-    0xA7,
-    0xA4,
-    0x66,
-    0x77,
-    0x57,
-    0xB2,
-    0x70,
-    0x05,
-    0xA0,
-    0x42,
-    0x86,
-    0x00,
-    0xD6,
-    0xD0,
-    0x59,
-    0x85,
-    0x01,
-    0x00,
-    0x82,
-    0x01,
-    0xDB,
-    0x30,
-    0x20,
-    0x04,
-    0x04,
-    0x65,
-    0x74,
-    0x74,
-    0x6D,
-    0x31,
-    0x18,
-    0x04,
-    0x04,
-    0x64,
-    0x62,
-    0x67,
-    0x72,
-    0x04,
-    0x04,
-    0x6F,
-    0x6C,
-    0x62,
-    0x74,
-    0x04,
-    0x04,
-    0x70,
-    0x72,
-    0x6F,
-    0x76,
-    0x04,
-    0x04,
-    0x76,
-    0x74,
-    0x72,
-    0x70,
-    0x30,
-    0x46,
-    0x02,
-    0x21,
-    0x00,
-    0xA4,
-    0x65,
-    0x78,
-    0xAC,
-    0xDF,
-    0x5B,
-    0xEC,
-    0x56,
-    0x10,
-    0xFA,
-    0x84,
-    0x66,
-    0xFA,
-    0x5C,
-    0x03,
-    0xC4,
-    0x45,
-    0xBD,
-    0x35,
-    0x31,
-    0x61,
-    0x0B,
-    0xC9,
-    0x3B,
-    0x06,
-    0x51,
-    0x9B,
-    0xBF,
-    0xD9,
-    0x15,
-    0xDB,
-    0x0E,
-    0x02,
-    0x21,
-    0x00,
-    0xE7,
-    0xCC,
-    0x06,
-    0x2B,
-    0x86,
-    0x6F,
-    0xB9,
-    0x4C,
-    0x17,
-    0xBB,
-    0x7E,
-    0x58,
-    0x68,
-    0x3C,
-    0x81,
-    0xEB,
-    0xDF,
-    0x27,
-    0x86,
-    0xFC,
-    0xF9,
-    0x49,
-    0xB1,
-    0x5B,
-    0x03,
-    0x83,
-    0xAC,
-    0x31,
-    0x4E,
-    0x37,
-    0x4A,
-    0x4B,
-]
-
-VB1940_FWP_START_ADDR = 0x2000
-VB1940_FW = [
-    0xEC,
-    0xEC,
-    0xE8,
-    0x0F,
-    0x47,
-    0x10,
-    0xCD,
-    0x04,
-    0xC7,
-    0xC4,
-    0x97,
-    0xF9,
-    0x8C,
-    0xD4,
-    0xDA,
-    0xED,
-    0x06,
-    0xC9,
-    0x54,
-    0xC2,
-    0xCD,
-    0x59,
-    0x2C,
-    0xCA,
-    0xD3,
-    0x80,
-    0x31,
-    0x9B,
-    0x5B,
-    0x11,
-    0xCB,
-    0xE2,
-    0xF1,
-    0x64,
-    0x54,
-    0x0B,
-    0x90,
-    0xD2,
-    0x9E,
-    0xAE,
-    0x2A,
-    0x58,
-    0x69,
-    0xF0,
-    0xFF,
-    0x8E,
-    0xB0,
-    0x07,
-    0xC5,
-    0x41,
-    0xEC,
-    0x3A,
-    0x66,
-    0x3B,
-    0x4E,
-    0x98,
-    0x6E,
-    0xAB,
-    0x4E,
-    0xA8,
-    0x8D,
-    0x65,
-    0x0C,
-    0xFE,
-    0xEE,
-    0x86,
-    0x18,
-    0x34,
-    0x45,
-    0xAD,
-    0x84,
-    0x5C,
-    0xBC,
-    0xA4,
-    0x32,
-    0x5E,
-    0xDC,
-    0xE3,
-    0xB8,
-    0x9E,
-    0x54,
-    0x86,
-    0x1E,
-    0x2D,
-    0x91,
-    0x1E,
-    0x96,
-    0xB2,
-    0xB0,
-    0x37,
-    0x29,
-    0x30,
-    0x4D,
-    0x9F,
-    0x42,
-    0x35,
-    0x3C,
-    0xED,
-    0x52,
-    0xF7,
-    0x73,
-    0x65,
-    0x6F,
-    0x13,
-    0xD9,
-    0xC0,
-    0xBC,
-    0xD3,
-    0xD8,
-    0x59,
-    0x39,
-    0xAE,
-    0x58,
-    0xA5,
-    0x70,
-    0xA6,
-    0x24,
-    0xAF,
-    0x78,
-    0x77,
-    0xCC,
-    0x9C,
-    0x9D,
-    0xCF,
-    0xC8,
-    0x52,
-    0xBA,
-    0x33,
-    0x39,
-    0x9A,
-    0xE8,
-    0x60,
-    0xD1,
-    0x73,
-    0xB7,
-    0x48,
-    0xD0,
-    0x9B,
-    0xAE,
-    0xCD,
-    0x78,
-    0x81,
-    0x52,
-    0xCF,
-    0x37,
-    0x63,
-    0xDC,
-    0x16,
-    0x52,
-    0xB0,
-    0x94,
-    0xA4,
-    0x80,
-    0x61,
-    0x4E,
-    0xA2,
-    0x07,
-    0x12,
-    0x9F,
-    0x85,
-    0x78,
-    0x29,
-    0xEE,
-    0xDA,
-    0x34,
-    0x2B,
-    0x8B,
-    0xA1,
-    0x7C,
-    0xFD,
-    0x2D,
-    0xC1,
-    0x21,
-    0xAC,
-    0xDD,
-    0x4F,
-    0x87,
-    0x66,
-    0x23,
-    0x81,
-    0x58,
-    0x91,
-    0x47,
-    0x9C,
-    0x12,
-    0x8A,
-    0xC4,
-    0xC5,
-    0xCA,
-    0x83,
-    0x0A,
-    0xC8,
-    0x63,
-    0x75,
-    0x94,
-    0x9C,
-    0x38,
-    0x0B,
-    0x0C,
-    0x1E,
-    0xA6,
-    0x47,
-    0xC2,
-    0x23,
-    0xBE,
-    0x0A,
-    0x42,
-    0x67,
-    0xAD,
-    0x8F,
-    0x65,
-    0xBD,
-    0x82,
-    0x70,
-    0x0F,
-    0xF9,
-    0x8F,
-    0x4B,
-    0x9D,
-    0x00,
-    0x75,
-    0x29,
-    0x49,
-    0x65,
-    0x70,
-    0x5F,
-    0x4F,
-    0xD3,
-    0x63,
-    0x66,
-    0x2B,
-    0x02,
-    0xE6,
-    0x0D,
-    0xF5,
-    0xD1,
-    0x29,
-    0x4D,
-    0x80,
-    0x5C,
-    0xFD,
-    0xA7,
-    0xBC,
-    0xDD,
-    0x55,
-    0x51,
-    0x50,
-    0x25,
-    0x2D,
-    0xD1,
-    0xA3,
-    0x76,
-    0x0D,
-    0xF5,
-    0xCB,
-    0x03,
-    0x0D,
-    0xAA,
-    0x93,
-    0x12,
-    0x2A,
-    0x4B,
-    0x62,
-    0x2E,
-    0x9C,
-    0xEE,
-    0x85,
-    0x11,
-    0x41,
-    0x93,
-    0x87,
-    0xAB,
-    0x39,
-    0xA4,
-    0xF6,
-    0x05,
-    0x45,
-    0x0D,
-    0xD5,
-    0x75,
-    0xF2,
-    0xF5,
-    0x30,
-    0xF2,
-    0xD7,
-    0x94,
-    0x6D,
-    0x2E,
-    0x1F,
-    0x63,
-    0xB3,
-    0x75,
-    0x15,
-    0x70,
-    0x02,
-    0x28,
-    0xD3,
-    0x3F,
-    0xB4,
-    0xA9,
-    0x79,
-    0xE7,
-    0xF8,
-    0xD5,
-    0xF7,
-    0x3C,
-    0xD3,
-    0x0E,
-    0x7F,
-    0x5E,
-    0xCC,
-    0xEF,
-    0x86,
-    0x62,
-    0x16,
-    0x54,
-    0x63,
-    0xE5,
-    0x3A,
-    0x89,
-    0xCB,
-    0x4E,
-    0x5F,
-    0x55,
-    0x93,
-    0x87,
-    0x6C,
-    0xAC,
-    0x40,
-    0x10,
-    0x7B,
-    0x5A,
-    0xD6,
-    0xBF,
-    0xAB,
-    0xF8,
-    0x96,
-    0xA4,
-    0x21,
-    0x8C,
-    0x35,
-    0x7F,
-    0xCB,
-    0x1C,
-    0x60,
-    0xC7,
-    0xBE,
-    0x91,
-    0x97,
-    0xBF,
-    0xB5,
-    0xD8,
-    0x20,
-    0x55,
-    0x72,
-    0xF0,
-    0x7D,
-    0xA0,
-    0xC7,
-    0xF4,
-    0x6B,
-    0x1B,
-    0xF9,
-    0xD9,
-    0x44,
-    0x52,
-    0xAC,
-    0x34,
-    0x3D,
-    0x48,
-    0x73,
-    0xFB,
-    0xA8,
-    0xFC,
-    0x4F,
-    0x08,
-    0xA6,
-    0x14,
-    0x86,
-    0x57,
-    0xEA,
-    0xDD,
-    0xE5,
-    0xA3,
-    0x24,
-    0x44,
-    0xE4,
-    0x55,
-    0xDA,
-    0x96,
-    0x42,
-    0x03,
-    0xA9,
-    0xD4,
-    0xA4,
-    0x29,
-    0x2B,
-    0x49,
-    0xB8,
-    0xE3,
-    0x3F,
-    0xD3,
-    0x6D,
-    0xBB,
-    0x0E,
-    0x71,
-    0xC4,
-    0x8C,
-    0x3E,
-    0x5C,
-    0x9A,
-    0x57,
-    0xE5,
-    0x69,
-    0xC6,
-    0x3C,
-    0xC3,
-    0x9A,
-    0x2F,
-    0xA0,
-    0x38,
-    0x49,
-    0x73,
-    0xE0,
-    0x44,
-    0x6A,
-    0x6E,
-    0x67,
-    0xFB,
-    0xED,
-    0x10,
-    0x87,
-    0x2E,
-    0xA8,
-    0x4F,
-    0xDC,
-    0xC2,
-    0x47,
-    0x8D,
-    0xEA,
-    0x1E,
-    0x9E,
-    0x76,
-    0x35,
-    0xB3,
-    0xA5,
-    0x86,
-    0x56,
-    0x28,
-    0x7F,
-    0x60,
-    0xB0,
-    0x8A,
-    0xB9,
-    0x09,
-    0x08,
-    0xDB,
-    0xDB,
-    0x32,
-    0x50,
-    0x4D,
-    0x76,
-    0xE2,
-    0x92,
-    0xEB,
-    0xCA,
-    0x53,
-    0x7E,
-    0x0C,
-    0xF1,
-    0x1F,
-    0xC8,
-    0xFF,
-    0x0A,
-    0x42,
-    0x9A,
-    0x22,
-    0x34,
-    0xE2,
-    0x0C,
-    0xE0,
-    0x35,
-    0x78,
-    0x6E,
-    0x4D,
-    0x52,
-    0xF9,
-    0xAC,
-    0x07,
-    0xA4,
-    0xCB,
-    0x5D,
-    0xB0,
-    0xF3,
-    0x47,
-    0xA1,
-    0xF0,
-    0x6E,
-    0x90,
-    0xDE,
-    0x26,
-    0xAD,
-    0x73,
-    0xDD,
-    0x1A,
-    0xAE,
-    0x0A,
-    0xC0,
-    0x2C,
-    0xDB,
-    0x8A,
-    0xE8,
-    0xBC,
-    0xA3,
-    0x11,
-    0x41,
-    0x35,
-    0xD5,
-    0xFB,
-    0x21,
-    0x95,
-    0x8F,
-    0x26,
-    0x8E,
-    0x15,
-    0xD3,
-    0xEB,
-    0xE7,
-    0x2D,
-    0x03,
-    0xCC,
-    0x20,
-    0x1F,
-    0x79,
-    0xE2,
-    0xE8,
-    0x5D,
-    0x9E,
-    0xB2,
-    0xF9,
-    0x4D,
-    0xB3,
-    0x0C,
-    0xF4,
-    0x9C,
-    0xD6,
-    0xA9,
-    0xA6,
-    0xE6,
-    0x0D,
-    0x78,
-    0x85,
-    0x1C,
-    0x16,
-    0x99,
-    0x33,
-    0xD5,
-    0x81,
-    0x7D,
-    0x21,
-    0x53,
-    0x70,
-    0xB0,
-    0xD7,
-    0x49,
-    0x41,
-    0xB5,
-    0xBC,
-    0x0B,
-    0x39,
-    0x5D,
-    0x8D,
-    0xFF,
-    0xD8,
-    0x1E,
-    0xD8,
-    0xC5,
-    0xBD,
-    0x4D,
-    0x2F,
-    0x58,
-    0x5B,
-    0x13,
-    0x3E,
-    0xC2,
-    0x0C,
-    0xDE,
-    0x02,
-    0xDF,
-    0x06,
-    0x78,
-    0x00,
-    0xD7,
-    0x49,
-    0xA9,
-    0x7E,
-    0x6D,
-    0xF2,
-    0x20,
-    0xF5,
-    0x06,
-    0xCB,
-    0x0B,
-    0xDB,
-    0x28,
-    0x35,
-    0x85,
-    0x11,
-    0x6D,
-    0x02,
-    0xEA,
-    0x6F,
-    0x2D,
-    0xFB,
-    0xA2,
-    0x8C,
-    0xE6,
-    0xBF,
-    0x35,
-    0x49,
-    0x68,
-    0x5D,
-    0x40,
-    0xBF,
-    0x76,
-    0x35,
-    0xCA,
-    0x69,
-    0xBC,
-    0xCB,
-    0xBB,
-    0xD3,
-    0x4F,
-    0x3E,
-    0xAA,
-    0x2B,
-    0x4E,
-    0x19,
-    0xBF,
-    0x05,
-    0x9E,
-    0x87,
-    0xBF,
-    0x7B,
-    0x9E,
-    0xE2,
-    0x81,
-    0x0E,
-    0xC1,
-    0x49,
-    0x63,
-    0x0C,
-    0x73,
-    0x54,
-    0xEE,
-    0xA9,
-    0xF8,
-    0x96,
-    0x17,
-    0x80,
-    0xF7,
-    0xE3,
-    0x1B,
-    0x59,
-    0xDD,
-    0x96,
-    0x3F,
-    0x42,
-    0xED,
-    0x5A,
-    0x74,
-    0xEC,
-    0x94,
-    0x8B,
-    0xF0,
-    0x98,
-    0x30,
-    0x39,
-    0x46,
-    0x0A,
-    0xE0,
-    0x05,
-    0xD1,
-    0x3F,
-    0x71,
-    0x65,
-    0x51,
-    0xCC,
-    0x1C,
-    0x53,
-    0xA0,
-    0x4D,
-    0xAE,
-    0x62,
-    0x4E,
-    0x2A,
-    0xFA,
-    0x53,
-    0x44,
-    0x2F,
-    0x6F,
-    0x43,
-    0xF4,
-    0x28,
-    0x78,
-    0xAF,
-    0x06,
-    0x8D,
-    0xF3,
-    0xA2,
-    0x73,
-    0xFD,
-    0x81,
-    0x00,
-    0x7B,
-    0x09,
-    0x2E,
-    0xC1,
-    0xB7,
-    0xAA,
-    0x22,
-    0x58,
-    0x8E,
-    0x8B,
-    0x89,
-    0x53,
-    0xAD,
-    0x2E,
-    0xD8,
-    0x5B,
-    0x48,
-    0xDC,
-    0x59,
-    0xE0,
-    0x2C,
-    0x10,
-    0x07,
-    0xA6,
-    0xBE,
-    0x46,
-    0xA9,
-    0xD6,
-    0x1A,
-    0xE7,
-    0x1F,
-    0xC6,
-    0xB8,
-    0xCF,
-    0x05,
-    0xBF,
-    0x93,
-    0x5A,
-    0xA9,
-    0xEE,
-    0x05,
-    0xC6,
-    0xEF,
-    0x60,
-    0x6B,
-    0x37,
-    0x17,
-    0x68,
-    0xF8,
-    0x4D,
-    0xC4,
-    0xE8,
-    0xD1,
-    0x67,
-    0x5F,
-    0x23,
-    0x1E,
-    0x62,
-    0x14,
-    0xF9,
-    0x63,
-    0x71,
-    0xBC,
-    0x61,
-    0x9B,
-    0xA9,
-    0xA8,
-    0x17,
-    0x42,
-    0x2B,
-    0x20,
-    0x5E,
-    0x40,
-    0x49,
-    0x8C,
-    0xDD,
-    0x69,
-    0xAF,
-    0xAF,
-    0x9F,
-    0xE3,
-    0xEE,
-    0x43,
-    0x12,
-    0xA3,
-    0x88,
-    0x17,
-    0xE3,
-    0x54,
-    0x92,
-    0xF1,
-    0xCC,
-    0x63,
-    0x83,
-    0x7A,
-    0xA1,
-    0x5A,
-    0xDE,
-    0x63,
-    0xD6,
-    0xF1,
-    0x04,
-    0x66,
-    0x5E,
-    0x2A,
-    0x29,
-    0x82,
-    0xCB,
-    0x3E,
-    0xB1,
-    0x44,
-    0x5B,
-    0x2F,
-    0x5C,
-    0xE9,
-    0x6F,
-    0xCF,
-    0x96,
-    0x6C,
-    0x58,
-    0x52,
-    0xFF,
-    0x68,
-    0x62,
-    0xBC,
-    0xF1,
-    0x70,
-    0x2B,
-    0xF4,
-    0xB6,
-    0x23,
-    0x0A,
-    0x16,
-    0x78,
-    0x1B,
-    0x42,
-    0x99,
-    0x6A,
-    0xAD,
-    0x6A,
-    0xFC,
-    0xF3,
-    0x9A,
-    0xE4,
-    0x24,
-    0xE8,
-    0x79,
-    0x26,
-    0x17,
-    0xF8,
-    0x4E,
-    0x70,
-    0xF6,
-    0xB8,
-    0x47,
-    0x16,
-    0xEE,
-    0xAF,
-    0xF1,
-    0x6C,
-    0xED,
-    0x6F,
-    0x61,
-    0xD5,
-    0x1E,
-    0x42,
-    0xCE,
-    0xD4,
-    0x08,
-    0xA3,
-    0x75,
-    0xFD,
-    0x31,
-    0x01,
-    0x41,
-    0xDA,
-    0x20,
-    0xAE,
-    0x5E,
-    0x52,
-    0x2A,
-    0x54,
-    0x24,
-    0x83,
-    0x50,
-    0xC6,
-    0x1D,
-    0x56,
-    0x7C,
-    0xD8,
-    0xB7,
-    0xBE,
-    0xB7,
-    0xEF,
-    0xD7,
-    0xC3,
-    0x23,
-    0xB9,
-    0x9B,
-    0xD3,
-    0x12,
-    0xE8,
-    0xEA,
-    0xB1,
-    0x65,
-    0x3B,
-    0xE3,
-    0x7D,
-    0x64,
-    0xA5,
-    0x41,
-    0x46,
-    0x01,
-    0x30,
-    0x42,
-    0x82,
-    0x58,
-    0x65,
-    0x32,
-    0x67,
-    0xCF,
-    0x67,
-    0x3F,
-    0xB3,
-    0x2F,
-    0x36,
-    0x9F,
-    0x98,
-    0x45,
-    0xAE,
-    0x54,
-    0xDA,
-    0x7C,
-    0x4E,
-    0x4F,
-    0xE3,
-    0xE3,
-    0x8E,
-    0xE5,
-    0xC0,
-    0x2E,
-    0x20,
-    0xD3,
-    0xA8,
-    0x6C,
-    0xD3,
-    0x63,
-    0x7E,
-    0x0D,
-    0x62,
-    0x76,
-    0x4C,
-    0x9A,
-    0xDF,
-    0xA5,
-    0x90,
-    0x4F,
-    0x32,
-    0x9B,
-    0x88,
-    0xCC,
-    0xA8,
-    0x00,
-    0x64,
-    0x60,
-    0x2E,
-    0x22,
-    0x0C,
-    0xB9,
-    0x7E,
-    0xA6,
-    0x07,
-    0x1A,
-    0x94,
-    0x8C,
-    0x53,
-    0x47,
-    0xC6,
-    0x1D,
-    0xF1,
-    0x83,
-    0x79,
-    0xED,
-    0x79,
-    0x93,
-    0xFB,
-    0x28,
-    0x54,
-    0x44,
-    0x56,
-    0xA5,
-    0xD3,
-    0x27,
-    0xEB,
-    0xC4,
-    0x3F,
-    0xAF,
-    0x36,
-    0xC2,
-    0x40,
-    0xE6,
-    0x14,
-    0xD9,
-    0x9F,
-    0x25,
-    0x9F,
-    0x2B,
-    0xF3,
-    0x9B,
-    0xA1,
-    0xB6,
-    0x28,
-    0x9C,
-    0xBC,
-    0x93,
-    0xAE,
-    0x8A,
-    0xDE,
-    0xFB,
-    0x3F,
-    0x34,
-    0x4C,
-    0x3B,
-    0x18,
-    0x3F,
-    0x92,
-    0x98,
-    0x96,
-    0x24,
-    0x41,
-    0x9A,
-    0xFB,
-    0x6A,
-    0x67,
-    0xE4,
-    0x95,
-    0x89,
-    0xBC,
-    0x05,
-    0x21,
-    0x78,
-    0x96,
-    0xC3,
-    0x9E,
-    0xAB,
-    0x1F,
-    0x9A,
-    0x4F,
-    0x21,
-    0x79,
-    0x68,
-    0xC5,
-    0xC2,
-    0x1B,
-    0xB3,
-    0x09,
-    0x6F,
-    0xF7,
-    0x9C,
-    0x16,
-    0x39,
-    0x00,
-    0x5A,
-    0x54,
-    0xAF,
-    0xD1,
-    0x44,
-    0x82,
-    0xFC,
-    0xED,
-    0x03,
-    0xA5,
-    0xC8,
-    0x25,
-    0x83,
-    0xC0,
-    0x73,
-    0xCA,
-    0x7C,
-    0xDA,
-    0x69,
-    0x0E,
-    0x46,
-    0x19,
-    0x90,
-    0x9E,
-    0x0F,
-    0x71,
-    0x81,
-    0x96,
-    0x38,
-    0x40,
-    0x43,
-    0x84,
-    0x43,
-    0xF7,
-    0xF1,
-    0x11,
-    0x90,
-    0x7C,
-    0x05,
-    0x9C,
-    0x6C,
-    0x90,
-    0xEC,
-    0xA7,
-    0x54,
-    0x33,
-    0x4E,
-    0xAA,
-    0xC8,
-    0x32,
-    0xA3,
-    0x46,
-    0xB0,
-    0x7C,
-    0xC5,
-    0x3D,
-    0x6F,
-    0x46,
-    0x3E,
-    0x01,
-    0x7D,
-    0xCD,
-    0xB8,
-    0x02,
-    0xB3,
-    0x1C,
-    0x87,
-    0x74,
-    0x38,
-    0x57,
-    0x14,
-    0xA7,
-    0xD8,
-    0xC2,
-    0x98,
-    0xF1,
-    0xC9,
-    0xC8,
-    0xCD,
-    0xAC,
-    0x51,
-    0xB0,
-    0xC7,
-    0x3A,
-    0xE7,
-    0x3D,
-    0xDD,
-    0xA8,
-    0xFD,
-    0xCE,
-    0x7F,
-    0x77,
-    0x64,
-    0x34,
-    0x7F,
-    0xEB,
-    0xED,
-    0xC6,
-    0x7B,
-    0x77,
-    0x69,
-    0x59,
-    0xE4,
-    0xB8,
-    0xE9,
-    0x8C,
-    0x5B,
-    0x6A,
-    0x09,
-    0xE4,
-    0x5A,
-    0x10,
-    0x3A,
-    0x7A,
-    0x77,
-    0x09,
-    0x0B,
-    0x4E,
-    0xAA,
-    0xEF,
-    0x3F,
-    0x33,
-    0x41,
-    0x6A,
-    0xDD,
-    0xE7,
-    0x4C,
-    0x4B,
-    0x10,
-    0xBF,
-    0x7F,
-    0x4B,
-    0x41,
-    0xB5,
-    0xC8,
-    0xDF,
-    0x93,
-    0x92,
-    0x72,
-    0xDE,
-    0x99,
-    0xA5,
-    0x04,
-    0x52,
-    0x97,
-    0xE4,
-    0xDA,
-    0xA6,
-    0x81,
-    0x5C,
-    0xC9,
-    0x82,
-    0x9B,
-    0x65,
-    0xD8,
-    0x7F,
-    0x48,
-    0x9D,
-    0xA6,
-    0x50,
-    0x0A,
-    0xC4,
-    0xEF,
-    0x49,
-    0x78,
-    0x58,
-    0x5D,
-    0xC1,
-    0xA4,
-    0x6C,
-    0x5F,
-    0x0B,
-    0xB9,
-    0xD0,
-    0x12,
-    0x73,
-    0x39,
-    0x5F,
-    0xC4,
-    0x90,
-    0xEE,
-    0xC6,
-    0x55,
-    0x06,
-    0xC0,
-    0xA7,
-    0x91,
-    0x1B,
-    0x90,
-    0xF9,
-    0xC9,
-    0x71,
-    0x2D,
-    0xC6,
-    0xB3,
-    0xC0,
-    0x0B,
-    0x44,
-    0x1F,
-    0x6B,
-    0x56,
-    0xFA,
-    0x31,
-    0x78,
-    0x70,
-    0x08,
-    0xA9,
-    0x11,
-    0x25,
-    0x5C,
-    0xD0,
-    0xCA,
-    0xA0,
-    0x5F,
-    0x18,
-    0x00,
-    0xF8,
-    0x9E,
-    0xF9,
-    0xCA,
-    0x0D,
-    0xF1,
-    0x42,
-    0xAD,
-    0x90,
-    0xC6,
-    0x1F,
-    0x2F,
-    0xC8,
-    0x68,
-    0xB8,
-    0xD0,
-    0x5F,
-    0x44,
-    0x53,
-    0xAF,
-    0x98,
-    0xBD,
-    0xED,
-    0x7F,
-    0xB2,
-    0x4E,
-    0xA3,
-    0xD2,
-    0x11,
-    0x4B,
-    0x5E,
-    0x8F,
-    0xF1,
-    0x78,
-    0x7D,
-    0xEF,
-    0xC4,
-    0x14,
-    0xF4,
-    0x9C,
-    0xA8,
-    0x1E,
-    0xC2,
-    0x8F,
-    0x73,
-    0x79,
-    0x2E,
-    0x73,
-    0xCD,
-    0x55,
-    0x1B,
-    0xF6,
-    0x85,
-    0xEC,
-    0x6C,
-    0x4B,
-    0xF7,
-    0xC9,
-    0x3C,
-    0xAF,
-    0x31,
-    0xA1,
-    0xE2,
-    0x08,
-    0x3B,
-    0x6B,
-    0xE7,
-    0x02,
-    0x6B,
-    0xF2,
-    0x0F,
-    0x4D,
-    0x7B,
-    0x2C,
-    0x36,
-    0x65,
-    0xEA,
-    0x72,
-    0xDD,
-    0x1B,
-    0x95,
-    0x53,
-    0xA8,
-    0xF0,
-    0x84,
-    0x74,
-    0x7E,
-    0x43,
-    0xB2,
-    0x32,
-    0x55,
-    0xD2,
-    0xA6,
-    0x77,
-    0x78,
-    0xF3,
-    0xC4,
-    0x47,
-    0x41,
-    0x5A,
-    0xCB,
-    0x84,
-    0xE8,
-    0x21,
-    0x83,
-    0xD7,
-    0x2F,
-    0xD1,
-    0xDC,
-    0x4A,
-    0xC4,
-    0x6B,
-    0x80,
-    0xD3,
-    0x9B,
-    0x0C,
-    0x4B,
-    0x1B,
-    0xF1,
-    0x6F,
-    0x62,
-    0x8A,
-    0xF3,
-    0x10,
-    0xD7,
-    0x14,
-    0xDB,
-    0x52,
-    0x38,
-    0xE5,
-    0x9F,
-    0x3B,
-    0x9D,
-    0xA7,
-    0x98,
-    0xE3,
-    0xA5,
-    0xC1,
-    0x1D,
-    0xE1,
-    0x03,
-    0x6E,
-    0xDD,
-    0x59,
-    0x2F,
-    0xCA,
-    0x34,
-    0xF5,
-    0xE2,
-    0x9E,
-    0x84,
-    0x11,
-    0xE3,
-    0x85,
-    0xB1,
-    0x95,
-    0xE9,
-    0x5A,
-    0x6D,
-    0xD4,
-    0x93,
-    0xE1,
-    0x45,
-    0x24,
-    0x17,
-    0x6E,
-    0x5E,
-    0x59,
-    0x73,
-    0xAC,
-    0xC5,
-    0x39,
-    0x0C,
-    0xD0,
-    0xCD,
-    0xD2,
-    0x86,
-    0x49,
-    0x14,
-    0x56,
-    0xDE,
-    0xB4,
-    0xED,
-    0x1C,
-    0xFF,
-    0xD1,
-    0x17,
-    0xF5,
-    0xAF,
-    0x1D,
-    0x73,
-    0xDB,
-    0x4D,
-    0xB9,
-    0xB4,
-    0x16,
-    0x19,
-    0x35,
-    0xD9,
-    0xE9,
-    0x76,
-    0xDA,
-    0x7A,
-    0x6E,
-    0xFA,
-    0xC9,
-    0x04,
-    0x80,
-    0x4C,
-    0xD6,
-    0xE9,
-    0x9B,
-    0x49,
-    0xA5,
-    0xB1,
-    0xB4,
-    0xCF,
-    0x08,
-    0x00,
-    0x14,
-    0x4D,
-    0xDE,
-    0x2F,
-    0x15,
-    0xC1,
-    0x21,
-    0xB5,
-    0x4E,
-    0x2F,
-    0xD5,
-    0x5A,
-    0x03,
-    0x6E,
-    0x0B,
-    0xEC,
-    0x3E,
-    0xD1,
-    0x0D,
-    0xA5,
-    0x34,
-    0xD1,
-    0xEA,
-    0x14,
-    0x8F,
-    0xBC,
-    0x18,
-    0x01,
-    0xD2,
-    0x8F,
-    0xCA,
-    0xEA,
-    0x8E,
-    0xB8,
-    0x4C,
-    0xD0,
-    0xBC,
-    0x16,
-    0xB0,
-    0xB0,
-    0xC9,
-    0x1C,
-    0xC2,
-    0xF1,
-    0x4D,
-    0x8D,
-    0x5F,
-    0x6F,
-    0x1D,
-    0x3A,
-    0xA2,
-    0x50,
-    0xC1,
-    0xF0,
-    0xCD,
-    0x5C,
-    0x07,
-    0x3A,
-    0xAB,
-    0x13,
-    0xD7,
-    0x80,
-    0x88,
-    0xFB,
-    0x05,
-    0x80,
-    0xDD,
-    0x09,
-    0xD7,
-    0xF3,
-    0x58,
-    0x61,
-    0xD7,
-    0xCF,
-    0x11,
-    0x51,
-    0xBC,
-    0x26,
-    0x6B,
-    0xB5,
-    0x85,
-    0x02,
-    0x73,
-    0x52,
-    0x07,
-    0xF7,
-    0xA7,
-    0xB0,
-    0x98,
-    0xE5,
-    0xBC,
-    0xB0,
-    0x05,
-    0x8A,
-    0xCF,
-    0x45,
-    0xFE,
-    0x66,
-    0xC8,
-    0xE7,
-    0xB4,
-    0x7E,
-    0x88,
-    0x69,
-    0xD6,
-    0xDB,
-    0x24,
-    0x34,
-    0x3B,
-    0xB4,
-    0x2E,
-    0x1B,
-    0x5F,
-    0xD2,
-    0x4F,
-    0x5F,
-    0x3F,
-    0xA9,
-    0xAA,
-    0x43,
-    0xF6,
-    0x2A,
-    0xBA,
-    0x1B,
-    0x9C,
-    0xAB,
-    0xA0,
-    0x37,
-    0xC0,
-    0x40,
-    0x10,
-    0x5D,
-    0x8B,
-    0x5D,
-    0x00,
-    0x25,
-    0x67,
-    0xB1,
-    0xA3,
-    0x9C,
-    0x26,
-    0xBB,
-    0xA5,
-    0x1F,
-    0x8B,
-    0x19,
-    0xA0,
-    0x49,
-    0x66,
-    0x87,
-    0x68,
-    0x24,
-    0xD5,
-    0x26,
-    0x1A,
-    0x94,
-    0x9E,
-    0x12,
-    0x9C,
-    0x21,
-    0x96,
-    0x3E,
-    0xA3,
-    0xC3,
-    0x66,
-    0x1D,
-    0x32,
-    0xF0,
-    0xCC,
-    0xE9,
-    0x16,
-    0x44,
-    0x61,
-    0xF2,
-    0xCC,
-    0x51,
-    0x52,
-    0x28,
-    0xA4,
-    0x80,
-    0x72,
-    0xDD,
-    0x5B,
-    0xD7,
-    0x6D,
-    0xD8,
-    0x4D,
-    0xE7,
-    0x14,
-    0x04,
-    0xF1,
-    0x69,
-    0x7C,
-    0x96,
-    0x02,
-    0x4F,
-    0xC0,
-    0x7D,
-    0x29,
-    0xB6,
-    0x95,
-    0x5F,
-    0xD5,
-    0xD9,
-    0x6C,
-    0x7E,
-    0xB6,
-    0x0F,
-    0xB9,
-    0x0D,
-    0x82,
-    0x9B,
-    0x47,
-    0x8A,
-    0x82,
-    0xC2,
-    0xC5,
-    0x33,
-    0xB4,
-    0x6E,
-    0x69,
-    0x5D,
-    0xC8,
-    0x26,
-    0x59,
-    0x30,
-    0xE0,
-    0x87,
-    0x9E,
-    0x6C,
-    0x50,
-    0x37,
-    0xE1,
-    0x41,
-    0x20,
-    0xE5,
-    0x52,
-    0xB2,
-    0x44,
-    0x93,
-    0x94,
-    0x9B,
-    0x50,
-    0xD1,
-    0x47,
-    0x82,
-    0x7B,
-    0xF4,
-    0x44,
-    0xB5,
-    0xC7,
-    0x27,
-    0x5B,
-    0x84,
-    0x93,
-    0xF2,
-    0xB4,
-    0x04,
-    0x7B,
-    0x70,
-    0x15,
-    0x53,
-    0x40,
-    0x54,
-    0x16,
-    0x17,
-    0x12,
-    0xDC,
-    0xD5,
-    0x48,
-    0x5C,
-    0x6A,
-    0xD4,
-    0x8B,
-    0x1B,
-    0x66,
-    0xBA,
-    0x09,
-    0x77,
-    0x03,
-    0x9C,
-    0x4C,
-    0x4F,
-    0x48,
-    0x68,
-    0xFB,
-    0x61,
-    0xF5,
-    0x9E,
-    0xC8,
-    0xA2,
-    0xFC,
-    0xAB,
-    0x6E,
-    0x3E,
-    0x1D,
-    0x79,
-    0x4E,
-    0x31,
-    0x5E,
-    0x9A,
-    0xAD,
-    0x11,
-    0x38,
-    0xDB,
-    0x8C,
-    0x3A,
-    0x69,
-    0xF9,
-    0xC8,
-    0x1F,
-    0x1C,
-    0x74,
-    0xBB,
-    0xAC,
-    0xC5,
-    0xC8,
-    0x11,
-    0x4C,
-    0xF2,
-    0xFA,
-    0xEE,
-    0x95,
-    0xB9,
-    0xB1,
-    0xF0,
-    0x91,
-    0xF8,
-    0xCD,
-    0x06,
-    0x7B,
-    0x04,
-    0x0B,
-    0x6C,
-    0xC6,
-    0x42,
-    0x41,
-    0x4C,
-    0xBE,
-    0xCB,
-    0x83,
-    0xAE,
-    0x93,
-    0x6B,
-    0xAA,
-    0x81,
-    0x1B,
-    0xC0,
-    0x0E,
-    0x61,
-    0xDB,
-    0x77,
-    0x62,
-    0xD4,
-    0xF1,
-    0x7C,
-    0x10,
-    0xC1,
-    0xE6,
-    0x9F,
-    0xF8,
-    0x32,
-    0xFA,
-    0x82,
-    0x66,
-    0x5F,
-    0x63,
-    0x58,
-    0x95,
-    0xB6,
-    0xBA,
-    0x82,
-    0x1F,
-    0xC4,
-    0x36,
-    0xBC,
-    0x3B,
-    0xAD,
-    0x87,
-    0x83,
-    0x2B,
-    0x30,
-    0x9E,
-    0xBC,
-    0xC1,
-    0x65,
-    0x7F,
-    0x03,
-    0x95,
-    0x09,
-    0xD5,
-    0xF6,
-    0x1E,
-    0xE0,
-    0x4D,
-    0x0E,
-    0x0D,
-    0xAD,
-    0x40,
-    0x50,
-    0x16,
-    0xBC,
-    0x07,
-    0xBE,
-    0x43,
-    0x5F,
-    0x36,
-    0xCA,
-    0x19,
-    0x09,
-    0x68,
-    0x68,
-    0xE4,
-    0x45,
-    0xF5,
-    0x30,
-    0x78,
-    0xE2,
-    0x45,
-    0xF1,
-    0xDF,
-    0xC6,
-    0xBF,
-    0xE6,
-    0xB0,
-    0x27,
-    0x5B,
-    0xD3,
-    0x08,
-    0xA2,
-    0x51,
-    0x53,
-    0x33,
-    0xAE,
-    0xAE,
-    0xA0,
-    0xFD,
-    0xFD,
-    0x7E,
-    0x55,
-    0x17,
-    0x8C,
-    0xD7,
-    0x45,
-    0xB9,
-    0x6C,
-    0x6F,
-    0xD2,
-    0x88,
-    0x5D,
-    0x61,
-    0x3C,
-    0xD6,
-    0x31,
-    0xE2,
-    0x11,
-    0x87,
-    0xBF,
-    0xBA,
-    0xA8,
-    0x56,
-    0xC6,
-    0xA6,
-    0x32,
-    0x0E,
-    0x3A,
-    0x9B,
-    0xD2,
-    0x12,
-    0xE3,
-    0x56,
-    0x33,
-    0xA0,
-    0x77,
-    0x7E,
-    0xE2,
-    0x78,
-    0x75,
-    0xCE,
-    0x2E,
-    0x49,
-    0x2E,
-    0x79,
-    0xA9,
-    0xF9,
-    0xFB,
-    0x5B,
-    0x5B,
-    0x40,
-    0x36,
-    0xD0,
-    0x96,
-    0xF4,
-    0x21,
-    0x00,
-    0x43,
-    0xBD,
-    0x37,
-    0xE4,
-    0x02,
-    0x13,
-    0x4C,
-    0x99,
-    0xD1,
-    0x83,
-    0x71,
-    0x09,
-    0xDF,
-    0x2A,
-    0x70,
-    0xCF,
-    0x7F,
-    0x2C,
-    0x69,
-    0x97,
-    0xB1,
-    0xDF,
-    0x67,
-    0x83,
-    0xA9,
-    0x19,
-    0xA5,
-    0xC9,
-    0x60,
-    0xBF,
-    0xEC,
-    0xD6,
-    0xBD,
-    0x66,
-    0x38,
-    0x90,
-    0x88,
-    0x68,
-    0x3C,
-    0x53,
-    0x8F,
-    0x17,
-    0x05,
-    0x0B,
-    0x32,
-    0x6C,
-    0x2B,
-    0x75,
-    0x3A,
-    0xD6,
-    0xF2,
-    0xA6,
-    0x5D,
-    0xF8,
-    0x82,
-    0x3D,
-    0x1E,
-    0xD7,
-    0x7D,
-    0xCE,
-    0x1C,
-    0xA5,
-    0xF6,
-    0xDE,
-    0xD4,
-    0x13,
-    0xAA,
-    0x61,
-    0x20,
-    0xFD,
-    0x61,
-    0xE4,
-    0x45,
-    0x06,
-    0xBC,
-    0xEE,
-    0x9F,
-    0xDB,
-    0x38,
-    0x17,
-    0xB5,
-    0x19,
-    0xFB,
-    0x77,
-    0xC9,
-    0x8B,
-    0x4A,
-    0x13,
-    0x79,
-    0xD8,
-    0xE6,
-    0xCA,
-    0x05,
-    0x37,
-    0x22,
-    0x3B,
-    0xDC,
-    0xE2,
-    0xB2,
-    0x42,
-    0xE7,
-    0x58,
-    0x58,
-    0x03,
-    0x43,
-    0xC4,
-    0xDD,
-    0x7B,
-    0x0E,
-    0x30,
-    0xA2,
-    0x78,
-    0x48,
-    0x06,
-    0x14,
-    0x15,
-    0x93,
-    0x8C,
-    0x5A,
-    0xED,
-    0x32,
-    0x6F,
-    0x25,
-    0xB0,
-    0x47,
-    0x20,
-    0xBA,
-    0x2C,
-    0xAC,
-    0xB5,
-    0x99,
-    0xE4,
-    0x43,
-    0xA2,
-    0xA0,
-    0x58,
-    0xF0,
-    0x65,
-    0xA5,
-    0xC0,
-    0x18,
-    0xC8,
-    0x46,
-    0xF4,
-    0x6F,
-    0x49,
-    0x70,
-    0xB6,
-    0xC3,
-    0xFD,
-    0xCE,
-    0xB2,
-    0xCA,
-    0x4A,
-    0x92,
-    0xB9,
-    0xDB,
-    0x35,
-    0x3B,
-    0x1B,
-    0x3C,
-    0x57,
-    0x9A,
-    0x35,
-    0x5A,
-    0x78,
-    0xE7,
-    0x63,
-    0xD6,
-    0x3B,
-    0x86,
-    0x84,
-    0x8C,
-    0x52,
-    0x35,
-    0xA7,
-    0x24,
-    0xE3,
-    0xCF,
-    0xD4,
-    0x50,
-    0x6B,
-    0x18,
-    0x49,
-    0x5B,
-    0xD2,
-    0xCB,
-    0xBD,
-    0xB4,
-    0xC5,
-    0xA4,
-    0x76,
-    0x52,
-    0x29,
-    0x88,
-    0x05,
-    0x1E,
-    0xC7,
-    0x38,
-    0x16,
-    0x9D,
-    0x91,
-    0x20,
-    0x60,
-    0x84,
-    0x0E,
-    0x6E,
-    0x8F,
-    0x70,
-    0xFC,
-    0x30,
-    0x62,
-    0x8B,
-    0x87,
-    0x63,
-    0x3F,
-    0xA0,
-    0x00,
-    0x58,
-    0xBC,
-    0x0D,
-    0x97,
-    0xB3,
-    0x61,
-    0x2F,
-    0xD4,
-    0x08,
-    0xF9,
-    0xF8,
-    0x53,
-    0xE0,
-    0x90,
-    0xA9,
-    0x4D,
-    0x25,
-    0x83,
-    0x3F,
-    0x44,
-    0x96,
-    0xC4,
-    0x63,
-    0x81,
-    0x1F,
-    0x38,
-    0x3F,
-    0x4F,
-    0x2C,
-    0x2B,
-    0xE3,
-    0xCF,
-    0xC0,
-    0x1B,
-    0x3E,
-    0xBC,
-    0x2E,
-    0x38,
-    0xDA,
-    0xC8,
-    0xA3,
-    0xC0,
-    0x7A,
-    0x34,
-    0x72,
-    0xAF,
-    0xBA,
-    0x86,
-    0x55,
-    0x8F,
-    0x57,
-    0x20,
-    0x9D,
-    0x60,
-    0x65,
-    0x5D,
-    0x48,
-    0xE9,
-    0xCA,
-    0x7E,
-    0x70,
-    0xF2,
-    0xB6,
-    0x76,
-    0x63,
-    0xD7,
-    0x9A,
-    0x1B,
-    0xEA,
-    0x8F,
-    0x17,
-    0x35,
-    0x1C,
-    0x9A,
-    0xA9,
-    0xF2,
-    0x9B,
-    0x0A,
-    0x76,
-    0xC2,
-    0xBC,
-    0xA3,
-    0xCF,
-    0xBE,
-    0xC5,
-    0x75,
-    0xE5,
-    0x74,
-    0xFA,
-    0x00,
-    0x49,
-    0x19,
-    0x00,
-    0xF1,
-    0xED,
-    0x2F,
-    0x8D,
-    0x3D,
-    0xB2,
-    0xDA,
-    0xBA,
-    0x1D,
-    0x9E,
-    0x5A,
-    0xFA,
-    0xC1,
-    0x9E,
-    0xFA,
-    0xFD,
-    0x3C,
-    0xF1,
-    0xB3,
-    0x84,
-    0xB8,
-    0xAC,
-    0xA4,
-    0xB2,
-    0xB4,
-    0xAB,
-    0xDD,
-    0xE7,
-    0x3D,
-    0xDC,
-    0x7B,
-    0xB5,
-    0xA5,
-    0xE1,
-    0x47,
-    0x70,
-    0x74,
-    0x03,
-    0xFD,
-    0x6A,
-    0x02,
-    0xBA,
-    0x23,
-    0xCB,
-    0x5A,
-    0x5B,
-    0x0B,
-    0x2E,
-    0xE5,
-    0x73,
-    0x8C,
-    0x26,
-    0x54,
-    0x61,
-    0x2D,
-    0xD7,
-    0x9B,
-    0x6C,
-    0x46,
-    0x00,
-    0x9B,
-    0x27,
-    0x10,
-    0xEF,
-    0x91,
-    0xED,
-    0xDA,
-    0x36,
-    0x48,
-    0xBC,
-    0xDE,
-    0x28,
-    0xBE,
-    0x6F,
-    0x69,
-    0x4E,
-    0x95,
-    0x35,
-    0xAF,
-    0xF4,
-    0xC4,
-    0x2D,
-    0xC7,
-    0x9B,
-    0xFD,
-    0xAD,
-    0xF4,
-    0x79,
-    0xF1,
-    0x29,
-    0x88,
-    0xE3,
-    0xE4,
-    0x7C,
-    0x82,
-    0xAB,
-    0x63,
-    0x47,
-    0x2B,
-    0x56,
-    0xB8,
-    0x18,
-    0x75,
-    0x0D,
-    0x3D,
-    0xFE,
-    0x89,
-    0x10,
-    0xDC,
-    0xF6,
-    0x77,
-    0x52,
-    0x35,
-    0xA0,
-    0x0B,
-    0x84,
-    0x08,
-    0x89,
-    0x0E,
-    0x3D,
-    0x9A,
-    0xCF,
-    0x2B,
-    0x0A,
-    0x4C,
-    0xDA,
-    0x7D,
-    0x53,
-    0xF7,
-    0x8F,
-    0xE5,
-    0x08,
-    0x0B,
-    0xDF,
-    0x2E,
-    0xB9,
-    0x3A,
-    0xA4,
-    0x5D,
-    0xC1,
-    0x14,
-    0x5B,
-    0x91,
-    0xED,
-    0xA1,
-    0xB3,
-    0xE8,
-    0x2B,
-    0x4A,
-    0xAA,
-    0x0A,
-    0x7A,
-    0x5F,
-    0xBB,
-    0x43,
-    0x0D,
-    0x31,
-    0x42,
-    0x9E,
-    0x63,
-    0x1B,
-    0x50,
-    0x89,
-    0x1A,
-    0x2E,
-    0x97,
-    0xB8,
-    0xDB,
-    0x5D,
-    0xFC,
-    0x6F,
-    0xE1,
-    0x4F,
-    0xB5,
-    0x76,
-    0x15,
-    0x91,
-    0x88,
-    0xA1,
-    0x40,
-    0xC8,
-    0x7F,
-    0x81,
-    0xEA,
-    0xC0,
-    0x8C,
-    0xD3,
-    0x05,
-    0x91,
-    0x1E,
-    0x65,
-    0xC3,
-    0xF4,
-    0x81,
-    0x29,
-    0x46,
-    0x06,
-    0xAB,
-    0xAB,
-    0x67,
-    0xED,
-    0x64,
-    0x6A,
-    0x6B,
-    0x3B,
-    0xD2,
-    0xCA,
-    0x5B,
-    0x55,
-    0xDB,
-    0x52,
-    0x45,
-    0x8A,
-    0xDA,
-    0x5D,
-    0x13,
-    0x5B,
-    0xF7,
-    0xBD,
-    0x3C,
-    0xCA,
-    0x3C,
-    0x3D,
-    0xC3,
-    0x65,
-    0x8F,
-    0xE9,
-    0xE1,
-    0x1B,
-    0x39,
-    0xB1,
-    0x88,
-    0x3D,
-    0xB8,
-    0x0B,
-    0xF7,
-    0x09,
-    0x37,
-    0xB8,
-    0x26,
-    0xD8,
-    0x2B,
-    0x44,
-    0xD3,
-    0x2C,
-    0x4C,
-    0xC5,
-    0x28,
-    0x87,
-    0xE2,
-    0xE2,
-    0xD1,
-    0xBA,
-    0x44,
-    0x5A,
-    0x0C,
-    0x09,
-    0x1A,
-    0x01,
-    0xCE,
-    0x49,
-    0xC3,
-    0x7B,
-    0x45,
-    0x05,
-    0x5A,
-    0x32,
-    0xA9,
-    0x98,
-    0x8D,
-    0xC1,
-    0x04,
-    0xD7,
-    0x31,
-    0x67,
-    0xE9,
-    0x48,
-    0x4D,
-    0x7D,
-    0x2A,
-    0x1D,
-    0x53,
-    0x34,
-    0xC1,
-    0x3C,
-    0x2A,
-    0x25,
-    0xEF,
-    0x3B,
-    0xAD,
-    0xC1,
-    0x35,
-    0x98,
-    0x7A,
-    0x64,
-    0xC2,
-    0xE0,
-    0x21,
-    0xBE,
-    0xA9,
-    0xA0,
-    0x33,
-    0x7E,
-    0x14,
-    0xE2,
-    0x06,
-    0x2F,
-    0xAD,
-    0xAA,
-    0x13,
-    0xE3,
-    0x96,
-    0x12,
-    0x6F,
-    0x9B,
-    0x49,
-    0x66,
-    0x3B,
-    0x9C,
-    0x16,
-    0x53,
-    0x73,
-    0xE8,
-    0xE5,
-    0xEA,
-    0xEF,
-    0x7F,
-    0x52,
-    0xDD,
-    0x05,
-    0x03,
-    0xFD,
-    0xDE,
-    0x08,
-    0x77,
-    0x44,
-    0x37,
-    0x2D,
-    0x7A,
-    0x16,
-    0xB2,
-    0xF6,
-    0xBE,
-    0x5D,
-    0xDC,
-    0x6A,
-    0x6F,
-    0x4B,
-    0x93,
-    0x1D,
-    0x02,
-    0xF5,
-    0x10,
-    0x39,
-    0x07,
-    0x2D,
-    0x56,
-    0xD5,
-    0x45,
-    0xC9,
-    0xB0,
-    0x49,
-    0x5A,
-    0x45,
-    0xAC,
-    0xE2,
-    0x48,
-    0xAF,
-    0xE0,
-    0x3A,
-    0x45,
-    0x4A,
-    0x13,
-    0xF3,
-    0xB5,
-    0x39,
-    0x89,
-    0x0C,
-    0xDD,
-    0xB1,
-    0xE6,
-    0x9A,
-    0x66,
-    0xA2,
-    0xDA,
-    0x61,
-    0xAB,
-    0x3A,
-    0x00,
-    0xEA,
-    0x1D,
-    0x90,
-    0x0D,
-    0x10,
-    0x88,
-    0x10,
-    0x30,
-    0x56,
-    0x27,
-    0xB3,
-    0x9B,
-    0x46,
-    0x96,
-    0xD2,
-    0x39,
-    0x7A,
-    0xCB,
-    0xC3,
-    0x6E,
-    0x80,
-    0x0B,
-    0xED,
-    0x7C,
-    0x75,
-    0x05,
-    0xE9,
-    0x92,
-    0xE5,
-    0x4B,
-    0xF1,
-    0xFC,
-    0xBF,
-    0xB2,
-    0x4F,
-    0xCB,
-    0x8F,
-    0xA4,
-    0xCF,
-    0x20,
-    0x02,
-    0x2E,
-    0x74,
-    0xF5,
-    0xD0,
-    0x10,
-    0x6A,
-    0xFF,
-    0xB2,
-    0xF5,
-    0xCF,
-    0xD0,
-    0x3E,
-    0x67,
-    0xD2,
-    0x00,
-    0x42,
-    0xFC,
-    0x51,
-    0x5E,
-    0xE4,
-    0xF4,
-    0xF6,
-    0x2A,
-    0x12,
-    0x7A,
-    0x75,
-    0x21,
-    0xC0,
-    0x3E,
-    0x51,
-    0x9E,
-    0x75,
-    0xC5,
-    0xB4,
-    0xBC,
-    0xBD,
-    0x69,
-    0xBA,
-    0xDE,
-    0xC7,
-    0x6B,
-    0x34,
-    0x6D,
-    0xF0,
-    0xF8,
-    0xA3,
-    0x00,
-    0xCC,
-    0xA2,
-    0x49,
-    0x0F,
-    0x0B,
-    0xFF,
-    0xFD,
-    0x19,
-    0x9C,
-    0xCF,
-    0x44,
-    0xB6,
-    0xEB,
-    0x28,
-    0x47,
-    0x8E,
-    0xF6,
-    0xBD,
-    0xE4,
-    0x4B,
-    0xC4,
-    0x96,
-    0x23,
-    0x2D,
-    0x4F,
-    0xA3,
-    0x94,
-    0x08,
-    0xF7,
-    0x43,
-    0xA3,
-    0xD8,
-    0x38,
-    0xFF,
-    0x14,
-    0xFF,
-    0xD9,
-    0xCE,
-    0x1F,
-    0x20,
-    0x6E,
-    0x3A,
-    0x22,
-    0x2D,
-    0x3C,
-    0x65,
-    0x6A,
-    0xD6,
-    0x90,
-    0xA6,
-    0xF4,
-    0x35,
-    0x44,
-    0xD5,
-    0xAE,
-    0x63,
-    0x26,
-    0xD6,
-    0xC7,
-    0xA1,
-    0x05,
-    0x4F,
-    0xED,
-    0xD5,
-    0x62,
-    0xE3,
-    0x7F,
-    0xA6,
-    0xDC,
-    0x23,
-    0xA2,
-    0x5C,
-    0xC4,
-    0xFF,
-    0xAD,
-    0x26,
-    0xCF,
-    0x6F,
-    0x49,
-    0x6A,
-    0x3F,
-    0xFD,
-    0x9A,
-    0x73,
-    0x9A,
-    0xD7,
-    0x78,
-    0x8F,
-    0x2A,
-    0xA8,
-    0x46,
-    0x23,
-    0x0D,
-    0x14,
-    0x83,
-    0x57,
-    0x6E,
-    0x71,
-    0x5C,
-    0x98,
-    0x57,
-    0xDE,
-    0x43,
-    0x92,
-    0x73,
-    0x42,
-    0x6B,
-    0x39,
-    0x03,
-    0xDC,
-    0xDB,
-    0x79,
-    0xCC,
-    0xBF,
-    0x86,
-    0xBF,
-    0x11,
-    0x77,
-    0x22,
-    0x3F,
-    0x53,
-    0x29,
-    0x53,
-    0xFF,
-    0x8D,
-    0x5C,
-    0x66,
-    0xED,
-    0x58,
-    0xCC,
-    0x11,
-    0x4B,
-    0x9D,
-    0x69,
-    0x89,
-    0xFF,
-    0x66,
-    0x61,
-    0xF9,
-    0xF6,
-    0x9C,
-    0xAE,
-    0xF5,
-    0x26,
-    0xAE,
-    0x9F,
-    0xFA,
-    0x42,
-    0x9E,
-    0x18,
-    0xF1,
-    0x5E,
-    0x9C,
-    0x21,
-    0xC5,
-    0x2D,
-    0x22,
-    0x80,
-    0x62,
-    0x46,
-    0xA9,
-    0xE7,
-    0xB5,
-    0xD7,
-    0xB4,
-    0xE7,
-    0x9F,
-    0xC8,
-    0xB0,
-    0xF6,
-    0xE5,
-    0xC1,
-    0x0C,
-    0x5F,
-    0xB0,
-    0xE2,
-    0x09,
-    0xCA,
-    0xDE,
-    0x3A,
-    0x07,
-    0xEF,
-    0x80,
-    0xC4,
-    0x3B,
-    0x9E,
-    0xCB,
-    0xB8,
-    0x9F,
-    0x06,
-    0x24,
-    0xE0,
-    0x2C,
-    0xE0,
-    0x71,
-    0x0D,
-    0xE6,
-    0x2E,
-    0x24,
-    0xF8,
-    0x17,
-    0x4A,
-    0xE4,
-    0xF9,
-    0xE1,
-    0xA6,
-    0xD4,
-    0x64,
-    0xB2,
-    0xA6,
-    0xCB,
-    0xC4,
-    0x41,
-    0xBC,
-    0x19,
-    0x7A,
-    0x80,
-    0xF3,
-    0x0C,
-    0xB6,
-    0xCB,
-    0xF8,
-    0xAE,
-    0x60,
-    0xE0,
-    0xE7,
-    0x73,
-    0x06,
-    0x57,
-    0x55,
-    0x96,
-    0x49,
-    0x1E,
-    0xA8,
-    0x59,
-    0x8D,
-    0x33,
-    0x29,
-    0x25,
-    0x94,
-    0xC8,
-    0xD2,
-    0xC1,
-    0x8E,
-    0x11,
-    0x9B,
-    0xAD,
-    0xC4,
-    0x10,
-    0xA6,
-    0xFA,
-    0xD6,
-    0xC9,
-    0x8F,
-    0xF1,
-    0x11,
-    0x55,
-    0xB2,
-    0x4A,
-    0xDA,
-    0x31,
-    0xA4,
-    0x2B,
-    0x97,
-    0xCA,
-    0xBD,
-    0xC9,
-    0xE5,
-    0x9F,
-    0x89,
-    0x90,
-    0x57,
-    0x5E,
-    0xF5,
-    0xE7,
-    0x42,
-    0x3C,
-    0x05,
-    0xD2,
-    0x8E,
-    0xBD,
-    0x24,
-    0x5C,
-    0x2B,
-    0x6A,
-    0x56,
-    0x06,
-    0x29,
-    0xB8,
-    0xB3,
-    0xFC,
-    0xB7,
-    0xF5,
-    0xB0,
-    0xB7,
-    0x8A,
-    0x2A,
-    0x83,
-    0xC9,
-    0x58,
-    0xF7,
-    0x32,
-    0xD2,
-    0x29,
-    0xF1,
-    0x97,
-    0x2E,
-    0xF1,
-    0xB6,
-    0x11,
-    0xDC,
-    0x25,
-    0x11,
-    0x50,
-    0xD9,
-    0xCD,
-    0x18,
-    0x98,
-    0xDE,
-    0x03,
-    0x34,
-    0x92,
-    0xA8,
-    0x7C,
-    0x77,
-    0xE6,
-    0xB6,
-    0x0B,
-    0xF6,
-    0x70,
-    0x51,
-    0xAF,
-    0x28,
-    0xBB,
-    0xA6,
-    0xD6,
-    0xDA,
-    0x63,
-    0xA7,
-    0xA3,
-    0x58,
-    0xE5,
-    0xA4,
-    0x45,
-    0x5B,
-    0x51,
-    0x30,
-    0x22,
-    0x6D,
-    0xA9,
-    0x47,
-    0x5B,
-    0x8E,
-    0x0B,
-    0xE7,
-    0x97,
-    0x64,
-    0xEF,
-    0xB6,
-    0xA1,
-    0xF3,
-    0x26,
-    0x23,
-    0x80,
-    0xF2,
-    0x74,
-    0x2A,
-    0x5A,
-    0x2E,
-    0x26,
-    0x38,
-    0xDC,
-    0x28,
-    0x77,
-    0xE5,
-    0xE3,
-    0x9F,
-    0x45,
-    0x37,
-    0x4D,
-    0xCC,
-    0x7A,
-    0x1C,
-    0xED,
-    0x46,
-    0xFE,
-    0xF5,
-    0x77,
-    0x96,
-    0x04,
-    0x7A,
-    0x8E,
-    0x45,
-    0x9F,
-    0xED,
-    0xA0,
-    0x25,
-    0x16,
-    0x4E,
-    0x91,
-    0x7A,
-    0x3E,
-    0x41,
-    0x76,
-    0x14,
-    0x01,
-    0xEE,
-    0x04,
-    0x84,
-    0xD1,
-    0x51,
-    0x26,
-    0x1F,
-    0x7E,
-    0x26,
-    0x76,
-    0xAB,
-    0xE0,
-    0xEC,
-    0x84,
-    0x0A,
-    0x93,
-    0xDB,
-    0x44,
-    0xFF,
-    0x38,
-    0xAB,
-    0x63,
-    0x55,
-    0x8C,
-    0xD2,
-    0x65,
-    0x0A,
-    0xAB,
-    0xDA,
-    0x62,
-    0xC0,
-    0x52,
-    0x32,
-    0xFA,
-    0x5E,
-    0x85,
-    0x2D,
-    0xC1,
-    0xE0,
-    0x4F,
-    0x4A,
-    0x58,
-    0xD3,
-    0xBD,
-    0xF7,
-    0x70,
-    0xDB,
-    0x96,
-    0x42,
-    0x17,
-    0xE2,
-    0x7D,
-    0xE4,
-    0x00,
-    0xEA,
-    0xE1,
-    0x51,
-    0x08,
-    0xF6,
-    0x4C,
-    0xE5,
-    0xF3,
-    0xE3,
-    0x0D,
-    0xC7,
-    0x87,
-    0x0E,
-    0x7F,
-    0xBB,
-    0x0B,
-    0xF7,
-    0x39,
-    0x69,
-    0xC7,
-    0xDD,
-    0xA7,
-    0x67,
-    0x44,
-    0x24,
-    0x55,
-    0x10,
-    0x56,
-    0x11,
-    0x36,
-    0xB4,
-    0xC7,
-    0x6C,
-    0x80,
-    0xF5,
-    0x75,
-    0xC9,
-    0xC9,
-    0x17,
-    0xFF,
-    0xD1,
-    0xAF,
-    0xC6,
-    0x88,
-    0x72,
-    0xC6,
-    0x71,
-    0x23,
-    0xE8,
-    0xDF,
-    0xA8,
-    0xCD,
-    0x95,
-    0x06,
-    0x3B,
-    0x68,
-    0x1F,
-    0x3F,
-    0x71,
-    0x20,
-    0xF7,
-    0xE9,
-    0xD1,
-    0x0F,
-    0xCD,
-    0x56,
-    0xD8,
-    0x64,
-    0xD9,
-    0xB2,
-    0x41,
-    0xD8,
-    0x7F,
-    0xFE,
-    0x3B,
-    0x01,
-    0x2A,
-    0x48,
-    0x46,
-    0xB7,
-    0x3A,
-    0xE6,
-    0xF7,
-    0xE1,
-    0x2B,
-    0x59,
-    0x54,
-    0x2C,
-    0x44,
-    0xA9,
-    0xE6,
-    0x59,
-    0xFF,
-    0x32,
-    0x03,
-    0x2D,
-    0x46,
-    0xCB,
-    0x0F,
-    0xBF,
-    0x8E,
-    0xA7,
-    0x88,
-    0xBF,
-    0xD1,
-    0xDF,
-    0x1C,
-    0x80,
-    0xFD,
-    0x6C,
-    0x80,
-    0xFB,
-    0x65,
-    0xA0,
-    0x67,
-    0x08,
-    0x55,
-    0x2F,
-    0xFA,
-    0x3B,
-    0xFA,
-    0x38,
-    0x4D,
-    0x7C,
-    0xC2,
-    0x1A,
-    0xE4,
-    0xF3,
-    0xBA,
-    0x2C,
-    0xF9,
-    0x3E,
-    0x7A,
-    0x80,
-    0x2F,
-    0xAE,
-    0x6B,
-    0xF0,
-    0x5C,
-    0xC9,
-    0x89,
-    0xEA,
-    0x57,
-    0xC3,
-    0x0D,
-    0x0A,
-    0x4A,
-    0x39,
-    0x23,
-    0x1C,
-    0x7F,
-    0x78,
-    0x6B,
-    0xFC,
-    0x06,
-    0xF2,
-    0x00,
-    0xFB,
-    0xF6,
-    0x9F,
-    0xAB,
-    0xE3,
-    0x3D,
-    0xF5,
-    0x88,
-    0xA9,
-    0x94,
-    0x87,
-    0xED,
-    0xAE,
-    0xC6,
-    0x43,
-    0x61,
-    0xE9,
-    0x2C,
-    0xE8,
-    0x8E,
-    0xD4,
-    0xED,
-    0xC6,
-    0x73,
-    0xED,
-    0x53,
-    0xD4,
-    0xCE,
-    0xA7,
-    0x18,
-    0xB9,
-    0x3C,
-    0xB5,
-    0x1E,
-    0x00,
-    0x00,
-    0x6A,
-    0x90,
-    0xDB,
-    0x48,
-    0xFA,
-    0x7D,
-    0xA8,
-    0x18,
-    0x9F,
-    0x86,
-    0xAE,
-    0x9A,
-    0xA5,
-    0x8A,
-    0x17,
-    0x5E,
-    0xAC,
-    0x2A,
-    0xFB,
-    0xC7,
-    0x0F,
-    0xBE,
-    0x41,
-    0xD4,
-    0xCF,
-    0xB2,
-    0xC4,
-    0x18,
-    0xB6,
-    0x35,
-    0x06,
-    0xB0,
-    0xA9,
-    0xB1,
-    0x87,
-    0x80,
-    0xF6,
-    0x3A,
-    0xB4,
-    0xB5,
-    0x98,
-    0x4C,
-    0xFE,
-    0xD2,
-    0x83,
-    0xDD,
-    0xF4,
-    0xBB,
-    0x3E,
-    0x72,
-    0x90,
-    0x90,
-    0xA2,
-    0x4E,
-    0xDA,
-    0x86,
-    0x5B,
-    0x32,
-    0xFE,
-    0x2A,
-    0x0A,
-    0x4E,
-    0xFD,
-    0x4F,
-    0xE4,
-    0xD8,
-    0xA5,
-    0x89,
-    0xE9,
-    0x7D,
-    0xFB,
-    0x3A,
-    0x4B,
-    0x87,
-    0x68,
-    0x55,
-    0xD9,
-    0xF2,
-    0x40,
-    0x1F,
-    0x04,
-    0xB9,
-    0x78,
-    0xD3,
-    0x0D,
-    0x4C,
-    0x79,
-    0xAD,
-    0x42,
-    0xFD,
-    0xE0,
-    0xAF,
-    0x86,
-    0xAB,
-    0xE5,
-    0x2F,
-    0x0B,
-    0x78,
-    0x70,
-    0xDF,
-    0x53,
-    0xC3,
-    0xF5,
-    0xD6,
-    0xEE,
-    0xB7,
-    0x2F,
-    0x64,
-    0xA0,
-    0x4F,
-    0x69,
-    0x97,
-    0xFE,
-    0xA6,
-    0x57,
-    0x3F,
-    0x06,
-    0xAC,
-    0x0D,
-    0x18,
-    0xAE,
-    0x1F,
-    0x89,
-    0xCF,
-    0x98,
-    0x9D,
-    0xD7,
-    0x87,
-    0xD0,
-    0xB7,
-    0x0A,
-    0x93,
-    0xD4,
-    0xFF,
-    0x3A,
-    0xC4,
-    0x5A,
-    0x80,
-    0xA9,
-    0xCF,
-    0x3D,
-    0x6A,
-    0x59,
-    0x3C,
-    0x32,
-    0xE3,
-    0xCF,
-    0xB7,
-    0x24,
-    0x23,
-    0x1D,
-    0xD3,
-    0xA2,
-    0x01,
-    0x58,
-    0x3D,
-    0x7B,
-    0x4E,
-    0xAF,
-    0x47,
-    0x48,
-    0x47,
-    0x69,
-    0xA2,
-    0x7E,
-    0xFD,
-    0x67,
-    0xF2,
-    0x70,
-    0xA2,
-    0xDC,
-    0x67,
-    0x7E,
-    0xDD,
-    0xF7,
-    0xA3,
-    0x35,
-    0x4D,
-    0xC9,
-    0x7C,
-    0x6D,
-    0x91,
-    0x1D,
-    0x21,
-    0x3F,
-    0x1C,
-    0xF8,
-    0xC4,
-    0xCD,
-    0x01,
-    0x8A,
-    0x5F,
-    0xA9,
-    0xB8,
-    0xCE,
-    0x74,
-    0xF8,
-    0xB2,
-    0xD7,
-    0x97,
-    0xCF,
-    0x47,
-    0x56,
-    0x08,
-    0xAE,
-    0x0D,
-    0xFF,
-    0x55,
-    0x83,
-    0x55,
-    0x65,
-    0x3E,
-    0x50,
-    0xBF,
-    0x3F,
-    0x38,
-    0x21,
-    0x9D,
-    0xD9,
-    0x4E,
-    0x3B,
-    0xA8,
-    0x4C,
-    0xD4,
-    0x68,
-    0x7B,
-    0x4D,
-    0x1E,
-    0xB1,
-    0xE7,
-    0x4F,
-    0x97,
-    0xF1,
-    0x00,
-    0x2D,
-    0x7F,
-    0x6C,
-    0x3B,
-    0xD4,
-    0xA5,
-    0x99,
-    0x5F,
-    0x2C,
-    0x21,
-    0xC5,
-    0xDD,
-    0x17,
-    0x42,
-    0xDE,
-    0xB2,
-    0x1C,
-    0x38,
-    0xA5,
-    0x49,
-    0x58,
-    0xEE,
-    0x6D,
-    0xAD,
-    0xDA,
-    0x18,
-    0xA6,
-    0x5B,
-    0xDB,
-    0xF1,
-    0xFC,
-    0x72,
-    0xCC,
-    0xB3,
-    0xD3,
-    0xEF,
-    0x2A,
-    0x8A,
-    0x6E,
-    0x21,
-    0x9D,
-    0xD2,
-    0x87,
-    0xA2,
-    0xB5,
-    0x47,
-    0xC0,
-    0xE0,
-    0xE1,
-    0xFF,
-    0x7A,
-    0x74,
-    0xA7,
-    0x1D,
-    0x84,
-    0x16,
-    0xAA,
-    0x3F,
-    0xE7,
-    0x6B,
-    0x28,
-    0x03,
-    0x8A,
-    0x19,
-    0x08,
-    0x5D,
-    0x6E,
-    0x98,
-    0xCE,
-    0x22,
-    0x14,
-    0x92,
-    0xCF,
-    0x82,
-    0xD1,
-    0x2B,
-    0xF6,
-    0x91,
-    0x22,
-    0x3A,
-    0x22,
-    0x8F,
-    0x6A,
-    0xF4,
-    0x9A,
-    0x25,
-    0x53,
-    0x0D,
-    0x63,
-    0xE5,
-    0x8C,
-    0x68,
-    0x2E,
-    0x20,
-    0x59,
-    0x87,
-    0xF8,
-    0xC4,
-    0x98,
-    0x16,
-    0x04,
-    0x9C,
-    0x12,
-    0x12,
-    0x7D,
-    0xFA,
-    0xB4,
-    0xA8,
-    0x13,
-    0x83,
-    0x56,
-    0xB5,
-    0x2F,
-    0x2F,
-    0x8C,
-    0x1D,
-    0xFE,
-    0x4B,
-    0x49,
-    0x8F,
-    0x35,
-    0x14,
-    0x04,
-    0xA9,
-    0x14,
-    0x54,
-    0x51,
-    0xD9,
-    0x2D,
-    0xF3,
-    0xCA,
-    0x79,
-    0x09,
-    0x6C,
-    0x09,
-    0xB0,
-    0xB2,
-    0x98,
-    0x26,
-    0x17,
-    0xA6,
-    0x31,
-    0xFC,
-    0xB1,
-    0xDF,
-    0x00,
-    0x5A,
-    0x2B,
-    0xF5,
-    0x19,
-    0x27,
-    0xA5,
-    0x6B,
-    0xF5,
-    0x9D,
-    0x6B,
-    0xF3,
-    0xDA,
-    0x7E,
-    0xE4,
-    0xA1,
-    0x36,
-    0x18,
-    0x1D,
-    0xAC,
-    0x1C,
-    0x0A,
-    0x5F,
-    0x67,
-    0x44,
-    0x12,
-    0x43,
-    0x77,
-    0x9D,
-    0x97,
-    0xF1,
-    0xFB,
-    0x24,
-    0x98,
-    0x9B,
-    0x81,
-    0x04,
-    0x1F,
-    0xD4,
-    0x1D,
-    0x53,
-    0xCB,
-    0x68,
-    0x8F,
-    0x2F,
-    0xAF,
-    0x89,
-    0xF9,
-    0xCB,
-    0x6C,
-    0x62,
-    0x23,
-    0x17,
-    0xD1,
-    0xD5,
-    0xA3,
-    0xC2,
-    0x0D,
-    0x20,
-    0x72,
-    0xFA,
-    0x3E,
-    0x3C,
-    0x75,
-    0x3C,
-    0xFB,
-    0x9B,
-    0x65,
-    0x89,
-    0x5E,
-    0x38,
-    0xCF,
-    0x79,
-    0x97,
-    0xEE,
-    0xAB,
-    0x98,
-    0xA6,
-    0xC2,
-    0xED,
-    0xD2,
-    0x18,
-    0xDC,
-    0x17,
-    0x0C,
-    0x95,
-    0x44,
-    0x1D,
-    0x5C,
-    0x4C,
-    0xBD,
-    0xC1,
-    0xF5,
-    0xB0,
-    0xC1,
-    0x5F,
-    0x03,
-    0x68,
-    0x10,
-    0x64,
-    0x7A,
-    0xA2,
-    0x4F,
-    0x49,
-    0x8D,
-    0xD1,
-    0x6D,
-    0x59,
-    0xE8,
-    0xC7,
-    0x22,
-    0x73,
-    0x19,
-    0x05,
-    0x5D,
-    0x1A,
-    0x66,
-    0x2E,
-    0xBA,
-    0x49,
-    0x1D,
-    0x36,
-    0x83,
-    0xDC,
-    0x3E,
-    0x32,
-    0xA7,
-    0xB8,
-    0xB6,
-    0xF4,
-    0x32,
-    0x7C,
-    0x8B,
-    0x33,
-    0x05,
-    0x07,
-    0x33,
-    0xE9,
-    0xC4,
-    0xD3,
-    0x4D,
-    0xD1,
-    0x95,
-    0xD4,
-    0xBD,
-    0x50,
-    0x60,
-    0xA4,
-    0xAB,
-    0xF9,
-    0x15,
-    0xD0,
-    0xA5,
-    0x35,
-    0x76,
-    0xB2,
-    0x76,
-    0xD3,
-    0xC9,
-    0xED,
-    0x31,
-    0x2F,
-    0x69,
-    0x18,
-    0x10,
-    0xA6,
-    0xD7,
-    0x31,
-    0x84,
-    0x51,
-    0x2A,
-    0x04,
-    0x03,
-    0xAE,
-    0x2C,
-    0x83,
-    0xF3,
-    0x9A,
-    0x46,
-    0xC6,
-    0x3F,
-    0xE9,
-    0x28,
-    0xF5,
-    0x54,
-    0xED,
-    0x92,
-    0x81,
-    0x5D,
-    0xB6,
-    0x00,
-    0xF9,
-    0xEE,
-    0x5F,
-    0x92,
-    0x9B,
-    0x5A,
-    0x96,
-    0xED,
-    0x34,
-    0x0F,
-    0xCA,
-    0x01,
-    0x4F,
-    0xFD,
-    0x5F,
-    0xAE,
-    0x09,
-    0x93,
-    0xC3,
-    0x22,
-    0x67,
-    0xB4,
-    0xDE,
-    0xCE,
-    0xD7,
-    0xCA,
-    0xC7,
-    0xF4,
-    0x5D,
-    0x66,
-    0xBD,
-    0xEF,
-    0x9C,
-    0x28,
-    0x73,
-    0x19,
-    0xC2,
-    0xC2,
-    0x06,
-    0x4F,
-    0x9B,
-    0xE3,
-    0xC7,
-    0x69,
-    0x28,
-    0xDE,
-    0x5C,
-    0x4D,
-    0x71,
-    0x82,
-    0x85,
-    0x32,
-    0x0A,
-    0xF3,
-    0x0A,
-    0xBD,
-    0x63,
-    0xC1,
-    0xD9,
-    0xCC,
-    0xD1,
-    0x4A,
-    0x41,
-    0x93,
-    0xDD,
-    0x46,
-    0x92,
-    0x79,
-    0x22,
-    0x77,
-    0xAC,
-    0x1D,
-    0x08,
-    0xBC,
-    0x2E,
-    0xE8,
-    0x23,
-    0xBB,
-    0x0F,
-    0x96,
-    0x63,
-    0x5D,
-    0xA5,
-    0xDD,
-    0x9B,
-    0x22,
-    0xE6,
-    0x6E,
-    0x12,
-    0x65,
-    0xBC,
-    0xDA,
-    0x70,
-    0xBD,
-    0x1C,
-    0x2D,
-    0xD5,
-    0xBC,
-    0x23,
-    0xC5,
-    0x8D,
-    0xA7,
-    0x1B,
-    0x76,
-    0xBF,
-    0x53,
-    0x9D,
-    0x9F,
-    0x96,
-    0x73,
-    0xA0,
-    0x98,
-    0x41,
-    0xCE,
-    0x5E,
-    0xD1,
-    0x17,
-    0xCD,
-    0xDF,
-    0x88,
-    0x09,
-    0x67,
-    0xAF,
-    0x19,
-    0xDC,
-    0x36,
-    0x24,
-    0xD2,
-    0x1B,
-    0xF0,
-    0x91,
-    0x2F,
-    0x6D,
-    0x30,
-    0xC6,
-    0xC7,
-    0xFE,
-    0x74,
-    0x23,
-    0x72,
-    0x64,
-    0x06,
-    0x57,
-    0x54,
-    0xFB,
-    0x7C,
-    0x35,
-    0xC5,
-    0xB0,
-    0x6A,
-    0xF4,
-    0xA3,
-    0x04,
-    0x24,
-    0xDD,
-    0xBF,
-    0xEA,
-    0xC3,
-    0x19,
-    0x62,
-    0xB6,
-    0x90,
-    0x98,
-    0x20,
-    0x22,
-    0xC3,
-    0xB2,
-    0xC1,
-    0xCB,
-    0x13,
-    0xCA,
-    0x25,
-    0x9E,
-    0xB4,
-    0x78,
-    0x8D,
-    0xE6,
-    0x52,
-    0x28,
-    0x86,
-    0xA9,
-    0xFE,
-    0x81,
-    0x82,
-    0x80,
-    0xCF,
-    0xD5,
-    0x91,
-    0xEC,
-    0xC9,
-    0x99,
-    0x26,
-    0xF5,
-    0xA0,
-    0xB1,
-    0x9C,
-    0xE1,
-    0xE4,
-    0x90,
-    0x31,
-    0xC4,
-    0x78,
-    0xB8,
-    0x3D,
-    0x99,
-    0xFB,
-    0x13,
-    0xFF,
-    0x70,
-    0x49,
-    0x94,
-    0xA4,
-    0xED,
-    0x86,
-    0x78,
-    0x14,
-    0xF6,
-    0x4A,
-    0x04,
-    0x01,
-    0x94,
-    0x30,
-    0x96,
-    0x6F,
-    0x6E,
-    0x18,
-    0x9C,
-    0xA5,
-    0x31,
-    0xF8,
-    0xAE,
-    0x2E,
-    0x83,
-    0xFC,
-    0x59,
-    0xB5,
-    0x44,
-    0xEF,
-    0x55,
-    0x83,
-    0xBD,
-    0x8E,
-    0x70,
-    0x5B,
-    0x00,
-    0x16,
-    0xD9,
-    0x6B,
-    0x8E,
-    0xBB,
-    0x54,
-    0xF8,
-    0x0E,
-    0xEB,
-    0x44,
-    0x5A,
-    0xD0,
-    0x42,
-    0x4F,
-    0x01,
-    0xE1,
-    0x64,
-    0xF3,
-    0x43,
-    0xE2,
-    0x37,
-    0xCF,
-    0xE8,
-    0xC6,
-    0xA4,
-    0x69,
-    0x4D,
-    0xEE,
-    0xCE,
-    0x45,
-    0x5C,
-    0x2D,
-    0xAF,
-    0x80,
-    0xEE,
-    0x26,
-    0xFF,
-    0x14,
-    0xFD,
-    0x8D,
-    0x26,
-    0x72,
-    0xCE,
-    0x8A,
-    0xE9,
-    0x5E,
-    0x9A,
-    0x42,
-    0x47,
-    0x32,
-    0x68,
-    0x17,
-    0xB9,
-    0x6E,
-    0xFF,
-    0x33,
-    0xC4,
-    0xFF,
-    0x46,
-    0x4D,
-    0x2F,
-    0x73,
-    0x2D,
-    0x60,
-    0x33,
-    0x4D,
-    0xA7,
-    0x08,
-    0xC7,
-    0xEA,
-    0x46,
-    0x40,
-    0x0B,
-    0x9B,
-    0x58,
-    0x0D,
-    0xD4,
-    0x19,
-    0xE2,
-    0x6A,
-    0x41,
-    0xB6,
-    0x13,
-    0x53,
-    0x57,
-    0x6C,
-    0x67,
-    0xDD,
-    0x93,
-    0x12,
-    0x05,
-    0x46,
-    0x74,
-    0x84,
-    0x84,
-    0x41,
-    0x05,
-    0x31,
-    0x74,
-    0xDF,
-    0x4A,
-    0x7A,
-    0x3A,
-    0xB0,
-    0x02,
-    0x28,
-    0xEF,
-    0xD5,
-    0x67,
-    0x9D,
-    0xC0,
-    0x5F,
-    0x7C,
-    0x0A,
-    0xA5,
-    0x21,
-    0xF5,
-    0x3E,
-    0x9C,
-    0xCA,
-    0x87,
-    0x65,
-    0x5A,
-    0x47,
-    0x66,
-    0x3B,
-    0xF2,
-    0x79,
-    0x7B,
-    0xCF,
-    0x73,
-    0x89,
-    0xE3,
-    0x51,
-    0x88,
-    0x8D,
-    0x43,
-    0x1A,
-    0x0D,
-    0x6E,
-    0x8A,
-    0x17,
-    0x90,
-    0xB7,
-    0xC1,
-    0x68,
-    0xDE,
-    0x60,
-    0x5C,
-    0x57,
-    0x84,
-    0x3E,
-    0xC0,
-    0x79,
-    0x3B,
-    0x38,
-    0x71,
-    0x55,
-    0x06,
-    0xA7,
-    0x5C,
-    0x3E,
-    0x72,
-    0x77,
-    0xB6,
-    0xA4,
-    0x93,
-    0xAF,
-    0xA8,
-    0xB8,
-    0xF8,
-    0xA5,
-    0xF9,
-    0x3C,
-    0xB1,
-    0x26,
-    0xC4,
-    0xAE,
-    0xA4,
-    0x1B,
-    0x1D,
-    0x68,
-    0xA4,
-    0xAC,
-    0x2A,
-    0x0E,
-    0x1E,
-    0x83,
-    0x6F,
-    0x40,
-    0xE9,
-    0x1D,
-    0xA6,
-    0x64,
-    0xF2,
-    0xC5,
-    0xB4,
-    0x8F,
-    0x53,
-    0x71,
-    0xB4,
-    0x3E,
-    0x74,
-    0x6D,
-    0xFC,
-    0x9D,
-    0xC9,
-    0xF6,
-    0xA5,
-    0x54,
-    0xC7,
-    0x4B,
-    0xBC,
-    0x8B,
-    0x6A,
-    0x4F,
-    0x69,
-    0x3E,
-    0x2F,
-    0xBD,
-    0xAB,
-    0x3C,
-    0x74,
-    0x07,
-    0xFC,
-    0xDA,
-    0x6F,
-    0xC1,
-    0x98,
-    0x27,
-    0x04,
-    0x06,
-    0x9F,
-    0x52,
-    0x71,
-    0x0B,
-    0x17,
-    0xD2,
-    0x6A,
-    0x85,
-    0xCB,
-    0xDF,
-    0xCE,
-    0xFE,
-    0xCA,
-    0x4B,
-    0xD3,
-    0x6B,
-    0x6B,
-    0x49,
-    0x08,
-    0xFE,
-    0xE2,
-    0xD7,
-    0x6F,
-    0x47,
-    0x1E,
-    0xBA,
-    0x9B,
-    0x65,
-    0x7F,
-    0x46,
-    0x92,
-    0x38,
-    0x10,
-    0x68,
-    0x8A,
-    0x94,
-    0x6F,
-    0xAB,
-    0x6F,
-    0x2E,
-    0x94,
-    0xEC,
-    0x31,
-    0x3A,
-    0x95,
-    0xE5,
-    0xCD,
-    0x64,
-    0x5E,
-    0x2B,
-    0x5C,
-    0x50,
-    0xD6,
-    0x0A,
-    0x0C,
-    0xD9,
-    0x23,
-    0x85,
-    0x1A,
-    0xE6,
-    0x2D,
-    0x20,
-    0x2C,
-    0x86,
-    0xEE,
-    0xEE,
-    0x2C,
-    0x57,
-    0x81,
-    0xA1,
-    0xDA,
-    0x65,
-    0x61,
-    0x53,
-    0x4F,
-    0x5D,
-    0x41,
-    0xEF,
-    0xEC,
-    0xC8,
-    0x63,
-    0xA2,
-    0xDF,
-    0xD4,
-    0x62,
-    0x62,
-    0x93,
-    0xBD,
-    0xB0,
-    0x3C,
-    0xDC,
-    0x4B,
-    0x7B,
-    0x4C,
-    0x9A,
-    0xE0,
-    0x46,
-    0x4F,
-    0x96,
-    0x01,
-    0x20,
-    0x29,
-    0xE9,
-    0xAF,
-    0x4C,
-    0x48,
-    0x89,
-    0xFA,
-    0xCD,
-    0xBB,
-    0xE4,
-    0xD3,
-    0x64,
-    0x2B,
-    0x75,
-    0x40,
-    0x87,
-    0xA2,
-    0xA9,
-    0x8A,
-    0xF7,
-    0xCA,
-    0x3A,
-    0xF2,
-    0x63,
-    0x16,
-    0xDD,
-    0x48,
-    0xD8,
-    0xD7,
-    0x4A,
-    0xD8,
-    0x41,
-    0xC1,
-    0xFF,
-    0xAF,
-    0xF1,
-    0xBA,
-    0xA2,
-    0x91,
-    0xEE,
-    0x6D,
-    0xAF,
-    0xCD,
-    0xEC,
-    0x02,
-    0x50,
-    0x20,
-    0x0A,
-    0x95,
-    0xA9,
-    0x7B,
-    0xC8,
-    0xFB,
-    0x17,
-    0xF5,
-    0x63,
-    0x48,
-    0xD6,
-    0x80,
-    0xFE,
-    0x5D,
-    0xF1,
-    0x1B,
-    0xFF,
-    0xA5,
-    0xA9,
-    0xFE,
-    0xFA,
-    0x54,
-    0xBF,
-    0x7E,
-    0x26,
-    0x84,
-    0x59,
-    0x8B,
-    0x6F,
-    0x36,
-    0xBE,
-    0x93,
-    0x77,
-    0xA5,
-    0xA5,
-    0x18,
-    0x0C,
-    0x39,
-    0x3D,
-    0x62,
-    0xF6,
-    0xDD,
-    0x22,
-    0xF9,
-    0xF7,
-    0x52,
-    0xEA,
-    0x47,
-    0x3F,
-    0xB1,
-    0xED,
-    0x2A,
-    0x2A,
-    0x35,
-    0xB9,
-    0xF9,
-    0xF5,
-    0xFF,
-    0xB9,
-    0x68,
-    0xD8,
-    0x46,
-    0x8D,
-    0x6F,
-    0xB4,
-    0x59,
-    0x29,
-    0xCB,
-    0x3B,
-    0xC8,
-    0x9B,
-    0x52,
-    0xBC,
-    0x0E,
-    0xCC,
-    0xF0,
-    0x2D,
-    0xB1,
-    0x55,
-    0x19,
-    0x77,
-    0x7C,
-    0x84,
-    0x06,
-    0x00,
-    0xC5,
-    0x0D,
-    0x16,
-    0x31,
-    0xAA,
-    0xFE,
-    0x6B,
-    0x58,
-    0xAB,
-    0xC7,
-    0x33,
-    0xBC,
-    0x27,
-    0x04,
-    0xB6,
-    0xB5,
-    0x95,
-    0x78,
-    0xB4,
-    0x17,
-    0x5C,
-    0xC2,
-    0xC9,
-    0xC6,
-    0xD6,
-    0x4D,
-    0xB7,
-    0x06,
-    0x38,
-    0x77,
-    0x54,
-    0xB4,
-    0x8C,
-    0x3B,
-    0xB2,
-    0x65,
-    0x2C,
-    0x1B,
-    0x4A,
-    0x04,
-    0x7A,
-    0x73,
-    0x00,
-    0x38,
-    0xC0,
-    0xAA,
-    0x91,
-    0x47,
-    0x63,
-    0x60,
-    0x8C,
-    0x11,
-    0x40,
-    0xA0,
-    0xB6,
-    0x0B,
-    0xCA,
-    0x00,
-    0xAB,
-    0xE1,
-    0xD5,
-    0x56,
-    0x75,
-    0xED,
-    0xAA,
-    0x83,
-    0xEB,
-    0xBF,
-    0x34,
-    0x39,
-    0x1A,
-    0x1F,
-    0x8E,
-    0x20,
-    0x70,
-    0xEF,
-    0x12,
-    0x1F,
-    0x02,
-    0x2D,
-    0xA6,
-    0xC9,
-    0xCA,
-    0x37,
-    0x71,
-    0x5D,
-    0x71,
-    0x3D,
-    0x0A,
-    0xEC,
-    0x40,
-    0x9B,
-    0x25,
-    0xFF,
-    0x25,
-    0xA6,
-    0x61,
-    0x28,
-    0x13,
-    0xB8,
-    0x55,
-    0x68,
-    0xAE,
-    0xD5,
-    0x1A,
-    0xE2,
-    0xE8,
-    0x98,
-    0x05,
-    0x93,
-    0x79,
-    0xAF,
-    0x19,
-    0x55,
-    0x39,
-    0x6B,
-    0x1A,
-    0x69,
-    0x37,
-    0x4E,
-    0x86,
-    0x02,
-    0xDF,
-    0xCB,
-    0xEC,
-    0x14,
-    0xD4,
-    0xE3,
-    0xB6,
-    0x93,
-    0xEC,
-    0x17,
-    0x08,
-    0x31,
-    0xB2,
-    0xA8,
-    0xD0,
-    0x28,
-    0xE6,
-    0x44,
-    0x71,
-    0x3E,
-    0x26,
-    0xE7,
-    0x01,
-    0xB0,
-    0x27,
-    0x5D,
-    0x81,
-    0x9C,
-    0xBD,
-    0xF1,
-    0xEB,
-    0x0B,
-    0x1E,
-    0xA8,
-    0xE4,
-    0x80,
-    0x4B,
-    0x5C,
-    0x79,
-    0x79,
-    0x3A,
-    0xB7,
-    0x64,
-    0x54,
-    0x7D,
-    0x4B,
-    0xF9,
-    0xA9,
-    0x1B,
-    0x83,
-    0x69,
-    0x6D,
-    0xC6,
-    0xF2,
-    0xE6,
-    0x02,
-    0x7B,
-    0xFF,
-    0x69,
-    0xC0,
-    0x12,
-    0x4C,
-    0x23,
-    0xCF,
-    0xD6,
-    0x62,
-    0x85,
-    0x44,
-    0xC3,
-    0x76,
-    0x94,
-    0x25,
-    0xBE,
-    0x4D,
-    0xB8,
-    0x98,
-    0x38,
-    0xD4,
-    0x23,
-    0xF7,
-    0x7F,
-    0x07,
-    0xCC,
-    0x4A,
-    0x2B,
-    0x50,
-    0x30,
-    0x0C,
-    0x39,
-    0xC7,
-    0xBA,
-    0xEA,
-    0x97,
-    0xAD,
-    0xFD,
-    0x3F,
-    0xDE,
-    0xBE,
-    0x05,
-    0xD6,
-    0x34,
-    0x50,
-    0xBD,
-    0xBD,
-    0x7B,
-    0x0F,
-    0x17,
-    0x1F,
-    0x5C,
-    0x68,
-    0x23,
-    0x82,
-    0x07,
-    0xDF,
-    0xE5,
-    0xA9,
-    0x65,
-    0x6E,
-    0x23,
-    0xE5,
-    0x43,
-    0x00,
-    0xF2,
-    0x6F,
-    0xFB,
-    0x7D,
-    0x3F,
-    0xA1,
-    0x33,
-    0xFC,
-    0x6A,
-    0xEF,
-    0x87,
-    0x5F,
-    0xE0,
-    0x58,
-    0x64,
-    0x09,
-    0x97,
-    0x4C,
-    0xAF,
-    0x81,
-    0xAC,
-    0x97,
-    0xD4,
-    0xBA,
-    0xBD,
-    0x1A,
-    0x05,
-    0xC8,
-    0x89,
-    0xF9,
-    0xA4,
-    0x96,
-    0x37,
-    0xB6,
-    0xFE,
-    0xA2,
-    0xA2,
-    0xFC,
-    0xA8,
-    0x5D,
-    0x21,
-    0x96,
-    0x63,
-    0x2B,
-    0x89,
-    0x0C,
-    0x11,
-    0xD6,
-    0x54,
-    0x52,
-    0x9A,
-    0xB3,
-    0x5E,
-    0x2E,
-    0xA4,
-    0x80,
-    0x02,
-    0x9A,
-    0x7D,
-    0xF2,
-    0x59,
-    0x1F,
-    0x3B,
-    0x27,
-    0x08,
-    0x88,
-    0x66,
-    0x4B,
-    0x50,
-    0xBF,
-    0x7B,
-    0xFC,
-    0x21,
-    0xB0,
-    0x68,
-    0xBE,
-    0x70,
-    0xEA,
-    0x93,
-    0xB1,
-    0x5F,
-    0xCB,
-    0x61,
-    0xF0,
-    0x44,
-    0x40,
-    0xF6,
-    0x93,
-    0xF0,
-    0x96,
-    0x31,
-    0xD8,
-    0x3B,
-    0x0E,
-    0x56,
-    0x79,
-    0x0E,
-    0xAE,
-    0x7E,
-    0x46,
-    0x73,
-    0xA3,
-    0x77,
-    0x93,
-    0x32,
-    0xBB,
-    0x96,
-    0x66,
-    0x17,
-    0xC7,
-    0xDD,
-    0x3C,
-    0x26,
-    0x73,
-    0x75,
-    0xDD,
-    0x63,
-    0xC7,
-    0x85,
-    0xA0,
-    0x2C,
-    0x9C,
-    0x63,
-    0x10,
-    0xE7,
-    0x26,
-    0x6C,
-    0x4E,
-    0x83,
-    0x49,
-    0x77,
-    0x5E,
-    0xC1,
-    0xD5,
-    0xAB,
-    0xFD,
-    0x73,
-    0xCF,
-    0x34,
-    0xB1,
-    0x21,
-    0x58,
-    0x80,
-    0x02,
-    0x9D,
-    0xB7,
-    0x1B,
-    0x27,
-    0x22,
-    0x8E,
-    0x73,
-    0x74,
-    0xC3,
-    0x10,
-    0x9D,
-    0x37,
-    0x85,
-    0x2E,
-    0x27,
-    0x21,
-    0x11,
-    0x6B,
-    0x43,
-    0xD2,
-    0xDA,
-    0x87,
-    0x99,
-    0x3A,
-    0x70,
-    0x14,
-    0x81,
-    0x6B,
-    0x95,
-    0x56,
-    0xF0,
-    0x1B,
-    0x72,
-    0x24,
-    0x28,
-    0x4E,
-    0xF9,
-    0xCB,
-    0x1D,
-    0x79,
-    0xF5,
-    0xC6,
-    0x31,
-    0xB6,
-    0x75,
-    0xA1,
-    0xBA,
-    0x7E,
-    0x90,
-    0x4A,
-    0xA1,
-    0x82,
-    0x27,
-    0xE3,
-    0x8C,
-    0x4F,
-    0x67,
-    0x89,
-    0xDD,
-    0xF2,
-    0x68,
-    0xD2,
-    0x39,
-    0x43,
-    0xF6,
-    0x1D,
-    0x30,
-    0xFB,
-    0xF9,
-    0x6D,
-    0xFE,
-    0xBB,
-    0x90,
-    0x0E,
-    0xC5,
-    0x55,
-    0x2B,
-    0xC9,
-    0xBC,
-    0x0A,
-    0x1A,
-    0x87,
-    0x9A,
-    0x43,
-    0x00,
-    0xD8,
-    0xC2,
-    0x85,
-    0xB0,
-    0xC2,
-    0xE9,
-    0xD5,
-    0x1A,
-    0x44,
-    0x5F,
-    0x70,
-    0xCC,
-    0xF5,
-    0x38,
-    0x6E,
-    0x05,
-    0xD8,
-    0xCB,
-    0x6B,
-    0x72,
-    0x21,
-    0xEE,
-    0x11,
-    0x2D,
-    0x87,
-    0xA7,
-    0x64,
-    0xCF,
-    0xF3,
-    0xCC,
-    0x23,
-    0x54,
-    0x34,
-    0xFC,
-    0xDB,
-    0xB1,
-    0x9B,
-    0x7F,
-    0xFC,
-    0xF9,
-    0x28,
-    0x8D,
-    0x2F,
-    0xD0,
-    0x9E,
-    0x9C,
-    0x64,
-    0x28,
-    0x9D,
-    0x99,
-    0xBA,
-    0xD4,
-    0xCD,
-    0x08,
-    0xB2,
-    0x1C,
-    0x49,
-    0x0A,
-    0x18,
-    0xE6,
-    0xF5,
-    0xEC,
-    0xC9,
-    0x96,
-    0x21,
-    0x7F,
-    0x53,
-    0x96,
-    0x95,
-    0xD5,
-    0xD6,
-    0xE1,
-    0x6D,
-    0xEB,
-    0xA4,
-    0xE9,
-    0x55,
-    0xFD,
-    0x91,
-    0x0B,
-    0xCF,
-    0x95,
-    0x31,
-    0xC7,
-    0xFE,
-    0x76,
-    0x17,
-    0xBE,
-    0xE6,
-    0x4A,
-    0x1F,
-    0x81,
-    0xA1,
-    0x3C,
-    0x42,
-    0x3E,
-    0xE4,
-    0xE6,
-    0x29,
-    0x23,
-    0x65,
-    0x86,
-    0x88,
-    0x4F,
-    0x6B,
-    0x27,
-    0xDB,
-    0x4C,
-    0xDD,
-    0xCD,
-    0x38,
-    0x69,
-    0x0D,
-    0x59,
-    0xFE,
-    0x23,
-    0xE9,
-    0x2F,
-    0x97,
-    0xEC,
-    0x11,
-    0x70,
-    0x6E,
-    0x5F,
-    0xE6,
-    0xEF,
-    0xB4,
-    0x84,
-    0xBA,
-    0x1B,
-    0x5E,
-    0x23,
-    0x3D,
-    0xE3,
-    0xAE,
-    0xB1,
-    0xBC,
-    0xC4,
-    0xE9,
-    0x56,
-    0xC3,
-    0xB3,
-    0xFC,
-    0xF3,
-    0x26,
-    0x59,
-    0xED,
-    0xCB,
-    0xB0,
-    0xD3,
-    0x1F,
-    0x2F,
-    0x51,
-    0xF6,
-    0x7B,
-    0xB9,
-    0xAC,
-    0xAC,
-    0xEB,
-    0x12,
-    0xF5,
-    0xC3,
-    0xB5,
-    0x84,
-    0xEA,
-    0x46,
-    0x18,
-    0xC2,
-    0x0F,
-    0xC1,
-    0x99,
-    0xCD,
-    0x84,
-    0xCE,
-    0xE0,
-    0x5F,
-    0x0B,
-    0x69,
-    0x4E,
-    0x22,
-    0xD4,
-    0x4F,
-    0x00,
-    0x39,
-    0x91,
-    0xDA,
-    0x6E,
-    0x79,
-    0x2A,
-    0xF7,
-    0xF2,
-    0xC5,
-    0x73,
-    0xB1,
-    0x53,
-    0xFA,
-    0x8E,
-    0xA5,
-    0xAE,
-    0x4A,
-    0xC5,
-    0x93,
-    0x3A,
-    0x4E,
-    0xEC,
-    0xCB,
-    0x3B,
-    0xCB,
-    0xB2,
-    0x9B,
-    0x41,
-    0x6F,
-    0xB3,
-    0xD5,
-    0x63,
-    0x55,
-    0x05,
-    0x7C,
-    0xF3,
-    0x97,
-    0x4D,
-    0xED,
-    0xA2,
-    0x95,
-    0x21,
-    0x8E,
-    0x12,
-    0x4B,
-    0xC2,
-    0xC7,
-    0xCE,
-    0x0C,
-    0x19,
-    0x56,
-    0xE5,
-    0x31,
-    0xD1,
-    0xF0,
-    0xBA,
-    0xEF,
-    0xEB,
-    0xA1,
-    0x17,
-    0x32,
-    0x0D,
-    0x49,
-    0xCA,
-    0xDD,
-    0xFD,
-    0xA4,
-    0x4F,
-    0x18,
-    0x02,
-    0xD9,
-    0xD2,
-    0x4E,
-    0x08,
-    0x05,
-    0x51,
-    0xB9,
-    0x81,
-    0x1B,
-    0x50,
-    0x41,
-    0x6D,
-    0xFF,
-    0xA0,
-    0xFD,
-    0x3B,
-    0x54,
-    0x8A,
-    0x11,
-    0x8D,
-    0xA6,
-    0xAD,
-    0xA2,
-    0xDC,
-    0x8A,
-    0xC7,
-    0x2E,
-    0x66,
-    0x96,
-    0x6A,
-    0x09,
-    0x89,
-    0x89,
-    0x88,
-    0x85,
-    0x8E,
-    0xEB,
-    0x5A,
-    0xFE,
-    0x0C,
-    0x6A,
-    0xB3,
-    0xC9,
-    0x98,
-    0xD3,
-    0xC8,
-    0xA7,
-    0xC4,
-    0xD9,
-    0x4C,
-    0x93,
-    0x48,
-    0x7D,
-    0xF5,
-    0x0E,
-    0x59,
-    0xA5,
-    0x7A,
-    0xDB,
-    0x8B,
-    0x72,
-    0x40,
-    0x14,
-    0x62,
-    0x10,
-    0x39,
-    0x47,
-    0xB9,
-    0x67,
-    0x15,
-    0x05,
-    0x93,
-    0x5B,
-    0x30,
-    0x1C,
-    0x94,
-    0xBA,
-    0x8B,
-    0xD3,
-    0x38,
-    0x7D,
-    0x53,
-    0x9B,
-    0x4C,
-    0x7C,
-    0x62,
-    0x43,
-    0x4A,
-    0x48,
-    0x6B,
-    0x90,
-    0x58,
-    0x0A,
-    0x87,
-    0x2A,
-    0xF3,
-    0xB6,
-    0x96,
-    0xC8,
-    0xF6,
-    0x0C,
-    0xE2,
-    0xE0,
-    0xBE,
-    0x5E,
-    0x97,
-    0x65,
-    0x20,
-    0xDF,
-    0x0C,
-    0xB5,
-    0xA1,
-    0xBD,
-    0x4E,
-    0xA6,
-    0x93,
-    0x52,
-    0xD2,
-    0x8D,
-    0xB7,
-    0x33,
-    0x79,
-    0xED,
-    0xD3,
-    0xC4,
-    0xBC,
-    0xEA,
-    0xC3,
-    0x16,
-    0x11,
-    0xCC,
-    0x5A,
-    0x16,
-    0x7B,
-    0x33,
-    0x10,
-    0x47,
-    0xCF,
-    0x54,
-    0xA1,
-    0x26,
-    0xD9,
-    0xE1,
-    0xF8,
-    0x1C,
-    0x34,
-    0x2B,
-    0x21,
-    0x5E,
-    0x8E,
-    0x51,
-    0x82,
-    0x8A,
-    0xAA,
-    0xA5,
-    0x77,
-    0xCC,
-    0xDD,
-    0x7F,
-    0x09,
-    0x91,
-    0x2E,
-    0xA3,
-    0x3E,
-    0x91,
-    0xD6,
-    0x54,
-    0xAB,
-    0xA9,
-    0x43,
-    0xDF,
-    0xAF,
-    0xEA,
-    0xE3,
-    0x22,
-    0x66,
-    0xDC,
-    0x1B,
-    0x93,
-    0xCD,
-    0x0F,
-    0xDB,
-    0x9E,
-    0x1F,
-    0x73,
-    0xAC,
-    0xCF,
-    0x20,
-    0x5C,
-    0x53,
-    0xD9,
-    0xF6,
-    0x1C,
-    0xF9,
-    0x7C,
-    0x00,
-    0xDB,
-    0x1B,
-    0x69,
-    0x5B,
-    0xE8,
-    0x19,
-    0xA0,
-    0xDF,
-    0x33,
-    0xF9,
-    0x10,
-    0xAB,
-    0x2A,
-    0x51,
-    0x7A,
-    0xAB,
-    0xCB,
-    0x80,
-    0xF7,
-    0x3C,
-    0xC5,
-    0x6A,
-    0x12,
-    0xE7,
-    0xDE,
-    0x79,
-    0xE1,
-    0x15,
-    0xF7,
-    0xCF,
-    0x93,
-    0x23,
-    0xA7,
-    0x19,
-    0x59,
-    0x75,
-    0x7E,
-    0xF6,
-    0x6B,
-    0xC8,
-    0xB5,
-    0x22,
-    0xB7,
-    0xCB,
-    0xFB,
-    0x1B,
-    0xB1,
-    0x17,
-    0xBA,
-    0x27,
-    0xDA,
-    0xB5,
-    0x9D,
-    0x0C,
-    0x4E,
-    0x4E,
-    0x15,
-    0x12,
-    0x6C,
-    0x8C,
-    0x3C,
-    0x1A,
-    0x63,
-    0xD3,
-    0x8F,
-    0x9B,
-    0xA6,
-    0xDF,
-    0x98,
-    0x1E,
-    0xB7,
-    0x62,
-    0xDC,
-    0xCE,
-    0xA1,
-    0x4E,
-    0xB3,
-    0x71,
-    0xBE,
-    0x5B,
-    0xDA,
-    0xCB,
-    0xF5,
-    0xDD,
-    0x73,
-    0x6D,
-    0xB8,
-    0xFD,
-    0x01,
-    0x69,
-    0x28,
-    0x94,
-    0xDE,
-    0x24,
-    0x6D,
-    0xC5,
-    0x98,
-    0xDB,
-    0x82,
-    0x67,
-    0x37,
-    0x81,
-    0xE3,
-    0x3F,
-    0x4F,
-    0x99,
-    0xE7,
-    0x33,
-    0x4D,
-    0x3D,
-    0x2D,
-    0x5F,
-    0x8E,
-    0xA1,
-    0xA4,
-    0x69,
-    0x7B,
-    0x95,
-    0x95,
-    0x85,
-    0xB3,
-    0xBD,
-    0x86,
-    0xD8,
-    0xA5,
-    0x3A,
-    0x2E,
-    0x91,
-    0xE1,
-    0x59,
-    0x65,
-    0x73,
-    0x7F,
-    0xE8,
-    0x31,
-    0xF0,
-    0xD2,
-    0x17,
-    0xA0,
-    0x73,
-    0x3A,
-    0x11,
-    0x6F,
-    0xBE,
-    0x9F,
-    0xCC,
-    0xB7,
-    0xD0,
-    0xD0,
-    0xA0,
-    0x8E,
-    0x9A,
-    0xCE,
-    0xF1,
-    0xC2,
-    0xF6,
-    0x60,
-    0xBA,
-    0x19,
-    0xA4,
-    0x42,
-    0x87,
-    0x98,
-    0x31,
-    0xDA,
-    0x5D,
-    0x7C,
-    0x6A,
-    0x59,
-    0x84,
-    0x64,
-    0xFF,
-    0x76,
-    0x42,
-    0xC5,
-    0x12,
-    0x2A,
-    0x68,
-    0x6A,
-    0x42,
-    0x9B,
-    0x5C,
-    0xBC,
-    0xC7,
-    0x75,
-    0x31,
-    0x11,
-    0x5B,
-    0x9A,
-    0x59,
-    0x96,
-    0x3A,
-    0xB4,
-    0x19,
-    0x7D,
-    0x95,
-    0x2E,
-    0xB4,
-    0x0A,
-    0xD0,
-    0x19,
-    0x69,
-    0xE0,
-    0x97,
-    0x2D,
-    0xDF,
-    0x82,
-    0x54,
-    0x9C,
-    0xCA,
-    0x92,
-    0x6B,
-    0x57,
-    0x47,
-    0xA9,
-    0x77,
-    0x19,
-    0x10,
-    0x05,
-    0x0B,
-    0xDD,
-    0x7F,
-    0x6D,
-    0xC4,
-    0xD8,
-    0xFF,
-    0x78,
-    0xEB,
-    0x05,
-    0xFF,
-    0x02,
-    0x9C,
-    0x10,
-    0x40,
-    0xA2,
-    0x74,
-    0xD4,
-    0xAD,
-    0x0B,
-    0xF6,
-    0x77,
-    0x3B,
-    0xA1,
-    0xE4,
-    0x67,
-    0xEF,
-    0x92,
-    0xCD,
-    0x2E,
-    0xD8,
-    0x3E,
-    0x4B,
-    0xEA,
-    0xE4,
-    0x51,
-    0x8B,
-    0x2A,
-    0x6C,
-    0x74,
-    0x83,
-    0xC1,
-    0xAD,
-    0x1E,
-    0xF9,
-    0x77,
-    0x14,
-    0x85,
-    0xCC,
-    0x01,
-    0xC1,
-    0x84,
-    0x5E,
-    0x17,
-    0xEE,
-    0x9C,
-    0x1E,
-    0x61,
-    0xC6,
-    0x42,
-    0xBC,
-    0x1B,
-    0x29,
-    0x0E,
-    0x45,
-    0xE9,
-    0x40,
-    0x6E,
-    0x42,
-    0xE5,
-    0x16,
-    0x7A,
-    0xCE,
-    0x9C,
-    0x15,
-    0xEF,
-    0xF2,
-    0x0F,
-    0x6F,
-    0xD5,
-    0x18,
-    0x8B,
-    0xED,
-    0x32,
-    0x4D,
-    0xC6,
-    0x44,
-    0x27,
-    0x35,
-    0x9F,
-    0x11,
-    0xF3,
-    0x3C,
-    0xE9,
-    0x3C,
-    0x59,
-    0xD3,
-    0xAF,
-    0x58,
-    0x29,
-    0x41,
-    0xC9,
-    0x28,
-    0xD3,
-    0xF5,
-    0x5F,
-    0x03,
-    0xD6,
-    0x38,
-    0xA5,
-    0xCA,
-    0x37,
-    0xD8,
-    0x39,
-    0x8D,
-    0xF9,
-    0x13,
-    0x77,
-    0x64,
-    0x98,
-    0xE8,
-    0x62,
-    0x3D,
-    0x50,
-    0xE2,
-    0xFE,
-    0xAD,
-    0xB9,
-    0x8C,
-    0x69,
-    0x97,
-    0x5B,
-    0xCC,
-    0x63,
-    0xB8,
-    0xF9,
-    0xCE,
-    0xF8,
-    0x2A,
-    0x4F,
-    0x5D,
-    0x9F,
-    0x9A,
-    0x4A,
-    0xED,
-    0x42,
-    0x33,
-    0x92,
-    0x64,
-    0x2F,
-    0x73,
-    0x96,
-    0xB9,
-    0x92,
-    0x08,
-    0x80,
-    0xE2,
-    0x6D,
-    0xAC,
-    0xFA,
-    0xB1,
-    0xBE,
-    0xB3,
-    0xA1,
-    0x44,
-    0xA8,
-    0xD7,
-    0xBF,
-    0x7A,
-    0x61,
-    0xFF,
-    0x72,
-    0x62,
-    0x74,
-    0x0B,
-    0xE1,
-    0x4F,
-    0xC3,
-    0x16,
-    0xDC,
-    0x5A,
-    0x2E,
-    0x85,
-    0x1B,
-    0x2D,
-    0x69,
-    0x25,
-    0x6D,
-    0x54,
-    0x99,
-    0x1E,
-    0xBF,
-    0xE8,
-    0x07,
-    0x18,
-    0x14,
-    0x34,
-    0x01,
-    0x14,
-    0x34,
-    0x8F,
-    0x3A,
-    0x03,
-    0x49,
-    0x55,
-    0xEA,
-    0x49,
-    0x76,
-    0x77,
-    0x5B,
-    0x6B,
-    0xF5,
-    0x22,
-    0x7D,
-    0x71,
-    0xA9,
-    0x17,
-    0xB4,
-    0xF8,
-    0x9E,
-    0x8F,
-    0x45,
-    0xFA,
-    0x22,
-    0x03,
-    0x94,
-    0x74,
-    0x40,
-    0x22,
-    0xBD,
-    0x18,
-    0x79,
-    0xDC,
-    0xF8,
-    0x0E,
-    0xE6,
-    0x9C,
-    0xC8,
-    0x75,
-    0x5E,
-    0x6D,
-    0x60,
-    0x50,
-    0x63,
-    0x66,
-    0xE8,
-    0x19,
-    0x6C,
-    0x08,
-    0x5E,
-    0xEF,
-    0x87,
-    0x0F,
-    0xD6,
-    0x38,
-    0x61,
-    0xED,
-    0xB8,
-    0x33,
-    0xE9,
-    0x5B,
-    0x15,
-    0x54,
-    0x06,
-    0xE9,
-    0xCE,
-    0x44,
-    0x00,
-    0xCE,
-    0xEA,
-    0x42,
-    0x45,
-    0x6B,
-    0x7D,
-    0x8F,
-    0xE1,
-    0x79,
-    0xBB,
-    0x53,
-    0x17,
-    0x45,
-    0xBE,
-    0x3A,
-    0xC9,
-    0x3C,
-    0xE4,
-    0x26,
-    0x5E,
-    0xBB,
-    0x9A,
-    0x3A,
-    0xFD,
-    0x15,
-    0x5D,
-    0x3F,
-    0x77,
-    0x70,
-    0xB5,
-    0x10,
-    0xA8,
-    0x45,
-    0x0F,
-    0x16,
-    0x4B,
-    0xC4,
-    0x58,
-    0x95,
-    0x01,
-    0x11,
-    0xBF,
-    0xE4,
-    0x7F,
-    0x75,
-    0xF6,
-    0x88,
-    0xF9,
-    0xD2,
-    0x8F,
-    0xFF,
-    0x92,
-    0xAB,
-    0xE3,
-    0x34,
-    0x69,
-    0x7A,
-    0xB7,
-    0x87,
-    0x34,
-    0x95,
-    0xD9,
-    0x78,
-    0xC2,
-    0xD3,
-    0xC4,
-    0xA0,
-    0xCB,
-    0x3F,
-    0xE1,
-    0x4E,
-    0xE4,
-    0x8E,
-    0x7D,
-    0x1C,
-    0x22,
-    0x71,
-    0x90,
-    0x6C,
-    0x02,
-    0x32,
-    0x92,
-    0x82,
-    0xC4,
-    0x4A,
-    0x33,
-    0xAA,
-    0x2E,
-    0xB1,
-    0x67,
-    0x19,
-    0x77,
-    0xA1,
-    0xD0,
-    0xFD,
-    0xCF,
-    0xC0,
-    0x74,
-    0x91,
-    0x38,
-    0x75,
-    0x3C,
-    0x08,
-    0x86,
-    0xC8,
-    0x3D,
-    0x82,
-    0x07,
-    0x2E,
-    0xEC,
-    0xE5,
-    0xC3,
-    0x06,
-    0x8F,
-    0x02,
-    0x1F,
-    0xB5,
-    0x9E,
-    0x83,
-    0x34,
-    0x09,
-    0x31,
-    0xD5,
-    0x19,
-    0xD0,
-    0xC7,
-    0xF8,
-    0x89,
-    0xF8,
-    0x4F,
-    0x5F,
-    0x10,
-    0x89,
-    0x95,
-    0x3C,
-    0xE2,
-    0x2E,
-    0x31,
-    0xCE,
-    0xEB,
-    0x42,
-    0xCD,
-    0xB0,
-    0x7D,
-    0x1A,
-    0xC7,
-    0x08,
-    0x42,
-    0xFF,
-    0x6D,
-    0x56,
-    0x82,
-    0xC2,
-    0x4C,
-    0x5A,
-    0x94,
-    0x99,
-    0x28,
-    0x44,
-    0x00,
-    0x6D,
-    0x91,
-    0x70,
-    0xDD,
-    0x0B,
-    0xB0,
-    0x1D,
-    0x20,
-    0x10,
-    0xF1,
-    0x40,
-    0x45,
-    0xC8,
-    0x47,
-    0xA4,
-    0xB3,
-    0xC9,
-    0x07,
-    0xF2,
-    0x02,
-    0x36,
-    0x20,
-    0x96,
-    0x80,
-    0x75,
-    0xE9,
-    0x2F,
-    0x31,
-    0xD4,
-    0x73,
-    0xC7,
-    0x96,
-    0x8B,
-    0x85,
-    0xB7,
-    0xC6,
-    0xE3,
-    0x20,
-    0xF7,
-    0x91,
-    0xFB,
-    0x4C,
-    0x6E,
-    0x18,
-    0x1D,
-    0x84,
-    0x86,
-    0xCD,
-    0x4E,
-    0x9F,
-    0xAB,
-    0xA9,
-    0x87,
-    0x5C,
-    0x94,
-    0xF3,
-    0x81,
-    0xA6,
-    0x46,
-    0x3C,
-    0x81,
-    0x88,
-    0x64,
-    0xE6,
-    0xF5,
-    0x6E,
-    0x15,
-    0xA6,
-    0x68,
-    0x56,
-    0x82,
-    0x0D,
-    0x4A,
-    0xDF,
-    0xF7,
-    0xE8,
-    0x73,
-    0x21,
-    0x33,
-    0x35,
-    0xF6,
-    0xE8,
-    0x5A,
-    0x3D,
-    0x27,
-    0x52,
-    0x04,
-    0x02,
-    0x70,
-    0xF9,
-    0x57,
-    0x71,
-    0x39,
-    0x15,
-    0x1B,
-    0x55,
-    0xF9,
-    0xA2,
-    0x64,
-    0x89,
-    0xC4,
-    0xDF,
-    0x77,
-    0x30,
-    0xFC,
-    0x15,
-    0x93,
-    0xB1,
-    0x15,
-    0x5E,
-    0x8E,
-    0xA2,
-    0x3B,
-    0x06,
-    0x4E,
-    0x1F,
-    0x74,
-    0xDE,
-    0x2F,
-    0x94,
-    0xCD,
-    0xB6,
-    0x48,
-    0xB6,
-    0x6E,
-    0xFA,
-    0x91,
-    0x77,
-    0x72,
-    0x41,
-    0x78,
-    0x71,
-    0x6A,
-    0xA1,
-    0x17,
-    0xAE,
-    0x9C,
-    0x89,
-    0x6B,
-    0x31,
-    0x0B,
-    0x24,
-    0x3A,
-    0x35,
-    0x0D,
-    0x0B,
-    0x35,
-    0x4C,
-    0xC3,
-    0x36,
-    0x40,
-    0x37,
-    0x40,
-    0x67,
-    0xD5,
-    0x17,
-    0xA6,
-    0x41,
-    0xE3,
-    0x54,
-    0xC9,
-    0x56,
-    0x4D,
-    0x76,
-    0x15,
-    0x62,
-    0x79,
-    0x1C,
-    0x17,
-    0x34,
-    0xBB,
-    0xBD,
-    0x84,
-    0x3B,
-    0x54,
-    0x26,
-    0x93,
-    0x0A,
-    0x08,
-    0x09,
-    0x65,
-    0xCD,
-    0x5B,
-    0x05,
-    0xA5,
-    0xD2,
-    0xCE,
-    0xB4,
-    0x50,
-    0xA3,
-    0xFA,
-    0x90,
-    0x75,
-    0x4D,
-    0x22,
-    0x31,
-    0xC9,
-    0xB5,
-    0x74,
-    0x13,
-    0x57,
-    0x9A,
-    0xBD,
-    0x10,
-    0xE8,
-    0x29,
-    0x27,
-    0xB8,
-    0x3A,
-    0x44,
-    0xC2,
-    0x45,
-    0xA3,
-    0xD8,
-    0xAD,
-    0xCB,
-    0x86,
-    0x3D,
-    0xB4,
-    0x2D,
-    0x6C,
-    0x0B,
-    0xB4,
-    0x17,
-    0x85,
-    0x00,
-    0x7E,
-    0x19,
-    0x68,
-    0x72,
-    0x09,
-    0x5A,
-    0xEF,
-    0x7F,
-    0x7E,
-    0x04,
-    0x90,
-    0xD4,
-    0x73,
-    0xD8,
-    0xF8,
-    0xBF,
-    0x33,
-    0x1B,
-    0x44,
-    0x2F,
-    0xDD,
-    0x64,
-    0xAC,
-    0x7C,
-    0x0C,
-    0x3F,
-    0x64,
-    0xDA,
-    0xF9,
-    0x99,
-    0x18,
-    0x8F,
-    0x61,
-    0x42,
-    0x2C,
-    0x25,
-    0xF2,
-    0xDD,
-    0x72,
-    0xB7,
-    0x2D,
-    0xB1,
-    0x3C,
-    0x68,
-    0xCE,
-    0xCA,
-    0xE2,
-    0x57,
-    0x88,
-    0x80,
-    0x12,
-    0xA9,
-    0x0F,
-    0xA2,
-    0x55,
-    0x99,
-    0xFB,
-    0x53,
-    0xFF,
-    0x38,
-    0x71,
-    0xFD,
-    0x6C,
-    0x4A,
-    0x22,
-    0xE6,
-    0x58,
-    0x9D,
-    0x28,
-    0xC9,
-    0x09,
-    0x58,
-    0x97,
-    0x51,
-    0xCF,
-    0x0A,
-    0x17,
-    0xB7,
-    0x9B,
-    0xC2,
-    0x6F,
-    0x05,
-    0x4F,
-    0x6A,
-    0x5A,
-    0x25,
-    0x4F,
-    0x9A,
-    0xA8,
-    0xB8,
-    0xB1,
-    0xA0,
-    0xB2,
-    0x26,
-    0x64,
-    0xB2,
-    0x73,
-    0xB1,
-    0x51,
-    0x5E,
-    0xB8,
-    0x9E,
-    0xBE,
-    0x66,
-    0x6B,
-    0x34,
-    0xFA,
-    0x37,
-    0x30,
-    0x5D,
-    0x74,
-    0x1B,
-    0x36,
-    0x24,
-    0xEB,
-    0xD0,
-    0x17,
-    0x0B,
-    0xA9,
-    0x29,
-    0x45,
-    0x06,
-    0x50,
-    0x57,
-    0x23,
-    0x79,
-    0x41,
-    0xDB,
-    0xB2,
-    0xD2,
-    0xE2,
-    0x28,
-    0xF9,
-    0xFD,
-    0x8A,
-    0xB6,
-    0x67,
-    0xFB,
-    0x9A,
-    0x14,
-    0xC4,
-    0xFB,
-    0x15,
-    0xF0,
-    0xC4,
-    0x1F,
-    0x63,
-    0x95,
-    0x07,
-    0xBA,
-    0x16,
-    0xA7,
-    0xFE,
-    0xBF,
-    0x61,
-    0x97,
-    0xD0,
-    0xA0,
-    0x5E,
-    0x74,
-    0x9B,
-    0x01,
-    0xED,
-    0x35,
-    0xBB,
-    0x33,
-    0x2F,
-    0xF1,
-    0x40,
-    0xF9,
-    0x54,
-    0x6F,
-    0x4F,
-    0x51,
-    0xC2,
-    0x72,
-    0x42,
-    0xE3,
-    0x76,
-    0xAA,
-    0x7E,
-    0x89,
-    0x40,
-    0xCD,
-    0x0B,
-    0xA1,
-    0x4E,
-    0x50,
-    0xA9,
-    0xBE,
-    0x3A,
-    0xA8,
-    0xCC,
-    0x0F,
-    0x36,
-    0xF0,
-    0xAC,
-    0xCF,
-    0xDD,
-    0x4A,
-    0x70,
-    0xFF,
-    0x69,
-    0x68,
-    0x1A,
-    0xDE,
-    0x2C,
-    0x60,
-    0xFE,
-    0x77,
-    0x4F,
-    0x0E,
-    0xB2,
-    0xD0,
-    0xD8,
-    0xF0,
-    0x81,
-    0x81,
-    0x63,
-    0x76,
-    0xB5,
-    0x4D,
-    0x50,
-    0x25,
-    0x08,
-    0x3B,
-    0xDD,
-    0x43,
-    0x6B,
-    0xFB,
-    0xF3,
-    0xDB,
-    0x50,
-    0x76,
-    0x7C,
-    0x0C,
-    0x5C,
-    0xE7,
-    0x25,
-    0xB4,
-    0x2F,
-    0x9D,
-    0xA9,
-    0xA8,
-    0xDF,
-    0x87,
-    0xE9,
-    0x73,
-    0xA8,
-    0x57,
-    0x5E,
-    0x1A,
-    0x3C,
-    0x79,
-    0x98,
-    0x9F,
-    0x58,
-    0x6D,
-    0x58,
-    0xEE,
-    0xD4,
-    0x1B,
-    0x29,
-    0x2D,
-    0xEC,
-    0xA0,
-    0xC5,
-    0xDF,
-    0x14,
-    0x8B,
-    0xB4,
-    0x00,
-    0xF7,
-    0xAA,
-    0x1B,
-    0x8E,
-    0xC0,
-    0x0B,
-    0x5A,
-    0x74,
-    0x81,
-    0xBD,
-    0xBF,
-    0xE4,
-    0xAF,
-    0x43,
-    0x2B,
-    0xFD,
-    0xDC,
-    0x61,
-    0xC0,
-    0x95,
-    0x43,
-    0x02,
-    0xA7,
-    0x70,
-    0xC8,
-    0x40,
-    0x45,
-    0x54,
-    0x8F,
-    0x0C,
-    0x19,
-    0x6D,
-    0xF5,
-    0xBD,
-    0xB4,
-    0x7D,
-    0x2A,
-    0xB7,
-    0xF9,
-    0x9D,
-    0x1E,
-    0x5E,
-    0x57,
-    0x4F,
-    0x9C,
-    0xB7,
-    0x51,
-    0xF9,
-    0x73,
-    0x53,
-    0x9E,
-    0x64,
-    0xCE,
-    0x49,
-    0xF1,
-    0x54,
-    0x35,
-    0x0E,
-    0x97,
-    0xD0,
-    0xEB,
-    0xE0,
-    0x8B,
-    0xEB,
-    0x29,
-    0xC1,
-    0x7E,
-    0x7C,
-    0xC1,
-    0xD8,
-    0x4D,
-    0xD3,
-    0xE0,
-    0x15,
-    0x3F,
-    0x10,
-    0xC3,
-    0x7E,
-    0xB3,
-    0x29,
-    0xF9,
-    0x1B,
-    0x3D,
-    0xAD,
-    0xA6,
-    0x6B,
-    0xA5,
-    0x16,
-    0x0F,
-    0xA6,
-    0xC9,
-    0x32,
-    0x9E,
-    0xCD,
-    0xDF,
-    0x18,
-    0x64,
-    0x81,
-    0x22,
-    0x62,
-    0x42,
-    0xB5,
-    0x00,
-    0xF4,
-    0x46,
-    0x69,
-    0x1F,
-    0xF1,
-    0x25,
-    0x5D,
-    0x88,
-    0xD6,
-    0x05,
-    0x15,
-    0xCF,
-    0x33,
-    0x23,
-    0xAC,
-    0x25,
-    0x7E,
-    0xAC,
-    0x55,
-    0xC7,
-    0x5D,
-    0x40,
-    0xE6,
-    0x5B,
-    0x1C,
-    0x73,
-    0x18,
-    0x4F,
-    0x0F,
-    0x85,
-    0xE6,
-    0x9D,
-    0x9E,
-    0x2A,
-    0x9F,
-    0xDF,
-    0xBB,
-    0xE9,
-    0x38,
-    0xAD,
-    0xAB,
-    0x61,
-    0x8A,
-    0x65,
-    0xD5,
-    0xFC,
-    0x73,
-    0x85,
-    0x20,
-    0xE9,
-    0xA4,
-    0xBC,
-    0x3B,
-    0x9C,
-    0x35,
-    0xE9,
-    0x29,
-    0x2C,
-    0x56,
-    0xED,
-    0x05,
-    0x4F,
-    0xF2,
-    0xBB,
-    0xA2,
-    0x9F,
-    0xED,
-    0xCF,
-    0x9F,
-    0xF5,
-    0x59,
-    0xE6,
-    0xC6,
-    0x97,
-    0x58,
-    0x66,
-    0x9F,
-    0xAB,
-    0xD2,
-    0x39,
-    0x0C,
-    0x1A,
-    0xFA,
-    0x3F,
-    0xD4,
-    0x27,
-    0xED,
-    0x18,
-    0x36,
-    0xF7,
-    0x23,
-    0x36,
-    0xF5,
-    0x9E,
-    0x72,
-    0x9F,
-    0x46,
-    0xED,
-    0x1C,
-    0xB0,
-    0xA8,
-    0x5A,
-    0xFD,
-    0xE7,
-    0x5D,
-    0xB0,
-    0xAB,
-    0x4E,
-    0xAB,
-    0x31,
-    0x6D,
-    0x62,
-    0xAB,
-    0x69,
-    0xFF,
-    0x7A,
-    0x74,
-    0xA5,
-    0x06,
-    0xD0,
-    0xEA,
-    0x50,
-    0x6F,
-    0x4D,
-    0x9A,
-    0x7F,
-    0xFB,
-    0x90,
-    0x86,
-    0x2B,
-    0xF4,
-    0xEA,
-    0xA5,
-    0xFE,
-    0x82,
-    0x8A,
-    0xF5,
-    0x54,
-    0x12,
-    0x5F,
-    0x19,
-    0xF0,
-    0xF9,
-    0x4B,
-    0xAF,
-    0x13,
-    0x86,
-    0xB8,
-    0xD8,
-    0xDD,
-    0xD8,
-    0xDA,
-    0x63,
-    0xC5,
-    0xA1,
-    0xA2,
-    0x53,
-    0xCB,
-    0xF0,
-    0x3D,
-    0x1E,
-    0x66,
-    0x31,
-    0x58,
-    0x3F,
-    0xC1,
-    0x50,
-    0x52,
-    0xED,
-    0xB8,
-    0xD4,
-    0xC1,
-    0xED,
-    0xDC,
-    0xB7,
-    0xCE,
-    0x4D,
-    0x85,
-    0x55,
-    0xD6,
-    0x2B,
-    0x4F,
-    0xC5,
-    0xB4,
-    0xEB,
-    0x4F,
-    0x61,
-    0x4E,
-    0x33,
-    0x9B,
-    0xDE,
-    0x6D,
-    0x42,
-    0x8F,
-    0x4D,
-    0x90,
-    0xF1,
-    0x64,
-    0xD2,
-    0x43,
-    0xB1,
-    0x7C,
-    0x52,
-    0x7D,
-    0xE3,
-    0xA1,
-    0x27,
-    0xA2,
-    0x6D,
-    0x6F,
-    0x80,
-    0x60,
-    0xF1,
-    0xF1,
-    0x2B,
-    0xDC,
-    0x4B,
-    0xA1,
-    0x7C,
-    0x58,
-    0x05,
-    0x49,
-    0xC9,
-    0x11,
-    0x1C,
-    0xD4,
-    0xEA,
-    0x53,
-    0x43,
-    0x88,
-    0xC0,
-    0x32,
-    0xDF,
-    0xBC,
-    0xFE,
-    0x68,
-    0x8A,
-    0xA6,
-    0x18,
-    0x36,
-    0x6B,
-    0x07,
-    0xFC,
-    0x16,
-    0x96,
-    0x9B,
-    0xE0,
-    0xB6,
-    0x13,
-    0x98,
-    0xAE,
-    0x11,
-    0x31,
-    0xD2,
-    0xD6,
-    0x8A,
-    0xD4,
-    0xF7,
-    0x72,
-    0x12,
-    0x32,
-    0xF3,
-    0x45,
-    0x87,
-    0x1E,
-    0x51,
-    0x9E,
-    0x59,
-    0x33,
-    0xCE,
-    0xDA,
-    0x22,
-    0x82,
-    0x46,
-    0x49,
-    0x07,
-    0x58,
-    0x09,
-    0xA6,
-    0xA5,
-    0x46,
-    0x01,
-    0x6F,
-    0x91,
-    0xCC,
-    0xEE,
-    0xA5,
-    0x21,
-    0x72,
-    0xC9,
-    0xD8,
-    0x17,
-    0xBB,
-    0x5A,
-    0x38,
-    0x12,
-    0xC8,
-    0x9D,
-    0xDC,
-    0xCB,
-    0x11,
-    0x35,
-    0xCF,
-    0x66,
-    0x74,
-    0xB5,
-    0xA7,
-    0x81,
-    0x89,
-    0x6E,
-    0x36,
-    0x5D,
-    0xEF,
-    0x07,
-    0x33,
-    0x0E,
-    0xB2,
-    0x42,
-    0xD0,
-    0xE2,
-    0x77,
-    0xA6,
-    0xBE,
-    0x87,
-    0xD3,
-    0x30,
-    0xB2,
-    0x74,
-    0xEB,
-    0x23,
-    0x3F,
-    0x2C,
-    0x68,
-    0x3A,
-    0xE4,
-    0x8A,
-    0xCD,
-    0x9A,
-    0xD1,
-    0xEB,
-    0x65,
-    0x23,
-    0x5C,
-    0x4C,
-    0x81,
-    0xAE,
-    0x1B,
-    0xE5,
-    0xA6,
-    0xCE,
-    0xBF,
-    0xAE,
-    0xF3,
-    0xA9,
-    0x58,
-    0x6B,
-    0x62,
-    0xE7,
-    0xF2,
-    0xAE,
-    0x3A,
-    0x7C,
-    0xAB,
-    0x25,
-    0xFF,
-    0x11,
-    0xAE,
-    0x72,
-    0x1A,
-    0xD9,
-    0x4B,
-    0xC7,
-    0x79,
-    0xDC,
-    0xBC,
-    0xA5,
-    0x0A,
-    0x20,
-    0x29,
-    0xEA,
-    0xFF,
-    0xA2,
-    0xF3,
-    0xE3,
-    0xCE,
-    0xDA,
-    0x94,
-    0xA4,
-    0x8A,
-    0x7D,
-    0xCF,
-    0x9D,
-    0xFE,
-    0x99,
-    0x2F,
-    0xF4,
-    0x76,
-    0x7B,
-    0xA6,
-    0xBA,
-    0x06,
-    0xFB,
-    0x92,
-    0x03,
-    0xF4,
-    0xBB,
-    0x06,
-    0x47,
-    0x08,
-    0xC4,
-    0xA7,
-    0x29,
-    0x24,
-    0x4D,
-    0xF8,
-    0x80,
-    0xB6,
-    0xB1,
-    0xB7,
-    0xCC,
-    0xCE,
-    0x42,
-    0xC8,
-    0x0F,
-    0xFC,
-    0xF9,
-    0x3B,
-    0x61,
-    0xE6,
-    0x8C,
-    0xF7,
-    0xBC,
-    0xAE,
-    0xB9,
-    0xF4,
-    0x3A,
-    0xD9,
-    0xDD,
-    0x19,
-    0x73,
-    0xEA,
-    0x96,
-    0xC6,
-    0x3E,
-    0xE2,
-    0x2D,
-    0x5C,
-    0x42,
-    0x38,
-    0xB0,
-    0x18,
-    0xC5,
-    0xFD,
-    0x8F,
-    0x6C,
-    0x24,
-    0xC3,
-    0xEF,
-    0x6A,
-    0x37,
-    0x34,
-    0x3A,
-    0x38,
-    0xC6,
-    0x3A,
-    0xB8,
-    0x50,
-    0xF1,
-    0x7B,
-    0xBF,
-    0xF2,
-    0xE3,
-    0xDC,
-    0x59,
-    0x9E,
-    0xF4,
-    0x48,
-    0xAF,
-    0xF7,
-    0xF7,
-    0xE2,
-    0xF0,
-    0xD0,
-    0x31,
-    0x0E,
-    0x34,
-    0x93,
-    0x81,
-    0xA0,
-    0x84,
-    0x31,
-    0x5C,
-    0x36,
-    0x6A,
-    0x87,
-    0xB1,
-    0x61,
-    0xE1,
-    0x7B,
-    0x76,
-    0xF8,
-    0xD4,
-    0x49,
-    0x64,
-    0x61,
-    0xCC,
-    0x71,
-    0xBC,
-    0xE5,
-    0x2E,
-    0xC7,
-    0x26,
-    0x4A,
-    0xF9,
-    0xF9,
-    0x76,
-    0x0F,
-    0x13,
-    0x90,
-    0xDC,
-    0xA9,
-    0x20,
-    0x6F,
-    0xE0,
-    0x43,
-    0xEE,
-    0x7C,
-    0x50,
-    0xA4,
-    0x66,
-    0x07,
-    0xFD,
-    0xBF,
-    0x53,
-    0x65,
-    0x7F,
-    0x6E,
-    0xE3,
-    0xE7,
-    0x33,
-    0x31,
-    0x61,
-    0x69,
-    0x41,
-    0x2F,
-    0x0A,
-    0x3A,
-    0x19,
-    0xDC,
-    0xCA,
-    0xAF,
-    0x81,
-    0xF1,
-    0x36,
-    0x16,
-    0xF0,
-    0xB9,
-    0x3E,
-    0x1D,
-    0x2D,
-    0x28,
-    0xA0,
-    0x02,
-    0x29,
-    0x88,
-    0xA8,
-    0x59,
-    0x8F,
-    0xF1,
-    0x4A,
-    0x5C,
-    0xD5,
-    0x97,
-    0x5D,
-    0x29,
-    0x9F,
-    0x8F,
-    0xDF,
-    0xAF,
-    0xD9,
-    0xDE,
-    0x52,
-    0x37,
-    0x30,
-    0x71,
-    0xD0,
-    0xBD,
-    0x4C,
-    0xBB,
-    0xBE,
-    0x53,
-    0x70,
-    0x6B,
-    0x80,
-    0x24,
-    0xA5,
-    0x5B,
-    0x6B,
-    0xCB,
-    0x3B,
-    0xBE,
-    0x4D,
-    0x56,
-    0x0E,
-    0x65,
-    0x26,
-    0x46,
-    0xF0,
-    0x72,
-    0x2E,
-    0xE1,
-    0xC9,
-    0xE1,
-    0xD4,
-    0x2F,
-    0xED,
-    0x08,
-    0xBE,
-    0x6C,
-    0x92,
-    0xFB,
-    0x6C,
-    0x1A,
-    0xA1,
-    0x45,
-    0xB2,
-    0xA4,
-    0x74,
-    0x8B,
-    0x20,
-    0x4F,
-    0x1D,
-    0xA2,
-    0x53,
-    0x09,
-    0xA5,
-    0x5F,
-    0x72,
-    0x0A,
-    0x76,
-    0x51,
-    0xBD,
-    0xD9,
-    0xA0,
-    0xC7,
-    0x21,
-    0xD3,
-    0x08,
-    0x4C,
-    0x9D,
-    0xDF,
-    0x04,
-    0x69,
-    0xDC,
-    0x1B,
-    0xA7,
-    0xC2,
-    0x4C,
-    0x0D,
-    0x17,
-    0xF1,
-    0x85,
-    0x3E,
-    0x0D,
-    0x95,
-    0x9F,
-    0x97,
-    0xD4,
-    0x1A,
-    0x58,
-    0xD2,
-    0x28,
-    0x19,
-    0xEB,
-    0x5A,
-    0x70,
-    0x3C,
-    0xCE,
-    0x26,
-    0x60,
-    0xD7,
-    0xC9,
-    0x22,
-    0xB4,
-    0x36,
-    0xDA,
-    0x5B,
-    0xB0,
-    0xCB,
-    0xFF,
-    0x77,
-    0xEE,
-    0xAA,
-    0xF1,
-    0x29,
-    0xBA,
-    0x06,
-    0x08,
-    0x84,
-    0x84,
-    0x3F,
-    0xDB,
-    0xA4,
-    0xBA,
-    0x1C,
-    0x4F,
-    0xD0,
-    0xB9,
-    0xE9,
-    0x4A,
-    0x11,
-    0xE6,
-    0xAE,
-    0x3F,
-    0x99,
-    0x04,
-    0x28,
-    0x7E,
-    0x1E,
-    0xD2,
-    0x67,
-    0x36,
-    0x1E,
-    0x1C,
-    0xE2,
-    0xE8,
-    0x7E,
-    0x88,
-    0xF4,
-    0x13,
-    0x34,
-    0x43,
-    0x94,
-    0x3F,
-    0x74,
-    0x15,
-    0x8F,
-    0x73,
-    0xA5,
-    0xE3,
-    0xA7,
-    0xE0,
-    0xD5,
-    0x43,
-    0xF8,
-    0x78,
-    0x4F,
-    0x75,
-    0x3C,
-    0xE8,
-    0xEF,
-    0x14,
-    0x0E,
-    0x53,
-    0x89,
-    0xBD,
-    0x6C,
-    0x4A,
-    0xC4,
-    0xAB,
-    0x2C,
-    0xF7,
-    0x65,
-    0xD9,
-    0x95,
-    0x95,
-    0xCE,
-    0xED,
-    0x39,
-    0xE2,
-    0xA7,
-    0xD0,
-    0xA3,
-    0x3B,
-    0x70,
-    0x53,
-    0x57,
-    0x65,
-    0xAF,
-    0xEF,
-    0x80,
-    0x14,
-    0x0B,
-    0x2D,
-    0x02,
-    0x7D,
-    0xE0,
-    0x63,
-    0xC2,
-    0x27,
-    0x17,
-    0xDD,
-    0x3F,
-    0xBE,
-    0xD9,
-    0x1C,
-    0x46,
-    0x1D,
-    0x1B,
-    0xAA,
-    0x85,
-    0x58,
-    0x0D,
-    0xDC,
-    0xB2,
-    0xD9,
-    0x37,
-    0x0D,
-    0x44,
-    0xBE,
-    0x7E,
-    0x3E,
-    0x09,
-    0x9C,
-    0x58,
-    0xE7,
-    0xC0,
-    0x18,
-    0xDC,
-    0x9D,
-    0xE5,
-    0xE1,
-    0x47,
-    0x06,
-    0x77,
-    0x0E,
-    0x74,
-    0x5D,
-    0x47,
-    0x76,
-    0xA3,
-    0x07,
-    0x10,
-    0x33,
-    0x0F,
-    0x5A,
-    0xC2,
-    0x96,
-    0x13,
-    0x2C,
-    0xF2,
-    0x41,
-    0xCB,
-    0x9B,
-    0xC8,
-    0x80,
-    0x95,
-    0xD7,
-    0x8C,
-    0x6D,
-    0xB2,
-    0x4F,
-    0x2B,
-    0x14,
-    0xD5,
-    0x78,
-    0x61,
-    0xFF,
-    0xB6,
-    0xEB,
-    0x89,
-    0xB8,
-    0xC3,
-    0xD2,
-    0x11,
-    0x7A,
-    0x2A,
-    0xB4,
-    0x78,
-    0x37,
-    0x03,
-    0x7B,
-    0xEE,
-    0xD4,
-    0xA7,
-    0x21,
-    0xAB,
-    0xA8,
-    0xBD,
-    0xDB,
-    0x84,
-    0x4C,
-    0x45,
-    0xAF,
-    0x85,
-    0x9D,
-    0xF0,
-    0x3F,
-    0x30,
-    0x02,
-    0x25,
-    0xE7,
-    0x7D,
-    0x02,
-    0x35,
-    0xF9,
-    0xC4,
-    0x7F,
-    0x15,
-    0xE4,
-    0x57,
-    0x77,
-    0x7D,
-    0x74,
-    0xE6,
-    0x93,
-    0x62,
-    0xB8,
-    0x52,
-    0xB7,
-    0x2E,
-    0x45,
-    0x7C,
-    0xB4,
-    0xFC,
-    0xFD,
-    0x01,
-    0xE4,
-    0x58,
-    0xA7,
-    0x42,
-    0xDF,
-    0xBF,
-    0xA6,
-    0x69,
-    0xCD,
-    0x56,
-    0xB3,
-    0xEA,
-    0xB5,
-    0x5A,
-    0x31,
-    0x4C,
-    0xC3,
-    0xAE,
-    0xAB,
-    0xC3,
-    0xB8,
-    0xCE,
-    0xD4,
-    0x67,
-    0x30,
-    0xD2,
-    0x53,
-    0x71,
-    0x43,
-    0x37,
-    0x99,
-    0x5E,
-    0xF2,
-    0x51,
-    0x73,
-    0x68,
-    0xC4,
-    0xF5,
-    0xF3,
-    0x8A,
-    0xBD,
-    0xEE,
-    0x54,
-    0x05,
-    0xE7,
-    0xE4,
-    0xB6,
-    0xF7,
-    0xCF,
-    0x5C,
-    0x5D,
-    0xAA,
-    0x31,
-    0x88,
-    0x89,
-    0x8B,
-    0x28,
-    0xB8,
-    0x52,
-    0xEE,
-    0xC3,
-    0x19,
-    0x6F,
-    0x29,
-    0x32,
-    0x80,
-    0x99,
-    0x2B,
-    0x2E,
-    0xA9,
-    0x1C,
-    0x71,
-    0xF6,
-    0xC7,
-    0xCB,
-    0xE1,
-    0x57,
-    0x0A,
-    0xAE,
-    0xCD,
-    0xAF,
-    0x30,
-    0x32,
-    0x34,
-    0x5A,
-    0x03,
-    0x73,
-    0x25,
-    0x17,
-    0xFA,
-    0x61,
-    0x25,
-    0xFD,
-    0x50,
-    0x7F,
-    0x4A,
-    0xAC,
-    0xE5,
-    0x79,
-    0x7D,
-    0x04,
-    0xBC,
-    0x61,
-    0xA8,
-    0x76,
-    0xE0,
-    0xDA,
-    0x71,
-    0x3D,
-    0x83,
-    0xBD,
-    0x84,
-    0x51,
-    0x3F,
-    0x8A,
-    0x7E,
-    0x35,
-    0x83,
-    0xCE,
-    0x24,
-    0xEC,
-    0x9A,
-    0x08,
-    0x1E,
-    0x32,
-    0x52,
-    0x1F,
-    0xBC,
-    0x42,
-    0x73,
-    0x76,
-    0x03,
-    0xD4,
-    0x1E,
-    0x7C,
-    0x97,
-    0xDD,
-    0xD4,
-    0x24,
-    0x68,
-    0x23,
-    0x7F,
-    0xF2,
-    0xBA,
-    0xB3,
-    0x7A,
-    0xB1,
-    0xCE,
-    0x7B,
-    0x98,
-    0x93,
-    0x0C,
-    0x3A,
-    0x7B,
-    0xA9,
-    0xCD,
-    0xC4,
-    0xE9,
-    0x35,
-    0x09,
-    0xF6,
-    0x3A,
-    0x8B,
-    0x25,
-    0x51,
-    0xE1,
-    0x12,
-    0xB7,
-    0xE8,
-    0xFE,
-    0x12,
-    0x75,
-    0x81,
-    0xD8,
-    0x55,
-    0x9B,
-    0xE6,
-    0xB3,
-    0x43,
-    0x09,
-    0xE4,
-    0x8B,
-    0x05,
-    0x0A,
-    0x97,
-    0xBC,
-    0x20,
-    0xA7,
-    0x05,
-    0x9A,
-    0x0B,
-    0xC6,
-    0x60,
-    0x25,
-    0xF5,
-    0xAB,
-    0x09,
-    0x4C,
-    0xB1,
-    0xC3,
-    0x92,
-    0x74,
-    0x91,
-    0x99,
-    0xA8,
-    0x04,
-    0xFD,
-    0xDD,
-    0x0D,
-    0xA3,
-    0x6C,
-    0xAF,
-    0x6F,
-    0xC7,
-    0x3E,
-    0x75,
-    0x0B,
-    0xF0,
-    0x22,
-    0x4B,
-    0xA6,
-    0xD4,
-    0x35,
-    0xCB,
-    0xAD,
-    0xEE,
-    0xC8,
-    0xBA,
-    0xF6,
-    0xE5,
-    0xE4,
-    0xE2,
-    0xE9,
-    0xB1,
-    0x0E,
-    0x0E,
-    0x1A,
-    0xD9,
-    0x71,
-    0x15,
-    0xD9,
-    0x41,
-    0xAE,
-    0x01,
-    0x35,
-    0x1D,
-    0x94,
-    0x2B,
-    0x46,
-    0xCF,
-    0xAB,
-    0x9A,
-    0xCA,
-    0x34,
-    0xB1,
-    0xAB,
-    0x4D,
-    0x20,
-    0x53,
-    0x07,
-    0x9F,
-    0x0F,
-    0xA3,
-    0xFE,
-    0xC3,
-    0x89,
-    0x48,
-    0x39,
-    0xD0,
-    0x11,
-    0xDC,
-    0x09,
-    0x86,
-    0x79,
-    0x60,
-    0xBF,
-    0xCE,
-    0xB0,
-    0x56,
-    0x96,
-    0xBC,
-    0x98,
-    0xA9,
-    0x5F,
-    0x33,
-    0x2D,
-    0xA8,
-    0xDB,
-    0x99,
-    0x91,
-    0xBE,
-    0xD8,
-    0xA9,
-    0x24,
-    0xEE,
-    0x5D,
-    0x71,
-    0xAF,
-    0x8F,
-    0xD0,
-    0x7F,
-    0x44,
-    0xD7,
-    0x7B,
-    0x81,
-    0xDB,
-    0xD9,
-    0x3F,
-    0xF8,
-    0x72,
-    0x91,
-    0x84,
-    0x78,
-    0x72,
-    0xAE,
-    0xCB,
-    0x2D,
-    0x4D,
-    0x2C,
-    0x2E,
-    0x62,
-    0x7F,
-    0x27,
-    0xF2,
-    0x01,
-    0x7D,
-    0xEE,
-    0x9A,
-    0x1C,
-    0x10,
-    0x61,
-    0x9D,
-    0x20,
-    0xF1,
-    0x57,
-    0x8D,
-    0xC0,
-    0x97,
-    0x06,
-    0x6C,
-    0x35,
-    0x25,
-    0xF7,
-    0x80,
-    0xDF,
-    0x85,
-    0x8E,
-    0x85,
-    0x33,
-    0x09,
-    0x65,
-    0xF6,
-    0x71,
-    0x18,
-    0x2B,
-    0xB9,
-    0x1A,
-    0x83,
-    0xC6,
-    0x23,
-    0x07,
-    0x49,
-    0xE7,
-    0x78,
-    0xB4,
-    0xC6,
-    0x87,
-    0x01,
-    0x58,
-    0x53,
-    0xFC,
-    0xC9,
-    0x5E,
-    0xC5,
-    0x7B,
-    0x76,
-    0x33,
-    0xB1,
-    0x1B,
-    0xB4,
-    0xE2,
-    0x53,
-    0x1C,
-    0x48,
-    0x6A,
-    0xA0,
-    0x17,
-    0xD3,
-    0x7A,
-    0x7F,
-    0x43,
-    0x24,
-    0x3E,
-    0x0F,
-    0x87,
-    0xAA,
-    0xC8,
-    0xA4,
-    0xB4,
-    0x62,
-    0x2E,
-    0x06,
-    0x8E,
-    0x12,
-    0x49,
-    0x23,
-    0x5A,
-    0xBC,
-    0x03,
-    0x35,
-    0x2D,
-    0x39,
-    0x1C,
-    0xBB,
-    0x9F,
-    0x7C,
-    0xCB,
-    0xB3,
-    0x52,
-    0xA8,
-    0x0E,
-    0xFC,
-    0x44,
-    0x7C,
-    0xA1,
-    0x81,
-    0x50,
-    0xC1,
-    0xDF,
-    0xD1,
-    0xF6,
-    0x2E,
-    0x3B,
-    0x45,
-    0x49,
-    0x9B,
-    0xCE,
-    0xA6,
-    0xF1,
-    0x42,
-    0xA4,
-    0xA8,
-    0xB4,
-    0xE4,
-    0x63,
-    0xDA,
-    0xCD,
-    0x73,
-    0x37,
-    0xEE,
-    0x2B,
-    0xB4,
-    0x09,
-    0x79,
-    0x6D,
-    0x7B,
-    0xA6,
-    0xDA,
-    0x77,
-    0xBF,
-    0x8D,
-    0xCF,
-    0xCC,
-    0xB3,
-    0x91,
-    0xB2,
-    0x68,
-    0x99,
-    0x43,
-    0x8D,
-    0x6A,
-    0xEA,
-    0x06,
-    0x3F,
-    0x5E,
-    0x7E,
-    0x4A,
-    0x94,
-    0x42,
-    0x9C,
-    0xA7,
-    0xF7,
-    0x24,
-    0x3C,
-    0xA1,
-    0xEA,
-    0xBC,
-    0xAB,
-    0xDE,
-    0xED,
-    0x01,
-    0xDE,
-    0x1D,
-    0x6C,
-    0x2B,
-    0x01,
-    0x4E,
-    0x61,
-    0xB4,
-    0xCC,
-    0xC3,
-    0xAC,
-    0x20,
-    0x7D,
-    0x1F,
-    0x0B,
-    0xBE,
-    0x8F,
-    0x51,
-    0xEA,
-    0xA3,
-    0xC0,
-    0xA3,
-    0xD1,
-    0xB3,
-    0xC4,
-    0xC7,
-    0x05,
-    0x85,
-    0xB1,
-    0xBE,
-    0x8D,
-    0x9E,
-    0xBA,
-    0x66,
-    0xF4,
-    0x17,
-    0x45,
-    0x0E,
-    0x5E,
-    0x2A,
-    0xB6,
-    0xF7,
-    0x5F,
-    0x94,
-    0x8F,
-    0x74,
-    0xAF,
-    0xBC,
-    0xF1,
-    0x1B,
-    0xAC,
-    0x80,
-    0x29,
-    0x6B,
-    0x10,
-    0xCF,
-    0xB5,
-    0xFA,
-    0xD4,
-    0x58,
-    0x76,
-    0xBD,
-    0x39,
-    0xE9,
-    0xEB,
-    0x60,
-    0xEE,
-    0x91,
-    0x55,
-    0xFD,
-    0x41,
-    0x50,
-    0x98,
-    0xB8,
-    0x0C,
-    0x0C,
-    0x41,
-    0x77,
-    0x49,
-    0xE2,
-    0x1E,
-    0x66,
-    0x22,
-    0xFD,
-    0x34,
-    0x80,
-    0x06,
-    0x1C,
-    0x18,
-    0x5E,
-    0x8F,
-    0x7A,
-    0xC2,
-    0x3E,
-    0x06,
-    0x13,
-    0xE4,
-    0xF2,
-    0xF6,
-    0x29,
-    0x89,
-    0xC3,
-    0xA5,
-    0x06,
-    0x5B,
-    0xE5,
-    0x97,
-    0x08,
-    0xAC,
-    0xBA,
-    0xE4,
-    0xD9,
-    0x7F,
-    0xBF,
-    0x37,
-    0xB3,
-    0x76,
-    0xA7,
-    0xF6,
-    0xBC,
-    0xF6,
-    0x04,
-    0x87,
-    0x67,
-    0x7C,
-    0x9A,
-    0x8F,
-    0xB3,
-    0x1B,
-    0x7F,
-    0x70,
-    0xAD,
-    0xD7,
-    0xE1,
-    0xCC,
-    0xD5,
-    0x9D,
-    0xE8,
-    0xCB,
-    0x87,
-    0x59,
-    0x02,
-    0xC8,
-    0xAC,
-    0x24,
-    0x23,
-    0x68,
-    0x6B,
-    0x15,
-    0xC2,
-    0x53,
-    0x9D,
-    0x83,
-    0x83,
-    0xC9,
-    0x9C,
-    0xCD,
-    0x22,
-    0x3E,
-    0xB9,
-    0x7D,
-    0x7D,
-    0x24,
-    0x62,
-    0x60,
-    0x38,
-    0x97,
-    0x18,
-    0xE9,
-    0x4D,
-    0x65,
-    0x16,
-    0x61,
-    0xEA,
-    0x71,
-    0xDD,
-    0x5A,
-    0x50,
-    0x58,
-    0x71,
-    0xAE,
-    0x04,
-    0x03,
-    0x5F,
-    0x79,
-    0x54,
-    0xF7,
-    0x73,
-    0x79,
-    0xBE,
-    0x2C,
-    0x7E,
-    0xD2,
-    0x1D,
-    0xAD,
-    0xF6,
-    0x8A,
-    0xE6,
-    0x72,
-    0x79,
-    0x0C,
-    0x0F,
-    0x46,
-    0x6E,
-    0x2A,
-    0x92,
-    0x3F,
-    0x26,
-    0x30,
-    0x79,
-    0x23,
-    0xE8,
-    0x22,
-    0x8F,
-    0x52,
-    0x2C,
-    0x06,
-    0x93,
-    0xB4,
-    0x51,
-    0x56,
-    0x77,
-    0x58,
-    0x25,
-    0xEE,
-    0x72,
-    0xD3,
-    0x97,
-    0x3F,
-    0x4A,
-    0x5C,
-    0x9A,
-    0xFF,
-    0x46,
-    0xB7,
-    0xA7,
-    0x99,
-    0x71,
-    0x63,
-    0xD4,
-    0x78,
-    0x14,
-    0x9D,
-    0xF6,
-    0x04,
-    0x74,
-    0x9A,
-    0x84,
-    0x45,
-    0x16,
-    0x68,
-    0xD9,
-    0x54,
-    0x18,
-    0x65,
-    0xD1,
-    0xED,
-    0x48,
-    0x2F,
-    0x42,
-    0x8F,
-    0x38,
-    0x11,
-    0x40,
-    0xDC,
-    0x08,
-    0x7D,
-    0x17,
-    0x50,
-    0xAE,
-    0x27,
-    0xFA,
-    0x4A,
-    0xE5,
-    0xB4,
-    0xC6,
-    0xF7,
-    0x7C,
-    0x2A,
-    0x4E,
-    0xC3,
-    0x2D,
-    0x91,
-    0x59,
-    0x3C,
-    0x46,
-    0xF3,
-    0x2C,
-    0xD9,
-    0x7B,
-    0x3B,
-    0x76,
-    0x60,
-    0x55,
-    0x33,
-    0x9F,
-    0xBE,
-    0x37,
-    0xF7,
-    0x5B,
-    0x54,
-    0x03,
-    0xD9,
-    0x4C,
-    0x70,
-    0x6E,
-    0xB9,
-    0xD9,
-    0x9C,
-    0x0E,
-    0x58,
-    0x90,
-    0xA8,
-    0x9E,
-    0x83,
-    0x6A,
-    0xD2,
-    0x23,
-    0x62,
-    0x23,
-    0x6E,
-    0xB1,
-    0xFF,
-    0x6C,
-    0x57,
-    0x5A,
-    0xC3,
-    0x4C,
-    0xD9,
-    0x4E,
-    0xFE,
-    0x67,
-    0x23,
-    0xC1,
-    0x9A,
-    0x11,
-    0x0E,
-    0x24,
-    0xC5,
-    0xE5,
-    0x43,
-    0x62,
-    0xA7,
-    0x83,
-    0x4E,
-    0x96,
-    0x6A,
-    0xC6,
-    0xE4,
-    0xDE,
-    0x03,
-    0x58,
-    0x44,
-    0x26,
-    0xEF,
-    0xC8,
-    0xD3,
-    0x34,
-    0xCD,
-    0xED,
-    0x6F,
-    0x63,
-    0x16,
-    0x5B,
-    0x7B,
-    0x8F,
-    0x46,
-    0xED,
-    0xDA,
-    0xBA,
-    0x27,
-    0xA5,
-    0x15,
-    0xA5,
-    0x7A,
-    0x88,
-    0x9F,
-    0xAA,
-    0x2D,
-    0xAB,
-    0x0D,
-    0x2E,
-    0xF7,
-    0x69,
-    0x06,
-    0x71,
-    0xE3,
-    0x9B,
-    0xFC,
-    0xBC,
-    0xC1,
-    0xCA,
-    0xF0,
-    0x58,
-    0xA4,
-    0x3F,
-    0x5B,
-    0x04,
-    0x75,
-    0x7B,
-    0xFD,
-    0xB9,
-    0xC1,
-    0xDC,
-    0xEB,
-    0x8F,
-    0x28,
-    0x26,
-    0xB0,
-    0x9A,
-    0xE6,
-    0xDF,
-    0x89,
-    0x3C,
-    0xA1,
-    0x4E,
-    0xF8,
-    0x15,
-    0xD2,
-    0xD0,
-    0xCD,
-    0xBE,
-    0x74,
-    0x11,
-    0x9D,
-    0xE4,
-    0x14,
-    0x7C,
-    0xEC,
-    0x11,
-    0x73,
-    0x14,
-    0x83,
-    0xC9,
-    0x25,
-    0x28,
-    0xA2,
-    0xFF,
-    0xCF,
-    0xAB,
-    0xC9,
-    0x86,
-    0x53,
-    0xF8,
-    0x00,
-    0x28,
-    0x33,
-    0x9E,
-    0x91,
-    0x96,
-    0x03,
-    0xA1,
-    0xB7,
-    0xD0,
-    0xF0,
-    0x16,
-    0x5B,
-    0x0F,
-    0x65,
-    0xF1,
-    0xD3,
-    0xC5,
-    0x6E,
-    0xBC,
-    0xC0,
-    0xA8,
-    0xEB,
-    0x64,
-    0x12,
-    0x80,
-    0xB7,
-    0xE0,
-    0xFF,
-    0xDA,
-    0x7C,
-    0x09,
-    0xEA,
-    0xF0,
-    0x2B,
-    0x75,
-    0xD4,
-    0x8E,
-    0x67,
-    0xD9,
-    0xBC,
-    0x74,
-    0x4A,
-    0x1D,
-    0x63,
-    0x01,
-    0xA6,
-    0x4C,
-    0xB6,
-    0x50,
-    0x7C,
-    0x8C,
-    0x03,
-    0x8B,
-    0xF7,
-    0x7D,
-    0x98,
-    0x46,
-    0xA6,
-    0xC2,
-    0x53,
-    0x6F,
-    0x9F,
-    0xFB,
-    0x93,
-    0x8F,
-    0xD3,
-    0x6B,
-    0x08,
-    0xF6,
-    0x60,
-    0x62,
-    0x1B,
-    0xAB,
-    0x9F,
-    0x18,
-    0xE7,
-    0xBA,
-    0xE0,
-    0xE3,
-    0xB4,
-    0x17,
-    0xE2,
-    0x46,
-    0x61,
-    0x18,
-    0x30,
-    0x14,
-    0x18,
-    0x96,
-    0x83,
-    0x02,
-    0x48,
-    0x93,
-    0x2B,
-    0x18,
-    0xF7,
-    0xFB,
-    0x42,
-    0x95,
-    0xB9,
-    0xED,
-    0x96,
-    0xC5,
-    0x90,
-    0xE4,
-    0x6D,
-    0x3D,
-    0x11,
-    0xDF,
-    0xBD,
-    0x33,
-    0xF6,
-    0x4C,
-    0x92,
-    0xA1,
-    0x3C,
-    0x0C,
-    0x97,
-    0x03,
-    0x57,
-    0xA5,
-    0xFF,
-    0x62,
-    0xA1,
-    0x5D,
-    0xE3,
-    0x85,
-    0xE3,
-    0x43,
-    0xE7,
-    0x1F,
-    0x98,
-    0x14,
-    0x41,
-    0x5C,
-    0x9F,
-    0x29,
-    0x0C,
-    0x02,
-    0x1C,
-    0xD4,
-    0xE0,
-    0x58,
-    0x1E,
-    0xD2,
-    0xE5,
-    0xAF,
-    0xDB,
-    0x0C,
-    0xD6,
-    0xBF,
-    0x5D,
-    0xEE,
-    0x54,
-    0x03,
-    0x9A,
-    0x82,
-    0xAF,
-    0xB3,
-    0xC6,
-    0x7F,
-    0xD8,
-    0xAC,
-    0x6E,
-    0xC5,
-    0xB9,
-    0xAA,
-    0xDB,
-    0x1E,
-    0x3F,
-    0x8A,
-    0x10,
-    0xD0,
-    0xE5,
-    0xE1,
-    0x46,
-    0xE8,
-    0x7B,
-    0x46,
-    0xCD,
-    0x78,
-    0x88,
-    0x6F,
-    0x64,
-    0x50,
-    0x28,
-    0x5F,
-    0x5B,
-    0xF7,
-    0xDC,
-    0xC8,
-    0x97,
-    0xEB,
-    0x56,
-    0xE2,
-    0x14,
-    0xE8,
-    0x26,
-    0x4E,
-    0x70,
-    0xA4,
-    0xAA,
-    0x6B,
-    0xFA,
-    0x3C,
-    0xB6,
-    0x24,
-    0x35,
-    0x60,
-    0x97,
-    0xAE,
-    0xE6,
-    0x15,
-    0x00,
-    0x8C,
-    0xB1,
-    0xF2,
-    0xBD,
-    0xF5,
-    0x7F,
-    0x8C,
-    0xBE,
-    0xC9,
-    0x8D,
-    0xD4,
-    0xD7,
-    0xC3,
-    0x28,
-    0xA1,
-    0xFB,
-    0x04,
-    0x9D,
-    0xD2,
-    0xCC,
-    0x64,
-    0xA7,
-    0xD3,
-    0xBE,
-    0x8D,
-    0x92,
-    0xDF,
-    0xEC,
-    0x1B,
-    0x18,
-    0x63,
-    0x38,
-    0x96,
-    0x40,
-    0x80,
-    0x7B,
-    0x51,
-    0x08,
-    0x9D,
-    0x0C,
-    0xF8,
-    0x92,
-    0x1A,
-    0x43,
-    0x62,
-    0x03,
-    0x22,
-    0xAA,
-    0xEE,
-    0x43,
-    0x9B,
-    0x9E,
-    0x84,
-    0x4C,
-    0x40,
-    0x44,
-    0x89,
-    0x99,
-    0x31,
-    0xE6,
-    0x02,
-    0x66,
-    0x13,
-    0xC7,
-    0xA6,
-    0xF0,
-    0x30,
-    0x7A,
-    0x44,
-    0x07,
-    0x85,
-    0x6B,
-    0x80,
-    0xCA,
-    0xE7,
-    0x34,
-    0xB6,
-    0x97,
-    0x0C,
-    0xB4,
-    0xEA,
-    0xDC,
-    0x00,
-    0x30,
-    0xFD,
-    0xA2,
-    0xD0,
-    0xEB,
-    0x45,
-    0x1D,
-    0xDE,
-    0x05,
-    0x7E,
-    0x7D,
-    0x36,
-    0xF7,
-    0xBC,
-    0x2D,
-    0x10,
-    0xA2,
-    0xBD,
-    0x9E,
-    0xA7,
-    0x45,
-    0xED,
-    0x6F,
-    0x0D,
-    0x0F,
-    0xAA,
-    0x02,
-    0x81,
-    0x97,
-    0xF9,
-    0xE6,
-    0xF2,
-    0x86,
-    0x4E,
-    0x0F,
-    0x44,
-    0x5E,
-    0x7E,
-    0x1A,
-    0x5D,
-    0x3B,
-    0x7D,
-    0xF3,
-    0xF8,
-    0xB1,
-    0xA3,
-    0x45,
-    0x16,
-    0xB9,
-    0x9B,
-    0x77,
-    0xA2,
-    0x8C,
-    0x73,
-    0x13,
-    0x58,
-    0x65,
-    0x73,
-    0x73,
-    0x39,
-    0x07,
-    0x20,
-    0x8D,
-    0x47,
-    0x13,
-    0x1B,
-    0xCD,
-    0x8F,
-    0x10,
-    0x9C,
-    0xFF,
-    0x66,
-    0xFB,
-    0x89,
-    0x75,
-    0xA8,
-    0xB3,
-    0xBF,
-    0x81,
-    0x92,
-    0x6F,
-    0xFC,
-    0x0A,
-    0x51,
-    0x7D,
-    0x10,
-    0xBD,
-    0x71,
-    0x1A,
-    0xAC,
-    0xD3,
-    0x27,
-    0x79,
-    0x35,
-    0xAF,
-    0x63,
-    0xF7,
-    0x4B,
-    0x53,
-    0xE0,
-    0xC8,
-    0x15,
-    0x5F,
-    0x6A,
-    0x5A,
-    0x1A,
-    0xCC,
-    0x7E,
-    0x3C,
-    0x82,
-    0xDE,
-    0x15,
-    0xDA,
-    0xD3,
-    0xDE,
-    0xD8,
-    0xBD,
-    0x43,
-    0xE1,
-    0xF9,
-    0x3D,
-    0x04,
-    0x95,
-    0xCD,
-    0xA2,
-    0x13,
-    0x86,
-    0xB8,
-    0xF3,
-    0xAD,
-    0x97,
-    0x55,
-    0xE5,
-    0xEE,
-    0x22,
-    0x4B,
-    0x2F,
-    0x29,
-    0xF8,
-    0xC4,
-    0xBE,
-    0x7A,
-    0xB5,
-    0x4F,
-    0xE7,
-    0xF9,
-    0xD0,
-    0x48,
-    0x8B,
-    0x75,
-    0xAE,
-    0x17,
-    0x02,
-    0x77,
-    0x94,
-    0x55,
-    0x8D,
-    0x35,
-    0x28,
-    0x86,
-    0x09,
-    0x85,
-    0xB7,
-    0xC0,
-    0x93,
-    0xBC,
-    0x5D,
-    0x9F,
-    0x18,
-    0x96,
-    0x2C,
-    0xBB,
-    0x95,
-    0xD3,
-    0x38,
-    0x8B,
-    0x4F,
-    0x58,
-    0x94,
-    0xAD,
-    0x2C,
-    0x6D,
-    0x67,
-    0xD8,
-    0xA0,
-    0x39,
-    0x60,
-    0x7E,
-    0xEB,
-    0x0E,
-    0x2D,
-    0x34,
-    0x9E,
-    0x54,
-    0xAD,
-    0xCA,
-    0xF4,
-    0x5B,
-    0x74,
-    0xE9,
-    0xAE,
-    0x9F,
-    0x31,
-    0xCA,
-    0x3A,
-    0xDD,
-    0x05,
-    0xC4,
-    0x7D,
-    0x2F,
-    0xE6,
-    0x97,
-    0x8D,
-    0xB2,
-    0x34,
-    0xDC,
-    0xA4,
-    0x5B,
-    0x7F,
-    0x9C,
-    0xC4,
-    0xBC,
-    0x85,
-    0x92,
-    0xB1,
-    0x38,
-    0x24,
-    0xF3,
-    0x1B,
-    0x7D,
-    0xCA,
-    0xC3,
-    0xF4,
-    0x47,
-    0xA8,
-    0x70,
-    0x37,
-    0xAC,
-    0x64,
-    0x17,
-    0x73,
-    0x78,
-    0xFF,
-    0x8E,
-    0xBD,
-    0x3D,
-    0x4C,
-    0x98,
-    0x9B,
-    0xE8,
-    0xD5,
-    0x6E,
-    0x49,
-    0xE6,
-    0xCA,
-    0x74,
-    0xE1,
-    0xC1,
-    0x93,
-    0x65,
-    0xC3,
-    0x0B,
-    0x6F,
-    0x34,
-    0x07,
-    0x09,
-    0x56,
-    0x66,
-    0x25,
-    0x9F,
-    0xEF,
-    0x07,
-    0x23,
-    0xBC,
-    0x17,
-    0x15,
-    0x8E,
-    0x66,
-    0x90,
-    0xAE,
-    0x5A,
-    0x70,
-    0x3F,
-    0xD9,
-    0x40,
-    0x77,
-    0x7A,
-    0x32,
-    0x7B,
-    0x65,
-    0x90,
-    0x60,
-    0x2D,
-    0xB2,
-    0x7D,
-    0x32,
-    0xAD,
-    0xC3,
-    0x43,
-    0x0B,
-    0x6E,
-    0xD1,
-    0x11,
-    0x18,
-    0xA2,
-    0x28,
-    0x8B,
-    0xD5,
-    0x27,
-    0x3B,
-    0x98,
-    0x99,
-    0x05,
-    0xB3,
-    0x16,
-    0x8A,
-    0xE9,
-    0x1D,
-    0xAC,
-    0x77,
-    0xA9,
-    0x8B,
-    0xCF,
-    0xAB,
-    0x9A,
-    0x51,
-    0x88,
-    0x3D,
-    0x32,
-    0x66,
-    0x4F,
-    0xCD,
-    0x30,
-    0xAF,
-    0xA9,
-    0xAB,
-    0xB0,
-    0x5E,
-    0x0D,
-    0xD7,
-    0x64,
-    0xDA,
-    0x48,
-    0x39,
-    0x3B,
-    0x4F,
-    0x24,
-    0xBB,
-    0xB8,
-    0x95,
-    0x10,
-    0x32,
-    0x41,
-    0xB8,
-    0xA5,
-    0x4B,
-    0x0F,
-    0x8A,
-    0xA4,
-    0x8C,
-    0xD8,
-    0xC3,
-    0xDC,
-    0x5F,
-    0xCB,
-    0xEB,
-    0xAD,
-    0x41,
-    0x6D,
-    0x27,
-    0x03,
-    0x5F,
-    0x4A,
-    0x9A,
-    0x5D,
-    0xAC,
-    0xA5,
-    0x40,
-    0x23,
-    0x6A,
-    0xBF,
-    0x00,
-    0x6D,
-    0xB0,
-    0x2F,
-    0xA2,
-    0x1E,
-    0xA5,
-    0xC2,
-    0x29,
-    0x94,
-    0x40,
-    0x57,
-    0x71,
-    0xA1,
-    0x98,
-    0xB9,
-    0xA9,
-    0xBD,
-    0x6B,
-    0xB7,
-    0xB4,
-    0x94,
-    0x7C,
-    0x57,
-    0xA1,
-    0x9B,
-    0xB9,
-    0x75,
-    0x44,
-    0x37,
-    0x9D,
-    0x62,
-    0x9F,
-    0xE3,
-    0xE4,
-    0x56,
-    0xC6,
-    0x3A,
-    0x4D,
-    0x49,
-    0xC8,
-    0x49,
-    0x79,
-    0x6E,
-    0x0B,
-    0x06,
-    0x9A,
-    0xF4,
-    0x0D,
-    0xA6,
-    0x03,
-    0xA1,
-    0xCA,
-    0x00,
-    0xB9,
-    0x59,
-    0xBB,
-    0x4B,
-    0xD1,
-    0xA9,
-    0xF8,
-    0xAA,
-    0xDD,
-    0xFC,
-    0xC8,
-    0x97,
-    0x57,
-    0x01,
-    0x7C,
-    0x5B,
-    0xDF,
-    0xE2,
-    0x51,
-    0xBE,
-    0x12,
-    0xDD,
-    0x20,
-    0x57,
-    0xD2,
-    0xEB,
-    0x13,
-    0x1D,
-    0x6E,
-    0xBB,
-    0xB4,
-    0x9A,
-    0x64,
-    0x5C,
-    0x28,
-    0x33,
-    0xB9,
-    0x21,
-    0xDD,
-    0x04,
-    0x2E,
-    0xCF,
-    0x68,
-    0x57,
-    0x7C,
-    0x23,
-    0x9B,
-    0xB4,
-    0x7C,
-    0x65,
-    0xF4,
-    0x6B,
-    0x22,
-    0xC3,
-    0x09,
-    0x98,
-    0x6E,
-    0x7B,
-    0xC3,
-    0x82,
-    0xA9,
-    0x66,
-    0xE3,
-    0x39,
-    0xC6,
-    0xAB,
-    0x3F,
-    0xD2,
-    0xB6,
-    0xC6,
-    0x9E,
-    0x95,
-    0x89,
-    0x3B,
-    0x0B,
-    0xC0,
-    0xDA,
-    0xCB,
-    0x29,
-    0xB0,
-    0x08,
-    0xAF,
-    0x74,
-    0x44,
-    0x27,
-    0x45,
-    0x00,
-    0x28,
-    0xBA,
-    0x16,
-    0xB4,
-    0x5F,
-    0xCC,
-    0xE4,
-    0x81,
-    0x5D,
-    0x09,
-    0xAB,
-    0xBF,
-    0x06,
-    0x8F,
-    0x90,
-    0x0F,
-    0x47,
-    0xDA,
-    0x98,
-    0x53,
-    0x90,
-    0x82,
-    0xE9,
-    0x19,
-    0xB3,
-    0xB9,
-    0x69,
-    0x5E,
-    0x34,
-    0xE2,
-    0x76,
-    0x8C,
-    0x29,
-    0x81,
-    0x22,
-    0xC7,
-    0xEF,
-    0x6E,
-    0x98,
-    0xEF,
-    0xCB,
-    0x08,
-    0x9C,
-    0x42,
-    0x36,
-    0x37,
-    0xEB,
-    0x8F,
-    0x7F,
-    0xA5,
-    0x67,
-    0x41,
-    0x7B,
-    0xA3,
-    0xF4,
-    0x78,
-    0x06,
-    0x0A,
-    0x92,
-    0xD8,
-    0x4D,
-    0xBB,
-    0xAF,
-    0x40,
-    0x5C,
-    0x17,
-    0x99,
-    0x15,
-    0x3E,
-    0x39,
-    0xD4,
-    0x20,
-    0xB8,
-    0x44,
-    0x5B,
-    0x24,
-    0xD6,
-    0xF3,
-    0xC5,
-    0x50,
-    0x0D,
-    0x4F,
-    0xDC,
-    0x88,
-    0x85,
-    0xAD,
-    0xDB,
-    0xFF,
-    0x65,
-    0x7A,
-    0xD1,
-    0x86,
-    0x50,
-    0xE3,
-    0x81,
-    0x72,
-    0xB9,
-    0x3B,
-    0x7B,
-    0x34,
-    0xD4,
-    0x54,
-    0xCB,
-    0x72,
-    0x65,
-    0x82,
-    0x63,
-    0xFC,
-    0x43,
-    0x20,
-    0xD2,
-    0x8A,
-    0xFD,
-    0x97,
-    0x98,
-    0x55,
-    0x9A,
-    0x99,
-    0xFC,
-    0x35,
-    0xD6,
-    0x11,
-    0x5F,
-    0xC2,
-    0xC0,
-    0x26,
-    0xF4,
-    0x1F,
-    0xCD,
-    0x15,
-    0xA6,
-    0x1D,
-    0x7A,
-    0x00,
-    0x9C,
-    0xCC,
-    0x1E,
-    0x6A,
-    0x1D,
-    0x2E,
-    0x19,
-    0x90,
-    0x6B,
-    0x1B,
-    0xC0,
-    0x94,
-    0x23,
-    0xCA,
-    0xF6,
-    0x27,
-    0xEE,
-    0xDD,
-    0x10,
-    0x3B,
-    0xC9,
-    0x6D,
-    0x4E,
-    0x34,
-    0xB6,
-    0xFE,
-    0x49,
-    0x63,
-    0x00,
-    0x6B,
-    0xF7,
-    0x11,
-    0x7B,
-    0xAA,
-    0x4D,
-    0x4D,
-    0xA9,
-    0x1B,
-    0x55,
-    0x6E,
-    0x84,
-    0x47,
-    0x5C,
-    0x01,
-    0x89,
-    0x3A,
-    0xA2,
-    0x87,
-    0x02,
-    0xB8,
-    0x51,
-    0x1F,
-    0xAC,
-    0xFF,
-    0x62,
-    0x9D,
-    0x19,
-    0x3A,
-    0x5D,
-    0xBA,
-    0x5C,
-    0x67,
-    0x5C,
-    0x1A,
-    0x0D,
-    0x80,
-    0x8A,
-    0x64,
-    0x92,
-    0xD8,
-    0xFE,
-    0x6E,
-    0x31,
-    0x27,
-    0x4E,
-    0x0B,
-    0x63,
-    0xAB,
-    0xD9,
-    0xBC,
-    0x20,
-    0x6B,
-    0xFC,
-    0xC6,
-    0x9B,
-    0x4F,
-    0x7C,
-    0x0A,
-    0x99,
-    0xF0,
-    0x8D,
-    0xE4,
-    0xE3,
-    0xF3,
-    0x86,
-    0x2A,
-    0x48,
-    0x6B,
-    0x07,
-    0x08,
-    0xD8,
-    0x73,
-    0x10,
-    0x89,
-    0xC0,
-    0xF0,
-    0x61,
-    0xF2,
-    0xEF,
-    0xE8,
-    0x1C,
-    0x2B,
-    0x9C,
-    0x24,
-    0x84,
-    0x7D,
-    0x69,
-    0x3C,
-    0xBF,
-    0x52,
-    0xD7,
-    0xD4,
-    0x27,
-    0x17,
-    0xBD,
-    0xE8,
-    0x71,
-    0x90,
-    0xA4,
-    0x7B,
-    0xF1,
-    0x74,
-    0xEF,
-    0xCA,
-    0xA5,
-    0xCE,
-    0x05,
-    0x11,
-    0xA4,
-    0xCB,
-    0x92,
-    0x23,
-    0x1B,
-    0x5F,
-    0xE6,
-    0xEE,
-    0xF1,
-    0x4B,
-    0xC8,
-    0x23,
-    0x0B,
-    0xE7,
-    0x6F,
-    0x29,
-    0x7B,
-    0xCE,
-    0xFB,
-    0x74,
-    0xC3,
-    0xC6,
-    0x3C,
-    0xBD,
-    0x84,
-    0x2A,
-    0xBE,
-    0x46,
-    0x1C,
-    0x0A,
-    0xB8,
-    0x3F,
-    0xEE,
-    0x0A,
-    0x8F,
-    0xCB,
-    0x43,
-    0x85,
-    0x5C,
-    0x4E,
-    0x7E,
-    0x73,
-    0x0C,
-    0xEE,
-    0x18,
-    0x41,
-    0x91,
-    0x19,
-    0xEC,
-    0xC9,
-    0x8A,
-    0xC5,
-    0x17,
-    0x17,
-    0x1C,
-    0x41,
-    0xF7,
-    0x4B,
-    0x0D,
-    0xF9,
-    0x52,
-    0xCA,
-    0xE8,
-    0x5A,
-    0x4D,
-    0xF8,
-    0x63,
-    0xC4,
-    0xB1,
-    0x56,
-    0xD6,
-    0x3F,
-    0x0B,
-    0x29,
-    0xBD,
-    0xA7,
-    0xB1,
-    0x38,
-    0xB0,
-    0x54,
-    0x24,
-    0x52,
-    0x70,
-    0x69,
-    0x4B,
-    0x57,
-    0x2F,
-    0x11,
-    0xDE,
-    0x9F,
-    0xBE,
-    0x4B,
-    0x35,
-    0xF2,
-    0x76,
-    0xCE,
-    0xA9,
-    0x5A,
-    0x68,
-    0xD6,
-    0x54,
-    0xED,
-    0x09,
-    0x20,
-    0x51,
-    0x75,
-    0x94,
-    0xFC,
-    0x7F,
-    0x4E,
-    0xA7,
-    0x50,
-    0x0C,
-    0x29,
-    0x0D,
-    0xE8,
-    0x06,
-    0x3C,
-    0xFE,
-    0x27,
-    0x4A,
-    0xEB,
-    0xFD,
-    0xFB,
-    0xC5,
-    0x23,
-    0x2D,
-    0x46,
-    0xEB,
-    0xB9,
-    0xF1,
-    0xE8,
-    0xCD,
-    0x2D,
-    0xAA,
-    0xA4,
-    0x1C,
-    0x77,
-    0x0F,
-    0xE7,
-    0xAB,
-    0xB7,
-    0xF8,
-    0x04,
-    0x84,
-    0x4D,
-    0x11,
-    0xE2,
-    0xB1,
-    0xF8,
-    0xFD,
-    0x92,
-    0x2F,
-    0x8C,
-    0xC5,
-    0xE5,
-    0x61,
-    0x80,
-    0x94,
-    0xA2,
-    0x80,
-    0xA2,
-    0x30,
-    0x57,
-    0x41,
-    0xD9,
-    0x2C,
-    0x69,
-    0x94,
-    0x6B,
-    0x32,
-    0xA6,
-    0x8A,
-    0xA6,
-    0x71,
-    0x38,
-    0xA8,
-    0x28,
-    0xA1,
-    0x38,
-    0xE2,
-    0xD0,
-    0xF2,
-    0xE7,
-    0xF0,
-    0xE6,
-    0xE7,
-    0xD4,
-    0xDE,
-    0x03,
-    0x08,
-    0xDD,
-    0x43,
-    0x8E,
-    0x0F,
-    0x0F,
-    0xD6,
-    0x61,
-    0x57,
-    0x10,
-    0xCE,
-    0xB0,
-    0x81,
-    0x01,
-    0x6A,
-    0x8D,
-    0xE3,
-    0xC8,
-    0x17,
-    0x8B,
-    0xF5,
-    0xE5,
-    0xFB,
-    0x7A,
-    0x5F,
-    0x49,
-    0x45,
-    0xA4,
-    0x00,
-    0xA6,
-    0xAC,
-    0x97,
-    0xFD,
-    0x17,
-    0xC0,
-    0x1F,
-    0x8C,
-    0x5E,
-    0x1F,
-    0xA4,
-    0x5C,
-    0x41,
-    0xFD,
-    0x10,
-    0xDE,
-    0x4D,
-    0xC0,
-    0x0E,
-    0x10,
-    0xCC,
-    0xCE,
-    0xD6,
-    0xD4,
-    0x2A,
-    0x55,
-    0x45,
-    0xEB,
-    0x22,
-    0xBA,
-    0xD6,
-    0x6C,
-    0xC4,
-    0xFB,
-    0x29,
-    0x7D,
-    0x89,
-    0xA7,
-    0x3C,
-    0xCE,
-    0x32,
-    0xFC,
-    0xDB,
-    0x36,
-    0x49,
-    0x41,
-    0x87,
-    0xAB,
-    0xFE,
-    0x64,
-    0xEB,
-    0xCA,
-    0x0A,
-    0xF3,
-    0x41,
-    0xEF,
-    0x33,
-    0x44,
-    0x41,
-    0x4A,
-    0xE1,
-    0xF9,
-    0x17,
-    0x1C,
-    0xC6,
-    0x96,
-    0x5A,
-    0x5C,
-    0xC5,
-    0xA3,
-    0x45,
-    0x8A,
-    0x81,
-    0x60,
-    0x27,
-    0x9F,
-    0x0C,
-    0xB7,
-    0xA4,
-    0x54,
-    0x7B,
-    0x6C,
-    0xA2,
-    0x0F,
-    0x1D,
-    0x4E,
-    0xB3,
-    0x52,
-    0x4A,
-    0x2E,
-    0x69,
-    0x35,
-    0xF8,
-    0xB8,
-    0x84,
-    0x1E,
-    0x62,
-    0x53,
-    0x19,
-    0x76,
-    0x9A,
-    0x77,
-    0x82,
-    0x98,
-    0x27,
-    0xB5,
-    0x36,
-    0x54,
-    0x5F,
-    0x35,
-    0xDD,
-    0x86,
-    0x8D,
-    0xE5,
-    0x34,
-    0xDF,
-    0xBB,
-    0x31,
-    0xE7,
-    0xEA,
-    0x76,
-    0xC0,
-    0x48,
-    0xFC,
-    0xB5,
-    0xB8,
-    0x00,
-    0xFE,
-    0x9E,
-    0xF4,
-    0x0A,
-    0x63,
-    0x57,
-    0xA2,
-    0x89,
-    0x85,
-    0x0A,
-    0xE2,
-    0x1A,
-    0x1C,
-    0xD4,
-    0x0B,
-    0xDA,
-    0xE5,
-    0xBF,
-    0x21,
-    0x03,
-    0xCD,
-    0x29,
-    0xB6,
-    0xA8,
-    0x2A,
-    0x60,
-    0x88,
-    0x45,
-    0x30,
-    0xF9,
-    0x65,
-    0x55,
-    0x1A,
-    0x31,
-    0x9D,
-    0xBA,
-    0x81,
-    0xB4,
-    0xBE,
-    0xE4,
-    0xF1,
-    0x94,
-    0x1A,
-    0x7F,
-    0xC4,
-    0xBF,
-    0x25,
-    0x2E,
-    0xA7,
-    0xB1,
-    0x1C,
-    0xEC,
-    0x97,
-    0x6A,
-    0x92,
-    0x41,
-    0x2E,
-    0x9E,
-    0x89,
-    0x3F,
-    0x18,
-    0x15,
-    0x13,
-    0x7C,
-    0xE9,
-    0x14,
-    0x53,
-    0x69,
-    0x43,
-    0x19,
-    0x3F,
-    0xB0,
-    0x3C,
-    0x18,
-    0xD7,
-    0x49,
-    0xA6,
-    0xB1,
-    0xDF,
-    0xE3,
-    0x3F,
-    0x58,
-    0xB6,
-    0x4B,
-    0xBD,
-    0xA9,
-    0x2D,
-    0xF4,
-    0x22,
-    0xBF,
-    0xB0,
-    0x26,
-    0x5C,
-    0xBB,
-    0x98,
-    0x64,
-    0x12,
-    0x61,
-    0x38,
-    0x01,
-    0x9C,
-    0x78,
-    0xD5,
-    0xAF,
-    0x45,
-    0x2B,
-    0xF9,
-    0x2C,
-    0x13,
-    0xAA,
-    0x04,
-    0xC8,
-    0xDE,
-    0x6C,
-    0x21,
-    0x6E,
-    0x70,
-    0xCE,
-    0x4E,
-    0x93,
-    0x88,
-    0xC5,
-    0x5A,
-    0xF4,
-    0x15,
-    0x5F,
-    0x86,
-    0xFC,
-    0x98,
-    0x74,
-    0x2E,
-    0xF1,
-    0x67,
-    0x43,
-    0xB4,
-    0xF9,
-    0x05,
-    0x5A,
-    0x24,
-    0xAC,
-    0x09,
-    0x04,
-    0x2E,
-    0x97,
-    0xD0,
-    0xC9,
-    0x91,
-    0x59,
-    0xEA,
-    0x43,
-    0x58,
-    0xDC,
-    0x18,
-    0xAB,
-    0x56,
-    0x1A,
-    0x52,
-    0x5B,
-    0xAD,
-    0x7A,
-    0x26,
-    0x39,
-    0xD1,
-    0x1B,
-    0x7F,
-    0x9A,
-    0x23,
-    0x98,
-    0x6B,
-    0xF4,
-    0xE2,
-    0xB7,
-    0xA3,
-    0x5E,
-    0x15,
-    0xCF,
-    0xC7,
-    0x2C,
-    0x98,
-    0x6F,
-    0xF3,
-    0xDD,
-    0xFA,
-    0xAA,
-    0xAD,
-    0xA7,
-    0x56,
-    0xF6,
-    0xF7,
-    0x7E,
-    0xA6,
-    0xF7,
-    0x2C,
-    0x29,
-    0x99,
-    0xF2,
-    0x29,
-    0xDE,
-    0x7A,
-    0xEC,
-    0x17,
-    0xA1,
-    0x9D,
-    0x33,
-    0xA4,
-    0x36,
-    0x53,
-    0x47,
-    0x13,
-    0x63,
-    0xAC,
-    0x29,
-    0xC4,
-    0xE0,
-    0xE0,
-    0x4C,
-    0x10,
-    0x90,
-    0xF5,
-    0x06,
-    0xDD,
-    0x37,
-    0xDB,
-    0x10,
-    0x93,
-    0x63,
-    0x90,
-    0xE8,
-    0xA9,
-    0x45,
-    0x47,
-    0x3E,
-    0x3F,
-    0x7B,
-    0xEB,
-    0x45,
-    0x75,
-    0x11,
-    0x8F,
-    0x88,
-    0x30,
-    0xA2,
-    0x62,
-    0x9B,
-    0x73,
-    0x15,
-    0xFE,
-    0x80,
-    0x34,
-    0x76,
-    0xF1,
-    0xEB,
-    0x58,
-    0x34,
-    0xA8,
-    0x5F,
-    0xEC,
-    0xB4,
-    0xD9,
-    0xD5,
-    0xBA,
-    0x04,
-    0xF7,
-    0x9E,
-    0x15,
-    0x21,
-    0x84,
-    0xA7,
-    0xAF,
-    0x63,
-    0xAA,
-    0x76,
-    0x75,
-    0x3E,
-    0x87,
-    0x84,
-    0xEF,
-    0xC2,
-    0xB1,
-    0xAF,
-    0xEE,
-    0xD8,
-    0x00,
-    0x92,
-    0xBA,
-    0xC2,
-    0xC9,
-    0x99,
-    0x73,
-    0x88,
-    0xE3,
-    0x37,
-    0x26,
-    0xDF,
-    0x74,
-    0xF3,
-    0x88,
-    0x45,
-    0x48,
-    0xD0,
-    0x06,
-    0x48,
-    0xD0,
-    0x25,
-    0x57,
-    0x36,
-    0x7D,
-    0x68,
-    0x6F,
-    0x82,
-    0x29,
-    0xA1,
-    0x00,
-    0xC0,
-    0x49,
-    0x98,
-    0x91,
-    0x0F,
-    0x01,
-    0xDB,
-    0x3B,
-    0x8F,
-    0x70,
-    0xEB,
-    0x17,
-    0xFB,
-    0xFF,
-    0x02,
-    0xC2,
-    0x17,
-    0x7F,
-    0x34,
-    0x48,
-    0xC7,
-    0x41,
-    0x7C,
-    0x66,
-    0x89,
-    0xB1,
-    0xD8,
-    0xDA,
-    0xA5,
-    0x79,
-    0xEC,
-    0xBF,
-    0xE9,
-    0x86,
-    0x63,
-    0xF1,
-    0x8D,
-    0x08,
-    0xFC,
-    0xCA,
-    0xD6,
-    0xBD,
-    0xA9,
-    0x87,
-    0x36,
-    0x32,
-    0x92,
-    0x3A,
-    0x60,
-    0x50,
-    0x11,
-    0x4D,
-    0x6C,
-    0xFF,
-    0xB7,
-    0x53,
-    0xFA,
-    0x7F,
-    0x8D,
-    0x9F,
-    0xFC,
-    0x8D,
-    0xB2,
-    0xE1,
-    0x70,
-    0x5E,
-    0x32,
-    0x78,
-    0xF6,
-    0x23,
-    0x66,
-    0x52,
-    0xC5,
-    0x7F,
-    0x0C,
-    0x30,
-    0xA6,
-    0xFA,
-    0xB8,
-    0x3C,
-    0x57,
-    0xC0,
-    0x58,
-    0xF6,
-    0xEA,
-    0xE6,
-    0x60,
-    0x45,
-    0xC0,
-    0xBE,
-    0x88,
-    0xC3,
-    0x6A,
-    0x7A,
-    0xFA,
-    0xC0,
-    0x3A,
-    0x42,
-    0xA0,
-    0x16,
-    0x41,
-    0xEE,
-    0x91,
-    0x96,
-    0xD8,
-    0x69,
-    0x3E,
-    0xED,
-    0x78,
-    0x79,
-    0x7A,
-    0xF1,
-    0x67,
-    0x5A,
-    0x0E,
-    0x70,
-    0x6C,
-    0x95,
-    0x75,
-    0xBC,
-    0x79,
-    0x77,
-    0x59,
-    0xCC,
-    0xAF,
-    0xA1,
-    0xD3,
-    0xA2,
-    0x2C,
-    0x9B,
-    0x48,
-    0xF0,
-    0xC7,
-    0xCF,
-    0xC6,
-    0xB4,
-    0x32,
-    0xC4,
-    0xD4,
-    0x27,
-    0x77,
-    0xD8,
-    0x11,
-    0xA6,
-    0x21,
-    0xFC,
-    0xD4,
-    0x06,
-    0x85,
-    0xCF,
-    0x53,
-    0x65,
-    0x7B,
-    0x44,
-    0x34,
-    0xE9,
-    0x6F,
-    0xB6,
-    0xED,
-    0x4F,
-    0xBA,
-    0xBE,
-    0xCA,
-    0x34,
-    0xE2,
-    0x55,
-    0x0E,
-    0xC8,
-    0xD0,
-    0x8A,
-    0xC8,
-    0x07,
-    0x94,
-    0x5C,
-    0x85,
-    0xBE,
-    0x32,
-    0xE4,
-    0xCA,
-    0x7F,
-    0xB3,
-    0x10,
-    0xF7,
-    0x8E,
-    0xED,
-    0x7C,
-    0xC6,
-    0x25,
-    0xE9,
-    0x04,
-    0x77,
-    0x8A,
-    0x57,
-    0xF4,
-    0xAD,
-    0x82,
-    0x67,
-    0x9F,
-    0x47,
-    0x64,
-    0x28,
-    0x10,
-    0xCB,
-    0xA4,
-    0x56,
-    0xE6,
-    0xD8,
-    0xE8,
-    0xB4,
-    0x02,
-    0x37,
-    0x66,
-    0xA0,
-    0xB6,
-    0x46,
-    0xB7,
-    0xDB,
-    0x91,
-    0x94,
-    0xCE,
-    0x84,
-    0x97,
-    0x74,
-    0x4D,
-    0xD3,
-    0xC3,
-    0x79,
-    0x90,
-    0x28,
-    0x30,
-    0x3B,
-    0xF3,
-    0x42,
-    0x02,
-    0x2A,
-    0x75,
-    0xEF,
-    0x62,
-    0x42,
-    0x5F,
-    0x41,
-    0xD9,
-    0x95,
-    0xCC,
-    0xCF,
-    0x67,
-    0xC8,
-    0xE8,
-    0xA1,
-    0xEC,
-    0x3F,
-    0x1A,
-    0xFE,
-    0xF8,
-    0x25,
-    0x49,
-    0x5A,
-    0x18,
-    0x99,
-    0x46,
-    0x10,
-    0x26,
-    0xBD,
-    0x3E,
-    0x92,
-    0x5E,
-    0xFB,
-    0x3D,
-    0xEC,
-    0x3D,
-    0x88,
-    0xF6,
-    0xF8,
-    0x6B,
-    0x46,
-    0xEF,
-    0xA4,
-    0x36,
-    0xF7,
-    0x65,
-    0xA0,
-    0xB8,
-    0xEA,
-    0xD2,
-    0x86,
-    0xA9,
-    0xE7,
-    0x5B,
-    0x0B,
-    0x2C,
-    0x9B,
-    0xCF,
-    0x3B,
-    0x8B,
-    0xD1,
-    0xFE,
-    0x91,
-    0x25,
-    0x2D,
-    0x78,
-    0x85,
-    0x1D,
-    0x79,
-    0x15,
-    0x22,
-    0xA8,
-    0x59,
-    0x8C,
-    0xD4,
-    0xA7,
-    0xDF,
-    0xE1,
-    0xE3,
-    0x38,
-    0x5F,
-    0x6B,
-    0x50,
-    0x99,
-    0x52,
-    0xDA,
-    0x4C,
-    0x7A,
-    0x07,
-    0x81,
-    0x7E,
-    0x62,
-    0x2F,
-    0x07,
-    0xA0,
-    0x81,
-    0x3C,
-    0x5E,
-    0x74,
-    0x39,
-    0x40,
-    0x5F,
-    0x4F,
-    0x3E,
-    0x6D,
-    0x11,
-    0x76,
-    0xA9,
-    0xFE,
-    0xCA,
-    0xD7,
-    0x7A,
-    0x7B,
-    0xCA,
-    0x4D,
-    0x74,
-    0xD0,
-    0x3B,
-    0x03,
-    0x4E,
-    0x89,
-    0x15,
-    0x31,
-    0x60,
-    0xED,
-    0xAF,
-    0xBC,
-    0x0F,
-    0x8C,
-    0xFD,
-    0xC4,
-    0x4B,
-    0xE6,
-    0x4E,
-    0x3A,
-    0x27,
-    0xE3,
-    0x0F,
-    0x23,
-    0xEC,
-    0xF5,
-    0xCE,
-    0xDE,
-    0x7F,
-    0x8D,
-    0xFD,
-    0x01,
-    0x31,
-    0xEA,
-    0x36,
-    0x56,
-    0x6F,
-    0xD4,
-    0x5B,
-    0x20,
-    0x4B,
-    0xD0,
-    0xFB,
-    0xAE,
-    0xD0,
-    0x25,
-    0xBD,
-    0x4F,
-    0xA5,
-    0xB2,
-    0x47,
-    0x82,
-    0x1E,
-    0x15,
-    0x8A,
-    0x17,
-    0xD2,
-    0xF2,
-    0x39,
-    0xCF,
-    0x5E,
-    0xE7,
-    0xD3,
-    0x16,
-    0x98,
-    0x5A,
-    0x4E,
-    0x60,
-    0xB8,
-    0x7B,
-    0x73,
-    0xB1,
-    0x5B,
-    0xF2,
-    0x17,
-    0xA8,
-    0x51,
-    0x5B,
-    0xF8,
-    0x2E,
-    0x73,
-    0xE9,
-    0xDC,
-    0xBA,
-    0x1E,
-    0xB3,
-    0x12,
-    0x0A,
-    0xF4,
-    0x2B,
-    0x9B,
-    0x12,
-    0x9C,
-    0x53,
-    0xD8,
-    0x32,
-    0x77,
-    0x1D,
-    0x05,
-    0xF7,
-    0xD4,
-    0x8C,
-    0xDB,
-    0x24,
-    0x36,
-    0xDE,
-    0x8B,
-    0x29,
-    0xC4,
-    0xC7,
-    0x5E,
-    0x32,
-    0x3B,
-    0x50,
-    0x96,
-    0x1E,
-    0x5C,
-    0x46,
-    0xBE,
-    0x53,
-    0xE1,
-    0xDC,
-    0xCE,
-    0x18,
-    0xE4,
-    0xD8,
-    0x7C,
-    0x0A,
-    0x59,
-    0x24,
-    0xCB,
-    0x8C,
-    0xF8,
-    0xAA,
-    0x84,
-    0xBC,
-    0x5C,
-    0xF8,
-    0xA2,
-    0x5D,
-    0x80,
-    0x4D,
-    0xD0,
-    0xD7,
-    0x31,
-    0xEE,
-    0xF2,
-    0xC8,
-    0xB0,
-    0xEA,
-    0xA7,
-    0xCE,
-    0x3A,
-    0xC5,
-    0x06,
-    0x64,
-    0x69,
-    0x4E,
-    0xA9,
-    0x2D,
-    0x67,
-    0x6D,
-    0xFC,
-    0x48,
-    0x58,
-    0x4D,
-    0x4B,
-    0x17,
-    0xA1,
-    0x04,
-    0x3B,
-    0xD8,
-    0x36,
-    0xE7,
-    0x5C,
-    0xA2,
-    0xE5,
-    0xED,
-    0x93,
-    0x58,
-    0xF0,
-    0xA8,
-    0x1E,
-    0x75,
-    0x49,
-    0x57,
-    0xC5,
-    0xB1,
-    0xFB,
-    0x7F,
-    0x95,
-    0xB4,
-    0x3C,
-    0xA4,
-    0x4C,
-    0xB4,
-    0x61,
-    0xE8,
-    0x48,
-    0xB3,
-    0x90,
-    0x0D,
-    0xDF,
-    0x49,
-    0x65,
-    0xAD,
-    0xC8,
-    0x40,
-    0x4C,
-    0xAC,
-    0xD4,
-    0x03,
-    0x0D,
-    0x29,
-    0xAB,
-    0xAA,
-    0x4D,
-    0x1C,
-    0xFA,
-    0x6B,
-    0xC1,
-    0xB4,
-    0x4A,
-    0xB6,
-    0xC5,
-    0x9D,
-    0x61,
-    0x64,
-    0x10,
-    0xF4,
-    0xC8,
-    0xAA,
-    0x2E,
-    0x26,
-    0x66,
-    0x74,
-    0x93,
-    0xA9,
-    0xFF,
-    0x5C,
-    0x46,
-    0x7F,
-    0xE3,
-    0x24,
-    0x54,
-    0x40,
-    0x42,
-    0x87,
-    0x67,
-    0xA3,
-    0x68,
-    0xA0,
-    0x41,
-    0xD1,
-    0x38,
-    0x6D,
-    0x63,
-    0xED,
-    0xE8,
-    0xCE,
-    0x94,
-    0xDC,
-    0xAC,
-    0xCE,
-    0x16,
-    0xC7,
-    0x75,
-    0x24,
-    0x2B,
-    0x00,
-    0x5F,
-    0x6F,
-    0x23,
-    0x32,
-    0x45,
-    0x85,
-    0xDF,
-    0x28,
-    0x91,
-    0xF7,
-    0xBB,
-    0xF9,
-    0x81,
-    0x9B,
-    0x1D,
-    0xED,
-    0x69,
-    0x7D,
-    0xC5,
-    0x74,
-    0x7B,
-    0x17,
-    0x4C,
-    0x62,
-    0x87,
-    0x7C,
-    0x7E,
-    0xDB,
-    0xB4,
-    0xAE,
-    0xF1,
-    0xC2,
-    0x54,
-    0x8C,
-    0xA4,
-    0xCC,
-    0x4B,
-    0x2C,
-    0xB9,
-    0x82,
-    0x2F,
-    0xA4,
-    0x70,
-    0x7D,
-    0x09,
-    0x42,
-    0x93,
-    0x15,
-    0xBA,
-    0x79,
-    0xC8,
-    0x4D,
-    0xAE,
-    0x30,
-    0xB7,
-    0xD3,
-    0x0A,
-    0x0D,
-    0xF1,
-    0xA6,
-    0x6A,
-    0x51,
-    0x4B,
-    0xF9,
-    0x6A,
-    0xFD,
-    0xDC,
-    0xB7,
-    0x3A,
-    0xE4,
-    0x1F,
-    0x17,
-    0xF9,
-    0x13,
-    0x76,
-    0x3A,
-    0x01,
-    0xE8,
-    0x23,
-    0xEB,
-    0xD1,
-    0x6D,
-    0x21,
-    0x5A,
-    0x76,
-    0x3A,
-    0x4C,
-    0x53,
-    0xC7,
-    0x09,
-    0x07,
-    0xC5,
-    0xC9,
-    0x0F,
-    0xE9,
-    0xED,
-    0x49,
-    0x76,
-    0xAF,
-    0x36,
-    0x07,
-    0x38,
-    0x35,
-    0x3E,
-    0x0E,
-    0xA1,
-    0x57,
-    0x11,
-    0x14,
-    0xA3,
-    0x74,
-    0x40,
-    0x03,
-    0x68,
-    0x9F,
-    0x5B,
-    0x5A,
-    0xED,
-    0xCE,
-    0x9A,
-    0xC8,
-    0x63,
-    0xF5,
-    0x79,
-    0xC1,
-    0xFD,
-    0xA8,
-    0x47,
-    0x7B,
-    0x66,
-    0xE7,
-    0xFA,
-    0xF7,
-    0xD5,
-    0x74,
-    0x7A,
-    0xE3,
-    0xA2,
-    0x1B,
-    0xF1,
-    0x25,
-    0x4B,
-    0x21,
-    0x3D,
-    0x09,
-    0xC0,
-    0xC6,
-    0x0B,
-    0xC3,
-    0xA5,
-    0x5B,
-    0x6D,
-    0xEA,
-    0x54,
-    0x63,
-    0x6D,
-    0xA6,
-    0x63,
-    0x97,
-    0xBD,
-    0x11,
-    0x7B,
-    0xBF,
-    0xD0,
-    0xB5,
-    0x68,
-    0x14,
-    0x4D,
-    0x7B,
-    0x75,
-    0x2B,
-    0x26,
-    0x47,
-    0x1A,
-    0x63,
-    0xB8,
-    0xDE,
-    0x8E,
-    0x35,
-    0x8A,
-    0xCB,
-    0xD1,
-    0xC9,
-    0x23,
-    0x39,
-    0x3B,
-    0xD6,
-    0x38,
-    0x22,
-    0x53,
-    0xE5,
-    0x15,
-    0x7F,
-    0x7C,
-    0xD8,
-    0x4E,
-    0xB3,
-    0xDC,
-    0x74,
-    0xD1,
-    0xAA,
-    0xC0,
-    0xA0,
-    0xF6,
-    0xBA,
-    0xC7,
-    0x24,
-    0x4B,
-    0xBC,
-    0xD4,
-    0x3E,
-    0x28,
-    0xC3,
-    0x4C,
-    0x7D,
-    0x3F,
-    0xAC,
-    0x8C,
-    0xC0,
-    0x6F,
-    0x6F,
-    0x7F,
-    0x2F,
-    0xCD,
-    0xC8,
-    0x90,
-    0xE4,
-    0xF6,
-    0x0F,
-    0x4B,
-    0x08,
-    0xAC,
-    0x79,
-    0x25,
-    0x5F,
-    0x53,
-    0x59,
-    0x2B,
-    0x0C,
-    0x77,
-    0xF1,
-    0x9D,
-    0x51,
-    0x2C,
-    0x71,
-    0xF0,
-    0x4C,
-    0x30,
-    0x02,
-    0x59,
-    0x7A,
-    0xE7,
-    0x8A,
-    0x81,
-    0x05,
-    0x83,
-    0x63,
-    0xEA,
-    0xC0,
-    0xD8,
-    0xED,
-    0x92,
-    0x93,
-    0x17,
-    0x7C,
-    0xAF,
-    0x15,
-    0x31,
-    0x4F,
-    0x02,
-    0xA9,
-    0xA1,
-    0x3C,
-    0x4A,
-    0x4C,
-    0x0B,
-    0x55,
-    0x6C,
-    0x01,
-    0x68,
-    0x1D,
-    0xA9,
-    0x4E,
-    0xC9,
-    0xBB,
-    0xF9,
-    0x0D,
-    0x2B,
-    0x3D,
-    0x11,
-    0x37,
-    0xDC,
-    0x12,
-    0x0F,
-    0x05,
-    0x91,
-    0xF2,
-    0x77,
-    0xD1,
-    0x47,
-    0xFB,
-    0x0A,
-    0xE9,
-    0x25,
-    0xAC,
-    0x4F,
-    0x3E,
-    0x75,
-    0xF1,
-    0x59,
-    0x41,
-    0xE9,
-    0x6E,
-    0xFA,
-    0xBC,
-    0xFD,
-    0x84,
-    0x72,
-    0xAF,
-    0x01,
-    0xD8,
-    0x4F,
-    0x4B,
-    0x48,
-    0x20,
-    0x84,
-    0xE1,
-    0xFA,
-    0x22,
-    0xC3,
-    0xE2,
-    0xCE,
-    0x6C,
-    0x06,
-    0x83,
-    0xA7,
-    0x31,
-    0x67,
-    0xC8,
-    0xEB,
-    0xEE,
-    0xED,
-    0xFA,
-    0xDE,
-    0x04,
-    0x6F,
-    0x25,
-    0x53,
-    0xF2,
-    0xAA,
-    0x90,
-    0x57,
-    0xF7,
-    0xEC,
-    0xF7,
-    0xFD,
-    0x2A,
-    0x01,
-    0x45,
-    0x82,
-    0xD5,
-    0xB0,
-    0x12,
-    0xA6,
-    0x32,
-    0xC7,
-    0x9C,
-    0xB6,
-    0x79,
-    0x63,
-    0xF0,
-    0x3B,
-    0x2C,
-    0x1D,
-    0x83,
-    0x57,
-    0x9E,
-    0x0C,
-    0x55,
-    0x70,
-    0x49,
-    0xB4,
-    0xB6,
-    0x48,
-    0xB0,
-    0x84,
-    0xEF,
-    0xE0,
-    0x63,
-    0x6A,
-    0xFD,
-    0xF6,
-    0x5B,
-    0x57,
-    0x50,
-    0xF4,
-    0x10,
-    0x15,
-    0x0A,
-    0x0F,
-    0xFF,
-    0x57,
-    0xFD,
-    0x26,
-    0x9C,
-    0x6F,
-    0x16,
-    0xCC,
-    0x9C,
-    0xD6,
-    0x4B,
-    0x46,
-    0x3B,
-    0xEF,
-    0x61,
-    0x2F,
-    0xEF,
-    0xB8,
-    0x0C,
-    0xA7,
-    0xCA,
-    0x8F,
-    0xAE,
-    0xD2,
-    0x59,
-    0x33,
-    0x64,
-    0xCA,
-    0xD8,
-    0x5B,
-    0x2C,
-    0xBF,
-    0xCD,
-    0x3A,
-    0x0E,
-    0x67,
-    0x8E,
-    0xDC,
-    0xF8,
-    0x85,
-    0xE2,
-    0xE9,
-    0x88,
-    0x34,
-    0x49,
-    0xEC,
-    0x30,
-    0xED,
-    0xC7,
-    0xB5,
-    0x13,
-    0xCE,
-    0xB5,
-    0xDD,
-    0x9F,
-    0x08,
-    0xAD,
-    0xEE,
-    0x0B,
-    0xFE,
-    0xE2,
-    0xCF,
-    0x03,
-    0x92,
-    0x5C,
-    0x8A,
-    0x4C,
-    0x24,
-    0xCF,
-    0xCC,
-    0xBF,
-    0x75,
-    0xB8,
-    0xE8,
-    0x91,
-    0x1E,
-    0x3A,
-    0xA3,
-    0x92,
-    0x86,
-    0x3E,
-    0xD9,
-    0xEB,
-    0x08,
-    0x7B,
-    0xE8,
-    0x98,
-    0x3D,
-    0x6E,
-    0x70,
-    0x5F,
-    0x86,
-    0x98,
-    0xE2,
-    0xD3,
-    0x87,
-    0xC5,
-    0xA4,
-    0x86,
-    0xC7,
-    0xBE,
-    0xA1,
-    0xB6,
-    0x33,
-    0x9F,
-    0x0B,
-    0x26,
-    0x12,
-    0x94,
-    0xE5,
-    0x61,
-    0x95,
-    0x6A,
-    0xBB,
-    0xED,
-    0x66,
-    0x74,
-    0x8E,
-    0x39,
-    0xAF,
-    0x30,
-    0xAC,
-    0x56,
-    0xC7,
-    0xA3,
-    0xFF,
-    0xFF,
-    0xD2,
-    0xAE,
-    0x74,
-    0x87,
-    0xFD,
-    0xDD,
-    0x52,
-    0x93,
-    0xC4,
-    0x9F,
-    0x8F,
-    0xCC,
-    0xD2,
-    0x03,
-    0xBC,
-    0x26,
-    0x4F,
-    0x47,
-    0x64,
-    0x8F,
-    0xB3,
-    0xAB,
-    0xB5,
-    0x50,
-    0xD5,
-    0x32,
-    0x72,
-    0x1B,
-    0x0E,
-    0x91,
-    0xA1,
-    0xF3,
-    0x7D,
-    0x33,
-    0x8A,
-    0x46,
-    0xB4,
-    0xD4,
-    0x28,
-    0x1F,
-    0x23,
-    0xDF,
-    0x29,
-    0x1E,
-    0xE3,
-    0x9E,
-    0x75,
-    0xCF,
-    0xB6,
-    0xFE,
-    0x91,
-    0x8D,
-    0xCE,
-    0x1D,
-    0x86,
-    0x8D,
-    0x28,
-    0x75,
-    0x59,
-    0x7A,
-    0x7E,
-    0x9F,
-    0x3F,
-    0x47,
-    0x17,
-    0x52,
-    0x79,
-    0xE5,
-    0x5D,
-    0xAA,
-    0x4F,
-    0x40,
-    0xA4,
-    0xD6,
-    0x59,
-    0x8A,
-    0xC3,
-    0x25,
-    0x8A,
-    0x44,
-    0x5E,
-    0xB4,
-    0xF7,
-    0x45,
-    0x5C,
-    0x93,
-    0x4F,
-    0xFE,
-    0x86,
-    0x87,
-    0xFD,
-    0xAE,
-    0x9A,
-    0xA1,
-    0x9F,
-    0xDD,
-    0x0D,
-    0x19,
-    0xCF,
-    0x73,
-    0xEF,
-    0x9C,
-    0xB1,
-    0x8B,
-    0xC3,
-    0xFE,
-    0xF2,
-    0x04,
-    0xB2,
-    0xD1,
-    0xD7,
-    0x69,
-    0x2B,
-    0x5A,
-    0xBF,
-    0x90,
-    0x17,
-    0x3B,
-    0xE5,
-    0xDE,
-    0x61,
-    0xB4,
-    0xE2,
-    0x23,
-    0x96,
-    0x0E,
-    0x22,
-    0x40,
-    0x5D,
-    0x33,
-    0x0D,
-    0x19,
-    0xFF,
-    0x2D,
-    0xDC,
-    0x22,
-    0x72,
-    0xC8,
-    0x58,
-    0xC5,
-    0x92,
-    0x23,
-    0xC2,
-    0x24,
-    0x13,
-    0x20,
-    0x5B,
-    0xFA,
-    0x86,
-    0xDE,
-    0xE7,
-    0x55,
-    0x66,
-    0x7A,
-    0xFF,
-    0xC7,
-    0x88,
-    0x73,
-    0x27,
-    0xEE,
-    0x72,
-    0x6B,
-    0x52,
-    0x53,
-    0x4A,
-    0x6E,
-    0x7F,
-    0x10,
-    0x1A,
-    0xB3,
-    0x67,
-    0xB2,
-    0xBE,
-    0x96,
-    0x65,
-    0x95,
-    0x31,
-    0x04,
-    0x79,
-    0x79,
-    0x30,
-    0x92,
-    0xCD,
-    0x34,
-    0x98,
-    0xE6,
-    0x65,
-    0x42,
-    0x44,
-    0x4E,
-    0x5C,
-    0x2F,
-    0x0C,
-    0xED,
-    0x6B,
-    0xAC,
-    0x4D,
-    0x23,
-    0x73,
-    0x32,
-    0x8E,
-    0x03,
-    0x87,
-    0x5A,
-    0x69,
-    0x50,
-    0xC5,
-    0x74,
-    0xFA,
-    0x49,
-    0x6E,
-    0xF7,
-    0xF5,
-    0xF4,
-    0xC3,
-    0x04,
-    0xB6,
-    0xE7,
-    0x1E,
-    0x09,
-    0xC1,
-    0x3A,
-    0x26,
-    0xB2,
-    0xD2,
-    0x0B,
-    0x7F,
-    0x9D,
-    0x0C,
-    0x25,
-    0xCE,
-    0x51,
-    0xC1,
-    0x6A,
-    0xAD,
-    0xEA,
-    0xA8,
-    0x2A,
-    0x70,
-    0x25,
-    0x1A,
-    0x11,
-    0xFE,
-    0xCA,
-    0xAC,
-    0x97,
-    0x21,
-    0x4D,
-    0xAB,
-    0x57,
-    0x06,
-    0xA8,
-    0x02,
-    0xC8,
-    0x49,
-    0x1E,
-    0xF0,
-    0x66,
-    0xC2,
-    0x83,
-    0x2B,
-    0x5A,
-    0x27,
-    0xAF,
-    0x13,
-    0xD1,
-    0xAC,
-    0x76,
-    0x51,
-    0x40,
-    0x59,
-    0x8A,
-    0xEA,
-    0x61,
-    0xF6,
-    0x1F,
-    0xE3,
-    0x5A,
-    0x77,
-    0xE8,
-    0xFB,
-    0xF2,
-    0x4C,
-    0xB5,
-    0xE0,
-    0xA3,
-    0x4E,
-    0x80,
-    0xB0,
-    0x15,
-    0x06,
-    0x20,
-    0x03,
-    0x26,
-    0xBC,
-    0x0C,
-    0x68,
-    0x5F,
-    0x9D,
-    0xF8,
-    0xCC,
-    0x52,
-    0x65,
-    0xB2,
-    0xD3,
-    0x02,
-    0x58,
-    0x39,
-    0x46,
-    0xE5,
-    0x8E,
-    0xC4,
-    0x46,
-    0x25,
-    0x94,
-    0x29,
-    0xC9,
-    0xF5,
-    0xBD,
-    0x7A,
-    0x93,
-    0x80,
-    0xAF,
-    0x5F,
-    0x54,
-    0xB6,
-    0x35,
-    0x03,
-    0xA3,
-    0x74,
-    0x60,
-    0xE5,
-    0xCC,
-    0xFF,
-    0x31,
-    0x05,
-    0x94,
-    0x21,
-    0x97,
-    0x5A,
-    0xA4,
-    0x96,
-    0x88,
-    0xD7,
-    0x3A,
-    0x13,
-    0x43,
-    0xE8,
-    0x7F,
-    0x83,
-    0xB3,
-    0x37,
-    0x87,
-    0x22,
-    0x36,
-    0x17,
-    0x91,
-    0xBC,
-    0x91,
-    0x36,
-    0x52,
-    0x12,
-    0x86,
-    0xD2,
-    0x4D,
-    0xAF,
-    0xBA,
-    0x91,
-    0x6B,
-    0x56,
-    0xB4,
-    0xAF,
-    0x7B,
-    0xB6,
-    0xB3,
-    0x08,
-    0x63,
-    0x7C,
-    0x3C,
-    0x74,
-    0x49,
-    0x6C,
-    0x1B,
-    0xA5,
-    0x8F,
-    0x59,
-    0x74,
-    0xB1,
-    0xA4,
-    0xD9,
-    0x90,
-    0x01,
-    0x35,
-    0xF0,
-    0x11,
-    0x1D,
-    0xAB,
-    0x31,
-    0x14,
-    0xA5,
-    0x87,
-    0x38,
-    0xF3,
-    0xDF,
-    0xFD,
-    0x0D,
-    0x35,
-    0x67,
-    0x85,
-    0x9E,
-    0xD3,
-    0x9E,
-    0x28,
-    0x7A,
-    0xE5,
-    0xD5,
-    0x1F,
-    0x65,
-    0xAB,
-    0x3D,
-    0x6E,
-    0x07,
-    0x3F,
-    0x63,
-    0xB7,
-    0x5D,
-    0x39,
-    0xAE,
-    0x05,
-    0x4A,
-    0x36,
-    0x43,
-    0x08,
-    0x35,
-    0x00,
-    0xAF,
-    0x22,
-    0x57,
-    0xF2,
-    0x68,
-    0xB4,
-    0x34,
-    0x19,
-    0x3A,
-    0x54,
-    0xE8,
-    0x6A,
-    0x08,
-    0x82,
-    0x75,
-    0x88,
-    0xCC,
-    0x1D,
-    0x7A,
-    0x2F,
-    0x42,
-    0x5C,
-    0xF3,
-    0xF7,
-    0xD0,
-    0x8E,
-    0x8B,
-    0xE3,
-    0x25,
-    0xED,
-    0xD9,
-    0x24,
-    0x25,
-    0xAE,
-    0xCB,
-    0xD2,
-    0x2E,
-    0x86,
-    0x1B,
-    0x7A,
-    0x49,
-    0x24,
-    0x51,
-    0x97,
-    0xA2,
-    0xC7,
-    0x7C,
-    0x91,
-    0x2E,
-    0x58,
-    0x80,
-    0x1E,
-    0xCE,
-    0xA1,
-    0x82,
-    0x3B,
-    0x91,
-    0x39,
-    0x05,
-    0x2D,
-    0x09,
-    0xFB,
-    0x29,
-    0x22,
-    0xBC,
-    0x5F,
-    0xC3,
-    0xEA,
-    0xB8,
-    0xA8,
-    0x0A,
-    0xEC,
-    0xE9,
-    0x2F,
-    0x98,
-    0x7F,
-    0xAF,
-    0xF1,
-    0xB7,
-    0x9A,
-    0xA5,
-    0xDD,
-    0x6F,
-    0xAF,
-    0xD9,
-    0xA5,
-    0xC4,
-    0x61,
-    0xA1,
-    0x86,
-    0x9D,
-    0xE0,
-    0xE8,
-    0x3A,
-    0x0E,
-    0x1F,
-    0xFF,
-    0x89,
-    0xFD,
-    0x7F,
-    0xDC,
-    0x52,
-    0xDC,
-    0x7A,
-    0x7F,
-    0xA3,
-    0x68,
-    0xED,
-    0xDB,
-    0x57,
-    0xC9,
-    0xDB,
-    0x35,
-    0xB1,
-    0x3D,
-    0xBF,
-    0xCD,
-    0xF7,
-    0xCA,
-    0xCD,
-    0x23,
-    0xB3,
-    0x45,
-    0xC0,
-    0x1D,
-    0xEC,
-    0x06,
-    0x75,
-    0xEB,
-    0x77,
-    0x67,
-    0x45,
-    0x29,
-    0x75,
-    0x9A,
-    0x31,
-    0xD7,
-    0x62,
-    0x15,
-    0xB1,
-    0x24,
-    0x5A,
-    0xD9,
-    0x53,
-    0xF4,
-    0x49,
-    0xAD,
-    0x97,
-    0xDD,
-    0x5B,
-    0x2B,
-    0x0F,
-    0x01,
-    0x5B,
-    0xF6,
-    0x75,
-    0xB5,
-    0x50,
-    0x4F,
-    0xDC,
-    0x9C,
-    0xC6,
-    0x13,
-    0x97,
-    0x28,
-    0x48,
-    0x7E,
-    0xAE,
-    0x21,
-    0xE1,
-    0x20,
-    0x7F,
-    0x91,
-    0x13,
-    0x9F,
-    0x08,
-    0xA1,
-    0x38,
-    0x05,
-    0x87,
-    0x4A,
-    0x60,
-    0xB8,
-    0xD0,
-    0x03,
-    0xE7,
-    0x63,
-    0x80,
-    0x30,
-    0x00,
-    0x90,
-    0x14,
-    0x72,
-    0x14,
-    0xF1,
-    0x46,
-    0x4B,
-    0x28,
-    0x3F,
-    0x02,
-    0x32,
-    0x8C,
-    0x6C,
-    0xBB,
-    0x4C,
-    0xA8,
-    0xF5,
-    0x97,
-    0x4E,
-    0xDC,
-    0x48,
-    0x9A,
-    0xFF,
-    0xCF,
-    0x4F,
-    0x9A,
-    0x84,
-    0x43,
-    0x94,
-    0xB7,
-    0x44,
-    0x78,
-    0xF8,
-    0xEC,
-    0xEA,
-    0x15,
-    0xFF,
-    0xBC,
-    0x78,
-    0x7D,
-    0xA5,
-    0x0C,
-    0x80,
-    0x38,
-    0xD3,
-    0xD6,
-    0x5B,
-    0x48,
-    0xFA,
-    0x7F,
-    0x8E,
-    0xFD,
-    0x8B,
-    0xD0,
-    0xE0,
-    0x70,
-    0xC7,
-    0x36,
-    0xE5,
-    0x93,
-    0xA1,
-    0xE8,
-    0xA5,
-    0x0D,
-    0x67,
-    0xA4,
-    0x7B,
-    0x18,
-    0x10,
-    0xA8,
-    0x17,
-    0x88,
-    0xCF,
-    0xB4,
-    0x98,
-    0x8B,
-    0x36,
-    0x20,
-    0x8E,
-    0x3A,
-    0x72,
-    0xC3,
-    0x0B,
-    0xE9,
-    0x29,
-    0x15,
-    0x4E,
-    0xD6,
-    0xC5,
-    0x47,
-    0xC1,
-    0xEF,
-    0xC2,
-    0xC5,
-    0x98,
-    0xA6,
-    0xA4,
-    0x42,
-    0xA1,
-    0x91,
-    0x66,
-    0xCB,
-    0xC7,
-    0x37,
-    0x2A,
-    0x15,
-    0x6A,
-    0xEF,
-    0x15,
-    0x09,
-    0xE5,
-    0x2C,
-    0x17,
-    0xBD,
-    0x49,
-    0xD5,
-    0xE3,
-    0x0C,
-    0x81,
-    0x3B,
-    0x02,
-    0x6A,
-    0x52,
-    0x1E,
-    0x2A,
-    0x14,
-    0x03,
-    0x86,
-    0x7E,
-    0xCE,
-    0x50,
-    0x16,
-    0xCC,
-    0x31,
-    0x22,
-    0x31,
-    0xA5,
-    0x53,
-    0x11,
-    0xEE,
-    0x86,
-    0x1B,
-    0xFE,
-    0x27,
-    0x55,
-    0x35,
-    0xC2,
-    0x78,
-    0xD6,
-    0x82,
-    0xFD,
-    0x8B,
-    0x00,
-    0x0C,
-    0x56,
-    0xF9,
-    0x5B,
-    0xB5,
-    0xBA,
-    0xBC,
-    0xD3,
-    0xEC,
-    0xF7,
-    0x3A,
-    0xD4,
-    0xB8,
-    0x73,
-    0xAD,
-    0x6A,
-    0xE9,
-    0x07,
-    0x1B,
-    0x3E,
-    0x50,
-    0xE5,
-    0x1C,
-    0x8D,
-    0x09,
-    0x70,
-    0x2A,
-    0x60,
-    0x0A,
-    0x58,
-    0xB7,
-    0xEA,
-    0xF9,
-    0x84,
-    0x82,
-    0x70,
-    0xA7,
-    0x94,
-    0xFB,
-    0x7B,
-    0x3B,
-    0x26,
-    0xED,
-    0x11,
-    0x64,
-    0xE3,
-    0x80,
-    0x16,
-    0x73,
-    0xC7,
-    0x54,
-    0xEA,
-    0x41,
-    0xC9,
-    0x58,
-    0xC8,
-    0x10,
-    0xB4,
-    0x14,
-    0xEB,
-    0x25,
-    0x13,
-    0x82,
-    0x7F,
-    0xA3,
-    0x6F,
-    0x91,
-    0x30,
-    0xBE,
-    0x3F,
-    0x72,
-    0x81,
-    0x25,
-    0xE4,
-    0x78,
-    0xCD,
-    0x98,
-    0x7D,
-    0x6C,
-    0x14,
-    0xB4,
-    0xD8,
-    0xF7,
-    0x4A,
-    0x6B,
-    0x3C,
-    0xB6,
-    0x91,
-    0xC8,
-    0x91,
-    0x92,
-    0x5B,
-    0x34,
-    0x69,
-    0x5E,
-    0xC1,
-    0x64,
-    0xFD,
-    0x16,
-    0xDD,
-    0xA3,
-    0x09,
-    0x0D,
-    0x58,
-    0x73,
-    0xA7,
-    0xF7,
-    0xCC,
-    0xCD,
-    0x66,
-    0xF9,
-    0x58,
-    0x6C,
-    0xC5,
-    0xAF,
-    0xD8,
-    0x19,
-    0x39,
-    0x09,
-    0x87,
-    0x25,
-    0xD6,
-    0x3F,
-    0xDB,
-    0x8B,
-    0x1A,
-    0xC6,
-    0x28,
-    0x41,
-    0xC6,
-    0x57,
-    0x39,
-    0x14,
-    0x73,
-    0x61,
-    0x62,
-    0x07,
-    0x98,
-    0xCB,
-    0x52,
-    0xB8,
-    0x89,
-    0x79,
-    0xC4,
-    0xD7,
-    0xFA,
-    0x89,
-    0x46,
-    0xE5,
-    0x93,
-    0xC6,
-    0xB0,
-    0x2C,
-    0x23,
-    0xAF,
-    0x63,
-    0xDC,
-    0xD0,
-    0xB4,
-    0xEC,
-    0xF4,
-    0x10,
-    0xEF,
-    0x14,
-    0x27,
-    0x4C,
-    0xF1,
-    0xB2,
-    0xBC,
-    0x28,
-    0x59,
-    0xF3,
-    0xEA,
-    0xC2,
-    0xAE,
-    0xCC,
-    0x93,
-    0x5A,
-    0xD7,
-    0xED,
-    0x72,
-    0xE7,
-    0xAB,
-    0x4C,
-    0xEC,
-    0x21,
-    0x5C,
-    0x70,
-    0x3C,
-    0x11,
-    0xB5,
-    0x9F,
-    0x77,
-    0x55,
-    0x49,
-    0x91,
-    0x0B,
-    0x26,
-    0x8B,
-    0x47,
-    0xCA,
-    0x41,
-    0x15,
-    0x6E,
-    0x46,
-    0x46,
-    0x14,
-    0x23,
-    0x56,
-    0x97,
-    0x19,
-    0x31,
-    0xCA,
-    0x6B,
-    0xF2,
-    0x6F,
-    0x94,
-    0x40,
-    0xC8,
-    0x27,
-    0x1F,
-    0xE6,
-    0x64,
-    0x83,
-    0x9D,
-    0x11,
-    0xDA,
-    0xBF,
-    0xD3,
-    0x39,
-    0x05,
-    0xA1,
-    0x69,
-    0xD8,
-    0x74,
-    0x1F,
-    0x26,
-    0xFC,
-    0x5A,
-    0xD2,
-    0x4F,
-    0x2A,
-    0x49,
-    0xD9,
-    0x33,
-    0xCB,
-    0xB1,
-    0xE8,
-    0x38,
-    0x58,
-    0x79,
-    0xCB,
-    0x73,
-    0x67,
-    0x21,
-    0xEA,
-    0x16,
-    0x67,
-    0x92,
-    0xEF,
-    0x2F,
-    0x90,
-    0xDA,
-    0xBB,
-    0xEC,
-    0x88,
-    0x6B,
-    0x7C,
-    0x5A,
-    0x9E,
-    0x3F,
-    0x4F,
-    0x6C,
-    0x3B,
-    0xCC,
-    0x7E,
-    0x64,
-    0x7E,
-    0x59,
-    0x98,
-    0x7C,
-    0xB6,
-    0xC9,
-    0xFA,
-    0x67,
-    0x16,
-    0x55,
-    0x96,
-    0xB2,
-    0x65,
-    0x87,
-    0x69,
-    0x66,
-    0x57,
-    0x23,
-    0xD4,
-    0x0F,
-    0xF6,
-    0xDE,
-    0x27,
-    0x38,
-    0x82,
-    0x4E,
-    0x55,
-    0xF5,
-    0xB9,
-    0xC6,
-    0xAD,
-    0x9E,
-    0x83,
-    0xD9,
-    0x8F,
-    0xAB,
-    0x7C,
-    0xA4,
-    0xD2,
-    0x41,
-    0xBB,
-    0xAA,
-    0xEB,
-    0xD5,
-    0xA3,
-    0x25,
-    0x1C,
-    0x87,
-    0x12,
-    0x97,
-    0xC1,
-    0x0A,
-    0xE8,
-    0x0F,
-    0x9E,
-    0x25,
-    0xD1,
-    0x61,
-    0x80,
-    0x80,
-    0x75,
-    0x38,
-    0xE3,
-    0x73,
-    0xED,
-    0x93,
-    0x74,
-    0x94,
-    0x0E,
-    0x47,
-    0x96,
-    0xB0,
-    0x83,
-    0xA6,
-    0x01,
-    0x7A,
-    0x50,
-    0x5C,
-    0x21,
-    0x9E,
-    0x43,
-    0x82,
-    0x64,
-    0x00,
-    0x4F,
-    0xEB,
-    0x52,
-    0xB3,
-    0x1B,
-    0x21,
-    0x17,
-    0x7F,
-    0xFB,
-    0x4D,
-    0xD2,
-    0xE6,
-    0x55,
-    0x2E,
-    0x64,
-    0x8F,
-    0x1D,
-    0x96,
-    0x7D,
-    0xD7,
-    0xB7,
-    0x48,
-    0xE7,
-    0x97,
-    0x2B,
-    0xC0,
-    0xEA,
-    0xB8,
-    0x16,
-    0x49,
-    0xB4,
-    0xC9,
-    0xBA,
-    0x10,
-    0xA7,
-    0x1C,
-    0x75,
-    0xB9,
-    0x39,
-    0xCF,
-    0x9F,
-    0xDA,
-    0x01,
-    0x9B,
-    0xFB,
-    0xA4,
-    0xCC,
-    0x54,
-    0x19,
-    0xC6,
-    0x2C,
-    0xFA,
-    0x89,
-    0x24,
-    0xAB,
-    0xC6,
-    0xA1,
-    0xE4,
-    0xFB,
-    0x2F,
-    0x86,
-    0xE2,
-    0xF9,
-    0xE4,
-    0x0C,
-    0xB3,
-    0x60,
-    0x33,
-    0xA9,
-    0x41,
-    0xB3,
-    0x52,
-    0x64,
-    0x8B,
-    0x0B,
-    0x18,
-    0xC0,
-    0xD5,
-    0xC0,
-    0xC5,
-    0x32,
-    0xDC,
-    0xFD,
-    0x99,
-    0x30,
-    0x24,
-    0x9A,
-    0xC1,
-    0x40,
-    0x48,
-    0x27,
-    0xE1,
-    0x6A,
-    0xD4,
-    0x9A,
-    0x3D,
-    0x3A,
-    0x29,
-    0xA1,
-    0xB2,
-    0xD5,
-    0xBB,
-    0x24,
-    0xF1,
-    0xB7,
-    0x17,
-    0x58,
-    0x61,
-    0x74,
-    0x51,
-    0x09,
-    0x6D,
-    0x25,
-    0x25,
-    0xEF,
-    0xB9,
-    0x73,
-    0x6B,
-    0x3E,
-    0xF7,
-    0x77,
-    0xBA,
-    0xDF,
-    0x39,
-    0xBB,
-    0x68,
-    0x92,
-    0x2F,
-    0x28,
-    0xFB,
-    0xD3,
-    0xED,
-    0x04,
-    0x14,
-    0x48,
-    0x32,
-    0x6D,
-    0xCD,
-    0x3D,
-    0xA7,
-    0x3A,
-    0x72,
-    0x00,
-    0xAA,
-    0x3A,
-    0xBB,
-    0x2D,
-    0xED,
-    0xA5,
-    0x83,
-    0x06,
-    0xA3,
-    0x8E,
-    0x8A,
-    0x71,
-    0x77,
-    0x54,
-    0xA5,
-    0x10,
-    0x02,
-    0xDA,
-    0xE7,
-    0x5B,
-    0x1B,
-    0xE2,
-    0x9D,
-    0x98,
-    0x83,
-    0x07,
-    0xA6,
-    0xE2,
-    0x03,
-    0x62,
-    0x56,
-    0xA8,
-    0xEE,
-    0xE7,
-    0xE6,
-    0x0F,
-    0x7B,
-    0x57,
-    0x0D,
-    0x2E,
-    0x59,
-    0x56,
-    0xFB,
-    0x60,
-    0x27,
-    0x86,
-    0xCC,
-    0x79,
-    0xAA,
-    0xA7,
-    0x29,
-    0x44,
-    0x1F,
-    0xFE,
-    0x87,
-    0x25,
-    0xDF,
-    0x1E,
-    0xBC,
-    0x69,
-    0xCC,
-    0xDA,
-    0xB9,
-    0x85,
-    0xEB,
-    0x03,
-    0xF3,
-    0x17,
-    0xBA,
-    0x2B,
-    0x07,
-    0x7E,
-    0x2F,
-    0xE8,
-    0x87,
-    0x32,
-    0x12,
-    0xA7,
-    0x9F,
-    0x33,
-    0x6B,
-    0xC5,
-    0xED,
-    0x5C,
-    0xFA,
-    0x51,
-    0x6E,
-    0xDE,
-    0x67,
-    0x2E,
-    0x3C,
-    0x86,
-    0x90,
-    0x16,
-    0xCB,
-    0x33,
-    0x93,
-    0x56,
-    0xC5,
-    0x87,
-    0x3C,
-    0x5E,
-    0xD7,
-    0x5C,
-    0xEE,
-    0xB3,
-    0x25,
-    0x83,
-    0xE0,
-    0xC9,
-    0x9B,
-    0xFC,
-    0xE9,
-    0x2D,
-    0xAA,
-    0x4B,
-    0xC0,
-    0x60,
-    0x92,
-    0xAC,
-    0x25,
-    0xA6,
-    0x99,
-    0xC0,
-    0xBF,
-    0x0D,
-    0xAF,
-    0x77,
-    0x01,
-    0x5F,
-    0x9E,
-    0x06,
-    0xE2,
-    0x70,
-    0xE2,
-    0xAF,
-    0x68,
-    0x63,
-    0xD2,
-    0x86,
-    0x72,
-    0x2C,
-    0x0C,
-    0xA0,
-    0x73,
-    0x5F,
-    0x83,
-    0x71,
-    0x69,
-    0x5B,
-    0x09,
-    0x8F,
-    0x5A,
-    0xF5,
-    0x0F,
-    0xEA,
-    0x74,
-    0xB3,
-    0xE1,
-    0x5D,
-    0xB8,
-    0xC7,
-    0xBA,
-    0x91,
-    0xDC,
-    0x1B,
-    0xE5,
-    0x41,
-    0xDA,
-    0x93,
-    0xAA,
-    0xFC,
-    0xA5,
-    0xF8,
-    0xD5,
-    0xC7,
-    0xDC,
-    0x5C,
-    0xB0,
-    0x8D,
-    0x6A,
-    0x0E,
-    0xC8,
-    0x59,
-    0x49,
-    0xB2,
-    0x4A,
-    0xAB,
-    0x9A,
-    0x89,
-    0x10,
-    0x9B,
-    0xCD,
-    0x36,
-    0x79,
-    0xB9,
-    0xB8,
-    0x73,
-    0xD2,
-    0x24,
-    0xDF,
-    0xC5,
-    0x14,
-    0xEA,
-    0xB1,
-    0xD2,
-    0xD5,
-    0xD7,
-    0xCB,
-    0x3D,
-    0x09,
-    0x04,
-    0xC7,
-    0xEF,
-    0x44,
-    0x34,
-    0xD3,
-    0x87,
-    0xA7,
-    0x8D,
-    0x92,
-    0xFA,
-    0xD4,
-    0x55,
-    0xC2,
-    0x2D,
-    0xF4,
-    0x0C,
-    0xD6,
-    0x18,
-    0x76,
-    0x51,
-    0x6B,
-    0x9B,
-    0xF9,
-    0x26,
-    0x0F,
-    0xF5,
-    0xDA,
-    0x4C,
-    0x95,
-    0x18,
-    0x0F,
-    0x5F,
-    0x0F,
-    0xE9,
-    0x2D,
-    0xE3,
-    0xFC,
-    0xAF,
-    0x6F,
-    0xD1,
-    0x40,
-    0x11,
-    0x39,
-    0x83,
-    0x6D,
-    0x0C,
-    0x66,
-    0x64,
-    0xF7,
-    0x8E,
-    0xC2,
-    0x5E,
-    0x97,
-    0x85,
-    0x7D,
-    0x3F,
-    0x3C,
-    0x3F,
-    0x79,
-    0xF4,
-    0xF7,
-    0x09,
-    0x91,
-    0x26,
-    0x45,
-    0x64,
-    0x3D,
-    0xC2,
-    0xC5,
-    0xE4,
-    0x91,
-    0x0B,
-    0x86,
-    0xE3,
-    0xAA,
-    0x55,
-    0x49,
-    0x91,
-    0x4A,
-    0x01,
-    0x3F,
-    0xAB,
-    0x86,
-    0x6B,
-    0x0D,
-    0x10,
-    0x64,
-    0x14,
-    0x17,
-    0xF2,
-    0x35,
-    0x15,
-    0x7B,
-    0xA1,
-    0x05,
-    0xEE,
-    0x6D,
-    0xA8,
-    0x91,
-    0xAB,
-    0x7F,
-    0x77,
-    0x0B,
-    0xBE,
-    0x3A,
-    0x09,
-    0x6B,
-    0xD7,
-    0x55,
-    0x18,
-    0x6F,
-    0xA2,
-    0x98,
-    0x88,
-    0x15,
-    0x3A,
-    0x30,
-    0x9A,
-    0x60,
-    0x3C,
-    0x85,
-    0x65,
-    0x52,
-    0xD5,
-    0x2D,
-    0x2D,
-    0x67,
-    0xD8,
-    0x4B,
-    0x46,
-    0x58,
-    0xAA,
-    0xE6,
-    0xF8,
-    0xE3,
-    0x4D,
-    0x4E,
-    0x86,
-    0x45,
-    0x17,
-    0xCF,
-    0x86,
-    0xED,
-    0xD0,
-    0x12,
-    0x19,
-    0x38,
-    0x4E,
-    0xCF,
-    0xD7,
-    0x68,
-    0x89,
-    0x5A,
-    0xA6,
-    0x6C,
-    0x16,
-    0xA0,
-    0x85,
-    0x7E,
-    0x4C,
-    0x40,
-    0xCE,
-    0x7F,
-    0xB8,
-    0x29,
-    0xFF,
-    0x04,
-    0x55,
-    0x8B,
-    0x41,
-    0xC0,
-    0xD3,
-    0x84,
-    0x87,
-    0x88,
-    0x8D,
-    0x2F,
-    0x27,
-    0xE3,
-    0x5F,
-    0x11,
-    0x93,
-    0x72,
-    0x75,
-    0x6D,
-    0x02,
-    0x32,
-    0x63,
-    0xBA,
-    0x43,
-    0xE5,
-    0x92,
-    0x4C,
-    0xEF,
-    0x1B,
-    0xA3,
-    0x8C,
-    0xA6,
-    0xEE,
-    0x88,
-    0x98,
-    0xBD,
-    0xA4,
-    0x68,
-    0x73,
-    0x87,
-    0x49,
-    0xBD,
-    0x0B,
-    0xFA,
-    0xA7,
-    0xA8,
-    0x9E,
-    0x67,
-    0x98,
-    0xED,
-    0xA6,
-    0x8A,
-    0xB5,
-    0xA8,
-    0xE0,
-    0x4E,
-    0x5C,
-    0x0E,
-    0x06,
-    0x88,
-    0x6C,
-    0x2F,
-    0xC6,
-    0x78,
-    0x0F,
-    0x55,
-    0xE6,
-    0x81,
-    0x72,
-    0x05,
-    0xB3,
-    0x8A,
-    0xA9,
-    0x7C,
-    0x7F,
-    0xB5,
-    0xF0,
-    0x1D,
-    0xA3,
-    0x04,
-    0xC4,
-    0x9F,
-    0x73,
-    0x7A,
-    0xB6,
-    0xFD,
-    0x90,
-    0xC5,
-    0x10,
-    0x19,
-    0x6E,
-    0xEC,
-    0x35,
-    0x22,
-    0x51,
-    0x92,
-    0xB4,
-    0x7E,
-    0xDF,
-    0x5C,
-    0xCF,
-    0x5F,
-    0x88,
-    0x24,
-    0xD9,
-    0x76,
-    0x6D,
-    0xA6,
-    0xB9,
-    0xA6,
-    0x31,
-    0xFD,
-    0x04,
-    0xB5,
-    0xA9,
-    0xAA,
-    0xF5,
-    0xCC,
-    0xEB,
-    0xCE,
-    0x08,
-    0xF6,
-    0x80,
-    0x2C,
-    0x21,
-    0xA6,
-    0x66,
-    0xBC,
-    0x77,
-    0x32,
-    0x92,
-    0xE5,
-    0x89,
-    0x3E,
-    0xB5,
-    0x34,
-    0xF0,
-    0x07,
-    0x7F,
-    0xB1,
-    0xA1,
-    0xD2,
-    0x54,
-    0x92,
-    0xB7,
-    0x64,
-    0x32,
-    0x03,
-    0xE5,
-    0xE8,
-    0x3F,
-    0xBF,
-    0x2D,
-    0x21,
-    0xC7,
-    0x67,
-    0xF0,
-    0x73,
-    0x11,
-    0x54,
-    0x1E,
-    0xBF,
-    0x53,
-    0xB6,
-    0x63,
-    0xC1,
-    0xCF,
-    0x8B,
-    0x8D,
-    0x6A,
-    0xD5,
-    0xAA,
-    0xAD,
-    0xE5,
-    0x24,
-    0x80,
-    0x0C,
-    0x9E,
-    0x07,
-    0x7B,
-    0x5D,
-    0x9C,
-    0x0C,
-    0x7C,
-    0xBB,
-    0xF9,
-    0xCA,
-    0x8E,
-    0x73,
-    0xE6,
-    0xB2,
-    0x2E,
-    0x0E,
-    0x65,
-    0xE8,
-    0x71,
-    0xDB,
-    0x27,
-    0x33,
-    0xE6,
-    0xBB,
-    0x11,
-    0x33,
-    0x63,
-    0x53,
-    0x75,
-    0x88,
-    0x4F,
-    0xD6,
-    0x74,
-    0x52,
-    0x65,
-    0x9B,
-    0x7B,
-    0xC3,
-    0x8D,
-    0x2E,
-    0x55,
-    0x34,
-    0xB3,
-    0x1A,
-    0xCA,
-    0x67,
-    0x32,
-    0xC9,
-    0x8E,
-    0x59,
-    0xF6,
-    0xAD,
-    0xF9,
-    0x23,
-    0x1A,
-    0x83,
-    0xD4,
-    0x5F,
-    0xD6,
-    0x76,
-    0x69,
-    0xD8,
-    0x33,
-    0x3B,
-    0x46,
-    0x3C,
-    0xF5,
-    0x9E,
-    0xCB,
-    0xC5,
-    0xB1,
-    0x01,
-    0x1E,
-    0x17,
-    0x6C,
-    0x8D,
-    0xBE,
-    0xD9,
-    0x9D,
-    0xC4,
-    0x0A,
-    0xDB,
-    0x79,
-    0xFB,
-    0x76,
-    0x99,
-    0xFB,
-    0x98,
-    0xB9,
-    0x0C,
-    0x97,
-    0x54,
-    0x07,
-    0xAA,
-    0xB1,
-    0x3B,
-    0x18,
-    0x8A,
-    0x41,
-    0x1A,
-    0xB3,
-    0xC0,
-    0x3B,
-    0x66,
-    0xD3,
-    0xD0,
-    0x06,
-    0x0E,
-    0xC4,
-    0x84,
-    0x8B,
-    0xB8,
-    0xF5,
-    0x39,
-    0x4D,
-    0xEC,
-    0x42,
-    0xA4,
-    0xBA,
-    0x7D,
-    0x3F,
-    0x12,
-    0x54,
-    0x83,
-    0x0C,
-    0xF2,
-    0xE2,
-    0xA8,
-    0x28,
-    0x65,
-    0x94,
-    0xFB,
-    0xCC,
-    0xB8,
-    0xD9,
-    0x42,
-    0x12,
-    0xD6,
-    0x0D,
-    0x9A,
-    0x8A,
-    0xEB,
-    0xA4,
-    0x75,
-    0xC4,
-    0x34,
-    0x1C,
-    0xEA,
-    0x91,
-    0x4A,
-    0x90,
-    0x18,
-    0x4B,
-    0xCD,
-    0x0A,
-    0x5C,
-    0xFB,
-    0xA1,
-    0xCB,
-    0x46,
-    0x0B,
-    0x2C,
-    0x0E,
-    0x60,
-    0x9D,
-    0xBC,
-    0x12,
-    0xF6,
-    0xFB,
-    0xDD,
-    0x0E,
-    0xEE,
-    0x98,
-    0xB7,
-    0x4D,
-    0x30,
-    0x3A,
-    0xF3,
-    0x82,
-    0x62,
-    0x6E,
-    0x6C,
-    0x63,
-    0x5B,
-    0x6D,
-    0xF4,
-    0xF4,
-    0xC5,
-    0x2C,
-    0x75,
-    0xF2,
-    0x34,
-    0x12,
-    0xDF,
-    0xE8,
-    0x8F,
-    0x34,
-    0xC5,
-    0x38,
-    0xDA,
-    0xFC,
-    0x6F,
-    0x55,
-    0xDF,
-    0x4E,
-    0x66,
-    0xAB,
-    0x77,
-    0x5B,
-    0xD7,
-    0x5C,
-    0xFF,
-    0x25,
-    0xD6,
-    0x81,
-    0x3B,
-    0xB2,
-    0x3F,
-    0x40,
-    0xB2,
-    0x4F,
-    0x0D,
-    0x24,
-    0x44,
-    0x60,
-    0x11,
-    0x93,
-    0x60,
-    0xA4,
-    0xB5,
-    0x07,
-    0xB9,
-    0xA1,
-    0x45,
-    0x9A,
-    0x5B,
-    0x0B,
-    0x60,
-    0xEB,
-    0x2F,
-    0x02,
-    0x6A,
-    0x1E,
-    0x1C,
-    0x67,
-    0x2C,
-    0x1D,
-    0x6B,
-    0xE8,
-    0xAE,
-    0xDC,
-    0x73,
-    0x51,
-    0xA4,
-    0x63,
-    0xDF,
-    0x1C,
-    0xEB,
-    0x30,
-    0x3A,
-    0x0E,
-    0xA5,
-    0xE7,
-    0x58,
-    0x81,
-    0x8F,
-    0xF9,
-    0xF8,
-    0x9E,
-    0x04,
-    0xD5,
-    0x0C,
-    0x68,
-    0x96,
-    0xE4,
-    0x67,
-    0x34,
-    0x88,
-    0x82,
-    0xAD,
-    0x30,
-    0xE1,
-    0x5B,
-    0xF7,
-    0xDA,
-    0x29,
-    0xD9,
-    0x49,
-    0xA6,
-    0xA9,
-    0x63,
-    0x06,
-    0xCB,
-    0xA3,
-    0xE0,
-    0xB2,
-    0x40,
-    0xFA,
-    0xCC,
-    0x3A,
-    0x50,
-    0x94,
-    0x6C,
-    0x41,
-    0x65,
-    0x27,
-    0x26,
-    0x1A,
-    0x42,
-    0xCC,
-    0xC1,
-    0x0B,
-    0x2F,
-    0x76,
-    0xFB,
-    0x3B,
-    0xCD,
-    0x5A,
-    0xE8,
-    0x5B,
-    0xF6,
-    0x34,
-    0x16,
-    0x31,
-    0xBD,
-    0x98,
-    0x56,
-    0x2C,
-    0x60,
-    0x36,
-    0xF7,
-    0xA0,
-    0x95,
-    0x7E,
-    0x62,
-    0x99,
-    0x1F,
-    0x66,
-    0x28,
-    0x7B,
-    0x91,
-    0xF0,
-    0x2E,
-    0xCF,
-    0x7E,
-    0x60,
-    0xBB,
-    0x69,
-    0x63,
-    0xC5,
-    0x21,
-    0x25,
-    0xAF,
-    0x85,
-    0xC9,
-    0x9B,
-    0x98,
-    0xC1,
-    0x19,
-    0x8B,
-    0x9B,
-    0x87,
-    0x1E,
-    0xE7,
-    0xCC,
-    0x6D,
-    0x5C,
-    0xA5,
-    0x03,
-    0x38,
-    0x78,
-    0x4F,
-    0x26,
-    0xE8,
-    0x12,
-    0x4F,
-    0xD3,
-    0x52,
-    0x43,
-    0x49,
-    0x5A,
-    0x08,
-    0xC3,
-    0xCB,
-    0x6E,
-    0x6F,
-    0x7F,
-    0x20,
-    0x1C,
-    0x90,
-    0xC6,
-    0xF7,
-    0x4B,
-    0xF8,
-    0x76,
-    0x97,
-    0xD6,
-    0x1D,
-    0x1D,
-    0x26,
-    0xE3,
-    0x33,
-    0x61,
-    0x77,
-    0xDE,
-    0xAE,
-    0xE5,
-    0xCE,
-    0xDC,
-    0xB3,
-    0x0B,
-    0x36,
-    0x1E,
-    0xB8,
-    0x1C,
-    0xF0,
-    0x70,
-    0x5E,
-    0xD4,
-    0x20,
-    0x3D,
-    0x94,
-    0x65,
-    0xE8,
-    0x48,
-    0xE6,
-    0x4A,
-    0x08,
-    0xF0,
-    0x51,
-    0x62,
-    0xB7,
-    0xC3,
-    0x41,
-    0x7A,
-    0x98,
-    0xA5,
-    0x16,
-    0x6C,
-    0x3C,
-    0x33,
-    0x28,
-    0x88,
-    0x66,
-    0xC9,
-    0xA6,
-    0xD7,
-    0x4D,
-    0x90,
-    0xA0,
-    0xE9,
-    0xD3,
-    0xD8,
-    0x9A,
-    0xE4,
-    0x68,
-    0x2D,
-    0x53,
-    0x2A,
-    0x2F,
-    0xBA,
-    0x15,
-    0xF4,
-    0xAE,
-    0x02,
-    0x88,
-    0xA0,
-    0x68,
-    0x6A,
-    0x0F,
-    0x8A,
-    0xF7,
-    0x19,
-    0xA9,
-    0xD2,
-    0x69,
-    0xE0,
-    0x51,
-    0x18,
-    0xEA,
-    0x7B,
-    0xC0,
-    0x96,
-    0xC4,
-    0x43,
-    0x31,
-    0x77,
-    0xEB,
-    0x24,
-    0x82,
-    0xB8,
-    0xF3,
-    0x99,
-    0x66,
-    0x60,
-    0x91,
-    0x71,
-    0xE0,
-    0x5E,
-    0xAD,
-    0xC8,
-    0x4D,
-    0xDA,
-    0x2F,
-    0x79,
-    0x20,
-    0x44,
-    0x3A,
-    0xAB,
-    0x9B,
-    0x9D,
-    0x73,
-    0x4A,
-    0x17,
-    0xE5,
-    0xA1,
-    0xAE,
-    0xE1,
-    0x9B,
-    0xD0,
-    0x30,
-    0xEC,
-    0xA6,
-    0x89,
-    0xB1,
-    0x34,
-    0xD0,
-    0x88,
-    0xD6,
-    0x82,
-    0x29,
-    0x56,
-    0x4F,
-    0x3C,
-    0xF1,
-    0x44,
-    0x80,
-    0x79,
-    0xE4,
-    0x35,
-    0x92,
-    0x13,
-    0x6A,
-    0xE3,
-    0x33,
-    0xCD,
-    0x81,
-    0x17,
-    0x20,
-    0x96,
-    0xA5,
-    0x7B,
-    0x95,
-    0xEF,
-    0xEF,
-    0x20,
-    0xAC,
-    0xE0,
-    0xC2,
-    0x8D,
-    0x47,
-    0x77,
-    0x55,
-    0x15,
-    0x6C,
-    0xD6,
-    0x97,
-    0x1D,
-    0xD8,
-    0x13,
-    0x84,
-    0xF8,
-    0x3F,
-    0xC1,
-    0x2C,
-    0x92,
-    0xF5,
-    0x01,
-    0xF3,
-    0x0F,
-    0x77,
-    0x72,
-    0xC4,
-    0xFA,
-    0x3E,
-    0x79,
-    0x93,
-    0x7B,
-    0x9B,
-    0x3C,
-    0x80,
-    0xDF,
-    0x72,
-    0x2D,
-    0xBF,
-    0x09,
-    0x0D,
-    0x0C,
-    0xBD,
-    0x52,
-    0x1F,
-    0x66,
-    0xAD,
-    0x33,
-    0x27,
-    0x2A,
-    0x65,
-    0x1A,
-    0x14,
-    0x80,
-    0x9E,
-    0x35,
-    0x04,
-    0x73,
-    0xCC,
-    0x1A,
-    0xEC,
-    0x15,
-    0x01,
-    0xD9,
-    0xA4,
-    0x72,
-    0xB8,
-    0x91,
-    0x1E,
-    0x73,
-    0x2D,
-    0x16,
-    0xEA,
-    0x83,
-    0xF6,
-    0xE9,
-    0xAC,
-    0xE6,
-    0xB5,
-    0xC6,
-    0xC6,
-    0x39,
-    0xC6,
-    0x66,
-    0xF7,
-    0x6E,
-    0x97,
-    0x1E,
-    0x5A,
-    0x48,
-    0x8E,
-    0x96,
-    0x4F,
-    0x82,
-    0xA0,
-    0xDC,
-    0x18,
-    0x17,
-    0x69,
-    0x6C,
-    0x04,
-    0x47,
-    0xB6,
-    0x85,
-    0x4E,
-    0x5A,
-    0x5D,
-    0x63,
-    0x21,
-    0x10,
-    0xC4,
-    0x9F,
-    0x4B,
-    0xFC,
-    0x87,
-    0x86,
-    0x27,
-    0xAF,
-    0x17,
-    0x6E,
-    0x10,
-    0x88,
-    0x59,
-    0x70,
-    0xD7,
-    0x30,
-    0x47,
-    0x37,
-    0x26,
-    0x84,
-    0xD4,
-    0x7F,
-    0x80,
-    0x16,
-    0xDB,
-    0x3F,
-    0x2C,
-    0xB6,
-    0x0B,
-    0xA2,
-    0x55,
-    0x53,
-    0x76,
-    0x33,
-    0x18,
-    0x36,
-    0xFE,
-    0x12,
-    0xAB,
-    0x78,
-    0x15,
-    0xBA,
-    0xE2,
-    0xFE,
-    0x14,
-    0x83,
-    0x48,
-    0x70,
-    0x73,
-    0x8F,
-    0xE5,
-    0xBE,
-    0x4A,
-    0x44,
-    0x28,
-    0x39,
-    0x54,
-    0x6C,
-    0xC8,
-    0x5F,
-    0x81,
-    0xB8,
-    0xF6,
-    0x8D,
-    0x08,
-    0x09,
-    0x41,
-    0x96,
-    0x5A,
-    0x16,
-    0xED,
-    0x4D,
-    0x17,
-    0x6E,
-    0x95,
-    0x51,
-    0x9E,
-    0xE3,
-    0x59,
-    0x23,
-    0x46,
-    0xEF,
-    0xE8,
-    0x63,
-    0x47,
-    0x0E,
-    0xD6,
-    0xFA,
-    0x8B,
-    0x66,
-    0xF3,
-    0x61,
-    0x29,
-    0xA3,
-    0x12,
-    0xA7,
-    0x1B,
-    0x21,
-    0xBE,
-    0xDC,
-    0xE1,
-    0x72,
-    0xA1,
-    0x33,
-    0x2A,
-    0x31,
-    0x66,
-    0x46,
-    0xA4,
-    0xF8,
-    0xCA,
-    0xB8,
-    0x1B,
-    0x7E,
-    0x4B,
-    0x33,
-    0x27,
-    0xD3,
-    0x84,
-    0x86,
-    0xEF,
-    0x7C,
-    0x4B,
-    0xFA,
-    0x57,
-    0xCF,
-    0x77,
-    0x8A,
-    0xE0,
-    0xB0,
-    0xDC,
-    0x4C,
-    0x8C,
-    0x5B,
-    0x36,
-    0x5D,
-    0x73,
-    0x16,
-    0xC4,
-    0xB1,
-    0xE8,
-    0x36,
-    0x94,
-    0x4C,
-    0x9D,
-    0xE9,
-    0xA2,
-    0x1D,
-    0x38,
-    0xA5,
-    0x8C,
-    0xD4,
-    0x38,
-    0x10,
-    0x83,
-    0x44,
-    0x3A,
-    0x7B,
-    0x90,
-    0xC8,
-    0x57,
-    0xDE,
-    0x2A,
-    0x5E,
-    0x9B,
-    0x31,
-    0xA7,
-    0xBF,
-    0x5B,
-    0xED,
-    0xE1,
-    0x5D,
-    0x6C,
-    0x03,
-    0xBA,
-    0x14,
-    0x46,
-    0x2C,
-    0x77,
-    0x5D,
-    0x01,
-    0xBD,
-    0xD6,
-    0x61,
-    0xFE,
-    0x3D,
-    0xA2,
-    0x2A,
-    0xB7,
-    0x59,
-    0x1D,
-    0x5D,
-    0x86,
-    0x62,
-    0x80,
-    0xCE,
-    0xE2,
-    0x6A,
-    0x19,
-    0x8A,
-    0x7D,
-    0x90,
-    0x41,
-    0x3B,
-    0x55,
-    0xE7,
-    0xA2,
-    0x88,
-    0x76,
-    0x38,
-    0x93,
-    0xF5,
-    0xCE,
-    0x7E,
-    0x2D,
-    0xA7,
-    0x8C,
-    0xE9,
-    0xF5,
-    0x83,
-    0xAF,
-    0xC6,
-    0xFF,
-    0x62,
-    0x48,
-    0x85,
-    0xE0,
-    0xC9,
-    0x42,
-    0x89,
-    0x8D,
-    0xC7,
-    0xFE,
-    0x15,
-    0x3C,
-    0x38,
-    0x89,
-    0xB4,
-    0x69,
-    0x31,
-    0x5B,
-    0x3E,
-    0x5C,
-    0xA7,
-    0x93,
-    0xE9,
-    0xE8,
-    0x6D,
-    0x17,
-    0xB0,
-    0xC7,
-    0x46,
-    0x1C,
-    0xEB,
-    0x54,
-    0xC3,
-    0x22,
-    0xD6,
-    0xC6,
-    0x22,
-    0x42,
-    0x99,
-    0x9B,
-    0x86,
-    0x33,
-    0x0F,
-    0xBF,
-    0x5B,
-    0xD2,
-    0xA3,
-    0x7B,
-    0x05,
-    0x77,
-    0xEC,
-    0xBF,
-    0x43,
-    0x05,
-    0xC8,
-    0x7F,
-    0x72,
-    0x4A,
-    0x96,
-    0x09,
-    0xCB,
-    0xE0,
-    0x8C,
-    0xEC,
-    0x74,
-    0x8A,
-    0xD3,
-    0x9E,
-    0x0D,
-    0x8D,
-    0x3C,
-    0xC7,
-    0x00,
-    0x46,
-    0x63,
-    0x58,
-    0xD3,
-    0x69,
-    0xC9,
-    0xA4,
-    0xC7,
-    0x9C,
-    0x10,
-    0x52,
-    0x5F,
-    0x52,
-    0x03,
-    0x05,
-    0xB9,
-    0x92,
-    0x10,
-    0x51,
-    0xD1,
-    0x14,
-    0x01,
-    0x0F,
-    0x16,
-    0xED,
-    0x11,
-    0xE1,
-    0x39,
-    0x2E,
-    0xDB,
-    0x36,
-    0xC9,
-    0x8F,
-    0xBE,
-    0xB3,
-    0xC2,
-    0xDE,
-    0x4E,
-    0x2A,
-    0xA9,
-    0xC8,
-    0x6E,
-    0xF8,
-    0xD1,
-    0xD7,
-    0x71,
-    0x50,
-    0xD9,
-    0x38,
-    0xA4,
-    0xEE,
-    0xD2,
-    0x5C,
-    0xB9,
-    0xF5,
-    0xF8,
-    0xA9,
-    0x2A,
-    0xB4,
-    0x3E,
-    0xFD,
-    0x84,
-    0xE3,
-    0xFB,
-    0x67,
-    0xAE,
-    0xC5,
-    0x7E,
-    0x48,
-    0x03,
-    0x4D,
-    0xAE,
-    0x73,
-    0x5A,
-    0xA0,
-    0x52,
-    0x08,
-    0xA4,
-    0x56,
-    0xCC,
-    0x07,
-    0x37,
-    0xC4,
-    0xD0,
-    0x0A,
-    0x16,
-    0xD1,
-    0x49,
-    0x81,
-    0x16,
-    0x00,
-    0x56,
-    0x79,
-    0xF2,
-    0xD9,
-    0x26,
-    0xF4,
-    0x30,
-    0xCA,
-    0x06,
-    0x5C,
-    0x03,
-    0x52,
-    0x28,
-    0xA8,
-    0x56,
-    0xEA,
-    0xB1,
-    0xF6,
-    0x66,
-    0x0B,
-    0x67,
-    0xF3,
-    0x68,
-    0x8A,
-    0xE4,
-    0x63,
-    0xEC,
-    0xD4,
-    0xD3,
-    0x80,
-    0x87,
-    0x63,
-    0x45,
-    0x6D,
-    0x61,
-    0x7A,
-    0x4B,
-    0x34,
-    0xDE,
-    0x2B,
-    0xF9,
-    0x76,
-    0xE4,
-    0xC8,
-    0xBE,
-    0x4B,
-    0x8C,
-    0x0B,
-    0xBF,
-    0x63,
-    0x4C,
-    0x5C,
-    0x4B,
-    0xC1,
-    0x6D,
-    0x78,
-    0xF6,
-    0x4E,
-    0xC1,
-    0x2D,
-    0xEC,
-    0x9F,
-    0xA2,
-    0x9F,
-    0x21,
-    0x5C,
-    0xC4,
-    0x9F,
-    0x7B,
-    0x3B,
-    0xD1,
-    0x33,
-    0xBC,
-    0x03,
-    0xBA,
-    0x29,
-    0xA4,
-    0x2A,
-    0x4A,
-    0xE8,
-    0x43,
-    0xD8,
-    0xC3,
-    0xE5,
-    0xE7,
-    0x4B,
-    0x9E,
-    0x7F,
-    0x72,
-    0xFD,
-    0xE3,
-    0x44,
-    0xA4,
-    0x6C,
-    0x3D,
-    0xD3,
-    0x93,
-    0x6D,
-    0x2C,
-    0x59,
-    0x43,
-    0x80,
-    0x54,
-    0x43,
-    0x06,
-    0x80,
-    0xA3,
-    0xC5,
-    0xDB,
-    0x52,
-    0x7A,
-    0xDC,
-    0xA7,
-    0x34,
-    0x9B,
-    0x99,
-    0xB3,
-    0xA3,
-    0x5C,
-    0x1E,
-    0xBB,
-    0x3D,
-    0xD6,
-    0x65,
-    0x42,
-    0x82,
-    0xFB,
-    0xC3,
-    0xD5,
-    0x15,
-    0xCB,
-    0x27,
-    0x39,
-    0x25,
-    0x91,
-    0x70,
-    0xB1,
-    0x29,
-    0x9C,
-    0xAF,
-    0x56,
-    0xDD,
-    0xA1,
-    0xB3,
-    0xC0,
-    0x00,
-    0x5A,
-    0xC3,
-    0x17,
-    0xDE,
-    0x7C,
-    0x3A,
-    0x5D,
-    0xDC,
-    0xBA,
-    0x6C,
-    0xC4,
-    0x5F,
-    0x2D,
-    0xEE,
-    0x6E,
-    0x28,
-    0xEE,
-    0xE0,
-    0x28,
-    0x5C,
-    0x03,
-    0xA0,
-    0x11,
-    0xE3,
-    0x47,
-    0x95,
-    0xF2,
-    0x0D,
-    0x7F,
-    0x10,
-    0x25,
-    0x85,
-    0xFE,
-    0xCB,
-    0x93,
-    0x8F,
-    0x17,
-    0x99,
-    0x39,
-    0xF6,
-    0xC2,
-    0x03,
-    0x48,
-    0x9C,
-    0xE4,
-    0x68,
-    0xC6,
-    0xEA,
-    0x0C,
-    0x07,
-    0x96,
-    0xF1,
-    0x6D,
-    0xA6,
-    0x0E,
-    0xD1,
-    0xB5,
-    0xCB,
-    0x41,
-    0x89,
-    0x33,
-    0xFF,
-    0x5D,
-    0x75,
-    0x50,
-    0x54,
-    0xF0,
-    0xDC,
-    0x9D,
-    0xEC,
-    0xFF,
-    0x95,
-    0x3D,
-    0x96,
-    0xA1,
-    0xFE,
-    0x0D,
-    0x53,
-    0x44,
-    0x78,
-    0x69,
-    0x8B,
-    0x53,
-    0x97,
-    0xAC,
-    0x53,
-    0xD5,
-    0x0A,
-    0x21,
-    0x0C,
-    0xFD,
-    0x50,
-    0x86,
-    0x1D,
-    0xD1,
-    0x46,
-    0x14,
-    0x47,
-    0x6F,
-    0xB7,
-    0x4C,
-    0x7B,
-    0x19,
-    0xE9,
-    0x1B,
-    0x76,
-    0xD4,
-    0xA9,
-    0xA6,
-    0xEB,
-    0x6C,
-    0x8C,
-    0x1B,
-    0xE5,
-    0x9F,
-    0xD5,
-    0xA1,
-    0x0A,
-    0xCA,
-    0x09,
-    0xBA,
-    0x45,
-    0x63,
-    0x72,
-    0xF5,
-    0x85,
-    0xAB,
-    0x44,
-    0x76,
-    0xF2,
-    0x80,
-    0xB0,
-    0xC3,
-    0xF3,
-    0x43,
-    0xDD,
-    0x5F,
-    0xF7,
-    0xDC,
-    0x2C,
-    0x2E,
-    0xEC,
-    0xF0,
-    0xC9,
-    0x27,
-    0xFE,
-    0xB8,
-    0x0E,
-    0xC3,
-    0xC0,
-    0x25,
-    0xCE,
-    0x40,
-    0x38,
-    0x6F,
-    0x4E,
-    0x8C,
-    0x3E,
-    0x10,
-    0x1A,
-    0xB9,
-    0xBE,
-    0xF5,
-    0xD6,
-    0x0D,
-    0x4C,
-    0x8F,
-    0x97,
-    0x80,
-    0xDB,
-    0xD1,
-    0xE5,
-    0xE8,
-    0x66,
-    0xD7,
-    0xDE,
-    0xB1,
-    0x0C,
-    0x9D,
-    0x79,
-    0x93,
-    0xD8,
-    0x87,
-    0xF8,
-    0x6B,
-    0xBA,
-    0x58,
-    0x4C,
-    0x34,
-    0x72,
-    0x93,
-    0x46,
-    0x5C,
-    0x7F,
-    0xDF,
-    0x63,
-    0x59,
-    0x61,
-    0x06,
-    0x00,
-    0x38,
-    0xAC,
-    0x92,
-    0xD2,
-    0x3C,
-    0xD0,
-    0x5C,
-    0x8A,
-    0x4F,
-    0x85,
-    0x77,
-    0x76,
-    0x8C,
-    0x92,
-    0x03,
-    0xF1,
-    0x3F,
-    0x1A,
-    0xAF,
-    0xE2,
-    0x85,
-    0x20,
-    0xFF,
-    0xCD,
-    0x35,
-    0x02,
-    0x49,
-    0x11,
-    0xA7,
-    0xE9,
-    0x79,
-    0xF3,
-    0x15,
-    0xF5,
-    0x9B,
-    0x88,
-    0x12,
-    0x66,
-    0x22,
-    0xED,
-    0x7B,
-    0xE1,
-    0x23,
-    0xAA,
-    0xD1,
-    0xB0,
-    0x3A,
-    0xBB,
-    0x02,
-    0x69,
-    0xEE,
-    0x78,
-    0x0A,
-    0xD1,
-    0xEF,
-    0x0C,
-    0x3A,
-    0x97,
-    0x14,
-    0xD8,
-    0x5E,
-    0x92,
-    0x2B,
-    0x99,
-    0x47,
-    0x64,
-    0x44,
-    0x71,
-    0xF8,
-    0x5F,
-    0x7A,
-    0x4C,
-    0x97,
-    0xC5,
-    0x91,
-    0xA3,
-    0xA4,
-    0xCE,
-    0xA4,
-    0xF8,
-    0x98,
-    0xDD,
-    0x39,
-    0x66,
-    0xD2,
-    0xE4,
-    0x1B,
-    0xE2,
-    0x2E,
-    0x66,
-    0x5E,
-    0x47,
-    0xCB,
-    0x53,
-    0x8B,
-    0x24,
-    0xDF,
-    0xAF,
-    0x07,
-    0x54,
-    0x93,
-    0xCF,
-    0xE8,
-    0x0D,
-    0x4F,
-    0x63,
-    0xC7,
-    0xC8,
-    0x50,
-    0x6D,
-    0xCF,
-    0x26,
-    0x15,
-    0x60,
-    0x21,
-    0xBC,
-    0x46,
-    0x77,
-    0x38,
-    0x58,
-    0x53,
-    0x1D,
-    0x75,
-    0x32,
-    0xFC,
-    0xE1,
-    0xC6,
-    0xEB,
-    0xD1,
-    0x60,
-    0xF9,
-    0xB0,
-    0x3E,
-    0xD0,
-    0xE2,
-    0x5B,
-    0x2A,
-    0xE4,
-    0xE4,
-    0x56,
-    0x91,
-    0xDF,
-    0x07,
-    0x3C,
-    0xA1,
-    0x85,
-    0xA9,
-    0xC7,
-    0x44,
-    0xE0,
-    0x13,
-    0x9D,
-    0x72,
-    0x02,
-    0xC3,
-    0xDE,
-    0xD4,
-    0x5D,
-    0xDC,
-    0x22,
-    0x4E,
-    0x56,
-    0x3D,
-    0x71,
-    0x45,
-    0x4D,
-    0x1F,
-    0xEC,
-    0xDD,
-    0x24,
-    0xF6,
-    0x51,
-    0xFD,
-    0x3F,
-    0x7B,
-    0x99,
-    0xF9,
-    0xDF,
-    0x7A,
-    0xF0,
-    0xAA,
-    0x77,
-    0xF7,
-    0x18,
-    0xBA,
-    0xC9,
-    0x19,
-    0x51,
-    0x28,
-    0xD5,
-    0xAD,
-    0x7B,
-    0x58,
-    0xAD,
-    0x89,
-    0xC9,
-    0x73,
-    0x76,
-    0x04,
-    0xDD,
-    0x14,
-    0x14,
-    0x49,
-    0x22,
-    0x67,
-    0xD0,
-    0x97,
-    0x01,
-    0x49,
-    0x76,
-    0x20,
-    0xEE,
-    0x57,
-    0xEA,
-    0xDA,
-    0x4F,
-    0x88,
-    0xE1,
-    0xF3,
-    0x82,
-    0x71,
-    0x45,
-    0x10,
-    0x2F,
-    0xA4,
-    0x9E,
-    0xDF,
-    0x91,
-    0xFD,
-    0xF8,
-    0x67,
-    0x3D,
-    0x07,
-    0x07,
-    0x09,
-    0x73,
-    0x82,
-    0xDB,
-    0xA4,
-    0xE0,
-    0x1F,
-    0xC0,
-    0xFB,
-    0xFC,
-    0xAC,
-    0xF8,
-    0x42,
-    0x38,
-    0xCF,
-    0xE8,
-    0x94,
-    0x27,
-    0x05,
-    0x9E,
-    0x59,
-    0x57,
-    0xAD,
-    0x34,
-    0x7F,
-    0x98,
-    0x50,
-    0x03,
-    0xB9,
-    0x7A,
-    0x64,
-    0x85,
-    0x49,
-    0x0D,
-    0xC8,
-    0xFE,
-    0x6B,
-    0x42,
-    0x02,
-    0x86,
-    0x34,
-    0x5A,
-    0x54,
-    0x61,
-    0xF5,
-    0x35,
-    0x28,
-    0x77,
-    0x29,
-    0xC6,
-    0x97,
-    0x55,
-    0xDB,
-    0x37,
-    0xD1,
-    0x3A,
-    0xE6,
-    0xB0,
-    0x07,
-    0x3C,
-    0x63,
-    0xA2,
-    0xFA,
-    0x26,
-    0x13,
-    0x20,
-    0x86,
-    0xD6,
-    0x69,
-    0x76,
-    0x02,
-    0x4F,
-    0xC6,
-    0x0B,
-    0x54,
-    0x6A,
-    0x18,
-    0xC7,
-    0xEB,
-    0x33,
-    0x06,
-    0x63,
-    0x4E,
-    0x22,
-    0x36,
-    0x34,
-    0x66,
-    0xFF,
-    0xC6,
-    0x25,
-    0xAA,
-    0x95,
-    0xF7,
-    0x4F,
-    0x3F,
-    0x78,
-    0xA7,
-    0x62,
-    0x2E,
-    0x4B,
-    0xEA,
-    0x6C,
-    0x1D,
-    0xEB,
-    0x44,
-    0x24,
-    0xEF,
-    0x81,
-    0xF1,
-    0x5C,
-    0x64,
-    0x4C,
-    0x68,
-    0x7F,
-    0xA7,
-    0x71,
-    0x54,
-    0x72,
-    0x06,
-    0x6C,
-    0xF7,
-    0x6B,
-    0x74,
-    0xB0,
-    0xB6,
-    0x07,
-    0x1C,
-    0x2B,
-    0x8B,
-    0x73,
-    0x24,
-    0x18,
-    0x9C,
-    0xC2,
-    0xA0,
-    0x7F,
-    0xB1,
-    0x4D,
-    0x70,
-    0x31,
-    0xBF,
-    0x9F,
-    0x1D,
-    0x46,
-    0xE0,
-    0xFF,
-    0xF8,
-    0x02,
-    0x13,
-    0xDB,
-    0xF7,
-    0xA9,
-    0x0F,
-    0xD0,
-    0x14,
-    0x50,
-    0x2B,
-    0x42,
-    0x16,
-    0xBC,
-    0x17,
-    0x8D,
-    0x2F,
-    0xB1,
-    0xEC,
-    0x8D,
-    0xCA,
-    0xC3,
-    0x93,
-    0x7C,
-    0xC0,
-    0xED,
-    0xB8,
-    0x32,
-    0xAE,
-    0xD1,
-    0x8A,
-    0xFF,
-    0x05,
-    0x1D,
-    0x89,
-    0xA1,
-    0xF2,
-    0xAF,
-    0x0E,
-    0xAE,
-    0xBF,
-    0x74,
-    0xBE,
-    0x2E,
-    0xC6,
-    0x8E,
-    0x60,
-    0x35,
-    0xF3,
-    0xEF,
-    0x36,
-    0xB5,
-    0x9C,
-    0xB4,
-    0x37,
-    0x73,
-    0x20,
-    0x0E,
-    0x64,
-    0x3D,
-    0x00,
-    0x6F,
-    0x17,
-    0x1E,
-    0x2D,
-    0xE3,
-    0xDF,
-    0xC3,
-    0xFA,
-    0x27,
-    0xE7,
-    0xC0,
-    0xEA,
-    0x90,
-    0xE7,
-    0x9D,
-    0x98,
-    0xE5,
-    0x4A,
-    0xF1,
-    0x75,
-    0xF7,
-    0xEE,
-    0x6F,
-    0x12,
-    0xB1,
-    0x78,
-    0x16,
-    0xD0,
-    0x80,
-    0x50,
-    0x64,
-    0x7E,
-    0x7A,
-    0x3F,
-    0x4E,
-    0x37,
-    0x80,
-    0xB3,
-    0x85,
-    0xC5,
-    0x71,
-    0x86,
-    0x66,
-    0x89,
-    0xDE,
-    0xD9,
-    0xEA,
-    0x7D,
-    0xF0,
-    0x09,
-    0x18,
-    0xEB,
-    0x3C,
-    0xB3,
-    0x14,
-    0x1E,
-    0x4A,
-    0xCE,
-    0xEE,
-    0x3B,
-    0x27,
-    0x3C,
-    0xCD,
-    0x16,
-    0xAB,
-    0x5E,
-    0x6E,
-    0xA2,
-    0x1D,
-    0xF3,
-    0xF9,
-    0xF6,
-    0x53,
-    0xF3,
-    0xF0,
-    0x66,
-    0x05,
-    0xCF,
-    0x58,
-    0xFC,
-    0x05,
-    0xAD,
-    0x70,
-    0x0B,
-    0x3C,
-    0x1A,
-    0x80,
-    0x77,
-    0x29,
-    0x05,
-    0x8D,
-    0x1F,
-    0x45,
-    0xE8,
-    0x86,
-    0x02,
-    0x91,
-    0x60,
-    0x1C,
-    0x10,
-    0x58,
-    0xEE,
-    0x4C,
-    0x8B,
-    0xF5,
-    0xB9,
-    0xFF,
-    0x4D,
-    0x65,
-    0x64,
-    0xD5,
-    0xFE,
-    0x32,
-    0x6E,
-    0x9F,
-    0x99,
-    0x37,
-    0xE7,
-    0xFC,
-    0xC9,
-    0x0B,
-    0x36,
-    0x33,
-    0x3C,
-    0x50,
-    0xF5,
-    0x6F,
-    0xB1,
-    0x09,
-    0xF7,
-    0xEC,
-    0xF7,
-    0x5D,
-    0x69,
-    0xCF,
-    0x1E,
-    0x9F,
-    0x92,
-    0x82,
-    0xF0,
-    0x95,
-    0x74,
-    0x10,
-    0x0C,
-    0xC5,
-    0xF7,
-    0x00,
-    0x4D,
-    0xBE,
-    0x7E,
-    0x5F,
-    0xDB,
-    0x1A,
-    0x14,
-    0xCD,
-    0xC7,
-    0x5F,
-    0x94,
-    0xB3,
-    0xEF,
-    0x42,
-    0x30,
-    0x27,
-    0x90,
-    0x58,
-    0xB8,
-    0x0A,
-    0x13,
-    0xF7,
-    0x58,
-    0x34,
-    0x2D,
-    0x8E,
-    0x2D,
-    0x26,
-    0x99,
-    0x9F,
-    0x96,
-    0xF2,
-    0x00,
-    0xDC,
-    0x57,
-    0x27,
-    0x82,
-    0xD8,
-    0x53,
-    0x85,
-    0x47,
-    0x57,
-    0x09,
-    0x07,
-    0xB8,
-    0x8A,
-    0x2B,
-    0xC6,
-    0xF5,
-    0x69,
-    0xC4,
-    0x83,
-    0x19,
-    0x0E,
-    0xF1,
-    0x9F,
-    0xAE,
-    0x87,
-    0x05,
-    0xC3,
-    0xCF,
-    0xA6,
-    0xFE,
-    0x8F,
-    0x46,
-    0x65,
-    0x32,
-    0xDC,
-    0x6E,
-    0xAB,
-    0x28,
-    0x2C,
-    0x6D,
-    0xE3,
-    0x84,
-    0xE9,
-    0x03,
-    0x7F,
-    0x43,
-    0x98,
-    0xD6,
-    0x40,
-    0x40,
-    0xC4,
-    0xE9,
-    0xCE,
-    0xFB,
-    0xCD,
-    0x3F,
-    0xA3,
-    0x12,
-    0x6C,
-    0x9A,
-    0x56,
-    0x4E,
-    0x24,
-    0x1F,
-    0x86,
-    0x81,
-    0x9E,
-    0x89,
-    0x93,
-    0xAE,
-    0x04,
-    0xD7,
-    0x5F,
-    0xF4,
-    0xBE,
-    0x87,
-    0x52,
-    0x80,
-    0x5D,
-    0x40,
-    0xE0,
-    0x43,
-    0xD6,
-    0x01,
-    0xC7,
-    0x73,
-    0x27,
-    0x8C,
-    0x31,
-    0x91,
-    0x3D,
-    0xC1,
-    0x54,
-    0x37,
-    0x4A,
-    0xC7,
-    0x7E,
-    0x71,
-    0x28,
-    0x03,
-    0xE4,
-    0xE2,
-    0xC7,
-    0x9C,
-    0xA2,
-    0xE5,
-    0x23,
-    0xC8,
-    0x2F,
-    0x20,
-    0xAD,
-    0x08,
-    0x4D,
-    0x62,
-    0x81,
-    0xBF,
-    0x04,
-    0xFF,
-    0xDA,
-    0x33,
-    0x20,
-    0x36,
-    0x68,
-    0x0D,
-    0x71,
-    0x7E,
-    0xF7,
-    0x45,
-    0x99,
-    0xB7,
-    0x42,
-    0xAB,
-    0x3D,
-    0xF7,
-    0x81,
-    0xDB,
-    0x85,
-    0x34,
-    0x76,
-    0xB5,
-    0x88,
-    0x24,
-    0x15,
-    0x71,
-    0x2D,
-    0xD7,
-    0xE8,
-    0x48,
-    0x46,
-    0xA2,
-    0xCA,
-    0xF5,
-    0x73,
-    0x15,
-    0xD0,
-    0x3D,
-    0xA4,
-    0x4E,
-    0x7D,
-    0x5A,
-    0x9E,
-    0x3B,
-    0xA1,
-    0x50,
-    0xE1,
-    0xC4,
-    0xB4,
-    0x99,
-    0xC2,
-    0x1D,
-    0xD4,
-    0xAA,
-    0xD2,
-    0xA7,
-    0x14,
-    0xD9,
-    0x5F,
-    0xF6,
-    0xC8,
-    0xBB,
-    0x61,
-    0x1D,
-    0xEE,
-    0x90,
-    0x26,
-    0xD8,
-    0xD4,
-    0x6E,
-    0x5C,
-    0x04,
-    0x06,
-    0xFD,
-    0x58,
-    0x04,
-    0xAA,
-    0x35,
-    0x8A,
-    0x86,
-    0xEA,
-    0x6B,
-    0xB8,
-    0xD7,
-    0x65,
-    0x56,
-    0x47,
-    0x90,
-    0x86,
-    0x45,
-    0x01,
-    0xEE,
-    0x64,
-    0xB0,
-    0x5E,
-    0x4E,
-    0x37,
-    0x0D,
-    0x8D,
-    0x3B,
-    0xFA,
-    0x11,
-    0x2B,
-    0xC2,
-    0x28,
-    0x89,
-    0x9D,
-    0x64,
-    0x5D,
-    0xC0,
-    0xC8,
-    0xF9,
-    0xBD,
-    0xA8,
-    0xF6,
-    0x69,
-    0x4D,
-    0xA7,
-    0xFE,
-    0xCD,
-    0x0F,
-    0xA9,
-    0x9A,
-    0xB2,
-    0xE9,
-    0x01,
-    0x73,
-    0x74,
-    0xA5,
-    0xB7,
-    0xDC,
-    0xD4,
-    0x37,
-    0x1D,
-    0x09,
-    0xFA,
-    0x23,
-    0xEA,
-    0x21,
-    0x81,
-    0x94,
-    0xD8,
-    0xFF,
-    0x49,
-    0x83,
-    0xBA,
-    0x6B,
-    0x51,
-    0x9D,
-    0xDB,
-    0x8B,
-    0xDD,
-    0xD1,
-    0x51,
-    0xF0,
-    0x83,
-    0x1E,
-    0x03,
-    0x69,
-    0xCF,
-    0x47,
-    0x43,
-    0x8A,
-    0xA9,
-    0xC8,
-    0xF4,
-    0x7A,
-    0xE9,
-    0x32,
-    0x34,
-    0xA7,
-    0x1D,
-    0xAC,
-    0xC2,
-    0x1E,
-    0x73,
-    0x5A,
-    0x02,
-    0x5D,
-    0xF1,
-    0xD8,
-    0x07,
-    0x2E,
-    0x04,
-    0x98,
-    0x5D,
-    0xA5,
-    0xAE,
-    0xA8,
-    0x2F,
-    0x98,
-    0x64,
-    0xBD,
-    0xF0,
-    0x2F,
-    0xBB,
-    0x22,
-    0x45,
-    0x1C,
-    0x3D,
-    0x79,
-    0x1D,
-    0x77,
-    0xAD,
-    0x15,
-    0xDC,
-    0x23,
-    0xE8,
-    0x0D,
-    0x63,
-    0x47,
-    0x83,
-    0xA6,
-    0x91,
-    0xC6,
-    0x73,
-    0x9A,
-    0x97,
-    0x93,
-    0x17,
-    0xCE,
-    0x39,
-    0xFC,
-    0xBA,
-    0xFF,
-    0x18,
-    0x96,
-    0xA2,
-    0x1C,
-    0xA0,
-    0xAE,
-    0xAF,
-    0x22,
-    0x30,
-    0x03,
-    0xD1,
-    0xE8,
-    0xDA,
-    0x05,
-    0x56,
-    0x70,
-    0x40,
-    0xF0,
-    0x51,
-    0x6B,
-    0x7D,
-    0xFD,
-    0x69,
-    0x5A,
-    0x14,
-    0xBE,
-    0x73,
-    0xD7,
-    0x32,
-    0xFF,
-    0x07,
-    0x4C,
-    0x48,
-    0x4E,
-    0x3C,
-    0xA1,
-    0x4D,
-    0x25,
-    0x6D,
-    0x69,
-    0xF8,
-    0x7C,
-    0x40,
-    0x53,
-    0xAE,
-    0x8E,
-    0x74,
-    0x7C,
-    0xE2,
-    0xC5,
-    0xDE,
-    0xBD,
-    0x58,
-    0x32,
-    0xC6,
-    0xB0,
-    0x38,
-    0x5D,
-    0xF8,
-    0xBF,
-    0x22,
-    0x91,
-    0x3E,
-    0x26,
-    0xB2,
-    0x97,
-    0x6D,
-    0xF5,
-    0xC9,
-    0xB4,
-    0xC8,
-    0x85,
-    0x88,
-    0xA0,
-    0xC8,
-    0x5E,
-    0xED,
-    0xFA,
-    0x10,
-    0xBE,
-    0xE7,
-    0xF8,
-    0x1A,
-    0x03,
-    0x16,
-    0x2A,
-    0xFA,
-    0x0E,
-    0x3C,
-    0xD6,
-    0x53,
-    0x12,
-    0xA5,
-    0x32,
-    0x69,
-    0xFD,
-    0x97,
-    0x17,
-    0xE4,
-    0x01,
-    0x3D,
-    0xD8,
-    0x57,
-    0xB3,
-    0x07,
-    0x2D,
-    0x21,
-    0x6C,
-    0x73,
-    0x75,
-    0xA3,
-    0x91,
-    0x86,
-    0x53,
-    0xFC,
-    0x8E,
-    0xA1,
-    0x22,
-    0xE7,
-    0x3A,
-    0xA2,
-    0x92,
-    0x24,
-    0xCC,
-    0x34,
-    0x2D,
-    0x0B,
-    0x1B,
-    0x87,
-    0x90,
-    0x52,
-    0xE4,
-    0x0B,
-    0x35,
-    0x27,
-    0xF6,
-    0x4F,
-    0xBD,
-    0x90,
-    0x2A,
-    0x64,
-    0x65,
-    0x47,
-    0x54,
-    0x80,
-    0x16,
-    0x82,
-    0x26,
-    0xAA,
-    0xF6,
-    0xEF,
-    0x64,
-    0xB4,
-    0x07,
-    0x35,
-    0x16,
-    0xB8,
-    0x95,
-    0x4C,
-    0x73,
-    0x5C,
-    0x5F,
-    0x68,
-    0x7E,
-    0x19,
-    0x64,
-    0x7B,
-    0xEB,
-    0x19,
-    0x84,
-    0x29,
-    0x8D,
-    0x8B,
-    0x84,
-    0xB9,
-    0x23,
-    0x37,
-    0x67,
-    0xA2,
-    0xFE,
-    0xAB,
-    0x61,
-    0xCA,
-    0x52,
-    0x24,
-    0x7D,
-    0xCD,
-    0x0C,
-    0x54,
-    0x40,
-    0xBD,
-    0x96,
-    0x75,
-    0x45,
-    0xA9,
-    0xAA,
-    0x6D,
-    0x7F,
-    0x95,
-    0xAF,
-    0xE6,
-    0x49,
-    0x87,
-    0x26,
-    0xB5,
-    0xF4,
-    0xCC,
-    0xBE,
-    0x51,
-    0xF0,
-    0x1C,
-    0x1D,
-    0x7D,
-    0x67,
-    0x0C,
-    0x01,
-    0xAE,
-    0x19,
-    0x67,
-    0xE3,
-    0x92,
-    0x69,
-    0x5F,
-    0x9A,
-    0x87,
-    0x66,
-    0x48,
-    0xCF,
-    0xB8,
-    0x75,
-    0xDF,
-    0x03,
-    0x4D,
-    0x24,
-    0x29,
-    0xC6,
-    0x12,
-    0xD4,
-    0x63,
-    0xFC,
-    0x7B,
-    0x2F,
-    0x54,
-    0x7B,
-    0x3A,
-    0xFC,
-    0x00,
-    0xB2,
-    0x7B,
-    0x90,
-    0x16,
-    0x6F,
-    0xAB,
-    0xB8,
-    0x8B,
-    0x85,
-    0x0D,
-    0xB7,
-    0xD4,
-    0x38,
-    0x48,
-    0x39,
-    0x30,
-    0xC4,
-    0x67,
-    0x80,
-    0x5E,
-    0x3C,
-    0x58,
-    0x5C,
-    0x71,
-    0x5C,
-    0xD4,
-    0x86,
-    0x62,
-    0x34,
-    0x92,
-    0xC1,
-    0x08,
-    0x76,
-    0x59,
-    0x55,
-    0xDC,
-    0xF3,
-    0xCB,
-    0x59,
-    0xD7,
-    0x8C,
-    0x48,
-    0x82,
-    0x52,
-    0xE1,
-    0x61,
-    0xCF,
-    0x50,
-    0x47,
-    0xA9,
-    0x52,
-    0x91,
-    0x74,
-    0xD2,
-    0x9F,
-    0xBC,
-    0x9F,
-    0x89,
-    0x11,
-    0x73,
-    0x12,
-    0xA8,
-    0xC2,
-    0x35,
-    0x47,
-    0xFD,
-    0x3B,
-    0x5A,
-    0xC4,
-    0xA6,
-    0x3F,
-    0xC7,
-    0xA0,
-    0x57,
-    0xC2,
-    0xC3,
-    0x8E,
-    0xD4,
-    0xFE,
-    0xE8,
-    0x18,
-    0x3E,
-    0x76,
-    0x29,
-    0x2F,
-    0xC6,
-    0x79,
-    0xBC,
-    0x11,
-    0xA9,
-    0x4F,
-    0xD3,
-    0x4F,
-    0xD1,
-    0xA3,
-    0x44,
-    0xBD,
-    0xBA,
-    0x72,
-    0x4E,
-    0xF1,
-    0x41,
-    0x88,
-    0x57,
-    0x61,
-    0xE5,
-    0x47,
-    0xAA,
-    0x42,
-    0x16,
-    0x2E,
-    0xA0,
-    0xFE,
-    0xE2,
-    0x7A,
-    0x4C,
-    0x6E,
-    0x75,
-    0x77,
-    0x7B,
-    0x9B,
-    0x43,
-    0x70,
-    0x7A,
-    0xAF,
-    0x18,
-    0x53,
-    0x1F,
-    0xC1,
-    0xA3,
-    0x64,
-    0x66,
-    0x2E,
-    0x2C,
-    0xD0,
-    0xAE,
-    0xE6,
-    0x59,
-    0x05,
-    0x14,
-    0xBE,
-    0x40,
-    0xB9,
-    0x0B,
-    0x60,
-    0xE4,
-    0x07,
-    0xE5,
-    0x66,
-    0x8C,
-    0xEB,
-    0xEE,
-    0x34,
-    0x4A,
-    0x12,
-    0x74,
-    0x36,
-    0xC4,
-    0x1C,
-    0xCD,
-    0xC3,
-    0x6B,
-    0x6B,
-    0x67,
-    0x63,
-    0x81,
-    0xF6,
-    0x43,
-    0x4E,
-    0x7B,
-    0x35,
-    0xD4,
-    0x2D,
-    0xCB,
-    0xBF,
-    0x5D,
-    0x39,
-    0x83,
-    0x97,
-    0xF7,
-    0x96,
-    0x74,
-    0x7B,
-    0x1D,
-    0xDC,
-    0x57,
-    0xCF,
-    0x3D,
-    0x32,
-    0x07,
-    0x43,
-    0x9B,
-    0x5B,
-    0xE2,
-    0x5B,
-    0x9B,
-    0x81,
-    0x6B,
-    0xF5,
-]
-
-LDEC_RAM_CONTENT_START_ADDR = 0x2000
-LDEC_RAM_CONTENT = [
-    0xB7,
-    0x0A,
-    0x00,
-    0x00,
-    0x3D,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x60,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x17,
-    0x80,
-    0x00,
-    0x00,
-    0x7F,
-    0x3C,
-    0x00,
-    0x00,
-    0x18,
-    0x9C,
-    0x00,
-    0x00,
-    0x2D,
-    0x9C,
-    0x00,
-    0x00,
-    0x1D,
-    0x80,
-    0x00,
-    0x00,
-    0x1E,
-    0x80,
-    0x00,
-    0x00,
-    0x1B,
-    0xBC,
-    0x00,
-    0x00,
-    0x06,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0C,
-    0x81,
-    0x00,
-    0x00,
-    0x0D,
-    0x81,
-    0x00,
-    0x00,
-    0x0E,
-    0x81,
-    0x00,
-    0x00,
-    0x0F,
-    0x81,
-    0x00,
-    0x00,
-    0x01,
-    0xDC,
-    0x00,
-    0x00,
-    0x0F,
-    0x85,
-    0x00,
-    0x00,
-    0x10,
-    0x81,
-    0x00,
-    0x00,
-    0x11,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x25,
-    0x85,
-    0x00,
-    0x00,
-    0x16,
-    0x85,
-    0x00,
-    0x00,
-    0x26,
-    0x85,
-    0x00,
-    0x00,
-    0x23,
-    0x85,
-    0x00,
-    0x00,
-    0x24,
-    0x85,
-    0x00,
-    0x00,
-    0x17,
-    0x81,
-    0x00,
-    0x00,
-    0x22,
-    0x81,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x31,
-    0x85,
-    0x00,
-    0x00,
-    0x32,
-    0x85,
-    0x00,
-    0x00,
-    0x33,
-    0x85,
-    0x00,
-    0x00,
-    0x34,
-    0x85,
-    0x00,
-    0x00,
-    0x35,
-    0x85,
-    0x00,
-    0x00,
-    0x29,
-    0x81,
-    0x00,
-    0x00,
-    0x2E,
-    0xDC,
-    0x00,
-    0x00,
-    0x21,
-    0x7C,
-    0x00,
-    0x00,
-    0x94,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x8D,
-    0x00,
-    0x00,
-    0x04,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x8D,
-    0x00,
-    0x00,
-    0x1A,
-    0xAD,
-    0x00,
-    0x00,
-    0x18,
-    0x8D,
-    0x00,
-    0x00,
-    0x1B,
-    0xAD,
-    0x00,
-    0x00,
-    0x19,
-    0x8D,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x08,
-    0x85,
-    0x00,
-    0x00,
-    0x1D,
-    0x7C,
-    0x00,
-    0x00,
-    0xA8,
-    0x3F,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x1F,
-    0x7C,
-    0x00,
-    0x00,
-    0x98,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8E,
-    0xAB,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x88,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x01,
-    0xD0,
-    0x00,
-    0x00,
-    0x8E,
-    0xAF,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x26,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0xA8,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x82,
-    0x0D,
-    0x00,
-    0x00,
-    0x17,
-    0x8C,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8D,
-    0x87,
-    0x00,
-    0x00,
-    0x0A,
-    0x84,
-    0x00,
-    0x00,
-    0x03,
-    0x7C,
-    0x00,
-    0x00,
-    0x82,
-    0x3F,
-    0x00,
-    0x00,
-    0x81,
-    0xFF,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x9B,
-    0xBA,
-    0x00,
-    0x00,
-    0xAD,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x39,
-    0x98,
-    0x00,
-    0x00,
-    0x19,
-    0xAC,
-    0x00,
-    0x00,
-    0x13,
-    0x8C,
-    0x00,
-    0x00,
-    0x03,
-    0xB0,
-    0x00,
-    0x00,
-    0x12,
-    0x90,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x84,
-    0x11,
-    0x00,
-    0x00,
-    0x06,
-    0x12,
-    0x00,
-    0x00,
-    0x07,
-    0x98,
-    0x00,
-    0x00,
-    0x08,
-    0x98,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x98,
-    0xAF,
-    0x00,
-    0x00,
-    0x02,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x8D,
-    0xAA,
-    0x00,
-    0x00,
-    0x82,
-    0x0D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x17,
-    0x90,
-    0x00,
-    0x00,
-    0x03,
-    0xB8,
-    0x00,
-    0x00,
-    0x39,
-    0xAC,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0x9B,
-    0xBB,
-    0x00,
-    0x00,
-    0x03,
-    0x3B,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x7F,
-    0x3B,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0x14,
-    0x90,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB8,
-    0x00,
-    0x00,
-    0x81,
-    0xD8,
-    0x00,
-    0x00,
-    0x17,
-    0x8C,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0E,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0xB8,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0x17,
-    0xB0,
-    0x00,
-    0x00,
-    0x14,
-    0x90,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xBC,
-    0x00,
-    0x00,
-    0x81,
-    0xDC,
-    0x00,
-    0x00,
-    0x17,
-    0x8C,
-    0x00,
-    0x00,
-    0x21,
-    0x7C,
-    0x00,
-    0x00,
-    0xB2,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x8D,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x10,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x30,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x8D,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x08,
-    0x85,
-    0x00,
-    0x00,
-    0x0D,
-    0x85,
-    0x00,
-    0x00,
-    0x0A,
-    0x84,
-    0x00,
-    0x00,
-    0x01,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x15,
-    0xAE,
-    0x00,
-    0x00,
-    0x11,
-    0xB4,
-    0x00,
-    0x00,
-    0x00,
-    0xBE,
-    0x00,
-    0x00,
-    0x81,
-    0xDC,
-    0x00,
-    0x00,
-    0x18,
-    0xAE,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x00,
-    0xBE,
-    0x00,
-    0x00,
-    0x18,
-    0xAE,
-    0x00,
-    0x00,
-    0x82,
-    0xDC,
-    0x00,
-    0x00,
-    0x15,
-    0xAE,
-    0x00,
-    0x00,
-    0xFE,
-    0x2D,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0xAE,
-    0x00,
-    0x00,
-    0x03,
-    0x7C,
-    0x00,
-    0x00,
-    0x82,
-    0x3F,
-    0x00,
-    0x00,
-    0x81,
-    0xFF,
-    0x00,
-    0x00,
-    0x12,
-    0xB0,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x90,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x84,
-    0xD0,
-    0x00,
-    0x00,
-    0x12,
-    0xB0,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x01,
-    0xD0,
-    0x00,
-    0x00,
-    0xFB,
-    0xC0,
-    0x00,
-    0x00,
-    0x01,
-    0xB9,
-    0x00,
-    0x00,
-    0x00,
-    0x99,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x19,
-    0x81,
-    0x00,
-    0x00,
-    0x17,
-    0x81,
-    0x00,
-    0x00,
-    0x1C,
-    0xAC,
-    0x00,
-    0x00,
-    0x04,
-    0xCC,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x33,
-    0x80,
-    0x00,
-    0x00,
-    0x1A,
-    0x81,
-    0x00,
-    0x00,
-    0x1B,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x1C,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x90,
-    0xC0,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x89,
-    0xCC,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8D,
-    0x83,
-    0x00,
-    0x00,
-    0x21,
-    0x7C,
-    0x00,
-    0x00,
-    0xB2,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x23,
-    0x7C,
-    0x00,
-    0x00,
-    0x8A,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x1B,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x1C,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0xB2,
-    0xC0,
-    0x00,
-    0x00,
-    0x1A,
-    0xAD,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x10,
-    0xAC,
-    0x00,
-    0x00,
-    0x0F,
-    0x8C,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x1A,
-    0xCC,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8D,
-    0x83,
-    0x00,
-    0x00,
-    0x21,
-    0x7C,
-    0x00,
-    0x00,
-    0x94,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x1D,
-    0x7C,
-    0x00,
-    0x00,
-    0xA8,
-    0x3F,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x1F,
-    0x7C,
-    0x00,
-    0x00,
-    0x98,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8E,
-    0xAB,
-    0x00,
-    0x00,
-    0x14,
-    0x88,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x81,
-    0xD0,
-    0x00,
-    0x00,
-    0x8E,
-    0xAF,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x26,
-    0x8D,
-    0x00,
-    0x00,
-    0x33,
-    0x80,
-    0x00,
-    0x00,
-    0x1A,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8E,
-    0xBB,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x03,
-    0xA8,
-    0x00,
-    0x00,
-    0x02,
-    0x1B,
-    0x00,
-    0x00,
-    0x0B,
-    0xCF,
-    0x00,
-    0x00,
-    0x1D,
-    0x7C,
-    0x00,
-    0x00,
-    0xA8,
-    0x3F,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x1F,
-    0x7C,
-    0x00,
-    0x00,
-    0x98,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x37,
-    0x81,
-    0x00,
-    0x00,
-    0x39,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x13,
-    0x81,
-    0x00,
-    0x00,
-    0x12,
-    0xB9,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x04,
-    0xB9,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x06,
-    0x85,
-    0x00,
-    0x00,
-    0x05,
-    0xB9,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x06,
-    0x81,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x39,
-    0xB8,
-    0x00,
-    0x00,
-    0x02,
-    0x3B,
-    0x00,
-    0x00,
-    0x1C,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x01,
-    0x38,
-    0x00,
-    0x00,
-    0x17,
-    0xCF,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x9B,
-    0xBA,
-    0x00,
-    0x00,
-    0xAD,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x39,
-    0x98,
-    0x00,
-    0x00,
-    0x19,
-    0xB8,
-    0x00,
-    0x00,
-    0x13,
-    0x98,
-    0x00,
-    0x00,
-    0x03,
-    0xB8,
-    0x00,
-    0x00,
-    0x12,
-    0x98,
-    0x00,
-    0x00,
-    0x1C,
-    0xAC,
-    0x00,
-    0x00,
-    0x86,
-    0xCC,
-    0x00,
-    0x00,
-    0x0F,
-    0xAC,
-    0x00,
-    0x00,
-    0x04,
-    0xCC,
-    0x00,
-    0x00,
-    0x1E,
-    0xAC,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x1E,
-    0x8C,
-    0x00,
-    0x00,
-    0x3C,
-    0x80,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x23,
-    0x84,
-    0x00,
-    0x00,
-    0x1C,
-    0xAC,
-    0x00,
-    0x00,
-    0x0E,
-    0xCC,
-    0x00,
-    0x00,
-    0x23,
-    0x80,
-    0x00,
-    0x00,
-    0x12,
-    0xAC,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x1B,
-    0xB5,
-    0x00,
-    0x00,
-    0x84,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x14,
-    0x98,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x81,
-    0xD4,
-    0x00,
-    0x00,
-    0x23,
-    0x84,
-    0x00,
-    0x00,
-    0x1E,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x07,
-    0x6C,
-    0x00,
-    0x00,
-    0x9F,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xED,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x13,
-    0xAC,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x18,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x3D,
-    0x90,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x85,
-    0xD0,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x12,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x05,
-    0x10,
-    0x00,
-    0x00,
-    0x01,
-    0xC4,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x06,
-    0xCF,
-    0x00,
-    0x00,
-    0x3C,
-    0xB4,
-    0x00,
-    0x00,
-    0x04,
-    0xD4,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x15,
-    0x81,
-    0x00,
-    0x00,
-    0x16,
-    0x81,
-    0x00,
-    0x00,
-    0x02,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x8D,
-    0xB2,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x12,
-    0xB0,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x02,
-    0x7C,
-    0x00,
-    0x00,
-    0xB8,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x8E,
-    0x82,
-    0x00,
-    0x00,
-    0x13,
-    0xAC,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x19,
-    0xB1,
-    0x00,
-    0x00,
-    0x05,
-    0x16,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x3E,
-    0x90,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x85,
-    0xD0,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x12,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x05,
-    0x10,
-    0x00,
-    0x00,
-    0x01,
-    0xC4,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x16,
-    0x85,
-    0x00,
-    0x00,
-    0x23,
-    0xAC,
-    0x00,
-    0x00,
-    0xBE,
-    0xCC,
-    0x00,
-    0x00,
-    0x18,
-    0xAC,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x81,
-    0xCE,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x82,
-    0x36,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x1B,
-    0xB1,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xBC,
-    0x00,
-    0x00,
-    0x03,
-    0xDC,
-    0x00,
-    0x00,
-    0x18,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0xC4,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x12,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0x1B,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x23,
-    0x81,
-    0x00,
-    0x00,
-    0x7D,
-    0x3B,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x27,
-    0x85,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x01,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x82,
-    0x36,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x2E,
-    0xB0,
-    0x00,
-    0x00,
-    0x01,
-    0x2E,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xBC,
-    0x00,
-    0x00,
-    0x03,
-    0xDC,
-    0x00,
-    0x00,
-    0x18,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0xC4,
-    0x00,
-    0x00,
-    0x17,
-    0xAC,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x12,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0x1B,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x1F,
-    0x85,
-    0x00,
-    0x00,
-    0x1C,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x0B,
-    0x6C,
-    0x00,
-    0x00,
-    0xB2,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xED,
-    0x00,
-    0x00,
-    0x02,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0x82,
-    0x00,
-    0x00,
-    0x81,
-    0x82,
-    0x00,
-    0x00,
-    0x1A,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x2B,
-    0xC4,
-    0x00,
-    0x00,
-    0x30,
-    0xAC,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x2E,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x18,
-    0xB4,
-    0x00,
-    0x00,
-    0x81,
-    0xD5,
-    0x00,
-    0x00,
-    0x20,
-    0x85,
-    0x00,
-    0x00,
-    0x30,
-    0xAC,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x18,
-    0xB5,
-    0x00,
-    0x00,
-    0x1A,
-    0xB8,
-    0x00,
-    0x00,
-    0x86,
-    0x16,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x19,
-    0x00,
-    0x00,
-    0x18,
-    0xB4,
-    0x00,
-    0x00,
-    0x02,
-    0xD7,
-    0x00,
-    0x00,
-    0x25,
-    0x81,
-    0x00,
-    0x00,
-    0x26,
-    0x81,
-    0x00,
-    0x00,
-    0x81,
-    0xD5,
-    0x00,
-    0x00,
-    0x25,
-    0x85,
-    0x00,
-    0x00,
-    0x18,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x19,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x01,
-    0xD7,
-    0x00,
-    0x00,
-    0x26,
-    0x85,
-    0x00,
-    0x00,
-    0x1B,
-    0xB9,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x98,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x02,
-    0xD0,
-    0x00,
-    0x00,
-    0x39,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0xC0,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0x81,
-    0xCE,
-    0x00,
-    0x00,
-    0x24,
-    0x81,
-    0x00,
-    0x00,
-    0x23,
-    0xAD,
-    0x00,
-    0x00,
-    0x09,
-    0xCC,
-    0x00,
-    0x00,
-    0x1C,
-    0xB5,
-    0x00,
-    0x00,
-    0x03,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x05,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x09,
-    0x78,
-    0x00,
-    0x00,
-    0x00,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x18,
-    0xD4,
-    0x00,
-    0x00,
-    0x1A,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x92,
-    0xC0,
-    0x00,
-    0x00,
-    0x24,
-    0xB5,
-    0x00,
-    0x00,
-    0x10,
-    0xD4,
-    0x00,
-    0x00,
-    0x1D,
-    0xB5,
-    0x00,
-    0x00,
-    0x04,
-    0x70,
-    0x00,
-    0x00,
-    0x00,
-    0x32,
-    0x00,
-    0x00,
-    0x05,
-    0xAE,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x04,
-    0xD4,
-    0x00,
-    0x00,
-    0x09,
-    0xC4,
-    0x00,
-    0x00,
-    0x1A,
-    0xB9,
-    0x00,
-    0x00,
-    0x1D,
-    0x99,
-    0x00,
-    0x00,
-    0x86,
-    0xC0,
-    0x00,
-    0x00,
-    0x83,
-    0xD4,
-    0x00,
-    0x00,
-    0x24,
-    0x85,
-    0x00,
-    0x00,
-    0x20,
-    0x81,
-    0x00,
-    0x00,
-    0x3F,
-    0x84,
-    0x00,
-    0x00,
-    0xFF,
-    0x36,
-    0x00,
-    0x00,
-    0x1D,
-    0x95,
-    0x00,
-    0x00,
-    0x03,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x09,
-    0xC4,
-    0x00,
-    0x00,
-    0x83,
-    0xD4,
-    0x00,
-    0x00,
-    0x3F,
-    0x84,
-    0x00,
-    0x00,
-    0x23,
-    0x85,
-    0x00,
-    0x00,
-    0x1F,
-    0x81,
-    0x00,
-    0x00,
-    0xFF,
-    0x36,
-    0x00,
-    0x00,
-    0x1C,
-    0x95,
-    0x00,
-    0x00,
-    0x02,
-    0xC4,
-    0x00,
-    0x00,
-    0x1A,
-    0xB9,
-    0x00,
-    0x00,
-    0x1C,
-    0x99,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x2B,
-    0xAF,
-    0x00,
-    0x00,
-    0x81,
-    0xD1,
-    0x00,
-    0x00,
-    0x21,
-    0x80,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x3F,
-    0xAF,
-    0x00,
-    0x00,
-    0x11,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x15,
-    0x00,
-    0x00,
-    0x81,
-    0xD2,
-    0x00,
-    0x00,
-    0x22,
-    0x80,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x28,
-    0x6C,
-    0x00,
-    0x00,
-    0xA1,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xFD,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x28,
-    0xAF,
-    0x00,
-    0x00,
-    0x81,
-    0xD1,
-    0x00,
-    0x00,
-    0x21,
-    0x84,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x3D,
-    0xAF,
-    0x00,
-    0x00,
-    0x11,
-    0xB8,
-    0x00,
-    0x00,
-    0x86,
-    0x19,
-    0x00,
-    0x00,
-    0x01,
-    0xD3,
-    0x00,
-    0x00,
-    0x22,
-    0x84,
-    0x00,
-    0x00,
-    0x0F,
-    0xB5,
-    0x00,
-    0x00,
-    0x87,
-    0xD4,
-    0x00,
-    0x00,
-    0x04,
-    0x6C,
-    0x00,
-    0x00,
-    0xA0,
-    0x2D,
-    0x00,
-    0x00,
-    0x9C,
-    0xB5,
-    0x00,
-    0x00,
-    0x03,
-    0xD4,
-    0x00,
-    0x00,
-    0x3F,
-    0x84,
-    0x00,
-    0x00,
-    0xA3,
-    0x85,
-    0x00,
-    0x00,
-    0x9F,
-    0x81,
-    0x00,
-    0x00,
-    0x1A,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x38,
-    0xC4,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x2B,
-    0xAF,
-    0x00,
-    0x00,
-    0x81,
-    0xD1,
-    0x00,
-    0x00,
-    0x08,
-    0x81,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x3F,
-    0xAF,
-    0x00,
-    0x00,
-    0x11,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x15,
-    0x00,
-    0x00,
-    0x81,
-    0xD2,
-    0x00,
-    0x00,
-    0x09,
-    0x81,
-    0x00,
-    0x00,
-    0x2D,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x28,
-    0x6C,
-    0x00,
-    0x00,
-    0xA1,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xFD,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x28,
-    0xAF,
-    0x00,
-    0x00,
-    0x81,
-    0xD1,
-    0x00,
-    0x00,
-    0x08,
-    0x85,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x3D,
-    0xAF,
-    0x00,
-    0x00,
-    0x11,
-    0xB8,
-    0x00,
-    0x00,
-    0x86,
-    0x19,
-    0x00,
-    0x00,
-    0x01,
-    0xD3,
-    0x00,
-    0x00,
-    0x09,
-    0x85,
-    0x00,
-    0x00,
-    0x0F,
-    0xB5,
-    0x00,
-    0x00,
-    0x87,
-    0xD4,
-    0x00,
-    0x00,
-    0x04,
-    0x6C,
-    0x00,
-    0x00,
-    0xA0,
-    0x2D,
-    0x00,
-    0x00,
-    0x9D,
-    0xB5,
-    0x00,
-    0x00,
-    0x03,
-    0xD4,
-    0x00,
-    0x00,
-    0x3F,
-    0x84,
-    0x00,
-    0x00,
-    0xA4,
-    0x85,
-    0x00,
-    0x00,
-    0xA0,
-    0x81,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x30,
-    0x29,
-    0x00,
-    0x00,
-    0x09,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x28,
-    0x6C,
-    0x00,
-    0x00,
-    0xA1,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xFD,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x14,
-    0x98,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x08,
-    0xD4,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x18,
-    0x98,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0xDA,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0xA7,
-    0x82,
-    0x00,
-    0x00,
-    0x1A,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x23,
-    0xC4,
-    0x00,
-    0x00,
-    0x18,
-    0xB4,
-    0x00,
-    0x00,
-    0x30,
-    0xB8,
-    0x00,
-    0x00,
-    0x05,
-    0xD7,
-    0x00,
-    0x00,
-    0x2D,
-    0x80,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x05,
-    0x85,
-    0x00,
-    0x00,
-    0x88,
-    0xC0,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x2D,
-    0xB8,
-    0x00,
-    0x00,
-    0x14,
-    0x98,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x02,
-    0xD4,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x2D,
-    0x98,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x30,
-    0x29,
-    0x00,
-    0x00,
-    0x18,
-    0xB4,
-    0x00,
-    0x00,
-    0x30,
-    0xB8,
-    0x00,
-    0x00,
-    0x0E,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x1A,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x03,
-    0x1B,
-    0x00,
-    0x00,
-    0x04,
-    0xD7,
-    0x00,
-    0x00,
-    0x0E,
-    0xAC,
-    0x00,
-    0x00,
-    0x09,
-    0x8C,
-    0x00,
-    0x00,
-    0x05,
-    0x85,
-    0x00,
-    0x00,
-    0x85,
-    0xC0,
-    0x00,
-    0x00,
-    0x09,
-    0xB8,
-    0x00,
-    0x00,
-    0x05,
-    0xAD,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x09,
-    0x98,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x00,
-    0x05,
-    0x80,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0xD8,
-    0x00,
-    0x00,
-    0x18,
-    0x80,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x05,
-    0x85,
-    0x00,
-    0x00,
-    0x39,
-    0xA8,
-    0x00,
-    0x00,
-    0x01,
-    0xD9,
-    0x00,
-    0x00,
-    0x05,
-    0x84,
-    0x00,
-    0x00,
-    0x0D,
-    0x78,
-    0x00,
-    0x00,
-    0x29,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x00,
-    0x05,
-    0x80,
-    0x00,
-    0x00,
-    0x20,
-    0x80,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0x81,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x30,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x87,
-    0xC0,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x30,
-    0x8D,
-    0x00,
-    0x00,
-    0x04,
-    0xCC,
-    0x00,
-    0x00,
-    0x33,
-    0x85,
-    0x00,
-    0x00,
-    0x02,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8F,
-    0x83,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x0D,
-    0x7C,
-    0x00,
-    0x00,
-    0xA2,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x29,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x29,
-    0x8C,
-    0x00,
-    0x00,
-    0x80,
-    0x15,
-    0x00,
-    0x00,
-    0x2C,
-    0xAC,
-    0x00,
-    0x00,
-    0x8D,
-    0xCC,
-    0x00,
-    0x00,
-    0x2A,
-    0xB0,
-    0x00,
-    0x00,
-    0x02,
-    0xD0,
-    0x00,
-    0x00,
-    0x0B,
-    0xAD,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0x0C,
-    0xAD,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x81,
-    0xD0,
-    0x00,
-    0x00,
-    0x80,
-    0x0E,
-    0x00,
-    0x00,
-    0x29,
-    0x8C,
-    0x00,
-    0x00,
-    0x27,
-    0x84,
-    0x00,
-    0x00,
-    0x28,
-    0x84,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x01,
-    0x78,
-    0x00,
-    0x00,
-    0x00,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xB7,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x86,
-    0x1A,
-    0x00,
-    0x00,
-    0x10,
-    0xAF,
-    0x00,
-    0x00,
-    0x81,
-    0xD1,
-    0x00,
-    0x00,
-    0x21,
-    0x80,
-    0x00,
-    0x00,
-    0x08,
-    0xAF,
-    0x00,
-    0x00,
-    0x11,
-    0xB4,
-    0x00,
-    0x00,
-    0x85,
-    0x15,
-    0x00,
-    0x00,
-    0x81,
-    0xD2,
-    0x00,
-    0x00,
-    0x22,
-    0x80,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x29,
-    0xAC,
-    0x00,
-    0x00,
-    0x1F,
-    0xCC,
-    0x00,
-    0x00,
-    0x27,
-    0x80,
-    0x00,
-    0x00,
-    0x28,
-    0x80,
-    0x00,
-    0x00,
-    0x11,
-    0x81,
-    0x00,
-    0x00,
-    0x17,
-    0x81,
-    0x00,
-    0x00,
-    0x13,
-    0x81,
-    0x00,
-    0x00,
-    0x12,
-    0x81,
-    0x00,
-    0x00,
-    0x14,
-    0x81,
-    0x00,
-    0x00,
-    0x15,
-    0x81,
-    0x00,
-    0x00,
-    0x16,
-    0x81,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0x36,
-    0x00,
-    0x00,
-    0x25,
-    0x6C,
-    0x00,
-    0x00,
-    0xB8,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xFD,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0xCE,
-    0x00,
-    0x00,
-    0x04,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x8D,
-    0x00,
-    0x00,
-    0x8B,
-    0xC0,
-    0x00,
-    0x00,
-    0x04,
-    0xD0,
-    0x00,
-    0x00,
-    0x01,
-    0x81,
-    0x00,
-    0x00,
-    0x18,
-    0x81,
-    0x00,
-    0x00,
-    0x19,
-    0x81,
-    0x00,
-    0x00,
-    0x86,
-    0xC0,
-    0x00,
-    0x00,
-    0x01,
-    0x2E,
-    0x00,
-    0x00,
-    0x01,
-    0x8D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x18,
-    0x8D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x19,
-    0x8D,
-    0x00,
-    0x00,
-    0x01,
-    0x7C,
-    0x00,
-    0x00,
-    0x80,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xAB,
-    0x00,
-    0x00,
-    0x82,
-    0x1B,
-    0x00,
-    0x00,
-    0x0F,
-    0xAF,
-    0x00,
-    0x00,
-    0x81,
-    0xD1,
-    0x00,
-    0x00,
-    0x21,
-    0x84,
-    0x00,
-    0x00,
-    0x07,
-    0xAF,
-    0x00,
-    0x00,
-    0x11,
-    0xB8,
-    0x00,
-    0x00,
-    0x86,
-    0x19,
-    0x00,
-    0x00,
-    0x01,
-    0xD3,
-    0x00,
-    0x00,
-    0x22,
-    0x84,
-    0x00,
-    0x00,
-    0x29,
-    0xAC,
-    0x00,
-    0x00,
-    0x05,
-    0xCC,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0x18,
-    0x98,
-    0x00,
-    0x00,
-    0x1C,
-    0xB8,
-    0x00,
-    0x00,
-    0x05,
-    0xD8,
-    0x00,
-    0x00,
-    0x1B,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xD8,
-    0x00,
-    0x00,
-    0x0F,
-    0x78,
-    0x00,
-    0x00,
-    0x0A,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x07,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x28,
-    0x6C,
-    0x00,
-    0x00,
-    0xA1,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0xFD,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x00,
-    0x00,
-    0x02,
-    0x6C,
-    0x00,
-    0x00,
-    0xA0,
-    0x2D,
-    0x00,
-    0x00,
-    0x93,
-    0xB9,
-    0x00,
-    0x00,
-    0x84,
-    0xD8,
-    0x00,
-    0x00,
-    0x94,
-    0xB9,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x00,
-    0x81,
-    0x00,
-    0x00,
-    0x90,
-    0xC0,
-    0x00,
-    0x00,
-    0x1C,
-    0xB8,
-    0x00,
-    0x00,
-    0x0E,
-    0xD8,
-    0x00,
-    0x00,
-    0x90,
-    0xB9,
-    0x00,
-    0x00,
-    0x02,
-    0x30,
-    0x00,
-    0x00,
-    0x04,
-    0x5B,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x09,
-    0xDA,
-    0x00,
-    0x00,
-    0x01,
-    0x70,
-    0x00,
-    0x00,
-    0x00,
-    0x32,
-    0x00,
-    0x00,
-    0x12,
-    0xAE,
-    0x00,
-    0x00,
-    0x2F,
-    0xB8,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x00,
-    0x81,
-    0x00,
-    0x00,
-    0x81,
-    0xD4,
-    0x00,
-    0x00,
-    0x0B,
-    0x84,
-    0x00,
-    0x00,
-    0x07,
-    0xB8,
-    0x00,
-    0x00,
-    0x05,
-    0xAD,
-    0x00,
-    0x00,
-    0x86,
-    0xCC,
-    0x00,
-    0x00,
-    0x1E,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD7,
-    0x00,
-    0x00,
-    0x3C,
-    0x84,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x07,
-    0x98,
-    0x00,
-    0x00,
-    0x08,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x10,
-    0x29,
-    0x00,
-    0x00,
-    0x28,
-    0x6C,
-    0x00,
-    0x00,
-    0xA1,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0xFD,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x00,
-    0x00,
-    0x02,
-    0x6C,
-    0x00,
-    0x00,
-    0xA0,
-    0x2D,
-    0x00,
-    0x00,
-    0x93,
-    0xB9,
-    0x00,
-    0x00,
-    0x84,
-    0xD8,
-    0x00,
-    0x00,
-    0x94,
-    0xB9,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x00,
-    0x81,
-    0x00,
-    0x00,
-    0x90,
-    0xC0,
-    0x00,
-    0x00,
-    0x1C,
-    0xB8,
-    0x00,
-    0x00,
-    0x0E,
-    0xD8,
-    0x00,
-    0x00,
-    0x90,
-    0xB9,
-    0x00,
-    0x00,
-    0x02,
-    0x30,
-    0x00,
-    0x00,
-    0x04,
-    0x5B,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x09,
-    0xDA,
-    0x00,
-    0x00,
-    0x01,
-    0x70,
-    0x00,
-    0x00,
-    0x00,
-    0x32,
-    0x00,
-    0x00,
-    0x12,
-    0xAE,
-    0x00,
-    0x00,
-    0x2F,
-    0xB8,
-    0x00,
-    0x00,
-    0x86,
-    0x0D,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0xCF,
-    0x00,
-    0x00,
-    0x00,
-    0x81,
-    0x00,
-    0x00,
-    0x81,
-    0xD4,
-    0x00,
-    0x00,
-    0x0B,
-    0x80,
-    0x00,
-    0x00,
-    0x08,
-    0xB8,
-    0x00,
-    0x00,
-    0x05,
-    0xAD,
-    0x00,
-    0x00,
-    0x86,
-    0xCC,
-    0x00,
-    0x00,
-    0x1E,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD7,
-    0x00,
-    0x00,
-    0x3C,
-    0x84,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x08,
-    0x98,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x08,
-    0xAD,
-    0x00,
-    0x00,
-    0x81,
-    0xC5,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x17,
-    0x98,
-    0x00,
-    0x00,
-    0x1C,
-    0xB8,
-    0x00,
-    0x00,
-    0x28,
-    0xD8,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x2F,
-    0xA8,
-    0x00,
-    0x00,
-    0x05,
-    0x6C,
-    0x00,
-    0x00,
-    0xA0,
-    0x2D,
-    0x00,
-    0x00,
-    0xAD,
-    0xB1,
-    0x00,
-    0x00,
-    0x04,
-    0x11,
-    0x00,
-    0x00,
-    0x04,
-    0xD3,
-    0x00,
-    0x00,
-    0x02,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x8E,
-    0x86,
-    0x00,
-    0x00,
-    0x83,
-    0xC0,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x01,
-    0xD3,
-    0x00,
-    0x00,
-    0xA9,
-    0x81,
-    0x00,
-    0x00,
-    0x01,
-    0x2D,
-    0x00,
-    0x00,
-    0x2E,
-    0xB4,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x11,
-    0x00,
-    0x00,
-    0x16,
-    0xAC,
-    0x00,
-    0x00,
-    0x85,
-    0xCC,
-    0x00,
-    0x00,
-    0x17,
-    0xB4,
-    0x00,
-    0x00,
-    0x03,
-    0xD6,
-    0x00,
-    0x00,
-    0x02,
-    0x6C,
-    0x00,
-    0x00,
-    0xA0,
-    0x2D,
-    0x00,
-    0x00,
-    0x8F,
-    0x85,
-    0x00,
-    0x00,
-    0x0B,
-    0xD9,
-    0x00,
-    0x00,
-    0x20,
-    0x84,
-    0x00,
-    0x00,
-    0x18,
-    0x80,
-    0x00,
-    0x00,
-    0x05,
-    0x84,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x1D,
-    0xB8,
-    0x00,
-    0x00,
-    0x7F,
-    0x3B,
-    0x00,
-    0x00,
-    0x1D,
-    0x98,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x07,
-    0x85,
-    0x00,
-    0x00,
-    0x1B,
-    0xB8,
-    0x00,
-    0x00,
-    0x83,
-    0xD8,
-    0x00,
-    0x00,
-    0x11,
-    0x78,
-    0x00,
-    0x00,
-    0x04,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x96,
-    0xDA,
-    0x00,
-    0x00,
-    0x17,
-    0x80,
-    0x00,
-    0x00,
-    0x00,
-    0x84,
-    0x00,
-    0x00,
-    0x10,
-    0xB8,
-    0x00,
-    0x00,
-    0x24,
-    0x98,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x29,
-    0x85,
-    0x00,
-    0x00,
-    0x2F,
-    0xA8,
-    0x00,
-    0x00,
-    0x09,
-    0xC1,
-    0x00,
-    0x00,
-    0x20,
-    0x84,
-    0x00,
-    0x00,
-    0x18,
-    0x80,
-    0x00,
-    0x00,
-    0x05,
-    0x84,
-    0x00,
-    0x00,
-    0x1D,
-    0xB8,
-    0x00,
-    0x00,
-    0x7F,
-    0x3B,
-    0x00,
-    0x00,
-    0x1D,
-    0x98,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x07,
-    0x85,
-    0x00,
-    0x00,
-    0x02,
-    0xB8,
-    0x00,
-    0x00,
-    0x3E,
-    0x80,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x3E,
-    0x84,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0F,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0x81,
-    0x00,
-    0x00,
-    0x2C,
-    0x80,
-    0x00,
-    0x00,
-    0x1C,
-    0xD8,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x05,
-    0x1B,
-    0x00,
-    0x00,
-    0x05,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x26,
-    0xAE,
-    0x00,
-    0x00,
-    0x17,
-    0xCF,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x24,
-    0x00,
-    0x00,
-    0x81,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x05,
-    0xCC,
-    0x00,
-    0x00,
-    0x03,
-    0x85,
-    0x00,
-    0x00,
-    0x1D,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x1D,
-    0x8C,
-    0x00,
-    0x00,
-    0x8F,
-    0xC0,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x86,
-    0xCC,
-    0x00,
-    0x00,
-    0x08,
-    0x85,
-    0x00,
-    0x00,
-    0x03,
-    0x85,
-    0x00,
-    0x00,
-    0x1D,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x1D,
-    0x8C,
-    0x00,
-    0x00,
-    0x87,
-    0xC0,
-    0x00,
-    0x00,
-    0x08,
-    0x81,
-    0x00,
-    0x00,
-    0x1B,
-    0x68,
-    0x00,
-    0x00,
-    0x0E,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0xE9,
-    0x00,
-    0x00,
-    0x12,
-    0x78,
-    0x00,
-    0x00,
-    0x15,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x13,
-    0x78,
-    0x00,
-    0x00,
-    0x21,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x87,
-    0xDA,
-    0x00,
-    0x00,
-    0x17,
-    0x80,
-    0x00,
-    0x00,
-    0x00,
-    0x84,
-    0x00,
-    0x00,
-    0x10,
-    0xB8,
-    0x00,
-    0x00,
-    0x24,
-    0x98,
-    0x00,
-    0x00,
-    0x0C,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x0C,
-    0x8C,
-    0x00,
-    0x00,
-    0x13,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x12,
-    0xB4,
-    0x00,
-    0x00,
-    0x83,
-    0x12,
-    0x00,
-    0x00,
-    0x39,
-    0xAC,
-    0x00,
-    0x00,
-    0x84,
-    0x11,
-    0x00,
-    0x00,
-    0x83,
-    0x1A,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x98,
-    0xAE,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0D,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x84,
-    0x11,
-    0x00,
-    0x00,
-    0x04,
-    0x0C,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x9B,
-    0xB2,
-    0x00,
-    0x00,
-    0x03,
-    0x32,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0x13,
-    0x00,
-    0x00,
-    0x15,
-    0x90,
-    0x00,
-    0x00,
-    0x16,
-    0xB8,
-    0x00,
-    0x00,
-    0x81,
-    0xD8,
-    0x00,
-    0x00,
-    0x00,
-    0x0E,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x12,
-    0xB4,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x03,
-    0x10,
-    0x00,
-    0x00,
-    0x16,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0xFE,
-    0x32,
-    0x00,
-    0x00,
-    0x1F,
-    0x90,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x82,
-    0x00,
-    0x00,
-    0x46,
-    0xDA,
-    0x00,
-    0x00,
-    0x3C,
-    0xAC,
-    0x00,
-    0x00,
-    0x44,
-    0xCC,
-    0x00,
-    0x00,
-    0x87,
-    0xAE,
-    0x00,
-    0x00,
-    0x03,
-    0x30,
-    0x00,
-    0x00,
-    0x84,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x10,
-    0xB0,
-    0x00,
-    0x00,
-    0x94,
-    0xBA,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x06,
-    0x52,
-    0x00,
-    0x00,
-    0x0F,
-    0x90,
-    0x00,
-    0x00,
-    0x83,
-    0xD0,
-    0x00,
-    0x00,
-    0x13,
-    0x74,
-    0x00,
-    0x00,
-    0x8D,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0xF6,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x86,
-    0xC0,
-    0x00,
-    0x00,
-    0x82,
-    0xAE,
-    0x00,
-    0x00,
-    0x04,
-    0xCC,
-    0x00,
-    0x00,
-    0x88,
-    0x82,
-    0x00,
-    0x00,
-    0x13,
-    0x7C,
-    0x00,
-    0x00,
-    0x8D,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x88,
-    0x86,
-    0x00,
-    0x00,
-    0x83,
-    0x86,
-    0x00,
-    0x00,
-    0x1E,
-    0xAC,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x1E,
-    0x8C,
-    0x00,
-    0x00,
-    0x1E,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xD8,
-    0x00,
-    0x00,
-    0x11,
-    0x78,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x3C,
-    0xB8,
-    0x00,
-    0x00,
-    0x83,
-    0xD8,
-    0x00,
-    0x00,
-    0x11,
-    0x78,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x1F,
-    0xAC,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x84,
-    0xD9,
-    0x00,
-    0x00,
-    0x01,
-    0x84,
-    0x00,
-    0x00,
-    0x0A,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x0A,
-    0x8C,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x39,
-    0xB4,
-    0x00,
-    0x00,
-    0x13,
-    0xAC,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x07,
-    0xD0,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x12,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x05,
-    0x10,
-    0x00,
-    0x00,
-    0x01,
-    0xC4,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x10,
-    0xCF,
-    0x00,
-    0x00,
-    0x0F,
-    0xAC,
-    0x00,
-    0x00,
-    0x0E,
-    0xCC,
-    0x00,
-    0x00,
-    0x0A,
-    0xAC,
-    0x00,
-    0x00,
-    0x39,
-    0xB0,
-    0x00,
-    0x00,
-    0x06,
-    0xCC,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x05,
-    0x85,
-    0x00,
-    0x00,
-    0x07,
-    0x90,
-    0x00,
-    0x00,
-    0x06,
-    0x8D,
-    0x00,
-    0x00,
-    0x85,
-    0xC0,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x10,
-    0x29,
-    0x00,
-    0x00,
-    0x05,
-    0x85,
-    0x00,
-    0x00,
-    0x08,
-    0x90,
-    0x00,
-    0x00,
-    0x06,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x05,
-    0xB5,
-    0x00,
-    0x00,
-    0x0B,
-    0xD4,
-    0x00,
-    0x00,
-    0x03,
-    0x68,
-    0x00,
-    0x00,
-    0x10,
-    0x29,
-    0x00,
-    0x00,
-    0x05,
-    0xB5,
-    0x00,
-    0x00,
-    0x07,
-    0xD4,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0xB5,
-    0x00,
-    0x00,
-    0x03,
-    0xD4,
-    0x00,
-    0x00,
-    0x1B,
-    0x7C,
-    0x00,
-    0x00,
-    0x82,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x2D,
-    0x81,
-    0x00,
-    0x00,
-    0x3F,
-    0x80,
-    0x00,
-    0x00,
-    0xF8,
-    0xC0,
-    0x00,
-    0x00,
-    0x1B,
-    0xB8,
-    0x00,
-    0x00,
-    0x85,
-    0xD8,
-    0x00,
-    0x00,
-    0x1D,
-    0xB8,
-    0x00,
-    0x00,
-    0xF4,
-    0xD8,
-    0x00,
-    0x00,
-    0x18,
-    0x78,
-    0x00,
-    0x00,
-    0x04,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x05,
-    0x1B,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x12,
-    0x81,
-    0x00,
-    0x00,
-    0x13,
-    0x81,
-    0x00,
-    0x00,
-    0x22,
-    0x81,
-    0x00,
-    0x00,
-    0x23,
-    0x81,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x0A,
-    0xCC,
-    0x00,
-    0x00,
-    0x00,
-    0x3C,
-    0x00,
-    0x00,
-    0x00,
-    0x2C,
-    0x00,
-    0x00,
-    0x06,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x86,
-    0xB2,
-    0x00,
-    0x00,
-    0x01,
-    0xD0,
-    0x00,
-    0x00,
-    0xDE,
-    0xC0,
-    0x00,
-    0x00,
-    0x15,
-    0x74,
-    0x00,
-    0x00,
-    0x90,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0xF6,
-    0x00,
-    0x00,
-    0x04,
-    0xAD,
-    0x00,
-    0x00,
-    0x88,
-    0xD9,
-    0x00,
-    0x00,
-    0x12,
-    0x85,
-    0x00,
-    0x00,
-    0x1D,
-    0x85,
-    0x00,
-    0x00,
-    0x05,
-    0xAD,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x04,
-    0xBC,
-    0x00,
-    0x00,
-    0x87,
-    0x0D,
-    0x00,
-    0x00,
-    0x14,
-    0x8D,
-    0x00,
-    0x00,
-    0x33,
-    0x84,
-    0x00,
-    0x00,
-    0x2C,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x15,
-    0x00,
-    0x00,
-    0x86,
-    0xDA,
-    0x00,
-    0x00,
-    0x32,
-    0x81,
-    0x00,
-    0x00,
-    0x25,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0x16,
-    0x00,
-    0x00,
-    0x25,
-    0x95,
-    0x00,
-    0x00,
-    0x34,
-    0x81,
-    0x00,
-    0x00,
-    0x35,
-    0x81,
-    0x00,
-    0x00,
-    0x07,
-    0xB5,
-    0x00,
-    0x00,
-    0x0F,
-    0xB1,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x0D,
-    0xB5,
-    0x00,
-    0x00,
-    0x05,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x3F,
-    0xBD,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x0E,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x0C,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x88,
-    0xD9,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x06,
-    0x34,
-    0x00,
-    0x00,
-    0x1C,
-    0x95,
-    0x00,
-    0x00,
-    0x87,
-    0x53,
-    0x00,
-    0x00,
-    0x04,
-    0xB4,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x15,
-    0x91,
-    0x00,
-    0x00,
-    0x33,
-    0x84,
-    0x00,
-    0x00,
-    0x2A,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x15,
-    0x00,
-    0x00,
-    0x84,
-    0xDA,
-    0x00,
-    0x00,
-    0x31,
-    0x81,
-    0x00,
-    0x00,
-    0x24,
-    0x85,
-    0x00,
-    0x00,
-    0x34,
-    0x81,
-    0x00,
-    0x00,
-    0x35,
-    0x81,
-    0x00,
-    0x00,
-    0x2B,
-    0xB1,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x84,
-    0x15,
-    0x00,
-    0x00,
-    0x82,
-    0xDA,
-    0x00,
-    0x00,
-    0x24,
-    0x81,
-    0x00,
-    0x00,
-    0x31,
-    0x85,
-    0x00,
-    0x00,
-    0x10,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x11,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x1F,
-    0x00,
-    0x00,
-    0x3D,
-    0x9D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x3F,
-    0xBD,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x2D,
-    0xB1,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x84,
-    0x15,
-    0x00,
-    0x00,
-    0x89,
-    0xDA,
-    0x00,
-    0x00,
-    0x25,
-    0xB1,
-    0x00,
-    0x00,
-    0x7F,
-    0x32,
-    0x00,
-    0x00,
-    0x25,
-    0x91,
-    0x00,
-    0x00,
-    0x05,
-    0xD0,
-    0x00,
-    0x00,
-    0x32,
-    0x85,
-    0x00,
-    0x00,
-    0x24,
-    0xB1,
-    0x00,
-    0x00,
-    0x02,
-    0xD0,
-    0x00,
-    0x00,
-    0x34,
-    0x85,
-    0x00,
-    0x00,
-    0x35,
-    0x85,
-    0x00,
-    0x00,
-    0x37,
-    0x8C,
-    0x00,
-    0x00,
-    0x38,
-    0x9C,
-    0x00,
-    0x00,
-    0x01,
-    0xB1,
-    0x00,
-    0x00,
-    0x07,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x37,
-    0xAC,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x3F,
-    0xBD,
-    0x00,
-    0x00,
-    0x00,
-    0xB5,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x87,
-    0xD9,
-    0x00,
-    0x00,
-    0x12,
-    0x85,
-    0x00,
-    0x00,
-    0x1D,
-    0x81,
-    0x00,
-    0x00,
-    0x32,
-    0x81,
-    0x00,
-    0x00,
-    0x87,
-    0x4F,
-    0x00,
-    0x00,
-    0x04,
-    0xBC,
-    0x00,
-    0x00,
-    0x87,
-    0x0D,
-    0x00,
-    0x00,
-    0x14,
-    0x8D,
-    0x00,
-    0x00,
-    0x2C,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x88,
-    0xD9,
-    0x00,
-    0x00,
-    0x32,
-    0x81,
-    0x00,
-    0x00,
-    0x25,
-    0xB1,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0x25,
-    0x91,
-    0x00,
-    0x00,
-    0x34,
-    0xB1,
-    0x00,
-    0x00,
-    0x82,
-    0xD0,
-    0x00,
-    0x00,
-    0x34,
-    0x81,
-    0x00,
-    0x00,
-    0x35,
-    0x81,
-    0x00,
-    0x00,
-    0x02,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x8D,
-    0xB2,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x8E,
-    0x82,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x13,
-    0xCC,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x00,
-    0xB6,
-    0x00,
-    0x00,
-    0x08,
-    0x95,
-    0x00,
-    0x00,
-    0x01,
-    0xB6,
-    0x00,
-    0x00,
-    0x09,
-    0x95,
-    0x00,
-    0x00,
-    0x02,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x03,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x12,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x94,
-    0x00,
-    0x00,
-    0x15,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x95,
-    0x00,
-    0x00,
-    0x00,
-    0x34,
-    0x00,
-    0x00,
-    0x1E,
-    0x95,
-    0x00,
-    0x00,
-    0x16,
-    0x7C,
-    0x00,
-    0x00,
-    0xB2,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x04,
-    0xB6,
-    0x00,
-    0x00,
-    0x08,
-    0x95,
-    0x00,
-    0x00,
-    0x05,
-    0xB6,
-    0x00,
-    0x00,
-    0x09,
-    0x95,
-    0x00,
-    0x00,
-    0x06,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x07,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x14,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x94,
-    0x00,
-    0x00,
-    0x17,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x95,
-    0x00,
-    0x00,
-    0x01,
-    0x34,
-    0x00,
-    0x00,
-    0x1E,
-    0x95,
-    0x00,
-    0x00,
-    0x16,
-    0x7C,
-    0x00,
-    0x00,
-    0xB2,
-    0x3F,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x02,
-    0x34,
-    0x00,
-    0x00,
-    0x1C,
-    0x95,
-    0x00,
-    0x00,
-    0x88,
-    0xC0,
-    0x00,
-    0x00,
-    0x22,
-    0xAD,
-    0x00,
-    0x00,
-    0x23,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x55,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x83,
-    0xD4,
-    0x00,
-    0x00,
-    0x02,
-    0x38,
-    0x00,
-    0x00,
-    0x1C,
-    0x99,
-    0x00,
-    0x00,
-    0x80,
-    0xC0,
-    0x00,
-    0x00,
-    0x1D,
-    0xB8,
-    0x00,
-    0x00,
-    0x13,
-    0x74,
-    0x00,
-    0x00,
-    0x99,
-    0x36,
-    0x00,
-    0x00,
-    0x82,
-    0xD8,
-    0x00,
-    0x00,
-    0x18,
-    0x74,
-    0x00,
-    0x00,
-    0x84,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0xF6,
-    0x00,
-    0x00,
-    0x38,
-    0xB0,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x0B,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x09,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x37,
-    0xAC,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x3F,
-    0xB5,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x0A,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x08,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x8D,
-    0xD9,
-    0x00,
-    0x00,
-    0x1E,
-    0xB1,
-    0x00,
-    0x00,
-    0x02,
-    0xD0,
-    0x00,
-    0x00,
-    0x22,
-    0x85,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0x23,
-    0x85,
-    0x00,
-    0x00,
-    0x1C,
-    0x91,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x31,
-    0x81,
-    0x00,
-    0x00,
-    0x1A,
-    0x85,
-    0x00,
-    0x00,
-    0x85,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0xB4,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x15,
-    0x91,
-    0x00,
-    0x00,
-    0x2B,
-    0xB0,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x85,
-    0xD9,
-    0x00,
-    0x00,
-    0x25,
-    0xA4,
-    0x00,
-    0x00,
-    0x2C,
-    0x84,
-    0x00,
-    0x00,
-    0x1E,
-    0xB5,
-    0x00,
-    0x00,
-    0x2A,
-    0x94,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x2A,
-    0xB1,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x8F,
-    0xD9,
-    0x00,
-    0x00,
-    0x31,
-    0x81,
-    0x00,
-    0x00,
-    0x24,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x24,
-    0x95,
-    0x00,
-    0x00,
-    0x25,
-    0xB4,
-    0x00,
-    0x00,
-    0x87,
-    0xD4,
-    0x00,
-    0x00,
-    0x02,
-    0x64,
-    0x00,
-    0x00,
-    0xA0,
-    0x24,
-    0x00,
-    0x00,
-    0x87,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x03,
-    0xD4,
-    0x00,
-    0x00,
-    0x34,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0xD4,
-    0x00,
-    0x00,
-    0x35,
-    0x81,
-    0x00,
-    0x00,
-    0x34,
-    0x81,
-    0x00,
-    0x00,
-    0x2B,
-    0xB5,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x84,
-    0x11,
-    0x00,
-    0x00,
-    0x05,
-    0xDA,
-    0x00,
-    0x00,
-    0x24,
-    0xB5,
-    0x00,
-    0x00,
-    0xFF,
-    0x36,
-    0x00,
-    0x00,
-    0x24,
-    0x95,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x31,
-    0x85,
-    0x00,
-    0x00,
-    0x02,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x8D,
-    0xB2,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x8E,
-    0x82,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xB0,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x01,
-    0x1B,
-    0x00,
-    0x00,
-    0x04,
-    0x1B,
-    0x00,
-    0x00,
-    0x2F,
-    0xB4,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x2E,
-    0xAD,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x83,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x33,
-    0x81,
-    0x00,
-    0x00,
-    0x1F,
-    0xAD,
-    0x00,
-    0x00,
-    0x20,
-    0xB5,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xB0,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x04,
-    0x1B,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x00,
-    0x00,
-    0x16,
-    0x81,
-    0x00,
-    0x00,
-    0x17,
-    0x81,
-    0x00,
-    0x00,
-    0x18,
-    0x81,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x01,
-    0x84,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x16,
-    0x85,
-    0x00,
-    0x00,
-    0x02,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x21,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x18,
-    0x85,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x0F,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0D,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x11,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x02,
-    0xBC,
-    0x00,
-    0x00,
-    0x01,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x2C,
-    0x00,
-    0x00,
-    0x03,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0C,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x10,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x02,
-    0xBC,
-    0x00,
-    0x00,
-    0x01,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x2C,
-    0x00,
-    0x00,
-    0x02,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x1A,
-    0xB6,
-    0x00,
-    0x00,
-    0x39,
-    0xBD,
-    0x00,
-    0x00,
-    0x15,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x7E,
-    0x00,
-    0x00,
-    0x87,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x81,
-    0xD3,
-    0x00,
-    0x00,
-    0x8A,
-    0xC0,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x06,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x3A,
-    0x95,
-    0x00,
-    0x00,
-    0x1A,
-    0xB1,
-    0x00,
-    0x00,
-    0x39,
-    0x91,
-    0x00,
-    0x00,
-    0x86,
-    0xC0,
-    0x00,
-    0x00,
-    0x39,
-    0x81,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x17,
-    0x85,
-    0x00,
-    0x00,
-    0x02,
-    0xBC,
-    0x00,
-    0x00,
-    0x1C,
-    0xDC,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x1B,
-    0xB6,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x37,
-    0xBD,
-    0x00,
-    0x00,
-    0x15,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x7E,
-    0x00,
-    0x00,
-    0x87,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0xDE,
-    0x00,
-    0x00,
-    0x8A,
-    0xC0,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x06,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x38,
-    0x95,
-    0x00,
-    0x00,
-    0x1A,
-    0xB1,
-    0x00,
-    0x00,
-    0x37,
-    0x91,
-    0x00,
-    0x00,
-    0x86,
-    0xC0,
-    0x00,
-    0x00,
-    0x37,
-    0x81,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x19,
-    0x85,
-    0x00,
-    0x00,
-    0xAF,
-    0xC0,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x0F,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x19,
-    0xB6,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x18,
-    0x85,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x1B,
-    0xB6,
-    0x00,
-    0x00,
-    0x37,
-    0xBD,
-    0x00,
-    0x00,
-    0x15,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x7E,
-    0x00,
-    0x00,
-    0x87,
-    0x52,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x01,
-    0xDE,
-    0x00,
-    0x00,
-    0x8A,
-    0xC0,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x06,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x38,
-    0x95,
-    0x00,
-    0x00,
-    0x1A,
-    0xAD,
-    0x00,
-    0x00,
-    0x37,
-    0x8D,
-    0x00,
-    0x00,
-    0x86,
-    0xC0,
-    0x00,
-    0x00,
-    0x37,
-    0x81,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x19,
-    0x85,
-    0x00,
-    0x00,
-    0x2F,
-    0xB0,
-    0x00,
-    0x00,
-    0x01,
-    0x32,
-    0x00,
-    0x00,
-    0x2E,
-    0xB4,
-    0x00,
-    0x00,
-    0x14,
-    0x90,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x16,
-    0xAC,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x17,
-    0xB4,
-    0x00,
-    0x00,
-    0x03,
-    0xD6,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0F,
-    0x85,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x03,
-    0xB0,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x04,
-    0x1B,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0F,
-    0x81,
-    0x00,
-    0x00,
-    0x0E,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0xDA,
-    0x00,
-    0x00,
-    0x10,
-    0xBC,
-    0x00,
-    0x00,
-    0x01,
-    0xDC,
-    0x00,
-    0x00,
-    0x0F,
-    0x85,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x0D,
-    0xBD,
-    0x00,
-    0x00,
-    0x11,
-    0x81,
-    0x00,
-    0x00,
-    0x10,
-    0xB5,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0xDC,
-    0x00,
-    0x00,
-    0x24,
-    0xBC,
-    0x00,
-    0x00,
-    0x02,
-    0xDC,
-    0x00,
-    0x00,
-    0x81,
-    0xDA,
-    0x00,
-    0x00,
-    0x11,
-    0x85,
-    0x00,
-    0x00,
-    0x17,
-    0xB8,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x37,
-    0xB5,
-    0x00,
-    0x00,
-    0x84,
-    0xD4,
-    0x00,
-    0x00,
-    0x38,
-    0xB5,
-    0x00,
-    0x00,
-    0x02,
-    0xD7,
-    0x00,
-    0x00,
-    0x19,
-    0x85,
-    0x00,
-    0x00,
-    0x37,
-    0x81,
-    0x00,
-    0x00,
-    0x39,
-    0xB5,
-    0x00,
-    0x00,
-    0x84,
-    0xD4,
-    0x00,
-    0x00,
-    0x3A,
-    0xB5,
-    0x00,
-    0x00,
-    0x02,
-    0xD7,
-    0x00,
-    0x00,
-    0x17,
-    0x85,
-    0x00,
-    0x00,
-    0x39,
-    0x81,
-    0x00,
-    0x00,
-    0x1C,
-    0xB0,
-    0x00,
-    0x00,
-    0x15,
-    0xD0,
-    0x00,
-    0x00,
-    0x2D,
-    0xAD,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x04,
-    0xCF,
-    0x00,
-    0x00,
-    0x25,
-    0x81,
-    0x00,
-    0x00,
-    0x32,
-    0x85,
-    0x00,
-    0x00,
-    0x34,
-    0x85,
-    0x00,
-    0x00,
-    0x35,
-    0x85,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x10,
-    0x29,
-    0x00,
-    0x00,
-    0x09,
-    0x81,
-    0x00,
-    0x00,
-    0x07,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0x3E,
-    0x00,
-    0x00,
-    0x01,
-    0xDC,
-    0x00,
-    0x00,
-    0x82,
-    0xC0,
-    0x00,
-    0x00,
-    0x01,
-    0xD7,
-    0x00,
-    0x00,
-    0x09,
-    0x85,
-    0x00,
-    0x00,
-    0x0A,
-    0x81,
-    0x00,
-    0x00,
-    0x08,
-    0xB5,
-    0x00,
-    0x00,
-    0x1C,
-    0xD7,
-    0x00,
-    0x00,
-    0x0A,
-    0x85,
-    0x00,
-    0x00,
-    0x9A,
-    0xC0,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x10,
-    0x29,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x02,
-    0x81,
-    0x00,
-    0x00,
-    0x00,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0x3E,
-    0x00,
-    0x00,
-    0x01,
-    0xDC,
-    0x00,
-    0x00,
-    0x82,
-    0xC0,
-    0x00,
-    0x00,
-    0x01,
-    0xD7,
-    0x00,
-    0x00,
-    0x02,
-    0x85,
-    0x00,
-    0x00,
-    0x03,
-    0x81,
-    0x00,
-    0x00,
-    0x01,
-    0xB5,
-    0x00,
-    0x00,
-    0x01,
-    0xD7,
-    0x00,
-    0x00,
-    0x03,
-    0x85,
-    0x00,
-    0x00,
-    0x04,
-    0xAD,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x06,
-    0x85,
-    0x00,
-    0x00,
-    0x05,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x81,
-    0xD9,
-    0x00,
-    0x00,
-    0x06,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x1E,
-    0xAD,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0x13,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x95,
-    0xAE,
-    0x00,
-    0x00,
-    0xA5,
-    0xB2,
-    0x00,
-    0x00,
-    0x84,
-    0x4D,
-    0x00,
-    0x00,
-    0xA3,
-    0xB2,
-    0x00,
-    0x00,
-    0xA4,
-    0xBA,
-    0x00,
-    0x00,
-    0x04,
-    0x53,
-    0x00,
-    0x00,
-    0x97,
-    0x92,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x84,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x05,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x33,
-    0xBA,
-    0x00,
-    0x00,
-    0x86,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0xA2,
-    0x8E,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x34,
-    0xB5,
-    0x00,
-    0x00,
-    0x33,
-    0xB1,
-    0x00,
-    0x00,
-    0x05,
-    0x4E,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x04,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x15,
-    0xBF,
-    0x00,
-    0x00,
-    0x87,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x25,
-    0xBF,
-    0x00,
-    0x00,
-    0x87,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x23,
-    0xBF,
-    0x00,
-    0x00,
-    0x87,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x24,
-    0xBF,
-    0x00,
-    0x00,
-    0x87,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x06,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x8C,
-    0x8F,
-    0x00,
-    0x00,
-    0x32,
-    0xB9,
-    0x00,
-    0x00,
-    0x04,
-    0x4E,
-    0x00,
-    0x00,
-    0x85,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x91,
-    0x8F,
-    0x00,
-    0x00,
-    0x06,
-    0x4F,
-    0x00,
-    0x00,
-    0x84,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x8D,
-    0x8F,
-    0x00,
-    0x00,
-    0x35,
-    0xAD,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x86,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x8F,
-    0x8F,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x31,
-    0xAD,
-    0x00,
-    0x00,
-    0x86,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x59,
-    0x00,
-    0x00,
-    0x86,
-    0x5A,
-    0x00,
-    0x00,
-    0x06,
-    0x57,
-    0x00,
-    0x00,
-    0x04,
-    0x4E,
-    0x00,
-    0x00,
-    0x85,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x90,
-    0x8F,
-    0x00,
-    0x00,
-    0x84,
-    0x4E,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x8E,
-    0x8F,
-    0x00,
-    0x00,
-    0x04,
-    0x7C,
-    0x00,
-    0x00,
-    0xA0,
-    0x3F,
-    0x00,
-    0x00,
-    0x9F,
-    0xAF,
-    0x00,
-    0x00,
-    0xA0,
-    0xB3,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x04,
-    0x52,
-    0x00,
-    0x00,
-    0x84,
-    0x4D,
-    0x00,
-    0x00,
-    0xA1,
-    0x8F,
-    0x00,
-    0x00,
-    0x03,
-    0x7C,
-    0x00,
-    0x00,
-    0x82,
-    0x3F,
-    0x00,
-    0x00,
-    0x81,
-    0xFF,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x04,
-    0xB6,
-    0x00,
-    0x00,
-    0x08,
-    0x95,
-    0x00,
-    0x00,
-    0x05,
-    0xB6,
-    0x00,
-    0x00,
-    0x09,
-    0x95,
-    0x00,
-    0x00,
-    0x06,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x07,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x14,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x94,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x0F,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0D,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x11,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x03,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0B,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x09,
-    0xB1,
-    0x00,
-    0x00,
-    0x80,
-    0x35,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x0E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0C,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x10,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x02,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x0A,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x1A,
-    0x00,
-    0x00,
-    0x3D,
-    0x95,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x3E,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x18,
-    0xB6,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x2B,
-    0xB0,
-    0x00,
-    0x00,
-    0x14,
-    0x90,
-    0x00,
-    0x00,
-    0x2A,
-    0xAD,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x2A,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x0E,
-    0x00,
-    0x00,
-    0x08,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x07,
-    0xB9,
-    0x00,
-    0x00,
-    0x0F,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x0D,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x11,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x01,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x3D,
-    0x99,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0xB9,
-    0x00,
-    0x00,
-    0x0E,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x0C,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x10,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x2C,
-    0xB1,
-    0x00,
-    0x00,
-    0x06,
-    0x1A,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x98,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x01,
-    0xD0,
-    0x00,
-    0x00,
-    0x06,
-    0x0C,
-    0x00,
-    0x00,
-    0x02,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x0D,
-    0xB3,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x82,
-    0xC0,
-    0x00,
-    0x00,
-    0x80,
-    0x2E,
-    0x00,
-    0x00,
-    0x80,
-    0xC0,
-    0x00,
-    0x00,
-    0x1F,
-    0x8D,
-    0x00,
-    0x00,
-    0x20,
-    0x95,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x05,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x02,
-    0xB6,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x06,
-    0xB6,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x8B,
-    0xD4,
-    0x00,
-    0x00,
-    0x00,
-    0xB6,
-    0x00,
-    0x00,
-    0x08,
-    0x95,
-    0x00,
-    0x00,
-    0x01,
-    0xB6,
-    0x00,
-    0x00,
-    0x09,
-    0x95,
-    0x00,
-    0x00,
-    0x02,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x03,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x12,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x94,
-    0x00,
-    0x00,
-    0x0A,
-    0xC4,
-    0x00,
-    0x00,
-    0x04,
-    0xB6,
-    0x00,
-    0x00,
-    0x08,
-    0x95,
-    0x00,
-    0x00,
-    0x05,
-    0xB6,
-    0x00,
-    0x00,
-    0x09,
-    0x95,
-    0x00,
-    0x00,
-    0x06,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x07,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x14,
-    0xB6,
-    0x00,
-    0x00,
-    0x2B,
-    0x94,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x0B,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x09,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x0A,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x08,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x2B,
-    0xB0,
-    0x00,
-    0x00,
-    0x14,
-    0x90,
-    0x00,
-    0x00,
-    0x2A,
-    0xB5,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x2A,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x2C,
-    0xB5,
-    0x00,
-    0x00,
-    0x05,
-    0x12,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x90,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x04,
-    0x0C,
-    0x00,
-    0x00,
-    0x02,
-    0x78,
-    0x00,
-    0x00,
-    0x20,
-    0x3B,
-    0x00,
-    0x00,
-    0x0D,
-    0xB3,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x1F,
-    0x8D,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x02,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x03,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x19,
-    0xB6,
-    0x00,
-    0x00,
-    0x36,
-    0x95,
-    0x00,
-    0x00,
-    0x20,
-    0x78,
-    0x00,
-    0x00,
-    0x3B,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x21,
-    0x95,
-    0x00,
-    0x00,
-    0x06,
-    0x70,
-    0x00,
-    0x00,
-    0x20,
-    0x32,
-    0x00,
-    0x00,
-    0x06,
-    0xB6,
-    0x00,
-    0x00,
-    0x0A,
-    0x95,
-    0x00,
-    0x00,
-    0x07,
-    0xB6,
-    0x00,
-    0x00,
-    0x0B,
-    0x95,
-    0x00,
-    0x00,
-    0x18,
-    0xB6,
-    0x00,
-    0x00,
-    0x36,
-    0x95,
-    0x00,
-    0x00,
-    0x20,
-    0x78,
-    0x00,
-    0x00,
-    0x3B,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x20,
-    0x95,
-    0x00,
-    0x00,
-    0x21,
-    0xB1,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x15,
-    0x90,
-    0x00,
-    0x00,
-    0x16,
-    0xB8,
-    0x00,
-    0x00,
-    0x1F,
-    0xAD,
-    0x00,
-    0x00,
-    0x12,
-    0xD8,
-    0x00,
-    0x00,
-    0x00,
-    0x16,
-    0x00,
-    0x00,
-    0x10,
-    0xC4,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x0B,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0x85,
-    0x00,
-    0x00,
-    0x3C,
-    0x81,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x0A,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x3E,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x0E,
-    0x00,
-    0x00,
-    0x36,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x14,
-    0x94,
-    0x00,
-    0x00,
-    0x15,
-    0x8C,
-    0x00,
-    0x00,
-    0x16,
-    0xB8,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x82,
-    0xC0,
-    0x00,
-    0x00,
-    0x80,
-    0x2E,
-    0x00,
-    0x00,
-    0x80,
-    0xC0,
-    0x00,
-    0x00,
-    0x1F,
-    0x8D,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x01,
-    0x68,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x11,
-    0xAD,
-    0x00,
-    0x00,
-    0x12,
-    0x8D,
-    0x00,
-    0x00,
-    0x09,
-    0xAD,
-    0x00,
-    0x00,
-    0x13,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x0A,
-    0x8D,
-    0x00,
-    0x00,
-    0x01,
-    0xAD,
-    0x00,
-    0x00,
-    0x16,
-    0xB5,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x02,
-    0x8D,
-    0x00,
-    0x00,
-    0x0B,
-    0xAD,
-    0x00,
-    0x00,
-    0x13,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x14,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x0C,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x16,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x17,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x04,
-    0x8D,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x01,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x37,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x10,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0x00,
-    0x10,
-    0x00,
-    0x00,
-    0x04,
-    0x11,
-    0x00,
-    0x00,
-    0x01,
-    0xAE,
-    0x00,
-    0x00,
-    0x07,
-    0xCC,
-    0x00,
-    0x00,
-    0x3E,
-    0xAD,
-    0x00,
-    0x00,
-    0x3F,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0xAD,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x1B,
-    0xAC,
-    0x00,
-    0x00,
-    0x08,
-    0xCC,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x3E,
-    0xAD,
-    0x00,
-    0x00,
-    0x3D,
-    0x8D,
-    0x00,
-    0x00,
-    0x3C,
-    0xAD,
-    0x00,
-    0x00,
-    0x3F,
-    0x8D,
-    0x00,
-    0x00,
-    0x1B,
-    0xAC,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x37,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x11,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x37,
-    0x8D,
-    0x00,
-    0x00,
-    0x00,
-    0xAD,
-    0x00,
-    0x00,
-    0x01,
-    0x8E,
-    0x00,
-    0x00,
-    0x09,
-    0xCC,
-    0x00,
-    0x00,
-    0x27,
-    0xAD,
-    0x00,
-    0x00,
-    0x28,
-    0x8E,
-    0x00,
-    0x00,
-    0x2A,
-    0xAD,
-    0x00,
-    0x00,
-    0x2B,
-    0x8E,
-    0x00,
-    0x00,
-    0x15,
-    0xAD,
-    0x00,
-    0x00,
-    0x16,
-    0x8E,
-    0x00,
-    0x00,
-    0x18,
-    0xAD,
-    0x00,
-    0x00,
-    0x19,
-    0x8E,
-    0x00,
-    0x00,
-    0x88,
-    0xC0,
-    0x00,
-    0x00,
-    0x27,
-    0xAD,
-    0x00,
-    0x00,
-    0x2B,
-    0x8E,
-    0x00,
-    0x00,
-    0x2A,
-    0xAD,
-    0x00,
-    0x00,
-    0x28,
-    0x8E,
-    0x00,
-    0x00,
-    0x15,
-    0xAD,
-    0x00,
-    0x00,
-    0x19,
-    0x8E,
-    0x00,
-    0x00,
-    0x18,
-    0xAD,
-    0x00,
-    0x00,
-    0x16,
-    0x8E,
-    0x00,
-    0x00,
-    0x09,
-    0xAD,
-    0x00,
-    0x00,
-    0x0A,
-    0x8E,
-    0x00,
-    0x00,
-    0x0C,
-    0xAD,
-    0x00,
-    0x00,
-    0x0D,
-    0x8E,
-    0x00,
-    0x00,
-    0x0F,
-    0xAD,
-    0x00,
-    0x00,
-    0x10,
-    0x8E,
-    0x00,
-    0x00,
-    0x12,
-    0xAD,
-    0x00,
-    0x00,
-    0x13,
-    0x8E,
-    0x00,
-    0x00,
-    0x21,
-    0xAD,
-    0x00,
-    0x00,
-    0x22,
-    0x8E,
-    0x00,
-    0x00,
-    0x24,
-    0xAD,
-    0x00,
-    0x00,
-    0x25,
-    0x8E,
-    0x00,
-    0x00,
-    0x1B,
-    0xAD,
-    0x00,
-    0x00,
-    0x2D,
-    0xB5,
-    0x00,
-    0x00,
-    0x2E,
-    0x96,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x1C,
-    0x8E,
-    0x00,
-    0x00,
-    0x03,
-    0xAD,
-    0x00,
-    0x00,
-    0x31,
-    0xB5,
-    0x00,
-    0x00,
-    0x32,
-    0x96,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x04,
-    0x8E,
-    0x00,
-    0x00,
-    0x1E,
-    0xAD,
-    0x00,
-    0x00,
-    0x2D,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x30,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x1F,
-    0x8E,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x31,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x34,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0x0E,
-    0x00,
-    0x00,
-    0x07,
-    0x8E,
-    0x00,
-    0x00,
-    0x24,
-    0x74,
-    0x00,
-    0x00,
-    0xA4,
-    0x36,
-    0x00,
-    0x00,
-    0x80,
-    0xF6,
-    0x00,
-    0x00,
-    0x01,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x37,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0x11,
-    0x00,
-    0x00,
-    0x3A,
-    0xB5,
-    0x00,
-    0x00,
-    0x39,
-    0x95,
-    0x00,
-    0x00,
-    0x3A,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x94,
-    0x82,
-    0x00,
-    0x00,
-    0x1B,
-    0xB4,
-    0x00,
-    0x00,
-    0xF1,
-    0xD4,
-    0x00,
-    0x00,
-    0x1C,
-    0xB4,
-    0x00,
-    0x00,
-    0xEF,
-    0xD4,
-    0x00,
-    0x00,
-    0x01,
-    0xB6,
-    0x00,
-    0x00,
-    0x15,
-    0xAD,
-    0x00,
-    0x00,
-    0x02,
-    0xD4,
-    0x00,
-    0x00,
-    0x19,
-    0xB6,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0x16,
-    0xB6,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x65,
-    0xD4,
-    0x00,
-    0x00,
-    0x01,
-    0xB6,
-    0x00,
-    0x00,
-    0x18,
-    0xAD,
-    0x00,
-    0x00,
-    0x02,
-    0xD4,
-    0x00,
-    0x00,
-    0x16,
-    0xB6,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0x19,
-    0xB6,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0xDB,
-    0xD4,
-    0x00,
-    0x00,
-    0x01,
-    0xAE,
-    0x00,
-    0x00,
-    0x08,
-    0xCC,
-    0x00,
-    0x00,
-    0x00,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x15,
-    0xAD,
-    0x00,
-    0x00,
-    0x16,
-    0xB6,
-    0x00,
-    0x00,
-    0x8B,
-    0xC0,
-    0x00,
-    0x00,
-    0x18,
-    0xAD,
-    0x00,
-    0x00,
-    0x16,
-    0xB6,
-    0x00,
-    0x00,
-    0x88,
-    0xC0,
-    0x00,
-    0x00,
-    0x00,
-    0xAD,
-    0x00,
-    0x00,
-    0x03,
-    0xCC,
-    0x00,
-    0x00,
-    0x16,
-    0xAE,
-    0x00,
-    0x00,
-    0x15,
-    0xB5,
-    0x00,
-    0x00,
-    0x83,
-    0xC0,
-    0x00,
-    0x00,
-    0x16,
-    0xAE,
-    0x00,
-    0x00,
-    0x18,
-    0xB5,
-    0x00,
-    0x00,
-    0x80,
-    0xC0,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB8,
-    0x00,
-    0x00,
-    0xC5,
-    0xD8,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x03,
-    0xB4,
-    0x00,
-    0x00,
-    0x19,
-    0xB8,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x01,
-    0x3B,
-    0x00,
-    0x00,
-    0x05,
-    0x1B,
-    0x00,
-    0x00,
-    0x7E,
-    0x3B,
-    0x00,
-    0x00,
-    0x1A,
-    0xB4,
-    0x00,
-    0x00,
-    0x01,
-    0xD4,
-    0x00,
-    0x00,
-    0x88,
-    0xC0,
-    0x00,
-    0x00,
-    0x30,
-    0xB4,
-    0x00,
-    0x00,
-    0x14,
-    0x98,
-    0x00,
-    0x00,
-    0x15,
-    0x94,
-    0x00,
-    0x00,
-    0x16,
-    0xB0,
-    0x00,
-    0x00,
-    0x87,
-    0xD0,
-    0x00,
-    0x00,
-    0x85,
-    0x56,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x05,
-    0x1B,
-    0x00,
-    0x00,
-    0x14,
-    0x8C,
-    0x00,
-    0x00,
-    0x15,
-    0x98,
-    0x00,
-    0x00,
-    0x16,
-    0xB4,
-    0x00,
-    0x00,
-    0x8A,
-    0xD4,
-    0x00,
-    0x00,
-    0x3A,
-    0xB5,
-    0x00,
-    0x00,
-    0x81,
-    0x36,
-    0x00,
-    0x00,
-    0x3A,
-    0x95,
-    0x00,
-    0x00,
-    0x38,
-    0xB5,
-    0x00,
-    0x00,
-    0x02,
-    0xD4,
-    0x00,
-    0x00,
-    0x39,
-    0x85,
-    0x00,
-    0x00,
-    0x83,
-    0xC0,
-    0x00,
-    0x00,
-    0x04,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0x94,
-    0x86,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x18,
-    0xB8,
-    0x00,
-    0x00,
-    0x10,
-    0xAD,
-    0x00,
-    0x00,
-    0x02,
-    0x30,
-    0x00,
-    0x00,
-    0x84,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x17,
-    0xCE,
-    0x00,
-    0x00,
-    0x92,
-    0xAE,
-    0x00,
-    0x00,
-    0x07,
-    0xCF,
-    0x00,
-    0x00,
-    0x00,
-    0x30,
-    0x00,
-    0x00,
-    0x11,
-    0x85,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x12,
-    0x85,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x17,
-    0x85,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x05,
-    0xCF,
-    0x00,
-    0x00,
-    0x00,
-    0x30,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x17,
-    0x85,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x05,
-    0xCF,
-    0x00,
-    0x00,
-    0x00,
-    0x30,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x17,
-    0x85,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x03,
-    0xB1,
-    0x00,
-    0x00,
-    0x10,
-    0xAD,
-    0x00,
-    0x00,
-    0x81,
-    0x4D,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x9F,
-    0xCC,
-    0x00,
-    0x00,
-    0x92,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x2D,
-    0x00,
-    0x00,
-    0x0D,
-    0xCF,
-    0x00,
-    0x00,
-    0x1F,
-    0x70,
-    0x00,
-    0x00,
-    0x2F,
-    0x32,
-    0x00,
-    0x00,
-    0x80,
-    0xA6,
-    0x00,
-    0x00,
-    0x02,
-    0xC4,
-    0x00,
-    0x00,
-    0x1F,
-    0x70,
-    0x00,
-    0x00,
-    0x2D,
-    0x32,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x11,
-    0x85,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x14,
-    0x85,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x16,
-    0x85,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x0D,
-    0xCF,
-    0x00,
-    0x00,
-    0x1F,
-    0x70,
-    0x00,
-    0x00,
-    0x2D,
-    0x32,
-    0x00,
-    0x00,
-    0x80,
-    0xA6,
-    0x00,
-    0x00,
-    0x02,
-    0xC4,
-    0x00,
-    0x00,
-    0x1F,
-    0x70,
-    0x00,
-    0x00,
-    0x2F,
-    0x32,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x11,
-    0x85,
-    0x00,
-    0x00,
-    0x13,
-    0x85,
-    0x00,
-    0x00,
-    0x14,
-    0x85,
-    0x00,
-    0x00,
-    0x15,
-    0x85,
-    0x00,
-    0x00,
-    0x16,
-    0x85,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x00,
-    0x6C,
-    0x00,
-    0x00,
-    0x80,
-    0x2D,
-    0x00,
-    0x00,
-    0x02,
-    0x8D,
-    0x00,
-    0x00,
-    0x05,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0x81,
-    0x00,
-    0x00,
-    0x9C,
-    0xBA,
-    0x00,
-    0x00,
-    0x9D,
-    0x9A,
-    0x00,
-    0x00,
-    0x03,
-    0xB1,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x24,
-    0x78,
-    0x00,
-    0x00,
-    0x28,
-    0x3B,
-    0x00,
-    0x00,
-    0x00,
-    0xFB,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0xF0,
-    0xCC,
-    0x00,
-    0x00,
-    0x02,
-    0xAD,
-    0x00,
-    0x00,
-    0x22,
-    0xCC,
-    0x00,
-    0x00,
-    0x8A,
-    0xAE,
-    0x00,
-    0x00,
-    0x6C,
-    0xCF,
-    0x00,
-    0x00,
-    0x80,
-    0xAE,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x8F,
-    0xB1,
-    0x00,
-    0x00,
-    0x93,
-    0xAE,
-    0x00,
-    0x00,
-    0x0A,
-    0xCC,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x93,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x08,
-    0x8D,
-    0x00,
-    0x00,
-    0x02,
-    0x85,
-    0x00,
-    0x00,
-    0x05,
-    0x85,
-    0x00,
-    0x00,
-    0x0E,
-    0x85,
-    0x00,
-    0x00,
-    0x06,
-    0x81,
-    0x00,
-    0x00,
-    0x01,
-    0x34,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x80,
-    0xBA,
-    0x00,
-    0x00,
-    0x8D,
-    0xA6,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0xED,
-    0xC0,
-    0x00,
-    0x00,
-    0x8E,
-    0xA6,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x71,
-    0xCC,
-    0x00,
-    0x00,
-    0xE5,
-    0xC0,
-    0x00,
-    0x00,
-    0x95,
-    0xCC,
-    0x00,
-    0x00,
-    0x8A,
-    0xAE,
-    0x00,
-    0x00,
-    0x8C,
-    0xB2,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x03,
-    0xCF,
-    0x00,
-    0x00,
-    0x02,
-    0x2C,
-    0x00,
-    0x00,
-    0x02,
-    0x8D,
-    0x00,
-    0x00,
-    0x90,
-    0xC0,
-    0x00,
-    0x00,
-    0x08,
-    0xB9,
-    0x00,
-    0x00,
-    0x80,
-    0xB2,
-    0x00,
-    0x00,
-    0x8E,
-    0xAE,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x8D,
-    0xAE,
-    0x00,
-    0x00,
-    0x82,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x08,
-    0x99,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x02,
-    0x30,
-    0x00,
-    0x00,
-    0x33,
-    0xCE,
-    0x00,
-    0x00,
-    0x82,
-    0xAE,
-    0x00,
-    0x00,
-    0x18,
-    0xCF,
-    0x00,
-    0x00,
-    0x80,
-    0xAE,
-    0x00,
-    0x00,
-    0x85,
-    0x0D,
-    0x00,
-    0x00,
-    0x87,
-    0xB1,
-    0x00,
-    0x00,
-    0x11,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x96,
-    0xAE,
-    0x00,
-    0x00,
-    0x12,
-    0xCC,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x02,
-    0x68,
-    0x00,
-    0x00,
-    0x20,
-    0x29,
-    0x00,
-    0x00,
-    0x03,
-    0x2C,
-    0x00,
-    0x00,
-    0x02,
-    0x8D,
-    0x00,
-    0x00,
-    0x96,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x08,
-    0x8D,
-    0x00,
-    0x00,
-    0x08,
-    0xAD,
-    0x00,
-    0x00,
-    0x9B,
-    0xBA,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0x9C,
-    0xBA,
-    0x00,
-    0x00,
-    0x9D,
-    0x9A,
-    0x00,
-    0x00,
-    0x05,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0x85,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0xA5,
-    0xC0,
-    0x00,
-    0x00,
-    0x80,
-    0xBA,
-    0x00,
-    0x00,
-    0x85,
-    0xA6,
-    0x00,
-    0x00,
-    0x9B,
-    0xAA,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0xE4,
-    0xC0,
-    0x00,
-    0x00,
-    0x7F,
-    0x29,
-    0x00,
-    0x00,
-    0x7A,
-    0xC8,
-    0x00,
-    0x00,
-    0x86,
-    0xA6,
-    0x00,
-    0x00,
-    0x9C,
-    0xAA,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0xD9,
-    0xC0,
-    0x00,
-    0x00,
-    0x7F,
-    0x29,
-    0x00,
-    0x00,
-    0x7A,
-    0xC8,
-    0x00,
-    0x00,
-    0xE9,
-    0xC0,
-    0x00,
-    0x00,
-    0x84,
-    0xB2,
-    0x00,
-    0x00,
-    0x82,
-    0xAE,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x12,
-    0xCF,
-    0x00,
-    0x00,
-    0x02,
-    0x81,
-    0x00,
-    0x00,
-    0x07,
-    0x81,
-    0x00,
-    0x00,
-    0x05,
-    0x74,
-    0x00,
-    0x00,
-    0xA0,
-    0x36,
-    0x00,
-    0x00,
-    0xAF,
-    0xAE,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0xB3,
-    0x86,
-    0x00,
-    0x00,
-    0x0F,
-    0x81,
-    0x00,
-    0x00,
-    0xB0,
-    0x8E,
-    0x00,
-    0x00,
-    0x05,
-    0x81,
-    0x00,
-    0x00,
-    0x06,
-    0x81,
-    0x00,
-    0x00,
-    0x03,
-    0xB1,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x83,
-    0xCC,
-    0x00,
-    0x00,
-    0x24,
-    0x6C,
-    0x00,
-    0x00,
-    0xA8,
-    0x2D,
-    0x00,
-    0x00,
-    0x80,
-    0xED,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x08,
-    0xB9,
-    0x00,
-    0x00,
-    0x80,
-    0xB2,
-    0x00,
-    0x00,
-    0x86,
-    0xAE,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x85,
-    0xAE,
-    0x00,
-    0x00,
-    0x82,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x9D,
-    0xAE,
-    0x00,
-    0x00,
-    0x87,
-    0xCC,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x08,
-    0x99,
-    0x00,
-    0x00,
-    0x08,
-    0xB9,
-    0x00,
-    0x00,
-    0x9B,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0xD8,
-    0x00,
-    0x00,
-    0x9C,
-    0xAE,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x9D,
-    0x8E,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x6C,
-    0x00,
-    0x00,
-    0x80,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0x8D,
-    0x00,
-    0x00,
-    0x03,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x81,
-    0x00,
-    0x00,
-    0x93,
-    0xBA,
-    0x00,
-    0x00,
-    0x0A,
-    0x99,
-    0x00,
-    0x00,
-    0x02,
-    0xB1,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x0F,
-    0x81,
-    0x00,
-    0x00,
-    0x05,
-    0xAD,
-    0x00,
-    0x00,
-    0xF3,
-    0xCC,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x0A,
-    0xAC,
-    0x00,
-    0x00,
-    0x06,
-    0x8D,
-    0x00,
-    0x00,
-    0x06,
-    0xAD,
-    0x00,
-    0x00,
-    0x83,
-    0x16,
-    0x00,
-    0x00,
-    0x01,
-    0xAD,
-    0x00,
-    0x00,
-    0x1F,
-    0xCC,
-    0x00,
-    0x00,
-    0x9C,
-    0xAE,
-    0x00,
-    0x00,
-    0x6A,
-    0xCF,
-    0x00,
-    0x00,
-    0xA8,
-    0xB2,
-    0x00,
-    0x00,
-    0xAE,
-    0xAE,
-    0x00,
-    0x00,
-    0x09,
-    0xCC,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0xAE,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x07,
-    0x8D,
-    0x00,
-    0x00,
-    0x01,
-    0x85,
-    0x00,
-    0x00,
-    0x03,
-    0x85,
-    0x00,
-    0x00,
-    0x04,
-    0x81,
-    0x00,
-    0x00,
-    0x80,
-    0x34,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x81,
-    0xBA,
-    0x00,
-    0x00,
-    0xA2,
-    0xA6,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x01,
-    0xCC,
-    0x00,
-    0x00,
-    0xEE,
-    0xC0,
-    0x00,
-    0x00,
-    0xA5,
-    0xA6,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x71,
-    0xCC,
-    0x00,
-    0x00,
-    0xE6,
-    0xC0,
-    0x00,
-    0x00,
-    0x95,
-    0xCC,
-    0x00,
-    0x00,
-    0x9C,
-    0xAE,
-    0x00,
-    0x00,
-    0x9F,
-    0xB2,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x03,
-    0xCF,
-    0x00,
-    0x00,
-    0x02,
-    0x2C,
-    0x00,
-    0x00,
-    0x01,
-    0x8D,
-    0x00,
-    0x00,
-    0x90,
-    0xC0,
-    0x00,
-    0x00,
-    0x07,
-    0xB9,
-    0x00,
-    0x00,
-    0x81,
-    0xB2,
-    0x00,
-    0x00,
-    0xA5,
-    0xAE,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0xA2,
-    0xAE,
-    0x00,
-    0x00,
-    0x82,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x07,
-    0x99,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x02,
-    0x30,
-    0x00,
-    0x00,
-    0x32,
-    0xCE,
-    0x00,
-    0x00,
-    0x84,
-    0xAE,
-    0x00,
-    0x00,
-    0x14,
-    0xCF,
-    0x00,
-    0x00,
-    0x96,
-    0xB2,
-    0x00,
-    0x00,
-    0x11,
-    0xAC,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0xB2,
-    0xAE,
-    0x00,
-    0x00,
-    0x10,
-    0xCC,
-    0x00,
-    0x00,
-    0x01,
-    0x24,
-    0x00,
-    0x00,
-    0x03,
-    0x2C,
-    0x00,
-    0x00,
-    0x01,
-    0x8D,
-    0x00,
-    0x00,
-    0xB2,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x07,
-    0x8D,
-    0x00,
-    0x00,
-    0x07,
-    0xAD,
-    0x00,
-    0x00,
-    0x8D,
-    0xBA,
-    0x00,
-    0x00,
-    0x81,
-    0xCC,
-    0x00,
-    0x00,
-    0x93,
-    0xBA,
-    0x00,
-    0x00,
-    0x0A,
-    0x99,
-    0x00,
-    0x00,
-    0x03,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x85,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0xA2,
-    0xC0,
-    0x00,
-    0x00,
-    0x81,
-    0xBA,
-    0x00,
-    0x00,
-    0x8A,
-    0xA6,
-    0x00,
-    0x00,
-    0x38,
-    0x88,
-    0x00,
-    0x00,
-    0x8D,
-    0xAA,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x38,
-    0xA8,
-    0x00,
-    0x00,
-    0xE4,
-    0xC0,
-    0x00,
-    0x00,
-    0x7F,
-    0x29,
-    0x00,
-    0x00,
-    0x79,
-    0xC8,
-    0x00,
-    0x00,
-    0x90,
-    0xA6,
-    0x00,
-    0x00,
-    0x93,
-    0xAA,
-    0x00,
-    0x00,
-    0x02,
-    0xD8,
-    0x00,
-    0x00,
-    0x81,
-    0x44,
-    0x00,
-    0x00,
-    0x81,
-    0x24,
-    0x00,
-    0x00,
-    0x01,
-    0x12,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x02,
-    0xCC,
-    0x00,
-    0x00,
-    0x38,
-    0xA8,
-    0x00,
-    0x00,
-    0xD8,
-    0xC0,
-    0x00,
-    0x00,
-    0x7F,
-    0x29,
-    0x00,
-    0x00,
-    0x79,
-    0xC8,
-    0x00,
-    0x00,
-    0xE6,
-    0xC0,
-    0x00,
-    0x00,
-    0x87,
-    0xB2,
-    0x00,
-    0x00,
-    0x84,
-    0xAE,
-    0x00,
-    0x00,
-    0x84,
-    0x0D,
-    0x00,
-    0x00,
-    0x08,
-    0xCF,
-    0x00,
-    0x00,
-    0x01,
-    0x81,
-    0x00,
-    0x00,
-    0x05,
-    0x81,
-    0x00,
-    0x00,
-    0x0F,
-    0x85,
-    0x00,
-    0x00,
-    0x03,
-    0x81,
-    0x00,
-    0x00,
-    0x04,
-    0x81,
-    0x00,
-    0x00,
-    0x02,
-    0xB1,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-    0x07,
-    0xB9,
-    0x00,
-    0x00,
-    0x81,
-    0xB2,
-    0x00,
-    0x00,
-    0x90,
-    0xAE,
-    0x00,
-    0x00,
-    0x01,
-    0xD8,
-    0x00,
-    0x00,
-    0x8A,
-    0xAE,
-    0x00,
-    0x00,
-    0x82,
-    0xD0,
-    0x00,
-    0x00,
-    0x83,
-    0x4D,
-    0x00,
-    0x00,
-    0x81,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x00,
-    0x03,
-    0x12,
-    0x00,
-    0x00,
-    0x0A,
-    0xAD,
-    0x00,
-    0x00,
-    0x87,
-    0xCC,
-    0x00,
-    0x00,
-    0x06,
-    0x5B,
-    0x00,
-    0x00,
-    0x07,
-    0x99,
-    0x00,
-    0x00,
-    0x07,
-    0xB9,
-    0x00,
-    0x00,
-    0x8D,
-    0xAE,
-    0x00,
-    0x00,
-    0x83,
-    0xD8,
-    0x00,
-    0x00,
-    0x93,
-    0xAE,
-    0x00,
-    0x00,
-    0x81,
-    0xC0,
-    0x00,
-    0x00,
-    0xFF,
-    0x2D,
-    0x00,
-    0x00,
-    0x0A,
-    0x8D,
-    0x00,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x80,
-    0xFF,
-    0x00,
-    0x00,
-]
-
-RD_RAM_SEQ_1_CONTENT_START_ADDR = 0x5000
-RD_RAM_SEQ_1_CONTENT = [
-    0xDF,
-    0x99,
-    0x00,
-    0x00,
-    0x45,
-    0x03,
-    0xD2,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x01,
-    0x00,
-    0x00,
-    0x80,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x00,
-    0x00,
-    0x80,
-    0x02,
-    0x00,
-    0x00,
-    0x01,
-    0x03,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x82,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x05,
-    0x00,
-    0x00,
-    0x82,
-    0x05,
-    0x00,
-    0x00,
-    0x0A,
-    0x05,
-    0x00,
-    0x00,
-    0x00,
-    0x06,
-    0x00,
-    0x00,
-    0x82,
-    0x06,
-    0x00,
-    0x00,
-    0x0B,
-    0x06,
-    0x00,
-    0x00,
-    0x04,
-    0x07,
-    0x00,
-    0x00,
-    0x82,
-    0x07,
-    0x00,
-    0x00,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x82,
-    0x08,
-    0x00,
-    0x00,
-    0x04,
-    0x09,
-    0x00,
-    0x00,
-    0x82,
-    0x09,
-    0x00,
-    0x00,
-    0x8A,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x0A,
-    0x00,
-    0x00,
-    0x82,
-    0x0A,
-    0x00,
-    0x00,
-    0x00,
-    0x0A,
-    0x00,
-    0x00,
-    0x80,
-    0x08,
-    0x00,
-    0x00,
-    0x02,
-    0x0B,
-    0x00,
-    0x00,
-    0x80,
-    0x08,
-    0x00,
-    0x00,
-    0x80,
-    0x08,
-    0x20,
-    0x00,
-    0x81,
-    0x08,
-    0x00,
-    0x00,
-    0x8A,
-    0x0B,
-    0x00,
-    0x00,
-    0x00,
-    0x0C,
-    0x00,
-    0x00,
-    0x82,
-    0x0C,
-    0x00,
-    0x00,
-    0x0B,
-    0x0C,
-    0x00,
-    0x00,
-    0x02,
-    0x0D,
-    0x00,
-    0x00,
-    0x00,
-    0x0C,
-    0x00,
-    0x00,
-    0x80,
-    0x0D,
-    0x00,
-    0x00,
-    0x02,
-    0x0E,
-    0x00,
-    0x00,
-    0xA7,
-    0x0D,
-    0x00,
-    0x00,
-    0xAB,
-    0x0E,
-    0x00,
-    0x00,
-    0x02,
-    0x0F,
-    0x00,
-    0x00,
-    0x89,
-    0x0F,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x82,
-    0x10,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x82,
-    0x10,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x82,
-    0x10,
-    0x00,
-    0x00,
-    0x01,
-    0x10,
-    0x00,
-    0x00,
-    0xAA,
-    0x0F,
-    0x00,
-    0x00,
-    0x02,
-    0x11,
-    0x00,
-    0x00,
-    0x80,
-    0x11,
-    0x00,
-    0x00,
-    0x81,
-    0x11,
-    0x11,
-    0x00,
-    0x01,
-    0x11,
-    0x11,
-    0x00,
-    0x03,
-    0x11,
-    0x10,
-    0x00,
-    0x03,
-    0x11,
-    0x0F,
-    0x00,
-    0x03,
-    0x11,
-    0x0E,
-    0x00,
-    0x03,
-    0x11,
-    0x0D,
-    0x00,
-    0x27,
-    0x11,
-    0x0C,
-    0x00,
-    0x00,
-    0x12,
-    0x0C,
-    0x00,
-    0x80,
-    0x12,
-    0x0C,
-    0x00,
-    0x00,
-    0x13,
-    0x0C,
-    0x00,
-    0x80,
-    0x13,
-    0x0C,
-    0x00,
-    0x00,
-    0x14,
-    0x0C,
-    0x00,
-    0x80,
-    0x14,
-    0x0C,
-    0x00,
-    0x00,
-    0x15,
-    0x0C,
-    0x00,
-    0x80,
-    0x15,
-    0x0C,
-    0x00,
-    0x00,
-    0x16,
-    0x0C,
-    0x00,
-    0x82,
-    0x16,
-    0x0C,
-    0x00,
-    0x01,
-    0x16,
-    0x0C,
-    0x00,
-    0x00,
-    0x17,
-    0x0C,
-    0x00,
-    0x81,
-    0x17,
-    0x0C,
-    0x00,
-    0x00,
-    0x18,
-    0x0C,
-    0x00,
-    0x80,
-    0x18,
-    0x0C,
-    0x00,
-    0x00,
-    0x19,
-    0x0C,
-    0x00,
-    0x81,
-    0x19,
-    0x0C,
-    0x00,
-    0x1D,
-    0x1A,
-    0x0C,
-    0x00,
-    0x80,
-    0x1A,
-    0x0C,
-    0x00,
-    0x02,
-    0x1B,
-    0x0C,
-    0x00,
-    0x8A,
-    0x1A,
-    0x0C,
-    0x00,
-    0x80,
-    0x1B,
-    0x0C,
-    0x00,
-    0x02,
-    0x1C,
-    0x0C,
-    0x00,
-    0x8C,
-    0x1C,
-    0x0C,
-    0x00,
-    0x09,
-    0x1D,
-    0x0C,
-    0x00,
-    0x88,
-    0x1D,
-    0x0C,
-    0x00,
-    0x05,
-    0x1E,
-    0x0C,
-    0x00,
-    0x82,
-    0x1E,
-    0x0C,
-    0x00,
-    0x05,
-    0x1F,
-    0x0C,
-    0x00,
-    0x89,
-    0x1F,
-    0x0C,
-    0x00,
-    0x08,
-    0x20,
-    0x0C,
-    0x00,
-    0xB5,
-    0x20,
-    0x0C,
-    0x00,
-    0x02,
-    0x21,
-    0x0C,
-    0x00,
-    0x9F,
-    0x21,
-    0x0C,
-    0x00,
-    0x02,
-    0x22,
-    0x0C,
-    0x00,
-    0x82,
-    0x22,
-    0x0C,
-    0x00,
-    0x02,
-    0x22,
-    0x0C,
-    0x00,
-    0x02,
-    0x23,
-    0x0C,
-    0x00,
-    0x03,
-    0x22,
-    0x0C,
-    0x00,
-    0x04,
-    0x22,
-    0x04,
-    0x00,
-    0x82,
-    0x23,
-    0x04,
-    0x00,
-    0x03,
-    0x22,
-    0x04,
-    0x00,
-    0x04,
-    0x22,
-    0x05,
-    0x00,
-    0x82,
-    0x23,
-    0x05,
-    0x00,
-    0x03,
-    0x22,
-    0x05,
-    0x00,
-    0x04,
-    0x22,
-    0x06,
-    0x00,
-    0x02,
-    0x24,
-    0x06,
-    0x00,
-    0x03,
-    0x22,
-    0x06,
-    0x00,
-    0x04,
-    0x22,
-    0x07,
-    0x00,
-    0x02,
-    0x24,
-    0x07,
-    0x00,
-    0x03,
-    0x22,
-    0x07,
-    0x00,
-    0x04,
-    0x22,
-    0x08,
-    0x00,
-    0x82,
-    0x24,
-    0x08,
-    0x00,
-    0x03,
-    0x22,
-    0x08,
-    0x00,
-    0x04,
-    0x22,
-    0x09,
-    0x00,
-    0x82,
-    0x24,
-    0x09,
-    0x00,
-    0x03,
-    0x22,
-    0x09,
-    0x00,
-    0x04,
-    0x22,
-    0x0A,
-    0x00,
-    0x02,
-    0x24,
-    0x0A,
-    0x00,
-    0x03,
-    0x22,
-    0x0A,
-    0x00,
-    0x04,
-    0x22,
-    0x0B,
-    0x00,
-    0x82,
-    0x24,
-    0x0B,
-    0x00,
-    0x39,
-    0x22,
-    0x0B,
-    0x00,
-    0x21,
-    0x25,
-    0x0B,
-    0x00,
-    0x80,
-    0x25,
-    0x0B,
-    0x00,
-    0x01,
-    0x26,
-    0x0B,
-    0x00,
-    0x80,
-    0x26,
-    0x0B,
-    0x00,
-    0x01,
-    0x27,
-    0x0B,
-    0x00,
-    0x80,
-    0x27,
-    0x0B,
-    0x00,
-    0x00,
-    0x26,
-    0x0B,
-    0x00,
-    0x00,
-    0x28,
-    0x0B,
-    0x00,
-    0x82,
-    0x28,
-    0x0B,
-    0x00,
-    0x00,
-    0x28,
-    0x0B,
-    0x00,
-    0x00,
-    0x29,
-    0x0B,
-    0x00,
-    0x80,
-    0x29,
-    0x0B,
-    0x00,
-    0x01,
-    0x2A,
-    0x0B,
-    0x00,
-    0x80,
-    0x2A,
-    0x0B,
-    0x00,
-    0x01,
-    0x29,
-    0x0B,
-    0x00,
-    0x02,
-    0x2B,
-    0x0B,
-    0x00,
-    0x83,
-    0x2B,
-    0x0B,
-    0x00,
-    0x84,
-    0x2B,
-    0x02,
-    0x00,
-    0x02,
-    0x2C,
-    0x02,
-    0x00,
-    0x83,
-    0x2B,
-    0x02,
-    0x00,
-    0x82,
-    0x2C,
-    0x03,
-    0x00,
-    0x81,
-    0x2B,
-    0x03,
-    0x00,
-    0x01,
-    0x2D,
-    0x03,
-    0x00,
-    0x80,
-    0x2D,
-    0x03,
-    0x00,
-    0x01,
-    0x2E,
-    0x03,
-    0x00,
-    0x82,
-    0x2E,
-    0x03,
-    0x00,
-    0x01,
-    0x2F,
-    0x03,
-    0x00,
-    0x84,
-    0x2F,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x83,
-    0x01,
-]
-
-
-GT_RAM_PAT_CONTENT_START_ADDR = 0x5BC0
-GT_RAM_PAT_CONTENT = [
-    0xEC,
-    0x88,
-    0x4B,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x88,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x80,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x82,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x40,
-    0x80,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x84,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x01,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x08,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x14,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x82,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x03,
-    0x08,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x48,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x10,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x08,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x03,
-    0x08,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x84,
-    0x03,
-    0x08,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x03,
-    0x08,
-    0x0A,
-    0x00,
-    0x00,
-    0x00,
-    0x21,
-    0x80,
-    0x03,
-    0x08,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x05,
-    0x80,
-    0x03,
-    0x08,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x45,
-    0x80,
-    0x03,
-    0x08,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x05,
-    0x82,
-    0x03,
-    0x0C,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x05,
-    0x80,
-    0x03,
-    0x0C,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x05,
-    0x80,
-    0x03,
-    0x0C,
-    0x06,
-    0x00,
-    0x00,
-    0x00,
-    0x05,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x80,
-    0x03,
-    0x1C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x40,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x2C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x08,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x08,
-    0x80,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x10,
-    0x80,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x80,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x44,
-    0x80,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x82,
-    0x02,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x02,
-    0x08,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x08,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x10,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x2C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x00,
-    0x08,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x20,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x44,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x82,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x80,
-    0x03,
-    0x0C,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x80,
-    0x03,
-    0x4C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x08,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x01,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x0A,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x06,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x16,
-    0x80,
-    0x03,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x06,
-    0x82,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x06,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x06,
-    0x80,
-    0x03,
-    0x0C,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x03,
-    0x4C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x03,
-    0x80,
-    0x03,
-    0x1C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x03,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x0A,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x12,
-    0x80,
-    0x03,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x2C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x84,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-]
-
-GT_RAM_SEQ_1_CONTENT_START_ADDR = 0x5E40
-GT_RAM_SEQ_1_CONTENT = [
-    0x42,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xC2,
-    0x00,
-    0x00,
-    0x01,
-    0x13,
-    0x00,
-    0x00,
-    0x00,
-    0x2F,
-    0x00,
-    0x00,
-    0x00,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0xDC,
-    0x00,
-    0x00,
-    0x02,
-    0x03,
-    0x00,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x02,
-    0x20,
-    0x00,
-    0x00,
-    0xD2,
-    0x31,
-    0x00,
-    0x00,
-    0x02,
-    0x40,
-    0x00,
-    0x00,
-    0x73,
-    0x31,
-    0x00,
-    0x00,
-    0xD5,
-    0x51,
-    0x00,
-    0x00,
-    0x02,
-    0x60,
-    0x00,
-    0x00,
-    0xD2,
-    0x51,
-    0x00,
-    0x00,
-    0xA9,
-    0x33,
-    0x00,
-    0x00,
-    0x02,
-    0x70,
-    0x00,
-    0x00,
-    0xB8,
-    0x30,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x00,
-    0xA3,
-    0x31,
-    0x00,
-    0x00,
-    0x2E,
-    0x90,
-    0x00,
-    0x00,
-    0x02,
-    0xA0,
-    0x00,
-    0x00,
-    0xC0,
-    0xB4,
-    0x00,
-    0x00,
-    0xBB,
-    0xC0,
-    0x00,
-    0x00,
-    0x02,
-    0xD0,
-    0x00,
-    0x00,
-    0x16,
-    0xC1,
-    0x00,
-    0x00,
-    0x02,
-    0xE0,
-    0x00,
-    0x00,
-    0xB8,
-    0xC0,
-    0x00,
-    0x00,
-    0x02,
-    0xF0,
-    0x00,
-    0x00,
-    0x16,
-    0xC1,
-    0x00,
-    0x00,
-    0xA9,
-    0xB3,
-    0x00,
-    0x00,
-    0x02,
-    0x00,
-    0x01,
-    0x00,
-    0x74,
-    0xB1,
-    0x00,
-    0x00,
-    0x02,
-    0xA0,
-    0x00,
-    0x00,
-    0x05,
-    0xB4,
-    0x00,
-    0x00,
-    0x4C,
-    0x13,
-    0x01,
-    0x00,
-    0xBB,
-    0xB0,
-    0x00,
-    0x00,
-    0x02,
-    0x20,
-    0x01,
-    0x00,
-    0x89,
-    0xB0,
-    0x00,
-    0x00,
-    0x19,
-    0x31,
-    0x01,
-    0x00,
-    0xBB,
-    0x40,
-    0x01,
-    0x00,
-    0x02,
-    0x50,
-    0x01,
-    0x00,
-    0x16,
-    0x41,
-    0x01,
-    0x00,
-    0x02,
-    0x60,
-    0x01,
-    0x00,
-    0xD2,
-    0x41,
-    0x01,
-    0x00,
-    0x02,
-    0x70,
-    0x01,
-    0x00,
-    0xC0,
-    0x44,
-    0x01,
-    0x00,
-    0xBB,
-    0x80,
-    0x01,
-    0x00,
-    0x02,
-    0x90,
-    0x01,
-    0x00,
-    0x16,
-    0x81,
-    0x01,
-    0x00,
-    0x02,
-    0xA0,
-    0x01,
-    0x00,
-    0xB8,
-    0xB0,
-    0x01,
-    0x00,
-    0x02,
-    0xC0,
-    0x01,
-    0x00,
-    0xB9,
-    0xB0,
-    0x01,
-    0x00,
-    0x5C,
-    0xD0,
-    0x01,
-    0x00,
-    0xD6,
-    0xE1,
-    0x01,
-    0x00,
-    0x48,
-    0xF1,
-    0x01,
-    0x00,
-    0x19,
-    0xE1,
-    0x01,
-    0x00,
-    0x19,
-    0x01,
-    0x02,
-    0x00,
-    0x02,
-    0x10,
-    0x02,
-    0x00,
-    0x05,
-    0x04,
-    0x02,
-    0x00,
-    0x4C,
-    0xE3,
-    0x01,
-    0x00,
-    0xBB,
-    0x00,
-    0x02,
-    0x00,
-    0x02,
-    0x20,
-    0x02,
-    0x00,
-    0x89,
-    0x00,
-    0x02,
-    0x00,
-    0x02,
-    0x30,
-    0x02,
-    0x00,
-    0x16,
-    0x41,
-    0x02,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x00,
-    0x06,
-    0x30,
-    0x00,
-    0x00,
-    0x02,
-    0x50,
-    0x02,
-    0x00,
-    0x06,
-    0x10,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x60,
-    0x00,
-]
-
-GT_RAM_SEQ_2_CONTENT_START_ADDR = 0x5F80
-GT_RAM_SEQ_2_CONTENT = [
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0xBF,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x4A,
-    0x00,
-    0x00,
-    0x03,
-    0x21,
-    0x00,
-    0x00,
-    0x00,
-    0x3F,
-    0x00,
-    0x00,
-    0x00,
-    0x1E,
-    0x00,
-    0x00,
-    0x00,
-    0xCB,
-    0x00,
-    0x00,
-    0x02,
-    0x03,
-    0x00,
-    0x00,
-    0x74,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x02,
-    0x20,
-    0x00,
-    0x00,
-    0xD2,
-    0x31,
-    0x00,
-    0x00,
-    0x02,
-    0x60,
-    0x02,
-    0x00,
-    0x7C,
-    0x75,
-    0x02,
-    0x00,
-    0x02,
-    0x80,
-    0x02,
-    0x00,
-    0x95,
-    0x76,
-    0x02,
-    0x00,
-    0x02,
-    0x90,
-    0x02,
-    0x00,
-    0xC0,
-    0x74,
-    0x02,
-    0x00,
-    0xBB,
-    0xA0,
-    0x02,
-    0x00,
-    0x02,
-    0xB0,
-    0x02,
-    0x00,
-    0x16,
-    0xA1,
-    0x02,
-    0x00,
-    0x02,
-    0xC0,
-    0x02,
-    0x00,
-    0xB8,
-    0xA0,
-    0x02,
-    0x00,
-    0x02,
-    0xD0,
-    0x02,
-    0x00,
-    0x16,
-    0xA1,
-    0x02,
-    0x00,
-    0xFE,
-    0x7F,
-    0x02,
-    0x00,
-    0xFE,
-    0x7F,
-    0x02,
-    0x00,
-    0xFE,
-    0x7F,
-    0x02,
-    0x00,
-    0xFE,
-    0x7F,
-    0x02,
-    0x00,
-    0x22,
-    0x73,
-    0x02,
-    0x00,
-    0x2E,
-    0xB0,
-    0x00,
-    0x00,
-    0x02,
-    0xE0,
-    0x02,
-    0x00,
-    0x05,
-    0x04,
-    0x02,
-    0x00,
-    0x4C,
-    0xE3,
-    0x01,
-    0x00,
-    0xBB,
-    0x00,
-    0x02,
-    0x00,
-    0x02,
-    0xF0,
-    0x02,
-    0x00,
-    0x89,
-    0x00,
-    0x02,
-    0x00,
-    0x48,
-    0xF1,
-    0x01,
-    0x00,
-    0x19,
-    0xE1,
-    0x01,
-    0x00,
-    0x19,
-    0x01,
-    0x02,
-    0x00,
-    0x02,
-    0x10,
-    0x02,
-    0x00,
-    0x05,
-    0x04,
-    0x02,
-    0x00,
-    0x4C,
-    0xE3,
-    0x01,
-    0x00,
-    0xBB,
-    0x00,
-    0x02,
-    0x00,
-    0x02,
-    0x20,
-    0x02,
-    0x00,
-    0x89,
-    0x00,
-    0x02,
-    0x00,
-    0x02,
-    0x00,
-    0x03,
-    0x00,
-    0x16,
-    0x01,
-    0x02,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x00,
-    0x06,
-    0x30,
-    0x00,
-    0x00,
-    0x02,
-    0x50,
-    0x02,
-    0x00,
-    0x5A,
-    0x10,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x60,
-    0x00,
-]
-
-GT_RAM_SEQ_3_CONTENT_START_ADDR = 0x60C0
-GT_RAM_SEQ_3_CONTENT = [
-    0x1F,
-    0x00,
-    0x00,
-    0x00,
-    0x06,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x1E,
-    0x00,
-    0x00,
-    0x02,
-    0x07,
-    0x00,
-    0x00,
-    0x00,
-    0xBA,
-    0x00,
-    0x00,
-    0x03,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0x03,
-    0x00,
-    0x00,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x03,
-    0x00,
-    0xA3,
-    0x31,
-    0x00,
-    0x00,
-    0x2E,
-    0x90,
-    0x00,
-    0x00,
-    0x02,
-    0x20,
-    0x03,
-    0x00,
-    0xC0,
-    0xB4,
-    0x00,
-    0x00,
-    0xBB,
-    0xC0,
-    0x00,
-    0x00,
-    0x02,
-    0x30,
-    0x03,
-    0x00,
-    0x16,
-    0xC1,
-    0x00,
-    0x00,
-    0x02,
-    0x40,
-    0x03,
-    0x00,
-    0xB8,
-    0x50,
-    0x03,
-    0x00,
-    0x02,
-    0x60,
-    0x03,
-    0x00,
-    0x16,
-    0x51,
-    0x03,
-    0x00,
-    0x02,
-    0x70,
-    0x03,
-    0x00,
-    0x74,
-    0x01,
-    0x02,
-    0x00,
-    0x48,
-    0xF1,
-    0x01,
-    0x00,
-    0x19,
-    0xE1,
-    0x01,
-    0x00,
-    0x19,
-    0x01,
-    0x02,
-    0x00,
-    0x02,
-    0x10,
-    0x02,
-    0x00,
-    0x05,
-    0x04,
-    0x02,
-    0x00,
-    0x4C,
-    0xE3,
-    0x01,
-    0x00,
-    0xBB,
-    0x00,
-    0x02,
-    0x00,
-    0x02,
-    0x20,
-    0x02,
-    0x00,
-    0x45,
-    0x01,
-    0x02,
-    0x00,
-    0x02,
-    0x30,
-    0x02,
-    0x00,
-    0x16,
-    0x41,
-    0x02,
-    0x00,
-    0x02,
-    0x80,
-    0x00,
-    0x00,
-    0x06,
-    0x30,
-    0x00,
-    0x00,
-    0x09,
-    0x10,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x60,
-    0x00,
-]
-
-GT_RAM_SEQ_4_CONTENT_START_ADDR = 0x6160
-GT_RAM_SEQ_4_CONTENT = [
-    0x20,
-    0x00,
-    0x00,
-    0x00,
-    0xC7,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x86,
-    0x00,
-    0x00,
-    0x02,
-    0x07,
-    0x00,
-    0x00,
-    0x00,
-    0xBA,
-    0x00,
-    0x00,
-    0x03,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x29,
-    0x00,
-    0x00,
-    0x02,
-    0x03,
-    0x00,
-    0x00,
-    0xDC,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x02,
-    0x10,
-    0x00,
-    0x00,
-    0x02,
-    0x80,
-    0x03,
-    0x00,
-    0xA3,
-    0x91,
-    0x03,
-    0x00,
-    0x2E,
-    0xA0,
-    0x03,
-    0x00,
-    0x02,
-    0xB0,
-    0x03,
-    0x00,
-    0xC0,
-    0xC4,
-    0x03,
-    0x00,
-    0xBB,
-    0xD0,
-    0x03,
-    0x00,
-    0x02,
-    0xE0,
-    0x03,
-    0x00,
-    0x16,
-    0xD1,
-    0x03,
-    0x00,
-    0x02,
-    0xF0,
-    0x03,
-    0x00,
-    0xB8,
-    0x00,
-    0x04,
-    0x00,
-    0x02,
-    0x10,
-    0x04,
-    0x00,
-    0x16,
-    0x01,
-    0x04,
-    0x00,
-    0x02,
-    0x20,
-    0x04,
-    0x00,
-    0x74,
-    0x31,
-    0x04,
-    0x00,
-    0x48,
-    0x41,
-    0x04,
-    0x00,
-    0x19,
-    0x51,
-    0x04,
-    0x00,
-    0x19,
-    0x31,
-    0x04,
-    0x00,
-    0x02,
-    0x60,
-    0x04,
-    0x00,
-    0x05,
-    0x34,
-    0x04,
-    0x00,
-    0x4C,
-    0x53,
-    0x04,
-    0x00,
-    0xBB,
-    0x30,
-    0x04,
-    0x00,
-    0x02,
-    0x70,
-    0x04,
-    0x00,
-    0x45,
-    0x31,
-    0x04,
-    0x00,
-    0x02,
-    0x80,
-    0x04,
-    0x00,
-    0x16,
-    0x91,
-    0x04,
-    0x00,
-    0x02,
-    0xA0,
-    0x04,
-    0x00,
-    0x06,
-    0x90,
-    0x03,
-    0x00,
-    0x02,
-    0x50,
-    0x02,
-    0x00,
-    0x06,
-    0x10,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x60,
-    0x00,
-]
-
-RD_RAM_PAT_CONTENT_START_ADDR = 0x6AC0
-RD_RAM_PAT_CONTENT = [
-    0x27,
-    0x83,
-    0x60,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x86,
-    0x02,
-    0x80,
-    0x00,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x86,
-    0x02,
-    0x80,
-    0xC0,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB6,
-    0x02,
-    0x81,
-    0xC0,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB6,
-    0x00,
-    0x80,
-    0xC0,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB6,
-    0x00,
-    0x80,
-    0x20,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x84,
-    0x20,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x84,
-    0x20,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x80,
-    0x20,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x80,
-    0x80,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0xA0,
-    0x80,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x80,
-    0x40,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x14,
-    0x80,
-    0x40,
-    0x00,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x40,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x02,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF6,
-    0x00,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0xC0,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x80,
-    0xC0,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0xC0,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x28,
-    0x90,
-    0xC0,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x82,
-    0x80,
-    0x01,
-    0x00,
-    0xD0,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x80,
-    0x01,
-    0x00,
-    0xD8,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x20,
-    0x00,
-    0x00,
-    0xD8,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0xA0,
-    0x20,
-    0x00,
-    0x00,
-    0xD8,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x04,
-    0x80,
-    0x20,
-    0x00,
-    0x00,
-    0xD8,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x40,
-    0x00,
-    0x00,
-    0xD8,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0xA0,
-    0x40,
-    0x00,
-    0x00,
-    0xD8,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x76,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0xD8,
-    0x04,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x72,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0xD8,
-    0x04,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x70,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x98,
-    0x04,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x70,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x98,
-    0x14,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x70,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x98,
-    0x54,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF0,
-    0x01,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x98,
-    0x04,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF0,
-    0x01,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x98,
-    0x84,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF0,
-    0x01,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x08,
-    0x14,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF0,
-    0x01,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x08,
-    0x14,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF0,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x08,
-    0x14,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xF1,
-    0x09,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x54,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x09,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x54,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x09,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x55,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x15,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x17,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x17,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x57,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x71,
-    0x00,
-    0x90,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x17,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x90,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x57,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x57,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x28,
-    0x17,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x40,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x28,
-    0x17,
-    0x01,
-    0x04,
-    0xF0,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x40,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xF0,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x40,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xF0,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x60,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xF0,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x80,
-    0xA0,
-    0x60,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xF0,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xF0,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x10,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xFF,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xFF,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xEF,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0xCF,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x8F,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x8E,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x0E,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x0C,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x31,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x28,
-    0x87,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x3C,
-    0x60,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x64,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x68,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x70,
-    0x00,
-    0x28,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x07,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x27,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x27,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x67,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x90,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x67,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x01,
-    0x90,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x27,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x27,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x04,
-    0x80,
-    0x20,
-    0x60,
-    0x00,
-    0x20,
-    0x67,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x27,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x90,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x27,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x90,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x67,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x67,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x03,
-    0x60,
-    0x00,
-    0x20,
-    0x07,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x07,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x00,
-    0x80,
-    0x01,
-    0x62,
-    0x00,
-    0x20,
-    0x07,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x08,
-    0x80,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x07,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x20,
-    0x80,
-    0x01,
-    0x62,
-    0x00,
-    0x20,
-    0x06,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x22,
-    0x80,
-    0x01,
-    0x62,
-    0x00,
-    0x20,
-    0x06,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0xB1,
-    0x02,
-    0x80,
-    0x01,
-    0x60,
-    0x00,
-    0x20,
-    0x06,
-    0x01,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x86,
-    0x02,
-    0x8A,
-    0x01,
-    0x00,
-    0x00,
-    0xC0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x86,
-    0x02,
-    0x80,
-    0x01,
-    0x00,
-    0x00,
-    0xC0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x86,
-    0x02,
-    0x80,
-    0x00,
-    0x00,
-    0x00,
-    0xC0,
-    0x06,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-]
-
-OPN7011 = [
-    0xFF,
-    0x00,
-    0x21,
-    0xC0,
-    0x22,
-    0xBD,
-    0x30,
-    0x20,
-    0x01,
-    0x00,
-    0x4D,
-    0x90,
-    0x4F,
-    0x4F,
-]
-
-TCA9535_Configure = [
-    0x06,
-    0x00,
-    0x07,
-    0x00,
-    0x02,
-    0x52,
-    0x03,
-    0x02,
-]
-
-# from_chuck_20241119
-vb1940_mode_2560X1984_30fps = [
-    # MIPI_DATA_RATE(570MHz)
-    (0x738, 0x80),
-    (0x739, 0x82),
-    (0x73A, 0xF9),
-    (0x73B, 0x21),
-    # ROI_B
-    (0x916, 0x00),
-    (0x917, 0x00),  # width offset
-    (0x918, 0x00),
-    (0x919, 0x00),  # height offset
-    (0x91A, 0x00),
-    (0x91B, 0x0A),  # width:2560
-    (0x91C, 0xC0),
-    (0x91D, 0x07),  # height:1984
-    (0x91E, 0x2B),  # data type
-    # slave mode and GPIO0 as input
-    (0xAC6, 0x00),  # master mode
-    (0xAD4, 0x05),  # GPIO0 FSYNC_IN
-    (0xAD6, 0x00),  # GPIO2 strobe
-    (0xAD7, 0x00),  # GPIO3 strobe
-    # context switch configuration
-    (0xADC, 0x01),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_0
-    (0xADD, 0x00),
-    (0xADE, 0x00),
-    (0xADF, 0x00),
-    (0xAE0, 0x00),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_1
-    (0xAE1, 0x00),
-    (0xAE2, 0x00),
-    (0xAE3, 0x00),
-    (0xAE4, 0x00),  # CONTEXT_SWITCH_LOOP_ELEMENT
-    # stream static global
-    (0x934, 0x48),  # LINE_LENGTH 0x2B48 = 11080d, line time = 11080/372 = 29.785us
-    (0x935, 0x2B),
-    (0x937, 0x00),  # ORIENTATION (0=normal)
-    # stream static ctx1
-    (
-        0xB88,
-        0x06,
-    ),  # CONFIG6_GS_OP_RGB_PWLOFF_SINGLE_EXP_VTSS1_DESCSS1_CFA_BAYER_RAW10_31
-    (0xB8E, 0x68),  # FRAME_LENGTH(frame time = 1128*29.785=33.597ms)
-    (0xB8F, 0x04),
-    (0xB8C, 0x00),  # vc0
-    (0xB90, 0x02),  # roi selection(2= Enable ROI_B)
-    (0xB91, 0x30),  # disable GPIO0-3
-    # stream dynamic ctx1
-    (0xCA1, 0x00),  # analog gain(1)
-    (0xCA2, 0xF4),  # INTEGRATION_TIME_PRIMARY
-    (0xCA3, 0x01),
-]
-vb1940_mode_1920X1080_30fps = [
-    # MIPI_DATA_RATE(570MHz)
-    (0x738, 0x80),
-    (0x739, 0x82),
-    (0x73A, 0xF9),
-    (0x73B, 0x21),
-    # ROI_B
-    (0x916, 0x40),
-    (0x917, 0x01),  # width offset
-    (0x918, 0xC4),
-    (0x919, 0x01),  # height offset
-    (0x91A, 0x80),
-    (0x91B, 0x07),  # width:1920
-    (0x91C, 0x38),
-    (0x91D, 0x04),  # height:1080
-    (0x91E, 0x2B),  # data type
-    # master mode
-    (0xAC6, 0x00),  # master mode
-    (0xAD4, 0x05),  # GPIO0 FSYNC_IN
-    (0xAD6, 0x00),  # GPIO2 strobe
-    (0xAD7, 0x00),  # GPIO3 strobe
-    # context switch configuration
-    (0xADC, 0x01),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_0
-    (0xADD, 0x00),
-    (0xADE, 0x00),
-    (0xADF, 0x00),
-    (0xAE0, 0x00),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_1
-    (0xAE1, 0x00),
-    (0xAE2, 0x00),
-    (0xAE3, 0x00),
-    (0xAE4, 0x00),  # CONTEXT_SWITCH_LOOP_ELEMENT
-    # stream static global
-    (0x934, 0x48),  # LINE_LENGTH 0x2B48 = 11080d, line time = 11080/372 = 29.785us
-    (0x935, 0x2B),
-    (0x937, 0x00),  # ORIENTATION (0=normal)
-    # stream static ctx1
-    (
-        0xB88,
-        0x06,
-    ),  # CONFIG6_GS_OP_RGB_PWLOFF_SINGLE_EXP_VTSS1_DESCSS1_CFA_BAYER_RAW10_31
-    (0xB8E, 0x68),  # FRAME_LENGTH(frame time = 1128*29.785=33.597ms)
-    (0xB8F, 0x04),
-    (0xB8C, 0x00),  # vc0
-    (0xB90, 0x02),  # roi selection(2= Enable ROI_B)
-    (0xB91, 0x30),  # disable GPIO0-3
-    # stream dynamic ctx1
-    (0xCA1, 0x00),  # analog gain(1)
-    (0xCA2, 0xF4),  # INTEGRATION_TIME_PRIMARY
-    (0xCA3, 0x01),
-]
-
-vb1940_mode_2560X1984_30fps_8bit = [
-    # MIPI_DATA_RATE(570MHz)
-    (0x738, 0x80),
-    (0x739, 0x82),
-    (0x73A, 0xF9),
-    (0x73B, 0x21),
-    # ROI_B
-    (0x916, 0x00),
-    (0x917, 0x00),  # width offset
-    (0x918, 0x00),
-    (0x919, 0x00),  # height offset
-    (0x91A, 0x00),
-    (0x91B, 0x0A),  # width:2560
-    (0x91C, 0xC0),
-    (0x91D, 0x07),  # height:1984
-    (0x91E, 0x2A),  # data type
-    # master mode
-    (0xAC6, 0x00),  # master mode
-    (0xAD4, 0x05),  # GPIO0 FSYNC_IN
-    (0xAD6, 0x00),  # GPIO2 strobe
-    (0xAD7, 0x00),  # GPIO3 strobe
-    # context switch configuration
-    (0xADC, 0x01),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_0
-    (0xADD, 0x00),
-    (0xADE, 0x00),
-    (0xADF, 0x00),
-    (0xAE0, 0x00),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_1
-    (0xAE1, 0x00),
-    (0xAE2, 0x00),
-    (0xAE3, 0x00),
-    (0xAE4, 0x00),  # CONTEXT_SWITCH_LOOP_ELEMENT
-    # stream static global
-    (0x934, 0x48),  # LINE_LENGTH 0x2B48 = 11080d, line time = 11080/372 = 29.785us
-    (0x935, 0x2B),
-    (0x937, 0x00),  # ORIENTATION (0=normal)
-    # stream static ctx1
-    (
-        0xB88,
-        0x05,
-    ),  # CONFIG5_GS_OP_RGB_PWL10T8_SINGLE_EXP_VTSS1_DESCSS1_CFA_BAYER_RAW8_30
-    (0xB8E, 0x68),  # FRAME_LENGTH(frame time = 1128*29.785=33.597ms)
-    (0xB8F, 0x04),
-    (0xB8C, 0x00),  # vc0
-    (0xB90, 0x02),  # roi selection(2= Enable ROI_B)
-    (0xB91, 0x30),  # disable GPIO0-3
-    # stream dynamic ctx1
-    (0xCA1, 0x00),  # analog gain(1)
-    (0xCA2, 0xF4),  # INTEGRATION_TIME_PRIMARY
-    (0xCA3, 0x01),
-]
-
-
-class Vb1940_Mode(Enum):
-    VB1940_MODE_2560X1984_30FPS = 0
-    VB1940_MODE_1920X1080_30FPS = 1
-    VB1940_MODE_2560X1984_30FPS_8BIT = 2
-    Unknown = 3
-
-
-frame_format = namedtuple(
-    "FrameFormat", ["width", "height", "framerate", "pixel_format"]
-)
-
-vb1940_frame_format = []
-vb1940_frame_format.insert(
-    Vb1940_Mode.VB1940_MODE_2560X1984_30FPS.value,
-    frame_format(2560, 1984, 30, hololink.sensors.csi.PixelFormat.RAW_10),
-)
-vb1940_frame_format.insert(
-    Vb1940_Mode.VB1940_MODE_1920X1080_30FPS.value,
-    frame_format(1920, 1080, 30, hololink.sensors.csi.PixelFormat.RAW_10),
-)
-vb1940_frame_format.insert(
-    Vb1940_Mode.VB1940_MODE_2560X1984_30FPS_8BIT.value,
-    frame_format(2560, 1984, 30, hololink.sensors.csi.PixelFormat.RAW_8),
-)
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+SPDX-License-Identifier: Apache-2.0
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import namedtuple
+from enum import Enum
+
+import hololink
+
+# values are on hex number system to be consistent with rest of the list
+VB1940_TABLE_WAIT_MS = "vb1940-table-wait-ms"
+VB1940_WAIT_MS = 0x0A
+VB1940_WAIT_MS_START = 0x64
+
+VB1940_PAGE_SIZE = 128
+
+REG_AG = 0x0CA1  # ctx1
+REG_EXP = 0x0CA2  # ctx1
+
+
+vb1940_start = [
+    (0x516, 0x01),  # start streaming
+    (VB1940_TABLE_WAIT_MS, VB1940_WAIT_MS_START),
+]
+
+vb1940_stop = [
+    (0x517, 0x01),  # stop streaming
+    (VB1940_TABLE_WAIT_MS, VB1940_WAIT_MS),
+]
+
+# Where each of the blobs in vb1940_firmware is written.
+VB1940_CERTIFICATE_START_ADDR = 0x1AA8
+VB1940_FWP_START_ADDR = 0x2000
+LDEC_RAM_CONTENT_START_ADDR = 0x2000
+RD_RAM_SEQ_1_CONTENT_START_ADDR = 0x5000
+GT_RAM_PAT_CONTENT_START_ADDR = 0x5BC0
+GT_RAM_SEQ_1_CONTENT_START_ADDR = 0x5E40
+GT_RAM_SEQ_2_CONTENT_START_ADDR = 0x5F80
+GT_RAM_SEQ_3_CONTENT_START_ADDR = 0x60C0
+GT_RAM_SEQ_4_CONTENT_START_ADDR = 0x6160
+RD_RAM_PAT_CONTENT_START_ADDR = 0x6AC0
+
+# These are bytes objects, tens of kilobytes in all; we don't
+# import vb1940_firmware until one is actually used.
+_FIRMWARE_NAMES = (
+    "VB1940_CERTIFICATE",
+    "VB1940_FW",
+    "LDEC_RAM_CONTENT",
+    "RD_RAM_SEQ_1_CONTENT",
+    "GT_RAM_PAT_CONTENT",
+    "GT_RAM_SEQ_1_CONTENT",
+    "GT_RAM_SEQ_2_CONTENT",
+    "GT_RAM_SEQ_3_CONTENT",
+    "GT_RAM_SEQ_4_CONTENT",
+    "RD_RAM_PAT_CONTENT",
+)
+
+
+def __getattr__(name):
+    if name in _FIRMWARE_NAMES:
+        from . import vb1940_firmware
+
+        return getattr(vb1940_firmware, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+OPN7011 = [
+    0xFF,
+    0x00,
+    0x21,
+    0xC0,
+    0x22,
+    0xBD,
+    0x30,
+    0x20,
+    0x01,
+    0x00,
+    0x4D,
+    0x90,
+    0x4F,
+    0x4F,
+]
+
+TCA9535_Configure = [
+    0x06,
+    0x00,
+    0x07,
+    0x00,
+    0x02,
+    0x52,
+    0x03,
+    0x02,
+]
+
+# from_chuck_20241119
+vb1940_mode_2560X1984_30fps = [
+    # MIPI_DATA_RATE(570MHz)
+    (0x738, 0x80),
+    (0x739, 0x82),
+    (0x73A, 0xF9),
+    (0x73B, 0x21),
+    # ROI_B
+    (0x916, 0x00),
+    (0x917, 0x00),  # width offset
+    (0x918, 0x00),
+    (0x919, 0x00),  # height offset
+    (0x91A, 0x00),
+    (0x91B, 0x0A),  # width:2560
+    (0x91C, 0xC0),
+    (0x91D, 0x07),  # height:1984
+    (0x91E, 0x2B),  # data type
+    # slave mode and GPIO0 as input
+    (0xAC6, 0x00),  # master mode
+    (0xAD4, 0x05),  # GPIO0 FSYNC_IN
+    (0xAD6, 0x00),  # GPIO2 strobe
+    (0xAD7, 0x00),  # GPIO3 strobe
+    # context switch configuration
+    (0xADC, 0x01),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_0
+    (0xADD, 0x00),
+    (0xADE, 0x00),
+    (0xADF, 0x00),
+    (0xAE0, 0x00),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_1
+    (0xAE1, 0x00),
+    (0xAE2, 0x00),
+    (0xAE3, 0x00),
+    (0xAE4, 0x00),  # CONTEXT_SWITCH_LOOP_ELEMENT
+    # stream static global
+    (0x934, 0x48),  # LINE_LENGTH 0x2B48 = 11080d, line time = 11080/372 = 29.785us
+    (0x935, 0x2B),
+    (0x937, 0x00),  # ORIENTATION (0=normal)
+    # stream static ctx1
+    (
+        0xB88,
+        0x06,
+    ),  # CONFIG6_GS_OP_RGB_PWLOFF_SINGLE_EXP_VTSS1_DESCSS1_CFA_BAYER_RAW10_31
+    (0xB8E, 0x68),  # FRAME_LENGTH(frame time = 1128*29.785=33.597ms)
+    (0xB8F, 0x04),
+    (0xB8C, 0x00),  # vc0
+    (0xB90, 0x02),  # roi selection(2= Enable ROI_B)
+    (0xB91, 0x30),  # disable GPIO0-3
+    # stream dynamic ctx1
+    (0xCA1, 0x00),  # analog gain(1)
+    (0xCA2, 0xF4),  # INTEGRATION_TIME_PRIMARY
+    (0xCA3, 0x01),
+]
+vb1940_mode_1920X1080_30fps = [
+    # MIPI_DATA_RATE(570MHz)
+    (0x738, 0x80),
+    (0x739, 0x82),
+    (0x73A, 0xF9),
+    (0x73B, 0x21),
+    # ROI_B
+    (0x916, 0x40),
+    (0x917, 0x01),  # width offset
+    (0x918, 0xC4),
+    (0x919, 0x01),  # height offset
+    (0x91A, 0x80),
+    (0x91B, 0x07),  # width:1920
+    (0x91C, 0x38),
+    (0x91D, 0x04),  # height:1080
+    (0x91E, 0x2B),  # data type
+    # master mode
+    (0xAC6, 0x00),  # master mode
+    (0xAD4, 0x05),  # GPIO0 FSYNC_IN
+    (0xAD6, 0x00),  # GPIO2 strobe
+    (0xAD7, 0x00),  # GPIO3 strobe
+    # context switch configuration
+    (0xADC, 0x01),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_0
+    (0xADD, 0x00),
+    (0xADE, 0x00),
+    (0xADF, 0x00),
+    (0xAE0, 0x00),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_1
+    (0xAE1, 0x00),
+    (0xAE2, 0x00),
+    (0xAE3, 0x00),
+    (0xAE4, 0x00),  # CONTEXT_SWITCH_LOOP_ELEMENT
+    # stream static global
+    (0x934, 0x48),  # LINE_LENGTH 0x2B48 = 11080d, line time = 11080/372 = 29.785us
+    (0x935, 0x2B),
+    (0x937, 0x00),  # ORIENTATION (0=normal)
+    # stream static ctx1
+    (
+        0xB88,
+        0x06,
+    ),  # CONFIG6_GS_OP_RGB_PWLOFF_SINGLE_EXP_VTSS1_DESCSS1_CFA_BAYER_RAW10_31
+    (0xB8E, 0x68),  # FRAME_LENGTH(frame time = 1128*29.785=33.597ms)
+    (0xB8F, 0x04),
+    (0xB8C, 0x00),  # vc0
+    (0xB90, 0x02),  # roi selection(2= Enable ROI_B)
+    (0xB91, 0x30),  # disable GPIO0-3
+    # stream dynamic ctx1
+    (0xCA1, 0x00),  # analog gain(1)
+    (0xCA2, 0xF4),  # INTEGRATION_TIME_PRIMARY
+    (0xCA3, 0x01),
+]
+
+vb1940_mode_2560X1984_30fps_8bit = [
+    # MIPI_DATA_RATE(570MHz)
+    (0x738, 0x80),
+    (0x739, 0x82),
+    (0x73A, 0xF9),
+    (0x73B, 0x21),
+    # ROI_B
+    (0x916, 0x00),
+    (0x917, 0x00),  # width offset
+    (0x918, 0x00),
+    (0x919, 0x00),  # height offset
+    (0x91A, 0x00),
+    (0x91B, 0x0A),  # width:2560
+    (0x91C, 0xC0),
+    (0x91D, 0x07),  # height:1984
+    (0x91E, 0x2A),  # data type
+    # master mode
+    (0xAC6, 0x00),  # master mode
+    (0xAD4, 0x05),  # GPIO0 FSYNC_IN
+    (0xAD6, 0x00),  # GPIO2 strobe
+    (0xAD7, 0x00),  # GPIO3 strobe
+    # context switch configuration
+    (0xADC, 0x01),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_0
+    (0xADD, 0x00),
+    (0xADE, 0x00),
+    (0xADF, 0x00),
+    (0xAE0, 0x00),  # CONTEXT_SWITCH_SEQUENCE_VECTOR_1
+    (0xAE1, 0x00),
+    (0xAE2, 0x00),
+    (0xAE3, 0x00),
+    (0xAE4, 0x00),  # CONTEXT_SWITCH_LOOP_ELEMENT
+    # stream static global
+    (0x934, 0x48),  # LINE_LENGTH 0x2B48 = 11080d, line time = 11080/372 = 29.785us
+    (0x935, 0x2B),
+    (0x937, 0x00),  # ORIENTATION (0=normal)
+    # stream static ctx1
+    (
+        0xB88,
+        0x05,
+    ),  # CONFIG5_GS_OP_RGB_PWL10T8_SINGLE_EXP_VTSS1_DESCSS1_CFA_BAYER_RAW8_30
+    (0xB8E, 0x68),  # FRAME_LENGTH(frame time = 1128*29.785=33.597ms)
+    (0xB8F, 0x04),
+    (0xB8C, 0x00),  # vc0
+    (0xB90, 0x02),  # roi selection(2= Enable ROI_B)
+    (0xB91, 0x30),  # disable GPIO0-3
+    # stream dynamic ctx1
+    (0xCA1, 0x00),  # analog gain(1)
+    (0xCA2, 0xF4),  # INTEGRATION_TIME_PRIMARY
+    (0xCA3, 0x01),
+]
+
+
+class Vb1940_Mode(Enum):
+    VB1940_MODE_2560X1984_30FPS = 0
+    VB1940_MODE_1920X1080_30FPS = 1
+    VB1940_MODE_2560X1984_30FPS_8BIT = 2
+    Unknown = 3
+
+
+frame_format = namedtuple(
+    "FrameFormat", ["width", "height", "framerate", "pixel_format"]
+)
+
+vb1940_frame_format = []
+vb1940_frame_format.insert(
+    Vb1940_Mode.VB1940_MODE_2560X1984_30FPS.value,
+    frame_format(2560, 1984, 30, hololink.sensors.csi.PixelFormat.RAW_10),
+)
+vb1940_frame_format.insert(
+    Vb1940_Mode.VB1940_MODE_1920X1080_30FPS.value,
+    frame_format(1920, 1080, 30, hololink.sensors.csi.PixelFormat.RAW_10),
+)
+vb1940_frame_format.insert(
+    Vb1940_Mode.VB1940_MODE_2560X1984_30FPS_8BIT.value,
+    frame_format(2560, 1984, 30, hololink.sensors.csi.PixelFormat.RAW_8),
+)
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+"""Reads the receiver telemetry segments (see core::ReceiverTelemetry
+in src/hololink/core/telemetry.hpp) that receivers publish in
+/dev/shm.  This module only uses the standard library, so external
+monitoring tools can use it without loading the hololink extensions,
+and reading a segment has no effect on the receiver that writes it."""
+
+import mmap
+import os
+import struct
+
+SHM_DIRECTORY = "/dev/shm"
+SHM_PREFIX = "hololink-telemetry."
+MAGIC = b"HSBTEL01"
+
+# Indexed by ReceiverTelemetry::Counter and ReceiverTelemetry::Timer.
+COUNTERS = (
+    "packets_received",
+    "bytes_received",
+    "packets_dropped",
+    "frames_received",
+    "frames_dropped",
+    "frames_delivered",
+    "timeouts",
+)
+TIMERS = (
+    "frame_assembly",
+    "frame_latency",
+    "frame_wait",
+)
+HISTOGRAM_BUCKETS = 25
+
+_HEADER = struct.Struct("=8sII32s")
+_VALUES = struct.Struct(
+    "=%dQ" % (len(COUNTERS) + len(TIMERS) * (2 + HISTOGRAM_BUCKETS))
+)
+SEGMENT_SIZE = _HEADER.size + _VALUES.size
+
+
+def bucket_limit_s(bucket):
+    """Upper limit, in seconds, of a histogram bucket; the last
+    bucket is unlimited."""
+    if bucket >= HISTOGRAM_BUCKETS - 1:
+        return float("inf")
+    return 1e-6 * (1 << bucket)
+
+
+class Histogram:
+    def __init__(self, count, sum_ns, buckets):
+        self.count = count
+        self.sum_s = sum_ns / 1e9
+        # Samples in each bucket; these aren't cumulative.
+        self.buckets = buckets
+
+    def mean_s(self):
+        return self.sum_s / self.count if self.count else 0.0
+
+    def quantile_s(self, q):
+        """Upper limit of the bucket that holds the q'th quantile."""
+        target = q * self.count
+        cumulative = 0
+        for bucket, n in enumerate(self.buckets):
+            cumulative += n
+            if n and cumulative >= target:
+                return bucket_limit_s(bucket)
+        return 0.0
+
+
+class ReceiverTelemetry:
+    """A snapshot of one receiver's segment."""
+
+    def __init__(self, name, pid, receiver, counters, histograms):
+        self.name = name
+        self.pid = pid
+        self.receiver = receiver
+        # {counter name: value}
+        self.counters = counters
+        # {timer name: Histogram}
+        self.histograms = histograms
+
+    def __repr__(self):
+        return f"ReceiverTelemetry({self.name=} {self.receiver=} {self.counters=})"
+
+
+def read_segment(path):
+    """Returns a ReceiverTelemetry with the values currently in the
+    segment at path, or None if that isn't a telemetry segment."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < SEGMENT_SIZE:
+                return None
+            with mmap.mmap(f.fileno(), SEGMENT_SIZE, access=mmap.ACCESS_READ) as m:
+                magic, size, pid, receiver = _HEADER.unpack_from(m, 0)
+                if (magic != MAGIC) or (size != SEGMENT_SIZE):
+                    return None
+                values = _VALUES.unpack_from(m, _HEADER.size)
+    except FileNotFoundError:
+        # The receiver went away.
+        return None
+    counters = dict(zip(COUNTERS, values))
+    histograms = {}
+    offset = len(COUNTERS)
+    for timer in TIMERS:
+        count, sum_ns = values[offset], values[offset + 1]
+        buckets = list(values[offset + 2 : offset + 2 + HISTOGRAM_BUCKETS])
+        histograms[timer] = Histogram(count, sum_ns, buckets)
+        offset += 2 + HISTOGRAM_BUCKETS
+    receiver = receiver.split(b"\0", 1)[0].decode()
+    return ReceiverTelemetry(
+        os.path.basename(path), pid, receiver, counters, histograms
+    )
+
+
+def read_all(directory=SHM_DIRECTORY):
+    """Returns a ReceiverTelemetry for each receiver segment in
+    directory, sorted by name."""
+    r = []
+    try:
+        names = sorted(os.listdir(directory))
+    except FileNotFoundError:
+        return r
+    for name in names:
+        if not name.startswith(SHM_PREFIX):
+            continue
+        telemetry = read_segment(os.path.join(directory, name))
+        if telemetry is not None:
+            r.append(telemetry)
+    return r
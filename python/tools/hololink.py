@@ -23,6 +23,7 @@ import pydoc
 import socket
 import struct
 import sys
+import threading
 import time
 
 import requests
@@ -255,6 +256,24 @@ class Timer:
         return r
 
 
+def kib_per_s(byte_count, mailbox):
+    elapsed_s, _, _ = mailbox.throughput()
+    return byte_count / 1024 / elapsed_s if elapsed_s > 0 else 0.0
+
+
+def log_throughput(what, byte_count, mailbox):
+    elapsed_s, words_written, words_read = mailbox.throughput()
+    rate = kib_per_s(byte_count, mailbox)
+    logging.info(
+        f"{what} {byte_count} bytes in {elapsed_s:.1f}s ({rate:.1f} KiB/s); "
+        f"{words_written=} {words_read=}"
+    )
+
+
+def no_progress(state, percent, rate):
+    pass
+
+
 class StratixMailboxError(Exception):
     def __init__(self, response_id, length, error_code, data, *args):
         self.response_id = response_id
@@ -307,6 +326,9 @@ class StratixMailbox:
         self._address = address
         self._id = os.getpid()  # start with a randomish value
         logging.debug(f"{self._id=:#x}")
+        self._start = time.monotonic()
+        self._words_written = 0
+        self._words_read = 0
         timeout = Timer(timeout_s=1.0)
         self._flush(timeout)
         self._clear_isr(hololink)
@@ -317,17 +339,36 @@ class StratixMailbox:
     def _read_uint32(self, address):
         return self._hololink.read_uint32(address + self._address)
 
+    def _write_fifo(self, address, values):
+        """Write all of values to the FIFO at address, in one request."""
+        fifo = address + self._address
+        ok = self._hololink.write_uint32_block([(fifo, value) for value in values])
+        assert ok
+
+    def _read_fifo(self, address, count):
+        """Read count words from the FIFO at address, in one request."""
+        fifo = address + self._address
+        ok, values = self._hololink.read_uint32_block([fifo] * count)
+        assert ok
+        return values
+
+    def _status(self):
+        status = self._read_uint32(self.STATUS)
+        length, eop, sop = (status >> 2), (status & 2) != 0, (status & 1) != 0
+        logging.trace(f"{length=} {eop=} {sop=}")
+        return length, eop, sop
+
     def _flush(self, timeout):
         flushed = 0
         while True:
-            status = self._read_uint32(self.STATUS)
-            length, eop, sop = (status >> 2), (status & 2) != 0, (status & 1) != 0
-            logging.debug(f"{length=} {eop=} {sop=}")
+            length, eop, sop = self._status()
             if length == 0:
                 break
-            flushed_response = self._read_uint32(self.RESPONSE)
-            logging.debug(f"{flushed_response=:#x}")
-            flushed += 1
+            for flushed_response in self._read_fifo(
+                self.RESPONSE, min(length, hololink_module.CONTROL_BLOCK_WORDS)
+            ):
+                logging.debug(f"{flushed_response=:#x}")
+                flushed += 1
             timeout.check()
         logging.debug(f"{flushed=}")
 
@@ -347,21 +388,32 @@ class StratixMailbox:
         assert command < 1024  # we only get 10 bits for the command value
         timeout = Timer(timeout_s=2.0)
         # Inspired by https://www.intel.com/content/www/us/en/docs/programmable/683290/24-1/using-the.html
-        # Make sure we have space.
-        fifo_space = self._read_uint32(self.FIFO_SPACE)
-        logging.trace(f"{fifo_space=}")
-        assert fifo_space > 0
-        # Write the command FIFO
         self._id += 1
         command_value = ((self._id & 0xF) << 24) | (len(args) << 12) | command
         cx = [command_value]
         cx.extend(args)
-        for c in cx[:-1]:
-            self._write_uint32(self.COMMAND, c)
-            fifo_space = self._read_uint32(self.FIFO_SPACE)
-            logging.debug(f"{fifo_space=}")
-            assert fifo_space > 0
-        self._write_uint32(self.COMMAND_EOP, cx[-1])
+        # Write the command FIFO.  FIFO_SPACE tells us how many words
+        # we can write without checking again, so we only read it when
+        # those credits run out, and send each batch of words as a
+        # single block write.  The last word goes to COMMAND_EOP.
+        credits = 0
+        while cx:
+            if credits == 0:
+                credits = self._read_uint32(self.FIFO_SPACE)
+                logging.trace(f"{credits=}")
+                if credits == 0:
+                    timeout.check()
+                    continue
+            count = min(credits, len(cx), hololink_module.CONTROL_BLOCK_WORDS)
+            if count == len(cx):
+                if count > 1:
+                    self._write_fifo(self.COMMAND, cx[: count - 1])
+                self._write_uint32(self.COMMAND_EOP, cx[-1])
+            else:
+                self._write_fifo(self.COMMAND, cx[:count])
+            cx = cx[count:]
+            credits -= count
+            self._words_written += count
         # Wait for ISR flag
         while True:
             isr = self._read_uint32(self.ISR)
@@ -372,29 +424,30 @@ class StratixMailbox:
             timeout.check()
         # Wait for a response (which should be already available)
         while True:
-            status = self._read_uint32(self.STATUS)
-            length, eop, sop = (status >> 2), (status & 2) != 0, (status & 1) != 0
-            logging.trace(f"{length=} {eop=} {sop=}")
+            length, eop, sop = self._status()
             if sop:  # and (length > 0):
                 assert length > 0  # we always get a response header
                 break
             timeout.check()
-        # Fish out the response
+        # Fish out the response.  STATUS tells us how many words are
+        # waiting and whether the first of those is the end of the
+        # response; we don't know if any of the others are until we
+        # get to them, so read all but the last of them in one go.
         r = []
         while True:
-            assert length > 0
-            response = self._read_uint32(self.RESPONSE)
-            logging.debug(f"{response=:#x}")
-            r.append(response)
-            # NOTE that we borrow "eop" from above, first time through--
-            # we always get at least 1 response header word.
             if eop:
+                response = self._read_uint32(self.RESPONSE)
+                logging.debug(f"{response=:#x}")
+                r.append(response)
                 break
-            status = self._read_uint32(self.STATUS)
-            length, eop, sop = (status >> 2), (status & 2) != 0, (status & 1) != 0
-            logging.debug(f"{length=} {eop=} {sop=}")
+            if length > 1:
+                count = min(length - 1, hololink_module.CONTROL_BLOCK_WORDS)
+                r.extend(self._read_fifo(self.RESPONSE, count))
+            else:
+                timeout.check()
+            length, eop, sop = self._status()
             assert not sop
-            timeout.check()
+        self._words_read += len(r)
         # Response header is first
         header, data = r[0], r[1:]
         response_id, length, error_code = (
@@ -409,6 +462,15 @@ class StratixMailbox:
         assert response_id == (self._id & 0xF)
         return data
 
+    def throughput(self):
+        """Returns (seconds, command words written, response words read)
+        since this object was created."""
+        return (
+            time.monotonic() - self._start,
+            self._words_written,
+            self._words_read,
+        )
+
     def get_idcode(self):
         r = self._execute(self.GET_IDCODE)
         return r[0]
@@ -561,7 +623,7 @@ class SensorBridgeStrategy:
     def check_fpga_uuid(self, fpga_uuid):
         raise Exception('Unexpected call to abstract "check_fpga_uuid"')
 
-    def program_and_verify_images(self, hololink):
+    def program_and_verify_images(self, hololink, progress=None):
         raise Exception('Unexpected call to abstract "program_and_verify_images"')
 
     def power_cycle(self, args, hololink):
@@ -581,15 +643,18 @@ class SensorBridge100Strategy(SensorBridgeStrategy):
         }
         return fpga_uuid in supported_fpga_uuids
 
-    def program_and_verify_images(self, hololink):
+    def program_and_verify_images(self, hololink, progress=None):
         content = self._programmer._content
         if "stratix" in content:
             original_stratix_content = content["stratix"]
             stratix_content = original_stratix_content.translate(reverse_map)
-            self.program_stratix(hololink, stratix_content)
-            self.verify_stratix(hololink, stratix_content)
+            sectors = self.program_stratix(hololink, stratix_content, progress)
+            self.verify_stratix(hololink, stratix_content, sectors, progress)
 
-    def verify_stratix(self, hololink, expected):
+    def verify_stratix(self, hololink, expected, sectors=None, progress=None):
+        """Check the flash against expected; if sectors is given, only
+        the 64K sectors at those offsets are checked."""
+        progress = progress or no_progress
         if self._args.skip_verify_stratix:
             logging.info(
                 "Skipping verification of stratix per command-line instructions."
@@ -608,12 +673,26 @@ class SensorBridge100Strategy(SensorBridgeStrategy):
         show_status = Timer(timeout_s=10.0)
         with StratixQspi(mailbox) as qspi:
             byte_count = qspi.PAGE_BYTES
-            for page in range(0, expected_size, byte_count):
+            if sectors is None:
+                sectors = range(0, expected_size, qspi.ERASE_64K_BYTES)
+            pages = [
+                page
+                for sector in sectors
+                for page in range(
+                    sector,
+                    min(sector + qspi.ERASE_64K_BYTES, expected_size),
+                    byte_count,
+                )
+            ]
+            verified = 0
+            for n, page in enumerate(pages):
                 flash_address = fpga_flash_address + page
                 # Let users know that we're running
                 if show_status.first() or show_status.tick():
-                    percent = int(100 * (page / expected_size))
-                    logging.info(f"{flash_address=:#x} ({percent}%)")
+                    percent = int(100 * (n / len(pages)))
+                    rate = kib_per_s(verified, mailbox)
+                    logging.info(f"{flash_address=:#x} ({percent}%, {rate:.1f} KiB/s)")
+                    progress("verify", percent, rate)
                 # Fetch this page
                 current_bytes = min(byte_count, expected_size - page)
                 assert (current_bytes & 3) == 0
@@ -622,14 +701,33 @@ class SensorBridge100Strategy(SensorBridgeStrategy):
                 actual = struct.pack("<%dI" % len(actual_words), *actual_words)
                 # Verify the content.
                 assert expected[page : page + current_bytes] == actual
+                verified += current_bytes
+        log_throughput("Verified", verified, mailbox)
+        progress("verified", 100, kib_per_s(verified, mailbox))
+
+    def stratix_sector_matches(self, qspi, flash_address, content):
+        """True if the flash at flash_address already holds content;
+        stops reading at the first page that's different."""
+        byte_count = qspi.PAGE_BYTES
+        for offset in range(0, len(content), byte_count):
+            expected = content[offset : offset + byte_count]
+            actual_words = qspi.read(flash_address + offset, len(expected) // 4)
+            actual = struct.pack("<%dI" % len(actual_words), *actual_words)
+            if actual != expected:
+                return False
+        return True
 
-    def program_stratix(self, hololink, content):
+    def program_stratix(self, hololink, content, progress=None):
+        """Returns the offsets of the 64K sectors that were written,
+        or None if programming was skipped."""
+        progress = progress or no_progress
         if self._args.skip_program_stratix:
             logging.info(
                 "Skipping programming of stratix per command-line instructions."
             )
-            return
-        logging.info("Programming stratix.")
+            return None
+        differential = self._args.differential
+        logging.info(f"Programming stratix; {differential=}.")
         content_size = len(content)
         # Attach to the device
         mailbox = StratixMailbox(hololink)
@@ -640,20 +738,36 @@ class SensorBridge100Strategy(SensorBridgeStrategy):
         fpga_flash_address = mailbox.fpga_application_address()
         # Program contents
         show_status = Timer(timeout_s=10.0)
+        written = []
+        skipped = 0
         with StratixQspi(mailbox) as qspi:
             byte_count = (
                 qspi.PAGE_BYTES
             )  # we can't write 1024 because the command adds 2 words
             for erase_address in range(0, content_size, qspi.ERASE_64K_BYTES):
-                qspi.erase(fpga_flash_address + erase_address, qspi.ERASE_64K_WORDS)
                 remaining = min(qspi.ERASE_64K_BYTES, content_size - erase_address)
+                # In differential mode, sectors that already have the
+                # right content are left alone.
+                if differential and self.stratix_sector_matches(
+                    qspi,
+                    fpga_flash_address + erase_address,
+                    content[erase_address : erase_address + remaining],
+                ):
+                    logging.debug(f"Skipping sector at {erase_address=:#x}.")
+                    skipped += 1
+                    continue
+                qspi.erase(fpga_flash_address + erase_address, qspi.ERASE_64K_WORDS)
                 for write_address in range(
                     erase_address, erase_address + remaining, byte_count
                 ):
                     flash_address = fpga_flash_address + write_address
                     if show_status.first() or show_status.tick():
                         percent = int(100 * (write_address / content_size))
-                        logging.info(f"{flash_address=:#x} ({percent}%)")
+                        rate = kib_per_s(write_address, mailbox)
+                        logging.info(
+                            f"{flash_address=:#x} ({percent}%, {rate:.1f} KiB/s)"
+                        )
+                        progress("program", percent, rate)
                     content_bytes = content[write_address : write_address + byte_count]
                     assert (len(content_bytes) & 0x3) == 0
                     word_count = (
@@ -661,6 +775,11 @@ class SensorBridge100Strategy(SensorBridgeStrategy):
                     )  # which could be less than the page size on the last page
                     content_words = struct.unpack("<%dI" % word_count, content_bytes)
                     qspi.write(flash_address, content_words)
+                written.append(erase_address)
+        log_throughput("Programmed", content_size, mailbox)
+        logging.info(f"Wrote {len(written)} sectors; {skipped} were already current.")
+        progress("programmed", 100, kib_per_s(content_size, mailbox))
+        return written
 
     def power_cycle(self, args, hololink):
         # Attach to the device
@@ -791,12 +910,17 @@ class Programmer:
             content = self.fetch_content(content_name)
             self._content[context] = content
 
-    def program_and_verify_images(self, hololink):
-        self._strategy.program_and_verify_images(hololink)
+    def program_and_verify_images(self, hololink, progress=None):
+        """progress, if given, is called with (state, percent, rate)
+        where rate is in KiB/s."""
+        self._strategy.program_and_verify_images(hololink, progress)
 
     def power_cycle(self, args, hololink):
         self._strategy.power_cycle(args, hololink)
 
+    def supports(self, channel_metadata):
+        return self._strategy.check_fpga_uuid(channel_metadata["fpga_uuid"])
+
     def hololink(self, channel_metadata):
         logging.debug(f"{channel_metadata=}")
         r = self._strategy.hololink(channel_metadata)
@@ -824,12 +948,118 @@ def manual_enumeration(args):
     return metadata
 
 
+class ProgressTable:
+    """Shows the progress of programming each board, one row per board."""
+
+    def __init__(self, boards):
+        self._lock = threading.Lock()
+        self._rows = {board: ("waiting", 0, 0.0) for board in boards}
+
+    def update(self, board, state, percent, rate):
+        with self._lock:
+            self._rows[board] = (state, percent, rate)
+
+    def progress(self, board):
+        """Returns a progress callback for board."""
+
+        def progress(state, percent, rate):
+            self.update(board, state, percent, rate)
+
+        return progress
+
+    def show(self):
+        with self._lock:
+            rows = sorted(self._rows.items())
+        width = max(len(board) for board, _ in rows)
+        print(f"{'board':{width}}  {'state':24}  {'%':>4}  {'KiB/s':>8}")
+        for board, (state, percent, rate) in rows:
+            print(f"{board:{width}}  {state:24.24}  {percent:>4}  {rate:>8.1f}")
+        sys.stdout.flush()
+
+
+def enumerate_boards(programmer, timeout_s):
+    """Returns {peer_ip: channel_metadata}, with one entry for each
+    board that the programmer supports and that enumerates within
+    timeout_s."""
+    boards = {}
+    serial_numbers = set()
+
+    def call_back(channel_metadata):
+        serial_number = channel_metadata.get("serial_number")
+        peer_ip = channel_metadata.get("peer_ip")
+        # Each data plane enumerates separately; we only need one.
+        if serial_number in serial_numbers:
+            return True
+        serial_numbers.add(serial_number)
+        if not programmer.supports(channel_metadata):
+            fpga_uuid = channel_metadata.get("fpga_uuid")
+            logging.info(f"Ignoring {peer_ip=} ({fpga_uuid}).")
+            return True
+        boards[peer_ip] = channel_metadata
+        return True
+
+    hololink_module.Enumerator.enumerated(call_back, hololink_module.Timeout(timeout_s))
+    return boards
+
+
+def _program_all(args, programmer):
+    """Program every supported board found by enumeration, all at once."""
+    boards = enumerate_boards(programmer, args.enumeration_timeout)
+    if len(boards) == 0:
+        raise Exception("No supported boards found.")
+    logging.info(f"Programming {sorted(boards)}.")
+    table = ProgressTable(boards)
+    errors = {}
+
+    def program(board, channel_metadata):
+        progress = table.progress(board)
+        # power_cycle finds the board again using args.hololink; don't
+        # let boards that need a manual power cycle prompt from each
+        # thread--nothing after this depends on it anyway.
+        board_args = argparse.Namespace(**vars(args))
+        board_args.hololink = board
+        board_args.skip_power_cycle = True
+        try:
+            progress("connecting", 0, 0.0)
+            hololink = programmer.hololink(channel_metadata)
+            try:
+                programmer.program_and_verify_images(hololink, progress)
+                progress("power cycle", 100, 0.0)
+                programmer.power_cycle(board_args, hololink)
+            finally:
+                hololink.stop()
+            progress("done", 100, 0.0)
+        except Exception as e:
+            logging.error(f"{board=} failed: {e} ({type(e)})")
+            errors[board] = e
+            progress(f"failed: {e}", 0, 0.0)
+
+    threads = [
+        threading.Thread(target=program, args=(board, channel_metadata), name=board)
+        for board, channel_metadata in boards.items()
+    ]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        table.show()
+        for thread in threads:
+            thread.join(timeout=args.progress_interval)
+            if thread.is_alive():
+                break
+    table.show()
+    if errors:
+        raise Exception(f"Programming failed for {sorted(errors)}.")
+
+
 def _program(args):
     logging.info("manifest=%s" % (args.manifest,))
     programmer = Programmer(args, args.manifest)
     programmer.fetch_manifest("hololink")
     programmer.check_eula(args)
     programmer.check_images()
+    if args.all:
+        _program_all(args, programmer)
+        return
     if args.force:
         channel_metadata = manual_enumeration(args)
     else:
@@ -995,6 +1225,28 @@ def main():
         help="Skip verify_stratix",
     )
 
+    program.add_argument(
+        "--differential",
+        action="store_true",
+        help="Read back each flash sector first, and only erase and write the sectors that differ from the new image; only those sectors are verified.",
+    )
+    program.add_argument(
+        "--all",
+        action="store_true",
+        help="Program every supported board that enumerates, concurrently, instead of just --hololink.",
+    )
+    program.add_argument(
+        "--enumeration-timeout",
+        type=float,
+        default=5.0,
+        help="With --all, how many seconds to spend finding boards.",
+    )
+    program.add_argument(
+        "--progress-interval",
+        type=float,
+        default=10.0,
+        help="With --all, how often (in seconds) to show the progress table.",
+    )
     program.add_argument(
         "--fpga-uuid",
         default="7a377bf7-76cb-4756-a4c5-7dddaed8354b",  # Stratix 10 HSB
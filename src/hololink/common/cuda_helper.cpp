@@ -16,7 +16,10 @@
  */
 
 #include "cuda_helper.hpp"
+#include "kernel_cache.hpp"
 
+#include <algorithm>
+#include <chrono>
 #include <memory>
 
 #include <nvrtc.h>
@@ -38,42 +41,119 @@
 
 namespace hololink::common {
 
+namespace {
+
+    // Compiles source, returning cubin or PTX.
+    std::string compile(const char* source, const std::vector<const char*>& compile_options, bool cubin)
+    {
+        nvrtcProgram prog;
+        NvRTCCheck(nvrtcCreateProgram(&prog, // prog
+            source, // buffer
+            "", // name
+            0, // numHeaders
+            NULL, // headers
+            NULL)); // includeNames
+        if (nvrtcCompileProgram(prog, compile_options.size(), compile_options.data()) != NVRTC_SUCCESS) {
+            // Obtain compilation log from the program.
+            size_t logSize;
+            NvRTCCheck(nvrtcGetProgramLogSize(prog, &logSize));
+            std::unique_ptr<char[]> log(new char[logSize]);
+            NvRTCCheck(nvrtcGetProgramLog(prog, log.get()));
+            nvrtcDestroyProgram(&prog);
+            std::stringstream buf;
+            buf << "Failed to compile: " << log.get();
+            throw std::runtime_error(buf.str().c_str());
+        }
+        // Obtain the cubin or PTX from the program; the PTX size
+        // includes the terminating NUL that cuModuleLoadDataEx needs.
+        size_t size;
+        std::string image;
+        if (cubin) {
+            NvRTCCheck(nvrtcGetCUBINSize(prog, &size));
+            image.resize(size);
+            NvRTCCheck(nvrtcGetCUBIN(prog, image.data()));
+        } else {
+            NvRTCCheck(nvrtcGetPTXSize(prog, &size));
+            image.resize(size);
+            NvRTCCheck(nvrtcGetPTX(prog, image.data()));
+        }
+        // Destroy the program.
+        NvRTCCheck(nvrtcDestroyProgram(&prog));
+        return image;
+    }
+
+    // If NVRTC can generate code for the current device, returns the
+    // option to do so, so that we can cache a cubin; otherwise
+    // returns an empty string and we'll use PTX.
+    std::string device_architecture_option(const std::vector<std::string>& options)
+    {
+        for (auto&& option : options) {
+            if ((option.rfind("-arch", 0) == 0) || (option.rfind("--gpu-architecture", 0) == 0)) {
+                return "";
+            }
+        }
+        CUdevice device;
+        CudaCheck(cuCtxGetDevice(&device));
+        int major = 0, minor = 0;
+        CudaCheck(cuDeviceGetAttribute(&major, CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR, device));
+        CudaCheck(cuDeviceGetAttribute(&minor, CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR, device));
+        int architecture = major * 10 + minor;
+        int count = 0;
+        NvRTCCheck(nvrtcGetNumSupportedArchs(&count));
+        std::vector<int> architectures(count);
+        NvRTCCheck(nvrtcGetSupportedArchs(architectures.data()));
+        if (std::find(architectures.begin(), architectures.end(), architecture) == architectures.end()) {
+            return "";
+        }
+        return fmt::format("--gpu-architecture=sm_{}", architecture);
+    }
+
+} // anonymous namespace
+
 CudaFunctionLauncher::CudaFunctionLauncher(const char* source,
     const std::vector<std::string>& functions, const std::vector<std::string>& options)
 {
-    nvrtcProgram prog;
-    NvRTCCheck(nvrtcCreateProgram(&prog, // prog
-        source, // buffer
-        "", // name
-        0, // numHeaders
-        NULL, // headers
-        NULL)); // includeNames
+    std::string architecture_option = device_architecture_option(options);
+    bool cubin = !architecture_option.empty();
     std::vector<const char*> compile_options;
     for (auto&& option : options) {
         compile_options.push_back(option.c_str());
     }
+    if (cubin) {
+        compile_options.push_back(architecture_option.c_str());
+    }
     compile_options.push_back("--include-path=/usr/local/cuda/include");
     compile_options.push_back("--include-path=/usr/local/cuda/include/cccl");
-    if (nvrtcCompileProgram(prog, compile_options.size(), compile_options.data()) != NVRTC_SUCCESS) {
-        // Obtain compilation log from the program.
-        size_t logSize;
-        NvRTCCheck(nvrtcGetProgramLogSize(prog, &logSize));
-        std::unique_ptr<char[]> log(new char[logSize]);
-        NvRTCCheck(nvrtcGetProgramLog(prog, log.get()));
-        std::stringstream buf;
-        buf << "Failed to compile: " << log.get();
-        throw std::runtime_error(buf.str().c_str());
+
+    // The cache key is everything that affects the compiler output.
+    int nvrtc_major = 0, nvrtc_minor = 0;
+    NvRTCCheck(nvrtcVersion(&nvrtc_major, &nvrtc_minor));
+    std::string key = fmt::format("nvrtc {}.{} {}\n", nvrtc_major, nvrtc_minor, cubin ? "cubin" : "ptx");
+    for (auto&& option : compile_options) {
+        key += option;
+        key += "\n";
     }
-    // Obtain PTX from the program.
-    size_t ptxSize;
-    NvRTCCheck(nvrtcGetPTXSize(prog, &ptxSize));
-    std::unique_ptr<char[]> ptx(new char[ptxSize]);
-    NvRTCCheck(nvrtcGetPTX(prog, ptx.get()));
-    // Destroy the program.
-    NvRTCCheck(nvrtcDestroyProgram(&prog));
-
-    // Load the generated PTX and get a handle to the kernels
-    CudaCheck(cuModuleLoadDataEx(&module_, ptx.get(), 0, 0, 0));
+    key += "\n";
+    key += source;
+    KernelCache& kernel_cache = KernelCache::get_default();
+    bool compiled = false;
+    auto start = std::chrono::steady_clock::now();
+    std::string image = kernel_cache.get(key, [&]() {
+        compiled = true;
+        return compile(source, compile_options, cubin);
+    });
+    double elapsed_ms = std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start).count();
+    KernelCache::Stats stats = kernel_cache.stats();
+    if (compiled) {
+        HSB_LOG_INFO("Compiled {} kernels in {:.3f}ms (hits={} misses={} cache=\"{}\").",
+            cubin ? "cubin" : "PTX", elapsed_ms, stats.hits, stats.misses, kernel_cache.directory());
+    } else {
+        HSB_LOG_DEBUG("Loaded {} kernels from the cache in {:.3f}ms (hits={} misses={}).",
+            cubin ? "cubin" : "PTX", elapsed_ms, stats.hits, stats.misses);
+    }
+
+    // Load the cubin or PTX and get a handle to the kernels
+    CudaCheck(cuModuleLoadDataEx(&module_, image.data(), 0, 0, 0));
     for (auto&& function : functions) {
         LaunchParams launch_params;
         CudaCheck(cuModuleGetFunction(&launch_params.function_, module_, function.c_str()));
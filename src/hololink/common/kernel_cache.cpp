@@ -0,0 +1,281 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "kernel_cache.hpp"
+
+#include <fcntl.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cstdlib>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <vector>
+
+#include <fmt/format.h>
+
+#include <hololink/core/logging_internal.hpp>
+
+namespace hololink::common {
+
+namespace {
+
+    namespace fs = std::filesystem;
+
+    // Each entry is MAGIC, the key size and image size as uint64_t, the
+    // key, then the image.
+    constexpr char MAGIC[8] = { 'H', 'S', 'B', 'K', 'C', '0', '0', '1' };
+    constexpr size_t HEADER_SIZE = sizeof(MAGIC) + 2 * sizeof(uint64_t);
+    constexpr const char* ENTRY_SUFFIX = ".kernel";
+    constexpr const char* TEMPORARY_SUFFIX = ".tmp";
+    // Temporary files older than this were left by a process that
+    // didn't finish writing them.
+    constexpr auto TEMPORARY_LIFETIME = std::chrono::hours(1);
+
+    uint64_t fnv1a(const std::string& s, uint64_t hash)
+    {
+        for (unsigned char c : s) {
+            hash ^= c;
+            hash *= 0x100000001b3ULL;
+        }
+        return hash;
+    }
+
+    bool ends_with(const std::string& s, const std::string& suffix)
+    {
+        return (s.size() >= suffix.size()) && (s.compare(s.size() - suffix.size(), suffix.size(), suffix) == 0);
+    }
+
+    double elapsed_s(std::chrono::steady_clock::time_point start)
+    {
+        return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+    }
+
+    std::string default_directory()
+    {
+        const char* directory = std::getenv("HOLOLINK_KERNEL_CACHE_DIR");
+        if (directory) {
+            return directory;
+        }
+        const char* xdg_cache_home = std::getenv("XDG_CACHE_HOME");
+        if (xdg_cache_home && xdg_cache_home[0]) {
+            return fmt::format("{}/hololink/kernels", xdg_cache_home);
+        }
+        const char* home = std::getenv("HOME");
+        if (home && home[0]) {
+            return fmt::format("{}/.cache/hololink/kernels", home);
+        }
+        return "";
+    }
+
+    uint64_t default_max_size()
+    {
+        const char* size = std::getenv("HOLOLINK_KERNEL_CACHE_SIZE");
+        if (size && size[0]) {
+            return std::strtoull(size, nullptr, 0);
+        }
+        return KernelCache::DEFAULT_MAX_SIZE;
+    }
+
+} // anonymous namespace
+
+KernelCache::KernelCache(std::string directory, uint64_t max_size)
+    : directory_(std::move(directory))
+    , max_size_(max_size)
+{
+}
+
+KernelCache& KernelCache::get_default()
+{
+    static KernelCache kernel_cache(default_directory(), default_max_size());
+    return kernel_cache;
+}
+
+std::string KernelCache::entry_name(const std::string& key)
+{
+    // Two FNV-1a hashes with different offset bases; collisions only
+    // cost a recompile, since the key is checked on load.
+    return fmt::format("{:016x}{:016x}{}", fnv1a(key, 0xcbf29ce484222325ULL),
+        fnv1a(key, 0x84222325cbf29ce4ULL), ENTRY_SUFFIX);
+}
+
+std::string KernelCache::get(const std::string& key, const Compiler& compile)
+{
+    std::string path;
+    if (!directory_.empty()) {
+        path = fmt::format("{}/{}", directory_, entry_name(key));
+        auto start = std::chrono::steady_clock::now();
+        auto image = load(path, key);
+        if (image) {
+            std::lock_guard lock(mutex_);
+            stats_.hits++;
+            stats_.load_s += elapsed_s(start);
+            return image.value();
+        }
+    }
+    auto start = std::chrono::steady_clock::now();
+    std::string image = compile();
+    {
+        std::lock_guard lock(mutex_);
+        stats_.misses++;
+        stats_.compile_s += elapsed_s(start);
+    }
+    if (!path.empty()) {
+        store(path, key, image);
+    }
+    return image;
+}
+
+KernelCache::Stats KernelCache::stats()
+{
+    std::lock_guard lock(mutex_);
+    return stats_;
+}
+
+std::optional<std::string> KernelCache::load(const std::string& path, const std::string& key)
+{
+    std::ifstream f(path, std::ios::binary | std::ios::ate);
+    if (!f) {
+        return {};
+    }
+    std::string content(static_cast<size_t>(f.tellg()), '\0');
+    f.seekg(0);
+    f.read(content.data(), content.size());
+    if (!f || (content.size() < HEADER_SIZE) || (std::memcmp(content.data(), MAGIC, sizeof(MAGIC)) != 0)) {
+        HSB_LOG_WARN("Ignoring invalid kernel cache entry \"{}\".", path);
+        std::lock_guard lock(mutex_);
+        stats_.errors++;
+        return {};
+    }
+    uint64_t key_size, image_size;
+    std::memcpy(&key_size, content.data() + sizeof(MAGIC), sizeof(key_size));
+    std::memcpy(&image_size, content.data() + sizeof(MAGIC) + sizeof(key_size), sizeof(image_size));
+    if ((content.size() - HEADER_SIZE != key_size + image_size)
+        || (content.compare(HEADER_SIZE, key_size, key) != 0)) {
+        // A hash collision, or a damaged entry; either way, storing
+        // the freshly compiled image will replace it.
+        HSB_LOG_DEBUG("Kernel cache entry \"{}\" doesn't match.", path);
+        return {};
+    }
+    // Mark this entry as recently used.
+    if (utimensat(AT_FDCWD, path.c_str(), nullptr, 0) != 0) {
+        HSB_LOG_DEBUG("utimensat \"{}\" failed, errno={}.", path, errno);
+    }
+    return content.substr(HEADER_SIZE + key_size);
+}
+
+void KernelCache::store(const std::string& path, const std::string& key, const std::string& image)
+{
+    static std::atomic<unsigned> sequence { 0 };
+    std::error_code ec;
+    fs::create_directories(directory_, ec);
+    if (ec) {
+        HSB_LOG_WARN("Unable to create kernel cache directory \"{}\": {}.", directory_, ec.message());
+        std::lock_guard lock(mutex_);
+        stats_.errors++;
+        return;
+    }
+    // Write to a name no other writer is using, then rename it into
+    // place, so readers only ever see complete entries.
+    std::string temporary = fmt::format("{}.{}.{}{}", path, getpid(), sequence++, TEMPORARY_SUFFIX);
+    {
+        std::ofstream f(temporary, std::ios::binary | std::ios::trunc);
+        uint64_t key_size = key.size(), image_size = image.size();
+        f.write(MAGIC, sizeof(MAGIC));
+        f.write(reinterpret_cast<const char*>(&key_size), sizeof(key_size));
+        f.write(reinterpret_cast<const char*>(&image_size), sizeof(image_size));
+        f.write(key.data(), key.size());
+        f.write(image.data(), image.size());
+        f.close();
+        if (!f) {
+            HSB_LOG_WARN("Unable to write kernel cache entry \"{}\".", temporary);
+            fs::remove(temporary, ec);
+            std::lock_guard lock(mutex_);
+            stats_.errors++;
+            return;
+        }
+    }
+    fs::rename(temporary, path, ec);
+    if (ec) {
+        HSB_LOG_WARN("Unable to rename \"{}\" to \"{}\": {}.", temporary, path, ec.message());
+        fs::remove(temporary, ec);
+        std::lock_guard lock(mutex_);
+        stats_.errors++;
+        return;
+    }
+    evict();
+}
+
+void KernelCache::evict()
+{
+    struct Entry {
+        fs::file_time_type time;
+        uint64_t size;
+        fs::path path;
+    };
+    std::vector<Entry> entries;
+    uint64_t total_size = 0;
+    auto now = fs::file_time_type::clock::now();
+    std::error_code ec;
+    for (fs::directory_iterator it(directory_, ec), end; !ec && (it != end); it.increment(ec)) {
+        std::error_code entry_ec;
+        std::string name = it->path().filename().string();
+        auto time = it->last_write_time(entry_ec);
+        if (entry_ec) {
+            continue; // removed by someone else
+        }
+        if (ends_with(name, TEMPORARY_SUFFIX)) {
+            if (now - time > TEMPORARY_LIFETIME) {
+                fs::remove(it->path(), entry_ec);
+            }
+            continue;
+        }
+        if (!ends_with(name, ENTRY_SUFFIX)) {
+            continue;
+        }
+        uint64_t size = it->file_size(entry_ec);
+        if (entry_ec) {
+            continue;
+        }
+        entries.push_back({ time, size, it->path() });
+        total_size += size;
+    }
+    if (total_size <= max_size_) {
+        return;
+    }
+    // Remove the least recently used entries, but always keep the
+    // newest one, which is the entry just stored.
+    std::sort(entries.begin(), entries.end(),
+        [](const Entry& a, const Entry& b) { return a.time < b.time; });
+    uint64_t evictions = 0;
+    for (size_t i = 0; (i + 1 < entries.size()) && (total_size > max_size_); i++) {
+        if (fs::remove(entries[i].path, ec)) {
+            HSB_LOG_DEBUG("Evicted kernel cache entry \"{}\".", entries[i].path.string());
+            evictions++;
+        }
+        // Whether we removed it or another process did, it's gone.
+        total_size -= entries[i].size;
+    }
+    std::lock_guard lock(mutex_);
+    stats_.evictions += evictions;
+}
+
+} // namespace hololink::common
@@ -0,0 +1,102 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef SRC_HOLOLINK_COMMON_KERNEL_CACHE
+#define SRC_HOLOLINK_COMMON_KERNEL_CACHE
+
+#include <cstdint>
+#include <functional>
+#include <mutex>
+#include <optional>
+#include <string>
+
+namespace hololink::common {
+
+/**
+ * Content addressed, on-disk cache of compiled kernel images (PTX or
+ * cubin), so that CudaFunctionLauncher doesn't run NVRTC each time an
+ * operator starts. Entries are named by a hash of the key, which is
+ * everything that affects the compiler output (source, options,
+ * target architecture, compiler version), and hold the key itself,
+ * which is checked on load. Entries are written to a temporary file
+ * and renamed into place, so any number of processes can share a
+ * cache directory; a hit updates the entry's modification time, and
+ * when the directory grows past max_size, the least recently used
+ * entries are removed. Failing to read or write the cache is never
+ * fatal: the image is just compiled again.
+ */
+class KernelCache {
+public:
+    struct Stats {
+        uint64_t hits = 0;
+        uint64_t misses = 0;
+        uint64_t evictions = 0;
+        uint64_t errors = 0;
+        // Total time spent in the compiler, and in loading hits.
+        double compile_s = 0;
+        double load_s = 0;
+    };
+
+    using Compiler = std::function<std::string()>;
+
+    static constexpr uint64_t DEFAULT_MAX_SIZE = 64 * 1024 * 1024;
+
+    /**
+     * @param directory Where to keep entries; created on first store.
+     * An empty directory disables the cache, so every lookup compiles.
+     * @param max_size Limit, in bytes, on the size of all entries.
+     */
+    explicit KernelCache(std::string directory, uint64_t max_size = DEFAULT_MAX_SIZE);
+
+    /**
+     * The cache CudaFunctionLauncher uses. Its directory is
+     * HOLOLINK_KERNEL_CACHE_DIR if that's set (set it to "" to disable
+     * caching), otherwise $XDG_CACHE_HOME/hololink/kernels, with
+     * XDG_CACHE_HOME defaulting to $HOME/.cache. Set
+     * HOLOLINK_KERNEL_CACHE_SIZE to change the size limit.
+     */
+    static KernelCache& get_default();
+
+    /**
+     * @returns the image stored for key, or the result of compile(),
+     * which is then stored. Exceptions from compile are passed to the
+     * caller, and nothing is stored.
+     */
+    std::string get(const std::string& key, const Compiler& compile);
+
+    Stats stats();
+    const std::string& directory() const { return directory_; }
+
+    /**
+     * The name (without directory) of the file that key is stored in.
+     */
+    static std::string entry_name(const std::string& key);
+
+private:
+    std::optional<std::string> load(const std::string& path, const std::string& key);
+    void store(const std::string& path, const std::string& key, const std::string& image);
+    void evict();
+
+    const std::string directory_;
+    const uint64_t max_size_;
+    std::mutex mutex_;
+    Stats stats_;
+};
+
+} // namespace hololink::common
+
+#endif /* SRC_HOLOLINK_COMMON_KERNEL_CACHE */
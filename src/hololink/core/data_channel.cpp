@@ -90,6 +90,9 @@ void DataChannel::initialize(const Metadata& metadata, std::shared_ptr<Hololink>
     }
     fpga_uuid_ = metadata.get<std::string>("fpga_uuid").value();
     packetizer_program_ = std::make_shared<NullPacketizerProgram>();
+    // Data plane configuration is only changed by the host.
+    hololink_->declare_host_owned(hif_address_ + DP_PACKET_SIZE, DP_VP_MASK + 4 - DP_PACKET_SIZE);
+    hololink_->declare_host_owned(vp_address_ + DP_QP, DP_HOST_UDP_PORT + 4 - DP_QP);
 }
 
 /*static*/ bool DataChannel::enumerated(const Metadata& metadata)
@@ -185,13 +188,15 @@ void DataChannel::configure_common(uint32_t frame_size, uint32_t overhead, uint3
     }
 
 #define PAGES(x) ((x) >> 7)
-    hololink_->write_uint32(hif_address_ + DP_PACKET_SIZE, PAGES(payload_size));
-    hololink_->write_uint32(hif_address_ + DP_PACKET_UDP_PORT, DATA_SOURCE_UDP_PORT);
-    hololink_->write_uint32(vp_address_ + DP_BUFFER_LENGTH, frame_size);
-    hololink_->write_uint32(vp_address_ + DP_HOST_MAC_LOW, mac_low);
-    hololink_->write_uint32(vp_address_ + DP_HOST_MAC_HIGH, mac_high);
-    hololink_->write_uint32(vp_address_ + DP_HOST_IP, ip);
-    hololink_->write_uint32(vp_address_ + DP_HOST_UDP_PORT, udp_port);
+    Hololink::WriteData write_data;
+    write_data.queue_write_uint32(hif_address_ + DP_PACKET_SIZE, PAGES(payload_size));
+    write_data.queue_write_uint32(hif_address_ + DP_PACKET_UDP_PORT, DATA_SOURCE_UDP_PORT);
+    write_data.queue_write_uint32(vp_address_ + DP_BUFFER_LENGTH, frame_size);
+    write_data.queue_write_uint32(vp_address_ + DP_HOST_MAC_LOW, mac_low);
+    write_data.queue_write_uint32(vp_address_ + DP_HOST_MAC_HIGH, mac_high);
+    write_data.queue_write_uint32(vp_address_ + DP_HOST_IP, ip);
+    write_data.queue_write_uint32(vp_address_ + DP_HOST_UDP_PORT, udp_port);
+    hololink_->write_uint32(write_data);
 
     // Enable the current packetizer program.
     packetizer_program_->enable(*hololink_, sif_address_);
@@ -230,13 +235,15 @@ void DataChannel::configure_roce(uint64_t frame_memory, size_t frame_size, size_
 
     const uint32_t roce_overhead = 74;
     configure_common(frame_size, roce_overhead, local_data_port);
-    hololink_->write_uint32(vp_address_ + DP_QP, qp_number_);
-    hololink_->write_uint32(vp_address_ + DP_RKEY, rkey_);
-    hololink_->write_uint32(vp_address_ + DP_ADDRESS_0, (pages > 0) ? PAGES(frame_memory) : 0);
-    hololink_->write_uint32(vp_address_ + DP_ADDRESS_1, (pages > 1) ? PAGES(frame_memory + page_size) : 0);
-    hololink_->write_uint32(vp_address_ + DP_ADDRESS_2, (pages > 2) ? PAGES(frame_memory + (page_size * 2)) : 0);
-    hololink_->write_uint32(vp_address_ + DP_ADDRESS_3, (pages > 3) ? PAGES(frame_memory + (page_size * 3)) : 0);
-    hololink_->write_uint32(vp_address_ + DP_BUFFER_MASK, (1 << pages) - 1);
+    Hololink::WriteData write_data;
+    write_data.queue_write_uint32(vp_address_ + DP_QP, qp_number_);
+    write_data.queue_write_uint32(vp_address_ + DP_RKEY, rkey_);
+    write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_0, (pages > 0) ? PAGES(frame_memory) : 0);
+    write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_1, (pages > 1) ? PAGES(frame_memory + page_size) : 0);
+    write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_2, (pages > 2) ? PAGES(frame_memory + (page_size * 2)) : 0);
+    write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_3, (pages > 3) ? PAGES(frame_memory + (page_size * 3)) : 0);
+    write_data.queue_write_uint32(vp_address_ + DP_BUFFER_MASK, (1 << pages) - 1);
+    hololink_->write_uint32(write_data);
 
     // Restore the DP_VP_MASK to re-enable the sensor.
     hololink_->or_uint32(hif_address_ + DP_VP_MASK, vp_mask_);
@@ -292,18 +299,20 @@ void DataChannel::unconfigure()
         // Let any in-transit data flush out.
         std::this_thread::sleep_for(std::chrono::milliseconds(10));
         // Clear the ROCE configuration.
-        hololink_->write_uint32(vp_address_ + DP_BUFFER_MASK, 0);
-        hololink_->write_uint32(vp_address_ + DP_BUFFER_LENGTH, 0);
-        hololink_->write_uint32(vp_address_ + DP_QP, 0);
-        hololink_->write_uint32(vp_address_ + DP_RKEY, 0);
-        hololink_->write_uint32(vp_address_ + DP_ADDRESS_0, 0);
-        hololink_->write_uint32(vp_address_ + DP_ADDRESS_1, 0);
-        hololink_->write_uint32(vp_address_ + DP_ADDRESS_2, 0);
-        hololink_->write_uint32(vp_address_ + DP_ADDRESS_3, 0);
-        hololink_->write_uint32(vp_address_ + DP_HOST_MAC_LOW, 0);
-        hololink_->write_uint32(vp_address_ + DP_HOST_MAC_HIGH, 0);
-        hololink_->write_uint32(vp_address_ + DP_HOST_IP, 0);
-        hololink_->write_uint32(vp_address_ + DP_HOST_UDP_PORT, 0);
+        Hololink::WriteData write_data;
+        write_data.queue_write_uint32(vp_address_ + DP_BUFFER_MASK, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_BUFFER_LENGTH, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_QP, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_RKEY, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_0, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_1, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_2, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_ADDRESS_3, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_HOST_MAC_LOW, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_HOST_MAC_HIGH, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_HOST_IP, 0);
+        write_data.queue_write_uint32(vp_address_ + DP_HOST_UDP_PORT, 0);
+        hololink_->write_uint32(write_data);
     } else {
         // skip for now as this causes to lose ping on vb1940-aio
     }
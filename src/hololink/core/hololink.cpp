@@ -104,6 +104,17 @@ namespace {
     // of any of those buffers.
     constexpr uint32_t CONTROL_PACKET_SIZE = 1472;
 
+    // A WR_BLOCK or RD_BLOCK request has a 6-byte header followed by
+    // 8 bytes (address and value) for each word.
+    static_assert(CONTROL_BLOCK_WORDS == (CONTROL_PACKET_SIZE - 6) / 8);
+
+    // Sequencer memory available to the software event program, in words.
+    constexpr unsigned SEQUENCER_LIMIT = 0x200;
+
+    // How long an I2C transaction waits for its I2C_BUSY async event
+    // before going back to polling the status register.
+    constexpr auto I2C_EVENT_FALLBACK = std::chrono::milliseconds(20);
+
 } // anonymous namespace
 
 Hololink::Hololink(
@@ -301,6 +312,9 @@ void Hololink::seed_arp(const Metadata& channel_metadata)
 
 void Hololink::post_reset_configuration()
 {
+    // Registers are back to their reset values.
+    invalidate_register_cache();
+
     // Necessary for e.g. I2C or SPI to work.
     configure_hsb();
 
@@ -312,6 +326,7 @@ void Hololink::post_reset_configuration()
 
 void Hololink::reset()
 {
+    invalidate_register_cache();
     trigger_reset();
 
     // Now wait for the device to come back up.
@@ -366,7 +381,7 @@ bool Hololink::write_uint32(
     return write_uint32(data, in_timeout, retry, sequence_check);
 }
 
-bool Hololink::write_uint32(Hololink::WriteData& write_data, const std::shared_ptr<Timeout> in_timeout, bool retry, bool sequence_check)
+bool Hololink::write_uint32(Hololink::WriteData& in_write_data, const std::shared_ptr<Timeout> in_timeout, bool retry, bool sequence_check)
 {
     std::shared_ptr<Timeout> timeout = Timeout::default_timeout(in_timeout);
     bool current_sequence_check = sequence_check;
@@ -375,11 +390,39 @@ bool Hololink::write_uint32(Hololink::WriteData& write_data, const std::shared_p
     // in other words we need to inhibit other threads from sending
     // a command until we receive the response for the current one.
     std::lock_guard lock(execute_mutex_);
+    // Whoever writes a GPIO direction register, GPIO reads it again
+    // before relying on it.
+    if (!gpio_directions_.empty()) {
+        for (const auto& [address, value] : in_write_data.data_) {
+            gpio_directions_.erase(address);
+        }
+    }
+    // With the register cache, only send the writes that change something.
+    Hololink::WriteData cache_misses;
+    if (register_cache_enable_) {
+        for (const auto& [address, value] : in_write_data.data_) {
+            if (cacheable(address, lock)) {
+                auto cached = register_cache_.find(address);
+                if ((cached != register_cache_.end()) && (cached->second == value)) {
+                    register_cache_elided_writes_++;
+                    continue;
+                }
+                // We don't know what's there until this write succeeds.
+                register_cache_.erase(address);
+            }
+            cache_misses.queue_write_uint32(address, value);
+        }
+        if (cache_misses.size() == 0) {
+            return true;
+        }
+    }
+    Hololink::WriteData& write_data = register_cache_enable_ ? cache_misses : in_write_data;
     if (block_enable_) {
         const uint16_t sequence = next_sequence(lock);
         while (true) {
             bool status = write_uint32_block_(write_data, timeout, retry, sequence, current_sequence_check, lock);
             if (status) {
+                update_register_cache(write_data, lock);
                 return status;
             }
             if (!retry) {
@@ -418,10 +461,85 @@ bool Hololink::write_uint32(Hololink::WriteData& write_data, const std::shared_p
                 current_sequence_check = false;
             }
         }
+        update_register_cache(write_data, lock);
         return true;
     }
 }
 
+bool Hololink::cacheable(uint32_t address, std::lock_guard<std::mutex>&)
+{
+    for (const auto& [start, size] : host_owned_) {
+        if ((address >= start) && (address - start < size)) {
+            return true;
+        }
+    }
+    return false;
+}
+
+void Hololink::update_register_cache(const Hololink::WriteData& write_data, std::lock_guard<std::mutex>& lock)
+{
+    if (!register_cache_enable_) {
+        return;
+    }
+    for (const auto& [address, value] : write_data.data_) {
+        if (cacheable(address, lock)) {
+            register_cache_[address] = value;
+        }
+    }
+}
+
+void Hololink::set_register_cache_enable(bool register_cache_enable)
+{
+    std::lock_guard lock(execute_mutex_);
+    register_cache_enable_ = register_cache_enable;
+    register_cache_.clear();
+}
+
+bool Hololink::get_register_cache_enable()
+{
+    std::lock_guard lock(execute_mutex_);
+    return register_cache_enable_;
+}
+
+void Hololink::declare_host_owned(uint32_t address, uint32_t size)
+{
+    std::lock_guard lock(execute_mutex_);
+    std::pair<uint32_t, uint32_t> range { address, size };
+    if (std::find(host_owned_.begin(), host_owned_.end(), range) == host_owned_.end()) {
+        host_owned_.push_back(range);
+    }
+}
+
+std::optional<uint32_t> Hololink::get_cached_uint32(uint32_t address)
+{
+    std::lock_guard lock(execute_mutex_);
+    auto cached = register_cache_.find(address);
+    if (cached == register_cache_.end()) {
+        return {};
+    }
+    register_cache_hits_++;
+    return cached->second;
+}
+
+void Hololink::invalidate_register_cache()
+{
+    std::lock_guard lock(execute_mutex_);
+    register_cache_.clear();
+    gpio_directions_.clear();
+}
+
+uint64_t Hololink::get_register_cache_hits()
+{
+    std::lock_guard lock(execute_mutex_);
+    return register_cache_hits_;
+}
+
+uint64_t Hololink::get_register_cache_elided_writes()
+{
+    std::lock_guard lock(execute_mutex_);
+    return register_cache_elided_writes_;
+}
+
 bool Hololink::write_uint32_block_(Hololink::WriteData write_data,
     const std::shared_ptr<Timeout>& timeout, bool response_expected, uint16_t sequence, bool sequence_check, std::lock_guard<std::mutex>& lock)
 {
@@ -562,10 +680,21 @@ uint32_t Hololink::read_uint32(uint32_t address, const std::shared_ptr<Timeout>&
     // in other words we need to inhibit other threads from sending
     // a command until we receive the response for the current one.
     std::lock_guard lock(execute_mutex_);
+    bool cache = register_cache_enable_ && cacheable(address, lock);
+    if (cache) {
+        auto cached = register_cache_.find(address);
+        if (cached != register_cache_.end()) {
+            register_cache_hits_++;
+            return cached->second;
+        }
+    }
     const uint16_t sequence = next_sequence(lock);
     while (true) {
         auto [status, value] = read_uint32_(address, timeout, sequence, current_sequence_check, lock);
         if (status) {
+            if (cache) {
+                register_cache_[address] = value.value();
+            }
             return value.value();
         }
         if (!timeout->retry()) {
@@ -632,18 +761,28 @@ std::tuple<bool, std::optional<uint32_t>> Hololink::read_uint32_(
 }
 
 std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32(uint32_t address, uint32_t count, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
+{
+    std::vector<uint32_t> addresses(count);
+    for (unsigned i = 0; i < count; i++) {
+        addresses[i] = address + i * 4;
+    }
+    return read_uint32(addresses, in_timeout, sequence_check);
+}
+
+std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32(const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
 {
     // in_timeout may be nullptr
     std::shared_ptr<Timeout> timeout = Timeout::default_timeout(in_timeout);
     if (block_enable_) {
-        return read_uint32_block_(address, count, timeout, sequence_check);
+        return read_uint32_block_(addresses, timeout, sequence_check);
     } else {
-        return read_uint32_singly_(address, count, timeout, sequence_check);
+        return read_uint32_singly_(addresses, timeout, sequence_check);
     }
 }
 
-std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_singly_(uint32_t address, uint32_t count, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
+std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_singly_(const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
 {
+    const unsigned count = addresses.size();
     std::vector<uint32_t> r(count);
     bool current_sequence_check = sequence_check;
     ReadRetryMonitor read_retries(*this);
@@ -651,14 +790,14 @@ std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_singly_(uint32_t a
     // in other words we need to inhibit other threads from sending
     // a command until we receive the response for the current one.
     std::lock_guard lock(execute_mutex_);
-    for (unsigned i = 0, n = 0; n < count; n++, i += 4) {
+    for (unsigned n = 0; n < count; n++) {
         // Timeout has state that changes as it's used, so let's make a new
         // copy each iteration.
         std::shared_ptr<Timeout> in_timeout_copy = std::make_shared<Timeout>(*in_timeout);
         std::shared_ptr<Timeout> timeout = Timeout::default_timeout(in_timeout_copy);
         const uint16_t sequence = next_sequence(lock);
         while (true) {
-            auto [status, value] = read_uint32_(address + i, timeout, sequence, current_sequence_check, lock);
+            auto [status, value] = read_uint32_(addresses[n], timeout, sequence, current_sequence_check, lock);
             if (status) {
                 r[n] = value.value();
                 break;
@@ -674,12 +813,15 @@ std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_singly_(uint32_t a
     return { true, r };
 }
 
-std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_block_(uint32_t address, uint32_t count, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
+std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_block_(const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
 {
-    HSB_LOG_DEBUG("read_uint32_block(address={:#x}, count={:#x})", address, count);
-    if ((address & 3) != 0) {
-        throw std::runtime_error(
-            fmt::format("Invalid address \"{:#x}\", has to be a multiple of four", address));
+    const unsigned count = addresses.size();
+    HSB_LOG_DEBUG("read_uint32_block(address={:#x}, count={:#x})", count ? addresses[0] : 0, count);
+    for (const auto& address : addresses) {
+        if ((address & 3) != 0) {
+            throw std::runtime_error(
+                fmt::format("Invalid address \"{:#x}\", has to be a multiple of four", address));
+        }
     }
     std::shared_ptr<Timeout> timeout = Timeout::default_timeout(in_timeout);
     // Serialize
@@ -697,7 +839,7 @@ std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_block_(uint32_t ad
         throw std::runtime_error("Unable to serialize");
     }
     for (unsigned i = 0; i < count; i++) {
-        if (!(serializer.append_uint32_be(address + i * 4)
+        if (!(serializer.append_uint32_be(addresses[i])
                 && serializer.append_uint32_be(0))) {
             throw std::runtime_error("Unable to serialize addresses");
         }
@@ -732,7 +874,7 @@ std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_block_(uint32_t ad
                     && deserializer->next_uint32_be(value))) {
                 throw std::runtime_error("Unable to deserialize block");
             }
-            if (response_address != (address + i * 4)) {
+            if (response_address != addresses[i]) {
                 throw std::runtime_error("Unexpected response address");
             }
             result[i] = value;
@@ -745,6 +887,253 @@ std::tuple<bool, std::vector<uint32_t>> Hololink::read_uint32_block_(uint32_t ad
     }
 }
 
+std::shared_future<bool> Hololink::write_uint32_async(uint32_t address, uint32_t value,
+    const std::shared_ptr<Timeout>& in_timeout, bool retry, bool sequence_check)
+{
+    HSB_LOG_DEBUG("write_uint32_async(address={:#x}, value={:#x})", address, value);
+    if ((address & 3) != 0) {
+        throw std::runtime_error(
+            fmt::format("Invalid address \"{:#x}\", has to be a multiple of four", address));
+    }
+    auto pending = std::make_shared<PendingControl>();
+    pending->description = fmt::format("write_uint32 address={:#X} value={:#X}", address, value);
+    pending->retry = retry;
+    pending->timeout = Timeout::default_timeout(in_timeout);
+    {
+        std::lock_guard lock(execute_mutex_);
+        // Pipelined writes bypass the register cache.
+        register_cache_.erase(address);
+        gpio_directions_.erase(address);
+        pending->sequence = next_sequence(lock);
+        pending->request.resize(CONTROL_PACKET_SIZE);
+        core::Serializer serializer(pending->request.data(), pending->request.size());
+        uint8_t flags = REQUEST_FLAGS_ACK_REQUEST;
+        if (sequence_check) {
+            flags |= REQUEST_FLAGS_SEQUENCE_CHECK;
+        }
+        if (!(serializer.append_uint8(WR_DWORD) && serializer.append_uint8(flags)
+                && serializer.append_uint16_be(pending->sequence) && serializer.append_uint8(0) // reserved
+                && serializer.append_uint8(0) // reserved
+                && serializer.append_uint32_be(address) && serializer.append_uint32_be(value))) {
+            throw std::runtime_error("Unable to serialize");
+        }
+        pending->request.resize(serializer.length());
+        submit_control(pending, lock);
+    }
+    return std::async(std::launch::deferred, [this, pending]() {
+        wait_pending_control(pending);
+        return pending->status;
+    }).share();
+}
+
+std::shared_future<uint32_t> Hololink::read_uint32_async(
+    uint32_t address, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check)
+{
+    HSB_LOG_DEBUG("read_uint32_async(address={:#x})", address);
+    if ((address & 3) != 0) {
+        throw std::runtime_error(
+            fmt::format("Invalid address \"{:#x}\", has to be a multiple of four", address));
+    }
+    auto pending = std::make_shared<PendingControl>();
+    pending->description = fmt::format("read_uint32 address={:#x}", address);
+    pending->read = true;
+    pending->timeout = Timeout::default_timeout(in_timeout);
+    {
+        std::lock_guard lock(execute_mutex_);
+        pending->sequence = next_sequence(lock);
+        pending->request.resize(CONTROL_PACKET_SIZE);
+        core::Serializer serializer(pending->request.data(), pending->request.size());
+        uint8_t flags = REQUEST_FLAGS_ACK_REQUEST;
+        if (sequence_check) {
+            flags |= REQUEST_FLAGS_SEQUENCE_CHECK;
+        }
+        if (!(serializer.append_uint8(RD_DWORD) && serializer.append_uint8(flags)
+                && serializer.append_uint16_be(pending->sequence) && serializer.append_uint8(0) // reserved
+                && serializer.append_uint8(0) // reserved
+                && serializer.append_uint32_be(address))) {
+            throw std::runtime_error("Unable to serialize");
+        }
+        pending->request.resize(serializer.length());
+        submit_control(pending, lock);
+    }
+    return std::async(std::launch::deferred, [this, pending]() {
+        wait_pending_control(pending);
+        return pending->value;
+    }).share();
+}
+
+void Hololink::flush_control()
+{
+    std::lock_guard lock(execute_mutex_);
+    while (!pending_control_.empty()) {
+        receive_pending_control(lock);
+    }
+}
+
+void Hololink::set_control_window(unsigned control_window)
+{
+    if (control_window < 1) {
+        throw std::runtime_error(fmt::format("Invalid control_window={}; at least 1 is required.", control_window));
+    }
+    std::lock_guard lock(execute_mutex_);
+    control_window_ = control_window;
+}
+
+void Hololink::set_i2c_event_enable(bool i2c_event_enable)
+{
+    std::lock_guard lock(i2c_event_mutex_);
+    i2c_event_enable_ = i2c_event_enable;
+}
+
+bool Hololink::get_i2c_event_enable()
+{
+    std::lock_guard lock(i2c_event_mutex_);
+    return i2c_event_enable_;
+}
+
+uint64_t Hololink::get_i2c_event_count()
+{
+    std::lock_guard lock(i2c_event_mutex_);
+    return i2c_event_count_;
+}
+
+uint64_t Hololink::get_i2c_event_fallback_count()
+{
+    std::lock_guard lock(i2c_event_mutex_);
+    return i2c_event_fallback_count_;
+}
+
+uint64_t Hololink::wait_i2c_event(uint64_t count, const std::shared_ptr<Timeout>& timeout)
+{
+    std::unique_lock lock(i2c_event_mutex_);
+    // Until we know HSB sends events to us, poll.
+    if (!(i2c_event_enable_ && i2c_events_seen_)) {
+        return i2c_event_count_;
+    }
+    auto wait = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+        std::chrono::duration<float>(std::max(timeout->trigger_s(), 0.f)));
+    if (wait > I2C_EVENT_FALLBACK) {
+        wait = I2C_EVENT_FALLBACK;
+    }
+    bool received = i2c_event_condition_.wait_for(lock, wait,
+        [&] { return i2c_event_count_ > count; });
+    if (!received) {
+        // A lost or late event packet; poll until we see another one.
+        HSB_LOG_DEBUG("No I2C event received; falling back to polling.");
+        i2c_events_seen_ = false;
+        i2c_event_fallback_count_++;
+    }
+    return i2c_event_count_;
+}
+
+void Hololink::submit_control(const std::shared_ptr<PendingControl>& pending, std::lock_guard<std::mutex>& lock)
+{
+    while (pending_control_.size() >= control_window_) {
+        receive_pending_control(lock);
+    }
+    if (sequence_resync_) {
+        pending->request[1] &= ~REQUEST_FLAGS_SEQUENCE_CHECK;
+        sequence_resync_ = false;
+    }
+    HSB_LOG_TRACE("Sending request={}", pending->request);
+    pending->request_time = Timeout::now_s();
+    send_control(pending->request);
+    pending_control_.push_back(pending);
+}
+
+void Hololink::receive_pending_control(std::lock_guard<std::mutex>&)
+{
+    std::shared_ptr<PendingControl> oldest = pending_control_.front();
+    std::vector<uint8_t> reply = receive_control(oldest->timeout);
+    double reply_time = Timeout::now_s();
+    if (reply.empty()) {
+        // The oldest request timed out.
+        executed(oldest->request_time, oldest->request, reply_time, reply);
+        if (!(oldest->retry && oldest->timeout->retry())) {
+            if (oldest->retry) {
+                oldest->exception = std::make_exception_ptr(TimeoutError(oldest->description));
+            }
+            oldest->done = true;
+            pending_control_.pop_front();
+        }
+        // If HSB never saw that request, sequence checking will reject
+        // everything we sent after it.  So just like the blocking calls
+        // do on retry, send everything outstanding again without
+        // sequence checking.
+        for (auto& pending : pending_control_) {
+            if (pending->read) {
+                add_read_retries(1);
+            } else {
+                add_write_retries(1);
+            }
+            pending->request[1] &= ~REQUEST_FLAGS_SEQUENCE_CHECK;
+            pending->request_time = Timeout::now_s();
+            send_control(pending->request);
+        }
+        // HSB now expects the sequence number after the last request
+        // we retried, which is behind ours if later requests already
+        // completed (e.g. only the oldest reply was lost).
+        sequence_resync_ = true;
+        return;
+    }
+    core::Deserializer deserializer(reply.data(), reply.size());
+    uint8_t dummy;
+    uint16_t reply_sequence = 0;
+    uint8_t response_code = 0;
+    if (!(deserializer.next_uint8(dummy) /* reply_cmd_code */
+            && deserializer.next_uint8(dummy) /* reply_flags */
+            && deserializer.next_uint16_be(reply_sequence)
+            && deserializer.next_uint8(response_code))) {
+        throw std::runtime_error("Unable to deserialize");
+    }
+    auto it = std::find_if(pending_control_.begin(), pending_control_.end(),
+        [reply_sequence](const std::shared_ptr<PendingControl>& pending) {
+            return pending->sequence == reply_sequence;
+        });
+    if (it == pending_control_.end()) {
+        // e.g. the reply to a request we've already retried.
+        HSB_LOG_TRACE("Ignoring reply_sequence={}", reply_sequence);
+        return;
+    }
+    std::shared_ptr<PendingControl> pending = *it;
+    executed(pending->request_time, pending->request, reply_time, reply);
+    if ((response_code == RESPONSE_SEQUENCE_CHECK_FAIL) && (pending != oldest)) {
+        // An earlier request was lost; this one is sent again
+        // when that one times out.
+        return;
+    }
+    pending_control_.erase(it);
+    pending->done = true;
+    if (response_code != RESPONSE_SUCCESS) {
+        pending->exception = std::make_exception_ptr(std::runtime_error(
+            fmt::format("{} response_code={:#X}({})", pending->description,
+                response_code, response_code_description(response_code))));
+        return;
+    }
+    if (pending->read) {
+        uint8_t reserved;
+        uint32_t response_address;
+        if (!(deserializer.next_uint8(reserved) /* reserved */
+                && deserializer.next_uint32_be(response_address) /* address */
+                && deserializer.next_uint32_be(pending->value))) {
+            pending->exception = std::make_exception_ptr(std::runtime_error("Unable to deserialize"));
+            return;
+        }
+    }
+    pending->status = true;
+}
+
+void Hololink::wait_pending_control(const std::shared_ptr<PendingControl>& pending)
+{
+    std::lock_guard lock(execute_mutex_);
+    while (!pending->done) {
+        receive_pending_control(lock);
+    }
+    if (pending->exception) {
+        std::rethrow_exception(pending->exception);
+    }
+}
+
 uint16_t Hololink::next_sequence(std::lock_guard<std::mutex>&)
 {
     uint16_t r = sequence_;
@@ -754,12 +1143,23 @@ uint16_t Hololink::next_sequence(std::lock_guard<std::mutex>&)
 
 std::tuple<bool, std::optional<uint32_t>, std::shared_ptr<core::Deserializer>> Hololink::execute(
     uint16_t sequence, const std::vector<uint8_t>& request, std::vector<uint8_t>& reply,
-    const std::shared_ptr<Timeout>& timeout, std::lock_guard<std::mutex>&)
+    const std::shared_ptr<Timeout>& timeout, std::lock_guard<std::mutex>& lock)
 {
+    // Don't let pipelined replies get mixed up with ours.
+    while (!pending_control_.empty()) {
+        receive_pending_control(lock);
+    }
     HSB_LOG_TRACE("Sending request={}", request);
     double request_time = Timeout::now_s();
 
-    send_control(request);
+    if (sequence_resync_) {
+        std::vector<uint8_t> unchecked_request(request);
+        unchecked_request[1] &= ~REQUEST_FLAGS_SEQUENCE_CHECK;
+        sequence_resync_ = false;
+        send_control(unchecked_request);
+    } else {
+        send_control(request);
+    }
     while (true) {
         reply = receive_control(timeout);
         double reply_time = Timeout::now_s();
@@ -1201,28 +1601,45 @@ public:
         auto [write_indexes, read_indexes, status_index] = encode_i2c_request(
             *sequencer, peripheral_i2c_address, write_bytes, read_byte_count);
         std::lock_guard lock(i2c_lock());
-        sequencer->enable();
-        Hololink::WriteData write_data;
-        hololink_.configure_apb_event(write_data, Hololink::Event::I2C_BUSY);
-        write_data.queue_write_uint32(CTRL_EVT_SW_EVENT, 1);
-        write_data.queue_write_uint32(CTRL_EVT_SW_EVENT, 0);
-        uint32_t status_cache = sequencer->location() + status_index * 4;
         std::shared_ptr<Timeout> timeout = Timeout::i2c_timeout(in_timeout);
-        if (timeout->trigger_s() > APB_TIMEOUT_MAX) {
-            write_data.queue_write_uint32(CTRL_EVT_APB_TIMEOUT,
-                static_cast<uint32_t>(APB_TIMEOUT_MAX * APB_TIMEOUT_SCALE));
-        } else {
-            write_data.queue_write_uint32(CTRL_EVT_APB_TIMEOUT,
-                static_cast<uint32_t>(timeout->trigger_s() * APB_TIMEOUT_SCALE));
-        }
-        write_uint32(write_data);
-        // Poll until done.  Future version will have an event packet too.
-        uint32_t value;
+        uint64_t event_count = hololink_.get_i2c_event_count();
+        run(*sequencer, timeout);
+        // The status is cached after the read data, so when the cached
+        // status shows done, the data is there too-- with block reads, we
+        // fetch it all together.
+        std::vector<uint32_t> addresses;
+        addresses.reserve(1 + read_indexes.size());
+        addresses.push_back(sequencer->location() + status_index * 4);
+        for (const auto& item : read_indexes) {
+            addresses.push_back(sequencer->location() + item * 4);
+        }
+        const bool block = hololink_.get_block_enable();
+        const unsigned poll_count = block ? addresses.size() : 1;
+        // Wait for HSB's I2C_BUSY event, if it sends those, then check the
+        // status; poll until done.  The event can beat the sequencer's
+        // write of the status cache, so once it's here, don't wait for
+        // another one.
+        const uint64_t expected_event_count = event_count + 1;
+        std::vector<uint32_t> values;
+        uint32_t value = 0;
         while (true) {
-            value = hololink_.read_uint32(status_cache, timeout);
-            HSB_LOG_DEBUG("status_cache={:#x}.", value);
-            if (value & I2C_DONE) {
-                break;
+            if (event_count < expected_event_count) {
+                event_count = hololink_.wait_i2c_event(expected_event_count - 1, timeout);
+            }
+            if (poll_count == 1) {
+                values = { hololink_.read_uint32(addresses[0], timeout) };
+            } else {
+                auto [ok, read_values] = hololink_.read_uint32(addresses, timeout);
+                if (ok) {
+                    values = read_values;
+                }
+            }
+            if (!values.empty()) {
+                value = values[0];
+                HSB_LOG_DEBUG("status_cache={:#x}.", value);
+                if (value & I2C_DONE) {
+                    break;
+                }
             }
             if (!timeout->retry()) {
                 // timed out
@@ -1251,10 +1668,19 @@ public:
         const uint32_t word_count = (read_byte_count + 3) / 4;
         // we should have one read_index for each word
         assert(word_count == read_indexes.size());
+        if ((word_count > 0) && (poll_count == 1)) {
+            std::vector<uint32_t> read_addresses(addresses.begin() + 1, addresses.end());
+            auto [ok, read_values] = hololink_.read_uint32(read_addresses, timeout);
+            if (!ok) {
+                throw TimeoutError(
+                    fmt::format("i2c_transaction i2c_address={:#x}", peripheral_i2c_address));
+            }
+            values.resize(1);
+            values.insert(values.end(), read_values.begin(), read_values.end());
+        }
         r.reserve(word_count * 4);
-        for (const auto& item : read_indexes) {
-            uint32_t address = sequencer->location() + item * 4;
-            value = hololink_.read_uint32(address, timeout);
+        for (unsigned i = 0; i < word_count; i++) {
+            value = values[1 + i];
             r.push_back((value >> 0) & 0xFF);
             r.push_back((value >> 8) & 0xFF);
             r.push_back((value >> 16) & 0xFF);
@@ -1264,6 +1690,77 @@ public:
         return r;
     }
 
+    void i2c_write_batch(uint32_t peripheral_i2c_address,
+        const std::vector<std::vector<uint8_t>>& transactions,
+        const std::shared_ptr<Timeout>& in_timeout) override
+    {
+        HSB_LOG_DEBUG("i2c_write_batch(peripheral_i2c_address={:#x}, transactions.size={}).",
+            peripheral_i2c_address, transactions.size());
+        size_t next = 0;
+        while (next < transactions.size()) {
+            // Pack as many transactions into this program as will fit;
+            // each one gets its own status cache.
+            auto sequencer = hololink_.software_sequencer();
+            std::vector<unsigned> status_indexes;
+            unsigned words = 1 + SEQUENCER_DONE_WORDS;
+            while (next < transactions.size()) {
+                unsigned size = encoded_words(transactions[next].size());
+                if ((words + size > SEQUENCER_LIMIT) && !status_indexes.empty()) {
+                    break;
+                }
+                auto [write_indexes, read_indexes, status_index] = encode_i2c_request(
+                    *sequencer, peripheral_i2c_address, transactions[next], 0);
+                status_indexes.push_back(status_index);
+                words += size;
+                next++;
+            }
+            std::lock_guard lock(i2c_lock());
+            std::shared_ptr<Timeout> timeout = Timeout::i2c_timeout(in_timeout);
+            uint64_t event_count = hololink_.get_i2c_event_count();
+            run(*sequencer, timeout);
+            std::vector<uint32_t> status_caches;
+            status_caches.reserve(status_indexes.size());
+            for (const auto& status_index : status_indexes) {
+                status_caches.push_back(sequencer->location() + status_index * 4);
+            }
+            // Each transaction polls for the previous one to finish, so
+            // when the last status shows done, all of them are.  Each
+            // I2C_BUSY event is a good time to check; after the last
+            // transaction's event, just poll.
+            const uint64_t expected_event_count = event_count + status_indexes.size();
+            std::vector<uint32_t> values;
+            while (true) {
+                if (event_count < expected_event_count) {
+                    event_count = hololink_.wait_i2c_event(event_count, timeout);
+                }
+                auto [ok, read_values] = hololink_.read_uint32(status_caches, timeout);
+                if (ok && (read_values.back() & I2C_DONE)) {
+                    values = read_values;
+                    break;
+                }
+                if (!timeout->retry()) {
+                    // timed out
+                    HSB_LOG_DEBUG("Timed out.");
+                    throw TimeoutError(
+                        fmt::format("i2c_write_batch i2c_address={:#x}", peripheral_i2c_address));
+                }
+            }
+            hololink_.clear_apb_event(Hololink::Event::I2C_BUSY);
+            // Check for errors.
+            for (const auto& value : values) {
+                if (value & I2C_FSM_ERR) {
+                    throw std::runtime_error("I2C port indicates I2C_FSM_ERR.");
+                }
+                if (value & I2C_I2C_ERR) {
+                    throw std::runtime_error("I2C port indicates I2C_I2C_ERR.");
+                }
+                if (value & I2C_I2C_NAK) {
+                    throw std::runtime_error("I2C port indicates I2C_I2C_NAK.");
+                }
+            }
+        }
+    }
+
     /**
      *
      */
@@ -1329,9 +1826,6 @@ public:
         sequencer.write_uint32(reg_control_, control);
         // Put in a POLL instruction to wait for it to be done.
         sequencer.poll(reg_status_, I2C_DONE, I2C_DONE);
-        // Cache the status register; this is where we look to see that we're done.
-        uint32_t initial_value = 0;
-        unsigned status_index = sequencer.read_uint32(reg_status_, initial_value);
         // Show how to fetch the result
         std::vector<unsigned> read_indexes;
         words = (read_byte_count + 3) / 4;
@@ -1342,11 +1836,56 @@ public:
             read_indexes.push_back(index);
             b += 4;
         }
+        // Cache the status register; this is where we look to see that we're
+        // done.  Doing this after the data reads means that once this shows
+        // done, the read data is cached too.
+        uint32_t initial_value = 0;
+        unsigned status_index = sequencer.read_uint32(reg_status_, initial_value);
         // Finally, write a 0 to the control register.
         sequencer.write_uint32(reg_control_, 0);
         return { write_indexes, read_indexes, status_index };
     }
 
+private:
+    // Words added to a sequence by done().
+    static constexpr unsigned SEQUENCER_DONE_WORDS = 3;
+
+    /**
+     * An upper bound on the number of sequencer words that
+     * encode_i2c_request adds for a write-only transaction.
+     */
+    static unsigned encoded_words(unsigned write_byte_count)
+    {
+        // Each write is an op with 2 words, the poll has 3, and
+        // the status read has 2; and there's another command word
+        // for every 16 ops.
+        unsigned data_words = (write_byte_count + 3) / 4;
+        unsigned ops = data_words + 7;
+        return (ops - 2) * 2 + 3 + 2 + (ops + 15) / 16;
+    }
+
+    /**
+     * Load the sequence and trigger it; the caller holds i2c_lock().
+     */
+    void run(Hololink::Sequencer& sequencer, const std::shared_ptr<Timeout>& timeout)
+    {
+        sequencer.enable();
+        Hololink::WriteData write_data;
+        // Signal on the falling edge of I2C_BUSY, when the transfer is
+        // finished; the rising edge would wake us as it starts.
+        hololink_.configure_apb_event(write_data, Hololink::Event::I2C_BUSY, 0, false);
+        write_data.queue_write_uint32(CTRL_EVT_SW_EVENT, 1);
+        write_data.queue_write_uint32(CTRL_EVT_SW_EVENT, 0);
+        if (timeout->trigger_s() > APB_TIMEOUT_MAX) {
+            write_data.queue_write_uint32(CTRL_EVT_APB_TIMEOUT,
+                static_cast<uint32_t>(APB_TIMEOUT_MAX * APB_TIMEOUT_SCALE));
+        } else {
+            write_data.queue_write_uint32(CTRL_EVT_APB_TIMEOUT,
+                static_cast<uint32_t>(timeout->trigger_s() * APB_TIMEOUT_SCALE));
+        }
+        write_uint32(write_data);
+    }
+
 private:
     Hololink& hololink_;
     const uint32_t reg_control_;
@@ -1358,6 +1897,15 @@ private:
     const uint32_t bus_en_;
 };
 
+void Hololink::I2c::i2c_write_batch(uint32_t peripheral_i2c_address,
+    const std::vector<std::vector<uint8_t>>& transactions,
+    const std::shared_ptr<Timeout>& in_timeout)
+{
+    for (const auto& write_bytes : transactions) {
+        i2c_transaction(peripheral_i2c_address, write_bytes, 0, in_timeout);
+    }
+}
+
 std::shared_ptr<Hololink::I2c> Hololink::get_i2c(uint32_t i2c_bus, uint32_t i2c_address)
 {
     return std::make_shared<hololink::I2c>(*this, i2c_bus, i2c_address);
@@ -1390,31 +1938,29 @@ Hololink::GPIO::GPIO(Hololink& hololink, uint32_t gpio_pin_number)
     }
 
     gpio_pin_number_ = gpio_pin_number;
+
+    // Direction and output registers are only changed by us.
+    uint32_t banks = (gpio_pin_number + 31) / 32;
+    hololink_.declare_host_owned(GPIO_DIRECTION_BASE_REGISTER, banks * GPIO_REGISTER_ADDRESS_OFFSET);
+    hololink_.declare_host_owned(GPIO_OUTPUT_BASE_REGISTER, banks * GPIO_REGISTER_ADDRESS_OFFSET);
 }
 
 void Hololink::GPIO::set_direction(uint32_t pin, uint32_t direction)
 {
     if (pin < gpio_pin_number_) {
 
-        uint32_t register_address = GPIO_DIRECTION_BASE_REGISTER + ((pin / 32) * GPIO_REGISTER_ADDRESS_OFFSET);
         uint32_t pin_bit = pin % 32; // map 0-255 to 0-31
 
-        // Read direction register
-        uint32_t reg_val = hololink_.read_uint32(register_address);
-
         // modify direction pin value
         if (direction == IN) {
-            reg_val = set_bit(reg_val, pin_bit);
+            update_directions({ { pin / 32, { set_bit(0, pin_bit), set_bit(0, pin_bit) } } });
         } else if (direction == OUT) {
-            reg_val = clear_bit(reg_val, pin_bit);
+            update_directions({ { pin / 32, { set_bit(0, pin_bit), 0 } } });
         } else {
             // raise exception
             throw std::runtime_error(fmt::format("GPIO:{},invalid direction:{}", pin, direction));
         }
 
-        // write back modified value
-        hololink_.write_uint32(register_address, reg_val);
-
         HSB_LOG_DEBUG("GPIO:{},set to direction:{}", pin, direction);
         return;
     }
@@ -1427,10 +1973,9 @@ uint32_t Hololink::GPIO::get_direction(uint32_t pin)
 {
     if (pin < gpio_pin_number_) {
 
-        uint32_t register_address = GPIO_DIRECTION_BASE_REGISTER + ((pin / 32) * GPIO_REGISTER_ADDRESS_OFFSET);
         uint32_t pin_bit = pin % 32; // map 0-255 to 0-31
 
-        uint32_t reg_val = hololink_.read_uint32(register_address);
+        uint32_t reg_val = get_bank_directions(pin / 32);
         return read_bit(reg_val, pin_bit);
     }
 
@@ -1441,37 +1986,22 @@ uint32_t Hololink::GPIO::get_direction(uint32_t pin)
 void Hololink::GPIO::set_value(uint32_t pin, uint32_t value)
 {
     if (pin < gpio_pin_number_) {
-        // make sure this is an output pin
-        const uint32_t direction = get_direction(pin);
 
-        uint32_t status_register_address = GPIO_STATUS_BASE_REGISTER + ((pin / 32) * GPIO_REGISTER_ADDRESS_OFFSET); // read from status
-        uint32_t output_register_address = GPIO_OUTPUT_BASE_REGISTER + ((pin / 32) * GPIO_REGISTER_ADDRESS_OFFSET); // write to output
         uint32_t pin_bit = pin % 32; // map 0-255 to 0-31
 
-        if (direction == OUT) {
-            // Read output register values
-            uint32_t reg_val = hololink_.read_uint32(status_register_address);
-
-            // Modify pin in the register
-            if (value == HIGH) {
-                reg_val = set_bit(reg_val, pin_bit);
-            } else if (value == LOW) {
-                reg_val = clear_bit(reg_val, pin_bit);
-            } else {
-                // raise exception
-                throw std::runtime_error(fmt::format("GPIO:{},invalid value:{}", pin, value));
-            }
-
-            // write back modified value
-            hololink_.write_uint32(output_register_address, reg_val);
-
-            HSB_LOG_DEBUG("GPIO:{},set to value:{}", pin, value);
-            return;
+        // Modify pin in the register; update_values makes sure this
+        // is an output pin.
+        if (value == HIGH) {
+            update_values({ { pin / 32, { set_bit(0, pin_bit), set_bit(0, pin_bit) } } });
+        } else if (value == LOW) {
+            update_values({ { pin / 32, { set_bit(0, pin_bit), 0 } } });
         } else {
             // raise exception
-            throw std::runtime_error(
-                fmt::format("GPIO:{},trying to write to an input register!", pin));
+            throw std::runtime_error(fmt::format("GPIO:{},invalid value:{}", pin, value));
         }
+
+        HSB_LOG_DEBUG("GPIO:{},set to value:{}", pin, value);
+        return;
     }
 
     // raise exception
@@ -1492,6 +2022,151 @@ uint32_t Hololink::GPIO::get_value(uint32_t pin)
     throw std::runtime_error(fmt::format("GPIO:{},invalid pin", pin));
 }
 
+void Hololink::GPIO::set_directions(const std::map<uint32_t, uint32_t>& pin_directions)
+{
+    update_directions(bank_updates(pin_directions, IN, OUT, "direction"));
+}
+
+void Hololink::GPIO::set_values(const std::map<uint32_t, uint32_t>& pin_values)
+{
+    update_values(bank_updates(pin_values, HIGH, LOW, "value"));
+}
+
+void Hololink::GPIO::set_bank_directions(uint32_t bank, uint32_t mask, uint32_t directions)
+{
+    for (uint32_t pin_bit = 0; pin_bit < 32; pin_bit++) {
+        if (read_bit(mask, pin_bit) && (bank * 32 + pin_bit >= gpio_pin_number_)) {
+            throw std::runtime_error(fmt::format("GPIO:{},invalid pin", bank * 32 + pin_bit));
+        }
+    }
+    update_directions({ { bank, { mask, directions } } });
+}
+
+void Hololink::GPIO::set_bank_values(uint32_t bank, uint32_t mask, uint32_t values)
+{
+    for (uint32_t pin_bit = 0; pin_bit < 32; pin_bit++) {
+        if (read_bit(mask, pin_bit) && (bank * 32 + pin_bit >= gpio_pin_number_)) {
+            throw std::runtime_error(fmt::format("GPIO:{},invalid pin", bank * 32 + pin_bit));
+        }
+    }
+    update_values({ { bank, { mask, values } } });
+}
+
+Hololink::GPIO::BankUpdates Hololink::GPIO::bank_updates(const std::map<uint32_t, uint32_t>& pin_settings, uint32_t set_value, uint32_t clear_value, const char* what)
+{
+    BankUpdates r;
+    for (const auto& [pin, setting] : pin_settings) {
+        if (pin >= gpio_pin_number_) {
+            throw std::runtime_error(fmt::format("GPIO:{},invalid pin", pin));
+        }
+        auto& [mask, bits] = r[pin / 32];
+        uint32_t pin_bit = pin % 32; // map 0-255 to 0-31
+        if (setting == set_value) {
+            bits = set_bit(bits, pin_bit);
+        } else if (setting == clear_value) {
+            bits = clear_bit(bits, pin_bit);
+        } else {
+            throw std::runtime_error(fmt::format("GPIO:{},invalid {}:{}", pin, what, setting));
+        }
+        mask = set_bit(mask, pin_bit);
+    }
+    return r;
+}
+
+void Hololink::GPIO::update_directions(const BankUpdates& updates)
+{
+    // Only banks that actually change are written.
+    Hololink::WriteData write_data;
+    std::vector<std::pair<uint32_t, uint32_t>> written;
+    std::vector<uint32_t> written_banks;
+    for (const auto& [bank, update] : updates) {
+        const auto& [mask, directions] = update;
+        uint32_t register_address = GPIO_DIRECTION_BASE_REGISTER + (bank * GPIO_REGISTER_ADDRESS_OFFSET);
+        uint32_t reg_val = get_bank_directions(bank);
+        uint32_t new_val = (reg_val & ~mask) | (directions & mask);
+        if (new_val != reg_val) {
+            write_data.queue_write_uint32(register_address, new_val);
+            written.push_back({ register_address, new_val });
+            written_banks.push_back(bank);
+        }
+    }
+    if (written.empty()) {
+        return;
+    }
+    // write_uint32 drops any cached values for these registers, so
+    // after a failure they're read from the device again.
+    if (!hololink_.write_uint32(write_data)) {
+        throw std::runtime_error(fmt::format("GPIO: unable to write directions for banks {}", written_banks));
+    }
+    std::lock_guard lock(hololink_.execute_mutex_);
+    for (const auto& [register_address, value] : written) {
+        hololink_.gpio_directions_[register_address] = value;
+    }
+}
+
+void Hololink::GPIO::update_values(const BankUpdates& updates)
+{
+    // Current output register values, by bank.  The output register
+    // itself is write-only, but the register cache may know what's
+    // there; otherwise we read the pin status.
+    std::map<uint32_t, uint32_t> outputs;
+    std::vector<uint32_t> status_banks;
+    std::vector<uint32_t> status_addresses;
+    for (const auto& [bank, update] : updates) {
+        const uint32_t mask = update.first;
+        // make sure these are all output pins
+        const uint32_t inputs = get_bank_directions(bank) & mask;
+        for (uint32_t pin_bit = 0; pin_bit < 32; pin_bit++) {
+            if (read_bit(inputs, pin_bit)) {
+                // raise exception
+                throw std::runtime_error(
+                    fmt::format("GPIO:{},trying to write to an input register!", bank * 32 + pin_bit));
+            }
+        }
+        uint32_t output_register_address = GPIO_OUTPUT_BASE_REGISTER + (bank * GPIO_REGISTER_ADDRESS_OFFSET);
+        auto cached = hololink_.get_cached_uint32(output_register_address);
+        if (cached) {
+            outputs[bank] = cached.value();
+        } else {
+            status_banks.push_back(bank);
+            status_addresses.push_back(GPIO_STATUS_BASE_REGISTER + (bank * GPIO_REGISTER_ADDRESS_OFFSET));
+        }
+    }
+    if (!status_addresses.empty()) {
+        auto [ok, values] = hololink_.read_uint32(status_addresses, std::shared_ptr<Timeout>());
+        if (!ok) {
+            throw std::runtime_error(fmt::format("GPIO: unable to read status for banks {}", status_banks));
+        }
+        for (size_t i = 0; i < status_banks.size(); i++) {
+            outputs[status_banks[i]] = values[i];
+        }
+    }
+    // One request sets every bank.
+    Hololink::WriteData write_data;
+    for (const auto& [bank, update] : updates) {
+        const auto& [mask, values] = update;
+        uint32_t output_register_address = GPIO_OUTPUT_BASE_REGISTER + (bank * GPIO_REGISTER_ADDRESS_OFFSET);
+        write_data.queue_write_uint32(output_register_address, (outputs[bank] & ~mask) | (values & mask));
+    }
+    hololink_.write_uint32(write_data);
+}
+
+uint32_t Hololink::GPIO::get_bank_directions(uint32_t bank)
+{
+    uint32_t register_address = GPIO_DIRECTION_BASE_REGISTER + (bank * GPIO_REGISTER_ADDRESS_OFFSET);
+    {
+        std::lock_guard lock(hololink_.execute_mutex_);
+        auto cached = hololink_.gpio_directions_.find(register_address);
+        if (cached != hololink_.gpio_directions_.end()) {
+            return cached->second;
+        }
+    }
+    uint32_t reg_val = hololink_.read_uint32(register_address);
+    std::lock_guard lock(hololink_.execute_mutex_);
+    hololink_.gpio_directions_[register_address] = reg_val;
+    return reg_val;
+}
+
 uint32_t Hololink::GPIO::get_supported_pin_num(void)
 {
     return gpio_pin_number_;
@@ -1932,6 +2607,13 @@ void Hololink::async_event_thread()
             throw std::runtime_error(fmt::format("Buffer underflow in async event message"));
         }
         HSB_LOG_DEBUG("async_event_thread received {} bytes from={} interrupt_active={:#x} interrupt_state={:#x} timestamp_s={}, timestamp_ns={}.", received.size(), peer_ip, interrupt_active, interrupt_state, timestamp_s, timestamp_ns);
+        if (interrupt_active & (1u << Event::I2C_BUSY)) {
+            // Wake up I2C transactions waiting for completion.
+            std::lock_guard lock(i2c_event_mutex_);
+            i2c_event_count_++;
+            i2c_events_seen_ = true;
+            i2c_event_condition_.notify_all();
+        }
     }
 }
 
@@ -2031,13 +2713,20 @@ void Hololink::Sequencer::write(Hololink& hololink)
     if (!address_set_) {
         throw std::runtime_error(fmt::format("Sequencer address not set; call assign_location() before calling write()."));
     }
+    // Long sequences don't fit in a single request.
     Hololink::WriteData data;
     unsigned address = address_;
     for (const auto& item : buffer_) {
         data.queue_write_uint32(address, item);
         address += 4;
+        if (data.size() == CONTROL_BLOCK_WORDS) {
+            hololink.write_uint32(data);
+            data = Hololink::WriteData();
+        }
+    }
+    if (data.size() > 0) {
+        hololink.write_uint32(data);
     }
-    hololink.write_uint32(data);
     written_ = true;
 }
 
@@ -21,12 +21,19 @@
 #define SRC_HOLOLINK_HOLOLINK
 
 #include <algorithm>
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <future>
+#include <map>
 #include <memory>
 #include <mutex>
+#include <optional>
 #include <stdint.h>
 #include <string>
 #include <thread>
 #include <tuple>
+#include <unordered_map>
 #include <vector>
 
 #include "enumerator.hpp"
@@ -63,6 +70,8 @@ constexpr uint32_t WR_DWORD = 0x04;
 constexpr uint32_t WR_BLOCK = 0x09;
 constexpr uint32_t RD_DWORD = 0x14;
 constexpr uint32_t RD_BLOCK = 0x19;
+// The most address/value pairs that fit in one WR_BLOCK or RD_BLOCK request.
+constexpr uint32_t CONTROL_BLOCK_WORDS = 183;
 // request packet flag bits
 constexpr uint32_t REQUEST_FLAGS_ACK_REQUEST = 0b0000'0001;
 constexpr uint32_t REQUEST_FLAGS_SEQUENCE_CHECK = 0b0000'0010;
@@ -366,6 +375,138 @@ public:
 
     std::tuple<bool, std::vector<uint32_t>> read_uint32(uint32_t address, uint32_t count, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check = true);
 
+    /**
+     * @brief Read each of the given addresses, which needn't be contiguous;
+     * when block transfers are enabled, this is a single RD_BLOCK request.
+     */
+    std::tuple<bool, std::vector<uint32_t>> read_uint32(const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check = true);
+
+    /**
+     * @brief Pipelined versions of write_uint32 and read_uint32: these
+     * send the request without waiting for its reply, so that up to
+     * get_control_window() requests are outstanding at once.  Replies
+     * are matched to requests by sequence number.  get() on the returned
+     * future waits for the reply and returns (or throws) just what the
+     * blocking call would, including retries.  Returned futures must
+     * not outlive this object.
+     */
+    std::shared_future<bool> write_uint32_async(uint32_t address, uint32_t value,
+        const std::shared_ptr<Timeout>& in_timeout, bool retry, bool sequence_check);
+
+    std::shared_future<bool> write_uint32_async(uint32_t address, uint32_t value,
+        const std::shared_ptr<Timeout>& timeout = std::shared_ptr<Timeout>(), bool retry = true)
+    {
+        return write_uint32_async(address, value, timeout, retry, sequence_number_checking_);
+    }
+
+    std::shared_future<uint32_t> read_uint32_async(
+        uint32_t address, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check);
+
+    std::shared_future<uint32_t> read_uint32_async(
+        uint32_t address, const std::shared_ptr<Timeout>& timeout = std::shared_ptr<Timeout>())
+    {
+        return read_uint32_async(address, timeout, sequence_number_checking_);
+    }
+
+    /**
+     * @brief Wait for the replies to all outstanding pipelined requests;
+     * errors are reported by the futures for those requests.
+     */
+    void flush_control();
+
+    /**
+     * @brief Set the number of pipelined requests that can be outstanding
+     * at once; with 1 (the default), each request waits for the reply to
+     * the previous one.
+     */
+    void set_control_window(unsigned control_window);
+
+    unsigned get_control_window() { return control_window_; }
+
+    /**
+     * @brief True if this device handles WR_BLOCK and RD_BLOCK requests.
+     */
+    bool get_block_enable() { return block_enable_; }
+
+    /**
+     * @brief Enable (or disable and clear) the shadow register cache.
+     * While enabled, the last value written to or read from each
+     * host-owned register (see declare_host_owned) is remembered:
+     * read_uint32 returns that value without a request, and write_uint32
+     * skips any write that wouldn't change it.  Only enable this when
+     * this object is the only thing changing those registers--e.g. not
+     * when another process configures other sensors on the same board.
+     * The cache is cleared by reset() and post_reset_configuration().
+     * GPIO direction registers are cached whether or not this is
+     * enabled; see GPIO::get_direction.
+     */
+    void set_register_cache_enable(bool register_cache_enable);
+
+    bool get_register_cache_enable();
+
+    /**
+     * @brief Declare that the size bytes of registers at address are
+     * only ever changed by the host, so their values can be cached.
+     * Registers the device updates itself must never be declared.
+     */
+    void declare_host_owned(uint32_t address, uint32_t size);
+
+    /**
+     * @returns The cached value for address, or nothing if the cache is
+     * disabled or doesn't know it; this never sends a request.
+     */
+    std::optional<uint32_t> get_cached_uint32(uint32_t address);
+
+    /**
+     * @brief Forget all cached register values, including the GPIO pin
+     * directions (which are cached even when the register cache is
+     * disabled).
+     */
+    void invalidate_register_cache();
+
+    /**
+     * @returns The number of reads answered by the register cache.
+     */
+    uint64_t get_register_cache_hits();
+
+    /**
+     * @returns The number of writes skipped because the register cache
+     * showed the register already had that value.
+     */
+    uint64_t get_register_cache_elided_writes();
+
+    /**
+     * @brief When enabled (the default), I2C transactions wait for HSB's
+     * I2C_BUSY async event packet before checking for completion, instead
+     * of polling the status register continuously.  Polling is still used
+     * until event packets are actually seen, and if one doesn't arrive in
+     * time.
+     */
+    void set_i2c_event_enable(bool i2c_event_enable);
+
+    bool get_i2c_event_enable();
+
+    /**
+     * @returns The number of I2C_BUSY async event packets received.
+     */
+    uint64_t get_i2c_event_count();
+
+    /**
+     * @returns The number of times an I2C transaction gave up waiting
+     * for its I2C_BUSY async event packet and went back to polling.
+     */
+    uint64_t get_i2c_event_fallback_count();
+
+    /**
+     * @brief If I2C event completion is in use, wait until
+     * more than count I2C_BUSY async event packets have been received,
+     * the timeout expires, or the event fallback interval passes.
+     * Returns immediately if we're polling instead.
+     *
+     * @returns The number of I2C_BUSY async event packets received.
+     */
+    uint64_t wait_i2c_event(uint64_t count, const std::shared_ptr<Timeout>& timeout);
+
     /**
      * @brief Setup the clock
      *
@@ -545,6 +686,20 @@ public:
             bool ignore_nak = false)
             = 0;
 
+        /**
+         * @brief Execute each of the given write-only transactions with
+         * peripheral_i2c_address, in order.  Implementations may pack
+         * several transactions into a single sequencer program; this
+         * default just calls i2c_transaction for each.
+         *
+         * @param peripheral_i2c_address
+         * @param transactions the bytes to write for each transaction
+         * @param in_timeout
+         */
+        virtual void i2c_write_batch(uint32_t peripheral_i2c_address,
+            const std::vector<std::vector<uint8_t>>& transactions,
+            const std::shared_ptr<Timeout>& in_timeout = std::shared_ptr<Timeout>());
+
         /**
          * @returns {write_indexes, read_indexes, status_index}
          */
@@ -641,7 +796,11 @@ public:
         inline static constexpr uint32_t GPIO_PIN_RANGE = 0x100;
 
         /**
-         * @brief
+         * @brief Set the direction of pin.  Direction registers are
+         * only changed by the host, so unlike the opt-in register cache
+         * (see set_register_cache_enable), GPIO always caches them: the
+         * value is recorded only after the write succeeds, and a failed
+         * write raises an exception.
          *
          * @param pin
          * @param direction
@@ -649,7 +808,11 @@ public:
         void set_direction(uint32_t pin, uint32_t direction);
 
         /**
-         * @brief
+         * @brief The direction of pin.  The direction register is read
+         * from the device the first time and cached after that, whether
+         * or not the register cache is enabled; writes to it by any
+         * other path, or clearing the register cache, cause it to be
+         * read again.
          *
          * @param pin
          * @return Direction
@@ -680,10 +843,51 @@ public:
          */
         uint32_t get_supported_pin_num(void);
 
+        /**
+         * @brief Set the direction of several pins at once. Each 32-pin
+         * bank is updated with a single read-modify-write, and all the
+         * bank updates go out in one request.
+         *
+         * @param pin_directions maps pin to IN or OUT
+         */
+        void set_directions(const std::map<uint32_t, uint32_t>& pin_directions);
+
+        /**
+         * @brief Set the value of several output pins at once. Each 32-pin
+         * bank is updated with a single read-modify-write, and all the
+         * bank updates go out in one request.
+         *
+         * @param pin_values maps pin to LOW or HIGH
+         */
+        void set_values(const std::map<uint32_t, uint32_t>& pin_values);
+
+        /**
+         * @brief For each set bit in mask, set the direction of that pin
+         * in bank (pins bank*32 to bank*32+31) from the same bit in
+         * directions: 1 for IN, 0 for OUT.
+         */
+        void set_bank_directions(uint32_t bank, uint32_t mask, uint32_t directions);
+
+        /**
+         * @brief For each set bit in mask, set the value of that output
+         * pin in bank (pins bank*32 to bank*32+31) from the same bit in
+         * values.
+         */
+        void set_bank_values(uint32_t bank, uint32_t mask, uint32_t values);
+
     private:
         Hololink& hololink_;
         uint32_t gpio_pin_number_;
 
+        // {bank: (mask, bits)}
+        using BankUpdates = std::map<uint32_t, std::pair<uint32_t, uint32_t>>;
+        BankUpdates bank_updates(const std::map<uint32_t, uint32_t>& pin_settings, uint32_t set_value, uint32_t clear_value, const char* what);
+        void update_directions(const BankUpdates& updates);
+        void update_values(const BankUpdates& updates);
+        // The direction register for bank, read from the device only
+        // the first time; see Hololink::gpio_directions_.
+        uint32_t get_bank_directions(uint32_t bank);
+
         static uint32_t set_bit(uint32_t value, uint32_t bit);
         static uint32_t clear_bit(uint32_t value, uint32_t bit);
         static uint32_t read_bit(uint32_t value, uint32_t bit);
@@ -908,14 +1112,64 @@ private:
     bool block_enable_;
     uint32_t ptp_sync_stat_;
 
+    // Counts I2C_BUSY events from async_event_thread; see wait_i2c_event.
+    std::mutex i2c_event_mutex_;
+    std::condition_variable i2c_event_condition_;
+    uint64_t i2c_event_count_ = 0;
+    uint64_t i2c_event_fallback_count_ = 0;
+    bool i2c_event_enable_ = true;
+    // Set when an event arrives, cleared when one is late.
+    bool i2c_events_seen_ = false;
+
+    // A pipelined request waiting for its reply; see write_uint32_async.
+    struct PendingControl {
+        std::string description;
+        bool read = false;
+        bool retry = true;
+        uint16_t sequence = 0;
+        std::vector<uint8_t> request;
+        std::shared_ptr<Timeout> timeout;
+        double request_time = 0;
+        bool done = false;
+        bool status = false;
+        uint32_t value = 0;
+        std::exception_ptr exception;
+    };
+    unsigned control_window_ = 1;
+    // Outstanding pipelined requests, oldest first; protected by execute_mutex_.
+    std::deque<std::shared_ptr<PendingControl>> pending_control_;
+    // Set when pipelined requests were retried without sequence checking;
+    // HSB's expected sequence number is then behind ours, so the next
+    // request is sent unchecked to resynchronize it.
+    bool sequence_resync_ = false;
+
+    // Shadow register cache; see set_register_cache_enable.  All of
+    // these are protected by execute_mutex_.
+    bool register_cache_enable_ = false;
+    // (address, size) ranges from declare_host_owned.
+    std::vector<std::pair<uint32_t, uint32_t>> host_owned_;
+    std::unordered_map<uint32_t, uint32_t> register_cache_;
+    uint64_t register_cache_hits_ = 0;
+    uint64_t register_cache_elided_writes_ = 0;
+    // GPIO direction registers, by address, once GPIO has read or
+    // written them; these are always cached (only the host changes
+    // them) and are cleared with the register cache.  Other writes to
+    // these registers drop their entries.  Protected by execute_mutex_.
+    std::unordered_map<uint32_t, uint32_t> gpio_directions_;
+
     bool write_uint32_block_(WriteData data, const std::shared_ptr<Timeout>& timeout,
         bool response_expected, uint16_t sequence, bool sequence_check, std::lock_guard<std::mutex>&);
     bool write_uint32_(uint32_t address, uint32_t value, const std::shared_ptr<Timeout>& timeout, bool response_expected, uint16_t sequence, bool sequence_check, std::lock_guard<std::mutex>&);
     std::tuple<bool, std::optional<uint32_t>> read_uint32_(
         uint32_t address, const std::shared_ptr<Timeout>& timeout, uint16_t sequence, bool sequence_check, std::lock_guard<std::mutex>&);
     // Read a block of data using individual RD_DWORD commands
-    std::tuple<bool, std::vector<uint32_t>> read_uint32_singly_(uint32_t address, uint32_t count, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check = true);
-    std::tuple<bool, std::vector<uint32_t>> read_uint32_block_(uint32_t address, uint32_t count, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check = true);
+    std::tuple<bool, std::vector<uint32_t>> read_uint32_singly_(const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check = true);
+    std::tuple<bool, std::vector<uint32_t>> read_uint32_block_(const std::vector<uint32_t>& addresses, const std::shared_ptr<Timeout>& in_timeout, bool sequence_check = true);
+
+    // True if the register cache should keep address.
+    bool cacheable(uint32_t address, std::lock_guard<std::mutex>&);
+    // Record the values written by a successful write_uint32.
+    void update_register_cache(const WriteData& write_data, std::lock_guard<std::mutex>&);
 
     void add_read_retries(uint32_t n);
     void add_write_retries(uint32_t n);
@@ -933,6 +1187,13 @@ private:
     // See the comment above for execute(...) about why we take
     // std::lock_guard as a parameter here.
     uint16_t next_sequence(std::lock_guard<std::mutex>&);
+
+    // Send a pipelined request, first waiting for room in the window.
+    void submit_control(const std::shared_ptr<PendingControl>& pending, std::lock_guard<std::mutex>&);
+    // Handle one reply (or timeout) for the outstanding pipelined requests.
+    void receive_pending_control(std::lock_guard<std::mutex>&);
+    // Wait for the given pipelined request to complete, rethrowing any error.
+    void wait_pending_control(const std::shared_ptr<PendingControl>& pending);
 };
 
 // Tool to manage extending e.g. uint16_t changes
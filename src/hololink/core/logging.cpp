@@ -30,6 +30,14 @@
 #include <time.h>
 #include <unistd.h>
 
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
 #if __GLIBC__ == 2 && __GLIBC_MINOR__ < 30
 #include <sys/syscall.h>
 #define gettid() syscall(SYS_gettid)
@@ -46,75 +54,112 @@ HsbLogLevel hsb_log_level = HSB_LOG_LEVEL_INVALID;
 static HsbLogLevel hsb_log_level_default = HSB_LOG_LEVEL_INFO;
 // Allow "HOLOSCAN_LOG_LEVEL" to set our logging level (along with HSDK applications)
 static const char* log_level_environment_variable = "HOLOSCAN_LOG_LEVEL";
+// Set "HSB_LOG_ASYNC=1" to start up with asynchronous logging.
+static const char* log_async_environment_variable = "HSB_LOG_ASYNC";
 #ifdef SOCKET_LOG
 // Socket to send our data to.
 static int logger_socket = -1;
 #endif /* SOCKET_LOG */
 
-float log_timestamp_s()
+static int64_t monotonic_ns()
 {
     struct timespec now = { 0, 0 };
-    float ts = 0;
-    if (clock_gettime(CLOCK_MONOTONIC, &now) == 0) {
-#define MS_PER_SEC (1000.0)
-#define US_PER_SEC (1000.0 * MS_PER_SEC)
-#define NS_PER_SEC (1000.0 * US_PER_SEC)
-        ts = now.tv_sec;
-        ts += now.tv_nsec / NS_PER_SEC;
-    }
-    static float start_time = 0;
-    if (start_time < 1) {
-        start_time = ts;
+    if (clock_gettime(CLOCK_MONOTONIC, &now) != 0) {
+        return 0;
     }
-    return ts - start_time;
+    return static_cast<int64_t>(now.tv_sec) * 1000000000 + now.tv_nsec;
 }
 
-static void _hsb_logger(char const* file, unsigned line, const char* function, HsbLogLevel level, const char* message)
+// Timestamps are relative to the first one we're asked for.
+static int64_t start_time_ns()
+{
+    static const int64_t start_time = monotonic_ns();
+    return start_time;
+}
+
+int64_t log_timestamp_ns()
+{
+    int64_t start_time = start_time_ns();
+    return monotonic_ns() - start_time;
+}
+
+double log_timestamp_s()
+{
+    // A float only has 24 bits of mantissa, so it loses milliseconds
+    // after a few hours; a double doesn't.
+    return log_timestamp_ns() / 1e9;
+}
+
+static pid_t cached_tid()
+{
+    static thread_local pid_t thread_id = gettid();
+    return thread_id;
+}
+
+static const char* level_description(HsbLogLevel level)
 {
-    // Don't include all the directory information included in "file"
-    const char* basename = strrchr(file, '/');
-    if (basename) {
-        basename++; // skip the '/'
-    } else {
-        basename = file;
-    }
-    const char* level_description = "INVALID";
     switch (level) {
     case HSB_LOG_LEVEL_TRACE:
-        level_description = "TRACE";
-        break;
+        return "TRACE";
     case HSB_LOG_LEVEL_DEBUG:
-        level_description = "DEBUG";
-        break;
+        return "DEBUG";
     case HSB_LOG_LEVEL_INFO:
-        level_description = "INFO";
-        break;
+        return "INFO";
     case HSB_LOG_LEVEL_WARN:
-        level_description = "WARN";
-        break;
+        return "WARN";
     case HSB_LOG_LEVEL_ERROR:
-        level_description = "ERROR";
-        break;
+        return "ERROR";
     default:
         break;
     }
-    pid_t thread_id = gettid();
-    float ts = log_timestamp_s();
-    std::string msg = fmt::format("{} {:.4f} {}:{} {} tid={:#x} -- {}", level_description, ts, basename, line, function, thread_id, message);
+    return "INVALID";
+}
 
-#ifdef CONSOLE_LOG
-    fprintf(stderr, "%s\n", msg.c_str());
-#endif /* CONSOLE_LOG */
+// Add the header line for a message to out; the caller appends the message itself.
+static void format_prefix(fmt::memory_buffer& out, char const* file, unsigned line, const char* function, HsbLogLevel level, pid_t thread_id, int64_t timestamp_ns)
+{
+    // Don't include all the directory information included in "file"
+    const char* basename = strrchr(file, '/');
+    if (basename) {
+        basename++; // skip the '/'
+    } else {
+        basename = file;
+    }
+    double ts = timestamp_ns / 1e9;
+    fmt::format_to(std::back_inserter(out), "{} {:.4f} {}:{} {} tid={:#x} -- ", level_description(level), ts, basename, line, function, thread_id);
+}
 
 #ifdef SOCKET_LOG
+static void _hsb_log_send(const char* msg, size_t size)
+{
     int flags = 0;
-    ssize_t r = send(logger_socket, msg.data(), msg.size(), flags);
+    ssize_t r = send(logger_socket, msg, size, flags);
     if (r <= 0) {
         throw std::runtime_error("hsb_log send failed");
     }
+}
+#endif /* SOCKET_LOG */
+
+// Write one formatted message, without a trailing newline, to our sinks.
+static void _hsb_log_write(const char* msg, size_t size)
+{
+#ifdef CONSOLE_LOG
+    fprintf(stderr, "%.*s\n", static_cast<int>(size), msg);
+#endif /* CONSOLE_LOG */
+
+#ifdef SOCKET_LOG
+    _hsb_log_send(msg, size);
 #endif /* SOCKET_LOG */
 }
 
+static void _hsb_logger(char const* file, unsigned line, const char* function, HsbLogLevel level, const char* message)
+{
+    fmt::memory_buffer msg;
+    format_prefix(msg, file, line, function, level, cached_tid(), log_timestamp_ns());
+    msg.append(fmt::string_view(message));
+    _hsb_log_write(msg.data(), msg.size());
+}
+
 #ifdef SOCKET_LOG
 static int create_logger_socket(const char* sender_ip, const char* destination_ip = "255.255.255.255")
 {
@@ -160,7 +205,12 @@ static int create_logger_socket(const char* sender_ip, const char* destination_i
 }
 #endif /* SOCKET_LOG */
 
-static void _initial_hsb_log(char const* file, unsigned line, const char* function, HsbLogLevel level, const char* msg)
+static void _initial_hsb_log(char const* file, unsigned line, const char* function, HsbLogLevel level, const char* msg);
+static void start_async_logger();
+
+static std::once_flag hsb_log_initialized;
+
+static void hsb_log_initialize()
 {
     // If the application hasn't already rewritten this value, set it
     // to a reasonable default.
@@ -193,7 +243,19 @@ static void _initial_hsb_log(char const* file, unsigned line, const char* functi
 #endif /* SOCKET_LOG */
 
     // We only need to be called once.
-    hsb_logger = _hsb_logger;
+    if (hsb_logger == _initial_hsb_log) {
+        hsb_logger = _hsb_logger;
+    }
+
+    char const* env_log_async = getenv(log_async_environment_variable);
+    if (env_log_async && (strcmp(env_log_async, "0") != 0)) {
+        start_async_logger();
+    }
+}
+
+static void _initial_hsb_log(char const* file, unsigned line, const char* function, HsbLogLevel level, const char* msg)
+{
+    std::call_once(hsb_log_initialized, hsb_log_initialize);
 
     // Does this specific logger call still apply?
     if (level < hsb_log_level) {
@@ -201,9 +263,392 @@ static void _initial_hsb_log(char const* file, unsigned line, const char* functi
     }
 
     // Then show it.
+    if (hsb_log_async_enable.load()) {
+        hsb_log_async(file, line, function, level, "{}", msg);
+        return;
+    }
     hsb_logger(file, line, function, level, msg);
 }
 
 HsbLogger hsb_logger = _initial_hsb_log;
 
+std::atomic<bool> hsb_log_async_enable = false;
+
+namespace {
+
+    // Records per thread; must be a power of 2.
+    constexpr size_t ASYNC_LOG_RING_SIZE = 4096;
+    // Report dropped messages at most this often, except on flush.
+    constexpr int64_t DROPPED_REPORT_INTERVAL_NS = 1000000000;
+
+    // Single producer (the thread that owns it), single consumer (the
+    // drain thread) queue of log records.
+    struct AsyncLogRing {
+        AsyncLogRecord records[ASYNC_LOG_RING_SIZE];
+        // Index of the next record to drain.
+        alignas(64) std::atomic<uint64_t> head { 0 };
+        // Index of the next record to fill.
+        alignas(64) std::atomic<uint64_t> tail { 0 };
+        // Set by the owning thread from async_log_acquire until
+        // async_log_commit; see AsyncLogger::stop.
+        std::atomic<bool> writing { false };
+        // Set when the owning thread exits; the ring is released
+        // after it's drained.
+        std::atomic<bool> orphaned { false };
+    };
+
+    class AsyncLogger {
+    public:
+        ~AsyncLogger() { stop(); }
+
+        std::shared_ptr<AsyncLogRing> add_ring()
+        {
+            auto ring = std::make_shared<AsyncLogRing>();
+            std::lock_guard lock(rings_mutex_);
+            rings_.push_back(ring);
+            return ring;
+        }
+
+        void start()
+        {
+            std::lock_guard lock(control_mutex_);
+            if (!thread_.joinable()) {
+                running_ = true;
+                thread_ = std::thread(&AsyncLogger::run, this);
+            }
+            hsb_log_async_enable = true;
+        }
+
+        void stop()
+        {
+            std::lock_guard lock(control_mutex_);
+            // Messages logged from here on go to the synchronous sink
+            // (see async_log_acquire).  Wait for the ones already being
+            // written to a ring so that the last drain below gets them.
+            hsb_log_async_enable = false;
+            wait_for_writers();
+            if (thread_.joinable()) {
+                {
+                    std::lock_guard lock(wait_mutex_);
+                    running_ = false;
+                }
+                wait_condition_.notify_all();
+                thread_.join();
+            }
+            flush();
+        }
+
+        void flush()
+        {
+            std::lock_guard lock(drain_mutex_);
+            drain();
+            report_dropped();
+        }
+
+        // Called by a thread that just published a record; wakes the
+        // drain thread if it's waiting for one.
+        void notify()
+        {
+            // This pairs with the fence in run: either we see idle_, or
+            // the drain thread sees our record.
+            std::atomic_thread_fence(std::memory_order_seq_cst);
+            if (!idle_.load(std::memory_order_relaxed)) {
+                return;
+            }
+            {
+                std::lock_guard lock(wait_mutex_);
+                idle_ = false;
+            }
+            wait_condition_.notify_one();
+        }
+
+        std::atomic<uint64_t> dropped_ { 0 };
+
+    private:
+        void wait_for_writers()
+        {
+            std::vector<std::shared_ptr<AsyncLogRing>> rings;
+            {
+                std::lock_guard lock(rings_mutex_);
+                rings = rings_;
+            }
+            for (auto& ring : rings) {
+                while (ring->writing.load()) {
+                    std::this_thread::yield();
+                }
+            }
+        }
+
+        void run()
+        {
+            std::unique_lock lock(wait_mutex_);
+            while (running_) {
+                lock.unlock();
+                size_t count;
+                {
+                    std::lock_guard drain_lock(drain_mutex_);
+                    count = drain();
+                }
+                lock.lock();
+                if (count != 0) {
+                    continue;
+                }
+                // Nothing to do; sleep until a writer publishes a record
+                // (see notify) or we're stopped.
+                idle_ = true;
+                std::atomic_thread_fence(std::memory_order_seq_cst);
+                if (pending()) {
+                    idle_ = false;
+                    continue;
+                }
+                wait_condition_.wait(lock, [this] { return !running_ || !idle_; });
+                idle_ = false;
+            }
+        }
+
+        // Does any ring have records that haven't been drained?
+        bool pending()
+        {
+            std::lock_guard lock(rings_mutex_);
+            for (auto& ring : rings_) {
+                if (ring->head.load(std::memory_order_relaxed) != ring->tail.load(std::memory_order_relaxed)) {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        // Write out everything in every ring, in timestamp order;
+        // returns the number of records written.  Caller must hold
+        // drain_mutex_.
+        size_t drain()
+        {
+            {
+                std::lock_guard lock(rings_mutex_);
+                draining_ = rings_;
+            }
+            struct Pending {
+                AsyncLogRing* ring;
+                uint64_t tail;
+            };
+            std::vector<Pending> pending;
+            records_.clear();
+            for (auto& ring : draining_) {
+                uint64_t head = ring->head.load(std::memory_order_relaxed);
+                uint64_t tail = ring->tail.load(std::memory_order_acquire);
+                for (uint64_t i = head; i != tail; i++) {
+                    records_.push_back(&ring->records[i & (ASYNC_LOG_RING_SIZE - 1)]);
+                }
+                if (head != tail) {
+                    pending.push_back({ ring.get(), tail });
+                }
+            }
+            std::stable_sort(records_.begin(), records_.end(),
+                [](const AsyncLogRecord* a, const AsyncLogRecord* b) { return a->timestamp_ns < b->timestamp_ns; });
+            for (const AsyncLogRecord* record : records_) {
+                write(*record);
+            }
+#ifdef CONSOLE_LOG
+            // One write for the whole batch.
+            if (console_.size()) {
+                fwrite(console_.data(), 1, console_.size(), stderr);
+                console_.clear();
+            }
+#endif /* CONSOLE_LOG */
+            for (auto& p : pending) {
+                p.ring->head.store(p.tail, std::memory_order_release);
+            }
+            // Don't flood the log with these.
+            if ((log_timestamp_ns() - reported_dropped_ns_) >= DROPPED_REPORT_INTERVAL_NS) {
+                report_dropped();
+            }
+
+            // Release the rings for threads that are gone.
+            std::lock_guard lock(rings_mutex_);
+            rings_.erase(std::remove_if(rings_.begin(), rings_.end(),
+                             [](const std::shared_ptr<AsyncLogRing>& ring) {
+                                 return ring->orphaned && (ring->head.load() == ring->tail.load());
+                             }),
+                rings_.end());
+            draining_.clear();
+            return records_.size();
+        }
+
+        void write(const AsyncLogRecord& record)
+        {
+            fmt::memory_buffer& message = message_;
+            message.clear();
+            HsbLogger logger = hsb_logger;
+            bool custom_logger = (logger != _hsb_logger) && (logger != _initial_hsb_log);
+            if (!custom_logger) {
+                format_prefix(message, record.file, record.line, record.function, record.level, record.tid, record.timestamp_ns);
+            }
+            if (record.formatter) {
+                try {
+                    record.formatter(record, message);
+                } catch (const fmt::format_error& e) {
+                    fmt::format_to(std::back_inserter(message), "(format error \"{}\" in \"{}\")", e.what(), record.format);
+                }
+            } else if (record.long_message) {
+                message.append(*record.long_message);
+                delete record.long_message;
+            } else {
+                message.append(record.payload, record.payload + record.size);
+            }
+            if (custom_logger) {
+                message.push_back(0);
+                logger(record.file, record.line, record.function, record.level, message.data());
+                return;
+            }
+#ifdef CONSOLE_LOG
+            console_.append(message);
+            console_.push_back('\n');
+#endif /* CONSOLE_LOG */
+
+#ifdef SOCKET_LOG
+            _hsb_log_send(message.data(), message.size());
+#endif /* SOCKET_LOG */
+        }
+
+        void report_dropped()
+        {
+            uint64_t dropped = dropped_.load(std::memory_order_relaxed);
+            if (dropped == reported_dropped_) {
+                return;
+            }
+            fmt::memory_buffer message;
+            format_prefix(message, __FILE__, __LINE__, __FUNCTION__, HSB_LOG_LEVEL_WARN, cached_tid(), log_timestamp_ns());
+            fmt::format_to(std::back_inserter(message), "Dropped {} log messages (total={}).", dropped - reported_dropped_, dropped);
+            _hsb_log_write(message.data(), message.size());
+            reported_dropped_ = dropped;
+            reported_dropped_ns_ = log_timestamp_ns();
+        }
+
+        std::mutex control_mutex_;
+        std::thread thread_;
+        bool running_ = false;
+        std::mutex wait_mutex_;
+        std::condition_variable wait_condition_;
+        // Set while the drain thread waits on wait_condition_.
+        std::atomic<bool> idle_ { false };
+        std::mutex rings_mutex_;
+        std::vector<std::shared_ptr<AsyncLogRing>> rings_;
+        // These are only touched with drain_mutex_ held.
+        std::mutex drain_mutex_;
+        std::vector<std::shared_ptr<AsyncLogRing>> draining_;
+        std::vector<const AsyncLogRecord*> records_;
+        fmt::memory_buffer message_;
+        fmt::memory_buffer console_;
+        uint64_t reported_dropped_ = 0;
+        int64_t reported_dropped_ns_ = 0;
+    };
+
+    AsyncLogger async_logger;
+
+    // Each thread gets its ring the first time it logs asynchronously.
+    struct AsyncLogRingHolder {
+        ~AsyncLogRingHolder()
+        {
+            if (ring) {
+                ring->orphaned = true;
+            }
+        }
+        std::shared_ptr<AsyncLogRing> ring;
+    };
+    thread_local AsyncLogRingHolder async_log_ring;
+
+} // anonymous namespace
+
+static void start_async_logger()
+{
+    async_logger.start();
+}
+
+AsyncLogRecord* async_log_acquire(char const* file, unsigned line, const char* function, HsbLogLevel level, bool& stopped)
+{
+    AsyncLogRing* ring = async_log_ring.ring.get();
+    if (!ring) {
+        async_log_ring.ring = async_logger.add_ring();
+        ring = async_log_ring.ring.get();
+    }
+    // This pairs with AsyncLogger::stop, which clears
+    // hsb_log_async_enable and then waits for writing to clear: either
+    // stop sees us writing and waits for the commit, or we see that
+    // we're stopped.
+    ring->writing.store(true);
+    if (!hsb_log_async_enable.load()) {
+        ring->writing.store(false, std::memory_order_release);
+        stopped = true;
+        return nullptr;
+    }
+    uint64_t tail = ring->tail.load(std::memory_order_relaxed);
+    if ((tail - ring->head.load(std::memory_order_acquire)) >= ASYNC_LOG_RING_SIZE) {
+        ring->writing.store(false, std::memory_order_release);
+        async_logger.dropped_.fetch_add(1, std::memory_order_relaxed);
+        return nullptr;
+    }
+    AsyncLogRecord* record = &ring->records[tail & (ASYNC_LOG_RING_SIZE - 1)];
+    record->timestamp_ns = log_timestamp_ns();
+    record->file = file;
+    record->function = function;
+    record->format = nullptr;
+    record->formatter = nullptr;
+    record->long_message = nullptr;
+    record->line = line;
+    record->level = level;
+    record->tid = cached_tid();
+    record->size = 0;
+    return record;
+}
+
+void async_log_commit()
+{
+    AsyncLogRing* ring = async_log_ring.ring.get();
+    uint64_t tail = ring->tail.load(std::memory_order_relaxed);
+    ring->tail.store(tail + 1, std::memory_order_release);
+    ring->writing.store(false, std::memory_order_release);
+    async_logger.notify();
+}
+
+void async_log_abandon()
+{
+    AsyncLogRing* ring = async_log_ring.ring.get();
+    ring->writing.store(false, std::memory_order_release);
+}
+
+void async_log_text(AsyncLogRecord* record, const fmt::memory_buffer& text)
+{
+    if (text.size() <= AsyncLogRecord::PAYLOAD_SIZE) {
+        std::copy(text.begin(), text.end(), record->payload);
+        record->size = text.size();
+    } else {
+        record->long_message = new std::string(text.data(), text.size());
+    }
+}
+
+void set_hsb_log_async(bool enable)
+{
+    std::call_once(hsb_log_initialized, hsb_log_initialize);
+    if (enable) {
+        async_logger.start();
+    } else {
+        async_logger.stop();
+    }
+}
+
+bool get_hsb_log_async()
+{
+    return hsb_log_async_enable;
+}
+
+uint64_t hsb_log_dropped()
+{
+    return async_logger.dropped_;
+}
+
+void hsb_log_flush()
+{
+    async_logger.flush();
+}
+
 } // namespace hololink::logging
@@ -20,6 +20,8 @@
 #ifndef SRC_HOLOLINK_LOGGING
 #define SRC_HOLOLINK_LOGGING
 
+#include <cstdint>
+
 namespace hololink::logging {
 
 // Supported logging levels.
@@ -51,7 +53,26 @@ extern HsbLogger hsb_logger;
 
 // Provide the current monotonic timestamp in seconds,
 // used with log messages-- for debugging use only.
-float log_timestamp_s();
+double log_timestamp_s();
+
+// The same timestamp in nanoseconds.
+int64_t log_timestamp_ns();
+
+// When enabled, HSB_LOG_* calls write a fixed-size binary record
+// to a per-thread ring instead of formatting and writing the message
+// on the calling thread; a background thread formats the records and
+// writes them to the console/socket sink (or hsb_logger, if that's
+// been replaced).  Messages logged while a thread's ring is full are
+// dropped and counted.  Setting HSB_LOG_ASYNC=1 in the environment
+// enables this at startup.
+void set_hsb_log_async(bool enable);
+bool get_hsb_log_async();
+
+// Number of messages dropped because a ring was full.
+uint64_t hsb_log_dropped();
+
+// Block until every message queued before this call is written.
+void hsb_log_flush();
 
 } // namespace hololink::logging
 
@@ -25,6 +25,14 @@
 #include "logging.hpp"
 #include "metadata.hpp"
 
+#include <atomic>
+#include <cstddef>
+#include <new>
+#include <tuple>
+#include <type_traits>
+
+#include <sys/types.h>
+
 #include <fmt/format.h>
 #include <fmt/ranges.h>
 
@@ -73,11 +81,162 @@ struct fmt::formatter<hololink::Metadata::Element> : fmt::formatter<fmt::string_
 
 namespace hololink::logging {
 
+// Set by set_hsb_log_async; checked by every HSB_LOG_* call.
+extern std::atomic<bool> hsb_log_async_enable;
+
+struct AsyncLogRecord;
+typedef void (*AsyncLogFormatter)(const AsyncLogRecord& record, fmt::memory_buffer& out);
+
+/**
+ * @brief What a logging thread writes to its ring in asynchronous mode.
+ * When all the arguments are plain values and the format is a string
+ * literal, the values are copied into payload and formatter renders
+ * them later on the drain thread; otherwise the message is formatted
+ * by the caller and payload (or, if that's too small, long_message)
+ * holds the text.
+ */
+struct alignas(64) AsyncLogRecord {
+    static constexpr size_t PAYLOAD_SIZE = 192;
+
+    int64_t timestamp_ns;
+    const char* file;
+    const char* function;
+    const char* format;
+    AsyncLogFormatter formatter;
+    std::string* long_message;
+    unsigned line;
+    HsbLogLevel level;
+    pid_t tid;
+    uint32_t size;
+    alignas(8) char payload[PAYLOAD_SIZE];
+};
+static_assert(sizeof(AsyncLogRecord) == 256);
+
+// Returns the next free record in the calling thread's ring, or
+// nullptr if the ring is full (counting a drop) or, setting stopped,
+// asynchronous logging was turned off (log synchronously instead).
+// Only when a record is returned, call async_log_commit to publish it,
+// or async_log_abandon to give it back unused; AsyncLogWrite does this.
+AsyncLogRecord* async_log_acquire(char const* file, unsigned line, const char* function, HsbLogLevel level, bool& stopped);
+void async_log_commit();
+void async_log_abandon();
+
+// Commits the acquired record, or abandons it if we leave before that
+// (e.g. formatting throws), so AsyncLogger::stop never waits on us.
+class AsyncLogWrite {
+public:
+    AsyncLogWrite() = default;
+    AsyncLogWrite(const AsyncLogWrite&) = delete;
+    AsyncLogWrite& operator=(const AsyncLogWrite&) = delete;
+    ~AsyncLogWrite()
+    {
+        if (!committed_) {
+            async_log_abandon();
+        }
+    }
+
+    void commit()
+    {
+        async_log_commit();
+        committed_ = true;
+    }
+
+private:
+    bool committed_ = false;
+};
+
+// Copy a formatted message to the record.
+void async_log_text(AsyncLogRecord* record, const fmt::memory_buffer& text);
+
+template <typename... ValuesT>
+static void async_log_format(const AsyncLogRecord& record, fmt::memory_buffer& out)
+{
+    const auto& values = *std::launder(reinterpret_cast<const std::tuple<ValuesT...>*>(record.payload));
+    std::apply(
+        [&](const auto&... value) {
+            auto fmt_args = fmt::make_format_args<fmt::buffer_context<char>>(value...);
+            fmt::vformat_to(std::back_inserter(out), fmt::string_view(record.format), fmt_args);
+        },
+        values);
+}
+
+// Is this format (as deduced by a forwarding reference) a string
+// literal, which outlives the call so that we can keep just the
+// pointer?  Character buffers, std::string and so on aren't.  Note that
+// a const char array on the stack has the same type as a literal.
+template <typename FormatT>
+struct AsyncLogLiteral : std::false_type { };
+
+template <size_t N>
+struct AsyncLogLiteral<const char (&)[N]> : std::true_type { };
+
+#ifdef FMT_HAS_CONSTEVAL
+// Where fmt checks format strings at compile time, fmt::format_string
+// can only be made from a constant.
+template <typename... FmtArgsT>
+struct AsyncLogLiteral<const fmt::basic_format_string<char, FmtArgsT...>&> : std::true_type { };
+#endif
+
+template <size_t N>
+static inline const char* async_log_literal(const char (&format)[N])
+{
+    return format;
+}
+
+template <typename... FmtArgsT>
+static inline const char* async_log_literal(const fmt::basic_format_string<char, FmtArgsT...>& format)
+{
+    return format.get().data();
+}
+
+// Can we copy these arguments now and format them later?
+template <typename FormatT, typename... ArgsT>
+static constexpr bool async_log_deferrable()
+{
+    if constexpr (AsyncLogLiteral<FormatT>::value && ((std::is_arithmetic_v<std::decay_t<ArgsT>> || std::is_enum_v<std::decay_t<ArgsT>>) && ...)) {
+        return sizeof(std::tuple<std::decay_t<ArgsT>...>) <= AsyncLogRecord::PAYLOAD_SIZE;
+    }
+    return false;
+}
+
+template <typename FormatT>
+using async_log_char_t = fmt::char_t<std::remove_cv_t<std::remove_reference_t<FormatT>>>;
+
+template <typename FormatT, typename... ArgsT>
+static inline void hsb_log_async(char const* file, unsigned line, const char* function, HsbLogLevel level, FormatT&& format, ArgsT&&... args)
+{
+    bool stopped = false;
+    AsyncLogRecord* record = async_log_acquire(file, line, function, level, stopped);
+    if (!record) {
+        if (stopped) {
+            auto fmt_args = fmt::make_format_args<fmt::buffer_context<async_log_char_t<FormatT>>>(args...);
+            hsb_logger(file, line, function, level, fmt::vformat(format, fmt_args).c_str());
+        }
+        return;
+    }
+    AsyncLogWrite write;
+    if constexpr (async_log_deferrable<FormatT, ArgsT...>()) {
+        new (record->payload) std::tuple<std::decay_t<ArgsT>...>(args...);
+        record->format = async_log_literal(format);
+        record->formatter = async_log_format<std::decay_t<ArgsT>...>;
+    } else {
+        fmt::memory_buffer text;
+        auto fmt_args = fmt::make_format_args<fmt::buffer_context<async_log_char_t<FormatT>>>(args...);
+        fmt::vformat_to(std::back_inserter(text), format, fmt_args);
+        async_log_text(record, text);
+    }
+    write.commit();
+}
+
 template <typename FormatT, typename... ArgsT>
-static inline void hsb_log_fmt(char const* file, unsigned line, const char* function, HsbLogLevel level, const FormatT& format, ArgsT&&... args)
+static inline void hsb_log_fmt(char const* file, unsigned line, const char* function, HsbLogLevel level, FormatT&& format, ArgsT&&... args)
 {
     if (level >= hsb_log_level) {
-        auto fmt_args = fmt::make_format_args<fmt::buffer_context<fmt::char_t<FormatT>>>(args...);
+        if (hsb_log_async_enable.load(std::memory_order_relaxed)) {
+            hsb_log_async(file, line, function, level, std::forward<FormatT>(format), std::forward<ArgsT>(args)...);
+            return;
+        }
+        auto fmt_args = fmt::make_format_args<fmt::buffer_context<async_log_char_t<FormatT>>>(args...);
         hsb_logger(file, line, function, level, fmt::vformat(format, fmt_args).c_str());
     }
 }
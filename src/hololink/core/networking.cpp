@@ -19,6 +19,8 @@
 
 #include <arpa/inet.h>
 #include <assert.h>
+#include <linux/netlink.h>
+#include <linux/rtnetlink.h>
 #include <net/if.h>
 #include <sys/ioctl.h>
 #include <sys/socket.h>
@@ -26,11 +28,14 @@
 #include <algorithm>
 #include <map>
 #include <memory>
+#include <mutex>
 #include <stdexcept>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 #include "logging_internal.hpp"
+#include "reactor.hpp"
 
 namespace hololink::core {
 
@@ -42,9 +47,257 @@ size_t round_up(size_t value, size_t alignment)
     return ((value + alignment - 1) / alignment) * alignment;
 }
 
+namespace {
+
+    // Map of IP address to interface name, for every interface.
+    std::map<in_addr_t, std::string> interfaces_by_ip(int socket_fd)
+    {
+        std::map<in_addr_t, std::string> interface_by_ip;
+        // First, find out how many interfaces there are.
+        ifconf ifconf_request {};
+        if (ioctl(socket_fd, SIOCGIFCONF, &ifconf_request) < 0) {
+            throw std::runtime_error(
+                fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
+        }
+        assert(ifconf_request.ifc_len > 0);
+        //
+        std::vector<ifreq> ifreq_buffer(ifconf_request.ifc_len / sizeof(ifreq));
+        ifconf_request.ifc_ifcu.ifcu_req = ifreq_buffer.data();
+        if (ioctl(socket_fd, SIOCGIFCONF, &ifconf_request) < 0) {
+            throw std::runtime_error(
+                fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
+        }
+        assert(static_cast<size_t>(ifconf_request.ifc_len) == ifreq_buffer.size() * sizeof(ifreq));
+        assert(ifconf_request.ifc_ifcu.ifcu_req == ifreq_buffer.data());
+        for (auto&& req : ifreq_buffer) {
+            const std::string name(req.ifr_ifrn.ifrn_name);
+            const in_addr ip = ((struct sockaddr_in*)&req.ifr_ifru.ifru_addr)->sin_addr;
+            HSB_LOG_TRACE("name={} ip={}", name, inet_ntoa(ip));
+            interface_by_ip[ip.s_addr] = name;
+        }
+        return interface_by_ip;
+    }
+
+    MacAddress interface_mac(int socket_fd, const std::string& binterface)
+    {
+        ifreq ifhwaddr_request {};
+        std::strncpy(ifhwaddr_request.ifr_ifrn.ifrn_name, binterface.c_str(),
+            sizeof(ifhwaddr_request.ifr_ifrn.ifrn_name));
+        if (ioctl(socket_fd, SIOCGIFHWADDR, &ifhwaddr_request) < 0) {
+            throw std::runtime_error(
+                fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
+        }
+        MacAddress mac;
+        static_assert(mac.max_size() <= sizeof(ifhwaddr_request.ifr_ifru.ifru_addr.sa_data));
+        std::copy(ifhwaddr_request.ifr_ifru.ifru_addr.sa_data,
+            ifhwaddr_request.ifr_ifru.ifru_addr.sa_data + mac.max_size(),
+            mac.begin());
+        return mac;
+    }
+
+    /**
+     * Remembers which local IP we use to reach each destination and
+     * the name and MAC of the interface with each local IP.  Everything
+     * is discarded when the kernel tells us, via RTNETLINK, that an
+     * address, link, or route was added, changed, or removed.  The
+     * netlink socket is serviced by the Reactor thread, so there's a
+     * brief window after a change where a stale entry can be returned.
+     */
+    class InterfaceCache {
+    public:
+        struct Interface {
+            std::string name;
+            MacAddress mac;
+        };
+
+        static InterfaceCache& get_interface_cache()
+        {
+            // Leaked, like the reactor, so that it's usable until exit.
+            static InterfaceCache* instance = new InterfaceCache();
+            return *instance;
+        }
+
+        // Returns the generation to pass to the store calls, and
+        // sets route/interface if we have them.
+        uint64_t lookup(const std::string& destination_ip, uint32_t port, in_addr_t& ip, Interface& interface)
+        {
+            std::lock_guard lock(mutex_);
+            auto route = routes_.find({ destination_ip, port });
+            if ((route != routes_.end()) && find_interface(route->second, interface)) {
+                ip = route->second;
+                stats_.hits++;
+            } else {
+                stats_.misses++;
+                ip = INADDR_NONE;
+            }
+            return generation_;
+        }
+
+        uint64_t lookup(in_addr_t ip, Interface& interface, bool& found)
+        {
+            std::lock_guard lock(mutex_);
+            found = find_interface(ip, interface);
+            if (found) {
+                stats_.hits++;
+            } else {
+                stats_.misses++;
+            }
+            return generation_;
+        }
+
+        // Only store what was looked up before the last invalidation.
+        void store(uint64_t generation, const std::string& destination_ip, uint32_t port, in_addr_t ip, const Interface& interface)
+        {
+            std::lock_guard lock(mutex_);
+            if (!stats_.enabled || (generation != generation_)) {
+                return;
+            }
+            routes_[{ destination_ip, port }] = ip;
+            interfaces_[ip] = interface;
+        }
+
+        void store(uint64_t generation, in_addr_t ip, const Interface& interface)
+        {
+            std::lock_guard lock(mutex_);
+            if (!stats_.enabled || (generation != generation_)) {
+                return;
+            }
+            interfaces_[ip] = interface;
+        }
+
+        void clear()
+        {
+            std::lock_guard lock(mutex_);
+            routes_.clear();
+            interfaces_.clear();
+            generation_++;
+        }
+
+        LocalIpAndMacCacheStats stats()
+        {
+            std::lock_guard lock(mutex_);
+            return stats_;
+        }
+
+        // Flush the cache if any of the RTNETLINK messages in
+        // buffer report an address, link, or route change.
+        void handle_netlink_messages(const uint8_t* buffer, size_t size)
+        {
+            if (changes_network_configuration(buffer, size)) {
+                invalidate();
+            }
+        }
+
+    private:
+        InterfaceCache()
+        {
+            stats_ = {};
+            // Listen for changes that can affect our results.
+            socket_fd_ = socket(AF_NETLINK, SOCK_RAW | SOCK_NONBLOCK | SOCK_CLOEXEC, NETLINK_ROUTE);
+            if (socket_fd_ < 0) {
+                HSB_LOG_DEBUG("Unable to create netlink socket, errno={}; local_ip_and_mac won't be cached.", errno);
+                return;
+            }
+            sockaddr_nl address {};
+            address.nl_family = AF_NETLINK;
+            address.nl_groups = RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV4_ROUTE;
+            if (bind(socket_fd_, (sockaddr*)&address, sizeof(address)) < 0) {
+                HSB_LOG_DEBUG("Unable to bind netlink socket, errno={}; local_ip_and_mac won't be cached.", errno);
+                close(socket_fd_);
+                socket_fd_ = -1;
+                return;
+            }
+            stats_.enabled = true;
+            Reactor::get_reactor()->add_fd_callback(socket_fd_,
+                [this](int fd, short events) { this->netlink_callback(fd, events); });
+        }
+
+        void netlink_callback(int fd, short events)
+        {
+            bool changed = false;
+            std::array<uint8_t, 8192> buffer;
+            while (true) {
+                ssize_t received = recv(fd, buffer.data(), buffer.size(), 0);
+                if (received < 0) {
+                    if (errno == ENOBUFS) {
+                        // We missed some notifications.
+                        changed = true;
+                        continue;
+                    }
+                    break;
+                }
+                if (changes_network_configuration(buffer.data(), received)) {
+                    changed = true;
+                }
+            }
+            if (changed) {
+                invalidate();
+            }
+        }
+
+        static bool changes_network_configuration(const uint8_t* buffer, size_t size)
+        {
+            int remaining = static_cast<int>(size);
+            for (auto header = reinterpret_cast<const nlmsghdr*>(buffer); NLMSG_OK(header, remaining);
+                 header = NLMSG_NEXT(header, remaining)) {
+                switch (header->nlmsg_type) {
+                case RTM_NEWADDR:
+                case RTM_DELADDR:
+                case RTM_NEWLINK:
+                case RTM_DELLINK:
+                case RTM_NEWROUTE:
+                case RTM_DELROUTE:
+                    return true;
+                default:
+                    break;
+                }
+            }
+            return false;
+        }
+
+        void invalidate()
+        {
+            HSB_LOG_DEBUG("Network configuration changed; flushing local_ip_and_mac cache.");
+            std::lock_guard lock(mutex_);
+            routes_.clear();
+            interfaces_.clear();
+            generation_++;
+            stats_.invalidations++;
+        }
+
+        // Caller must hold mutex_.
+        bool find_interface(in_addr_t ip, Interface& interface)
+        {
+            auto it = interfaces_.find(ip);
+            if (it == interfaces_.end()) {
+                return false;
+            }
+            interface = it->second;
+            return true;
+        }
+
+        std::mutex mutex_;
+        int socket_fd_ = -1;
+        uint64_t generation_ = 0;
+        LocalIpAndMacCacheStats stats_;
+        std::map<std::pair<std::string, uint32_t>, in_addr_t> routes_;
+        std::unordered_map<in_addr_t, Interface> interfaces_;
+    };
+
+} // anonymous namespace
+
 std::tuple<std::string, std::string, MacAddress> local_ip_and_mac(
     const std::string& destination_ip, uint32_t port)
 {
+    InterfaceCache& cache = InterfaceCache::get_interface_cache();
+    in_addr_t cached_ip;
+    InterfaceCache::Interface interface;
+    uint64_t generation = cache.lookup(destination_ip, port, cached_ip, interface);
+    if (cached_ip != INADDR_NONE) {
+        in_addr ip { cached_ip };
+        return { inet_ntoa(ip), interface.name, interface.mac };
+    }
+
     // We need a port number for the connect call to work, but because it's
     // SOCK_DGRAM, there's no actual traffic sent.
     UniqueFileDescriptor s(socket(AF_INET, SOCK_DGRAM, 0));
@@ -53,29 +306,7 @@ std::tuple<std::string, std::string, MacAddress> local_ip_and_mac(
     }
 
     // Start with a map of IP address to interfaces.
-    std::map<in_addr_t, std::string> interface_by_ip;
-    // First, find out how many interfaces there are.
-    ifconf ifconf_request {};
-    if (ioctl(s.get(), SIOCGIFCONF, &ifconf_request) < 0) {
-        throw std::runtime_error(
-            fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
-    }
-    assert(ifconf_request.ifc_len > 0);
-    //
-    std::vector<ifreq> ifreq_buffer(ifconf_request.ifc_len / sizeof(ifreq));
-    ifconf_request.ifc_ifcu.ifcu_req = ifreq_buffer.data();
-    if (ioctl(s.get(), SIOCGIFCONF, &ifconf_request) < 0) {
-        throw std::runtime_error(
-            fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
-    }
-    assert(static_cast<size_t>(ifconf_request.ifc_len) == ifreq_buffer.size() * sizeof(ifreq));
-    assert(ifconf_request.ifc_ifcu.ifcu_req == ifreq_buffer.data());
-    for (auto&& req : ifreq_buffer) {
-        const std::string name(req.ifr_ifrn.ifrn_name);
-        const in_addr ip = ((struct sockaddr_in*)&req.ifr_ifru.ifru_addr)->sin_addr;
-        HSB_LOG_TRACE("name={} ip={}", name, inet_ntoa(ip));
-        interface_by_ip[ip.s_addr] = name;
-    }
+    std::map<in_addr_t, std::string> interface_by_ip = interfaces_by_ip(s.get());
 
     // datagram sockets, when connected, will only
     // do I/O with the address they're connected to.
@@ -105,51 +336,15 @@ std::tuple<std::string, std::string, MacAddress> local_ip_and_mac(
             fmt::format("getsockname failed with errno={}: \"{}\"", errno, strerror(errno)));
     }
     const std::string binterface = interface_by_ip[ip.sin_addr.s_addr];
-
-    ifreq ifhwaddr_request {};
-    std::strncpy(ifhwaddr_request.ifr_ifrn.ifrn_name, binterface.c_str(),
-        sizeof(ifhwaddr_request.ifr_ifrn.ifrn_name));
-    if (ioctl(s.get(), SIOCGIFHWADDR, &ifhwaddr_request) < 0) {
-        throw std::runtime_error(
-            fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
-    }
-    MacAddress mac;
-    static_assert(mac.max_size() <= sizeof(ifhwaddr_request.ifr_ifru.ifru_addr.sa_data));
-    std::copy(ifhwaddr_request.ifr_ifru.ifru_addr.sa_data,
-        ifhwaddr_request.ifr_ifru.ifru_addr.sa_data + mac.max_size(),
-        mac.begin());
+    MacAddress mac = interface_mac(s.get(), binterface);
     HSB_LOG_DEBUG("destination_ip={} local_ip={} mac_id={:x}:{:x}:{:x}:{:x}:{:x}:{:x}",
         destination_ip, inet_ntoa(ip.sin_addr), mac[0], mac[1], mac[2], mac[3], mac[4], mac[5]);
+    cache.store(generation, destination_ip, port, ip.sin_addr.s_addr, { binterface, mac });
     return { inet_ntoa(ip.sin_addr), binterface, mac };
 }
 
 std::tuple<std::string, std::string, MacAddress> local_ip_and_mac_from_socket(int socket_fd)
 {
-    // Start with a map of IP address to interfaces.
-    std::map<in_addr_t, std::string> interface_by_ip;
-    // First, find out how many interfaces there are.
-    ifconf ifconf_request {};
-    if (ioctl(socket_fd, SIOCGIFCONF, &ifconf_request) < 0) {
-        throw std::runtime_error(
-            fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
-    }
-    assert(ifconf_request.ifc_len > 0);
-    //
-    std::vector<ifreq> ifreq_buffer(ifconf_request.ifc_len / sizeof(ifreq));
-    ifconf_request.ifc_ifcu.ifcu_req = ifreq_buffer.data();
-    if (ioctl(socket_fd, SIOCGIFCONF, &ifconf_request) < 0) {
-        throw std::runtime_error(
-            fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
-    }
-    assert(static_cast<size_t>(ifconf_request.ifc_len) == ifreq_buffer.size() * sizeof(ifreq));
-    assert(ifconf_request.ifc_ifcu.ifcu_req == ifreq_buffer.data());
-    for (auto&& req : ifreq_buffer) {
-        const std::string name(req.ifr_ifrn.ifrn_name);
-        const in_addr ip = ((struct sockaddr_in*)&req.ifr_ifru.ifru_addr)->sin_addr;
-        HSB_LOG_TRACE("name={} ip={}", name, inet_ntoa(ip));
-        interface_by_ip[ip.s_addr] = name;
-    }
-
     sockaddr_in ip {};
     ip.sin_family = AF_UNSPEC;
     socklen_t ip_len = sizeof(ip);
@@ -157,25 +352,40 @@ std::tuple<std::string, std::string, MacAddress> local_ip_and_mac_from_socket(in
         throw std::runtime_error(
             fmt::format("getsockname failed with errno={}: \"{}\"", errno, strerror(errno)));
     }
-    const std::string binterface = interface_by_ip[ip.sin_addr.s_addr];
 
-    ifreq ifhwaddr_request {};
-    std::strncpy(ifhwaddr_request.ifr_ifrn.ifrn_name, binterface.c_str(),
-        sizeof(ifhwaddr_request.ifr_ifrn.ifrn_name));
-    if (ioctl(socket_fd, SIOCGIFHWADDR, &ifhwaddr_request) < 0) {
-        throw std::runtime_error(
-            fmt::format("ioctl failed with errno={}: \"{}\"", errno, strerror(errno)));
+    InterfaceCache& cache = InterfaceCache::get_interface_cache();
+    InterfaceCache::Interface interface;
+    bool found;
+    uint64_t generation = cache.lookup(ip.sin_addr.s_addr, interface, found);
+    if (found) {
+        return { inet_ntoa(ip.sin_addr), interface.name, interface.mac };
     }
-    MacAddress mac;
-    static_assert(mac.max_size() <= sizeof(ifhwaddr_request.ifr_ifru.ifru_addr.sa_data));
-    std::copy(ifhwaddr_request.ifr_ifru.ifru_addr.sa_data,
-        ifhwaddr_request.ifr_ifru.ifru_addr.sa_data + mac.max_size(),
-        mac.begin());
+
+    // Start with a map of IP address to interfaces.
+    std::map<in_addr_t, std::string> interface_by_ip = interfaces_by_ip(socket_fd);
+    const std::string binterface = interface_by_ip[ip.sin_addr.s_addr];
+    MacAddress mac = interface_mac(socket_fd, binterface);
     HSB_LOG_DEBUG("local_ip={} mac_id={:x}:{:x}:{:x}:{:x}:{:x}:{:x}",
         inet_ntoa(ip.sin_addr), mac[0], mac[1], mac[2], mac[3], mac[4], mac[5]);
+    cache.store(generation, ip.sin_addr.s_addr, { binterface, mac });
     return { inet_ntoa(ip.sin_addr), binterface, mac };
 }
 
+LocalIpAndMacCacheStats local_ip_and_mac_cache_stats()
+{
+    return InterfaceCache::get_interface_cache().stats();
+}
+
+void clear_local_ip_and_mac_cache()
+{
+    InterfaceCache::get_interface_cache().clear();
+}
+
+void handle_local_ip_and_mac_netlink_messages(const uint8_t* messages, size_t size)
+{
+    InterfaceCache::get_interface_cache().handle_netlink_messages(messages, size);
+}
+
 /**
  * @brief
  *
@@ -21,6 +21,7 @@
 #include <unistd.h> // for close()
 
 #include <array>
+#include <cstdint>
 #include <memory>
 #include <stdexcept>
 #include <string>
@@ -51,7 +52,9 @@ using MacAddress = std::array<uint8_t, 6>;
 using UniqueFileDescriptor = std::unique_ptr<Nullable<int>, Nullable<int>::Deleter<int, &close>>;
 
 /**
- * @brief Works only on Linux.
+ * @brief Works only on Linux.  Results are cached; the cache is
+ * flushed when an RTNETLINK listener sees an address, link, or route
+ * change.
  *
  * @param destination_ip
  * @param port
@@ -68,6 +71,41 @@ std::tuple<std::string, std::string, MacAddress> local_ip_and_mac(
  */
 std::tuple<std::string, std::string, MacAddress> local_ip_and_mac_from_socket(int socket_fd);
 
+/**
+ * @brief Counters for the cache behind local_ip_and_mac and
+ * local_ip_and_mac_from_socket.
+ */
+struct LocalIpAndMacCacheStats {
+    uint64_t hits;
+    uint64_t misses;
+    // Times the cache was flushed due to a netlink notification
+    uint64_t invalidations;
+    // False if we couldn't listen for netlink notifications, in
+    // which case nothing is cached.
+    bool enabled;
+};
+
+/**
+ * @returns the current local_ip_and_mac cache counters.
+ */
+LocalIpAndMacCacheStats local_ip_and_mac_cache_stats();
+
+/**
+ * @brief Discard everything cached by local_ip_and_mac and
+ * local_ip_and_mac_from_socket; counters are not reset.
+ */
+void clear_local_ip_and_mac_cache();
+
+/**
+ * @brief Process RTNETLINK messages as though they were received by the
+ * local_ip_and_mac cache's netlink listener; this is for testing, since
+ * generating real notifications requires CAP_NET_ADMIN.
+ *
+ * @param messages A buffer of nlmsghdr-framed messages
+ * @param size The number of bytes in messages
+ */
+void handle_local_ip_and_mac_netlink_messages(const uint8_t* messages, size_t size);
+
 /**
  * @brief Get the Mac ID for the given interface by name
  *
@@ -17,6 +17,8 @@
 
 #include "packetizer_program.hpp"
 
+#include "logging_internal.hpp"
+
 namespace hololink {
 
 // Packetizer configuration SIF offsets
@@ -47,6 +49,41 @@ void PacketizerProgram::disable(Hololink& hololink, uint32_t sif_address)
     hololink.write_uint32(sif_address + PACKETIZER_MODE, 0);
 }
 
+void PacketizerProgram::load(Hololink& hololink, uint32_t sif_address, uint32_t mode, const Microcode& microcode)
+{
+    if (!microcode.empty()) {
+        auto [ok, values] = hololink.read_uint32(
+            { sif_address + PACKETIZER_MODE, sif_address + PACKETIZER_RAM, sif_address + PACKETIZER_DATA },
+            std::shared_ptr<Timeout>());
+        if (ok) {
+            uint32_t resident_mode = values[0];
+            const auto& [last_ram, last_data] = microcode.back();
+            if ((values[1] == last_ram) && (values[2] == last_data)
+                && ((resident_mode == mode) || (resident_mode == 0))) {
+                HSB_LOG_DEBUG("Packetizer program at sif_address={:#x} is already loaded.", sif_address);
+                if (resident_mode != mode) {
+                    hololink.write_uint32(sif_address + PACKETIZER_MODE, mode);
+                }
+                return;
+            }
+        }
+    }
+
+    Hololink::WriteData write_data;
+    write_data.queue_write_uint32(sif_address + PACKETIZER_MODE, mode);
+    for (const auto& [ram, data] : microcode) {
+        // Each request is limited to CONTROL_BLOCK_WORDS writes; keep
+        // each RAM/DATA pair in the same request.
+        if (write_data.size() + 2 > CONTROL_BLOCK_WORDS) {
+            hololink.write_uint32(write_data);
+            write_data = Hololink::WriteData();
+        }
+        write_data.queue_write_uint32(sif_address + PACKETIZER_RAM, ram);
+        write_data.queue_write_uint32(sif_address + PACKETIZER_DATA, data);
+    }
+    hololink.write_uint32(write_data);
+}
+
 /*******************************************************************************
  NullPacketizerProgram
 *******************************************************************************/
@@ -84,534 +121,284 @@ uint32_t Csi10ToPacked10::get_output_size(uint32_t input_size)
     return ((num_pixels + 2) / 3) * 4;
 }
 
+// Csi10ToPacked10 microcode: (PACKETIZER_RAM, PACKETIZER_DATA) values, in load order.
+static const PacketizerProgram::Microcode CSI10_TO_PACKED10_MICROCODE = {
+    { 0x00000000, 0x2AAAAAAA }, // RAM: 0 ELEMENT:0
+    { 0x00000010, 0x2A9AA6AA }, // RAM: 1 ELEMENT:0
+    { 0x00000020, 0x02020000 }, // RAM: 2 ELEMENT:0
+    { 0x00000040, 0x05000000 }, // RAM: 4 ELEMENT:0
+    { 0x00000050, 0x00001865 }, // RAM: 5 ELEMENT:0
+    { 0x00000060, 0x20300000 }, // RAM: 6 ELEMENT:0
+    { 0x00000070, 0x1C007061 }, // RAM: 7 ELEMENT:0
+    { 0x00000090, 0x40044400 }, // RAM: 9 ELEMENT:0
+    { 0x000000a0, 0x50000600 }, // RAM: 10 ELEMENT:0
+    { 0x000000b0, 0x20802080 }, // RAM: 11 ELEMENT:0
+    { 0x000000c0, 0x9362E000 }, // RAM: 12 ELEMENT:0
+    { 0x000000d0, 0x01B18626 }, // RAM: 13 ELEMENT:0
+    { 0x00000140, 0x00000001 }, // RAM: 20 ELEMENT:0
+    { 0x00000001, 0x2AAAABFE }, // RAM: 0 ELEMENT:1
+    { 0x00000011, 0x2AAAAAAA }, // RAM: 1 ELEMENT:1
+    { 0x00000081, 0x00010000 }, // RAM: 8 ELEMENT:1
+    { 0x00000091, 0x440CCC81 }, // RAM: 9 ELEMENT:1
+    { 0x000000a1, 0x01555600 }, // RAM: 10 ELEMENT:1
+    { 0x000000b1, 0x18006085 }, // RAM: 11 ELEMENT:1
+    { 0x000000c1, 0x9362E000 }, // RAM: 12 ELEMENT:1
+    { 0x000000d1, 0x01B10724 }, // RAM: 13 ELEMENT:1
+    { 0x000000f1, 0x00222200 }, // RAM: 15 ELEMENT:1
+    { 0x00000101, 0xA802A800 }, // RAM: 16 ELEMENT:1
+    { 0x00000111, 0xE0000002 }, // RAM: 17 ELEMENT:1
+    { 0x00000121, 0x6DB0F000 }, // RAM: 18 ELEMENT:1
+    { 0x00000131, 0x0000C001 }, // RAM: 19 ELEMENT:1
+    { 0x00000141, 0x00000001 }, // RAM: 20 ELEMENT:1
+    { 0x00000002, 0x2AAAABFE }, // RAM: 0 ELEMENT:2
+    { 0x00000012, 0x2A9AA6AA }, // RAM: 1 ELEMENT:2
+    { 0x00000022, 0x01000000 }, // RAM: 2 ELEMENT:2
+    { 0x00000032, 0x11110000 }, // RAM: 3 ELEMENT:2
+    { 0x00000042, 0x05000000 }, // RAM: 4 ELEMENT:2
+    { 0x00000052, 0x00001865 }, // RAM: 5 ELEMENT:2
+    { 0x00000062, 0x20300000 }, // RAM: 6 ELEMENT:2
+    { 0x00000072, 0x1C007061 }, // RAM: 7 ELEMENT:2
+    { 0x00000092, 0x00111100 }, // RAM: 9 ELEMENT:2
+    { 0x000000a2, 0xA9557800 }, // RAM: 10 ELEMENT:2
+    { 0x000000b2, 0xD80C668D }, // RAM: 11 ELEMENT:2
+    { 0x000000c2, 0xDB63E001 }, // RAM: 12 ELEMENT:2
+    { 0x000000d2, 0x01C18022 }, // RAM: 13 ELEMENT:2
+    { 0x000000f2, 0x00222200 }, // RAM: 15 ELEMENT:2
+    { 0x00000102, 0xA802A800 }, // RAM: 16 ELEMENT:2
+    { 0x00000112, 0xE0000002 }, // RAM: 17 ELEMENT:2
+    { 0x00000122, 0x6DB0F000 }, // RAM: 18 ELEMENT:2
+    { 0x00000132, 0x0000C001 }, // RAM: 19 ELEMENT:2
+    { 0x00000142, 0x00000001 }, // RAM: 20 ELEMENT:2
+    { 0x00000003, 0x155AA6A9 }, // RAM: 0 ELEMENT:3
+    { 0x00000013, 0x15555555 }, // RAM: 1 ELEMENT:3
+    { 0x00000023, 0x00010000 }, // RAM: 2 ELEMENT:3
+    { 0x00000033, 0x00444401 }, // RAM: 3 ELEMENT:3
+    { 0x00000043, 0x02AAA000 }, // RAM: 4 ELEMENT:3
+    { 0x00000053, 0x3C00C108 }, // RAM: 5 ELEMENT:3
+    { 0x00000063, 0x9B7FC05C }, // RAM: 6 ELEMENT:3
+    { 0x00000073, 0x03624AC0 }, // RAM: 7 ELEMENT:3
+    { 0x000000a3, 0x05555000 }, // RAM: 10 ELEMENT:3
+    { 0x000000b3, 0xC0000000 }, // RAM: 11 ELEMENT:3
+    { 0x000000c3, 0x013FE01F }, // RAM: 12 ELEMENT:3
+    { 0x000000d3, 0x00018206 }, // RAM: 13 ELEMENT:3
+    { 0x00000143, 0x00000001 }, // RAM: 20 ELEMENT:3
+    { 0x00000004, 0x155AA6A9 }, // RAM: 0 ELEMENT:4
+    { 0x00000014, 0x15555555 }, // RAM: 1 ELEMENT:4
+    { 0x00000024, 0x00800000 }, // RAM: 2 ELEMENT:4
+    { 0x00000034, 0x00444480 }, // RAM: 3 ELEMENT:4
+    { 0x00000044, 0xF2A15000 }, // RAM: 4 ELEMENT:4
+    { 0x00000054, 0xB006840F }, // RAM: 5 ELEMENT:4
+    { 0x00000064, 0x0B7FC07F }, // RAM: 6 ELEMENT:4
+    { 0x00000074, 0x038344CC }, // RAM: 7 ELEMENT:4
+    { 0x000000a4, 0x05555000 }, // RAM: 10 ELEMENT:4
+    { 0x000000b4, 0xC0000000 }, // RAM: 11 ELEMENT:4
+    { 0x000000c4, 0x013FE01F }, // RAM: 12 ELEMENT:4
+    { 0x000000d4, 0x00018206 }, // RAM: 13 ELEMENT:4
+    { 0x00000144, 0x00000001 }, // RAM: 20 ELEMENT:4
+    { 0x00000005, 0x155AAAAA }, // RAM: 0 ELEMENT:5
+    { 0x00000015, 0x15555555 }, // RAM: 1 ELEMENT:5
+    { 0x00000035, 0x00444400 }, // RAM: 3 ELEMENT:5
+    { 0x00000045, 0xA2A00000 }, // RAM: 4 ELEMENT:5
+    { 0x00000055, 0xF000820A }, // RAM: 5 ELEMENT:5
+    { 0x00000065, 0x64BA1FFF }, // RAM: 6 ELEMENT:5
+    { 0x00000075, 0x6360C8C3 }, // RAM: 7 ELEMENT:5
+    { 0x00000085, 0x40400000 }, // RAM: 8 ELEMENT:5
+    { 0x00000095, 0x44226600 }, // RAM: 9 ELEMENT:5
+    { 0x000000a5, 0x50501000 }, // RAM: 10 ELEMENT:5
+    { 0x000000b5, 0xE0C04145 }, // RAM: 11 ELEMENT:5
+    { 0x000000c5, 0x06DF807F }, // RAM: 12 ELEMENT:5
+    { 0x000000d5, 0x00003C78 }, // RAM: 13 ELEMENT:5
+    { 0x00000145, 0x00000001 }, // RAM: 20 ELEMENT:5
+    { 0x00000006, 0x2A9AA6A9 }, // RAM: 0 ELEMENT:6
+    { 0x00000016, 0x15555555 }, // RAM: 1 ELEMENT:6
+    { 0x00000026, 0x40400000 }, // RAM: 2 ELEMENT:6
+    { 0x00000036, 0x88191100 }, // RAM: 3 ELEMENT:6
+    { 0x00000046, 0x00000800 }, // RAM: 4 ELEMENT:6
+    { 0x00000056, 0x80000000 }, // RAM: 5 ELEMENT:6
+    { 0x00000066, 0x66F9DFFF }, // RAM: 6 ELEMENT:6
+    { 0x00000076, 0x63E3CCCF }, // RAM: 7 ELEMENT:6
+    { 0x00000096, 0x00222200 }, // RAM: 9 ELEMENT:6
+    { 0x000000a6, 0x55500000 }, // RAM: 10 ELEMENT:6
+    { 0x000000b6, 0xC0000005 }, // RAM: 11 ELEMENT:6
+    { 0x000000c6, 0xB7FEE1FF }, // RAM: 12 ELEMENT:6
+    { 0x000000d6, 0x00318607 }, // RAM: 13 ELEMENT:6
+    { 0x00000146, 0x00000001 }, // RAM: 20 ELEMENT:6
+    { 0x00000007, 0x2A9AAAAA }, // RAM: 0 ELEMENT:7
+    { 0x00000017, 0x15555555 }, // RAM: 1 ELEMENT:7
+    { 0x00000037, 0x00222200 }, // RAM: 3 ELEMENT:7
+    { 0x00000047, 0x50005000 }, // RAM: 4 ELEMENT:7
+    { 0x00000057, 0xC0180C11 }, // RAM: 5 ELEMENT:7
+    { 0x00000067, 0x00A01FFF }, // RAM: 6 ELEMENT:7
+    { 0x00000077, 0x7FE0F033 }, // RAM: 7 ELEMENT:7
+    { 0x00000087, 0x20200000 }, // RAM: 8 ELEMENT:7
+    { 0x00000097, 0x44440000 }, // RAM: 9 ELEMENT:7
+    { 0x000000a7, 0x50001000 }, // RAM: 10 ELEMENT:7
+    { 0x000000b7, 0xE0C020C0 }, // RAM: 11 ELEMENT:7
+    { 0x000000c7, 0xB05807FF }, // RAM: 12 ELEMENT:7
+    { 0x000000d7, 0x003078F9 }, // RAM: 13 ELEMENT:7
+    { 0x00000147, 0x00000001 }, // RAM: 20 ELEMENT:7
+    { 0x00000008, 0x2A9AA6A9 }, // RAM: 0 ELEMENT:8
+    { 0x00000018, 0x155556A9 }, // RAM: 1 ELEMENT:8
+    { 0x00000028, 0x20200000 }, // RAM: 2 ELEMENT:8
+    { 0x00000038, 0x00222200 }, // RAM: 3 ELEMENT:8
+    { 0x00000048, 0x52054000 }, // RAM: 4 ELEMENT:8
+    { 0x00000058, 0x2003C31F }, // RAM: 5 ELEMENT:8
+    { 0x00000068, 0xD03FDFE0 }, // RAM: 6 ELEMENT:8
+    { 0x00000078, 0x60E0CC8A }, // RAM: 7 ELEMENT:8
+    { 0x000000b8, 0xC0000000 }, // RAM: 11 ELEMENT:8
+    { 0x000000c8, 0x9362FFFF }, // RAM: 12 ELEMENT:8
+    { 0x000000d8, 0x01B18626 }, // RAM: 13 ELEMENT:8
+    { 0x00000148, 0x00000001 }, // RAM: 20 ELEMENT:8
+    { 0x00000009, 0x2A9AAAAA }, // RAM: 0 ELEMENT:9
+    { 0x00000019, 0x155556A9 }, // RAM: 1 ELEMENT:9
+    { 0x00000039, 0x00222200 }, // RAM: 3 ELEMENT:9
+    { 0x00000049, 0x05555000 }, // RAM: 4 ELEMENT:9
+    { 0x00000059, 0x00180804 }, // RAM: 5 ELEMENT:9
+    { 0x00000069, 0xB66FDFFC }, // RAM: 6 ELEMENT:9
+    { 0x00000079, 0x7CE0F073 }, // RAM: 7 ELEMENT:9
+    { 0x00000089, 0x10100000 }, // RAM: 8 ELEMENT:9
+    { 0x00000099, 0x22113300 }, // RAM: 9 ELEMENT:9
+    { 0x000000a9, 0xAD02A800 }, // RAM: 10 ELEMENT:9
+    { 0x000000b9, 0x20006187 }, // RAM: 11 ELEMENT:9
+    { 0x000000c9, 0xEB3FE7FE }, // RAM: 12 ELEMENT:9
+    { 0x000000d9, 0x01B1F8DB }, // RAM: 13 ELEMENT:9
+    { 0x00000149, 0x00000001 }, // RAM: 20 ELEMENT:9
+    { 0x0000000a, 0x2AAAAAAA }, // RAM: 0 ELEMENT:10
+    { 0x0000001a, 0x155556AA }, // RAM: 1 ELEMENT:10
+    { 0x0000002a, 0x10100000 }, // RAM: 2 ELEMENT:10
+    { 0x0000003a, 0x44440000 }, // RAM: 3 ELEMENT:10
+    { 0x0000004a, 0x07555000 }, // RAM: 4 ELEMENT:10
+    { 0x0000005a, 0x2000C30A }, // RAM: 5 ELEMENT:10
+    { 0x0000006a, 0x403FDFC0 }, // RAM: 6 ELEMENT:10
+    { 0x0000007a, 0x6000C082 }, // RAM: 7 ELEMENT:10
+    { 0x0000009a, 0x00555500 }, // RAM: 9 ELEMENT:10
+    { 0x000000aa, 0xF802F800 }, // RAM: 10 ELEMENT:10
+    { 0x000000ba, 0x26003043 }, // RAM: 11 ELEMENT:10
+    { 0x000000ca, 0xDB63FFFE }, // RAM: 12 ELEMENT:10
+    { 0x000000da, 0x01C18022 }, // RAM: 13 ELEMENT:10
+    { 0x0000014a, 0x00000001 }, // RAM: 20 ELEMENT:10
+    { 0x0000000b, 0x2A9AAAAA }, // RAM: 0 ELEMENT:11
+    { 0x0000001b, 0x155AA6A9 }, // RAM: 1 ELEMENT:11
+    { 0x0000003b, 0x00111100 }, // RAM: 3 ELEMENT:11
+    { 0x0000004b, 0x05555000 }, // RAM: 4 ELEMENT:11
+    { 0x0000006b, 0x49BFDF00 }, // RAM: 6 ELEMENT:11
+    { 0x0000007b, 0x7CE0F072 }, // RAM: 7 ELEMENT:11
+    { 0x0000008b, 0x08080000 }, // RAM: 8 ELEMENT:11
+    { 0x0000009b, 0x22220000 }, // RAM: 9 ELEMENT:11
+    { 0x000000ab, 0x07AAA800 }, // RAM: 10 ELEMENT:11
+    { 0x000000bb, 0x20006185 }, // RAM: 11 ELEMENT:11
+    { 0x000000cb, 0x35FFE600 }, // RAM: 12 ELEMENT:11
+    { 0x000000db, 0x01B1DA9F }, // RAM: 13 ELEMENT:11
+    { 0x0000014b, 0x00000001 }, // RAM: 20 ELEMENT:11
+    { 0x0000000c, 0x2AAAAAAA }, // RAM: 0 ELEMENT:12
+    { 0x0000001c, 0x155AA6AA }, // RAM: 1 ELEMENT:12
+    { 0x0000002c, 0x08080000 }, // RAM: 2 ELEMENT:12
+    { 0x0000003c, 0x00111100 }, // RAM: 3 ELEMENT:12
+    { 0x0000004c, 0x55500000 }, // RAM: 4 ELEMENT:12
+    { 0x0000005c, 0x00000005 }, // RAM: 5 ELEMENT:12
+    { 0x0000006c, 0x4DBF1F00 }, // RAM: 6 ELEMENT:12
+    { 0x0000007c, 0x7C00F872 }, // RAM: 7 ELEMENT:12
+    { 0x000000ac, 0x52ABF800 }, // RAM: 10 ELEMENT:12
+    { 0x000000bc, 0x21801005 }, // RAM: 11 ELEMENT:12
+    { 0x000000cc, 0x05BFFFC0 }, // RAM: 12 ELEMENT:12
+    { 0x000000dc, 0x01C1A266 }, // RAM: 13 ELEMENT:12
+    { 0x0000014c, 0x00000001 }, // RAM: 20 ELEMENT:12
+    { 0x0000000d, 0x2A9AAAAA }, // RAM: 0 ELEMENT:13
+    { 0x0000001d, 0x2A9AA6A9 }, // RAM: 1 ELEMENT:13
+    { 0x0000003d, 0x00111100 }, // RAM: 3 ELEMENT:13
+    { 0x0000004d, 0x55500000 }, // RAM: 4 ELEMENT:13
+    { 0x0000005d, 0x00200045 }, // RAM: 5 ELEMENT:13
+    { 0x0000006d, 0x24300000 }, // RAM: 6 ELEMENT:13
+    { 0x0000007d, 0x1CC07061 }, // RAM: 7 ELEMENT:13
+    { 0x0000008d, 0x04040000 }, // RAM: 8 ELEMENT:13
+    { 0x0000009d, 0x11089980 }, // RAM: 9 ELEMENT:13
+    { 0x000000ad, 0xA8280800 }, // RAM: 10 ELEMENT:13
+    { 0x000000bd, 0x0001882A }, // RAM: 11 ELEMENT:13
+    { 0x000000cd, 0xB25D1000 }, // RAM: 12 ELEMENT:13
+    { 0x000000dd, 0x31B06461 }, // RAM: 13 ELEMENT:13
+    { 0x0000014d, 0x00000001 }, // RAM: 20 ELEMENT:13
+    { 0x0000000e, 0x2AAAAAAA }, // RAM: 0 ELEMENT:14
+    { 0x0000001e, 0x2A9AA6AA }, // RAM: 1 ELEMENT:14
+    { 0x0000002e, 0x04040000 }, // RAM: 2 ELEMENT:14
+    { 0x0000003e, 0x22220000 }, // RAM: 3 ELEMENT:14
+    { 0x0000006e, 0x20300000 }, // RAM: 6 ELEMENT:14
+    { 0x0000007e, 0x1C007061 }, // RAM: 7 ELEMENT:14
+    { 0x0000009e, 0x002AAA80 }, // RAM: 9 ELEMENT:14
+    { 0x000000ae, 0xAAA80000 }, // RAM: 10 ELEMENT:14
+    { 0x000000be, 0x20000002 }, // RAM: 11 ELEMENT:14
+    { 0x000000ce, 0xB37CF000 }, // RAM: 12 ELEMENT:14
+    { 0x000000de, 0x31F1E667 }, // RAM: 13 ELEMENT:14
+    { 0x0000014e, 0x00000001 }, // RAM: 20 ELEMENT:14
+    { 0x0000000f, 0x2AAAAAAA }, // RAM: 0 ELEMENT:15
+    { 0x0000001f, 0x2AAAAAAA }, // RAM: 1 ELEMENT:15
+    { 0x0000008f, 0x02020000 }, // RAM: 8 ELEMENT:15
+    { 0x0000009f, 0x11554400 }, // RAM: 9 ELEMENT:15
+    { 0x000000af, 0x78005800 }, // RAM: 10 ELEMENT:15
+    { 0x000000bf, 0x0601B459 }, // RAM: 11 ELEMENT:15
+    { 0x000000cf, 0x80501000 }, // RAM: 12 ELEMENT:15
+    { 0x000000df, 0x3FF07819 }, // RAM: 13 ELEMENT:15
+    { 0x0000014f, 0x00000001 }, // RAM: 20 ELEMENT:15
+};
+
 void Csi10ToPacked10::enable(Hololink& hololink, uint32_t sif_address)
 {
-    hololink.write_uint32(sif_address + PACKETIZER_MODE, 0x11f1fff7);
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000000); // RAM: 0 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000010); // RAM: 1 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AA6AA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000020); // RAM: 2 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x02020000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000040); // RAM: 4 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000050); // RAM: 5 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00001865); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000060); // RAM: 6 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20300000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000070); // RAM: 7 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x1C007061); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000090); // RAM: 9 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x40044400); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a0); // RAM: 10 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x50000600); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b0); // RAM: 11 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20802080); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c0); // RAM: 12 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x9362E000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d0); // RAM: 13 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01B18626); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000140); // RAM: 20 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000001); // RAM: 0 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAABFE); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000011); // RAM: 1 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000081); // RAM: 8 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00010000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000091); // RAM: 9 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x440CCC81); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a1); // RAM: 10 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01555600); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b1); // RAM: 11 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x18006085); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c1); // RAM: 12 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x9362E000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d1); // RAM: 13 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01B10724); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000f1); // RAM: 15 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000101); // RAM: 16 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA802A800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000111); // RAM: 17 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xE0000002); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000121); // RAM: 18 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x6DB0F000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000131); // RAM: 19 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0000C001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000141); // RAM: 20 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000002); // RAM: 0 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAABFE); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000012); // RAM: 1 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AA6AA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000022); // RAM: 2 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000032); // RAM: 3 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x11110000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000042); // RAM: 4 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000052); // RAM: 5 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00001865); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000062); // RAM: 6 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20300000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000072); // RAM: 7 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x1C007061); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000092); // RAM: 9 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00111100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a2); // RAM: 10 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA9557800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b2); // RAM: 11 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xD80C668D); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c2); // RAM: 12 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xDB63E001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d2); // RAM: 13 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01C18022); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000f2); // RAM: 15 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000102); // RAM: 16 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA802A800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000112); // RAM: 17 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xE0000002); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000122); // RAM: 18 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x6DB0F000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000132); // RAM: 19 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0000C001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000142); // RAM: 20 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000003); // RAM: 0 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155AA6A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000013); // RAM: 1 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x15555555); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000023); // RAM: 2 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00010000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000033); // RAM: 3 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00444401); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000043); // RAM: 4 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x02AAA000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000053); // RAM: 5 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x3C00C108); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000063); // RAM: 6 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x9B7FC05C); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000073); // RAM: 7 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x03624AC0); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a3); // RAM: 10 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05555000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b3); // RAM: 11 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xC0000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c3); // RAM: 12 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x013FE01F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d3); // RAM: 13 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00018206); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000143); // RAM: 20 ELEMENT:3
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000004); // RAM: 0 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155AA6A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000014); // RAM: 1 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x15555555); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000024); // RAM: 2 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00800000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000034); // RAM: 3 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00444480); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000044); // RAM: 4 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xF2A15000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000054); // RAM: 5 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xB006840F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000064); // RAM: 6 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0B7FC07F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000074); // RAM: 7 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x038344CC); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a4); // RAM: 10 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05555000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b4); // RAM: 11 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xC0000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c4); // RAM: 12 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x013FE01F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d4); // RAM: 13 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00018206); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000144); // RAM: 20 ELEMENT:4
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000005); // RAM: 0 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155AAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000015); // RAM: 1 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x15555555); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000035); // RAM: 3 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00444400); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000045); // RAM: 4 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA2A00000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000055); // RAM: 5 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xF000820A); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000065); // RAM: 6 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x64BA1FFF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000075); // RAM: 7 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x6360C8C3); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000085); // RAM: 8 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x40400000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000095); // RAM: 9 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x44226600); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a5); // RAM: 10 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x50501000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b5); // RAM: 11 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xE0C04145); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c5); // RAM: 12 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x06DF807F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d5); // RAM: 13 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00003C78); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000145); // RAM: 20 ELEMENT:5
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000006); // RAM: 0 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AA6A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000016); // RAM: 1 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x15555555); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000026); // RAM: 2 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x40400000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000036); // RAM: 3 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x88191100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000046); // RAM: 4 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000056); // RAM: 5 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x80000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000066); // RAM: 6 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x66F9DFFF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000076); // RAM: 7 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x63E3CCCF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000096); // RAM: 9 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a6); // RAM: 10 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x55500000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b6); // RAM: 11 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xC0000005); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c6); // RAM: 12 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xB7FEE1FF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d6); // RAM: 13 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00318607); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000146); // RAM: 20 ELEMENT:6
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000007); // RAM: 0 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000017); // RAM: 1 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x15555555); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000037); // RAM: 3 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000047); // RAM: 4 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x50005000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000057); // RAM: 5 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xC0180C11); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000067); // RAM: 6 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00A01FFF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000077); // RAM: 7 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x7FE0F033); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000087); // RAM: 8 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20200000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000097); // RAM: 9 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x44440000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a7); // RAM: 10 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x50001000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b7); // RAM: 11 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xE0C020C0); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c7); // RAM: 12 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xB05807FF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d7); // RAM: 13 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x003078F9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000147); // RAM: 20 ELEMENT:7
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000008); // RAM: 0 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AA6A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000018); // RAM: 1 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155556A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000028); // RAM: 2 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20200000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000038); // RAM: 3 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000048); // RAM: 4 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x52054000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000058); // RAM: 5 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2003C31F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000068); // RAM: 6 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xD03FDFE0); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000078); // RAM: 7 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x60E0CC8A); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b8); // RAM: 11 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xC0000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c8); // RAM: 12 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x9362FFFF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d8); // RAM: 13 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01B18626); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000148); // RAM: 20 ELEMENT:8
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000009); // RAM: 0 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000019); // RAM: 1 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155556A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000039); // RAM: 3 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000049); // RAM: 4 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05555000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000059); // RAM: 5 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00180804); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000069); // RAM: 6 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xB66FDFFC); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000079); // RAM: 7 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x7CE0F073); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000089); // RAM: 8 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x10100000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000099); // RAM: 9 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x22113300); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a9); // RAM: 10 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xAD02A800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b9); // RAM: 11 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20006187); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c9); // RAM: 12 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xEB3FE7FE); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d9); // RAM: 13 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01B1F8DB); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000149); // RAM: 20 ELEMENT:9
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000000a); // RAM: 0 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000001a); // RAM: 1 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155556AA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000002a); // RAM: 2 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x10100000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000003a); // RAM: 3 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x44440000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000004a); // RAM: 4 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x07555000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000005a); // RAM: 5 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2000C30A); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000006a); // RAM: 6 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x403FDFC0); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000007a); // RAM: 7 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x6000C082); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000009a); // RAM: 9 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00555500); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000aa); // RAM: 10 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xF802F800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ba); // RAM: 11 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x26003043); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ca); // RAM: 12 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xDB63FFFE); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000da); // RAM: 13 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01C18022); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000014a); // RAM: 20 ELEMENT:10
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000000b); // RAM: 0 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000001b); // RAM: 1 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155AA6A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000003b); // RAM: 3 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00111100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000004b); // RAM: 4 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05555000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000006b); // RAM: 6 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x49BFDF00); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000007b); // RAM: 7 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x7CE0F072); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000008b); // RAM: 8 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x08080000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000009b); // RAM: 9 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x22220000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ab); // RAM: 10 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x07AAA800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000bb); // RAM: 11 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20006185); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000cb); // RAM: 12 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x35FFE600); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000db); // RAM: 13 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01B1DA9F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000014b); // RAM: 20 ELEMENT:11
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000000c); // RAM: 0 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000001c); // RAM: 1 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x155AA6AA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000002c); // RAM: 2 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x08080000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000003c); // RAM: 3 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00111100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000004c); // RAM: 4 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x55500000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000005c); // RAM: 5 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000005); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000006c); // RAM: 6 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x4DBF1F00); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000007c); // RAM: 7 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x7C00F872); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ac); // RAM: 10 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x52ABF800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000bc); // RAM: 11 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x21801005); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000cc); // RAM: 12 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05BFFFC0); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000dc); // RAM: 13 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01C1A266); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000014c); // RAM: 20 ELEMENT:12
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000000d); // RAM: 0 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000001d); // RAM: 1 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AA6A9); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000003d); // RAM: 3 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00111100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000004d); // RAM: 4 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x55500000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000005d); // RAM: 5 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00200045); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000006d); // RAM: 6 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x24300000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000007d); // RAM: 7 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x1CC07061); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000008d); // RAM: 8 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x04040000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000009d); // RAM: 9 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x11089980); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ad); // RAM: 10 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA8280800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000bd); // RAM: 11 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0001882A); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000cd); // RAM: 12 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xB25D1000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000dd); // RAM: 13 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x31B06461); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000014d); // RAM: 20 ELEMENT:13
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000000e); // RAM: 0 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000001e); // RAM: 1 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2A9AA6AA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000002e); // RAM: 2 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x04040000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000003e); // RAM: 3 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x22220000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000006e); // RAM: 6 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20300000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000007e); // RAM: 7 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x1C007061); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000009e); // RAM: 9 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x002AAA80); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ae); // RAM: 10 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xAAA80000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000be); // RAM: 11 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20000002); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000ce); // RAM: 12 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xB37CF000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000de); // RAM: 13 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x31F1E667); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000014e); // RAM: 20 ELEMENT:14
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000000f); // RAM: 0 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000001f); // RAM: 1 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x2AAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000008f); // RAM: 8 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x02020000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000009f); // RAM: 9 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x11554400); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000af); // RAM: 10 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x78005800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000bf); // RAM: 11 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0601B459); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000cf); // RAM: 12 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x80501000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000df); // RAM: 13 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x3FF07819); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x0000014f); // RAM: 20 ELEMENT:15
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
+    load(hololink, sif_address, 0x11f1fff7, CSI10_TO_PACKED10_MICROCODE);
 }
 
 /*******************************************************************************
  Csi12ToPacked12
 *******************************************************************************/
 
+// Csi12ToPacked12 microcode: (PACKETIZER_RAM, PACKETIZER_DATA) values, in load order.
+static const PacketizerProgram::Microcode CSI12_TO_PACKED12_MICROCODE = {
+    { 0x00000000, 0xAAAAAAAA }, // RAM: 0 ELEMENT:0
+    { 0x00000010, 0x5AA5AAAA }, // RAM: 1 ELEMENT:0
+    { 0x00000030, 0x00111100 }, // RAM: 3 ELEMENT:0
+    { 0x00000040, 0x55500000 }, // RAM: 4 ELEMENT:0
+    { 0x00000050, 0x00000005 }, // RAM: 5 ELEMENT:0
+    { 0x00000060, 0x6DBC3000 }, // RAM: 6 ELEMENT:0
+    { 0x00000070, 0x00008103 }, // RAM: 7 ELEMENT:0
+    { 0x00000090, 0x44226600 }, // RAM: 9 ELEMENT:0
+    { 0x000000a0, 0xA8002800 }, // RAM: 10 ELEMENT:0
+    { 0x000000b0, 0x0000020A }, // RAM: 11 ELEMENT:0
+    { 0x000000c0, 0x02400000 }, // RAM: 12 ELEMENT:0
+    { 0x000000d0, 0x00000810 }, // RAM: 13 ELEMENT:0
+    { 0x00000140, 0x00000001 }, // RAM: 20 ELEMENT:0
+    { 0x00000001, 0xAAAAAAFF }, // RAM: 0 ELEMENT:1
+    { 0x00000011, 0xA5AAAAAA }, // RAM: 1 ELEMENT:1
+    { 0x00000021, 0x02020000 }, // RAM: 2 ELEMENT:1
+    { 0x00000041, 0x05000000 }, // RAM: 4 ELEMENT:1
+    { 0x00000051, 0x00001865 }, // RAM: 5 ELEMENT:1
+    { 0x00000061, 0x60300000 }, // RAM: 6 ELEMENT:1
+    { 0x00000071, 0x0000F1E3 }, // RAM: 7 ELEMENT:1
+    { 0x00000081, 0x40400000 }, // RAM: 8 ELEMENT:1
+    { 0x00000091, 0x00111100 }, // RAM: 9 ELEMENT:1
+    { 0x000000a1, 0x78005000 }, // RAM: 10 ELEMENT:1
+    { 0x000000b1, 0x00001455 }, // RAM: 11 ELEMENT:1
+    { 0x000000f1, 0x00222200 }, // RAM: 15 ELEMENT:1
+    { 0x00000101, 0xA802A800 }, // RAM: 16 ELEMENT:1
+    { 0x00000111, 0xF0000002 }, // RAM: 17 ELEMENT:1
+    { 0x00000121, 0x6DB0F000 }, // RAM: 18 ELEMENT:1
+    { 0x00000141, 0x00000001 }, // RAM: 20 ELEMENT:1
+    { 0x00000002, 0xAAAAAAAF }, // RAM: 0 ELEMENT:2
+    { 0x00000012, 0xAAAAAAAA }, // RAM: 1 ELEMENT:2
+    { 0x00000092, 0x004CCC80 }, // RAM: 9 ELEMENT:2
+    { 0x000000a2, 0x50000000 }, // RAM: 10 ELEMENT:2
+    { 0x000000b2, 0x00002080 }, // RAM: 11 ELEMENT:2
+    { 0x000000c2, 0x92406000 }, // RAM: 12 ELEMENT:2
+    { 0x000000d2, 0x00000408 }, // RAM: 13 ELEMENT:2
+    { 0x000000e2, 0x20200000 }, // RAM: 14 ELEMENT:2
+    { 0x000000f2, 0x22002200 }, // RAM: 15 ELEMENT:2
+    { 0x00000102, 0x28002800 }, // RAM: 16 ELEMENT:2
+    { 0x00000112, 0x30001860 }, // RAM: 17 ELEMENT:2
+    { 0x00000122, 0x01B03000 }, // RAM: 18 ELEMENT:2
+    { 0x00000132, 0x0000078F }, // RAM: 19 ELEMENT:2
+    { 0x00000142, 0x00000001 }, // RAM: 20 ELEMENT:2
+};
+
 void Csi12ToPacked12::enable(Hololink& hololink, uint32_t sif_address)
 {
-    hololink.write_uint32(sif_address + PACKETIZER_MODE, 0x11210007);
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000000); // RAM: 0 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xAAAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000010); // RAM: 1 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x5AA5AAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000030); // RAM: 3 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00111100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000040); // RAM: 4 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x55500000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000050); // RAM: 5 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000005); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000060); // RAM: 6 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x6DBC3000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000070); // RAM: 7 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00008103); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000090); // RAM: 9 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x44226600); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a0); // RAM: 10 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA8002800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b0); // RAM: 11 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0000020A); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c0); // RAM: 12 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x02400000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d0); // RAM: 13 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000810); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000140); // RAM: 20 ELEMENT:0
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000001); // RAM: 0 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xAAAAAAFF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000011); // RAM: 1 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA5AAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000021); // RAM: 2 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x02020000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000041); // RAM: 4 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x05000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000051); // RAM: 5 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00001865); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000061); // RAM: 6 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x60300000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000071); // RAM: 7 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0000F1E3); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000081); // RAM: 8 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x40400000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000091); // RAM: 9 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00111100); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a1); // RAM: 10 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x78005000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b1); // RAM: 11 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00001455); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000f1); // RAM: 15 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00222200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000101); // RAM: 16 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xA802A800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000111); // RAM: 17 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xF0000002); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000121); // RAM: 18 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x6DB0F000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000141); // RAM: 20 ELEMENT:1
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000002); // RAM: 0 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xAAAAAAAF); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000012); // RAM: 1 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0xAAAAAAAA); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000092); // RAM: 9 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x004CCC80); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000a2); // RAM: 10 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x50000000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000b2); // RAM: 11 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00002080); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000c2); // RAM: 12 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x92406000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000d2); // RAM: 13 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000408); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000e2); // RAM: 14 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x20200000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x000000f2); // RAM: 15 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x22002200); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000102); // RAM: 16 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x28002800); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000112); // RAM: 17 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x30001860); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000122); // RAM: 18 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x01B03000); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000132); // RAM: 19 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x0000078F); // DATA
-    hololink.write_uint32(sif_address + PACKETIZER_RAM, 0x00000142); // RAM: 20 ELEMENT:2
-    hololink.write_uint32(sif_address + PACKETIZER_DATA, 0x00000001); // DATA
+    load(hololink, sif_address, 0x11210007, CSI12_TO_PACKED12_MICROCODE);
 }
 
 } // namespace hololink
@@ -19,6 +19,11 @@
 
 #pragma once
 
+#include <stdint.h>
+
+#include <utility>
+#include <vector>
+
 #include "csi_formats.hpp"
 #include "hololink.hpp"
 
@@ -29,6 +34,12 @@ namespace hololink {
  */
 class PacketizerProgram {
 public:
+    /**
+     * Packetizer microcode: (PACKETIZER_RAM, PACKETIZER_DATA) values,
+     * which are written in this order.
+     */
+    using Microcode = std::vector<std::pair<uint32_t, uint32_t>>;
+
     virtual ~PacketizerProgram();
 
     /**
@@ -50,6 +61,18 @@ public:
 
 protected:
     PacketizerProgram();
+
+    /**
+     * Writes mode and microcode to the packetizer at sif_address, in as
+     * few WR_BLOCK requests as fit the control packet size.  Because the
+     * writes are applied in order, the RAM and DATA registers show the
+     * last entry of the last program that was completely loaded; if that
+     * is the last entry of microcode (and the packetizer is running with
+     * mode or is disabled), loading is skipped and only the mode is
+     * written if necessary.  Programs must therefore end with distinct
+     * entries.
+     */
+    void load(Hololink& hololink, uint32_t sif_address, uint32_t mode, const Microcode& microcode);
 };
 
 /**
@@ -25,6 +25,7 @@
 #include <poll.h>
 #include <sstream>
 #include <stdexcept>
+#include <sys/epoll.h>
 #include <unistd.h>
 
 // Utility functions for timespec operations
@@ -43,14 +44,18 @@ int timespec_compare(const struct timespec& a, const struct timespec& b)
     return 0;
 }
 
-// Subtract two timespec values and return difference in milliseconds
+// Subtract two timespec values and return difference in milliseconds,
+// rounded up so that we don't wake up just before an alarm is due
 int timespec_diff_ms(const struct timespec& a, const struct timespec& b)
 {
     long long diff_sec = a.tv_sec - b.tv_sec;
     long long diff_nsec = a.tv_nsec - b.tv_nsec;
-    return static_cast<int>((diff_sec * 1000) + (diff_nsec / 1000000));
+    return static_cast<int>((diff_sec * 1000) + ((diff_nsec + 999999) / 1000000));
 }
 
+// How many epoll events we handle per wakeup
+constexpr int MAX_EPOLL_EVENTS = 64;
+
 // Add seconds to timespec
 struct timespec timespec_add_seconds(const struct timespec& ts, float seconds)
 {
@@ -98,6 +103,17 @@ namespace core {
         wakeup_read_fd_ = pipe_fds[0];
         wakeup_write_fd_ = pipe_fds[1];
 
+        epoll_fd_ = epoll_create1(EPOLL_CLOEXEC);
+        if (epoll_fd_ == -1) {
+            throw std::runtime_error("Failed to create epoll instance: " + std::string(strerror(errno)));
+        }
+        struct epoll_event event { };
+        event.events = EPOLLIN;
+        event.data.fd = wakeup_read_fd_;
+        if (epoll_ctl(epoll_fd_, EPOLL_CTL_ADD, wakeup_read_fd_, &event) == -1) {
+            throw std::runtime_error("Failed to add wakeup pipe to epoll: " + std::string(strerror(errno)));
+        }
+
         // Generate a unique name for this reactor instance
         std::stringstream ss;
         ss << "reactor@" << std::hex << reinterpret_cast<uintptr_t>(this);
@@ -123,6 +139,9 @@ namespace core {
         if (wakeup_write_fd_ >= 0) {
             close(wakeup_write_fd_);
         }
+        if (epoll_fd_ >= 0) {
+            close(epoll_fd_);
+        }
     }
 
     struct timespec Reactor::now() const
@@ -142,16 +161,35 @@ namespace core {
     void Reactor::add_fd_callback(int fd, FdCallback callback, short events)
     {
         std::lock_guard<std::mutex> lock(lock_);
+        // Poll event flags have the same values as their epoll counterparts.
+        struct epoll_event event { };
+        event.events = static_cast<uint16_t>(events);
+        event.data.fd = fd;
+        // Always tell epoll, even if the events haven't changed: the fd
+        // may have been closed (which drops it from the epoll set) and
+        // the number reused without a call to remove_fd_callback.
+        int op = fd_callbacks_.count(fd) ? EPOLL_CTL_MOD : EPOLL_CTL_ADD;
+        int r = epoll_ctl(epoll_fd_, op, fd, &event);
+        if ((r == -1) && (op == EPOLL_CTL_ADD) && (errno == EEXIST)) {
+            r = epoll_ctl(epoll_fd_, EPOLL_CTL_MOD, fd, &event);
+        } else if ((r == -1) && (op == EPOLL_CTL_MOD) && (errno == ENOENT)) {
+            r = epoll_ctl(epoll_fd_, EPOLL_CTL_ADD, fd, &event);
+        }
+        if (r == -1) {
+            throw std::runtime_error("Failed to add fd to epoll: " + std::string(strerror(errno)));
+        }
         fd_callbacks_[fd] = std::make_pair(callback, events);
-        wakeup();
     }
 
     void Reactor::remove_fd_callback(int fd)
     {
         HSB_LOG_TRACE("remove_fd_callback(fd={})", fd);
         std::lock_guard<std::mutex> lock(lock_);
-        fd_callbacks_.erase(fd);
-        wakeup();
+        if (fd_callbacks_.erase(fd)) {
+            // Closing fd already removes it from the epoll set, so
+            // failure here is fine.
+            epoll_ctl(epoll_fd_, EPOLL_CTL_DEL, fd, nullptr);
+        }
     }
 
     Reactor::AlarmHandle Reactor::add_alarm_s(float seconds, Callback callback)
@@ -170,19 +208,15 @@ namespace core {
 
         {
             std::lock_guard<std::mutex> lock(lock_);
+            entry->index = alarms_.size();
             alarms_.push_back(entry);
+            alarm_sift_up(entry->index);
 
-            // Keep alarms sorted by time, then by sequence number
-            std::sort(alarms_.begin(), alarms_.end(),
-                [](const std::shared_ptr<AlarmEntry>& a, const std::shared_ptr<AlarmEntry>& b) {
-                    int time_cmp = timespec_compare(a->when, b->when);
-                    if (time_cmp != 0) {
-                        return time_cmp < 0;
-                    }
-                    return a->sequence < b->sequence;
-                });
-
-            wakeup();
+            // run() only needs to recompute its timeout if this is
+            // now the next alarm due.
+            if (entry->index == 0) {
+                wakeup();
+            }
         }
 
         HSB_LOG_TRACE("add_alarm() -> handle={}, sequence={}", static_cast<const void*>(entry.get()), entry->sequence);
@@ -197,11 +231,11 @@ namespace core {
         }
 
         {
+            // If this was the next alarm due, run() just wakes up early
+            // and finds nothing to do.
             std::lock_guard<std::mutex> lock(lock_);
-            auto it = std::find(alarms_.begin(), alarms_.end(), handle);
-            if (it != alarms_.end()) {
-                alarms_.erase(it);
-                wakeup();
+            if (handle->index != NOT_QUEUED) {
+                alarm_remove(handle->index);
             }
         }
     }
@@ -242,63 +276,46 @@ namespace core {
                 }
             }
 
-            // Build poll structures
-            std::vector<struct pollfd> poll_fds;
-            std::vector<int> fd_list;
-
-            // Add wakeup pipe
-            poll_fds.push_back({ wakeup_read_fd_, POLLIN, 0 });
-            fd_list.push_back(wakeup_read_fd_);
-
-            // Add registered file descriptors
-            {
-                std::lock_guard<std::mutex> lock(lock_);
-                for (const auto& [fd, callback_data] : fd_callbacks_) {
-                    poll_fds.push_back({ fd, callback_data.second, 0 }); // Use stored events
-                    fd_list.push_back(fd);
-                }
-            }
-
-            // Poll for ready file descriptors
-            HSB_LOG_TRACE("poll(..., timeout_ms={})", timeout_ms);
-            int ready_count = poll(poll_fds.data(), poll_fds.size(), timeout_ms);
-            HSB_LOG_TRACE("poll(...) ready_count={}", ready_count);
+            // Wait for ready file descriptors
+            struct epoll_event events[MAX_EPOLL_EVENTS];
+            HSB_LOG_TRACE("epoll_wait(..., timeout_ms={})", timeout_ms);
+            int ready_count = epoll_wait(epoll_fd_, events, MAX_EPOLL_EVENTS, timeout_ms);
+            HSB_LOG_TRACE("epoll_wait(...) ready_count={}", ready_count);
 
             if (ready_count == -1) {
                 if (errno == EINTR) {
                     continue; // Interrupted by signal, continue
                 }
-                throw std::runtime_error("Poll failed: " + std::string(strerror(errno)));
+                throw std::runtime_error("epoll_wait failed: " + std::string(strerror(errno)));
             }
 
             // Handle ready file descriptors
-            for (size_t i = 0; i < poll_fds.size() && ready_count > 0; ++i) {
-                if (poll_fds[i].revents != 0) {
-                    ready_count--;
-                    int fd = fd_list[i];
-
-                    if (fd == wakeup_read_fd_) {
-                        HSB_LOG_TRACE("poll(...) fd={} is wakeup_read_fd_", fd);
-                        // Clear the wakeup pipe
-                        char buffer[1024];
-                        ssize_t bytes_read = read(wakeup_read_fd_, buffer, sizeof(buffer));
-                        (void)bytes_read; // Suppress unused variable warning
-                    } else {
-                        // Call the callback for this file descriptor
-                        FdCallback callback;
-                        {
-                            std::lock_guard<std::mutex> lock(lock_);
-                            auto it = fd_callbacks_.find(fd);
-                            if (it != fd_callbacks_.end()) {
-                                callback = it->second.first; // Get callback from pair
-                            }
-                        }
-
-                        if (callback) {
-                            callback(fd, poll_fds[i].revents);
-                        }
+            for (int i = 0; i < ready_count; ++i) {
+                int fd = events[i].data.fd;
+                if (fd == wakeup_read_fd_) {
+                    HSB_LOG_TRACE("epoll_wait(...) fd={} is wakeup_read_fd_", fd);
+                    // Clear the wakeup pipe, then the flag; anything that
+                    // wanted a wakeup in between is seen below, as we
+                    // look at alarms_ after this.
+                    char buffer[1024];
+                    ssize_t bytes_read = read(wakeup_read_fd_, buffer, sizeof(buffer));
+                    (void)bytes_read; // Suppress unused variable warning
+                    wakeup_pending_.store(false);
+                    continue;
+                }
+                // Call the callback for this file descriptor
+                FdCallback callback;
+                {
+                    std::lock_guard<std::mutex> lock(lock_);
+                    auto it = fd_callbacks_.find(fd);
+                    if (it != fd_callbacks_.end()) {
+                        callback = it->second.first; // Get callback from pair
                     }
                 }
+
+                if (callback) {
+                    callback(fd, static_cast<short>(events[i].events));
+                }
             }
 
             // Process expired alarms
@@ -309,7 +326,7 @@ namespace core {
 
                 while (!alarms_.empty() && timespec_compare(alarms_[0]->when, current_time) <= 0) {
                     expired.push_back(alarms_[0]);
-                    alarms_.erase(alarms_.begin());
+                    alarm_remove(0);
                 }
             }
 
@@ -329,10 +346,82 @@ namespace core {
 
     void Reactor::wakeup()
     {
+        // One pending wakeup is enough.
+        if (wakeup_pending_.exchange(true)) {
+            return;
+        }
         const char wake_msg[] = "wake-up\n";
         ssize_t bytes_written = write(wakeup_write_fd_, wake_msg, sizeof(wake_msg) - 1);
         (void)bytes_written; // Suppress unused variable warning
     }
 
+    bool Reactor::alarm_before(size_t a, size_t b) const
+    {
+        int time_cmp = timespec_compare(alarms_[a]->when, alarms_[b]->when);
+        if (time_cmp != 0) {
+            return time_cmp < 0;
+        }
+        return alarms_[a]->sequence < alarms_[b]->sequence;
+    }
+
+    void Reactor::alarm_swap(size_t a, size_t b)
+    {
+        std::swap(alarms_[a], alarms_[b]);
+        alarms_[a]->index = a;
+        alarms_[b]->index = b;
+    }
+
+    void Reactor::alarm_sift_up(size_t index)
+    {
+        while (index > 0) {
+            size_t parent = (index - 1) / 2;
+            if (!alarm_before(index, parent)) {
+                break;
+            }
+            alarm_swap(index, parent);
+            index = parent;
+        }
+    }
+
+    void Reactor::alarm_sift_down(size_t index)
+    {
+        size_t size = alarms_.size();
+        while (true) {
+            size_t first = index;
+            size_t left = index * 2 + 1;
+            size_t right = left + 1;
+            if ((left < size) && alarm_before(left, first)) {
+                first = left;
+            }
+            if ((right < size) && alarm_before(right, first)) {
+                first = right;
+            }
+            if (first == index) {
+                break;
+            }
+            alarm_swap(index, first);
+            index = first;
+        }
+    }
+
+    void Reactor::alarm_remove(size_t index)
+    {
+        size_t last = alarms_.size() - 1;
+        alarms_[index]->index = NOT_QUEUED;
+        if (index != last) {
+            auto moved = std::move(alarms_[last]);
+            alarms_.pop_back();
+            moved->index = index;
+            alarms_[index] = moved;
+            // The entry moved here may belong above or below.
+            alarm_sift_up(index);
+            if (moved->index == index) {
+                alarm_sift_down(index);
+            }
+        } else {
+            alarms_.pop_back();
+        }
+    }
+
 } // namespace core
 } // namespace hololink
@@ -19,13 +19,14 @@
 
 #include <atomic>
 #include <chrono>
+#include <cstddef>
 #include <ctime>
 #include <functional>
-#include <map>
 #include <memory>
 #include <mutex>
 #include <string>
 #include <thread>
+#include <unordered_map>
 #include <vector>
 
 namespace hololink {
@@ -40,7 +41,9 @@ namespace core {
      * - Arbitrary callbacks
      *
      * It runs in a dedicated background thread and provides thread-safe methods
-     * for registering callbacks and alarms.
+     * for registering callbacks and alarms.  Alarms are kept in a binary
+     * heap, so adding or cancelling one is O(log n); file descriptors are
+     * registered with epoll, which is only updated when callbacks change.
      */
     class Reactor {
     public:
@@ -51,8 +54,12 @@ namespace core {
             struct timespec when;
             uint64_t sequence;
             std::function<void()> callback;
+            // Position in alarms_, or NOT_QUEUED; protected by lock_.
+            size_t index;
         };
 
+        static constexpr size_t NOT_QUEUED = static_cast<size_t>(-1);
+
         using Callback = std::function<void()>;
         using FdCallback = std::function<void(int fd, short events)>;
         using AlarmHandle = std::shared_ptr<AlarmEntry>;
@@ -150,13 +157,24 @@ namespace core {
          */
         void wakeup();
 
+        // Binary heap operations on alarms_; the caller holds lock_.
+        bool alarm_before(size_t a, size_t b) const;
+        void alarm_swap(size_t a, size_t b);
+        void alarm_sift_up(size_t index);
+        void alarm_sift_down(size_t index);
+        void alarm_remove(size_t index);
+
         mutable std::mutex lock_;
+        // A binary heap ordered by time, then by sequence number.
         std::vector<std::shared_ptr<AlarmEntry>> alarms_;
         std::atomic<uint64_t> alarms_added_ { 0 };
-        std::map<int, std::pair<FdCallback, short>> fd_callbacks_;
+        std::unordered_map<int, std::pair<FdCallback, short>> fd_callbacks_;
 
+        int epoll_fd_;
         int wakeup_read_fd_;
         int wakeup_write_fd_;
+        // Set while there's a wakeup in the pipe that run() hasn't read yet.
+        std::atomic<bool> wakeup_pending_ { false };
 
         std::thread thread_;
         std::atomic<bool> running_ { true };
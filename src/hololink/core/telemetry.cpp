@@ -0,0 +1,475 @@
+/**
+ * SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * See README.md for detailed information.
+ */
+
+#include "telemetry.hpp"
+
+#include <arpa/inet.h>
+#include <dirent.h>
+#include <fcntl.h>
+#include <netinet/in.h>
+#include <poll.h>
+#include <signal.h>
+#include <sys/mman.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cerrno>
+#include <cmath>
+#include <cstdlib>
+#include <cstring>
+#include <map>
+#include <mutex>
+#include <stdexcept>
+
+#include <fmt/format.h>
+
+#include "logging_internal.hpp"
+#include "reactor.hpp"
+
+namespace hololink::core {
+
+namespace {
+
+    static_assert(std::atomic<uint64_t>::is_always_lock_free,
+        "ReceiverTelemetry needs lock-free 64-bit atomics in shared memory.");
+    static_assert(sizeof(std::atomic<uint64_t>) == sizeof(uint64_t));
+    static_assert(sizeof(ReceiverTelemetry::Segment)
+        == 48 + 8 * (ReceiverTelemetry::COUNTER_COUNT + ReceiverTelemetry::TIMER_COUNT * (2 + ReceiverTelemetry::HISTOGRAM_BUCKETS)));
+
+    constexpr const char* SHM_PREFIX = "hololink-telemetry.";
+
+    // Name and HELP text for each value, indexed by Counter or Timer.
+    constexpr const char* COUNTER_NAMES[][2] = {
+        { "packets_received", "Packets received." },
+        { "bytes_received", "Bytes received, including protocol headers." },
+        { "packets_dropped", "Packets missing from the PSN sequence." },
+        { "frames_received", "Frames completed by the receiver." },
+        { "frames_dropped", "Completed frames discarded before the application fetched them." },
+        { "frames_delivered", "Frames returned by get_next_frame." },
+        { "timeouts", "Calls to get_next_frame that returned without a frame." },
+    };
+    static_assert(std::size(COUNTER_NAMES) == ReceiverTelemetry::COUNTER_COUNT);
+
+    constexpr const char* TIMER_NAMES[][2] = {
+        { "frame_assembly", "Time from the first to the last packet of a frame." },
+        { "frame_latency", "Time from the first packet of a frame to the frame being ready for get_next_frame." },
+        { "frame_wait", "Time spent blocked in get_next_frame." },
+    };
+    static_assert(std::size(TIMER_NAMES) == ReceiverTelemetry::TIMER_COUNT);
+
+    // All live ReceiverTelemetry instances, for prometheus_text; leaked
+    // so that they're usable from static destructors.
+    std::mutex& registry_lock()
+    {
+        static auto* lock = new std::mutex();
+        return *lock;
+    }
+
+    std::vector<ReceiverTelemetry*>& registry()
+    {
+        static auto* registry = new std::vector<ReceiverTelemetry*>();
+        return *registry;
+    }
+
+    // Remove segments left behind by processes that didn't exit cleanly.
+    void remove_stale_segments()
+    {
+        DIR* dir = opendir("/dev/shm");
+        if (!dir) {
+            return;
+        }
+        size_t prefix_length = strlen(SHM_PREFIX);
+        while (struct dirent* entry = readdir(dir)) {
+            if (strncmp(entry->d_name, SHM_PREFIX, prefix_length) != 0) {
+                continue;
+            }
+            pid_t pid = static_cast<pid_t>(strtol(&entry->d_name[prefix_length], nullptr, 10));
+            if ((pid > 0) && (kill(pid, 0) != 0) && (errno == ESRCH)) {
+                HSB_LOG_DEBUG("Removing stale telemetry segment \"{}\".", entry->d_name);
+                shm_unlink(fmt::format("/{}", entry->d_name).c_str());
+            }
+        }
+        closedir(dir);
+    }
+
+} // anonymous namespace
+
+ReceiverTelemetry::ReceiverTelemetry(const std::string& receiver, bool shared)
+    : receiver_(receiver)
+    , instance_([]() {
+        static std::atomic<unsigned> instances { 0 };
+        return instances++;
+    }())
+    , shm_name_()
+    , segment_(nullptr)
+{
+    void* segment = MAP_FAILED;
+    if (shared) {
+        static std::once_flag cleanup;
+        std::call_once(cleanup, remove_stale_segments);
+        std::string shm_name = fmt::format("/{}{}.{}", SHM_PREFIX, getpid(), instance_);
+        int fd = shm_open(shm_name.c_str(), O_CREAT | O_EXCL | O_RDWR | O_CLOEXEC, 0644);
+        if (fd < 0) {
+            HSB_LOG_WARN("shm_open \"{}\" failed, errno={}; telemetry won't be shared.", shm_name, errno);
+        } else {
+            if (ftruncate(fd, sizeof(Segment)) == 0) {
+                segment = mmap(NULL, sizeof(Segment), PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+            }
+            if (segment == MAP_FAILED) {
+                HSB_LOG_WARN("Unable to map \"{}\", errno={}; telemetry won't be shared.", shm_name, errno);
+                shm_unlink(shm_name.c_str());
+            } else {
+                shm_name_ = shm_name;
+            }
+            ::close(fd);
+        }
+    }
+    if (segment == MAP_FAILED) {
+        segment = mmap(NULL, sizeof(Segment), PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+        if (segment == MAP_FAILED) {
+            throw std::runtime_error(fmt::format("mmap failed for telemetry, errno={}.", errno));
+        }
+    }
+    // New mappings are zero filled, so all the values start at 0.
+    segment_ = static_cast<Segment*>(segment);
+    segment_->size = sizeof(Segment);
+    segment_->pid = static_cast<uint32_t>(getpid());
+    strncpy(segment_->receiver, receiver_.c_str(), sizeof(segment_->receiver) - 1);
+    // Readers check this last.
+    std::atomic_thread_fence(std::memory_order_release);
+    memcpy(segment_->magic, MAGIC, sizeof(MAGIC));
+
+    std::lock_guard lock(registry_lock());
+    registry().push_back(this);
+}
+
+ReceiverTelemetry::~ReceiverTelemetry()
+{
+    {
+        std::lock_guard lock(registry_lock());
+        auto& r = registry();
+        r.erase(std::remove(r.begin(), r.end(), this), r.end());
+    }
+    if (!shm_name_.empty()) {
+        shm_unlink(shm_name_.c_str());
+    }
+    munmap(segment_, sizeof(Segment));
+}
+
+std::shared_ptr<ReceiverTelemetry> ReceiverTelemetry::create(const std::string& receiver)
+{
+    static std::once_flag server_started;
+    std::call_once(server_started, []() {
+        const char* port = std::getenv("HOLOLINK_TELEMETRY_PORT");
+        if (!(port && port[0])) {
+            return;
+        }
+        const char* address = std::getenv("HOLOLINK_TELEMETRY_ADDRESS");
+        try {
+            // This serves for the life of the process.
+            static auto* server = new TelemetryServer(static_cast<uint16_t>(strtoul(port, nullptr, 10)),
+                (address && address[0]) ? address : "127.0.0.1");
+            (void)server;
+        } catch (const std::exception& e) {
+            HSB_LOG_ERROR("Unable to start the telemetry server: {}", e.what());
+        }
+    });
+    const char* shm = std::getenv("HOLOLINK_TELEMETRY_SHM");
+    bool shared = !(shm && (strcmp(shm, "0") == 0));
+    return std::make_shared<ReceiverTelemetry>(receiver, shared);
+}
+
+void ReceiverTelemetry::record_ns(Timer timer, int64_t ns)
+{
+    if (ns < 0) {
+        ns = 0;
+    }
+    // Find the smallest bucket whose limit, 2**i us, is at least ns.
+    uint64_t us = (static_cast<uint64_t>(ns) + 999) / 1000;
+    unsigned bucket = (us <= 1) ? 0 : (64 - __builtin_clzll(us - 1));
+    bucket = std::min(bucket, HISTOGRAM_BUCKETS - 1);
+    Histogram& histogram = segment_->histograms[timer];
+    auto increment = [](std::atomic<uint64_t>& value, uint64_t n) {
+        value.store(value.load(std::memory_order_relaxed) + n, std::memory_order_relaxed);
+    };
+    increment(histogram.buckets[bucket], 1);
+    increment(histogram.sum_ns, ns);
+    increment(histogram.count, 1);
+}
+
+ReceiverTelemetry::Snapshot ReceiverTelemetry::snapshot() const
+{
+    Snapshot r;
+    r.receiver = receiver_;
+    r.instance = instance_;
+    for (unsigned i = 0; i < COUNTER_COUNT; i++) {
+        r.counters.push_back(segment_->counters[i].load(std::memory_order_relaxed));
+    }
+    for (unsigned i = 0; i < TIMER_COUNT; i++) {
+        const Histogram& histogram = segment_->histograms[i];
+        r.counts.push_back(histogram.count.load(std::memory_order_relaxed));
+        r.sums_ns.push_back(histogram.sum_ns.load(std::memory_order_relaxed));
+        std::vector<uint64_t> buckets;
+        for (auto& bucket : histogram.buckets) {
+            buckets.push_back(bucket.load(std::memory_order_relaxed));
+        }
+        r.buckets.push_back(std::move(buckets));
+    }
+    return r;
+}
+
+const char* ReceiverTelemetry::counter_name(Counter counter)
+{
+    return COUNTER_NAMES[counter][0];
+}
+
+const char* ReceiverTelemetry::timer_name(Timer timer)
+{
+    return TIMER_NAMES[timer][0];
+}
+
+double ReceiverTelemetry::bucket_limit_s(unsigned bucket)
+{
+    if (bucket >= HISTOGRAM_BUCKETS - 1) {
+        return INFINITY;
+    }
+    return std::ldexp(1e-6, bucket);
+}
+
+std::string ReceiverTelemetry::prometheus_text()
+{
+    std::vector<Snapshot> snapshots;
+    {
+        std::lock_guard lock(registry_lock());
+        for (auto telemetry : registry()) {
+            snapshots.push_back(telemetry->snapshot());
+        }
+    }
+    fmt::memory_buffer r;
+    auto out = std::back_inserter(r);
+    auto labels = [](const Snapshot& snapshot) {
+        return fmt::format("receiver=\"{}\",instance=\"{}\"", snapshot.receiver, snapshot.instance);
+    };
+    for (unsigned i = 0; i < COUNTER_COUNT; i++) {
+        std::string name = fmt::format("hololink_receiver_{}_total", COUNTER_NAMES[i][0]);
+        fmt::format_to(out, "# HELP {} {}\n# TYPE {} counter\n", name, COUNTER_NAMES[i][1], name);
+        for (auto& snapshot : snapshots) {
+            fmt::format_to(out, "{}{{{}}} {}\n", name, labels(snapshot), snapshot.counters[i]);
+        }
+    }
+    for (unsigned i = 0; i < TIMER_COUNT; i++) {
+        std::string name = fmt::format("hololink_receiver_{}_seconds", TIMER_NAMES[i][0]);
+        fmt::format_to(out, "# HELP {} {}\n# TYPE {} histogram\n", name, TIMER_NAMES[i][1], name);
+        for (auto& snapshot : snapshots) {
+            // Prometheus buckets are cumulative.
+            uint64_t cumulative = 0;
+            for (unsigned bucket = 0; bucket < HISTOGRAM_BUCKETS; bucket++) {
+                cumulative += snapshot.buckets[i][bucket];
+                std::string le = (bucket == HISTOGRAM_BUCKETS - 1) ? "+Inf" : fmt::format("{:g}", bucket_limit_s(bucket));
+                fmt::format_to(out, "{}_bucket{{{},le=\"{}\"}} {}\n", name, labels(snapshot), le, cumulative);
+            }
+            fmt::format_to(out, "{}_sum{{{}}} {:.9f}\n", name, labels(snapshot), snapshot.sums_ns[i] / 1e9);
+            fmt::format_to(out, "{}_count{{{}}} {}\n", name, labels(snapshot), snapshot.counts[i]);
+        }
+    }
+    return fmt::to_string(r);
+}
+
+struct TelemetryServer::State : std::enable_shared_from_this<TelemetryServer::State> {
+    // Don't let a stuck client hold a connection open for longer than this.
+    static constexpr float CLIENT_TIMEOUT_S = 1.0f;
+
+    struct Client {
+        // Empty until we've seen the request.
+        std::string response;
+        size_t sent = 0;
+        Reactor::AlarmHandle timeout;
+    };
+
+    int socket = -1;
+    // Open connections; only used on the reactor thread.
+    std::map<int, Client> clients;
+
+    void accept_connections()
+    {
+        while (true) {
+            int fd = accept4(socket, nullptr, nullptr, SOCK_NONBLOCK | SOCK_CLOEXEC);
+            if (fd < 0) {
+                if ((errno != EAGAIN) && (errno != EWOULDBLOCK) && (errno != EINTR)) {
+                    HSB_LOG_ERROR("accept failed, errno={}.", errno);
+                }
+                return;
+            }
+            clients[fd];
+            auto self = shared_from_this();
+            Reactor::get_reactor()->add_fd_callback(fd, [self](int fd, short) { self->handle_request(fd); });
+        }
+    }
+
+    void handle_request(int fd)
+    {
+        char request[4096];
+        ssize_t n = recv(fd, request, sizeof(request), 0);
+        if ((n < 0) && ((errno == EAGAIN) || (errno == EWOULDBLOCK) || (errno == EINTR))) {
+            return;
+        }
+        if (n <= 0) {
+            close_client(fd);
+            return;
+        }
+        // We answer as soon as we see the request line; the scraper
+        // doesn't need anything else from us.
+        std::string status = "200 OK";
+        std::string body;
+        if ((n >= 4) && (memcmp(request, "GET ", 4) == 0)) {
+            body = ReceiverTelemetry::prometheus_text();
+        } else {
+            status = "405 Method Not Allowed";
+        }
+        auto& client = clients[fd];
+        client.response = fmt::format("HTTP/1.1 {}\r\n"
+                                      "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                                      "Content-Length: {}\r\n"
+                                      "Connection: close\r\n\r\n{}",
+            status, body.size(), body);
+        send_response(fd);
+    }
+
+    // The socket is nonblocking, so this never holds up the reactor:
+    // whatever doesn't fit in the socket buffer now is sent when
+    // the client is ready for it.
+    void send_response(int fd)
+    {
+        auto it = clients.find(fd);
+        if (it == clients.end()) {
+            return;
+        }
+        auto& client = it->second;
+        while (client.sent < client.response.size()) {
+            ssize_t r = send(fd, client.response.data() + client.sent, client.response.size() - client.sent, MSG_NOSIGNAL);
+            if (r < 0) {
+                if (errno == EINTR) {
+                    continue;
+                }
+                if ((errno == EAGAIN) || (errno == EWOULDBLOCK)) {
+                    wait_for_client(fd, client);
+                    return;
+                }
+            }
+            if (r <= 0) {
+                HSB_LOG_DEBUG("Telemetry response send failed, errno={}.", errno);
+                break;
+            }
+            client.sent += r;
+        }
+        close_client(fd);
+    }
+
+    void wait_for_client(int fd, Client& client)
+    {
+        if (client.timeout) {
+            // Already waiting.
+            return;
+        }
+        auto reactor = Reactor::get_reactor();
+        auto self = shared_from_this();
+        reactor->add_fd_callback(fd, [self](int fd, short) { self->send_response(fd); }, POLLOUT);
+        client.timeout = reactor->add_alarm_s(CLIENT_TIMEOUT_S, [self, fd]() {
+            HSB_LOG_DEBUG("Timed out sending the telemetry response.");
+            // This alarm is done; close_client mustn't cancel it.
+            auto it = self->clients.find(fd);
+            if (it != self->clients.end()) {
+                it->second.timeout.reset();
+                self->close_client(fd);
+            }
+        });
+    }
+
+    void close_client(int fd)
+    {
+        auto reactor = Reactor::get_reactor();
+        reactor->remove_fd_callback(fd);
+        auto it = clients.find(fd);
+        if (it != clients.end()) {
+            if (it->second.timeout) {
+                reactor->cancel_alarm(it->second.timeout);
+            }
+            clients.erase(it);
+        }
+        ::close(fd);
+    }
+
+    void shutdown()
+    {
+        while (!clients.empty()) {
+            close_client(clients.begin()->first);
+        }
+        if (socket >= 0) {
+            Reactor::get_reactor()->remove_fd_callback(socket);
+            ::close(socket);
+            socket = -1;
+        }
+    }
+};
+
+TelemetryServer::TelemetryServer(uint16_t port, const std::string& address)
+    : state_(std::make_shared<State>())
+    , port_(0)
+{
+    int fd = socket(AF_INET, SOCK_STREAM | SOCK_NONBLOCK | SOCK_CLOEXEC, 0);
+    if (fd < 0) {
+        throw std::runtime_error(fmt::format("socket failed, errno={}.", errno));
+    }
+    state_->socket = fd;
+    int enable = 1;
+    setsockopt(fd, SOL_SOCKET, SO_REUSEADDR, &enable, sizeof(enable));
+    struct sockaddr_in sockaddr = {};
+    sockaddr.sin_family = AF_INET;
+    sockaddr.sin_port = htons(port);
+    if (inet_pton(AF_INET, address.c_str(), &sockaddr.sin_addr) != 1) {
+        ::close(fd);
+        throw std::runtime_error(fmt::format("Invalid telemetry server address \"{}\".", address));
+    }
+    if ((bind(fd, reinterpret_cast<struct sockaddr*>(&sockaddr), sizeof(sockaddr)) != 0)
+        || (listen(fd, 16) != 0)) {
+        int error = errno;
+        ::close(fd);
+        throw std::runtime_error(fmt::format("Unable to listen on {}:{}, errno={}.", address, port, error));
+    }
+    socklen_t sockaddr_len = sizeof(sockaddr);
+    if (getsockname(fd, reinterpret_cast<struct sockaddr*>(&sockaddr), &sockaddr_len) != 0) {
+        int error = errno;
+        ::close(fd);
+        throw std::runtime_error(fmt::format("getsockname failed, errno={}.", error));
+    }
+    port_ = ntohs(sockaddr.sin_port);
+    auto state = state_;
+    Reactor::get_reactor()->add_fd_callback(fd, [state](int, short) { state->accept_connections(); });
+    HSB_LOG_INFO("Serving receiver telemetry at http://{}:{}/metrics.", address, port_);
+}
+
+TelemetryServer::~TelemetryServer()
+{
+    // state_ is only used on the reactor thread; close everything there.
+    auto state = state_;
+    Reactor::get_reactor()->add_callback([state]() { state->shutdown(); });
+}
+
+} // namespace hololink::core
@@ -0,0 +1,209 @@
+/**
+ * SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * See README.md for detailed information.
+ */
+
+#ifndef SRC_HOLOLINK_CORE_TELEMETRY
+#define SRC_HOLOLINK_CORE_TELEMETRY
+
+#include <stdint.h>
+#include <time.h>
+
+#include <atomic>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace hololink::core {
+
+/**
+ * Counters and timing histograms common to the receivers (LinuxReceiver,
+ * LinuxCoeReceiver and RoceReceiver). Values live in a POSIX shared
+ * memory segment, /dev/shm/hololink-telemetry.<pid>.<instance>, so an
+ * external scraper can map it read-only and sample it at any time
+ * without any cooperation from, or cost to, the receiver; the segment
+ * is removed when the receiver is destroyed. If the segment can't be
+ * created (or HOLOLINK_TELEMETRY_SHM=0), values are kept in ordinary
+ * memory and are still available via snapshot() and TelemetryServer.
+ *
+ * Each value has exactly one writing thread, so updates are plain
+ * relaxed loads and stores to naturally aligned 64-bit words--no locks
+ * and no read-modify-write instructions on the hot path. Readers may
+ * see a histogram's count, sum and buckets from slightly different
+ * moments.
+ *
+ * Segment layout (native byte order, see Segment below):
+ *   char magic[8] = "HSBTEL01"
+ *   uint32_t size, pid
+ *   char receiver[32], NUL terminated
+ *   uint64_t counters[COUNTER_COUNT]
+ *   Histogram histograms[TIMER_COUNT]
+ *     uint64_t count, sum_ns, buckets[HISTOGRAM_BUCKETS]
+ * bucket[i] counts samples no longer than 2**i microseconds (the last
+ * bucket counts everything else); buckets aren't cumulative.
+ */
+class ReceiverTelemetry {
+public:
+    // RoceReceiver doesn't see individual packets, so it doesn't report
+    // PACKETS_RECEIVED, BYTES_RECEIVED, PACKETS_DROPPED or FRAME_ASSEMBLY;
+    // LinuxCoeReceiver has no PSN, so doesn't report PACKETS_DROPPED.
+    enum Counter : unsigned {
+        PACKETS_RECEIVED,
+        BYTES_RECEIVED,
+        // Packets missing from the PSN sequence.
+        PACKETS_DROPPED,
+        // Frames completed by the receiver.
+        FRAMES_RECEIVED,
+        // Completed frames discarded because the application didn't fetch them in time.
+        FRAMES_DROPPED,
+        // Frames returned by get_next_frame.
+        FRAMES_DELIVERED,
+        // Calls to get_next_frame that returned without a frame.
+        TIMEOUTS,
+        COUNTER_COUNT,
+    };
+
+    enum Timer : unsigned {
+        // From the first to the last packet of a frame.
+        FRAME_ASSEMBLY,
+        // From the first packet (with RoceReceiver, the completion event)
+        // to the frame being queued for get_next_frame.
+        FRAME_LATENCY,
+        // Time spent blocked in get_next_frame.
+        FRAME_WAIT,
+        TIMER_COUNT,
+    };
+
+    static constexpr unsigned HISTOGRAM_BUCKETS = 25;
+
+    struct Histogram {
+        std::atomic<uint64_t> count;
+        std::atomic<uint64_t> sum_ns;
+        std::atomic<uint64_t> buckets[HISTOGRAM_BUCKETS];
+    };
+
+    struct Segment {
+        char magic[8];
+        uint32_t size;
+        uint32_t pid;
+        char receiver[32];
+        std::atomic<uint64_t> counters[COUNTER_COUNT];
+        Histogram histograms[TIMER_COUNT];
+    };
+
+    static constexpr char MAGIC[8] = { 'H', 'S', 'B', 'T', 'E', 'L', '0', '1' };
+
+    /**
+     * A copy of the current values, for use off the hot path.
+     */
+    struct Snapshot {
+        std::string receiver;
+        unsigned instance = 0;
+        std::vector<uint64_t> counters;
+        std::vector<uint64_t> counts;
+        std::vector<uint64_t> sums_ns;
+        std::vector<std::vector<uint64_t>> buckets;
+    };
+
+    /**
+     * @param receiver names the kind of receiver, e.g. "linux_receiver";
+     * it's the "receiver" label in Prometheus output.
+     * @param shared if false, don't create a shared memory segment.
+     */
+    explicit ReceiverTelemetry(const std::string& receiver, bool shared = true);
+    ~ReceiverTelemetry();
+
+    ReceiverTelemetry(const ReceiverTelemetry&) = delete;
+    ReceiverTelemetry& operator=(const ReceiverTelemetry&) = delete;
+
+    /**
+     * Creates a new ReceiverTelemetry, with a shared memory segment
+     * unless HOLOLINK_TELEMETRY_SHM=0. If HOLOLINK_TELEMETRY_PORT is
+     * set, this also starts a TelemetryServer on that port (once per
+     * process).
+     */
+    static std::shared_ptr<ReceiverTelemetry> create(const std::string& receiver);
+
+    // Only the thread that owns a value may call these for it.
+    void add(Counter counter, uint64_t n = 1)
+    {
+        auto& value = segment_->counters[counter];
+        value.store(value.load(std::memory_order_relaxed) + n, std::memory_order_relaxed);
+    }
+    void record_ns(Timer timer, int64_t ns);
+    // Records end - start, given timestamps from the same clock.
+    void record(Timer timer, const struct timespec& start, const struct timespec& end)
+    {
+        record_ns(timer, (end.tv_sec - start.tv_sec) * 1'000'000'000LL + (end.tv_nsec - start.tv_nsec));
+    }
+
+    uint64_t get(Counter counter) const { return segment_->counters[counter].load(std::memory_order_relaxed); }
+    Snapshot snapshot() const;
+
+    const std::string& receiver() const { return receiver_; }
+    // Distinguishes receivers within this process.
+    unsigned instance() const { return instance_; }
+    // The shared memory name (for shm_open), or "" if there isn't one.
+    const std::string& shm_name() const { return shm_name_; }
+
+    /**
+     * @returns Prometheus text exposition format for all the
+     * ReceiverTelemetry objects in this process.
+     */
+    static std::string prometheus_text();
+
+    static const char* counter_name(Counter counter);
+    static const char* timer_name(Timer timer);
+    // Upper limit, in seconds, of bucket; the last bucket is unlimited.
+    static double bucket_limit_s(unsigned bucket);
+
+private:
+    const std::string receiver_;
+    const unsigned instance_;
+    std::string shm_name_;
+    Segment* segment_;
+};
+
+/**
+ * Serves the Prometheus text for all receivers in this process
+ * (ReceiverTelemetry::prometheus_text) over HTTP, from the core
+ * Reactor thread; nothing is done on the receiver threads. Any GET
+ * request is answered, so point the scraper at http://host:port/metrics.
+ */
+class TelemetryServer {
+public:
+    /**
+     * Listens on address:port; port 0 picks a free port (see get_port).
+     */
+    TelemetryServer(uint16_t port, const std::string& address = "127.0.0.1");
+    ~TelemetryServer();
+
+    TelemetryServer(const TelemetryServer&) = delete;
+    TelemetryServer& operator=(const TelemetryServer&) = delete;
+
+    uint16_t get_port() const { return port_; }
+
+private:
+    // Shared with the reactor callbacks, which may outlive this object.
+    struct State;
+    std::shared_ptr<State> state_;
+    uint16_t port_;
+};
+
+} // namespace hololink::core
+
+#endif /* SRC_HOLOLINK_CORE_TELEMETRY */
@@ -22,6 +22,7 @@
 #include <condition_variable>
 #include <csignal>
 #include <cstring>
+#include <ctime>
 #include <memory>
 #include <mutex>
 #include <queue>
@@ -141,7 +142,7 @@ size_t serialize_reply_message(hololink::core::Serializer& serializer, ControlMe
     return serializer.length();
 }
 
-// class that currently just handles SW_EVENT APB events.
+// class that handles SW_EVENT APB events and events raised by controllers via HSBEmulator::apb_event().
 // runs a thread with a queue of events to execute. in practice,
 // for the same type of event, there is only ever one executing at a time
 class APBEventHandler {
@@ -218,6 +219,31 @@ public:
         apb_event_queue_cv_.notify_one();
     }
 
+    // handle an event raised by a controller: send the async event packet
+    // right away, as HSB does when the edge happens, and queue up the sequence
+    // the host configured for it. The packet does not wait for that sequence
+    // or for any sequence already running (e.g. the SW_EVENT sequence that
+    // started an I2C transaction). Unlike queue_event, this quietly drops the
+    // event if the handler is stopped, as controllers may still be finishing
+    // up while the emulator stops.
+    void notify_event(hololink::Hololink::Event event)
+    {
+        if (!running_) {
+            return;
+        }
+        hsbemu_.send_async_event(1u << event);
+        uint32_t start_address = hsbemu_.read(hololink::APB_RAM + event * 4);
+        if (!start_address) {
+            return;
+        }
+        std::unique_lock<std::mutex> lock(apb_event_queue_mutex_);
+        if (!running_) {
+            return;
+        }
+        apb_event_queue_.push(APBEventEntry { event, start_address });
+        apb_event_queue_cv_.notify_one();
+    }
+
 private:
     struct APBEventEntry {
         hololink::Hololink::Event event;
@@ -244,13 +270,15 @@ private:
     {
         uint32_t match = next_value(seq_address);
         uint32_t mask = next_value(seq_address);
-        // no checking for timeout yet
+        // no checking for timeout yet. HSB's sequencer polls at APB speed;
+        // keep this short so the status cache follows the I2C_BUSY event
+        // closely.
         while (true) {
             uint32_t value = hsbemu_.read(register_address);
             if ((value & mask) == match) {
                 break;
             }
-            std::this_thread::sleep_for(std::chrono::milliseconds(1));
+            std::this_thread::sleep_for(std::chrono::microseconds(10));
         }
     }
 
@@ -351,7 +379,9 @@ private:
             APBEventEntry entry = apb_event_queue_.front();
             apb_event_queue_.pop();
             lock.unlock(); // allow other threads to write to queue
-            execute_sequence(entry);
+            if (entry.start_address) {
+                execute_sequence(entry);
+            }
         }
     }
     std::mutex apb_event_queue_mutex_;
@@ -363,7 +393,8 @@ private:
 };
 
 I2CController::I2CController(HSBEmulator& hsb_emulator, uint32_t controller_address)
-    : registers_(hsb_emulator.get_memory())
+    : hsb_emulator_(hsb_emulator)
+    , registers_(hsb_emulator.get_memory())
     , controller_address_(controller_address)
     , status_address_(controller_address + hololink::I2C_REG_STATUS)
     , bus_en_address_(controller_address + hololink::I2C_REG_BUS_EN)
@@ -463,6 +494,7 @@ void I2CController::i2c_execute()
 {
     // runs under the lock from the run() thread when this is executed
     registers_->write(status_address_, hololink::I2C_BUSY);
+    hsb_emulator_.apb_event(hololink::Hololink::Event::I2C_BUSY, true);
     // get the transaction size
     uint32_t num_bytes = registers_->read(num_bytes_address_);
     uint16_t num_bytes_write = static_cast<uint16_t>(num_bytes & 0xFFFF);
@@ -499,6 +531,7 @@ void I2CController::i2c_execute()
         // TODO: print messages based on status and write an error to the FSM status registers
         fprintf(stderr, "I2CController: i2c_transaction reports non-success status. %d\n", status);
         registers_->write(status_address_, hololink::I2C_I2C_ERR);
+        hsb_emulator_.apb_event(hololink::Hololink::Event::I2C_BUSY, false);
         return; // wrote error to I2C. Don't read data back
     }
 
@@ -510,6 +543,7 @@ void I2CController::i2c_execute()
 
     // update status register to done
     registers_->write(status_address_, hololink::I2C_DONE);
+    hsb_emulator_.apb_event(hololink::Hololink::Event::I2C_BUSY, false);
 
     // reset the command and peripheral address for next transaction
     cmd_ = 0;
@@ -600,6 +634,11 @@ void HSBEmulator::start()
         return;
     }
 
+    // async event packets are sent from an unbound socket
+    async_event_socket_ = socket(AF_INET, SOCK_DGRAM, 0);
+    if (async_event_socket_ < 0) {
+        fprintf(stderr, "Failed to create async event socket...async events will not be sent: %d - %s\n", errno, strerror(errno));
+    }
     i2c_controller_->start();
     apb_event_handler_->start();
 
@@ -630,6 +669,10 @@ void HSBEmulator::stop()
 
     apb_event_handler_->stop();
     i2c_controller_->stop();
+    if (async_event_socket_ >= 0) {
+        close(async_event_socket_);
+        async_event_socket_ = -1;
+    }
     // stop the control plane thread and wait for data planes to stop
     running_ = false;
     if (control_thread_.joinable()) {
@@ -714,6 +757,7 @@ void HSBEmulator::control_listen()
                     fprintf(stderr, "incomplete message received: %zu - %u\n", message_length, MIN_VALID_CONTROL_LENGTH);
                     continue;
                 }
+                control_host_ip_ = host_addr.sin_addr.s_addr;
 
                 // deserialize the control message
                 struct ControlMessage message;
@@ -829,8 +873,65 @@ void HSBEmulator::handle_spi_control_write(uint32_t address, uint32_t value)
     }
 }
 
+void HSBEmulator::apb_event(hololink::Hololink::Event event, bool rising)
+{
+    uint32_t mask = 1u << event;
+    if (!(this->read(hololink::CTRL_EVT_APB_INTERRUPT_EN) & mask)) {
+        return;
+    }
+    uint32_t edges = this->read(rising ? hololink::CTRL_EVT_RISING : hololink::CTRL_EVT_FALLING);
+    if (!(edges & mask)) {
+        return;
+    }
+    apb_event_handler_->notify_event(event);
+}
+
+void HSBEmulator::send_async_event(uint32_t interrupt_active)
+{
+    if (async_event_socket_ < 0) {
+        return;
+    }
+    uint32_t host_ip = this->read(hololink::CTRL_EVT_HOST_IP_ADDR);
+    uint32_t host_port = this->read(hololink::CTRL_EVT_HOST_UDP_PORT);
+    if (!host_port) {
+        return;
+    }
+    struct sockaddr_in host_addr = {
+        .sin_family = AF_INET,
+        .sin_port = htons(static_cast<uint16_t>(host_port)),
+        .sin_addr = {
+            .s_addr = htonl(host_ip),
+        }
+    };
+    // hosts configure a local broadcast address; we deliver that to whoever
+    // is talking to us, which also works over loopback.
+    if ((host_ip == 0) || (host_ip == 0xFFFF'FFFF)) {
+        host_addr.sin_addr.s_addr = control_host_ip_;
+    }
+    struct timespec now;
+    clock_gettime(CLOCK_REALTIME, &now);
+    uint64_t timestamp_s = static_cast<uint64_t>(now.tv_sec);
+
+    // interrupt_active, interrupt_state, 48-bit seconds, nanoseconds
+    uint8_t message_buffer[4 + 4 + 6 + 4];
+    hololink::core::Serializer serializer(message_buffer, sizeof(message_buffer));
+    auto ok = serializer.append_uint32_be(interrupt_active)
+        && serializer.append_uint32_be(interrupt_active)
+        && serializer.append_uint16_be(static_cast<uint16_t>(timestamp_s >> 32))
+        && serializer.append_uint32_be(static_cast<uint32_t>(timestamp_s))
+        && serializer.append_uint32_be(static_cast<uint32_t>(now.tv_nsec));
+    if (!ok) {
+        fprintf(stderr, "serialize async event failed. no event sent\n");
+        return;
+    }
+    if (sendto(async_event_socket_, message_buffer, serializer.length(), 0, (struct sockaddr*)&host_addr, sizeof(host_addr)) < 0) {
+        fprintf(stderr, "sendto in send_async_event failed: %d - %s - host_addr: %s\n", errno, strerror(errno), inet_ntoa(host_addr.sin_addr));
+    }
+}
+
 // detect_poll() and handle_poll() are a workaround for handling i2c_transaction
-// sequences.
+// sequences. Hosts that wait for the I2C_BUSY async event (see apb_event())
+// only read the status once it's done, so they don't hit this.
 // detect if host side application is expecting a response
 // returns true if polling on the same address, false otherwise
 bool HSBEmulator::detect_poll(uint32_t address)
@@ -120,6 +120,7 @@ private:
     uint16_t peripheral_address_ { 0 };
     uint16_t cmd_ { 0 };
     std::thread i2c_thread_;
+    HSBEmulator& hsb_emulator_;
     std::shared_ptr<MemRegister> registers_;
     uint32_t controller_address_;
     uint32_t status_address_;
@@ -137,6 +138,7 @@ class HSBEmulator {
 public:
     friend class DataPlane;
     friend class I2CController;
+    friend class APBEventHandler;
 
     /**
      *
@@ -243,6 +245,24 @@ private:
      */
     void handle_spi_control_write(uint32_t address, uint32_t value);
 
+    /**
+     * @brief method for controllers to signal an edge on an APB event line. If the event is enabled
+     * in CTRL_EVT_APB_INTERRUPT_EN for that edge (CTRL_EVT_RISING or CTRL_EVT_FALLING), the event's
+     * sequence is executed and an async event packet is sent to the host.
+     * @param event The event that changed.
+     * @param rising true for a rising edge, false for a falling edge.
+     */
+    void apb_event(hololink::Hololink::Event event, bool rising);
+
+    /**
+     * @brief method to send an async event packet to the host address and UDP port configured
+     * in CTRL_EVT_HOST_IP_ADDR and CTRL_EVT_HOST_UDP_PORT.
+     * @param interrupt_active The mask of events that triggered this packet.
+     *
+     * @note A broadcast host address is sent to the most recent control plane host instead.
+     */
+    void send_async_event(uint32_t interrupt_active);
+
     /**
      * @brief method to detect HSB Host application polling conditions
      * @return true if the polling condition is met, false otherwise.
@@ -293,6 +313,9 @@ private:
     std::unique_ptr<I2CController> i2c_controller_; // owned by HSBEmulator and never shared
     std::unique_ptr<RenesasI2CPeripheral> renesas_i2c_; // owned by HSBEmulator and never shared
     std::thread control_thread_;
+    int async_event_socket_ { -1 };
+    // network order address of the most recent control plane host
+    std::atomic<uint32_t> control_host_ip_ { 0 };
 
     std::vector<DataPlane*> data_plane_list_;
     /* for workaround to handle polling conditions */
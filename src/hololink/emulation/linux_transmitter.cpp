@@ -51,6 +51,10 @@
 #define IB_PAYLOAD_OFFSET (UDP_PAYLOAD_OFFSET + IB_HEADER_SIZE)
 
 #define IB_PSN_MASK 0xFFFFFF
+// offset of the BTHeader psn; everything from here to the payload changes from packet to packet
+#define IB_PSN_OFFSET (UDP_PAYLOAD_OFFSET + 8)
+
+static_assert(sizeof(hololink::emulation::LinuxPacketFrame::headers) == IB_PAYLOAD_OFFSET, "LinuxPacketFrame headers must hold exactly the IP, UDP, BT and RET headers");
 
 namespace hololink::emulation {
 
@@ -247,6 +251,66 @@ static size_t serialize_packet(LinuxHeaders& headers, uint8_t* __restrict__ buff
     return message_size;
 }
 
+// Serialized headers shared by all the packets of a frame with the same content_size.
+// crc is the iCRC state over the CRC initializer and the masked headers up to the psn,
+// so each packet only has to hash its psn, RET header and payload.
+struct PacketTemplate {
+    uint8_t headers[IB_PAYLOAD_OFFSET];
+    uint32_t crc;
+};
+
+// returns false on failure. headers.ret_h.content_size must be set to the payload size of the packets this template is for.
+static bool init_packet_template(PacketTemplate& packet_template, LinuxHeaders& headers)
+{
+    size_t message_size = IB_PAYLOAD_OFFSET + headers.ret_h.content_size + sizeof(uint32_t);
+    assert(message_size <= UINT16_MAX); // ip header cannot accept values greater than 65535
+    headers.ip_h.tot_len = message_size;
+    headers.udp_h.len = message_size - IP_HEADER_SIZE;
+
+    // the magic values for CRC calculation, as in serialize_packet
+    iphdr ip_header = headers.ip_h;
+    ip_header.tos = 0xFF;
+    ip_header.ttl = 0xFF;
+    ip_header.check = 0xFFFF;
+    udphdr udp_header = headers.udp_h;
+    udp_header.check = 0xFFFF;
+
+    uint8_t masked[IB_PAYLOAD_OFFSET];
+    hololink::core::Serializer serializer(masked, sizeof(masked));
+    if (!(serialize_ip_header(serializer, ip_header)
+            && serialize_udp_header(serializer, udp_header)
+            && serialize_bt_header(serializer, headers.bt_h)
+            && serialize_ret_header(serializer, headers.ret_h))) {
+        fprintf(stderr, "failure in serializing packet template\n");
+        return false;
+    }
+    static uint8_t crc_init_buf[8] = { 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF };
+    packet_template.crc = crc32(crc32(0L, crc_init_buf, sizeof(crc_init_buf)), masked, IB_PSN_OFFSET);
+
+    serializer = hololink::core::Serializer(packet_template.headers, sizeof(packet_template.headers));
+    if (!(serialize_ip_header(serializer, headers.ip_h)
+            && serialize_udp_header(serializer, headers.udp_h)
+            && serialize_bt_header(serializer, headers.bt_h)
+            && serialize_ret_header(serializer, headers.ret_h))) {
+        fprintf(stderr, "failure in serializing packet template\n");
+        return false;
+    }
+    return true;
+}
+
+// fills in frame with the headers from packet_template, the given psn and vaddress, and the
+// iCRC over the headers and the content_size bytes at content.
+static void write_packet_frame(LinuxPacketFrame& frame, const PacketTemplate& packet_template, uint32_t psn, uint64_t vaddress, const uint8_t* content, uint32_t content_size)
+{
+    memcpy(frame.headers, packet_template.headers, sizeof(frame.headers));
+    hololink::core::Serializer serializer(&frame.headers[IB_PSN_OFFSET], IB_PAYLOAD_OFFSET - IB_PSN_OFFSET);
+    serializer.append_uint32_be(psn);
+    serializer.append_uint64_be(vaddress);
+    uint32_t crc = crc32(packet_template.crc, &frame.headers[IB_PSN_OFFSET], IB_PAYLOAD_OFFSET - IB_PSN_OFFSET);
+    // per zlib docs, crc is already in network byte order and application should not modify. direct copy.
+    frame.crc = crc32(crc, content, content_size);
+}
+
 // returns 0 on failure or the number of bytes written to buffer on success
 static size_t write_frame_metadata(uint8_t* __restrict__ buffer, size_t buffer_size, const struct timespec& frame_start_timestamp, size_t n_bytes_sent, uint32_t frame_number, uint32_t psn, uint8_t page)
 {
@@ -305,10 +369,48 @@ void LinuxTransmitter::init_socket()
     }
 }
 
+// points each message at its headers and iCRC; payload slices and the destination are filled in on send
+void LinuxTransmitter::init_batch()
+{
+    for (unsigned int i = 0; i < LINUX_TRANSMITTER_BATCH_SIZE; i++) {
+        struct iovec* iov = &iovecs_[i * 3];
+        iov[0] = { .iov_base = frames_[i].headers, .iov_len = sizeof(frames_[i].headers) };
+        iov[1] = { .iov_base = nullptr, .iov_len = 0 };
+        iov[2] = { .iov_base = &frames_[i].crc, .iov_len = sizeof(frames_[i].crc) };
+        messages_[i] = {};
+        messages_[i].msg_hdr.msg_name = &dest_addr_;
+        messages_[i].msg_hdr.msg_namelen = sizeof(dest_addr_);
+        messages_[i].msg_hdr.msg_iov = iov;
+        messages_[i].msg_hdr.msg_iovlen = 3;
+    }
+}
+
+// sends the first count messages, returning the number of payload bytes successfully sent
+int64_t LinuxTransmitter::send_batch(unsigned int count)
+{
+    int64_t n_bytes_sent = 0;
+    unsigned int sent = 0;
+    while (sent < count) {
+        int n = sendmmsg(data_socket_fd_, &messages_[sent], count - sent, 0);
+        if (n <= 0) {
+            // TODO: need more sophisticated error handling here. For now, just show error and move on
+            fprintf(stderr, "packet not sent: %d - %s\n", errno, strerror(errno));
+            sent++;
+            continue;
+        }
+        for (unsigned int i = sent; i < sent + n; i++) {
+            n_bytes_sent += iovecs_[i * 3 + 1].iov_len;
+        }
+        sent += n;
+    }
+    return n_bytes_sent;
+}
+
 LinuxTransmitter::LinuxTransmitter(const LinuxHeaders& headers)
     : linux_headers_(headers)
 {
     init_socket();
+    init_batch();
 }
 
 // Infiniband transmitter without using ib verbs apis
@@ -320,6 +422,7 @@ LinuxTransmitter::LinuxTransmitter(const IPAddress& source_ip)
     linux_headers_.udp_h.source = source_ip.port;
 
     init_socket();
+    init_batch();
 }
 
 LinuxTransmitter::~LinuxTransmitter()
@@ -410,28 +513,40 @@ int64_t LinuxTransmitter::send(const TransmissionMetadata* metadata, const DLTen
         return -1;
     }
 
+    if (!udp_payload_size || (IB_PAYLOAD_OFFSET + udp_payload_size + sizeof(uint32_t) > hololink::core::UDP_PACKET_SIZE)) {
+        fprintf(stderr, "invalid payload size %u\n", (unsigned)udp_payload_size);
+        return -1;
+    }
+    // packets are sent in batches with sendmmsg. Every packet but the last has the
+    // same headers apart from the psn and vaddress, so serialize them once per frame.
+    int64_t n_packets = (n_bytes + udp_payload_size - 1) / udp_payload_size;
+    int64_t last_payload_size = n_bytes - (n_packets - 1) * udp_payload_size;
+    PacketTemplate packet_template, last_packet_template;
+    ret_header->content_size = udp_payload_size;
+    bool templates_ok = init_packet_template(packet_template, linux_headers_);
+    ret_header->content_size = last_payload_size;
+    templates_ok = templates_ok && init_packet_template(last_packet_template, linux_headers_);
+    if (!templates_ok) {
+        return -1;
+    }
+    dest_addr_ = dest_addr;
+
     while (offset < n_bytes) {
-        int64_t n_bytes_to_send = n_bytes - offset;
-        if (n_bytes_to_send > udp_payload_size) {
-            n_bytes_to_send = udp_payload_size;
-        }
-        // prepare headers for packet
-        bt_header->psn = psn_;
-        ret_header->content_size = n_bytes_to_send;
-        ret_header->vaddress = linux_metadata->address + offset;
-
-        size_t message_size = serialize_packet(linux_headers_, mesg, sizeof(mesg), content + offset);
-        if (message_size != IB_PAYLOAD_OFFSET + n_bytes_to_send + sizeof(uint32_t)) {
-            fprintf(stderr, "error in writing packet psn %d. found %zu expected %zu\n", psn_, message_size, IB_PAYLOAD_OFFSET + n_bytes_to_send + sizeof(uint32_t));
-        } else if (sendto(data_socket_fd_, &mesg, message_size, 0, (struct sockaddr*)&dest_addr, sizeof(dest_addr)) <= 0) {
-            // TODO: need more sophisticated error handling here. For now, just show error and move on
-            fprintf(stderr, "packet psn %d not sent\n", psn_);
-        } else {
-            n_bytes_sent += n_bytes_to_send;
-        }
+        unsigned int count = 0;
+        for (; count < LINUX_TRANSMITTER_BATCH_SIZE && offset < n_bytes; count++) {
+            int64_t n_bytes_to_send = n_bytes - offset;
+            const PacketTemplate* frame_template = &last_packet_template;
+            if (n_bytes_to_send > udp_payload_size) {
+                n_bytes_to_send = udp_payload_size;
+                frame_template = &packet_template;
+            }
+            write_packet_frame(frames_[count], *frame_template, psn_, linux_metadata->address + offset, content + offset, n_bytes_to_send);
+            iovecs_[count * 3 + 1] = { .iov_base = content + offset, .iov_len = (size_t)n_bytes_to_send };
 
-        offset += n_bytes_to_send;
-        psn_ = (psn_ + 1) & IB_PSN_MASK;
+            offset += n_bytes_to_send;
+            psn_ = (psn_ + 1) & IB_PSN_MASK;
+        }
+        n_bytes_sent += send_batch(count);
     }
 
     // write directly into the mesg packet buffer
@@ -23,6 +23,8 @@
 #include <cstdint>
 #include <cstring>
 
+#include <sys/uio.h>
+
 #include "dlpack/dlpack.h"
 
 #include "base_transmitter.hpp"
@@ -62,6 +64,16 @@ struct LinuxHeaders {
 // explanations of which fields are overwritten and when
 extern const LinuxHeaders DEFAULT_LINUX_HEADERS;
 
+// number of packets handed to the kernel in each sendmmsg call
+constexpr unsigned int LINUX_TRANSMITTER_BATCH_SIZE = 64;
+
+// serialized headers and iCRC for one packet of a batched send. The payload is
+// sent straight from the tensor (or double buffer) between the two.
+struct LinuxPacketFrame {
+    uint8_t headers[sizeof(iphdr) + sizeof(udphdr) + sizeof(BTHeader) + sizeof(RETHeader)];
+    uint32_t crc;
+};
+
 /**
  * Metadata for a transmission that is specific to the LinuxTransmitter.
  *
@@ -107,6 +119,8 @@ public:
 
 private:
     void init_socket();
+    void init_batch();
+    int64_t send_batch(unsigned int count);
     int data_socket_fd_ { -1 };
 
     // state data that is not thread safe without the DataPlane::send level synchronization
@@ -116,6 +130,12 @@ private:
     // double buffering is for GPU inputs currently
     void* double_buffer_ { nullptr };
     int64_t double_buffer_size_ { 0 };
+    // per-packet storage for sendmmsg; each message is
+    // { frames_[i].headers, payload slice, frames_[i].crc }
+    LinuxPacketFrame frames_[LINUX_TRANSMITTER_BATCH_SIZE];
+    struct iovec iovecs_[LINUX_TRANSMITTER_BATCH_SIZE * 3];
+    struct mmsghdr messages_[LINUX_TRANSMITTER_BATCH_SIZE];
+    struct sockaddr_in dest_addr_ {};
 };
 
 } // namespace hololink::emulation
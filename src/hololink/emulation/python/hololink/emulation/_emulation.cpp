@@ -48,6 +48,11 @@ int64_t py_send_dltensor(DataPlane* self, py::object py_tensor)
     // called and decrefs the DLManagedTensor and releases the memory for
     // this to work, send must not propagate the DLManagedTensor to other
     // objects
+
+    // capsule keeps the tensor alive while we send it without the GIL,
+    // so DataPlanes in other threads (e.g. stereo sensors) can send
+    // at the same time.
+    py::gil_scoped_release release;
     return self->send(*tensor);
 }
 
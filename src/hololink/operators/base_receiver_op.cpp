@@ -114,6 +114,10 @@ void BaseReceiverOp::compute(holoscan::InputContext& input, holoscan::OutputCont
     frame_count_ += 1;
     // Clear our asynchronous event
     frame_ready_condition_->event_state(holoscan::AsynchronousEventState::EVENT_WAITING);
+    // If more frames are queued up, make sure we're scheduled again.
+    if (frames_pending()) {
+        frame_ready();
+    }
 
     // Create an Entity and use GXF tensor to wrap the CUDA memory.
     nvidia::gxf::Expected<nvidia::gxf::Entity> out_message
@@ -159,7 +163,7 @@ void BaseReceiverOp::compute(holoscan::InputContext& input, holoscan::OutputCont
     const uint64_t element_size = nvidia::gxf::PrimitiveTypeSize(element_type);
     if (!gxf_tensor.value()->wrapMemory(shape, element_type, element_size,
             nvidia::gxf::ComputeTrivialStrides(shape, element_size),
-            nvidia::gxf::MemoryStorageType::kDevice, reinterpret_cast<void*>(frame_memory),
+            frame_memory_storage_type_, reinterpret_cast<void*>(frame_memory),
             [](void*) {
                 // release function, nothing to do
                 return nvidia::gxf::Success;
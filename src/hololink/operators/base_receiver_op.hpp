@@ -77,6 +77,9 @@ protected:
     holoscan::Parameter<bool> trim_;
     std::shared_ptr<holoscan::AsynchronousCondition> frame_ready_condition_;
     uint64_t frame_count_;
+    // Where the frame_memory returned by get_next_frame lives;
+    // receivers that deliver frames in host memory set kSystem.
+    nvidia::gxf::MemoryStorageType frame_memory_storage_type_ = nvidia::gxf::MemoryStorageType::kDevice;
 
     core::UniqueFileDescriptor data_socket_;
 
@@ -84,6 +87,9 @@ protected:
     virtual void stop_receiver() = 0;
     virtual std::tuple<CUdeviceptr, std::shared_ptr<Metadata>> get_next_frame(double timeout_ms) = 0;
     virtual std::tuple<std::string, uint32_t> local_ip_and_port();
+    // Receivers that queue up more than one frame return true
+    // here when get_next_frame won't block.
+    virtual bool frames_pending() { return false; }
     virtual void timeout(holoscan::InputContext& input, holoscan::OutputContext& output,
         holoscan::ExecutionContext& context);
 
@@ -19,8 +19,12 @@
 
 #include "linux_coe_receiver.hpp"
 
+#include <algorithm>
 #include <errno.h>
+#include <linux/if_packet.h>
+#include <poll.h>
 #include <pthread.h>
+#include <sys/mman.h>
 #include <sys/socket.h>
 #include <sys/types.h>
 #include <unistd.h>
@@ -51,6 +55,37 @@ static inline struct timespec add_ms(struct timespec& ts, unsigned long ms)
     return r;
 }
 
+// Given the [start, end) regions received, fill in missing with the
+// (offset, length) of each gap in [0, size); returns the total
+// number of bytes missing.
+static uint64_t find_missing_regions(std::vector<std::pair<uint64_t, uint64_t>>& received,
+    uint64_t size, std::vector<std::pair<uint64_t, uint64_t>>& missing)
+{
+    missing.clear();
+    // Packets usually arrive in order, in which case this is cheap.
+    if (!std::is_sorted(received.begin(), received.end())) {
+        std::sort(received.begin(), received.end());
+    }
+    uint64_t r = 0;
+    uint64_t cursor = 0;
+    for (auto& [start, end] : received) {
+        if (cursor >= size) {
+            break;
+        }
+        if (start > cursor) {
+            uint64_t length = std::min(start, size) - cursor;
+            missing.emplace_back(cursor, length);
+            r += length;
+        }
+        cursor = std::max(cursor, end);
+    }
+    if (cursor < size) {
+        missing.emplace_back(cursor, size - cursor);
+        r += size - cursor;
+    }
+    return r;
+}
+
 class LinuxCoeReceiverDescriptor {
 public:
     LinuxCoeReceiverDescriptor(uint8_t* memory)
@@ -65,22 +100,53 @@ public:
 LinuxCoeReceiver::LinuxCoeReceiver(CUdeviceptr cu_buffer,
     size_t cu_buffer_size,
     int socket,
-    uint16_t channel)
+    uint16_t channel,
+    unsigned ring_block_size,
+    unsigned ring_block_count,
+    unsigned pages,
+    size_t cu_page_size,
+    bool track_missing,
+    bool fill_missing,
+    bool host_memory,
+    bool huge_pages)
     : cu_buffer_(cu_buffer)
     , cu_buffer_size_(cu_buffer_size)
+    , pages_(pages)
+    , cu_page_size_(cu_page_size ? cu_page_size : cu_buffer_size)
+    , track_missing_(track_missing)
+    , fill_missing_(fill_missing)
+    , received_regions_()
+    , host_memory_(host_memory)
+    , huge_pages_(huge_pages)
     , socket_(socket)
     , channel_(channel)
-    , ready_(false)
+    , ring_block_size_(ring_block_size)
+    , ring_block_count_(ring_block_count)
+    , running_(false)
     , exit_(false)
     , ready_mutex_(PTHREAD_MUTEX_INITIALIZER)
     , ready_condition_(PTHREAD_COND_INITIALIZER)
     , local_(NULL)
-    , available_(NULL)
-    , busy_(NULL)
+    , local_size_(0)
+    , buffer_size_(0)
+    , receiving_(NULL)
+    , held_()
+    , completed_()
+    , free_()
+    , overwrites_(0)
+    , next_page_(0)
     , cu_stream_(0)
     , frame_ready_([](const LinuxCoeReceiver&) {})
     , frame_number_()
+    , telemetry_(core::ReceiverTelemetry::create("linux_coe_receiver"))
 {
+    if (pages_ == 0) {
+        throw std::runtime_error("pages must be at least 1.");
+    }
+    if (cu_page_size_ < cu_buffer_size_) {
+        throw std::runtime_error(fmt::format("cu_page_size={:#x} is smaller than cu_buffer_size={:#x}.", cu_page_size_, cu_buffer_size_));
+    }
+
     int r = pthread_mutex_init(&ready_mutex_, NULL);
     if (r != 0) {
         throw std::runtime_error("pthread_mutex_init failed.");
@@ -102,18 +168,84 @@ LinuxCoeReceiver::LinuxCoeReceiver(CUdeviceptr cu_buffer,
         throw std::runtime_error(fmt::format("setsockopt failed errno={}", errno));
     }
 
+    // The kernel requires the ring block size to be a multiple of
+    // the system page size.
+    if (ring_block_count_) {
+        size_t page_size = getpagesize();
+        if ((ring_block_size_ == 0) || (ring_block_size_ % page_size)) {
+            throw std::runtime_error(fmt::format("ring_block_size={:#x} must be a nonzero multiple of the page size ({:#x}).", ring_block_size_, page_size));
+        }
+    }
+
     // See get_next_frame.
-    CUresult cu_result = cuStreamCreate(&cu_stream_, CU_STREAM_NON_BLOCKING);
-    if (cu_result != CUDA_SUCCESS) {
-        throw std::runtime_error(fmt::format("cuStreamCreate failed, cu_result={}.", cu_result));
+    if (!host_memory_) {
+        CUresult cu_result = cuStreamCreate(&cu_stream_, CU_STREAM_NON_BLOCKING);
+        if (cu_result != CUDA_SUCCESS) {
+            throw std::runtime_error(fmt::format("cuStreamCreate failed, cu_result={}.", cu_result));
+        }
     }
 }
 
 LinuxCoeReceiver::~LinuxCoeReceiver()
 {
+    // With host_memory_, run() leaves local_ for us to free, because
+    // the application may still have frames that point into it.
+    if (local_) {
+        free_local();
+    }
     pthread_cond_destroy(&ready_condition_);
     pthread_mutex_destroy(&ready_mutex_);
-    cuStreamDestroy(cu_stream_);
+    if (cu_stream_) {
+        cuStreamDestroy(cu_stream_);
+    }
+}
+
+void LinuxCoeReceiver::allocate_local(size_t size)
+{
+    if (!host_memory_) {
+        // Write-combined memory is fast for cuMemcpyHtoDAsync to read.
+        CUresult cu_result = cuMemHostAlloc((void**)(&local_), size, CU_MEMHOSTALLOC_WRITECOMBINED);
+        if (cu_result != CUDA_SUCCESS) {
+            throw std::runtime_error(fmt::format("cuMemHostAlloc failed, cu_result={}.", cu_result));
+        }
+        local_size_ = size;
+        return;
+    }
+    // The application reads this memory directly, so use
+    // ordinary cached pages.
+    void* local = MAP_FAILED;
+    if (huge_pages_) {
+        constexpr size_t HUGE_PAGE_SIZE = 2 * 1024 * 1024;
+        local_size_ = hololink::core::round_up(size, HUGE_PAGE_SIZE);
+        local = mmap(NULL, local_size_, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS | MAP_HUGETLB | MAP_POPULATE, -1, 0);
+        if (local == MAP_FAILED) {
+            HSB_LOG_WARN("Unable to allocate {:#x} bytes of huge pages, errno={}; using normal pages.", local_size_, errno);
+        }
+    }
+    if (local == MAP_FAILED) {
+        local_size_ = size;
+        local = mmap(NULL, local_size_, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS | MAP_POPULATE, -1, 0);
+        if (local == MAP_FAILED) {
+            throw std::runtime_error(fmt::format("mmap failed for size={:#x}, errno={}.", local_size_, errno));
+        }
+    }
+    local_ = static_cast<uint8_t*>(local);
+}
+
+void LinuxCoeReceiver::free_local()
+{
+    if (!host_memory_) {
+        CUresult cu_result = cuMemFreeHost((void*)(local_));
+        if (cu_result != CUDA_SUCCESS) {
+            HSB_LOG_ERROR("cuMemFreeHost failed, cu_result={}", cu_result);
+            return;
+        }
+    } else if (munmap(local_, local_size_) != 0) {
+        HSB_LOG_ERROR("munmap failed, errno={}", errno);
+        return;
+    }
+    local_ = NULL;
+    local_size_ = 0;
 }
 
 void LinuxCoeReceiver::run()
@@ -122,31 +254,87 @@ void LinuxCoeReceiver::run()
     core::NvtxTrace::setThreadName("linux_coe_receiver");
 
     // Round the buffer size up so that the next buffer starts on a 128-byte boundary.
-    size_t buffer_size = hololink::core::round_up(cu_buffer_size_, 128);
-    // Allocate three pages, details below
-    CUresult cu_result = cuMemHostAlloc((void**)(&local_), buffer_size * 3, CU_MEMHOSTALLOC_WRITECOMBINED);
-    if (cu_result != CUDA_SUCCESS) {
-        throw std::runtime_error(fmt::format("cuMemHostAlloc failed, cu_result={}.", cu_result));
-    }
+    buffer_size_ = hololink::core::round_up(cu_buffer_size_, 128);
+    // We need a page to receive into, pages_ to hold completed frames,
+    // and one for get_next_frame to copy from-- and with host_memory_,
+    // another pages_ for the application to hold on to.
+    unsigned descriptor_count = 2 + pages_ + (host_memory_ ? pages_ : 0);
+    allocate_local(buffer_size_ * descriptor_count);
     // Construct a descriptor for each page
-    LinuxCoeReceiverDescriptor d0(&local_[buffer_size * 0]);
-    LinuxCoeReceiverDescriptor d1(&local_[buffer_size * 1]);
-    LinuxCoeReceiverDescriptor d2(&local_[buffer_size * 2]);
-    // receiving points to the section we're currently receiving into
-    // busy_ points to the buffer that the application is using.
-    // available_ points to the last completed frame
-    LinuxCoeReceiverDescriptor* receiving = &d0;
-    busy_ = &d1;
-    available_.store(&d2);
+    std::vector<LinuxCoeReceiverDescriptor> descriptors;
+    descriptors.reserve(descriptor_count);
+    for (unsigned i = 0; i < descriptor_count; i++) {
+        descriptors.emplace_back(&local_[buffer_size_ * i]);
+    }
+    // receiving_ points to the section we're currently receiving into;
+    // signal() queues it up in completed_ and gives us a page from free_.
+    receiving_ = &descriptors[0];
+    int r = pthread_mutex_lock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
+    }
+    completed_.clear();
+    held_.clear();
+    free_.clear();
+    for (unsigned i = 1; i < descriptor_count; i++) {
+        free_.push_back(&descriptors[i]);
+    }
+    running_ = true;
+    r = pthread_mutex_unlock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
+    }
+
+    if (track_missing_) {
+        // Usually all the packets in a frame are contiguous, so
+        // this is plenty.
+        received_regions_.clear();
+        received_regions_.reserve(1024);
+    }
+    frame_count_ = 0;
+    frame_packets_received_ = 0;
+    frame_bytes_received_ = 0;
+    frame_start_ = { 0 };
+
+    // Use the memory-mapped ring if we can; otherwise fall back
+    // to fetching each packet with recv().
+    if (ring_block_count_ && start_ring()) {
+        run_ring();
+        stop_ring();
+    } else {
+        run_socket();
+    }
+
+    // Wake up anyone waiting in get_next_frame.
+    r = pthread_mutex_lock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
+    }
+    running_ = false;
+    completed_.clear();
+    held_.clear();
+    free_.clear();
+    pthread_cond_broadcast(&ready_condition_);
+    r = pthread_mutex_unlock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
+    }
+    receiving_ = NULL;
+
+    // With host_memory_, frames we handed out point into local_;
+    // the destructor frees it.
+    if (!host_memory_) {
+        free_local();
+    }
+    HSB_LOG_DEBUG("Done.");
+}
 
+void LinuxCoeReceiver::run_socket()
+{
     // Received L2 network message goes here.
     constexpr uint32_t ETHERNET_PACKET_SIZE = 10240;
     uint8_t received[ETHERNET_PACKET_SIZE];
-
-    unsigned frame_count = 0;
-    [[maybe_unused]] unsigned packet_count = 0;
-    unsigned frame_packets_received = 0, frame_bytes_received = 0;
-    struct timespec now = { 0 }, frame_start = { 0 };
+    struct timespec now = { 0 };
 
     while (true) {
         int recv_flags = 0;
@@ -173,162 +361,322 @@ void LinuxCoeReceiver::run()
             break;
         }
 
-        packet_count++;
-        frame_packets_received++;
-        if (!frame_bytes_received) {
-            frame_start = now;
-        }
+        handle_packet(received, received_bytes, now);
+    }
+}
+
+bool LinuxCoeReceiver::start_ring()
+{
+    // TPACKET_V3 delivers variable-length frames packed into blocks;
+    // the kernel hands a whole block to us at a time.
+    int version = TPACKET_V3;
+    if (setsockopt(socket_, SOL_PACKET, PACKET_VERSION, &version, sizeof(version)) < 0) {
+        HSB_LOG_WARN("setsockopt(PACKET_VERSION) failed, errno={}; falling back to recv.", errno);
+        return false;
+    }
+    struct tpacket_req3 req = {};
+    req.tp_block_size = ring_block_size_;
+    req.tp_block_nr = ring_block_count_;
+    req.tp_frame_size = TPACKET_ALIGNMENT << 7; // only used by the kernel for sanity checks
+    req.tp_frame_nr = (ring_block_size_ / req.tp_frame_size) * ring_block_count_;
+    // Don't hold on to a partially filled block any longer than this.
+    req.tp_retire_blk_tov = RING_BLOCK_TIMEOUT_MS;
+    req.tp_feature_req_word = 0;
+    if (setsockopt(socket_, SOL_PACKET, PACKET_RX_RING, &req, sizeof(req)) < 0) {
+        HSB_LOG_WARN("setsockopt(PACKET_RX_RING) failed for block_size={:#x} block_count={}, errno={}; falling back to recv.",
+            ring_block_size_, ring_block_count_, errno);
+        return false;
+    }
+    ring_size_ = static_cast<size_t>(ring_block_size_) * ring_block_count_;
+    void* ring = mmap(NULL, ring_size_, PROT_READ | PROT_WRITE, MAP_SHARED | MAP_LOCKED, socket_, 0);
+    if (ring == MAP_FAILED) {
+        HSB_LOG_WARN("mmap failed for ring_size={:#x}, errno={}; falling back to recv.", ring_size_, errno);
+        // Unconfigure the ring so that recv() sees our traffic again.
+        req = {};
+        setsockopt(socket_, SOL_PACKET, PACKET_RX_RING, &req, sizeof(req));
+        ring_size_ = 0;
+        return false;
+    }
+    ring_ = static_cast<uint8_t*>(ring);
+    ring_enabled_ = true;
+    {
+        std::lock_guard<std::mutex> lock(ring_statistics_mutex_);
+        ring_running_ = true;
+    }
+    HSB_LOG_INFO("Using TPACKET_V3 ring with block_size={:#x} block_count={}.", ring_block_size_, ring_block_count_);
+    return true;
+}
 
-        do {
-            core::Deserializer deserializer(received, received_bytes);
-            std::vector<uint8_t> destination_mac(6);
-            std::vector<uint8_t> source_mac(6);
-            uint16_t ethertype = 0;
-            constexpr uint16_t AVTP_ETHERTYPE = 0x22F0;
-            uint8_t subtype = 0;
-            constexpr uint8_t NTSCF = 0x82;
-            uint16_t ntscf_data_length = 0;
-            uint8_t sequence = 0;
-            std::vector<uint8_t> stream_id(8);
-            uint8_t acf_message_type = 0;
-            constexpr uint8_t ACF_MESSAGE_TYPE = 0x0C; // No idea what this should be called.
-            uint8_t acf_message_length = 0;
-            uint8_t reserved_1 = 0, reserved_2 = 0;
-            uint32_t timestamp_ns = 0, timestamp_sec = 0;
-            uint8_t sequence_number_c = 0;
-            uint16_t channel = 0;
-            uint8_t flags = 0;
-            [[maybe_unused]] constexpr uint32_t FRAME_START = 0x01;
-            [[maybe_unused]] constexpr uint32_t FRAME_END = 0x02;
-            [[maybe_unused]] constexpr uint32_t LINE_END = 0x04;
-            uint32_t address = 0;
-            const uint8_t* payload = 0;
-
-            // The kernel feeds us everything received here, so don't
-            // pay any mind to packets that aren't specifically a part
-            // of our stack.
-            if (!(deserializer.next_buffer(destination_mac)
-                    && deserializer.next_buffer(source_mac)
-                    && deserializer.next_uint16_be(ethertype)
-                    && (ethertype == AVTP_ETHERTYPE)
-                    && deserializer.next_uint8(subtype)
-                    && (subtype == NTSCF)
-                    && deserializer.next_uint16_be(ntscf_data_length)
-                    && deserializer.next_uint8(sequence)
-                    && deserializer.next_buffer(stream_id)
-                    && deserializer.next_uint8(acf_message_type)
-                    && (acf_message_type == ACF_MESSAGE_TYPE)
-                    && deserializer.next_uint8(acf_message_length)
-                    && deserializer.next_uint8(reserved_1)
-                    && deserializer.next_uint8(reserved_2)
-                    && deserializer.next_uint32_be(timestamp_sec)
-                    && deserializer.next_uint32_be(timestamp_ns)
-                    && deserializer.next_uint8(sequence_number_c)
-                    && deserializer.next_uint16_be(channel) // note that we check this below
-                    && deserializer.next_uint8(flags)
-                    && deserializer.next_uint32_be(address)
-                    && deserializer.pointer(payload, 0)
-                    && (deserializer.position() <= received_bytes))) {
-                // Ignore this guy.
+void LinuxCoeReceiver::run_ring()
+{
+    unsigned block_index = 0;
+    struct pollfd pfd = {};
+    pfd.fd = socket_;
+    pfd.events = POLLIN | POLLERR;
+
+    while (!exit_) {
+        auto block = reinterpret_cast<struct tpacket_block_desc*>(&ring_[block_index * ring_block_size_]);
+        if ((__atomic_load_n(&block->hdr.bh1.block_status, __ATOMIC_ACQUIRE) & TP_STATUS_USER) == 0) {
+            // Wake up periodically so that we can check exit_.
+            int r = poll(&pfd, 1, 100);
+            if ((r < 0) && (errno != EINTR)) {
+                HSB_LOG_ERROR("poll failed, errno={}", errno);
                 break;
             }
+            continue;
+        }
 
-            // NOTE that ntscv_data_length is really
-            // (sv, version (3 bits), r, and length (11 bits))
-            // per 1722-2016.pdf page 78.
-            [[maybe_unused]] uint8_t sv = (ntscf_data_length & 0x8000) >> 15;
-            [[maybe_unused]] uint8_t version = (ntscf_data_length >> 12) & 0x7;
-            [[maybe_unused]] uint8_t r = (ntscf_data_length & 0x800) >> 11;
-            ntscf_data_length &= 0x7FF;
-            // NOTE that channel is really
-            // (e, se, fcv, ver (2 bits), exposure (2 bits), reserved (3 bits), channel number (6 bits)
-            [[maybe_unused]] uint8_t e = (channel & 0x8000) >> 15; // Not clear how this is used
-            [[maybe_unused]] uint8_t se = (channel & 0x4000) >> 14; // Not clear how this is used
-            [[maybe_unused]] uint8_t fcv = (channel & 0x2000) >> 13; // Not clear how this is used
-            [[maybe_unused]] uint8_t acf_version = (channel & 0x1800) >> 11; // Not clear how this is used
-            [[maybe_unused]] uint8_t exposure = (channel & 0x600) >> 9; // Not clear how this is used
-            channel &= 0x3F;
-            // Skip traffic for other channels.
-            if (channel != channel_) {
-                continue;
-            }
-            // This has to be >= 0 due to the test above.
-            uint32_t payload_bytes = received_bytes - deserializer.position();
-            // NOTE that address is really
-            // ( frame number (4 bits), byte offset (28 bits) )
-            [[maybe_unused]] uint8_t frame_number = (address & 0xF000'0000) >> 28;
-            address &= 0xFFF'FFFF;
-
-            core::NvtxTrace::event_u64(fmt::format("address={:#x} flags={:#x} sequence_number_c={} payload_bytes={}",
-                                           address, flags, sequence_number_c, payload_bytes)
-                                           .c_str(),
-                0);
-
-            // Cache the payload data.
-            if ((address + payload_bytes) <= (cu_buffer_size_)) {
-                HSB_LOG_TRACE("address={:#x} payload_bytes={:#x} flags={:#x}", address, payload_bytes, flags);
-                memcpy(&receiving->memory_[address], payload, payload_bytes);
-                frame_bytes_received += payload_bytes;
-            } else {
-                HSB_LOG_ERROR("Ignoring contents for a packet with address={:#x} and payload_bytes={:#x}, cu_buffer_size={:#x}, flags={:#x}.", address, payload_bytes, cu_buffer_size_, flags);
-            }
+        // Walk the packets in this block in place; handle_packet
+        // copies each payload directly into the frame buffer.
+        uint32_t num_pkts = block->hdr.bh1.num_pkts;
+        auto header = reinterpret_cast<struct tpacket3_hdr*>(reinterpret_cast<uint8_t*>(block) + block->hdr.bh1.offset_to_first_pkt);
+        for (uint32_t i = 0; i < num_pkts; i++) {
+            struct timespec now;
+            now.tv_sec = header->tp_sec;
+            now.tv_nsec = header->tp_nsec;
+            const uint8_t* received = reinterpret_cast<const uint8_t*>(header) + header->tp_mac;
+            handle_packet(received, header->tp_snaplen, now);
+            header = reinterpret_cast<struct tpacket3_hdr*>(reinterpret_cast<uint8_t*>(header) + header->tp_next_offset);
+        }
+        ring_blocks_seen_++;
 
-            if (flags & FRAME_END) {
-                frame_count++;
-                core::NvtxTrace::event_u64("FRAME_END", frame_count);
-
-                // Send it
-                // - receiving now has legit data;
-                // - swap it with available_, now
-                //  available_ points to received data
-                //  and we'll continue to receive into what
-                //  was in available_ (but not consumed by
-                //  the application)
-                // - signal the pipeline so it wakes up if necessary.
-                Hololink::FrameMetadata frame_metadata = Hololink::deserialize_metadata(payload, payload_bytes);
-                LinuxCoeReceiverMetadata& metadata = receiving->metadata_;
-                metadata.frame_packets_received = frame_packets_received;
-                metadata.frame_bytes_received = frame_bytes_received;
-                metadata.received_frame_number = frame_count;
-                metadata.frame_start_s = frame_start.tv_sec;
-                metadata.frame_start_ns = frame_start.tv_nsec;
-                metadata.frame_end_s = now.tv_sec;
-                metadata.frame_end_ns = now.tv_nsec;
-                metadata.received_s = now.tv_sec;
-                metadata.received_ns = now.tv_nsec;
-                metadata.frame_metadata = frame_metadata;
-                metadata.frame_number = frame_number_.update(frame_metadata.frame_number);
-
-                receiving = available_.exchange(receiving);
-                signal();
-                // Make it easy to identify missing packets.
-                memset(receiving->memory_, 0xFF, buffer_size);
-                // Reset metadata.
-                frame_packets_received = 0;
-                frame_bytes_received = 0;
-            }
-        } while (false);
+        // Give the block back to the kernel.
+        __atomic_store_n(&block->hdr.bh1.block_status, TP_STATUS_KERNEL, __ATOMIC_RELEASE);
+        block_index = (block_index + 1) % ring_block_count_;
     }
+}
 
-    busy_ = NULL;
-    available_.store(NULL);
+void LinuxCoeReceiver::stop_ring()
+{
+    // Collect the final kernel statistics before we tear the ring down;
+    // once ring_running_ is clear, get_ring_statistics won't touch
+    // socket_, which our caller may close as soon as run() returns.
+    {
+        std::lock_guard<std::mutex> lock(ring_statistics_mutex_);
+        update_ring_statistics(lock);
+        ring_running_ = false;
+    }
+    if (ring_) {
+        munmap(ring_, ring_size_);
+        ring_ = NULL;
+        ring_size_ = 0;
+    }
+}
 
-    cu_result = cuMemFreeHost((void*)(local_));
-    if (cu_result != CUDA_SUCCESS) {
-        HSB_LOG_ERROR("cuMemFreeHost failed, cu_result={}", cu_result);
+void LinuxCoeReceiver::update_ring_statistics(std::lock_guard<std::mutex>& lock)
+{
+    if (!ring_running_) {
         return;
     }
-    local_ = NULL;
-    HSB_LOG_DEBUG("Done.");
+    // Note that reading PACKET_STATISTICS resets the kernel's counters,
+    // so we accumulate them here.
+    struct tpacket_stats_v3 stats = {};
+    socklen_t stats_len = sizeof(stats);
+    if (getsockopt(socket_, SOL_PACKET, PACKET_STATISTICS, &stats, &stats_len) < 0) {
+        HSB_LOG_ERROR("getsockopt(PACKET_STATISTICS) failed, errno={}", errno);
+        return;
+    }
+    ring_kernel_packets_ += stats.tp_packets;
+    ring_kernel_drops_ += stats.tp_drops;
+    ring_freeze_count_ += stats.tp_freeze_q_cnt;
+}
+
+LinuxCoeReceiverRingStatistics LinuxCoeReceiver::get_ring_statistics()
+{
+    std::lock_guard<std::mutex> lock(ring_statistics_mutex_);
+    update_ring_statistics(lock);
+    LinuxCoeReceiverRingStatistics r;
+    r.ring_enabled = ring_enabled_;
+    r.block_size = ring_block_size_;
+    r.block_count = ring_block_count_;
+    r.blocks_seen = ring_blocks_seen_;
+    r.kernel_packets = ring_kernel_packets_;
+    r.kernel_drops = ring_kernel_drops_;
+    r.freeze_count = ring_freeze_count_;
+    return r;
+}
+
+void LinuxCoeReceiver::handle_packet(const uint8_t* received, size_t received_bytes, const struct timespec& now)
+{
+    frame_packets_received_++;
+    if (!frame_bytes_received_) {
+        frame_start_ = now;
+    }
+
+    core::Deserializer deserializer(received, received_bytes);
+    std::vector<uint8_t> destination_mac(6);
+    std::vector<uint8_t> source_mac(6);
+    uint16_t ethertype = 0;
+    constexpr uint16_t AVTP_ETHERTYPE = 0x22F0;
+    uint8_t subtype = 0;
+    constexpr uint8_t NTSCF = 0x82;
+    uint16_t ntscf_data_length = 0;
+    uint8_t sequence = 0;
+    std::vector<uint8_t> stream_id(8);
+    uint8_t acf_message_type = 0;
+    constexpr uint8_t ACF_MESSAGE_TYPE = 0x0C; // No idea what this should be called.
+    uint8_t acf_message_length = 0;
+    uint8_t reserved_1 = 0, reserved_2 = 0;
+    uint32_t timestamp_ns = 0, timestamp_sec = 0;
+    uint8_t sequence_number_c = 0;
+    uint16_t channel = 0;
+    uint8_t flags = 0;
+    [[maybe_unused]] constexpr uint32_t FRAME_START = 0x01;
+    [[maybe_unused]] constexpr uint32_t FRAME_END = 0x02;
+    [[maybe_unused]] constexpr uint32_t LINE_END = 0x04;
+    uint32_t address = 0;
+    const uint8_t* payload = 0;
+
+    // The kernel feeds us everything received here, so don't
+    // pay any mind to packets that aren't specifically a part
+    // of our stack.
+    if (!(deserializer.next_buffer(destination_mac)
+            && deserializer.next_buffer(source_mac)
+            && deserializer.next_uint16_be(ethertype)
+            && (ethertype == AVTP_ETHERTYPE)
+            && deserializer.next_uint8(subtype)
+            && (subtype == NTSCF)
+            && deserializer.next_uint16_be(ntscf_data_length)
+            && deserializer.next_uint8(sequence)
+            && deserializer.next_buffer(stream_id)
+            && deserializer.next_uint8(acf_message_type)
+            && (acf_message_type == ACF_MESSAGE_TYPE)
+            && deserializer.next_uint8(acf_message_length)
+            && deserializer.next_uint8(reserved_1)
+            && deserializer.next_uint8(reserved_2)
+            && deserializer.next_uint32_be(timestamp_sec)
+            && deserializer.next_uint32_be(timestamp_ns)
+            && deserializer.next_uint8(sequence_number_c)
+            && deserializer.next_uint16_be(channel) // note that we check this below
+            && deserializer.next_uint8(flags)
+            && deserializer.next_uint32_be(address)
+            && deserializer.pointer(payload, 0)
+            && (deserializer.position() <= received_bytes))) {
+        // Ignore this guy.
+        return;
+    }
+
+    // NOTE that ntscv_data_length is really
+    // (sv, version (3 bits), r, and length (11 bits))
+    // per 1722-2016.pdf page 78.
+    [[maybe_unused]] uint8_t sv = (ntscf_data_length & 0x8000) >> 15;
+    [[maybe_unused]] uint8_t version = (ntscf_data_length >> 12) & 0x7;
+    [[maybe_unused]] uint8_t r = (ntscf_data_length & 0x800) >> 11;
+    ntscf_data_length &= 0x7FF;
+    // NOTE that channel is really
+    // (e, se, fcv, ver (2 bits), exposure (2 bits), reserved (3 bits), channel number (6 bits)
+    [[maybe_unused]] uint8_t e = (channel & 0x8000) >> 15; // Not clear how this is used
+    [[maybe_unused]] uint8_t se = (channel & 0x4000) >> 14; // Not clear how this is used
+    [[maybe_unused]] uint8_t fcv = (channel & 0x2000) >> 13; // Not clear how this is used
+    [[maybe_unused]] uint8_t acf_version = (channel & 0x1800) >> 11; // Not clear how this is used
+    [[maybe_unused]] uint8_t exposure = (channel & 0x600) >> 9; // Not clear how this is used
+    channel &= 0x3F;
+    // Skip traffic for other channels.
+    if (channel != channel_) {
+        return;
+    }
+    telemetry_->add(core::ReceiverTelemetry::PACKETS_RECEIVED);
+    telemetry_->add(core::ReceiverTelemetry::BYTES_RECEIVED, received_bytes);
+    // This has to be >= 0 due to the test above.
+    uint32_t payload_bytes = received_bytes - deserializer.position();
+    // NOTE that address is really
+    // ( frame number (4 bits), byte offset (28 bits) )
+    [[maybe_unused]] uint8_t frame_number = (address & 0xF000'0000) >> 28;
+    address &= 0xFFF'FFFF;
+
+    core::NvtxTrace::event_u64(fmt::format("address={:#x} flags={:#x} sequence_number_c={} payload_bytes={}",
+                                   address, flags, sequence_number_c, payload_bytes)
+                                   .c_str(),
+        0);
+
+    // Cache the payload data.
+    if ((address + payload_bytes) <= (cu_buffer_size_)) {
+        HSB_LOG_TRACE("address={:#x} payload_bytes={:#x} flags={:#x}", address, payload_bytes, flags);
+        memcpy(&receiving_->memory_[address], payload, payload_bytes);
+        frame_bytes_received_ += payload_bytes;
+        if (track_missing_) {
+            if (!received_regions_.empty() && (received_regions_.back().second == address)) {
+                received_regions_.back().second += payload_bytes;
+            } else {
+                received_regions_.emplace_back(address, address + payload_bytes);
+            }
+        }
+    } else {
+        HSB_LOG_ERROR("Ignoring contents for a packet with address={:#x} and payload_bytes={:#x}, cu_buffer_size={:#x}, flags={:#x}.", address, payload_bytes, cu_buffer_size_, flags);
+    }
+
+    if (flags & FRAME_END) {
+        frame_count_++;
+        core::NvtxTrace::event_u64("FRAME_END", frame_count_);
+
+        // Send it
+        // - receiving now has legit data;
+        // - queue it up for get_next_frame; if the ring
+        //  is full, the oldest frame is discarded
+        // - signal the pipeline so it wakes up if necessary
+        // - continue receiving into a free page.
+        Hololink::FrameMetadata frame_metadata = Hololink::deserialize_metadata(payload, payload_bytes);
+        LinuxCoeReceiverMetadata& metadata = receiving_->metadata_;
+        metadata.frame_packets_received = frame_packets_received_;
+        metadata.frame_bytes_received = frame_bytes_received_;
+        metadata.received_frame_number = frame_count_;
+        metadata.frame_start_s = frame_start_.tv_sec;
+        metadata.frame_start_ns = frame_start_.tv_nsec;
+        metadata.frame_end_s = now.tv_sec;
+        metadata.frame_end_ns = now.tv_nsec;
+        metadata.received_s = now.tv_sec;
+        metadata.received_ns = now.tv_nsec;
+        metadata.frame_metadata = frame_metadata;
+        metadata.frame_number = frame_number_.update(frame_metadata.frame_number);
+        if (track_missing_) {
+            // The frame data is everything before the metadata.
+            uint64_t frame_size = std::min<uint64_t>(address, cu_buffer_size_);
+            metadata.missing_bytes = find_missing_regions(received_regions_, frame_size, metadata.missing_regions);
+            if (fill_missing_) {
+                for (auto& [missing_offset, missing_length] : metadata.missing_regions) {
+                    memset(&receiving_->memory_[missing_offset], 0xFF, missing_length);
+                }
+            }
+            received_regions_.clear();
+        }
+
+        telemetry_->record(core::ReceiverTelemetry::FRAME_ASSEMBLY, frame_start_, now);
+        receiving_ = signal(receiving_);
+        struct timespec signalled;
+        clock_gettime(CLOCK_REALTIME, &signalled);
+        telemetry_->record(core::ReceiverTelemetry::FRAME_LATENCY, frame_start_, signalled);
+        telemetry_->add(core::ReceiverTelemetry::FRAMES_RECEIVED);
+        if (!track_missing_) {
+            // Make it easy to identify missing packets.
+            memset(receiving_->memory_, 0xFF, buffer_size_);
+        }
+        // Reset metadata.
+        frame_packets_received_ = 0;
+        frame_bytes_received_ = 0;
+    }
 }
 
-void LinuxCoeReceiver::signal()
+LinuxCoeReceiverDescriptor* LinuxCoeReceiver::signal(LinuxCoeReceiverDescriptor* receiving)
 {
     int r = pthread_mutex_lock(&ready_mutex_);
     if (r != 0) {
         throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
     }
-    ready_ = true;
+    completed_.push_back(receiving);
+    // If the application isn't keeping up, drop the oldest frame.
+    if (completed_.size() > pages_) {
+        free_.push_back(completed_.front());
+        completed_.pop_front();
+        overwrites_++;
+        core::NvtxTrace::event_u64("ring_overwrites", overwrites_);
+        telemetry_->add(core::ReceiverTelemetry::FRAMES_DROPPED);
+    }
+    // There are pages_ + 2 descriptors (2 * pages_ + 2 with
+    // host_memory_); at most pages_ are in completed_, one is used by
+    // get_next_frame and, with host_memory_, pages_ are in held_, so
+    // free_ can't be empty here.
+    LinuxCoeReceiverDescriptor* next = free_.back();
+    free_.pop_back();
     r = pthread_cond_signal(&ready_condition_);
     if (r != 0) {
         throw std::runtime_error(fmt::format("pthread_cond_signal returned r={}.", r));
@@ -340,43 +688,103 @@ void LinuxCoeReceiver::signal()
     // Provide the local callback, letting the application know
     // that get_next_frame won't block.
     frame_ready_(this[0]);
+    return next;
 }
 
-bool LinuxCoeReceiver::get_next_frame(unsigned timeout_ms, LinuxCoeReceiverMetadata& metadata)
+void LinuxCoeReceiver::release(LinuxCoeReceiverDescriptor* descriptor)
 {
-    bool r = wait(timeout_ms);
-    if (r) {
-        busy_ = available_.exchange(busy_);
-        if (busy_) {
-            // Because we're setting up the next frame of data for
-            // pipeline processing, we can allow this memcpy to overlap
-            // with other GPU work-- we just make sure that this copy is done
-            // (with the cuStreamSynchronize below) to ensure that this memcpy
-            // finishes before the pipeline uses the destination buffer.
-            // Without this, it'd use the device stream instance which would
-            // wait until the device was completely idle.
-            CUresult cu_result = cuMemcpyHtoDAsync(cu_buffer_, busy_->memory_, cu_buffer_size_, cu_stream_);
-            if (cu_result != CUDA_SUCCESS) {
-                HSB_LOG_ERROR("cuMemcpyHtoDAsync failed, cu_result={}", cu_result);
-                r = false;
-            } else {
-                cu_result = cuStreamSynchronize(cu_stream_);
-                if (cu_result != CUDA_SUCCESS) {
-                    HSB_LOG_ERROR("cuStreamSynchronize failed, cu_result={}", cu_result);
-                    r = false;
-                }
+    int r = pthread_mutex_lock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
+    }
+    // If run() exited, free_ is no longer in use.
+    if (running_) {
+        if (host_memory_) {
+            // The application may still be using the last pages_
+            // frames we gave it.
+            held_.push_back(descriptor);
+            if (held_.size() > pages_) {
+                free_.push_back(held_.front());
+                held_.pop_front();
             }
-            metadata = busy_->metadata_;
         } else {
-            // run() exited.
-            HSB_LOG_ERROR("get_next_frame failed, receiver has terminated.");
+            free_.push_back(descriptor);
+        }
+    }
+    r = pthread_mutex_unlock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
+    }
+}
+
+bool LinuxCoeReceiver::get_next_frame(unsigned timeout_ms, LinuxCoeReceiverMetadata& metadata)
+{
+    unsigned ring_occupancy = 0;
+    uint64_t ring_overwrites = 0;
+    struct timespec start, end;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    LinuxCoeReceiverDescriptor* busy = wait(timeout_ms, ring_occupancy, ring_overwrites);
+    if (!busy) {
+        telemetry_->add(core::ReceiverTelemetry::TIMEOUTS);
+        return false;
+    }
+    clock_gettime(CLOCK_MONOTONIC, &end);
+    telemetry_->record(core::ReceiverTelemetry::FRAME_WAIT, start, end);
+    telemetry_->add(core::ReceiverTelemetry::FRAMES_DELIVERED);
+    // Each frame goes to the next page in turn, so the application can
+    // continue to use the last pages_-1 frames we've handed out.
+    unsigned page = next_page_;
+    next_page_ = (next_page_ + 1) % pages_;
+    metadata = busy->metadata_;
+    metadata.page = page;
+    metadata.ring_occupancy = ring_occupancy;
+    metadata.ring_overwrites = ring_overwrites;
+    if (host_memory_) {
+        // Just hand the application our buffer.
+        metadata.frame_memory = reinterpret_cast<CUdeviceptr>(busy->memory_);
+        release(busy);
+        return true;
+    }
+    CUdeviceptr frame_memory = cu_buffer_ + cu_page_size_ * page;
+    metadata.frame_memory = frame_memory;
+    bool r = true;
+    // Because we're setting up the next frame of data for
+    // pipeline processing, we can allow this memcpy to overlap
+    // with other GPU work-- we just make sure that this copy is done
+    // (with the cuStreamSynchronize below) to ensure that this memcpy
+    // finishes before the pipeline uses the destination buffer.
+    // Without this, it'd use the device stream instance which would
+    // wait until the device was completely idle.
+    CUresult cu_result = cuMemcpyHtoDAsync(frame_memory, busy->memory_, cu_buffer_size_, cu_stream_);
+    if (cu_result != CUDA_SUCCESS) {
+        HSB_LOG_ERROR("cuMemcpyHtoDAsync failed, cu_result={}", cu_result);
+        r = false;
+    } else {
+        cu_result = cuStreamSynchronize(cu_stream_);
+        if (cu_result != CUDA_SUCCESS) {
+            HSB_LOG_ERROR("cuStreamSynchronize failed, cu_result={}", cu_result);
             r = false;
         }
     }
+    release(busy);
+    return r;
+}
+
+unsigned LinuxCoeReceiver::frames_pending()
+{
+    int status = pthread_mutex_lock(&ready_mutex_);
+    if (status != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned status={}.", status));
+    }
+    unsigned r = completed_.size();
+    status = pthread_mutex_unlock(&ready_mutex_);
+    if (status != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned status={}.", status));
+    }
     return r;
 }
 
-bool LinuxCoeReceiver::wait(unsigned timeout_ms)
+LinuxCoeReceiverDescriptor* LinuxCoeReceiver::wait(unsigned timeout_ms, unsigned& ring_occupancy, uint64_t& ring_overwrites)
 {
     int status = pthread_mutex_lock(&ready_mutex_);
     if (status != 0) {
@@ -388,7 +796,7 @@ bool LinuxCoeReceiver::wait(unsigned timeout_ms)
     }
     struct timespec timeout = add_ms(now, timeout_ms);
 
-    while (!ready_) {
+    while (completed_.empty()) {
         status = pthread_cond_timedwait(&ready_condition_, &ready_mutex_, &timeout);
         if (status == ETIMEDOUT) {
             break;
@@ -397,9 +805,19 @@ bool LinuxCoeReceiver::wait(unsigned timeout_ms)
             HSB_LOG_ERROR("pthread_cond_wait returned status={}", status);
             break;
         }
+        if (!running_) {
+            // run() exited.
+            HSB_LOG_ERROR("get_next_frame failed, receiver has terminated.");
+            break;
+        }
+    }
+    LinuxCoeReceiverDescriptor* r = NULL;
+    if (!completed_.empty()) {
+        r = completed_.front();
+        completed_.pop_front();
     }
-    bool r = ready_;
-    ready_ = false;
+    ring_occupancy = completed_.size();
+    ring_overwrites = overwrites_;
     status = pthread_mutex_unlock(&ready_mutex_);
     if (status != 0) {
         throw std::runtime_error(fmt::format("pthread_mutex_unlock returned status={}.", status));
@@ -21,12 +21,18 @@
 #define SRC_HOLOLINK_OPERATORS_LINUX_RECEIVER_LINUX_COE_RECEIVER
 
 #include <atomic>
+#include <deque>
+#include <memory>
+#include <mutex>
 #include <semaphore.h>
 #include <stdint.h>
+#include <utility>
+#include <vector>
 
 #include <cuda.h>
 
 #include <hololink/core/hololink.hpp>
+#include <hololink/core/telemetry.hpp>
 
 namespace hololink::operators {
 
@@ -45,6 +51,37 @@ public:
     // Data received directly from HSB.
     Hololink::FrameMetadata frame_metadata;
     uint32_t frame_number = 0; // 32-bit extended version of the 16-bit frame_metadata.frame_number
+    // Which page of cu_buffer holds this frame; with host_memory,
+    // frame_memory is the address of the receiver's host buffer.
+    unsigned page = 0;
+    CUdeviceptr frame_memory = 0;
+    // Completed frames still waiting in the ring after this one
+    unsigned ring_occupancy = 0;
+    // Completed frames discarded, over the life of the application,
+    // because the ring was full
+    uint64_t ring_overwrites = 0;
+    // With track_missing, the (offset, length) of each region of
+    // the frame that we didn't receive, and the total of those lengths.
+    std::vector<std::pair<uint64_t, uint64_t>> missing_regions;
+    uint64_t missing_bytes = 0;
+};
+
+/**
+ * Statistics for the TPACKET_V3 receive ring; use these
+ * to size ring_block_size and ring_block_count.
+ */
+class LinuxCoeReceiverRingStatistics {
+public:
+    // True if the memory-mapped ring is in use (vs. the recv fallback)
+    bool ring_enabled = false;
+    unsigned block_size = 0;
+    unsigned block_count = 0;
+    // Number of kernel-filled blocks we've processed
+    uint64_t blocks_seen = 0;
+    // Accumulated from PACKET_STATISTICS
+    uint64_t kernel_packets = 0;
+    uint64_t kernel_drops = 0;
+    uint64_t freeze_count = 0;
 };
 
 class LinuxCoeReceiverDescriptor;
@@ -66,10 +103,47 @@ class LinuxCoeReceiverDescriptor;
  */
 class LinuxCoeReceiver {
 public:
+    /**
+     * @param ring_block_size, ring_block_count: when ring_block_count
+     * is nonzero, receive via a memory-mapped TPACKET_V3 ring of
+     * ring_block_count blocks, each ring_block_size bytes (a multiple
+     * of the system page size).  If the kernel refuses the ring
+     * configuration, we fall back to recv().
+     * @param pages is the number of completed frames we'll queue
+     * for get_next_frame; cu_buffer must have room for this many
+     * pages, each cu_page_size bytes apart.  get_next_frame writes
+     * each frame into the next page in turn, so the application can
+     * hold on to a frame until pages-1 more frames are fetched.
+     * @param cu_page_size is the distance between pages in cu_buffer;
+     * 0 uses cu_buffer_size.
+     * @param track_missing if false, the whole receive buffer is set
+     * to 0xFF before each frame is received into it; if true, we
+     * instead keep track of which regions of the frame (up to the
+     * metadata) were received, and report the rest in the metadata
+     * (missing_regions).
+     * @param fill_missing with track_missing, set just the missing
+     * regions to 0xFF; otherwise they're left with whatever data
+     * was there before.
+     * @param host_memory if true, no CUDA calls are made: frames are
+     * received into host memory owned by this object, and
+     * get_next_frame returns that address (in metadata.frame_memory)
+     * instead of copying the frame into cu_buffer, which is unused.
+     * That memory remains valid until pages more frames are fetched.
+     * @param huge_pages with host_memory, try to back the receive
+     * buffers with huge pages, falling back to normal pages.
+     */
     LinuxCoeReceiver(CUdeviceptr cu_buffer,
         size_t cu_buffer_size,
         int socket,
-        uint16_t channel);
+        uint16_t channel,
+        unsigned ring_block_size = 0,
+        unsigned ring_block_count = 0,
+        unsigned pages = 1,
+        size_t cu_page_size = 0,
+        bool track_missing = false,
+        bool fill_missing = true,
+        bool host_memory = false,
+        bool huge_pages = false);
 
     ~LinuxCoeReceiver();
 
@@ -86,7 +160,8 @@ public:
     void close();
 
     /**
-     * Block until the next complete frame arrives.
+     * Block until the next complete frame arrives; if
+     * more than one frame is waiting, fetch the oldest one.
      * @returns false if timeout_ms elapses before
      * the complete frame is observed.
      * @param metadata is updated with statistics
@@ -94,20 +169,69 @@ public:
      */
     bool get_next_frame(unsigned timeout_ms, LinuxCoeReceiverMetadata& metadata);
 
+    /**
+     * @returns the number of completed frames that
+     * get_next_frame can fetch without blocking.
+     */
+    unsigned frames_pending();
+
+    unsigned get_pages() { return pages_; };
+
+    bool get_host_memory() { return host_memory_; };
+
     /**
      * If the application schedules the call to get_next_frame after this
      * callback occurs, then get_next_frame won't block.
      */
     void set_frame_ready(std::function<void(const LinuxCoeReceiver&)> frame_ready);
 
+    /**
+     * Fetch the receive ring statistics; safe to call from
+     * any thread.
+     */
+    LinuxCoeReceiverRingStatistics get_ring_statistics();
+
+    /**
+     * Counters and timing histograms for this receiver, also published
+     * in shared memory and by TelemetryServer.
+     */
+    std::shared_ptr<core::ReceiverTelemetry> get_telemetry() { return telemetry_; };
+
 protected:
-    // Blocks execution until signal() is called;
-    // @returns false if timeout_ms elapses before
-    // signal is observed.
-    bool wait(unsigned timeout_ms);
+    // Receive loop using recv() for each packet.
+    void run_socket();
+
+    // Receive loop walking the TPACKET_V3 ring.
+    void run_ring();
+
+    // Configure and map the TPACKET_V3 ring; returns false
+    // if the kernel doesn't accept our configuration.
+    bool start_ring();
+    void stop_ring();
+    // Caller holds ring_statistics_mutex_.
+    void update_ring_statistics(std::lock_guard<std::mutex>& lock);
+
+    // Decode one 1722 packet and copy its payload into receiving_.
+    void handle_packet(const uint8_t* received, size_t received_bytes, const struct timespec& now);
 
-    // Pass a message to wait() telling it to wake up.
-    void signal();
+    // Blocks execution until a completed frame is available;
+    // @returns that (oldest) frame, or NULL if timeout_ms
+    // elapses first or the receiver has terminated.
+    LinuxCoeReceiverDescriptor* wait(unsigned timeout_ms, unsigned& ring_occupancy, uint64_t& ring_overwrites);
+
+    // Queue up the completed frame in receiving, wake up
+    // wait(), and return the descriptor to receive the
+    // next frame into.
+    LinuxCoeReceiverDescriptor* signal(LinuxCoeReceiverDescriptor* receiving);
+
+    // Return a descriptor fetched with wait() to the free list;
+    // with host_memory_, the descriptor is held until pages_
+    // more are released.
+    void release(LinuxCoeReceiverDescriptor* descriptor);
+
+    // Allocate and free local_.
+    void allocate_local(size_t size);
+    void free_local();
 
 protected:
     /**
@@ -117,6 +241,31 @@ protected:
     CUdeviceptr cu_buffer_;
     size_t cu_buffer_size_;
 
+    /**
+     * How many completed frames we queue up, and the
+     * distance between the pages in cu_buffer_ that
+     * get_next_frame writes them to.
+     */
+    unsigned pages_;
+    size_t cu_page_size_;
+
+    /**
+     * With track_missing_, received_regions_ lists the [start, end)
+     * of each region received in the current frame instead of
+     * clearing each receive buffer before use; only used by the
+     * receiver thread.
+     */
+    bool track_missing_;
+    bool fill_missing_;
+    std::vector<std::pair<uint64_t, uint64_t>> received_regions_;
+
+    /**
+     * With host_memory_, local_ is plain host memory that we hand
+     * directly to the application.
+     */
+    bool host_memory_;
+    bool huge_pages_;
+
     /**
      * Socket fd where our received packets can be found.
      */
@@ -128,11 +277,32 @@ protected:
     uint16_t channel_;
 
     /**
-     * Works with ready_mutex_ and ready_condition_
-     * to notify callers blocked in get_next_frame
-     * to wake up.
+     * TPACKET_V3 ring configuration; ring_block_count_
+     * of 0 means to use recv() instead.
      */
-    std::atomic<bool> ready_;
+    unsigned ring_block_size_;
+    unsigned ring_block_count_;
+    uint8_t* ring_ = nullptr;
+    size_t ring_size_ = 0;
+    // ring_enabled_ records that we used the ring; ring_running_
+    // is true only while the ring is mapped, and is protected by
+    // ring_statistics_mutex_.
+    std::atomic<bool> ring_enabled_ { false };
+    bool ring_running_ = false;
+    static constexpr unsigned RING_BLOCK_TIMEOUT_MS = 1;
+
+    /** Protects the accumulated ring statistics. */
+    std::mutex ring_statistics_mutex_;
+    std::atomic<uint64_t> ring_blocks_seen_ { 0 };
+    uint64_t ring_kernel_packets_ = 0;
+    uint64_t ring_kernel_drops_ = 0;
+    uint64_t ring_freeze_count_ = 0;
+
+    /**
+     * True while run() is executing; protected
+     * by ready_mutex_.
+     */
+    bool running_;
 
     /** Flag tells the background thread to terminate. */
     std::atomic<bool> exit_;
@@ -146,24 +316,57 @@ protected:
 
     /**
      * get_next_frame waits on this condition variable
-     * until a frame is pointed to by `available_`.
+     * until a frame is queued in `completed_`.
      */
     pthread_cond_t ready_condition_;
 
     /** Points to the host memory where we cache our received data. */
     uint8_t* local_;
 
+    /** Total size of local_. */
+    size_t local_size_;
+
+    /** Size of each of the pages in local_. */
+    size_t buffer_size_;
+
+    /**
+     * The page we're currently receiving into; only
+     * used by the receiver thread.
+     */
+    LinuxCoeReceiverDescriptor* receiving_;
+
     /**
-     * This points to the last received data buffer, or null,
-     * if get_next_frame was called and we haven't received
-     * our next complete data frame yet.
+     * With host_memory_, frames handed to the application, oldest
+     * first; protected by ready_mutex_.
      */
-    std::atomic<LinuxCoeReceiverDescriptor*> available_;
+    std::deque<LinuxCoeReceiverDescriptor*> held_;
+
+    /** Per-frame accounting, only used by the receiver thread. */
+    unsigned frame_count_ = 0;
+    unsigned frame_packets_received_ = 0;
+    unsigned frame_bytes_received_ = 0;
+    struct timespec frame_start_ = { 0 };
 
     /**
-     * Which buffer is used by the application?  May be null.
+     * Completed frames, oldest first, waiting for get_next_frame;
+     * protected by ready_mutex_.
      */
-    LinuxCoeReceiverDescriptor* busy_;
+    std::deque<LinuxCoeReceiverDescriptor*> completed_;
+
+    /**
+     * Pages the receiver thread can receive into next;
+     * protected by ready_mutex_.
+     */
+    std::vector<LinuxCoeReceiverDescriptor*> free_;
+
+    /**
+     * Count of completed frames discarded because the
+     * application didn't keep up; protected by ready_mutex_.
+     */
+    uint64_t overwrites_;
+
+    /** Next page in cu_buffer_ written by get_next_frame. */
+    unsigned next_page_;
 
     /**
      * This stream allows us to copy our receiver cache
@@ -182,6 +385,12 @@ protected:
 
     /** Sign-extended frame_number value. */
     ExtendedCounter<uint32_t, uint16_t> frame_number_;
+
+    /**
+     * Packet and frame values are written by the receiver thread;
+     * the get_next_frame values by the application thread.
+     */
+    std::shared_ptr<core::ReceiverTelemetry> telemetry_;
 };
 
 } // namespace hololink::operators
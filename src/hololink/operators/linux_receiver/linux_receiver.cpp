@@ -19,6 +19,7 @@
 
 #include "linux_receiver.hpp"
 
+#include <algorithm>
 #include <alloca.h>
 #include <chrono>
 #include <errno.h>
@@ -26,9 +27,11 @@
 #include <pthread.h>
 #include <stdio.h>
 #include <string.h>
+#include <sys/mman.h>
 #include <sys/socket.h>
 #include <sys/types.h>
 #include <unistd.h>
+#include <vector>
 
 #include <infiniband/opcode.h>
 
@@ -60,6 +63,37 @@ static inline struct timespec add_ms(struct timespec& ts, unsigned long ms)
     return r;
 }
 
+// Given the [start, end) regions received, fill in missing with the
+// (offset, length) of each gap in [0, size); returns the total
+// number of bytes missing.
+static uint64_t find_missing_regions(std::vector<std::pair<uint64_t, uint64_t>>& received,
+    uint64_t size, std::vector<std::pair<uint64_t, uint64_t>>& missing)
+{
+    missing.clear();
+    // Packets usually arrive in order, in which case this is cheap.
+    if (!std::is_sorted(received.begin(), received.end())) {
+        std::sort(received.begin(), received.end());
+    }
+    uint64_t r = 0;
+    uint64_t cursor = 0;
+    for (auto& [start, end] : received) {
+        if (cursor >= size) {
+            break;
+        }
+        if (start > cursor) {
+            uint64_t length = std::min(start, size) - cursor;
+            missing.emplace_back(cursor, length);
+            r += length;
+        }
+        cursor = std::max(cursor, end);
+    }
+    if (cursor < size) {
+        missing.emplace_back(cursor, size - cursor);
+        r += size - cursor;
+    }
+    return r;
+}
+
 class LinuxReceiverDescriptor {
 public:
     LinuxReceiverDescriptor(uint8_t* memory)
@@ -74,24 +108,53 @@ public:
 LinuxReceiver::LinuxReceiver(CUdeviceptr cu_buffer,
     size_t cu_buffer_size,
     int socket,
-    uint64_t received_address_offset)
+    uint64_t received_address_offset,
+    unsigned batch_size,
+    bool kernel_timestamps,
+    unsigned pages,
+    size_t cu_page_size,
+    bool track_missing,
+    bool fill_missing,
+    bool host_memory,
+    bool huge_pages)
     : cu_buffer_(cu_buffer)
     , cu_buffer_size_(cu_buffer_size)
     , socket_(socket)
     , received_address_offset_(received_address_offset)
-    , ready_(false)
+    , batch_size_(batch_size ? batch_size : 1)
+    , kernel_timestamps_(kernel_timestamps)
+    , pages_(pages)
+    , cu_page_size_(cu_page_size ? cu_page_size : cu_buffer_size)
+    , track_missing_(track_missing)
+    , fill_missing_(fill_missing)
+    , host_memory_(host_memory)
+    , huge_pages_(huge_pages)
+    , received_regions_()
+    , running_(false)
     , exit_(false)
     , ready_mutex_(PTHREAD_MUTEX_INITIALIZER)
     , ready_condition_(PTHREAD_COND_INITIALIZER)
     , qp_number_(0xCAFE)
     , rkey_(0xBEEF)
     , local_(NULL)
-    , available_(NULL)
-    , busy_(NULL)
+    , local_size_(0)
+    , held_()
+    , completed_()
+    , free_()
+    , overwrites_(0)
+    , next_page_(0)
     , cu_stream_(0)
     , frame_ready_([](const LinuxReceiver&) {})
     , frame_number_()
+    , telemetry_(core::ReceiverTelemetry::create("linux_receiver"))
 {
+    if (pages_ == 0) {
+        throw std::runtime_error("pages must be at least 1.");
+    }
+    if (cu_page_size_ < cu_buffer_size_) {
+        throw std::runtime_error(fmt::format("cu_page_size={:#x} is smaller than cu_buffer_size={:#x}.", cu_page_size_, cu_buffer_size_));
+    }
+
     int r = pthread_mutex_init(&ready_mutex_, NULL);
     if (r != 0) {
         throw std::runtime_error("pthread_mutex_init failed.");
@@ -113,18 +176,84 @@ LinuxReceiver::LinuxReceiver(CUdeviceptr cu_buffer,
         throw std::runtime_error(fmt::format("setsockopt failed errno={}", errno));
     }
 
+    // Have the kernel timestamp each packet as it arrives; run() fetches
+    // these from the control message that accompanies each datagram.
+    if (kernel_timestamps_) {
+        int enable = 1;
+        if (setsockopt(socket_, SOL_SOCKET, SO_TIMESTAMPNS, &enable, sizeof(enable)) < 0) {
+            throw std::runtime_error(fmt::format("setsockopt(SO_TIMESTAMPNS) failed errno={}", errno));
+        }
+    }
+
     // See get_next_frame.
-    CUresult cu_result = cuStreamCreate(&cu_stream_, CU_STREAM_NON_BLOCKING);
-    if (cu_result != CUDA_SUCCESS) {
-        throw std::runtime_error(fmt::format("cuStreamCreate failed, cu_result={}.", cu_result));
+    if (!host_memory_) {
+        CUresult cu_result = cuStreamCreate(&cu_stream_, CU_STREAM_NON_BLOCKING);
+        if (cu_result != CUDA_SUCCESS) {
+            throw std::runtime_error(fmt::format("cuStreamCreate failed, cu_result={}.", cu_result));
+        }
     }
 }
 
 LinuxReceiver::~LinuxReceiver()
 {
+    // With host_memory_, run() leaves local_ for us to free, because
+    // the application may still have frames that point into it.
+    if (local_) {
+        free_local();
+    }
     pthread_cond_destroy(&ready_condition_);
     pthread_mutex_destroy(&ready_mutex_);
-    cuStreamDestroy(cu_stream_);
+    if (cu_stream_) {
+        cuStreamDestroy(cu_stream_);
+    }
+}
+
+void LinuxReceiver::allocate_local(size_t size)
+{
+    if (!host_memory_) {
+        // Write-combined memory is fast for cuMemcpyHtoDAsync to read.
+        CUresult cu_result = cuMemHostAlloc((void**)(&local_), size, CU_MEMHOSTALLOC_WRITECOMBINED);
+        if (cu_result != CUDA_SUCCESS) {
+            throw std::runtime_error(fmt::format("cuMemHostAlloc failed, cu_result={}.", cu_result));
+        }
+        local_size_ = size;
+        return;
+    }
+    // The application reads this memory directly, so use
+    // ordinary cached pages.
+    void* local = MAP_FAILED;
+    if (huge_pages_) {
+        constexpr size_t HUGE_PAGE_SIZE = 2 * 1024 * 1024;
+        local_size_ = hololink::core::round_up(size, HUGE_PAGE_SIZE);
+        local = mmap(NULL, local_size_, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS | MAP_HUGETLB | MAP_POPULATE, -1, 0);
+        if (local == MAP_FAILED) {
+            HSB_LOG_WARN("Unable to allocate {:#x} bytes of huge pages, errno={}; using normal pages.", local_size_, errno);
+        }
+    }
+    if (local == MAP_FAILED) {
+        local_size_ = size;
+        local = mmap(NULL, local_size_, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS | MAP_POPULATE, -1, 0);
+        if (local == MAP_FAILED) {
+            throw std::runtime_error(fmt::format("mmap failed for size={:#x}, errno={}.", local_size_, errno));
+        }
+    }
+    local_ = static_cast<uint8_t*>(local);
+}
+
+void LinuxReceiver::free_local()
+{
+    if (!host_memory_) {
+        CUresult cu_result = cuMemFreeHost((void*)(local_));
+        if (cu_result != CUDA_SUCCESS) {
+            HSB_LOG_ERROR("cuMemFreeHost failed, cu_result={}", cu_result);
+            return;
+        }
+    } else if (munmap(local_, local_size_) != 0) {
+        HSB_LOG_ERROR("munmap failed, errno={}", errno);
+        return;
+    }
+    local_ = NULL;
+    local_size_ = 0;
 }
 
 void LinuxReceiver::run()
@@ -135,24 +264,58 @@ void LinuxReceiver::run()
     // Round the buffer size up to 64k
 #define BUFFER_ALIGNMENT (0x10000)
     uint64_t buffer_size = (cu_buffer_size_ + BUFFER_ALIGNMENT - 1) & ~(BUFFER_ALIGNMENT - 1);
-    // Allocate three pages, details below
-    CUresult cu_result = cuMemHostAlloc((void**)(&local_), buffer_size * 3, CU_MEMHOSTALLOC_WRITECOMBINED);
-    if (cu_result != CUDA_SUCCESS) {
-        throw std::runtime_error(fmt::format("cuMemHostAlloc failed, cu_result={}.", cu_result));
-    }
+    // We need a page to receive into, pages_ to hold completed frames,
+    // and one for get_next_frame to copy from-- and with host_memory_,
+    // another pages_ for the application to hold on to.
+    unsigned descriptor_count = 2 + pages_ + (host_memory_ ? pages_ : 0);
+    allocate_local(buffer_size * descriptor_count);
     // Construct a descriptor for each page
-    LinuxReceiverDescriptor d0(&local_[buffer_size * 0]);
-    LinuxReceiverDescriptor d1(&local_[buffer_size * 1]);
-    LinuxReceiverDescriptor d2(&local_[buffer_size * 2]);
-    // receiving points to the section we're currently receiving into
-    // busy_ points to the buffer that the application is using.
-    // available_ points to the last completed frame
-    LinuxReceiverDescriptor* receiving = &d0;
-    busy_ = &d1;
-    available_.store(&d2);
-
-    // Received UDP message goes here.
-    uint8_t received[hololink::core::UDP_PACKET_SIZE];
+    std::vector<LinuxReceiverDescriptor> descriptors;
+    descriptors.reserve(descriptor_count);
+    for (unsigned i = 0; i < descriptor_count; i++) {
+        descriptors.emplace_back(&local_[buffer_size * i]);
+    }
+    // receiving points to the section we're currently receiving into;
+    // signal() queues it up in completed_ and gives us a page from free_.
+    LinuxReceiverDescriptor* receiving = &descriptors[0];
+    int r = pthread_mutex_lock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
+    }
+    completed_.clear();
+    held_.clear();
+    free_.clear();
+    for (unsigned i = 1; i < descriptor_count; i++) {
+        free_.push_back(&descriptors[i]);
+    }
+    running_ = true;
+    r = pthread_mutex_unlock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
+    }
+
+    // Received UDP messages go here; we have room for up to batch_size_
+    // datagrams per call to recvmmsg.
+    const size_t control_size = CMSG_SPACE(sizeof(struct timespec));
+    std::vector<uint8_t> receive_buffers(batch_size_ * hololink::core::UDP_PACKET_SIZE);
+    std::vector<uint8_t> control_buffers(batch_size_ * control_size);
+    std::vector<struct iovec> iovecs(batch_size_);
+    std::vector<struct mmsghdr> messages(batch_size_);
+    for (unsigned i = 0; i < batch_size_; i++) {
+        iovecs[i].iov_base = &receive_buffers[i * hololink::core::UDP_PACKET_SIZE];
+        iovecs[i].iov_len = hololink::core::UDP_PACKET_SIZE;
+        messages[i].msg_hdr = {};
+        messages[i].msg_hdr.msg_iov = &iovecs[i];
+        messages[i].msg_hdr.msg_iovlen = 1;
+    }
+    // The traditional path: one recv call per packet.
+    const bool single_recv = (batch_size_ == 1) && !kernel_timestamps_;
+    if (track_missing_) {
+        // Usually all the packets in a frame are contiguous, so
+        // this is plenty.
+        received_regions_.clear();
+        received_regions_.reserve(1024);
+    }
 
     unsigned frame_count = 0;
     [[maybe_unused]] unsigned packet_count = 0;
@@ -163,19 +326,40 @@ void LinuxReceiver::run()
     bool first = true;
 
     while (true) {
-        int recv_flags = 0;
-        ssize_t received_bytes = recv(socket_, received, sizeof(received), recv_flags);
-        int recv_errno = errno;
+        int received_packets = 0;
+        int recv_errno = 0;
+        if (single_recv) {
+            int recv_flags = 0;
+            ssize_t received_bytes = recv(socket_, iovecs[0].iov_base, iovecs[0].iov_len, recv_flags);
+            recv_errno = errno;
+            HSB_LOG_TRACE("received_bytes={} recv_errno={}.", received_bytes, recv_errno);
+            if (received_bytes > 0) {
+                messages[0].msg_len = received_bytes;
+                received_packets = 1;
+            }
+        } else {
+            if (kernel_timestamps_) {
+                for (unsigned i = 0; i < batch_size_; i++) {
+                    messages[i].msg_hdr.msg_control = &control_buffers[i * control_size];
+                    messages[i].msg_hdr.msg_controllen = control_size;
+                }
+            }
+            // MSG_WAITFORONE blocks (up to SO_RCVTIMEO) for the first
+            // datagram, then returns whatever else is already queued.
+            received_packets = recvmmsg(socket_, messages.data(), batch_size_, MSG_WAITFORONE, NULL);
+            recv_errno = errno;
+            HSB_LOG_TRACE("received_packets={} recv_errno={}.", received_packets, recv_errno);
+        }
 
-        // Get the clock as close to the packet receipt as possible.
+        // Get the clock as close to the packet receipt as possible;
+        // with batching, all packets in this batch share this timestamp
+        // (unless kernel_timestamps_ is set).
         if (clock_gettime(CLOCK_REALTIME, &now) != 0) {
             HSB_LOG_ERROR("clock_gettime failed, errno={}", errno);
             break;
         }
 
-        HSB_LOG_TRACE("received_bytes={} recv_errno={}.", received_bytes, recv_errno);
-
-        if (received_bytes <= 0) {
+        if (received_packets <= 0) {
             // check if there is a timeout
             if ((recv_errno == EAGAIN) || (recv_errno == EWOULDBLOCK) || (recv_errno == EINTR)) {
                 // should we exit?
@@ -185,139 +369,207 @@ void LinuxReceiver::run()
                 // if not, continue
                 continue;
             }
-            HSB_LOG_ERROR("recv returned received_bytes={}, recv_errno={}", received_bytes, recv_errno);
+            HSB_LOG_ERROR("recv returned received_packets={}, recv_errno={}", received_packets, recv_errno);
             break;
         }
 
-        packet_count++;
-        frame_packets_received++;
-        if (!frame_bytes_received) {
-            frame_start = now;
-        }
-
-        do {
-            core::Deserializer deserializer(received, received_bytes);
-            uint8_t opcode = 0, flags = 0;
-            uint16_t pkey = 0;
-            uint8_t becn = 0, ack_request = 0;
-            uint32_t qp = 0, psn = 0;
-            if (!(deserializer.next_uint8(opcode)
-                    && deserializer.next_uint8(flags)
-                    && deserializer.next_uint16_be(pkey)
-                    && deserializer.next_uint8(becn)
-                    && deserializer.next_uint24_be(qp)
-                    && deserializer.next_uint8(ack_request)
-                    && deserializer.next_uint24_be(psn))) {
-                HSB_LOG_ERROR("Unable to decode runt IB request, received_bytes={}", received_bytes);
-                break;
+        uint64_t batch_bytes = 0;
+        for (int packet = 0; packet < received_packets; packet++) {
+            const uint8_t* received = static_cast<const uint8_t*>(iovecs[packet].iov_base);
+            size_t received_bytes = messages[packet].msg_len;
+            batch_bytes += received_bytes;
+
+            struct timespec packet_time = now;
+            if (kernel_timestamps_) {
+                struct msghdr* msg_hdr = &messages[packet].msg_hdr;
+                for (struct cmsghdr* cmsg = CMSG_FIRSTHDR(msg_hdr); cmsg != NULL; cmsg = CMSG_NXTHDR(msg_hdr, cmsg)) {
+                    if ((cmsg->cmsg_level == SOL_SOCKET) && (cmsg->cmsg_type == SCM_TIMESTAMPNS)) {
+                        memcpy(&packet_time, CMSG_DATA(cmsg), sizeof(packet_time));
+                        break;
+                    }
+                }
             }
 
-            // Note that 'psn' is only 24 bits.  Use that to determine
-            // how many packets were dropped.  Note that this doesn't
-            // account for out-of-order delivery.
-            core::NvtxTrace::event_u64("psn", psn);
-            core::NvtxTrace::event_u64("frame_packets_received", frame_packets_received);
-            if (!first) {
-                uint32_t next_psn = (last_psn + 1) & 0xFFFFFF;
-                uint32_t diff = (psn - next_psn) & 0xFFFFFF;
-                packets_dropped += diff;
+            packet_count++;
+            frame_packets_received++;
+            if (!frame_bytes_received) {
+                frame_start = packet_time;
             }
-            last_psn = psn;
-            first = false;
-
-            uint64_t address = 0;
-            uint32_t rkey = 0;
-            uint32_t size = 0;
-            const uint8_t* content = NULL;
-            if ((opcode == IBV_OPCODE_UC_RDMA_WRITE_ONLY)
-                && deserializer.next_uint64_be(address)
-                && deserializer.next_uint32_be(rkey)
-                && deserializer.next_uint32_be(size)
-                && deserializer.pointer(content, size)) {
-                HSB_LOG_TRACE("opcode=2A address={:x} size={:x}", address, size);
-                uint64_t target_address = address + received_address_offset_;
-                if ((target_address >= cu_buffer_) && (target_address + size <= (cu_buffer_ + cu_buffer_size_))) {
-                    uint64_t offset = target_address - cu_buffer_;
-                    memcpy(&receiving->memory_[offset], content, size);
-                    frame_bytes_received += size;
+
+            do {
+                core::Deserializer deserializer(received, received_bytes);
+                uint8_t opcode = 0, flags = 0;
+                uint16_t pkey = 0;
+                uint8_t becn = 0, ack_request = 0;
+                uint32_t qp = 0, psn = 0;
+                if (!(deserializer.next_uint8(opcode)
+                        && deserializer.next_uint8(flags)
+                        && deserializer.next_uint16_be(pkey)
+                        && deserializer.next_uint8(becn)
+                        && deserializer.next_uint24_be(qp)
+                        && deserializer.next_uint8(ack_request)
+                        && deserializer.next_uint24_be(psn))) {
+                    HSB_LOG_ERROR("Unable to decode runt IB request, received_bytes={}", received_bytes);
+                    break;
                 }
-                break;
-            }
 
-            uint32_t imm_data = 0;
-            if ((opcode == IBV_OPCODE_UC_RDMA_WRITE_ONLY_WITH_IMMEDIATE)
-                && deserializer.next_uint64_be(address)
-                && deserializer.next_uint32_be(rkey)
-                && deserializer.next_uint32_be(size)
-                && deserializer.next_uint32_be(imm_data)
-                && deserializer.pointer(content, size)) {
-                frame_count++;
-                core::NvtxTrace::event_u64("frame_count", frame_count);
-
-                HSB_LOG_TRACE("opcode=2B address={:#x} size={:x}", address, size);
-                uint64_t target_address = address + received_address_offset_;
-                if ((target_address >= cu_buffer_) && (target_address + size <= (cu_buffer_ + cu_buffer_size_))) {
-                    uint64_t offset = target_address - cu_buffer_;
-                    memcpy(&receiving->memory_[offset], content, size);
-                    frame_bytes_received += size;
+                // Note that 'psn' is only 24 bits.  Use that to determine
+                // how many packets were dropped.  Note that this doesn't
+                // account for out-of-order delivery.
+                core::NvtxTrace::event_u64("psn", psn);
+                core::NvtxTrace::event_u64("frame_packets_received", frame_packets_received);
+                if (!first) {
+                    uint32_t next_psn = (last_psn + 1) & 0xFFFFFF;
+                    uint32_t diff = (psn - next_psn) & 0xFFFFFF;
+                    if (diff) {
+                        packets_dropped += diff;
+                        telemetry_->add(core::ReceiverTelemetry::PACKETS_DROPPED, diff);
+                    }
+                }
+                last_psn = psn;
+                first = false;
+
+                uint64_t address = 0;
+                uint32_t rkey = 0;
+                uint32_t size = 0;
+                const uint8_t* content = NULL;
+                if ((opcode == IBV_OPCODE_UC_RDMA_WRITE_ONLY)
+                    && deserializer.next_uint64_be(address)
+                    && deserializer.next_uint32_be(rkey)
+                    && deserializer.next_uint32_be(size)
+                    && deserializer.pointer(content, size)) {
+                    HSB_LOG_TRACE("opcode=2A address={:x} size={:x}", address, size);
+                    uint64_t target_address = address + received_address_offset_;
+                    if ((target_address >= cu_buffer_) && (target_address + size <= (cu_buffer_ + cu_buffer_size_))) {
+                        uint64_t offset = target_address - cu_buffer_;
+                        memcpy(&receiving->memory_[offset], content, size);
+                        frame_bytes_received += size;
+                        if (track_missing_) {
+                            if (!received_regions_.empty() && (received_regions_.back().second == offset)) {
+                                received_regions_.back().second += size;
+                            } else {
+                                received_regions_.emplace_back(offset, offset + size);
+                            }
+                        }
+                    }
+                    break;
                 }
-                // Send it
-                // - receiving now has legit data;
-                // - swap it with available_, now
-                //  available_ points to received data
-                //  and we'll continue to receive into what
-                //  was in available_ (but not consumed by
-                //  the application)
-                // - signal the pipeline so it wakes up if necessary.
-                Hololink::FrameMetadata frame_metadata = Hololink::deserialize_metadata(content, size);
-                LinuxReceiverMetadata& metadata = receiving->metadata_;
-                metadata.frame_packets_received = frame_packets_received;
-                metadata.frame_bytes_received = frame_bytes_received;
-                metadata.received_frame_number = frame_count;
-                metadata.frame_start_s = frame_start.tv_sec;
-                metadata.frame_start_ns = frame_start.tv_nsec;
-                metadata.frame_end_s = now.tv_sec;
-                metadata.frame_end_ns = now.tv_nsec;
-                metadata.imm_data = imm_data;
-                metadata.packets_dropped = packets_dropped;
-                metadata.received_s = now.tv_sec;
-                metadata.received_ns = now.tv_nsec;
-                metadata.frame_metadata = frame_metadata;
-                metadata.frame_number = frame_number_.update(frame_metadata.frame_number);
-
-                receiving = available_.exchange(receiving);
-                signal();
-                // Make it easy to identify missing packets.
-                memset(receiving->memory_, 0xFF, buffer_size);
-                // Reset metadata.
-                frame_packets_received = 0;
-                frame_bytes_received = 0;
-                break;
-            }
 
-            HSB_LOG_ERROR("Unable to decode IB request with opcode={:x}", opcode);
-        } while (false);
+                uint32_t imm_data = 0;
+                if ((opcode == IBV_OPCODE_UC_RDMA_WRITE_ONLY_WITH_IMMEDIATE)
+                    && deserializer.next_uint64_be(address)
+                    && deserializer.next_uint32_be(rkey)
+                    && deserializer.next_uint32_be(size)
+                    && deserializer.next_uint32_be(imm_data)
+                    && deserializer.pointer(content, size)) {
+                    frame_count++;
+                    core::NvtxTrace::event_u64("frame_count", frame_count);
+
+                    HSB_LOG_TRACE("opcode=2B address={:#x} size={:x}", address, size);
+                    uint64_t target_address = address + received_address_offset_;
+                    if ((target_address >= cu_buffer_) && (target_address + size <= (cu_buffer_ + cu_buffer_size_))) {
+                        uint64_t offset = target_address - cu_buffer_;
+                        memcpy(&receiving->memory_[offset], content, size);
+                        frame_bytes_received += size;
+                    }
+                    // Send it
+                    // - receiving now has legit data;
+                    // - queue it up for get_next_frame; if the ring
+                    //  is full, the oldest frame is discarded
+                    // - signal the pipeline so it wakes up if necessary
+                    // - continue receiving into a free page.
+                    Hololink::FrameMetadata frame_metadata = Hololink::deserialize_metadata(content, size);
+                    LinuxReceiverMetadata& metadata = receiving->metadata_;
+                    metadata.frame_packets_received = frame_packets_received;
+                    metadata.frame_bytes_received = frame_bytes_received;
+                    metadata.received_frame_number = frame_count;
+                    metadata.frame_start_s = frame_start.tv_sec;
+                    metadata.frame_start_ns = frame_start.tv_nsec;
+                    metadata.frame_end_s = packet_time.tv_sec;
+                    metadata.frame_end_ns = packet_time.tv_nsec;
+                    metadata.imm_data = imm_data;
+                    metadata.packets_dropped = packets_dropped;
+                    metadata.received_s = packet_time.tv_sec;
+                    metadata.received_ns = packet_time.tv_nsec;
+                    metadata.frame_metadata = frame_metadata;
+                    metadata.frame_number = frame_number_.update(frame_metadata.frame_number);
+                    if (track_missing_) {
+                        metadata.missing_bytes = find_missing_regions(received_regions_, cu_buffer_size_, metadata.missing_regions);
+                        if (fill_missing_) {
+                            for (auto& [missing_offset, missing_length] : metadata.missing_regions) {
+                                memset(&receiving->memory_[missing_offset], 0xFF, missing_length);
+                            }
+                        }
+                        received_regions_.clear();
+                    }
+
+                    telemetry_->record(core::ReceiverTelemetry::FRAME_ASSEMBLY, frame_start, packet_time);
+                    receiving = signal(receiving);
+                    struct timespec signalled;
+                    clock_gettime(CLOCK_REALTIME, &signalled);
+                    telemetry_->record(core::ReceiverTelemetry::FRAME_LATENCY, frame_start, signalled);
+                    telemetry_->add(core::ReceiverTelemetry::FRAMES_RECEIVED);
+                    if (!track_missing_) {
+                        // Make it easy to identify missing packets.
+                        memset(receiving->memory_, 0xFF, buffer_size);
+                    }
+                    // Reset metadata.
+                    frame_packets_received = 0;
+                    frame_bytes_received = 0;
+                    break;
+                }
+
+                HSB_LOG_ERROR("Unable to decode IB request with opcode={:x}", opcode);
+            } while (false);
+        }
+        telemetry_->add(core::ReceiverTelemetry::PACKETS_RECEIVED, received_packets);
+        telemetry_->add(core::ReceiverTelemetry::BYTES_RECEIVED, batch_bytes);
     }
 
-    busy_ = NULL;
-    available_.store(NULL);
+    // Wake up anyone waiting in get_next_frame.
+    r = pthread_mutex_lock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
+    }
+    running_ = false;
+    completed_.clear();
+    held_.clear();
+    free_.clear();
+    pthread_cond_broadcast(&ready_condition_);
+    r = pthread_mutex_unlock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
+    }
 
-    cu_result = cuMemFreeHost((void*)(local_));
-    if (cu_result != CUDA_SUCCESS) {
-        HSB_LOG_ERROR("cuMemFreeHost failed, cu_result={}", cu_result);
-        return;
+    // With host_memory_, frames we handed out point into local_;
+    // the destructor frees it.
+    if (!host_memory_) {
+        free_local();
     }
-    local_ = NULL;
     HSB_LOG_DEBUG("Done.");
 }
 
-void LinuxReceiver::signal()
+LinuxReceiverDescriptor* LinuxReceiver::signal(LinuxReceiverDescriptor* receiving)
 {
     int r = pthread_mutex_lock(&ready_mutex_);
     if (r != 0) {
         throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
     }
-    ready_ = true;
+    completed_.push_back(receiving);
+    // If the application isn't keeping up, drop the oldest frame.
+    if (completed_.size() > pages_) {
+        free_.push_back(completed_.front());
+        completed_.pop_front();
+        overwrites_++;
+        core::NvtxTrace::event_u64("ring_overwrites", overwrites_);
+        telemetry_->add(core::ReceiverTelemetry::FRAMES_DROPPED);
+    }
+    // There are pages_ + 2 descriptors (2 * pages_ + 2 with
+    // host_memory_); at most pages_ are in completed_, one is used by
+    // get_next_frame and, with host_memory_, pages_ are in held_, so
+    // free_ can't be empty here.
+    LinuxReceiverDescriptor* next = free_.back();
+    free_.pop_back();
     r = pthread_cond_signal(&ready_condition_);
     if (r != 0) {
         throw std::runtime_error(fmt::format("pthread_cond_signal returned r={}.", r));
@@ -329,41 +581,101 @@ void LinuxReceiver::signal()
     // Provide the local callback, letting the application know
     // that get_next_frame won't block.
     frame_ready_(this[0]);
+    return next;
 }
 
-bool LinuxReceiver::get_next_frame(unsigned timeout_ms, LinuxReceiverMetadata& metadata)
+void LinuxReceiver::release(LinuxReceiverDescriptor* descriptor)
 {
-    bool r = wait(timeout_ms);
-    if (r) {
-        busy_ = available_.exchange(busy_);
-        if (busy_) {
-            // Because we're setting up the next frame of data for
-            // pipeline processing, we can allow this memcpy to overlap
-            // with other GPU work-- we just make sure that this copy is done
-            // (with the cuStreamSynchronize below) to ensure that this memcpy
-            // finishes before the pipeline uses the destination buffer.
-            CUresult cu_result = cuMemcpyHtoDAsync(cu_buffer_, busy_->memory_, cu_buffer_size_, cu_stream_);
-            if (cu_result != CUDA_SUCCESS) {
-                HSB_LOG_ERROR("cuMemcpyHtoDAsync failed, cu_result={}", cu_result);
-                r = false;
-            } else {
-                cu_result = cuStreamSynchronize(cu_stream_);
-                if (cu_result != CUDA_SUCCESS) {
-                    HSB_LOG_ERROR("cuStreamSynchronize failed, cu_result={}", cu_result);
-                    r = false;
-                }
+    int r = pthread_mutex_lock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned r={}.", r));
+    }
+    // If run() exited, free_ is no longer in use.
+    if (running_) {
+        if (host_memory_) {
+            // The application may still be using the last pages_
+            // frames we gave it.
+            held_.push_back(descriptor);
+            if (held_.size() > pages_) {
+                free_.push_back(held_.front());
+                held_.pop_front();
             }
-            metadata = busy_->metadata_;
         } else {
-            // run() exited.
-            HSB_LOG_ERROR("get_next_frame failed, receiver has terminated.");
+            free_.push_back(descriptor);
+        }
+    }
+    r = pthread_mutex_unlock(&ready_mutex_);
+    if (r != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
+    }
+}
+
+bool LinuxReceiver::get_next_frame(unsigned timeout_ms, LinuxReceiverMetadata& metadata)
+{
+    unsigned ring_occupancy = 0;
+    uint64_t ring_overwrites = 0;
+    struct timespec start, end;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    LinuxReceiverDescriptor* busy = wait(timeout_ms, ring_occupancy, ring_overwrites);
+    if (!busy) {
+        telemetry_->add(core::ReceiverTelemetry::TIMEOUTS);
+        return false;
+    }
+    clock_gettime(CLOCK_MONOTONIC, &end);
+    telemetry_->record(core::ReceiverTelemetry::FRAME_WAIT, start, end);
+    telemetry_->add(core::ReceiverTelemetry::FRAMES_DELIVERED);
+    // Each frame goes to the next page in turn, so the application can
+    // continue to use the last pages_-1 frames we've handed out.
+    unsigned page = next_page_;
+    next_page_ = (next_page_ + 1) % pages_;
+    metadata = busy->metadata_;
+    metadata.page = page;
+    metadata.ring_occupancy = ring_occupancy;
+    metadata.ring_overwrites = ring_overwrites;
+    if (host_memory_) {
+        // Just hand the application our buffer.
+        metadata.frame_memory = reinterpret_cast<CUdeviceptr>(busy->memory_);
+        release(busy);
+        return true;
+    }
+    CUdeviceptr frame_memory = cu_buffer_ + cu_page_size_ * page;
+    metadata.frame_memory = frame_memory;
+    bool r = true;
+    // Because we're setting up the next frame of data for
+    // pipeline processing, we can allow this memcpy to overlap
+    // with other GPU work-- we just make sure that this copy is done
+    // (with the cuStreamSynchronize below) to ensure that this memcpy
+    // finishes before the pipeline uses the destination buffer.
+    CUresult cu_result = cuMemcpyHtoDAsync(frame_memory, busy->memory_, cu_buffer_size_, cu_stream_);
+    if (cu_result != CUDA_SUCCESS) {
+        HSB_LOG_ERROR("cuMemcpyHtoDAsync failed, cu_result={}", cu_result);
+        r = false;
+    } else {
+        cu_result = cuStreamSynchronize(cu_stream_);
+        if (cu_result != CUDA_SUCCESS) {
+            HSB_LOG_ERROR("cuStreamSynchronize failed, cu_result={}", cu_result);
             r = false;
         }
     }
+    release(busy);
+    return r;
+}
+
+unsigned LinuxReceiver::frames_pending()
+{
+    int status = pthread_mutex_lock(&ready_mutex_);
+    if (status != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_lock returned status={}.", status));
+    }
+    unsigned r = completed_.size();
+    status = pthread_mutex_unlock(&ready_mutex_);
+    if (status != 0) {
+        throw std::runtime_error(fmt::format("pthread_mutex_unlock returned status={}.", status));
+    }
     return r;
 }
 
-bool LinuxReceiver::wait(unsigned timeout_ms)
+LinuxReceiverDescriptor* LinuxReceiver::wait(unsigned timeout_ms, unsigned& ring_occupancy, uint64_t& ring_overwrites)
 {
     int status = pthread_mutex_lock(&ready_mutex_);
     if (status != 0) {
@@ -375,7 +687,7 @@ bool LinuxReceiver::wait(unsigned timeout_ms)
     }
     struct timespec timeout = add_ms(now, timeout_ms);
 
-    while (!ready_) {
+    while (completed_.empty()) {
         status = pthread_cond_timedwait(&ready_condition_, &ready_mutex_, &timeout);
         if (status == ETIMEDOUT) {
             break;
@@ -384,9 +696,19 @@ bool LinuxReceiver::wait(unsigned timeout_ms)
             HSB_LOG_ERROR("pthread_cond_wait returned status={}", status);
             break;
         }
+        if (!running_) {
+            // run() exited.
+            HSB_LOG_ERROR("get_next_frame failed, receiver has terminated.");
+            break;
+        }
+    }
+    LinuxReceiverDescriptor* r = NULL;
+    if (!completed_.empty()) {
+        r = completed_.front();
+        completed_.pop_front();
     }
-    bool r = ready_;
-    ready_ = false;
+    ring_occupancy = completed_.size();
+    ring_overwrites = overwrites_;
     status = pthread_mutex_unlock(&ready_mutex_);
     if (status != 0) {
         throw std::runtime_error(fmt::format("pthread_mutex_unlock returned status={}.", status));
@@ -21,12 +21,17 @@
 #define SRC_HOLOLINK_OPERATORS_LINUX_RECEIVER_LINUX_RECEIVER
 
 #include <atomic>
+#include <deque>
+#include <memory>
 #include <semaphore.h>
 #include <stdint.h>
+#include <utility>
+#include <vector>
 
 #include <cuda.h>
 
 #include <hololink/core/hololink.hpp>
+#include <hololink/core/telemetry.hpp>
 
 namespace hololink::operators {
 
@@ -48,16 +53,66 @@ public:
     // Data received directly from HSB.
     Hololink::FrameMetadata frame_metadata;
     uint32_t frame_number = 0; // 32-bit extended version of the 16-bit frame_metadata.frame_number
+    // Which page of cu_buffer holds this frame; with host_memory,
+    // frame_memory is the address of the receiver's host buffer.
+    unsigned page = 0;
+    CUdeviceptr frame_memory = 0;
+    // Completed frames still waiting in the ring after this one
+    unsigned ring_occupancy = 0;
+    // Completed frames discarded, over the life of the application,
+    // because the ring was full
+    uint64_t ring_overwrites = 0;
+    // With track_missing, the (offset, length) of each region of
+    // the frame that we didn't receive, and the total of those lengths.
+    std::vector<std::pair<uint64_t, uint64_t>> missing_regions;
+    uint64_t missing_bytes = 0;
 };
 
 class LinuxReceiverDescriptor;
 
 class LinuxReceiver {
 public:
+    /**
+     * @param batch_size is the maximum number of datagrams fetched
+     * with a single recvmmsg call; 1 uses the traditional one-recv-per-packet
+     * path.
+     * @param kernel_timestamps if true, each packet is timestamped by
+     * the kernel (SO_TIMESTAMPNS); otherwise a single timestamp is
+     * taken after each batch is received.
+     * @param pages is the number of completed frames we'll queue
+     * for get_next_frame; cu_buffer must have room for this many
+     * pages, each cu_page_size bytes apart.  get_next_frame writes
+     * each frame into the next page in turn, so the application can
+     * hold on to a frame until pages-1 more frames are fetched.
+     * @param cu_page_size is the distance between pages in cu_buffer;
+     * 0 uses cu_buffer_size.
+     * @param track_missing if false, the whole receive buffer is set
+     * to 0xFF before each frame is received into it; if true, we
+     * instead keep track of which regions of the frame were received,
+     * and report the rest in the metadata (missing_regions).
+     * @param fill_missing with track_missing, set just the missing
+     * regions to 0xFF; otherwise they're left with whatever data
+     * was there before.
+     * @param host_memory if true, no CUDA calls are made: frames are
+     * received into page-aligned host memory owned by this object,
+     * and get_next_frame returns that address (in metadata.frame_memory)
+     * instead of copying the frame into cu_buffer, which is unused.
+     * That memory remains valid until pages more frames are fetched.
+     * @param huge_pages with host_memory, try to back the receive
+     * buffers with huge pages, falling back to normal pages.
+     */
     LinuxReceiver(CUdeviceptr cu_buffer,
         size_t cu_buffer_size,
         int socket,
-        uint64_t received_address_offset);
+        uint64_t received_address_offset,
+        unsigned batch_size = 1,
+        bool kernel_timestamps = false,
+        unsigned pages = 1,
+        size_t cu_page_size = 0,
+        bool track_missing = false,
+        bool fill_missing = true,
+        bool host_memory = false,
+        bool huge_pages = false);
 
     ~LinuxReceiver();
 
@@ -74,7 +129,8 @@ public:
     void close();
 
     /**
-     * Block until the next complete frame arrives.
+     * Block until the next complete frame arrives; if
+     * more than one frame is waiting, fetch the oldest one.
      * @returns false if timeout_ms elapses before
      * the complete frame is observed.
      * @param metadata is updated with statistics
@@ -82,6 +138,12 @@ public:
      */
     bool get_next_frame(unsigned timeout_ms, LinuxReceiverMetadata& metadata);
 
+    /**
+     * @returns the number of completed frames that
+     * get_next_frame can fetch without blocking.
+     */
+    unsigned frames_pending();
+
     uint32_t get_qp_number() { return qp_number_; };
 
     uint32_t get_rkey() { return rkey_; };
@@ -92,33 +154,79 @@ public:
      */
     void set_frame_ready(std::function<void(const LinuxReceiver&)> frame_ready);
 
+    unsigned get_batch_size() { return batch_size_; };
+
+    unsigned get_pages() { return pages_; };
+
+    bool get_host_memory() { return host_memory_; };
+
+    /**
+     * Counters and timing histograms for this receiver, also published
+     * in shared memory and by TelemetryServer.
+     */
+    std::shared_ptr<core::ReceiverTelemetry> get_telemetry() { return telemetry_; };
+
 protected:
-    // Blocks execution until signal() is called;
-    // @returns false if timeout_ms elapses before
-    // signal is observed.
-    bool wait(unsigned timeout_ms);
+    // Blocks execution until a completed frame is available;
+    // @returns that (oldest) frame, or NULL if timeout_ms
+    // elapses first or the receiver has terminated.
+    LinuxReceiverDescriptor* wait(unsigned timeout_ms, unsigned& ring_occupancy, uint64_t& ring_overwrites);
+
+    // Queue up the completed frame in receiving, wake up
+    // wait(), and return the descriptor to receive the
+    // next frame into.
+    LinuxReceiverDescriptor* signal(LinuxReceiverDescriptor* receiving);
+
+    // Return a descriptor fetched with wait() to the free list;
+    // with host_memory_, the descriptor is held until pages_
+    // more are released.
+    void release(LinuxReceiverDescriptor* descriptor);
 
-    // Pass a message to wait() telling it to wake up.
-    void signal();
+    // Allocate and free local_.
+    void allocate_local(size_t size);
+    void free_local();
 
 protected:
     CUdeviceptr cu_buffer_;
     size_t cu_buffer_size_;
     int socket_;
     uint64_t received_address_offset_;
-    bool volatile ready_;
+    unsigned batch_size_;
+    bool kernel_timestamps_;
+    unsigned pages_;
+    size_t cu_page_size_;
+    bool track_missing_;
+    bool fill_missing_;
+    bool host_memory_;
+    bool huge_pages_;
+    // [start, end) of each region received in the current frame;
+    // only used by the receiver thread.
+    std::vector<std::pair<uint64_t, uint64_t>> received_regions_;
+    bool volatile running_;
     bool volatile exit_;
     pthread_mutex_t ready_mutex_;
     pthread_cond_t ready_condition_;
     uint32_t qp_number_;
     uint32_t rkey_;
     uint8_t* local_;
-    std::atomic<LinuxReceiverDescriptor*> available_;
-    LinuxReceiverDescriptor* busy_;
+    size_t local_size_;
+    // With host_memory_, frames handed to the application, oldest
+    // first; protected by ready_mutex_.
+    std::deque<LinuxReceiverDescriptor*> held_;
+    // Completed frames, oldest first, and descriptors that run()
+    // can receive into; both are protected by ready_mutex_.
+    std::deque<LinuxReceiverDescriptor*> completed_;
+    std::vector<LinuxReceiverDescriptor*> free_;
+    uint64_t overwrites_;
+    // Next page in cu_buffer_ written by get_next_frame.
+    unsigned next_page_;
     CUstream cu_stream_; // Used to control cuMemcpyHtoDAsync.
     std::function<void(const LinuxReceiver&)> frame_ready_;
     /** Sign-extended frame_number value. */
     ExtendedCounter<uint32_t, uint16_t> frame_number_;
+    // Packet and frame values are written by run(); the get_next_frame
+    // values by the application thread.
+    std::shared_ptr<core::ReceiverTelemetry> telemetry_;
 };
 
 } // namespace hololink::operators
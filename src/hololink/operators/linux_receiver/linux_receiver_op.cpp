@@ -19,6 +19,7 @@
 
 #include <chrono>
 #include <cstdlib>
+#include <cstring>
 #include <sched.h>
 #include <sys/socket.h>
 #include <unistd.h>
@@ -60,6 +61,10 @@ void LinuxReceiverOp::initialize()
     crc_metadata_ = rename_fn("crc");
     psn_metadata_ = rename_fn("psn");
     bytes_written_metadata_ = rename_fn("bytes_written");
+    ring_occupancy_metadata_ = rename_fn("ring_occupancy");
+    ring_overwrites_metadata_ = rename_fn("ring_overwrites");
+    missing_regions_metadata_ = rename_fn("missing_regions");
+    missing_bytes_metadata_ = rename_fn("missing_bytes");
 
     // Set default receiver affinity if not set
     if (receiver_affinity_.has_value() && receiver_affinity_.get().empty()) {
@@ -84,6 +89,20 @@ void LinuxReceiverOp::setup(holoscan::OperatorSpec& spec)
     // Add our own parameters
     spec.param(receiver_affinity_, "receiver_affinity", "ReceiverAffinity",
         "CPU affinity set for receiver thread", std::vector<int> {});
+    spec.param(batch_size_, "batch_size", "BatchSize",
+        "Maximum number of packets fetched with each recvmmsg call; 1 uses recv", 1u);
+    spec.param(kernel_timestamps_, "kernel_timestamps", "KernelTimestamps",
+        "Use per-packet kernel (SO_TIMESTAMPNS) receive timestamps", false);
+    spec.param(pages_, "pages", "Pages",
+        "Number of completed frames queued up for the pipeline; each is emitted in its own GPU page", 1u);
+    spec.param(track_missing_, "track_missing", "TrackMissing",
+        "Track the regions of each frame that were received instead of clearing the whole buffer before each frame", false);
+    spec.param(fill_missing_, "fill_missing", "FillMissing",
+        "With track_missing, set the regions that weren't received to 0xFF", true);
+    spec.param(host_memory_, "host_memory", "HostMemory",
+        "Emit frames in host memory without using CUDA; frame_context is ignored", false);
+    spec.param(huge_pages_, "huge_pages", "HugePages",
+        "With host_memory, back the receive buffers with huge pages when available", false);
 
     // Note: rename_metadata is handled programmatically via set_rename_metadata() method
     // to avoid YAML-CPP serialization issues with std::function
@@ -106,16 +125,31 @@ void LinuxReceiverOp::start_receiver()
     // Allocate frame memory with metadata space
     size_t aligned_frame_size = hololink::core::round_up(frame_size_.get(), hololink::core::PAGE_SIZE);
     size_t allocation_size = aligned_frame_size + hololink::METADATA_SIZE;
-    frame_memory_.reset(new ReceiverMemoryDescriptor(frame_context_, allocation_size));
+    if (host_memory_.get()) {
+        // LinuxReceiver owns the frame memory.
+        frame_memory_storage_type_ = nvidia::gxf::MemoryStorageType::kSystem;
+    } else {
+        frame_memory_storage_type_ = nvidia::gxf::MemoryStorageType::kDevice;
+        frame_memory_.reset(new ReceiverMemoryDescriptor(frame_context_, allocation_size * pages_.get()));
+    }
+    CUdeviceptr frame_memory = frame_memory_ ? frame_memory_->get() : 0;
 
-    HSB_LOG_INFO("frame_size={:#x} frame={:#x} allocation_size={:#x}",
-        frame_size_.get(), frame_memory_->get(), allocation_size);
+    HSB_LOG_INFO("frame_size={:#x} frame={:#x} allocation_size={:#x} pages={} host_memory={}",
+        frame_size_.get(), frame_memory, allocation_size, pages_.get(), host_memory_.get());
 
     receiver_.reset(new LinuxReceiver(
-        frame_memory_->get(),
+        frame_memory,
         frame_size_.get(),
         data_socket_.get(),
-        received_address_offset()));
+        received_address_offset(),
+        batch_size_.get(),
+        kernel_timestamps_.get(),
+        pages_.get(),
+        allocation_size,
+        track_missing_.get(),
+        fill_missing_.get(),
+        host_memory_.get(),
+        huge_pages_.get()));
 
     receiver_->set_frame_ready([this](const LinuxReceiver&) {
         this->frame_ready();
@@ -132,6 +166,8 @@ void LinuxReceiverOp::start_receiver()
     auto [local_ip, local_port] = local_ip_and_port();
     HSB_LOG_INFO("local_ip={} local_port={}", local_ip, local_port);
 
+    // HSB always writes into the first page; LinuxReceiver does
+    // the paging on the host side.
     size_t page_size = allocation_size;
     size_t pages = 1;
     uint64_t distal_memory_address_start = 0; // See received_address_offset()
@@ -140,7 +176,9 @@ void LinuxReceiverOp::start_receiver()
 
 void LinuxReceiverOp::run()
 {
-    CudaCheck(cuCtxSetCurrent(frame_context_));
+    if (!host_memory_.get()) {
+        CudaCheck(cuCtxSetCurrent(frame_context_));
+    }
 
     // Set CPU affinity if specified
     if (receiver_affinity_.has_value() && !receiver_affinity_.get().empty()) {
@@ -189,15 +227,36 @@ std::tuple<CUdeviceptr, std::shared_ptr<hololink::Metadata>> LinuxReceiverOp::ge
     (*metadata)[crc_metadata_] = int64_t(linux_receiver_metadata.frame_metadata.crc);
     (*metadata)[psn_metadata_] = int64_t(linux_receiver_metadata.imm_data); // PSN is stored in imm_data
     (*metadata)[bytes_written_metadata_] = int64_t(linux_receiver_metadata.frame_metadata.bytes_written);
+    (*metadata)[ring_occupancy_metadata_] = int64_t(linux_receiver_metadata.ring_occupancy);
+    (*metadata)[ring_overwrites_metadata_] = int64_t(linux_receiver_metadata.ring_overwrites);
+    if (track_missing_.get()) {
+        // Metadata values can't be lists, so this is packed (offset,
+        // length) pairs of native-endian uint64_t, 16 bytes per region.
+        const auto& regions = linux_receiver_metadata.missing_regions;
+        std::vector<uint8_t> missing_regions(regions.size() * 2 * sizeof(uint64_t));
+        uint8_t* p = missing_regions.data();
+        for (const auto& [missing_offset, missing_length] : regions) {
+            memcpy(p, &missing_offset, sizeof(missing_offset));
+            memcpy(p + sizeof(uint64_t), &missing_length, sizeof(missing_length));
+            p += 2 * sizeof(uint64_t);
+        }
+        (*metadata)[missing_regions_metadata_] = missing_regions;
+        (*metadata)[missing_bytes_metadata_] = int64_t(linux_receiver_metadata.missing_bytes);
+    }
 
-    return { frame_memory_->get(), metadata };
+    return { linux_receiver_metadata.frame_memory, metadata };
+}
+
+bool LinuxReceiverOp::frames_pending()
+{
+    return receiver_->frames_pending() > 0;
 }
 
 uint64_t LinuxReceiverOp::received_address_offset()
 {
     // This address is added to the address received from HSB;
     // HSB is configured to start with address 0.
-    return frame_memory_->get();
+    return frame_memory_ ? frame_memory_->get() : 0;
 }
 
 void LinuxReceiverOp::check_buffer_size(size_t data_memory_size)
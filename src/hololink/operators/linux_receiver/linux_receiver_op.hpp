@@ -46,6 +46,7 @@ public:
     void start_receiver() override;
     void stop_receiver() override;
     std::tuple<CUdeviceptr, std::shared_ptr<hololink::Metadata>> get_next_frame(double timeout_ms) override;
+    bool frames_pending() override;
 
     // Setter for rename_metadata function and receiver_affinity
     void set_rename_metadata(std::function<std::string(const std::string&)> rename_fn);
@@ -53,6 +54,13 @@ public:
 
 private:
     holoscan::Parameter<std::vector<int>> receiver_affinity_;
+    holoscan::Parameter<uint32_t> batch_size_;
+    holoscan::Parameter<bool> kernel_timestamps_;
+    holoscan::Parameter<uint32_t> pages_;
+    holoscan::Parameter<bool> track_missing_;
+    holoscan::Parameter<bool> fill_missing_;
+    holoscan::Parameter<bool> host_memory_;
+    holoscan::Parameter<bool> huge_pages_;
     std::function<std::string(const std::string&)> rename_metadata_;
 
     // Cached metadata key names
@@ -70,6 +78,10 @@ private:
     std::string crc_metadata_;
     std::string psn_metadata_;
     std::string bytes_written_metadata_;
+    std::string ring_occupancy_metadata_;
+    std::string ring_overwrites_metadata_;
+    std::string missing_regions_metadata_;
+    std::string missing_bytes_metadata_;
 
     std::shared_ptr<LinuxReceiver> receiver_;
     std::unique_ptr<std::thread> receiver_thread_;
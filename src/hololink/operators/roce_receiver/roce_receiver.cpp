@@ -85,6 +85,7 @@ RoceReceiver::RoceReceiver(
     , frame_ready_([](const RoceReceiver&) {})
     , frame_number_()
     , monitor_running_()
+    , telemetry_(core::ReceiverTelemetry::create("roce_receiver"))
 {
     HSB_LOG_DEBUG("cu_buffer={:#x} cu_frame_size={:#x} cu_page_size={} pages={}",
         cu_buffer, cu_frame_size, cu_page_size, pages);
@@ -568,6 +569,7 @@ void RoceReceiver::blocking_monitor()
                 // then we're overwriting a valid frame.
                 if (ready_) {
                     dropped_++;
+                    telemetry_->add(core::ReceiverTelemetry::FRAMES_DROPPED);
                 }
                 if ((buffer_size > 0) && (buffer_size < 1000)) {
                     rx_write_requests_ = strtoull(buffer, NULL, 10);
@@ -603,6 +605,11 @@ void RoceReceiver::blocking_monitor()
                 if (r != 0) {
                     throw std::runtime_error(fmt::format("pthread_mutex_unlock returned r={}.", r));
                 }
+                struct timespec signalled;
+                clock_gettime(CLOCK_REALTIME, &signalled);
+                telemetry_->record(core::ReceiverTelemetry::FRAME_LATENCY,
+                    const_cast<const struct timespec&>(event_time_), signalled);
+                telemetry_->add(core::ReceiverTelemetry::FRAMES_RECEIVED);
                 // Provide the local callback, letting the application know
                 // that get_next_frame won't block.
                 frame_ready_(this[0]);
@@ -730,6 +737,14 @@ bool RoceReceiver::get_next_frame(unsigned timeout_ms, RoceReceiverMetadata& met
     }
     bool r = ready_;
     ready_ = false;
+    if (r) {
+        struct timespec end;
+        clock_gettime(CLOCK_MONOTONIC, &end);
+        telemetry_->record(core::ReceiverTelemetry::FRAME_WAIT, now, end);
+        telemetry_->add(core::ReceiverTelemetry::FRAMES_DELIVERED);
+    } else {
+        telemetry_->add(core::ReceiverTelemetry::TIMEOUTS);
+    }
     metadata.received_frame_number = received_frame_number_;
     metadata.dropped = dropped_;
     if (r) {
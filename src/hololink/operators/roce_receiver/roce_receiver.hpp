@@ -21,6 +21,7 @@
 #define SRC_HOLOLINK_OPERATORS_ROCE_RECEIVER_ROCE_RECEIVER
 
 #include <atomic>
+#include <memory>
 #include <mutex>
 #include <stddef.h>
 #include <stdint.h>
@@ -32,6 +33,7 @@
 #include <hololink/core/deserializer.hpp>
 #include <hololink/core/hololink.hpp>
 #include <hololink/core/nvtx_trace.hpp>
+#include <hololink/core/telemetry.hpp>
 
 namespace hololink::operators {
 
@@ -115,6 +117,12 @@ public:
      */
     void set_frame_ready(std::function<void(const RoceReceiver&)> frame_ready);
 
+    /**
+     * Counters and timing histograms for this receiver, also published
+     * in shared memory and by TelemetryServer.
+     */
+    std::shared_ptr<core::ReceiverTelemetry> get_telemetry() { return telemetry_; };
+
 protected:
     void free_ib_resources();
 
@@ -160,6 +168,9 @@ protected:
     /** Sign-extended frame_number value. */
     ExtendedCounter<uint32_t, uint16_t> frame_number_;
     std::mutex monitor_running_;
+    // Frame values are written by blocking_monitor; the get_next_frame
+    // values by the application thread.
+    std::shared_ptr<core::ReceiverTelemetry> telemetry_;
 
     std::mutex& get_lock(); // Ensures reentrency protection for ibv calls.
 };
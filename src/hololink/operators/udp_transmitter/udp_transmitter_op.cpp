@@ -16,6 +16,9 @@
  */
 #include "udp_transmitter_op.hpp"
 
+#include <algorithm>
+#include <chrono>
+
 #include <hololink/common/cuda_error.hpp>
 #include <hololink/core/logging_internal.hpp>
 
@@ -65,10 +68,38 @@ void UdpTransmitterOp::setup(holoscan::OperatorSpec& spec)
         "lossy",
         "Lossy mode",
         true);
+
+    // With segment_size set, tensors are sent whole, as a series of
+    // datagrams each with a SegmentHeader and up to segment_size bytes
+    // of data; for a 1500 byte MTU, use 1500 - 20 (IP) - 8 (UDP) - 12
+    // (SegmentHeader) = 1460. 0 selects sending one datagram with up
+    // to max_buffer_size bytes of each tensor.
+    spec.param(segment_size_,
+        "segment_size",
+        "segment size",
+        "Data bytes per datagram in segmenting mode, 0 to disable segmenting",
+        static_cast<uint16_t>(0));
+
+    spec.param(batch_size_,
+        "batch_size",
+        "batch size",
+        "Maximum datagrams sent with each sendmmsg call in segmenting mode",
+        static_cast<uint16_t>(64));
 }
 
 void UdpTransmitterOp::start()
 {
+    if (segment_size_.get() > max_udp_data_size - sizeof(SegmentHeader)) {
+        throw std::runtime_error(fmt::format("segment_size={} exceeds the maximum of {}.",
+            segment_size_.get(), max_udp_data_size - sizeof(SegmentHeader)));
+    }
+    if (batch_size_.get() == 0) {
+        throw std::runtime_error("batch_size must be at least 1.");
+    }
+    headers_.resize(batch_size_.get());
+    iovecs_.resize(batch_size_.get() * 2);
+    messages_.resize(batch_size_.get());
+
     thread_ = std::thread([this] {
         // Create UDP socket
         socket_ = socket(AF_INET, SOCK_DGRAM, 0);
@@ -87,35 +118,128 @@ void UdpTransmitterOp::start()
         while (true) {
             std::unique_lock<std::mutex> lock(mutex_);
             cv_.wait(lock, [this] { return !running_ || (!tensor_queue_.empty()); });
-            if (!running_)
+            // After stop(), finish sending whatever is already queued.
+            if (tensor_queue_.empty())
                 break;
             auto tensor = std::move(tensor_queue_.front());
             tensor_queue_.pop();
             lock.unlock();
             cv_.notify_all();
-            host_buffer_.resize(std::min(static_cast<int64_t>(max_buffer_size_), tensor->nbytes()));
-            memset(host_buffer_.data(), 0, host_buffer_.size());
-            cudaMemcpy(&host_buffer_.front(), tensor->data(), host_buffer_.size(), cudaMemcpyDeviceToHost);
-
-            // Send data via UDP
-            auto bytes = ::sendto(
-                socket_,
-                &host_buffer_.front(),
-                host_buffer_.size(),
-                0,
-                reinterpret_cast<sockaddr*>(&destination_address_),
-                sizeof(destination_address_));
-
-            if (bytes < 0)
-                throw std::runtime_error(fmt::format("UDP send failed: {} (errno: {})", strerror(errno), errno));
-
-            HSB_LOG_DEBUG("Socket: {}, Size: {}, Bytes sent: {}, Error: {}", socket_, host_buffer_.size(), bytes, strerror(errno));
+            send_tensor(tensor);
         }
 
         close(socket_);
     });
 }
 
+void UdpTransmitterOp::send_tensor(const Tensor& tensor)
+{
+    auto start = std::chrono::steady_clock::now();
+    size_t size = tensor->nbytes();
+    if (!segment_size_.get()) {
+        size = std::min(static_cast<size_t>(max_buffer_size_), size);
+    }
+    // Host memory is sent from where it is; device memory needs a copy.
+    const uint8_t* data = static_cast<const uint8_t*>(tensor->data());
+    auto device_type = tensor->device().device_type;
+    if ((device_type != kDLCPU) && (device_type != kDLCUDAHost) && (device_type != kDLCUDAManaged)) {
+        host_buffer_.resize(size);
+        cudaError_t cuda_error = cudaMemcpy(host_buffer_.data(), data, size, cudaMemcpyDeviceToHost);
+        if (cuda_error != cudaSuccess) {
+            HSB_LOG_ERROR("cudaMemcpy failed: {}", cudaGetErrorString(cuda_error));
+            std::lock_guard lock(metrics_mutex_);
+            metrics_.send_errors++;
+            return;
+        }
+        data = host_buffer_.data();
+    }
+
+    uint64_t datagrams = 1;
+    if (segment_size_.get()) {
+        if (size > UINT32_MAX) {
+            HSB_LOG_ERROR("Tensor size {} is too large to send.", size);
+            std::lock_guard lock(metrics_mutex_);
+            metrics_.send_errors++;
+            return;
+        }
+        if (!send_segments(data, size)) {
+            std::lock_guard lock(metrics_mutex_);
+            metrics_.send_errors++;
+            return;
+        }
+        datagrams = std::max<uint64_t>(1, (size + segment_size_.get() - 1) / segment_size_.get());
+    } else {
+        // Send data via UDP
+        auto bytes = ::sendto(
+            socket_,
+            data,
+            size,
+            0,
+            reinterpret_cast<sockaddr*>(&destination_address_),
+            sizeof(destination_address_));
+
+        if (bytes < 0)
+            throw std::runtime_error(fmt::format("UDP send failed: {} (errno: {})", strerror(errno), errno));
+
+        HSB_LOG_DEBUG("Socket: {}, Size: {}, Bytes sent: {}, Error: {}", socket_, size, bytes, strerror(errno));
+    }
+
+    double latency_s = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+    std::lock_guard lock(metrics_mutex_);
+    metrics_.tensors_sent++;
+    metrics_.datagrams_sent += datagrams;
+    metrics_.bytes_sent += size;
+    metrics_.last_send_latency_s = latency_s;
+    metrics_.max_send_latency_s = std::max(metrics_.max_send_latency_s, latency_s);
+    metrics_.total_send_latency_s += latency_s;
+}
+
+bool UdpTransmitterOp::send_segments(const uint8_t* data, size_t size)
+{
+    const size_t segment_size = segment_size_.get();
+    const size_t batch_size = batch_size_.get();
+    // An empty tensor is still sent, as a datagram with just a header.
+    const size_t segments = std::max<size_t>(1, (size + segment_size - 1) / segment_size);
+    const uint32_t sequence = sequence_++;
+    for (size_t first = 0; first < segments; first += batch_size) {
+        const size_t count = std::min(batch_size, segments - first);
+        for (size_t i = 0; i < count; i++) {
+            const size_t offset = (first + i) * segment_size;
+            const size_t length = std::min(segment_size, size - offset);
+            SegmentHeader& header = headers_[i];
+            header.sequence = htonl(sequence);
+            header.offset = htonl(static_cast<uint32_t>(offset));
+            header.tensor_size = htonl(static_cast<uint32_t>(size));
+            ::iovec* iov = &iovecs_[i * 2];
+            iov[0].iov_base = &header;
+            iov[0].iov_len = sizeof(header);
+            iov[1].iov_base = const_cast<uint8_t*>(data + offset);
+            iov[1].iov_len = length;
+            ::msghdr& msg = messages_[i].msg_hdr;
+            msg = {};
+            msg.msg_name = &destination_address_;
+            msg.msg_namelen = sizeof(destination_address_);
+            msg.msg_iov = iov;
+            msg.msg_iovlen = length ? 2 : 1;
+        }
+        // sendmmsg may stop early; send whatever it didn't.
+        size_t sent = 0;
+        while (sent < count) {
+            int r = ::sendmmsg(socket_, &messages_[sent], count - sent, 0);
+            if (r < 0) {
+                if (errno == EINTR) {
+                    continue;
+                }
+                HSB_LOG_ERROR("sendmmsg failed: {} (errno: {})", strerror(errno), errno);
+                return false;
+            }
+            sent += r;
+        }
+    }
+    HSB_LOG_DEBUG("Socket: {}, Size: {}, Sequence: {}, Datagrams: {}", socket_, size, sequence, segments);
+    return true;
+}
+
 void UdpTransmitterOp::stop()
 {
     running_ = false;
@@ -141,6 +265,8 @@ void UdpTransmitterOp::queue_buffer(Tensor buffer)
     std::unique_lock<std::mutex> lock(mutex_);
     if (lossy_.get() && tensor_queue_.size() >= queue_size_.get()) {
         HSB_LOG_DEBUG("Dropping buffer due to lossy mode and full queue");
+        std::lock_guard metrics_lock(metrics_mutex_);
+        metrics_.tensors_dropped++;
         return;
     }
     cv_.wait(lock, [this] { return tensor_queue_.size() < queue_size_.get(); });
@@ -149,4 +275,10 @@ void UdpTransmitterOp::queue_buffer(Tensor buffer)
     cv_.notify_all();
 }
 
+UdpTransmitterOp::Metrics UdpTransmitterOp::get_metrics()
+{
+    std::lock_guard lock(metrics_mutex_);
+    return metrics_;
+}
+
 } // namespace hololink::operators
@@ -29,13 +29,51 @@
 #include <holoscan/holoscan.hpp>
 
 #include <arpa/inet.h>
+#include <sys/socket.h>
+#include <sys/uio.h>
 
 namespace hololink::operators {
 
+/**
+ * Sends each received tensor over UDP. By default, a tensor is sent
+ * as one datagram of at most max_buffer_size bytes, with anything
+ * beyond that dropped. With segment_size set, the whole tensor is
+ * sent as a series of datagrams, each carrying up to segment_size
+ * bytes of it after a UdpTransmitterOp::SegmentHeader, in batches of
+ * up to batch_size datagrams per sendmmsg call. Tensors in host
+ * memory are sent directly from the tensor; device tensors are copied
+ * to a host buffer first.
+ */
 class UdpTransmitterOp : public holoscan::Operator {
 public:
     HOLOSCAN_OPERATOR_FORWARD_ARGS(UdpTransmitterOp)
 
+    /**
+     * Precedes the data in each datagram in segmenting mode; all
+     * fields are in network byte order. A receiver has the complete
+     * tensor when it has tensor_size bytes with the same sequence.
+     */
+    struct SegmentHeader {
+        uint32_t sequence; // increments with each tensor
+        uint32_t offset; // of this data within the tensor
+        uint32_t tensor_size;
+    };
+    static_assert(sizeof(SegmentHeader) == 12);
+
+    struct Metrics {
+        uint64_t tensors_sent = 0;
+        // Tensors discarded because the queue was full, in lossy mode
+        uint64_t tensors_dropped = 0;
+        // Tensors not sent because of a CUDA or socket error
+        uint64_t send_errors = 0;
+        uint64_t datagrams_sent = 0;
+        uint64_t bytes_sent = 0;
+        // Time from dequeuing each tensor until its last datagram is sent
+        double last_send_latency_s = 0;
+        double max_send_latency_s = 0;
+        double total_send_latency_s = 0;
+    };
+
     UdpTransmitterOp() = default;
 
     void setup(holoscan::OperatorSpec& spec) override;
@@ -46,6 +84,8 @@ public:
     void compute(holoscan::InputContext& op_input, holoscan::OutputContext& op_output,
         holoscan::ExecutionContext& context) override;
 
+    Metrics get_metrics();
+
 private:
     std::mutex mutex_;
     std::condition_variable cv_;
@@ -57,6 +97,17 @@ private:
     std::queue<Tensor> tensor_queue_;
     std::vector<uint8_t> host_buffer_;
     void queue_buffer(Tensor buffer);
+    void send_tensor(const Tensor& tensor);
+    bool send_segments(const uint8_t* data, size_t size);
+
+    // Segmenting mode state
+    uint32_t sequence_ = 0;
+    std::vector<SegmentHeader> headers_;
+    std::vector<::iovec> iovecs_;
+    std::vector<::mmsghdr> messages_;
+
+    std::mutex metrics_mutex_;
+    Metrics metrics_;
 
     // Parameters
     holoscan::Parameter<std::string> destination_ip_;
@@ -64,6 +115,8 @@ private:
     holoscan::Parameter<uint16_t> max_buffer_size_;
     holoscan::Parameter<uint16_t> queue_size_;
     holoscan::Parameter<bool> lossy_;
+    holoscan::Parameter<uint16_t> segment_size_;
+    holoscan::Parameter<uint16_t> batch_size_;
 };
 
 } // namespace hololink::operators
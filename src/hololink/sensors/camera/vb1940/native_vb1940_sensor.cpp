@@ -709,6 +709,17 @@ std::vector<uint8_t> NativeVb1940Sensor::get_eeprom_page(uint32_t page_num, uint
         throw std::out_of_range("EEPROM read exceeds page boundary");
     }
     uint16_t register_addr = static_cast<uint16_t>((page_num << 6) + page_offset);
+    return get_eeprom_buffer(register_addr, data_len);
+}
+
+std::vector<uint8_t> NativeVb1940Sensor::get_eeprom_buffer(uint16_t register_addr, uint32_t data_len)
+{
+    if (data_len > EEPROM_READ_SIZE) {
+        throw std::out_of_range("EEPROM read exceeds " + std::to_string(EEPROM_READ_SIZE) + " bytes");
+    }
+    if (register_addr + data_len > EEPROM_MAX_PAGE_NUM * EEPROM_PAGE_SIZE) {
+        throw std::out_of_range("EEPROM read exceeds the end of EEPROM");
+    }
     std::vector<uint8_t> write_bytes(2);
     core::Serializer serializer(write_bytes.data(), write_bytes.size());
     serializer.append_uint16_be(register_addr);
@@ -722,7 +733,7 @@ std::vector<uint8_t> NativeVb1940Sensor::get_eeprom_page(uint32_t page_num, uint
         throw std::runtime_error("Read " + std::to_string(data.size()) + " != " + std::to_string(read_byte_count));
     }
 
-    HSB_LOG_DEBUG("get_eeprom_page(register={}(0x{:X}),buffer_size={})", register_addr, register_addr, data.size());
+    HSB_LOG_DEBUG("get_eeprom_buffer(register={}(0x{:X}),buffer_size={})", register_addr, register_addr, data.size());
 
     return data;
 }
@@ -815,17 +826,11 @@ CalibrationData NativeVb1940Sensor::read_calibration_from_eeprom(bool rgb)
         if (rgb) {
             // RGB calibration data: pages 0-3
             HSB_LOG_DEBUG("Reading RGB calibration data from EEPROM pages 0-3");
-            for (uint32_t page = 0; page < calib_pages; ++page) {
-                auto page_data = get_eeprom_page(page);
-                calib_data_raw.insert(calib_data_raw.end(), page_data.begin(), page_data.end());
-            }
+            calib_data_raw = get_eeprom_buffer(0, CALIB_SIZE);
         } else {
             // IR calibration data: pages 4-7
             HSB_LOG_DEBUG("Reading IR calibration data from EEPROM pages 4-7");
-            for (uint32_t page = calib_pages; page < calib_pages * 2; ++page) {
-                auto page_data = get_eeprom_page(page);
-                calib_data_raw.insert(calib_data_raw.end(), page_data.begin(), page_data.end());
-            }
+            calib_data_raw = get_eeprom_buffer(calib_pages * EEPROM_PAGE_SIZE, CALIB_SIZE);
         }
 
         // Convert bytes to doubles
@@ -65,6 +65,8 @@ public:
     static constexpr uint32_t EEPROM_I2C_ADDRESS = 0x51;
     static constexpr uint32_t EEPROM_MAX_PAGE_NUM = 256;
     static constexpr uint32_t EEPROM_PAGE_SIZE = 64;
+    // The most we can read in one I2C transaction.
+    static constexpr uint32_t EEPROM_READ_SIZE = 256;
     static constexpr uint32_t CALIB_SIZE = 256;
     static constexpr uint32_t VCL_EN_I2C_ADDRESS_1 = 0x70;
     static constexpr uint32_t VCL_EN_I2C_ADDRESS_2 = 0x71;
@@ -123,6 +125,9 @@ protected:
     // EEPROM access methods
     uint8_t get_eeprom_register(uint16_t reg);
     std::vector<uint8_t> get_eeprom_page(uint32_t page_num = 0, uint32_t page_offset = 0, uint32_t data_len = 64);
+    // Sequential reads aren't limited to a page; this reads up to
+    // EEPROM_READ_SIZE bytes in one transaction.
+    std::vector<uint8_t> get_eeprom_buffer(uint16_t register_addr, uint32_t data_len);
     void set_eeprom_register(uint16_t reg, uint8_t value, const std::shared_ptr<Timeout>& timeout = nullptr);
     void set_eeprom_page(uint32_t page_num, uint32_t page_offset, const std::vector<uint8_t>& data_buffer, const std::shared_ptr<Timeout>& timeout = nullptr);
 
@@ -15,6 +15,8 @@
 
 # See README.md for detailed information.
 
+import collections
+import contextlib
 import json
 import logging
 import logging.handlers
@@ -247,6 +249,12 @@ def pytest_addoption(parser):
         default=False,
         help="Include tests for HSBEmulator.",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Include long-running benchmark tests.",
+    )
     parser.addoption(
         "--hw-loopback",
         nargs=2,
@@ -350,6 +358,11 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "skip_unless_audio" in item.keywords:
                 item.add_marker(skip_audio)
+    if not config.getoption("--benchmark"):
+        skip_benchmark = pytest.mark.skip(reason="Tests only run in --benchmark mode.")
+        for item in items:
+            if "skip_unless_benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
 
 
 @pytest.fixture
@@ -414,6 +427,71 @@ def audio_enable(request):
     return request.config.getoption("--audio")
 
 
+class CountingHololink(hololink_module.Hololink):
+    """Counts the control plane requests sent: in total (requests) and
+    by command code (commands)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = 0
+        self.commands = collections.Counter()
+
+    def send_control(self, request):
+        self.requests += 1
+        self.commands[request[0]] += 1
+        super().send_control(request)
+
+    def reads(self):
+        return (
+            self.commands[hololink_module.RD_DWORD]
+            + self.commands[hololink_module.RD_BLOCK]
+        )
+
+    def count(self, f, *args):
+        """Returns (requests sent, result) for f(*args)."""
+        requests = self.requests
+        r = f(*args)
+        return self.requests - requests, r
+
+
+@contextlib.contextmanager
+def _counting_hololink(**kwargs):
+    kwargs.setdefault("sequence_number_checking", False)
+    hololink = CountingHololink(**kwargs)
+    hololink.start()
+    try:
+        yield hololink
+    finally:
+        hololink.stop()
+
+
+# "with counting_hololink_factory(peer_ip=..., ...) as hololink:" gives
+# a started CountingHololink, e.g. for tests that run the emulator.
+@pytest.fixture
+def counting_hololink_factory():
+    return _counting_hololink
+
+
+@pytest.fixture
+def mock_hololink_server(mock_camera_ip):
+    import mock_server
+
+    with mock_server.TestServer(mock_camera_ip) as server:
+        yield server
+
+
+# A started CountingHololink connected to mock_hololink_server.
+@pytest.fixture
+def counting_hololink(mock_hololink_server):
+    channel_metadata = mock_hololink_server.channel_metadata()
+    with _counting_hololink(
+        peer_ip=channel_metadata["peer_ip"],
+        control_port=channel_metadata["control_port"],
+        serial_number=channel_metadata["serial_number"],
+    ) as hololink:
+        yield hololink
+
+
 # given an interface name, return the current, first, IPv4 address in CIDR notation, if it has one or None if it does not.
 # the return is primarily used by the scripts/nsjoin.sh script to reset the interface to an address it had before being isolated, otherwise is can end up down or with no configuration.
 def get_if_ip(if_name):
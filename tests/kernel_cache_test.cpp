@@ -0,0 +1,215 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "gtest/gtest.h"
+
+#include <stdlib.h>
+
+#include <atomic>
+#include <chrono>
+#include <filesystem>
+#include <fstream>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+#include <hololink/common/kernel_cache.hpp>
+
+namespace hololink::tests {
+
+namespace fs = std::filesystem;
+using hololink::common::KernelCache;
+
+// Stands in for NVRTC: produces a different image for each key,
+// including NULs as cubins do, and counts how often it's called.
+class StubCompiler {
+public:
+    KernelCache::Compiler operator()(const std::string& key)
+    {
+        return [this, key]() {
+            calls_++;
+            std::this_thread::sleep_for(std::chrono::milliseconds(10));
+            return image(key);
+        };
+    }
+
+    static std::string image(const std::string& key)
+    {
+        return std::string("\x7f" "ELF\0", 5) + key + std::string(1000, '\0');
+    }
+
+    unsigned calls() const { return calls_; }
+
+private:
+    std::atomic<unsigned> calls_ { 0 };
+};
+
+class KernelCacheTest : public testing::Test {
+protected:
+    void SetUp() override
+    {
+        std::string pattern = (fs::temp_directory_path() / "kernel_cache_test.XXXXXX").string();
+        ASSERT_NE(mkdtemp(pattern.data()), nullptr);
+        directory_ = pattern;
+    }
+
+    void TearDown() override { fs::remove_all(directory_); }
+
+    std::vector<fs::path> files()
+    {
+        std::vector<fs::path> r;
+        for (auto&& entry : fs::directory_iterator(directory_)) {
+            r.push_back(entry.path());
+        }
+        return r;
+    }
+
+    fs::path directory_;
+    StubCompiler compiler_;
+};
+
+TEST_F(KernelCacheTest, MissThenHit)
+{
+    KernelCache kernel_cache(directory_.string());
+    std::string key = "nvrtc 12.6 cubin\n--gpu-architecture=sm_87\n\n__global__ void f() {}";
+    EXPECT_EQ(kernel_cache.get(key, compiler_(key)), StubCompiler::image(key));
+    EXPECT_EQ(kernel_cache.get(key, compiler_(key)), StubCompiler::image(key));
+    EXPECT_EQ(compiler_.calls(), 1u);
+    auto stats = kernel_cache.stats();
+    EXPECT_EQ(stats.misses, 1u);
+    EXPECT_EQ(stats.hits, 1u);
+    EXPECT_GE(stats.compile_s, 0.01);
+    EXPECT_LT(stats.load_s, stats.compile_s);
+    ASSERT_EQ(files().size(), 1u);
+    EXPECT_EQ(files()[0].filename().string(), KernelCache::entry_name(key));
+
+    // Another cache on the same directory, as in the next process, hits.
+    KernelCache other(directory_.string());
+    EXPECT_EQ(other.get(key, compiler_(key)), StubCompiler::image(key));
+    EXPECT_EQ(compiler_.calls(), 1u);
+    EXPECT_EQ(other.stats().hits, 1u);
+
+    // Different options or architecture compile again.
+    std::string other_key = "nvrtc 12.6 cubin\n--gpu-architecture=sm_89\n\n__global__ void f() {}";
+    EXPECT_NE(KernelCache::entry_name(key), KernelCache::entry_name(other_key));
+    EXPECT_EQ(kernel_cache.get(other_key, compiler_(other_key)), StubCompiler::image(other_key));
+    EXPECT_EQ(compiler_.calls(), 2u);
+}
+
+TEST_F(KernelCacheTest, CompileFailure)
+{
+    KernelCache kernel_cache(directory_.string());
+    EXPECT_THROW(kernel_cache.get("key", []() -> std::string { throw std::runtime_error("Failed to compile"); }),
+        std::runtime_error);
+    EXPECT_TRUE(files().empty());
+    EXPECT_EQ(kernel_cache.get("key", compiler_("key")), StubCompiler::image("key"));
+}
+
+TEST_F(KernelCacheTest, Disabled)
+{
+    KernelCache kernel_cache("");
+    kernel_cache.get("key", compiler_("key"));
+    kernel_cache.get("key", compiler_("key"));
+    EXPECT_EQ(compiler_.calls(), 2u);
+    EXPECT_EQ(kernel_cache.stats().misses, 2u);
+}
+
+TEST_F(KernelCacheTest, InvalidEntry)
+{
+    KernelCache kernel_cache(directory_.string());
+    fs::path path = directory_ / KernelCache::entry_name("key");
+    std::ofstream(path) << "truncated";
+    EXPECT_EQ(kernel_cache.get("key", compiler_("key")), StubCompiler::image("key"));
+    EXPECT_EQ(kernel_cache.stats().errors, 1u);
+    // Storing the compiled image replaced it.
+    EXPECT_EQ(kernel_cache.get("key", compiler_("key")), StubCompiler::image("key"));
+    EXPECT_EQ(compiler_.calls(), 1u);
+
+    // An entry for a different key (a hash collision) isn't used.
+    fs::copy_file(path, directory_ / KernelCache::entry_name("other"));
+    EXPECT_EQ(kernel_cache.get("other", compiler_("other")), StubCompiler::image("other"));
+    EXPECT_EQ(compiler_.calls(), 2u);
+}
+
+TEST_F(KernelCacheTest, LeastRecentlyUsedEviction)
+{
+    // Room for two entries.
+    uint64_t entry_size = fs::file_size([&]() {
+        KernelCache(directory_.string()).get("a", compiler_("a"));
+        return directory_ / KernelCache::entry_name("a");
+    }());
+    KernelCache kernel_cache(directory_.string(), entry_size * 2 + entry_size / 2);
+    auto later = [&]() { std::this_thread::sleep_for(std::chrono::milliseconds(20)); };
+    later();
+    kernel_cache.get("b", compiler_("b"));
+    later();
+    kernel_cache.get("a", compiler_("a")); // now "b" is the least recently used
+    EXPECT_EQ(kernel_cache.stats().hits, 1u);
+    later();
+    kernel_cache.get("c", compiler_("c"));
+    EXPECT_EQ(kernel_cache.stats().evictions, 1u);
+    EXPECT_TRUE(fs::exists(directory_ / KernelCache::entry_name("a")));
+    EXPECT_FALSE(fs::exists(directory_ / KernelCache::entry_name("b")));
+    EXPECT_TRUE(fs::exists(directory_ / KernelCache::entry_name("c")));
+
+    // An entry bigger than the whole cache is kept until the next store.
+    KernelCache tiny(directory_.string(), 1);
+    tiny.get("d", compiler_("d"));
+    ASSERT_EQ(files().size(), 1u);
+    EXPECT_EQ(files()[0].filename().string(), KernelCache::entry_name("d"));
+}
+
+TEST_F(KernelCacheTest, AbandonedTemporaryFiles)
+{
+    fs::path abandoned = directory_ / (KernelCache::entry_name("x") + ".1234.0.tmp");
+    fs::path in_progress = directory_ / (KernelCache::entry_name("y") + ".1235.0.tmp");
+    std::ofstream(abandoned) << "partial";
+    std::ofstream(in_progress) << "partial";
+    fs::last_write_time(abandoned, fs::file_time_type::clock::now() - std::chrono::hours(2));
+    KernelCache(directory_.string()).get("key", compiler_("key"));
+    EXPECT_FALSE(fs::exists(abandoned));
+    EXPECT_TRUE(fs::exists(in_progress));
+}
+
+TEST_F(KernelCacheTest, ConcurrentWriters)
+{
+    // Caches sharing a directory, as separate processes would, all
+    // racing to compile and store the same keys.
+    constexpr unsigned THREADS = 8;
+    std::vector<std::thread> threads;
+    std::atomic<unsigned> mismatches { 0 };
+    for (unsigned i = 0; i < THREADS; i++) {
+        threads.emplace_back([&]() {
+            KernelCache kernel_cache(directory_.string());
+            for (unsigned j = 0; j < 20; j++) {
+                std::string key = std::to_string(j % 4);
+                if (kernel_cache.get(key, compiler_(key)) != StubCompiler::image(key)) {
+                    mismatches++;
+                }
+            }
+        });
+    }
+    for (auto&& thread : threads) {
+        thread.join();
+    }
+    EXPECT_EQ(mismatches, 0u);
+    EXPECT_LE(compiler_.calls(), THREADS * 4);
+    // No temporary files are left behind.
+    EXPECT_EQ(files().size(), 4u);
+}
+
+} // namespace hololink::tests
@@ -18,6 +18,7 @@
 import argparse
 import collections
 import ctypes
+import errno
 import logging
 import multiprocessing
 import os
@@ -101,19 +102,14 @@ def generate_image(bayer_height, bayer_width, bayer_format, pixel_format):
     line_start = np.array([255] * line_start_size, dtype=np.uint8)
     line_end = np.array([255] * line_end_size, dtype=np.uint8)
     frame_end = np.array([255] * frame_end_size, dtype=np.uint8)
-    csi_image_data = np.concatenate([frame_start])
     # These guys need to be 8-byte aligned.
     assert (len(bayer_image[0]) & 7) == 0
+    # Concatenate once; growing the array line by line is quadratic.
+    pieces = [frame_start]
     for line in bayer_image:
-        csi_image_data = np.concatenate(
-            [
-                csi_image_data,
-                line_start,
-                line,
-                line_end,
-            ]
-        )
-    csi_image_data = np.concatenate([csi_image_data, frame_end])
+        pieces.extend([line_start, line, line_end])
+    pieces.append(frame_end)
+    csi_image_data = np.concatenate(pieces)
     return csi_image_data
 
 
@@ -226,6 +222,199 @@ class InfinibandFormatter:
         return self._format_ib_packet(ib)
 
 
+# Offsets within a RoCE write packet from InfinibandFormatter.format_write.
+IB_PSN_OFFSET = 20 + 8 + 8  # IP, UDP, then BTH opcode/flags/partition/QP
+IB_ADDRESS_OFFSET = IB_PSN_OFFSET + 4
+IB_WRITE_HEADER_SIZE = IB_ADDRESS_OFFSET + 16  # RETH address/rkey/length
+ICRC_SIZE = 4
+
+
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr), ("msg_len", ctypes.c_uint)]
+
+
+_libc = ctypes.CDLL(None, use_errno=True)
+_sendmmsg = getattr(_libc, "sendmmsg", None)
+
+
+class FrameSynthesizer:
+    """
+    Produces the same packets as calling InfinibandFormatter.format_write
+    for each payload_size slice of csi_image_data, but for the whole
+    frame at once.  The packets live in a preallocated matrix, one row
+    each, built from a header template; per frame only the PSN and
+    address fields are patched, through strided views over that matrix.
+    The iCRC is affine in the packet content, so it's assembled from a
+    per-packet payload term, computed once per image, and per-byte
+    tables for the PSN and address fields.  Rows are transmitted in
+    batches with sendmmsg.
+    """
+
+    def __init__(self, formatter, payload_size, csi_image_data, batch_size=1024):
+        self._formatter = formatter
+        self._payload_size = payload_size
+        self._batch_size = batch_size
+        image = np.asarray(csi_image_data, dtype=np.uint8).ravel()
+        count = len(image) // payload_size
+        self._count = count
+        self._full_size = count * payload_size
+        # The last packet, if short, is formatted the usual way.
+        self._remainder = bytes(image[self._full_size :])
+        packet_size = IB_WRITE_HEADER_SIZE + payload_size + ICRC_SIZE
+        template = np.frombuffer(
+            formatter.format_write(0, 0, bytes(payload_size)), dtype=np.uint8
+        )
+        assert len(template) == packet_size
+        self._packets = np.empty((count, packet_size), dtype=np.uint8)
+        self._packets[:] = template
+        payload = self._packets[:, IB_WRITE_HEADER_SIZE:-ICRC_SIZE]
+        payload[:] = image[: self._full_size].reshape(count, payload_size)
+        # Views of the fields we patch.
+        self._psn = self._packets[:, IB_PSN_OFFSET : IB_PSN_OFFSET + 4].view(">u4")
+        self._address = self._packets[
+            :, IB_ADDRESS_OFFSET : IB_ADDRESS_OFFSET + 8
+        ].view(">u8")
+        self._icrc = self._packets[:, -ICRC_SIZE:].view("<u4")
+        self._index = np.arange(count, dtype=np.uint64).reshape(count, 1)
+        self._init_icrc(payload)
+        self._messages = None
+
+    def _init_icrc(self, payload):
+        # The iCRC covers the IP and UDP headers with the variant fields
+        # set to all 1s, then the IB headers and payload.
+        ib_size = IB_WRITE_HEADER_SIZE - 20 - 8 + self._payload_size
+        udp = self._formatter._format_udp(
+            payload_size=ib_size + ICRC_SIZE, udp_checksum=0xFFFF
+        )
+        ip = self._formatter._format_ip(
+            tos=0xFF,
+            payload_size=len(udp) + ib_size + ICRC_SIZE,
+            ttl=0xFF,
+            header_checksum=0xFFFF,
+        )
+        message = bytearray(self._packets[0, :-ICRC_SIZE].tobytes())
+        message[: len(ip)] = ip
+        message[len(ip) : len(ip) + len(udp)] = udp
+        message[IB_PSN_OFFSET : IB_WRITE_HEADER_SIZE - 8] = bytes(12)
+        message[IB_WRITE_HEADER_SIZE:] = bytes(self._payload_size)
+        message_size = len(message)
+        # crc(m) = crc(zeros) ^ g(m) with g linear; so for each packet,
+        # crc = crc(template) ^ g(payload) ^ g(psn and address bytes).
+        zero_crc = zlib.crc32(bytes(message_size), icrc_initializer)
+        self._template_crc = zlib.crc32(message, icrc_initializer)
+        header_crc = zlib.crc32(bytes(IB_WRITE_HEADER_SIZE), icrc_initializer)
+        self._payload_crc = np.fromiter(
+            (zlib.crc32(row, header_crc) ^ zero_crc for row in payload),
+            dtype=np.uint32,
+            count=self._count,
+        )
+        field_size = IB_WRITE_HEADER_SIZE - 8 - IB_PSN_OFFSET
+        bit_terms = np.zeros((field_size, 8), dtype=np.uint32)
+        for k in range(field_size):
+            prefix = bytes(IB_PSN_OFFSET + k)
+            suffix = bytes(message_size - IB_PSN_OFFSET - k - 1)
+            for bit in range(8):
+                crc = zlib.crc32(prefix + bytes([1 << bit]), icrc_initializer)
+                bit_terms[k, bit] = zlib.crc32(suffix, crc) ^ zero_crc
+        bits = ((np.arange(256).reshape(256, 1) >> np.arange(8)) & 1).astype(bool)
+        self._field_tables = np.bitwise_xor.reduce(
+            np.where(bits, bit_terms.reshape(field_size, 1, 8), np.uint32(0)),
+            axis=2,
+        )
+
+    def packet_count(self):
+        """Packets per frame, not counting the metadata packet."""
+        return self._count + (1 if self._remainder else 0)
+
+    def frame(self, psn, address):
+        """Patch the packet matrix for a frame starting at psn and
+        address; returns (packets, last) where packets is the matrix and
+        last is the short final packet, or None."""
+        self._psn[:] = (self._index + psn) & 0xFFFFFFFF
+        self._address[:] = self._index * self._payload_size + address
+        fields = self._packets[:, IB_PSN_OFFSET : IB_WRITE_HEADER_SIZE - 8]
+        icrc = self._payload_crc ^ np.uint32(self._template_crc)
+        for k in range(fields.shape[1]):
+            icrc ^= self._field_tables[k][fields[:, k]]
+        self._icrc[:, 0] = icrc
+        last = None
+        if self._remainder:
+            last = self._formatter.format_write(
+                (psn + self._count) & 0xFFFFFFFF,
+                address + self._full_size,
+                self._remainder,
+            )
+        return self._packets, last
+
+    def _build_messages(self, destination):
+        if self._messages is not None and self._destination == destination:
+            return
+        self._destination = destination
+        sockaddr = struct.pack(
+            "=HH4s8x",
+            socket.AF_INET,
+            socket.htons(destination[1]),
+            socket.inet_aton(destination[0]),
+        )
+        self._sockaddr = ctypes.create_string_buffer(sockaddr, len(sockaddr))
+        base = self._packets.ctypes.data
+        stride = self._packets.strides[0]
+        self._iovecs = (_iovec * self._count)()
+        self._messages = (_mmsghdr * self._count)()
+        for i in range(self._count):
+            self._iovecs[i].iov_base = base + i * stride
+            self._iovecs[i].iov_len = self._packets.shape[1]
+            header = self._messages[i].msg_hdr
+            header.msg_name = ctypes.addressof(self._sockaddr)
+            header.msg_namelen = ctypes.sizeof(self._sockaddr)
+            header.msg_iov = ctypes.pointer(self._iovecs[i])
+            header.msg_iovlen = 1
+
+    def send_frame(self, data_socket, destination, psn, address):
+        """Transmit a frame's packets to destination (ip, port); returns
+        the PSN following the last packet sent."""
+        packets, last = self.frame(psn, address)
+        if _sendmmsg is None:
+            for packet in packets:
+                data_socket.sendto(packet, destination)
+        else:
+            self._build_messages(destination)
+            fd = data_socket.fileno()
+            sent = 0
+            message_size = ctypes.sizeof(_mmsghdr)
+            while sent < self._count:
+                batch = min(self._batch_size, self._count - sent)
+                r = _sendmmsg(
+                    fd, ctypes.byref(self._messages, sent * message_size), batch, 0
+                )
+                if r < 0:
+                    error = ctypes.get_errno()
+                    if error in (errno.EINTR, errno.EAGAIN, errno.ENOBUFS):
+                        time.sleep(0)
+                        continue
+                    raise OSError(error, os.strerror(error))
+                sent += r
+        if last is not None:
+            data_socket.sendto(last, destination)
+        return psn + self.packet_count()
+
+
 class I2c:
     def __init__(self, server, address):
         self._server = server
@@ -317,6 +506,210 @@ class I2c:
         return True
 
 
+class StratixMailbox:
+    """Models the Stratix 10 SDM mailbox client, with enough of the SDM
+    commands (and a QSPI flash) for tools/hololink.py to program and
+    verify an image.  The command FIFO is smaller than a QSPI_WRITE
+    command, so writers have to follow FIFO_SPACE; writing to a full
+    FIFO sets an error bit in ISR."""
+
+    ADDRESS = 0x3000_0000
+    # Registers
+    COMMAND = 0x00
+    COMMAND_EOP = 0x04
+    FIFO_SPACE = 0x08
+    RESPONSE = 0x14
+    STATUS = 0x18
+    ISR = 0x20
+    SIZE = 0x30
+    # ISR bits
+    ISR_RESPONSE_VALID = 0x001
+    ISR_COMMAND_OVERFLOW = 0x008
+    # Commands
+    GET_IDCODE = 0x10
+    GET_CHIPID = 0x12
+    RSU_STATUS = 0x5B
+    RSU_IMAGE_UPDATE = 0x5C
+    QSPI_OPEN = 0x32
+    QSPI_CLOSE = 0x33
+    QSPI_SET_CS = 0x34
+    QSPI_ERASE = 0x38
+    QSPI_WRITE = 0x39
+    QSPI_READ = 0x3A
+    # Errors
+    INVALID_COMMAND = 0x001
+    QSPI_NOT_OPENED_BY_CLIENT = 0x008
+    #
+    FIFO_WORDS = 256
+    IDCODE = 0x4361_00DD
+    CHIPID = [0x1234_5678, 0x9ABC_DEF0]
+    APPLICATION_ADDRESS = 0xB10000
+
+    def __init__(self):
+        # Words in the command FIFO that the SDM hasn't taken yet
+        self._fifo = []
+        # Words of the current command that the SDM has taken
+        self._command = []
+        # (value, sop, eop)
+        self._response = collections.deque()
+        self._isr = 0
+        self._qspi_open = False
+        # Flash word address to value; erased words aren't here.
+        self._flash = {}
+
+    def owns(self, address):
+        return self.ADDRESS <= address < (self.ADDRESS + self.SIZE)
+
+    def _take(self):
+        self._command.extend(self._fifo)
+        self._fifo = []
+
+    def memory_write(self, address, value):
+        reg = address - self.ADDRESS
+        if reg in (self.COMMAND, self.COMMAND_EOP):
+            if len(self._fifo) >= self.FIFO_WORDS:
+                logging.error(f"Stratix mailbox command FIFO overflow; {value=:#x}")
+                self._isr |= self.ISR_COMMAND_OVERFLOW
+                return
+            self._fifo.append(value)
+            if reg == self.COMMAND_EOP:
+                self._take()
+                self._execute(self._command)
+                self._command = []
+        elif reg == self.ISR:
+            self._isr &= ~value
+
+    def memory_read(self, address):
+        reg = address - self.ADDRESS
+        if reg == self.FIFO_SPACE:
+            # Each time the host looks, the SDM has caught up.
+            self._take()
+            return self.FIFO_WORDS - len(self._fifo)
+        if reg == self.STATUS:
+            if len(self._response) == 0:
+                return 0
+            _, sop, eop = self._response[0]
+            return (len(self._response) << 2) | (int(eop) << 1) | int(sop)
+        if reg == self.RESPONSE:
+            if len(self._response) == 0:
+                return 0
+            value, _, _ = self._response.popleft()
+            if len(self._response) == 0:
+                self._isr &= ~self.ISR_RESPONSE_VALID
+            return value
+        if reg == self.ISR:
+            return self._isr
+        return 0
+
+    def _execute(self, words):
+        header, args = words[0], words[1:]
+        response_id, length, command = (
+            (header >> 24) & 0xF,
+            (header >> 12) & 0x7FF,
+            header & 0x3FF,
+        )
+        logging.debug(f"{response_id=} {length=} {command=:#x}")
+        assert length == len(args)
+        error_code, data = 0, []
+        if command == self.GET_IDCODE:
+            data = [self.IDCODE]
+        elif command == self.GET_CHIPID:
+            data = self.CHIPID
+        elif command == self.RSU_STATUS:
+            data = [self.APPLICATION_ADDRESS, 0, 0, 0, 0, 0x202, 0, 0, 0]
+        elif command == self.RSU_IMAGE_UPDATE:
+            pass
+        elif command == self.QSPI_OPEN:
+            self._qspi_open = True
+        elif command == self.QSPI_CLOSE:
+            if self._qspi_open:
+                self._qspi_open = False
+            else:
+                error_code = self.QSPI_NOT_OPENED_BY_CLIENT
+        elif command in (self.QSPI_SET_CS, self.QSPI_ERASE, self.QSPI_WRITE):
+            if not self._qspi_open:
+                error_code = self.QSPI_NOT_OPENED_BY_CLIENT
+            elif command == self.QSPI_ERASE:
+                flash_address, erase_words = args
+                for n in range(erase_words):
+                    self._flash.pop(flash_address // 4 + n, None)
+            elif command == self.QSPI_WRITE:
+                flash_address, write_words = args[:2]
+                assert len(args) == write_words + 2
+                for n, value in enumerate(args[2:]):
+                    # Programming can only clear bits.
+                    word = flash_address // 4 + n
+                    self._flash[word] = self._flash.get(word, 0xFFFFFFFF) & value
+        elif command == self.QSPI_READ:
+            if not self._qspi_open:
+                error_code = self.QSPI_NOT_OPENED_BY_CLIENT
+            else:
+                flash_address, read_words = args
+                data = [
+                    self._flash.get(flash_address // 4 + n, 0xFFFFFFFF)
+                    for n in range(read_words)
+                ]
+        else:
+            error_code = self.INVALID_COMMAND
+        response = [(response_id << 24) | ((len(data) & 0x7FF) << 12) | error_code]
+        response.extend(data)
+        for n, value in enumerate(response):
+            self._response.append((value, n == 0, n == len(response) - 1))
+        self._isr |= self.ISR_RESPONSE_VALID
+
+
+class Gpio:
+    """Models the GPIO banks (see Hololink::GPIO): pins reset to inputs,
+    and the status register shows the output value for output pins
+    and the level in "inputs" for input pins."""
+
+    # Register addresses match those in src/hololink/core/hololink.cpp.
+    OUTPUT = 0x0C
+    DIRECTION = 0x2C
+    STATUS = 0x8C
+    PIN_COUNT = 54
+    BANKS = (PIN_COUNT + 31) // 32
+
+    def __init__(self):
+        self._output = [0] * self.BANKS
+        self._direction = [0xFFFF_FFFF] * self.BANKS
+        self.inputs = [0] * self.BANKS
+
+    def _bank(self, address, base):
+        offset = address - base
+        if (0 <= offset < self.BANKS * 4) and (offset % 4 == 0):
+            return offset // 4
+        return None
+
+    def owns(self, address):
+        return any(
+            self._bank(address, base) is not None
+            for base in (self.OUTPUT, self.DIRECTION, self.STATUS)
+        )
+
+    def memory_write(self, address, value):
+        bank = self._bank(address, self.OUTPUT)
+        if bank is not None:
+            self._output[bank] = value
+            return
+        bank = self._bank(address, self.DIRECTION)
+        if bank is not None:
+            self._direction[bank] = value
+            return
+        assert False and "Unexpected write to GPIO status."
+
+    def memory_read(self, address):
+        bank = self._bank(address, self.DIRECTION)
+        if bank is not None:
+            return self._direction[bank]
+        bank = self._bank(address, self.STATUS)
+        if bank is not None:
+            direction = self._direction[bank]
+            return (self._output[bank] & ~direction) | (self.inputs[bank] & direction)
+        # The output register is write-only.
+        assert False and "Unexpected read from GPIO output."
+
+
 class MockServer:
     def __init__(self):
         self._control_udp_port = 8192
@@ -326,6 +719,8 @@ class MockServer:
         self._run = False  # publish video frames?
         self._psn = 0x1000
         self._csi_image_data = None
+        self._synthesizer = None
+        self._synthesizer_key = None
         self._bayer_height = 0
         self._bayer_width = 0
         self._bayer_format = hololink_module.sensors.csi.BayerFormat.RGGB
@@ -367,9 +762,12 @@ class MockServer:
             "vp_address": self._vp_address,
             "hif_address": self._hif_address,
             "frame_end_event": int(sensor_map[self._sensor].frame_end_event),
+            "gpio_pin_count": Gpio.PIN_COUNT,
         }
         self._i2c = I2c(self, hololink_module.I2C_CTRL)
         self._i2c_trigger = None
+        self._stratix_mailbox = StratixMailbox()
+        self._gpio = Gpio()
         self._sequencer_queue = queue.Queue()
         self._sequencer = threading.Thread(target=self.run_sequencer, daemon=True)
 
@@ -388,6 +786,9 @@ class MockServer:
         frame_number = 0
         next_page = 0
         latched_sequence = 0
+        # Like HSB, track the sequence number we expect next no matter
+        # whether the request asks for it to be checked.
+        next_sequence = None
 
         now = time.monotonic()
         # frames come in at this rate.
@@ -427,13 +828,28 @@ class MockServer:
                         sequence = deserializer.next_uint16_be()
                         deserializer.next_uint8()  # reserved
                         deserializer.next_uint8()  # reserved
+                        sequence_ok = (
+                            not (flags & hololink_module.REQUEST_FLAGS_SEQUENCE_CHECK)
+                            or (next_sequence is None)
+                            or (sequence == next_sequence)
+                        )
+                        if sequence_ok:
+                            next_sequence = (sequence + 1) & 0xFFFF
                         #
                         serializer = hololink_module.Serializer(reply)
                         reply_cmd_code = 0x80 | cmd_code
                         serializer.append_uint8(reply_cmd_code)
                         serializer.append_uint8(flags)
                         serializer.append_uint16_be(sequence)
-                        if cmd_code == hololink_module.WR_DWORD:
+                        if not sequence_ok:
+                            # The request isn't executed.
+                            serializer.append_uint8(
+                                hololink_module.RESPONSE_SEQUENCE_CHECK_FAIL
+                            )
+                            serializer.append_uint8(0)  # reserved
+                            serializer.append_uint32_be(latched_sequence)
+                            send_reply = True
+                        elif cmd_code == hololink_module.WR_DWORD:
                             address = deserializer.next_uint32_be()
                             value = deserializer.next_uint32_be()
                             status = self.memory_write(address, value)
@@ -472,6 +888,18 @@ class MockServer:
                             serializer.append_uint32_be(value)
                             serializer.append_uint32_be(latched_sequence)
                             send_reply = True
+                        elif cmd_code == hololink_module.RD_BLOCK:
+                            status = hololink_module.RESPONSE_SUCCESS
+                            serializer.append_uint8(status)
+                            serializer.append_uint8(0)  # reserved; aligns the next data
+                            while deserializer.position() < length:
+                                address = deserializer.next_uint32_be()
+                                deserializer.next_uint32_be()  # ignored
+                                value = self.memory_read(address)
+                                serializer.append_uint32_be(address)
+                                serializer.append_uint32_be(value)
+                            serializer.append_uint32_be(latched_sequence)
+                            send_reply = True
                         else:
                             serializer.append_uint8(
                                 hololink_module.RESPONSE_INVALID_CMD
@@ -566,20 +994,33 @@ class MockServer:
                             )
                             with nvtx.annotate("write-frame"):
                                 # the last packet is a bit different; don't include that here
-                                s, e = 0, payload_size
                                 csi_image_length = len(self._csi_image_data)
                                 logging.debug(
                                     f"{self._vp_address=:#X} {csi_image_length=} {payload_size=} {ip=} {target_udp_port=}"
                                 )
-                                while s < csi_image_length:
-                                    packet = formatter.format_write(
-                                        self._psn,
-                                        address + s,
-                                        bytes(self._csi_image_data[s:e]),
+                                # Only rebuild the packet templates when the
+                                # configuration or image changes.
+                                synthesizer_key = (
+                                    source_ip,
+                                    bytes(destination_ip),
+                                    target_udp_port,
+                                    qp,
+                                    rkey,
+                                    payload_size,
+                                )
+                                if (self._synthesizer is None) or (
+                                    self._synthesizer_key != synthesizer_key
+                                ):
+                                    self._synthesizer = FrameSynthesizer(
+                                        formatter, payload_size, self._csi_image_data
                                     )
-                                    data_socket.sendto(packet, (ip, target_udp_port))
-                                    s, e = e, e + payload_size
-                                    self._psn += 1
+                                    self._synthesizer_key = synthesizer_key
+                                self._psn = self._synthesizer.send_frame(
+                                    data_socket,
+                                    (ip, target_udp_port),
+                                    self._psn,
+                                    address,
+                                )
                                 assert (page & ~0xFF) == 0
                                 immediate_value = (page & 0xFF) | (
                                     (self._psn & 0xFFFFFF) << 8
@@ -624,6 +1065,12 @@ class MockServer:
 
     def memory_write(self, address, value):
         logging.debug("Writing 0x%X to 0x%X." % (value, address))
+        if self._stratix_mailbox.owns(address):
+            self._stratix_mailbox.memory_write(address, value)
+            return hololink_module.RESPONSE_SUCCESS
+        if self._gpio.owns(address):
+            self._gpio.memory_write(address, value)
+            return hololink_module.RESPONSE_SUCCESS
         self._memory[address] = value
         if address == (hololink_module.I2C_CTRL + hololink_module.I2C_REG_CONTROL):
             if self._i2c.set_control(value):
@@ -638,6 +1085,10 @@ class MockServer:
         return hololink_module.RESPONSE_SUCCESS
 
     def memory_read(self, address):
+        if self._stratix_mailbox.owns(address):
+            return self._stratix_mailbox.memory_read(address)
+        if self._gpio.owns(address):
+            return self._gpio.memory_read(address)
         value = self._memory[address]
         logging.debug("Read 0x%X from 0x%X." % (value, address))
         return value
@@ -675,7 +1126,7 @@ class MockServer:
             self._frame_time_s = 60.0 / value
             logging.trace(f"{self._frame_time_s=}")
         elif register_id == mock_camera.INITIALIZE:
-
+            self._synthesizer = None
             self._csi_image_data = generate_image(
                 self._bayer_height,
                 self._bayer_width,
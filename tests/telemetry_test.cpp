@@ -0,0 +1,185 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "gtest/gtest.h"
+
+#include <arpa/inet.h>
+#include <fcntl.h>
+#include <netinet/in.h>
+#include <sys/mman.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#include <chrono>
+#include <cstring>
+#include <string>
+#include <thread>
+
+#include <hololink/core/telemetry.hpp>
+
+namespace hololink::tests {
+
+using hololink::core::ReceiverTelemetry;
+using hololink::core::TelemetryServer;
+
+// Maps a telemetry segment the way an external scraper would.
+class SegmentReader {
+public:
+    explicit SegmentReader(const std::string& shm_name)
+    {
+        int fd = shm_open(shm_name.c_str(), O_RDONLY, 0);
+        if (fd >= 0) {
+            void* segment = mmap(NULL, sizeof(ReceiverTelemetry::Segment), PROT_READ, MAP_SHARED, fd, 0);
+            close(fd);
+            if (segment != MAP_FAILED) {
+                segment_ = static_cast<const ReceiverTelemetry::Segment*>(segment);
+            }
+        }
+    }
+
+    ~SegmentReader()
+    {
+        if (segment_) {
+            munmap(const_cast<ReceiverTelemetry::Segment*>(segment_), sizeof(ReceiverTelemetry::Segment));
+        }
+    }
+
+    const ReceiverTelemetry::Segment* segment_ = nullptr;
+};
+
+static std::string http_get(uint16_t port, const std::string& request)
+{
+    int fd = socket(AF_INET, SOCK_STREAM, 0);
+    struct sockaddr_in address = {};
+    address.sin_family = AF_INET;
+    address.sin_port = htons(port);
+    address.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    EXPECT_EQ(connect(fd, reinterpret_cast<struct sockaddr*>(&address), sizeof(address)), 0);
+    EXPECT_EQ(send(fd, request.data(), request.size(), 0), static_cast<ssize_t>(request.size()));
+    std::string response;
+    char buffer[4096];
+    ssize_t n;
+    while ((n = recv(fd, buffer, sizeof(buffer), 0)) > 0) {
+        response.append(buffer, n);
+    }
+    close(fd);
+    return response;
+}
+
+TEST(ReceiverTelemetry, SharedSegment)
+{
+    std::string shm_name;
+    {
+        ReceiverTelemetry telemetry("test_receiver");
+        shm_name = telemetry.shm_name();
+        ASSERT_FALSE(shm_name.empty());
+        SegmentReader reader(shm_name);
+        ASSERT_NE(reader.segment_, nullptr);
+        auto segment = reader.segment_;
+        EXPECT_EQ(memcmp(segment->magic, ReceiverTelemetry::MAGIC, sizeof(ReceiverTelemetry::MAGIC)), 0);
+        EXPECT_EQ(segment->size, sizeof(ReceiverTelemetry::Segment));
+        EXPECT_EQ(segment->pid, static_cast<uint32_t>(getpid()));
+        EXPECT_STREQ(segment->receiver, "test_receiver");
+
+        // Updates are visible to the reader right away.
+        telemetry.add(ReceiverTelemetry::PACKETS_RECEIVED, 10);
+        telemetry.add(ReceiverTelemetry::PACKETS_RECEIVED);
+        telemetry.add(ReceiverTelemetry::BYTES_RECEIVED, 11 * 1472);
+        EXPECT_EQ(segment->counters[ReceiverTelemetry::PACKETS_RECEIVED], 11u);
+        EXPECT_EQ(segment->counters[ReceiverTelemetry::BYTES_RECEIVED], 11u * 1472);
+        EXPECT_EQ(segment->counters[ReceiverTelemetry::PACKETS_DROPPED], 0u);
+
+        // 1us and less go in bucket 0, (2**(i-1), 2**i] us in bucket i.
+        telemetry.record_ns(ReceiverTelemetry::FRAME_WAIT, 0);
+        telemetry.record_ns(ReceiverTelemetry::FRAME_WAIT, 1000);
+        telemetry.record_ns(ReceiverTelemetry::FRAME_WAIT, 1001);
+        telemetry.record_ns(ReceiverTelemetry::FRAME_WAIT, 16'000'000);
+        telemetry.record_ns(ReceiverTelemetry::FRAME_WAIT, 3'600'000'000'000LL);
+        auto& histogram = segment->histograms[ReceiverTelemetry::FRAME_WAIT];
+        EXPECT_EQ(histogram.count, 5u);
+        EXPECT_EQ(histogram.sum_ns, 3'600'016'002'001ULL);
+        EXPECT_EQ(histogram.buckets[0], 2u);
+        EXPECT_EQ(histogram.buckets[1], 1u);
+        EXPECT_EQ(histogram.buckets[14], 1u); // 16ms <= 2**14us
+        EXPECT_EQ(histogram.buckets[ReceiverTelemetry::HISTOGRAM_BUCKETS - 1], 1u);
+
+        struct timespec start = { 100, 999'000'000 }, end = { 101, 1'000'000 };
+        telemetry.record(ReceiverTelemetry::FRAME_ASSEMBLY, start, end);
+        EXPECT_EQ(segment->histograms[ReceiverTelemetry::FRAME_ASSEMBLY].sum_ns, 2'000'000u);
+
+        auto snapshot = telemetry.snapshot();
+        EXPECT_EQ(snapshot.receiver, "test_receiver");
+        EXPECT_EQ(snapshot.counters[ReceiverTelemetry::PACKETS_RECEIVED], 11u);
+        EXPECT_EQ(snapshot.counts[ReceiverTelemetry::FRAME_WAIT], 5u);
+    }
+    // The segment goes away with the receiver.
+    EXPECT_LT(shm_open(shm_name.c_str(), O_RDONLY, 0), 0);
+}
+
+TEST(ReceiverTelemetry, NotShared)
+{
+    ReceiverTelemetry telemetry("test_receiver", false);
+    EXPECT_TRUE(telemetry.shm_name().empty());
+    telemetry.add(ReceiverTelemetry::TIMEOUTS);
+    EXPECT_EQ(telemetry.get(ReceiverTelemetry::TIMEOUTS), 1u);
+}
+
+TEST(ReceiverTelemetry, PrometheusText)
+{
+    ReceiverTelemetry first("first_receiver", false);
+    ReceiverTelemetry second("second_receiver", false);
+    first.add(ReceiverTelemetry::FRAMES_RECEIVED, 3);
+    second.add(ReceiverTelemetry::FRAMES_RECEIVED, 4);
+    second.record_ns(ReceiverTelemetry::FRAME_LATENCY, 1500);
+    second.record_ns(ReceiverTelemetry::FRAME_LATENCY, 3000);
+    std::string text = ReceiverTelemetry::prometheus_text();
+    auto labels = [](const ReceiverTelemetry& telemetry) {
+        return "receiver=\"" + telemetry.receiver() + "\",instance=\"" + std::to_string(telemetry.instance()) + "\"";
+    };
+    EXPECT_NE(text.find("# TYPE hololink_receiver_frames_received_total counter\n"), std::string::npos);
+    EXPECT_NE(text.find("hololink_receiver_frames_received_total{" + labels(first) + "} 3\n"), std::string::npos);
+    EXPECT_NE(text.find("hololink_receiver_frames_received_total{" + labels(second) + "} 4\n"), std::string::npos);
+    EXPECT_NE(text.find("# TYPE hololink_receiver_frame_latency_seconds histogram\n"), std::string::npos);
+    // Buckets are cumulative.
+    std::string bucket = "hololink_receiver_frame_latency_seconds_bucket{" + labels(second);
+    EXPECT_NE(text.find(bucket + ",le=\"1e-06\"} 0\n"), std::string::npos);
+    EXPECT_NE(text.find(bucket + ",le=\"2e-06\"} 1\n"), std::string::npos);
+    EXPECT_NE(text.find(bucket + ",le=\"4e-06\"} 2\n"), std::string::npos);
+    EXPECT_NE(text.find(bucket + ",le=\"+Inf\"} 2\n"), std::string::npos);
+    EXPECT_NE(text.find("hololink_receiver_frame_latency_seconds_sum{" + labels(second) + "} 0.000004500\n"), std::string::npos);
+    EXPECT_NE(text.find("hololink_receiver_frame_latency_seconds_count{" + labels(second) + "} 2\n"), std::string::npos);
+}
+
+TEST(TelemetryServer, Scrape)
+{
+    ReceiverTelemetry telemetry("test_receiver", false);
+    telemetry.add(ReceiverTelemetry::PACKETS_DROPPED, 7);
+    std::string expected = "hololink_receiver_packets_dropped_total{receiver=\"test_receiver\",instance=\""
+        + std::to_string(telemetry.instance()) + "\"} 7\n";
+    TelemetryServer server(0);
+    ASSERT_NE(server.get_port(), 0);
+    for (unsigned i = 0; i < 3; i++) {
+        std::string response = http_get(server.get_port(), "GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n");
+        EXPECT_EQ(response.rfind("HTTP/1.1 200 OK\r\n", 0), 0u);
+        EXPECT_NE(response.find("Content-Type: text/plain; version=0.0.4"), std::string::npos);
+        EXPECT_NE(response.find(expected), std::string::npos);
+    }
+    std::string response = http_get(server.get_port(), "POST /metrics HTTP/1.1\r\n\r\n");
+    EXPECT_EQ(response.rfind("HTTP/1.1 405", 0), 0u);
+}
+
+} // namespace hololink::tests
@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+emulator_loopback_script = os.path.join(
+    script_dir, "benchmarks", "emulator_loopback.py"
+)
+
+
+def load_emulator_loopback():
+    spec = importlib.util.spec_from_file_location(
+        "emulator_loopback", emulator_loopback_script
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.skip_unless_benchmark
+@pytest.mark.parametrize(
+    "sensors",
+    [
+        1,
+        2,
+    ],
+)
+def test_emulator_loopback(tmp_path, sensors, frames=10):
+    """A short run of the loopback benchmark produces a result
+    for each case, with every frame received."""
+    output = tmp_path / "results.json"
+    command = [
+        sys.executable,
+        emulator_loopback_script,
+        "--transport",
+        "linux",
+        "--sensors",
+        str(sensors),
+        "--frame-size",
+        str(64 * 1024),
+        "--mtu",
+        "1500",
+        "9000",
+        "--frame-rate",
+        "60",
+        "--frames",
+        str(frames),
+        "--output",
+        str(output),
+    ]
+    subprocess.run(command, check=True, timeout=120)
+    results = json.loads(output.read_text())
+    cases = results["results"]
+    assert [case["mtu"] for case in cases] == [1500, 9000]
+    for case in cases:
+        assert case["frames_sent"] == sensors * frames
+        assert case["frames_delivered"] == sensors * frames
+        assert case["frame_drop_rate"] == 0
+        assert case["packets_per_s"] > 0
+        assert 0 < case["latency_p50_s"] <= case["latency_p99_s"]
+        assert len(case["cpu"]["receiver_s"]) == sensors
+    # Bigger packets mean fewer of them.
+    assert cases[0]["packets_received"] > cases[1]["packets_received"]
+
+
+def test_emulator_loopback_compare():
+    emulator_loopback = load_emulator_loopback()
+    case = {
+        "transport": "linux",
+        "sensors": 1,
+        "frame_size": 1024,
+        "mtu": 1500,
+        "frame_rate": 0,
+        "packets_per_s": 1000.0,
+        "frames_per_s": 100.0,
+        "latency_p50_s": 0.001,
+        "latency_p99_s": 0.002,
+        "frame_drop_rate": 0.0,
+        "packet_drop_rate": 0.0,
+    }
+    baseline = {"results": [case, {**case, "mtu": 9000}]}
+    assert emulator_loopback.compare({"results": [case]}, baseline, 0.1) == []
+    # Within tolerance
+    results = {"results": [{**case, "packets_per_s": 950.0}]}
+    assert emulator_loopback.compare(results, baseline, 0.1) == []
+    results = {
+        "results": [
+            {**case, "frames_per_s": 80.0, "latency_p99_s": 0.003},
+            {**case, "mtu": 9000, "frame_drop_rate": 0.5},
+            {**case, "mtu": 4096, "frames_per_s": 1.0},  # not in the baseline
+            {**case, "sensors": 2, "skipped": "not measured"},
+        ]
+    }
+    regressions = emulator_loopback.compare(results, baseline, 0.1)
+    assert len(regressions) == 3
+    assert "frames_per_s=80.0" in regressions[0]
+    assert "latency_p99_s=0.003" in regressions[1]
+    assert "mtu=9000" in regressions[2]
+
+
+gpio_power_up_script = os.path.join(script_dir, "benchmarks", "gpio_power_up.py")
+
+
+def load_gpio_power_up():
+    spec = importlib.util.spec_from_file_location("gpio_power_up", gpio_power_up_script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.skip_unless_benchmark
+def test_gpio_power_up(tmp_path):
+    """Bulk GPIO updates take fewer requests than updating each pin,
+    and the fr_imx* expander sequences don't re-read what they wrote."""
+    output = tmp_path / "results.json"
+    command = [
+        sys.executable,
+        gpio_power_up_script,
+        "--pins",
+        "0,1,40,41",
+        "--iterations",
+        "2",
+        "--output",
+        str(output),
+    ]
+    subprocess.run(command, check=True, timeout=120)
+    results = json.loads(output.read_text())
+    cases = {
+        (case["path"], case.get("api"), case.get("sensor"), case["phase"]): case
+        for case in results["results"]
+    }
+    for phase in ("cold", "warm"):
+        per_pin = cases[("hsb_gpio", "per_pin", None, phase)]
+        bulk = cases[("hsb_gpio", "bulk", None, phase)]
+        assert bulk["requests"] < per_pin["requests"]
+    # Two banks: one read of each direction register and one write for
+    # both, then for each of low and high, one read and one write.
+    assert cases[("hsb_gpio", "bulk", None, "cold")]["requests"] == 7
+    # configure_gpio_expander reads the expander's registers again, as it
+    # may have been reset, but skips writes that change nothing.
+    for case in results["results"]:
+        if case["path"] == "li_gpio_expander":
+            assert (
+                case["i2c_transactions"] <= {"power_up": 6, "restart": 5}[case["phase"]]
+            )
+
+
+def test_gpio_power_up_compare():
+    gpio_power_up = load_gpio_power_up()
+    case = {
+        "path": "hsb_gpio",
+        "api": "bulk",
+        "pins": "0,1",
+        "phase": "cold",
+        "requests": 4,
+        "time_s": 0.001,
+    }
+    expander = {
+        "path": "li_gpio_expander",
+        "sensor": "fr_imx662",
+        "phase": "power_up",
+        "i2c_transactions": 6,
+    }
+    baseline = {"results": [case, expander, {**case, "api": "per_pin"}]}
+    results = {
+        "results": [
+            {**case, "time_s": 0.00105},  # within tolerance
+            {**expander, "i2c_transactions": 7},
+            {**case, "api": "per_pin", "requests": 5},
+            {**case, "pins": "0,40", "requests": 100},  # not in the baseline
+        ]
+    }
+    regressions = gpio_power_up.compare(results, baseline, 0.1)
+    assert len(regressions) == 2
+    assert "i2c_transactions=7" in regressions[0]
+    assert "api=per_pin" in regressions[1]
@@ -0,0 +1,374 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import time
+
+import numpy as np
+import pytest
+import utils
+
+import hololink as hololink_module
+from hololink import csi_codec
+
+csi = hololink_module.sensors.csi
+
+ENCODERS = {
+    csi.PixelFormat.RAW_8: utils.encode_raw_8_bayer_image,
+    csi.PixelFormat.RAW_10: utils.encode_raw_10_bayer_image,
+    csi.PixelFormat.RAW_12: utils.encode_raw_12_bayer_image,
+}
+
+
+def reference_unpack(
+    data, pixel_format, pixel_width, pixel_height, start_byte, bytes_per_line
+):
+    """One pixel at a time, the way CsiToBayerOp's kernels work,
+    without msb alignment."""
+    image = np.zeros((pixel_height, pixel_width), dtype=np.uint16)
+    for y in range(pixel_height):
+        line = data[start_byte + y * bytes_per_line :]
+        for x in range(pixel_width):
+            if pixel_format == csi.PixelFormat.RAW_8:
+                image[y, x] = line[x]
+            elif pixel_format == csi.PixelFormat.RAW_10:
+                group, k = divmod(x, 4)
+                lsbs = int(line[group * 5 + 4]) >> (2 * k)
+                image[y, x] = int(line[group * 5 + k]) << 2 | (lsbs & 0x3)
+            else:
+                group, k = divmod(x, 2)
+                lsbs = int(line[group * 3 + 2]) >> (4 * k)
+                image[y, x] = int(line[group * 3 + k]) << 4 | (lsbs & 0xF)
+    return image
+
+
+def reference_unpack_packed(
+    data, pixel_format, pixel_width, pixel_height, bytes_per_line
+):
+    """One pixel at a time, in the Csi10ToPacked10 or Csi12ToPacked12 layout."""
+    image = np.zeros((pixel_height, pixel_width), dtype=np.uint16)
+    for y in range(pixel_height):
+        line = data[y * bytes_per_line :]
+        for x in range(pixel_width):
+            if pixel_format == csi.PixelFormat.RAW_10:
+                group, k = divmod(x, 3)
+                word = int.from_bytes(bytes(line[group * 4 : group * 4 + 4]), "little")
+                image[y, x] = (word >> (10 * k)) & 0x3FF
+            else:
+                group, k = divmod(x, 2)
+                b0, b1, b2 = (int(b) for b in line[group * 3 : group * 3 + 3])
+                image[y, x] = ((b1 & 0xF) << 8 | b2) if k == 0 else (b0 << 4 | b1 >> 4)
+    return image
+
+
+def make_bayer_image(pixel_format, pixel_height, pixel_width, seed=0):
+    bits = csi_codec.bits_per_pixel(pixel_format)
+    return np.random.default_rng(seed).integers(
+        0, 1 << bits, (pixel_height, pixel_width), dtype=np.uint16
+    )
+
+
+@pytest.mark.parametrize("pixel_format", list(ENCODERS.keys()))
+def test_csi_codec(pixel_format):
+    """pack matches the encoders the tests use to fake sensor data, and
+    unpack decodes it at the start_byte and line stride CsiConverter
+    configures, in place, with and without msb alignment."""
+    pixel_height, pixel_width = 12, 64
+    bayer_image = make_bayer_image(pixel_format, pixel_height, pixel_width)
+    csi_lines = ENCODERS[pixel_format](bayer_image)
+    assert np.array_equal(csi_codec.pack(bayer_image, pixel_format), csi_lines)
+
+    line_bytes = csi_codec.transmitted_line_bytes(pixel_format, pixel_width)
+    assert csi_lines.shape == (pixel_height, line_bytes)
+    bytes_per_line = hololink_module.round_up(line_bytes, 8) + 8
+    start_byte = 37
+    rng = np.random.default_rng(1)
+    data = rng.integers(
+        0, 256, start_byte + bytes_per_line * pixel_height + 5, dtype=np.uint8
+    )
+    for y in range(pixel_height):
+        line_start = start_byte + y * bytes_per_line
+        data[line_start : line_start + line_bytes] = csi_lines[y]
+    expected = reference_unpack(
+        data, pixel_format, pixel_width, pixel_height, start_byte, bytes_per_line
+    )
+    assert np.array_equal(expected, bayer_image)
+    shift = 16 - csi_codec.bits_per_pixel(pixel_format)
+    out = np.empty((pixel_height, pixel_width, 1), dtype=np.uint16)
+    for msb_aligned in [False, True]:
+        image = csi_codec.unpack(
+            data,
+            pixel_format,
+            pixel_width,
+            pixel_height,
+            start_byte,
+            bytes_per_line,
+            out=out,
+            msb_aligned=msb_aligned,
+        )
+        assert image is out
+        assert np.array_equal(
+            out[..., 0], expected << shift if msb_aligned else expected
+        )
+    assert np.array_equal(
+        csi_codec.unpack(
+            bytes(data),
+            pixel_format,
+            pixel_width,
+            pixel_height,
+            start_byte,
+            bytes_per_line,
+        ),
+        bayer_image,
+    )
+
+    # pack with padded lines leaves the padding alone.
+    out = np.full((pixel_height, bytes_per_line), 0xAA, dtype=np.uint8)
+    assert csi_codec.pack(bayer_image, pixel_format, bytes_per_line, out=out) is out
+    assert np.array_equal(out[:, :line_bytes], csi_lines)
+    assert np.all(out[:, line_bytes:] == 0xAA)
+
+    # The last line doesn't have to be padded, but it has to be there.
+    required = start_byte + bytes_per_line * (pixel_height - 1) + line_bytes
+    csi_codec.unpack(
+        data[:required],
+        pixel_format,
+        pixel_width,
+        pixel_height,
+        start_byte,
+        bytes_per_line,
+    )
+    with pytest.raises(ValueError):
+        csi_codec.unpack(
+            data[: required - 1],
+            pixel_format,
+            pixel_width,
+            pixel_height,
+            start_byte,
+            bytes_per_line,
+        )
+
+
+@pytest.mark.parametrize(
+    "pixel_format", [csi.PixelFormat.RAW_10, csi.PixelFormat.RAW_12]
+)
+@pytest.mark.parametrize("pixel_width", [60, 61, 62, 63])
+def test_csi_codec_packed(pixel_format, pixel_width):
+    """The packetizer layouts round trip, including lines ending in a
+    partial group."""
+    pixel_height = 5
+    bayer_image = make_bayer_image(pixel_format, pixel_height, pixel_width)
+    line_bytes = csi_codec.packed_line_bytes(pixel_format, pixel_width)
+    bytes_per_line = hololink_module.round_up(line_bytes, 64)
+    data = csi_codec.pack_packed(bayer_image, pixel_format, bytes_per_line)
+    assert np.array_equal(
+        reference_unpack_packed(
+            data.ravel(), pixel_format, pixel_width, pixel_height, bytes_per_line
+        ),
+        bayer_image,
+    )
+    image = csi_codec.unpack_packed(
+        data, pixel_format, pixel_width, pixel_height, 0, bytes_per_line
+    )
+    assert np.array_equal(image, bayer_image)
+    image = csi_codec.unpack_packed(
+        data,
+        pixel_format,
+        pixel_width,
+        pixel_height,
+        0,
+        bytes_per_line,
+        msb_aligned=True,
+    )
+    assert np.array_equal(
+        image, bayer_image << (16 - csi_codec.bits_per_pixel(pixel_format))
+    )
+
+
+def reference_demosaic(bayer_image, bayer_format):
+    """Each missing color is the rounded mean of its neighbors of that color."""
+
+    def color(y, x):
+        if bayer_format == csi.BayerFormat.RGGB:
+            return [[0, 1], [1, 2]][y % 2][x % 2]
+        return [[1, 2], [0, 1]][y % 2][x % 2]
+
+    height, width = bayer_image.shape
+    padded = np.pad(bayer_image, 1, mode="reflect").astype(int)
+    image = np.zeros((height, width, 3), dtype=bayer_image.dtype)
+    for y in range(height):
+        for x in range(width):
+            for c in range(3):
+                if color(y, x) == c:
+                    image[y, x, c] = bayer_image[y, x]
+                    continue
+                values = [
+                    padded[y + 1 + dy, x + 1 + dx]
+                    for dy in (-1, 0, 1)
+                    for dx in (-1, 0, 1)
+                    if (dy or dx) and color(y + dy, x + dx) == c
+                ]
+                image[y, x, c] = (sum(values) + len(values) // 2) // len(values)
+    return image
+
+
+@pytest.mark.parametrize("bayer_format", [csi.BayerFormat.RGGB, csi.BayerFormat.GBRG])
+def test_csi_codec_demosaic(bayer_format):
+    bayer_image = make_bayer_image(csi.PixelFormat.RAW_12, 8, 10)
+    expected = reference_demosaic(bayer_image, bayer_format)
+    out = np.empty((8, 10, 3), dtype=np.uint16)
+    assert csi_codec.demosaic(bayer_image, bayer_format, out=out) is out
+    assert np.array_equal(out, expected)
+
+
+def frames_per_second(f, frame_count):
+    start = time.monotonic()
+    for _ in range(frame_count):
+        f()
+    return frame_count / (time.monotonic() - start)
+
+
+@pytest.mark.skip_unless_benchmark
+@pytest.mark.parametrize(
+    "pixel_width, pixel_height",
+    [(640, 480), (1920, 1080), (2560, 1984), (3840, 2160)],
+)
+@pytest.mark.parametrize("pixel_format", list(ENCODERS.keys()))
+def test_csi_codec_benchmark(pixel_format, pixel_width, pixel_height, frame_count=10):
+    """Frame rates for decoding and encoding received frames into
+    preallocated buffers, compared with the byte order independent
+    decoder big-endian hosts use."""
+    bayer_image = make_bayer_image(pixel_format, pixel_height, pixel_width)
+    line_bytes = csi_codec.transmitted_line_bytes(pixel_format, pixel_width)
+    bytes_per_line = hololink_module.round_up(line_bytes, 8)
+    data = csi_codec.pack(bayer_image, pixel_format, bytes_per_line)
+    packed = csi_codec.pack_packed(bayer_image, pixel_format)
+    out = np.empty_like(bayer_image)
+
+    def unpack():
+        csi_codec.unpack(
+            data,
+            pixel_format,
+            pixel_width,
+            pixel_height,
+            bytes_per_line=bytes_per_line,
+            out=out,
+            msb_aligned=True,
+        )
+
+    unpack_fps = frames_per_second(unpack, frame_count)
+    pack_fps = frames_per_second(
+        lambda: csi_codec.pack(bayer_image, pixel_format, bytes_per_line, out=data),
+        frame_count,
+    )
+    unpack_packed_fps = frames_per_second(
+        lambda: csi_codec.unpack_packed(
+            packed, pixel_format, pixel_width, pixel_height, out=out
+        ),
+        frame_count,
+    )
+    message = (
+        f"{pixel_width}x{pixel_height} {pixel_format.name}: unpack={unpack_fps:.1f}fps "
+        f"pack={pack_fps:.1f}fps unpack_packed={unpack_packed_fps:.1f}fps"
+    )
+    assert np.array_equal(out, bayer_image)
+    if pixel_format != csi.PixelFormat.RAW_8 and csi_codec._LITTLE_ENDIAN:
+        csi_codec._LITTLE_ENDIAN = False
+        try:
+            groups_fps = frames_per_second(unpack, frame_count)
+        finally:
+            csi_codec._LITTLE_ENDIAN = True
+        message += f" (byte order independent unpack={groups_fps:.1f}fps)"
+        assert unpack_fps > groups_fps
+    logging.info(message)
+
+
+def test_cpu_csi_to_bayer_op():
+    """CpuCsiToBayerOp, configured the way sensors configure
+    CsiToBayerOp, emits the msb aligned bayer image."""
+    holoscan = pytest.importorskip(
+        "holoscan", reason="Use 'pip3 install holoscan' to enable holoscan tests."
+    )
+    pixel_format = csi.PixelFormat.RAW_10
+    pixel_height, pixel_width = 48, 64
+    bayer_image = make_bayer_image(pixel_format, pixel_height, pixel_width)
+    frame_count = 3
+    received = []
+
+    class CsiSourceOp(holoscan.core.Operator):
+        def __init__(self, *args, converter=None, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._converter = converter
+
+        def setup(self, spec):
+            spec.output("output")
+
+        def compute(self, op_input, op_output, context):
+            start_byte = self._converter.receiver_start_byte()
+            line_bytes = self._converter.transmitted_line_bytes(
+                pixel_format, pixel_width
+            )
+            bytes_per_line = self._converter.received_line_bytes(line_bytes)
+            frame = np.zeros(self._converter.get_csi_length(), dtype=np.uint8)
+            lines = frame[start_byte : start_byte + bytes_per_line * pixel_height]
+            csi_codec.pack(
+                bayer_image,
+                pixel_format,
+                bytes_per_line,
+                out=lines.reshape(pixel_height, bytes_per_line),
+            )
+            op_output.emit({"": frame}, "output")
+
+    class SinkOp(holoscan.core.Operator):
+        def setup(self, spec):
+            spec.input("input")
+
+        def compute(self, op_input, op_output, context):
+            in_message = op_input.receive("input")
+            received.append(np.array(np.from_dlpack(in_message.get("bayer"))))
+
+    class Application(holoscan.core.Application):
+        def compose(self):
+            converter = hololink_module.operators.CpuCsiToBayerOp(
+                self, name="cpu_csi_to_bayer", out_tensor_name="bayer"
+            )
+            start_byte = converter.receiver_start_byte()
+            line_bytes = converter.transmitted_line_bytes(pixel_format, pixel_width)
+            bytes_per_line = converter.received_line_bytes(line_bytes)
+            converter.configure(
+                start_byte,
+                bytes_per_line,
+                pixel_width,
+                pixel_height,
+                pixel_format,
+                trailing_bytes=hololink_module.METADATA_SIZE,
+            )
+            source = CsiSourceOp(
+                self,
+                holoscan.conditions.CountCondition(self, count=frame_count),
+                name="source",
+                converter=converter,
+            )
+            sink = SinkOp(self, name="sink")
+            self.add_flow(source, converter, {("output", "input")})
+            self.add_flow(converter, sink, {("output", "input")})
+
+    Application().run()
+    assert len(received) == frame_count
+    for image in received:
+        assert image.shape == (pixel_height, pixel_width, 1)
+        assert np.array_equal(image[..., 0], bayer_image << 6)
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import socket
+import time
+
+import mock_server
+import numpy as np
+import pytest
+
+import hololink as hololink_module
+
+# 4K RAW10
+UHD_RAW10_SIZE = 3840 * 2160 * 10 // 8
+
+
+def make_formatter(destination_port=4791):
+    return mock_server.InfinibandFormatter(
+        socket.inet_aton("127.0.0.1"),
+        12288,
+        socket.inet_aton("127.0.0.1"),
+        destination_port,
+        0x1234,
+        0xABCD,
+    )
+
+
+def format_frame(formatter, image, payload_size, psn, address):
+    """What MockServer used to send, one format_write at a time."""
+    packets = []
+    for s in range(0, len(image), payload_size):
+        content = bytes(image[s : s + payload_size])
+        packets.append(formatter.format_write(psn, address + s, content))
+        psn = (psn + 1) & 0xFFFFFFFF
+    return packets
+
+
+@pytest.mark.parametrize(
+    "image_size, payload_size",
+    [
+        (1920 * 1080 * 2, 1472 - 32),
+        (UHD_RAW10_SIZE, 8192),
+        (4096, 1024),
+    ],
+)
+def test_frame_synthesizer_packets(image_size, payload_size):
+    """FrameSynthesizer produces exactly the packets format_write does,
+    including the iCRC, across frames with different PSNs and addresses."""
+    formatter = make_formatter()
+    image = np.random.default_rng(image_size).integers(
+        0, 256, image_size, dtype=np.uint8
+    )
+    synthesizer = mock_server.FrameSynthesizer(formatter, payload_size, image)
+    for psn, address in [(0x1000, 0x10000000), (0xFFFFFFF0, 0x7FFF00000000)]:
+        packets, last = synthesizer.frame(psn, address)
+        expected = format_frame(formatter, image, payload_size, psn, address)
+        if last is not None:
+            assert last == expected.pop()
+        assert len(packets) == len(expected)
+        for packet, expected_packet in zip(packets, expected):
+            assert packet.tobytes() == expected_packet
+
+
+@pytest.mark.skip_unless_benchmark
+def test_frame_synthesizer_benchmark(frame_count=60):
+    """Compare building 4K RAW10 frames one packet at a time with
+    patching the preallocated packet matrix."""
+    formatter = make_formatter()
+    image = np.random.default_rng(0).integers(0, 256, UHD_RAW10_SIZE, dtype=np.uint8)
+    payload_size = 8192
+    start = time.monotonic()
+    format_frame(formatter, image, payload_size, 0x1000, 0x10000000)
+    before = time.monotonic() - start
+    synthesizer = mock_server.FrameSynthesizer(formatter, payload_size, image)
+    start = time.monotonic()
+    for frame in range(frame_count):
+        synthesizer.frame(0x1000 + frame * 2000, 0x10000000)
+    after = (time.monotonic() - start) / frame_count
+    logging.info(
+        f"packets={synthesizer.packet_count()} format_write={1 / before:.1f}fps "
+        f"synthesizer={1 / after:.1f}fps ({before / after:.1f}x faster)"
+    )
+    assert after < before
+    assert 1 / after > 60
+
+
+def test_frame_synthesizer_send():
+    """Every packet sent with sendmmsg arrives, with the UDP payload
+    LinuxReceiver would see."""
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sender = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_RAW)
+    except PermissionError:
+        receiver.close()
+        pytest.skip("Raw sockets require CAP_NET_RAW.")
+    with receiver, sender:
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 * 1024 * 1024)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(1)
+        destination = receiver.getsockname()
+        formatter = make_formatter(destination[1])
+        payload_size = 1024
+        image = np.random.default_rng(1).integers(
+            0, 256, payload_size * 64 + 100, dtype=np.uint8
+        )
+        synthesizer = mock_server.FrameSynthesizer(
+            formatter, payload_size, image, batch_size=16
+        )
+        psn = synthesizer.send_frame(sender, destination, 0x1000, 0x10000000)
+        assert psn == 0x1000 + synthesizer.packet_count()
+        expected = format_frame(formatter, image, payload_size, 0x1000, 0x10000000)
+        for expected_packet in expected:
+            ip_udp_header_size = 20 + 8
+            assert receiver.recv(hololink_module.UDP_PACKET_SIZE) == (
+                expected_packet[ip_udp_header_size:]
+            )
+
+
+def test_generate_image_layout():
+    """The CSI stream is the bayer lines back to back."""
+    csi = hololink_module.sensors.csi
+    image, bayer_image = mock_server.utils.make_image(
+        64, 128, csi.BayerFormat.RGGB, csi.PixelFormat.RAW_10
+    )
+    csi_image_data = mock_server.generate_image(
+        64, 128, csi.BayerFormat.RGGB, csi.PixelFormat.RAW_10
+    )
+    assert np.array_equal(csi_image_data, bayer_image.ravel())
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import mock_server
+import pytest
+
+
+def test_gpio_bulk(mock_hololink_server, counting_hololink):
+    hololink = counting_hololink
+    channel_metadata = mock_hololink_server.channel_metadata()
+    gpio = hololink.get_gpio(channel_metadata)
+    IN, OUT = gpio.IN, gpio.OUT
+    LOW, HIGH = gpio.LOW, gpio.HIGH
+
+    # Pins 0 and 1 are in the first bank, 40 is in the second.
+    # Directions are read once per bank, then all the banks are
+    # written together.
+    outputs = {0: OUT, 1: OUT, 40: OUT}
+    assert hololink.count(gpio.set_directions, outputs) == (3, None)
+    assert hololink.count(gpio.get_direction, 40) == (0, OUT)
+    assert hololink.count(gpio.get_direction, 2) == (0, IN)
+    # Nothing changes, so nothing is sent.
+    assert hololink.count(gpio.set_directions, {0: OUT, 40: OUT}) == (0, None)
+    # One read for the current values, one write for all the banks.
+    assert hololink.count(gpio.set_values, {0: LOW, 1: LOW, 40: LOW}) == (2, None)
+    assert hololink.count(gpio.set_values, {0: HIGH, 40: HIGH}) == (2, None)
+    assert [gpio.get_value(pin) for pin in (0, 1, 40)] == [HIGH, LOW, HIGH]
+    assert hololink.count(gpio.set_bank_values, 0, 0x3, 0x2) == (2, None)
+    assert [gpio.get_value(pin) for pin in (0, 1, 40)] == [LOW, HIGH, HIGH]
+    # Single pins no longer need to read the direction.
+    assert hololink.count(gpio.set_value, 1, LOW) == (2, None)
+    assert gpio.get_value(1) == LOW
+    pin_40 = 1 << (40 - 32)
+    assert hololink.count(gpio.set_bank_directions, 1, pin_40, pin_40) == (1, None)
+    assert gpio.get_direction(40) == IN
+    # Input pins, pins out of range and bad values are rejected.
+    with pytest.raises(RuntimeError):
+        gpio.set_values({0: HIGH, 40: HIGH})
+    with pytest.raises(RuntimeError):
+        gpio.set_values({mock_server.Gpio.PIN_COUNT: HIGH})
+    with pytest.raises(RuntimeError):
+        gpio.set_bank_values(1, 1 << 31, 0)
+    with pytest.raises(RuntimeError):
+        gpio.set_directions({0: 2})
+    # Reset forgets the directions.
+    hololink.invalidate_register_cache()
+    assert hololink.count(gpio.get_direction, 0) == (1, OUT)
+    assert hololink.count(gpio.get_direction, 0) == (0, OUT)
+    # With the register cache, the output values are known, so
+    # after the first update, each update is a single write.
+    hololink.set_register_cache_enable(True)
+    assert hololink.count(gpio.set_values, {0: HIGH, 1: HIGH}) == (2, None)
+    assert hololink.count(gpio.set_values, {0: LOW, 1: HIGH}) == (1, None)
+    assert [gpio.get_value(pin) for pin in (0, 1)] == [LOW, HIGH]
+    # Writing a direction register some other way drops what GPIO knew.
+    hololink.write_uint32(mock_server.Gpio.DIRECTION, 0xFFFF_FFFF)
+    assert hololink.count(gpio.get_direction, 0) == (1, IN)
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import time
+
+import mock_server
+import pytest
+
+import hololink as hololink_module
+
+
+class DropControlHololink(hololink_module.Hololink):
+    """Drops the n'th request after _drop_send is set to n, or the n'th
+    reply after _drop_receive is set to n."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._drop_send = 0
+        self._drop_receive = 0
+
+    def send_control(self, request):
+        if self._drop_send > 0:
+            self._drop_send -= 1
+            if self._drop_send == 0:
+                logging.info(f"send_control dropped {request=}")
+                return
+        super().send_control(request)
+
+    def receive_control(self, timeout):
+        while True:
+            reply = super().receive_control(timeout)
+            if reply and (self._drop_receive > 0):
+                self._drop_receive -= 1
+                if self._drop_receive == 0:
+                    logging.info(f"receive_control dropped {reply=}")
+                    continue
+            return reply
+
+
+def make_hololink(server, sequence_number_checking=False):
+    channel_metadata = server.channel_metadata()
+    return DropControlHololink(
+        peer_ip=channel_metadata["peer_ip"],
+        control_port=channel_metadata["control_port"],
+        serial_number=channel_metadata["serial_number"],
+        sequence_number_checking=sequence_number_checking,
+    )
+
+
+@pytest.mark.skip_unless_benchmark
+def test_hololink_pipeline(mock_camera_ip, count=2000):
+    """Measure register writes/second with each control window depth."""
+    with mock_server.TestServer(mock_camera_ip) as server:
+        hololink = make_hololink(server)
+        hololink.start()
+        try:
+            rates = {}
+            for control_window in [1, 4, 16]:
+                hololink.set_control_window(control_window)
+                assert hololink.get_control_window() == control_window
+                start = time.monotonic()
+                futures = [
+                    hololink.write_uint32_async(
+                        hololink_module.APB_RAM + (i % 64) * 4, control_window + i
+                    )
+                    for i in range(count)
+                ]
+                hololink.flush_control()
+                elapsed = time.monotonic() - start
+                assert all(future.get() for future in futures)
+                rates[control_window] = count / elapsed
+                logging.info(
+                    f"{control_window=} {count=} {elapsed=:.3f} "
+                    f"writes/s={rates[control_window]:.0f}"
+                )
+                # Read back what we wrote.
+                futures = [
+                    hololink.read_uint32_async(hololink_module.APB_RAM + i * 4)
+                    for i in range(64)
+                ]
+                for i, future in enumerate(futures):
+                    last = count - 64 + ((i - count) % 64)
+                    assert future.get() == control_window + last
+            for control_window, rate in rates.items():
+                logging.info(f"{control_window=} speedup={rate / rates[1]:.2f}x")
+        finally:
+            hololink.stop()
+
+
+def test_hololink_pipeline_retry(mock_camera_ip, control_window=8):
+    """A request lost from the middle of the window is retried, and
+    the blocking calls still work with pipelined requests outstanding."""
+    with mock_server.TestServer(mock_camera_ip) as server:
+        hololink = make_hololink(server)
+        hololink.start()
+        try:
+            hololink.set_control_window(control_window)
+            hololink._drop_send = 3
+            futures = [
+                hololink.write_uint32_async(hololink_module.APB_RAM + i * 4, 0x55 + i)
+                for i in range(control_window)
+            ]
+            # This waits for everything outstanding first.
+            assert hololink.read_uint32(hololink_module.APB_RAM + 8) == 0x55 + 2
+            assert all(future.get() for future in futures)
+            futures = [
+                hololink.read_uint32_async(hololink_module.APB_RAM + i * 4)
+                for i in range(control_window)
+            ]
+            assert [future.get() for future in futures] == [
+                0x55 + i for i in range(control_window)
+            ]
+        finally:
+            hololink.stop()
+
+
+@pytest.mark.parametrize("drop", ["request", "reply"])
+def test_hololink_pipeline_sequence_check_retry(mock_camera_ip, drop, control_window=8):
+    """With sequence checking on, a request or reply lost from the middle
+    of the window is retried without checking; HSB's expected sequence
+    number has to be resynchronized for the checked requests after it."""
+    with mock_server.TestServer(mock_camera_ip) as server:
+        hololink = make_hololink(server, sequence_number_checking=True)
+        hololink.start()
+        try:
+            hololink.set_control_window(control_window)
+            if drop == "request":
+                hololink._drop_send = 3
+            else:
+                hololink._drop_receive = 3
+            futures = [
+                hololink.write_uint32_async(hololink_module.APB_RAM + i * 4, 0x55 + i)
+                for i in range(control_window)
+            ]
+            # Checked requests after the retry still succeed.
+            assert hololink.read_uint32(hololink_module.APB_RAM + 8) == 0x55 + 2
+            assert all(future.get() for future in futures)
+            futures = [
+                hololink.write_uint32_async(hololink_module.APB_RAM + i * 4, 0xAA + i)
+                for i in range(control_window)
+            ]
+            assert all(future.get() for future in futures)
+            futures = [
+                hololink.read_uint32_async(hololink_module.APB_RAM + i * 4)
+                for i in range(control_window)
+            ]
+            assert [future.get() for future in futures] == [
+                0xAA + i for i in range(control_window)
+            ]
+        finally:
+            hololink.stop()
@@ -15,9 +15,13 @@
 
 """Tests for HSB logging Python wrappers."""
 
+import logging
+import time
+
 import pytest
 
 import hololink
+import hololink.emulation as hemu
 
 
 class TestHsbLogging:
@@ -145,3 +149,70 @@ class TestHsbLogging:
         assert hololink.HSB_LOG_LEVEL_INFO == 30
         assert hololink.HSB_LOG_LEVEL_WARN == 40
         assert hololink.HSB_LOG_LEVEL_ERROR == 50
+
+    def test_log_timestamp_s_precision(self):
+        """log_timestamp_s keeps sub-millisecond resolution."""
+        first = hololink.log_timestamp_s()
+        while (second := hololink.log_timestamp_s()) == first:
+            pass
+        assert 0 < second - first < 0.001
+
+    def test_hsb_log_async(self):
+        """Messages logged asynchronously are all written by hsb_log_flush."""
+        original_level = hololink.get_hsb_log_level()
+        original_async = hololink.get_hsb_log_async()
+        try:
+            hololink.set_hsb_log_level(hololink.HSB_LOG_LEVEL_TRACE)
+            hololink.set_hsb_log_async(True)
+            assert hololink.get_hsb_log_async()
+            dropped = hololink.hsb_log_dropped()
+            hololink.hsb_log_info("Async info message")
+            hololink.hsb_log_info("A" * 1000)
+            hololink.hsb_log_flush()
+            assert hololink.hsb_log_dropped() == dropped
+            hololink.set_hsb_log_async(False)
+            assert not hololink.get_hsb_log_async()
+            hololink.hsb_log_info("Sync info message")
+        finally:
+            hololink.set_hsb_log_async(original_async)
+            hololink.set_hsb_log_level(original_level)
+
+    @pytest.mark.skip_unless_benchmark
+    def test_hsb_log_async_benchmark(self, iterations=2000):
+        """Compare control plane requests per second, at TRACE, with
+        messages written by the calling thread and by the drain thread."""
+        original_level = hololink.get_hsb_log_level()
+        original_async = hololink.get_hsb_log_async()
+        hsb = hemu.HSBEmulator(hemu.HSB_LEOPARD_EAGLE_CONFIG)
+        hsb.start()
+        try:
+            hololink.set_hsb_log_level(hololink.HSB_LOG_LEVEL_TRACE)
+            results = {}
+            for log_async in [False, True]:
+                hololink.set_hsb_log_async(log_async)
+                channel = hololink.Hololink(
+                    peer_ip="127.0.0.1",
+                    control_port=8192,
+                    serial_number="hsb-log-async",
+                    sequence_number_checking=False,
+                )
+                channel.start()
+                try:
+                    dropped = hololink.hsb_log_dropped()
+                    start = time.monotonic()
+                    for _ in range(iterations):
+                        channel.read_uint32(hololink.FPGA_DATE)
+                    elapsed = time.monotonic() - start
+                    hololink.hsb_log_flush()
+                finally:
+                    channel.stop()
+                results[log_async] = iterations / elapsed
+                logging.info(
+                    f"{log_async=} requests/s={results[log_async]:.0f} "
+                    f"dropped={hololink.hsb_log_dropped() - dropped}"
+                )
+            logging.info(f"speedup={results[True] / results[False]:.2f}x")
+        finally:
+            hsb.stop()
+            hololink.set_hsb_log_async(original_async)
+            hololink.set_hsb_log_level(original_level)
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import time
+
+import hololink as hololink_module
+import hololink.emulation as hemu
+
+CAM_I2C_ADDRESS = 0x10
+EEPROM_I2C_ADDRESS = 0x51
+
+
+def read_latency(hololink, i2c, peripheral_i2c_address, register, count, iterations):
+    write_bytes = bytearray(register.to_bytes(2, "big"))
+    reads = hololink.reads()
+    start = time.monotonic()
+    for _ in range(iterations):
+        reply = i2c.i2c_transaction(peripheral_i2c_address, write_bytes, count)
+    elapsed = time.monotonic() - start
+    reads = hololink.reads() - reads
+    return bytearray(reply), elapsed / iterations, reads / iterations
+
+
+def test_i2c_block_read(counting_hololink_factory, iterations=20):
+    """Compare I2C read latency fetching the reply one word at a time
+    with fetching it, and the status, in one block request."""
+    hsb = hemu.HSBEmulator(hemu.HSB_LEOPARD_EAGLE_CONFIG)
+    vb1940 = hemu.sensors.Vb1940Emulator()
+    vb1940.attach_to_i2c(
+        hsb.get_i2c(hololink_module.I2C_CTRL), hololink_module.CAM_I2C_BUS
+    )
+    hsb.start()
+    try:
+        # Load a pattern we can read back.
+        register = 0x8000
+        pattern = bytes((i * 7 + 3) & 0xFF for i in range(256))
+        results = {}
+        for block_enable in [False, True]:
+            with counting_hololink_factory(
+                peer_ip="127.0.0.1",
+                control_port=8192,
+                serial_number="i2c-block-read",
+                block_enable=block_enable,
+            ) as hololink:
+                i2c = hololink.get_i2c(hololink_module.CAM_I2C_BUS)
+                for offset in range(0, len(pattern), 254):
+                    write_bytes = bytearray((register + offset).to_bytes(2, "big"))
+                    write_bytes.extend(pattern[offset : offset + 254])
+                    i2c.i2c_transaction(CAM_I2C_ADDRESS, write_bytes, 0)
+                # Bit-exact, including lengths that aren't whole words.
+                for count in [1, 3, 4, 64, 255, 256]:
+                    reply, _, _ = read_latency(
+                        hololink, i2c, CAM_I2C_ADDRESS, register, count, 1
+                    )
+                    assert reply == pattern[:count]
+                # A 256-byte EEPROM read, as Vb1940Cam.get_calibration_data does.
+                _, latency, reads = read_latency(
+                    hololink, i2c, EEPROM_I2C_ADDRESS, 0, 256, iterations
+                )
+                results[block_enable] = latency
+                logging.info(
+                    f"{block_enable=} latency={latency * 1000:.3f}ms read_requests={reads:.1f}"
+                )
+                if block_enable:
+                    # No per-word reads: just the status poll(s).
+                    assert reads < 64
+                else:
+                    assert reads >= 64
+        logging.info(f"speedup={results[False] / results[True]:.2f}x")
+    finally:
+        hsb.stop()
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import time
+
+import hololink as hololink_module
+import hololink.emulation as hemu
+
+CAM_I2C_ADDRESS = 0x10
+
+
+def write_read(hololink, i2c, register, iterations):
+    """Write a word to register and read it back, iterations times;
+    returns (seconds, read requests) per transaction."""
+    reads = hololink.reads()
+    start = time.monotonic()
+    for i in range(iterations):
+        value = (i * 0x01010101 + 0x04030201) & 0xFFFFFFFF
+        write_bytes = bytearray(register.to_bytes(2, "big"))
+        write_bytes.extend(value.to_bytes(4, "little"))
+        i2c.i2c_transaction(CAM_I2C_ADDRESS, write_bytes, 0)
+        reply = i2c.i2c_transaction(
+            CAM_I2C_ADDRESS, bytearray(register.to_bytes(2, "big")), 4
+        )
+        assert bytearray(reply) == value.to_bytes(4, "little")
+    elapsed = time.monotonic() - start
+    transactions = iterations * 2
+    return elapsed / transactions, (hololink.reads() - reads) / transactions
+
+
+def test_i2c_event(counting_hololink_factory, iterations=20):
+    """Compare I2C transactions that poll the status register with
+    ones that wait for the emulator's I2C_BUSY async event packet."""
+    hsb = hemu.HSBEmulator(hemu.HSB_LEOPARD_EAGLE_CONFIG)
+    vb1940 = hemu.sensors.Vb1940Emulator()
+    vb1940.attach_to_i2c(
+        hsb.get_i2c(hololink_module.I2C_CTRL), hololink_module.CAM_I2C_BUS
+    )
+    hsb.start()
+    try:
+        results = {}
+        for i2c_event_enable in [False, True]:
+            with counting_hololink_factory(
+                peer_ip="127.0.0.1",
+                control_port=8192,
+                serial_number="i2c-event",
+            ) as hololink:
+                hololink.set_i2c_event_enable(i2c_event_enable)
+                assert hololink.get_i2c_event_enable() == i2c_event_enable
+                i2c = hololink.get_i2c(hololink_module.CAM_I2C_BUS)
+                # Until the first event shows up, we poll.
+                write_read(hololink, i2c, 0x8000, 1)
+                events = hololink.get_i2c_event_count()
+                fallbacks = hololink.get_i2c_event_fallback_count()
+                latency, reads = write_read(hololink, i2c, 0x8000, iterations)
+                # The emulator sends events whether we use them or not,
+                # one per transaction, when I2C_BUSY falls.
+                assert hololink.get_i2c_event_count() >= events + iterations * 2
+                # No transaction waited out the event fallback interval.
+                assert hololink.get_i2c_event_fallback_count() == fallbacks
+                assert latency < 0.02
+                results[i2c_event_enable] = (latency, reads)
+                logging.info(
+                    f"{i2c_event_enable=} latency={latency * 1000:.3f}ms "
+                    f"read_requests={reads:.1f}"
+                )
+        # With events, each transaction reads the status about once;
+        # the event can beat the status cache write by a little.
+        assert results[True][1] < 2
+        assert results[True][1] < results[False][1]
+        logging.info(f"speedup={results[False][0] / results[True][0]:.2f}x")
+    finally:
+        hsb.stop()
+
+
+def test_i2c_event_fallback(counting_hololink_factory):
+    """If event packets stop arriving, transactions still complete
+    by polling the status register."""
+    hsb = hemu.HSBEmulator(hemu.HSB_LEOPARD_EAGLE_CONFIG)
+    vb1940 = hemu.sensors.Vb1940Emulator()
+    vb1940.attach_to_i2c(
+        hsb.get_i2c(hololink_module.I2C_CTRL), hololink_module.CAM_I2C_BUS
+    )
+    hsb.start()
+    try:
+        with counting_hololink_factory(
+            peer_ip="127.0.0.1",
+            control_port=8192,
+            serial_number="i2c-event-fallback",
+        ) as hololink:
+            i2c = hololink.get_i2c(hololink_module.CAM_I2C_BUS)
+            write_read(hololink, i2c, 0x8000, 2)
+            assert hololink.get_i2c_event_count() > 0
+            # Stop the emulator from sending us events.
+            hololink.write_uint32(hololink_module.CTRL_EVT_HOST_UDP_PORT, 0)
+            events = hololink.get_i2c_event_count()
+            fallbacks = hololink.get_i2c_event_fallback_count()
+            write_read(hololink, i2c, 0x8000, 4)
+            assert hololink.get_i2c_event_count() == events
+            # Only the first transaction waits for the missing event;
+            # the rest poll straight away.
+            assert hololink.get_i2c_event_fallback_count() == fallbacks + 1
+    finally:
+        hsb.stop()
@@ -444,6 +444,7 @@ class CoeTestApplication(holoscan.core.Application):
         camera_mode,
         watchdog,
         coe_interface,
+        ring_block_count=0,
     ):
         logging.info("__init__")
         super().__init__()
@@ -457,6 +458,7 @@ class CoeTestApplication(holoscan.core.Application):
         self._camera_mode = camera_mode
         self._watchdog = watchdog
         self._coe_interface = coe_interface
+        self._ring_block_count = ring_block_count
         # Each camera sharing a network connection must use
         # a unique channel number from 0..63.
         self._coe_channel = 1
@@ -500,6 +502,7 @@ class CoeTestApplication(holoscan.core.Application):
             coe_interface=self._coe_interface,
             pixel_width=self._camera._width,
             coe_channel=self._coe_channel,
+            ring_block_count=self._ring_block_count,
         )
 
         isp = hololink_module.operators.ImageProcessorOp(
@@ -572,6 +575,13 @@ class CoeTestApplication(holoscan.core.Application):
         "192.168.0.2",
     ],
 )
+@pytest.mark.parametrize(
+    "ring_block_count",
+    [
+        0,  # use recv()
+        16,  # use the TPACKET_V3 ring
+    ],
+)
 def test_imx274_pattern_coe(
     camera_mode,
     pattern,
@@ -579,6 +589,7 @@ def test_imx274_pattern_coe(
     hololink,
     coe_interfaces,
     frame_limit,
+    ring_block_count,
 ):
     # Get a handle to data sources
     channel_metadata = hololink_module.Enumerator.find_channel(channel_ip=hololink)
@@ -614,6 +625,7 @@ def test_imx274_pattern_coe(
             camera_mode,
             watchdog,
             coe_interface=coe_interfaces[0],
+            ring_block_count=ring_block_count,
         )
         # Run it.
         hololink = hololink_channel.hololink()
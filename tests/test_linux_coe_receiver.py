@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import ctypes
+import socket
+import struct
+import threading
+
+import numpy as np
+import pytest
+
+import hololink as hololink_module
+
+ETH_P_AVTP = 0x22F0
+NTSCF = 0x82
+ACF_MESSAGE_TYPE = 0x0C
+FRAME_END = 0x02
+SOL_PACKET = 263
+PACKET_TX_RING = 13
+
+
+def coe_packet(channel, address, payload, flags=0):
+    """An 1722 NTSCF packet in the form LinuxCoeReceiver.handle_packet expects."""
+    header = struct.pack(
+        "!6s6sHBHB8sBBBBIIBHBI",
+        b"\xff" * 6,  # destination MAC
+        b"\x00" * 6,  # source MAC
+        ETH_P_AVTP,
+        NTSCF,
+        0,  # sv, version, r, ntscf_data_length
+        0,  # sequence
+        b"\x00" * 8,  # stream_id
+        ACF_MESSAGE_TYPE,
+        0,  # acf_message_length
+        0,
+        0,
+        0,  # timestamp_sec
+        0,  # timestamp_ns
+        0,  # sequence_number_c
+        channel,
+        flags,
+        address,
+    )
+    return header + payload
+
+
+def frame_packets(channel, frame_size, payload_size, frame_number):
+    packets = []
+    content = bytes([frame_number & 0xFF] * payload_size)
+    for address in range(0, frame_size, payload_size):
+        size = min(payload_size, frame_size - address)
+        packets.append(coe_packet(channel, address, content[:size]))
+    # The frame ends with the metadata, written after the frame data.
+    metadata = struct.pack(
+        "!IIIQIQHHQI", 0, 0, 0, 0, 0, frame_size, 0, frame_number & 0xFFFF, 0, 0
+    )
+    packets.append(coe_packet(channel, frame_size, metadata, FRAME_END))
+    return packets
+
+
+def open_packet_socket():
+    try:
+        return socket.socket(
+            socket.AF_PACKET, socket.SOCK_RAW, socket.ntohs(ETH_P_AVTP)
+        )
+    except PermissionError:
+        pytest.skip("AF_PACKET sockets need CAP_NET_RAW.")
+
+
+@pytest.mark.parametrize(
+    "ring_block_count, ring_enabled",
+    [
+        (0, False),  # recv() only
+        (16, True),  # TPACKET_V3 ring
+        (16, False),  # ring setup fails; falls back to recv()
+    ],
+)
+def test_linux_coe_receiver_loopback(
+    ring_block_count,
+    ring_enabled,
+    channel=5,
+    pages=2,
+    frame_count=10,
+    frame_size=16 * 1024,
+    payload_size=1024,
+):
+    """Receive frames sent to an AF_PACKET socket on lo, with and without
+    the TPACKET_V3 ring; this runs without a GPU or HSB."""
+    data_socket = open_packet_socket()
+    sender = open_packet_socket()
+    try:
+        data_socket.bind(("lo", 0))
+        sender.bind(("lo", 0))
+        if ring_block_count and not ring_enabled:
+            # With a transmit ring configured, the kernel won't let the
+            # receiver change PACKET_VERSION, so it goes back to recv().
+            tpacket_req = struct.pack("IIII", 4096, 1, 2048, 2)
+            data_socket.setsockopt(SOL_PACKET, PACKET_TX_RING, tpacket_req)
+        # There's no cu_buffer: HSB addresses start at 0.  Leave room for
+        # the metadata after the frame.
+        receiver = hololink_module.operators.LinuxCoeReceiver(
+            0,
+            frame_size + 128,
+            data_socket.fileno(),
+            channel,
+            ring_block_size=64 * 1024,
+            ring_block_count=ring_block_count,
+            pages=pages,
+            host_memory=True,
+        )
+        receiver_thread = threading.Thread(daemon=True, target=receiver.run)
+        receiver_thread.start()
+        try:
+            for frame_number in range(frame_count):
+                for packet in frame_packets(
+                    channel, frame_size, payload_size, frame_number
+                ):
+                    sender.send(packet)
+                # Traffic for other channels is ignored.
+                sender.send(coe_packet(channel + 1, 0, b"\x55" * payload_size))
+                ok, metadata = receiver.get_next_frame(1000)
+                assert ok
+                assert metadata.frame_bytes_received == frame_size + 48
+                buffer = (ctypes.c_uint8 * frame_size).from_address(
+                    metadata.frame_memory
+                )
+                frame = np.frombuffer(buffer, dtype=np.uint8)
+                assert (frame == (frame_number & 0xFF)).all()
+                # Safe to call while the receiver is running.
+                statistics = receiver.get_ring_statistics()
+                assert statistics.ring_enabled == ring_enabled
+        finally:
+            receiver.close()
+            receiver_thread.join()
+        # And after it's stopped, without touching the socket again.
+        statistics = receiver.get_ring_statistics()
+        assert statistics.ring_enabled == ring_enabled
+        if ring_enabled:
+            assert statistics.blocks_seen > 0
+            assert statistics.kernel_packets >= frame_count * (
+                frame_size // payload_size + 1
+            )
+            assert statistics.kernel_drops == 0
+        else:
+            assert statistics.blocks_seen == 0
+    finally:
+        sender.close()
+        data_socket.close()
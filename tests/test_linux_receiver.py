@@ -0,0 +1,556 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import ctypes
+import logging
+import os
+import socket
+import struct
+import threading
+import time
+import urllib.request
+
+import cuda.bindings.driver as cuda
+import mock_server
+import numpy as np
+import pytest
+
+import hololink as hololink_module
+
+# mock_server.InfinibandFormatter produces IP/UDP/IB packets for a raw
+# socket; LinuxReceiver only sees the UDP payload.
+IP_UDP_HEADER_SIZE = 20 + 8
+
+
+def make_frame_packets(formatter, psn, frame_size, payload_size, frame_number, skip=()):
+    """Returns the list of UDP payloads that HSB would send for one frame;
+    packets with an index in skip are left out (as if they were dropped)."""
+    packets = []
+    content = bytes([frame_number & 0xFF] * payload_size)
+    for index, s in enumerate(range(0, frame_size, payload_size)):
+        e = min(s + payload_size, frame_size)
+        packet = formatter.format_write(psn, s, content[: e - s])
+        if index not in skip:
+            packets.append(packet[IP_UDP_HEADER_SIZE:])
+        psn += 1
+    immediate_value = (psn & 0xFFFFFF) << 8
+    metadata = struct.pack(
+        "!IIIQIQHHQI", 0, psn, 0, 0, 0, frame_size, 0, frame_number & 0xFFFF, 0, 0
+    )
+    metadata_address = hololink_module.round_up(frame_size, mock_server.PAGE_SIZE)
+    packet = formatter.format_write_immediate(
+        psn, metadata_address, metadata, immediate_value
+    )
+    packets.append(packet[IP_UDP_HEADER_SIZE:])
+    psn += 1
+    return packets, psn
+
+
+def measure_receiver(cu_context, batch_size, frame_size, payload_size, frame_count):
+    (cu_result,) = cuda.cuCtxSetCurrent(cu_context)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    allocation_size = (
+        hololink_module.round_up(frame_size, hololink_module.PAGE_SIZE)
+        + hololink_module.METADATA_SIZE
+    )
+    cu_result, frame_memory = cuda.cuMemAlloc(allocation_size)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2 * frame_size)
+        data_socket.bind(("127.0.0.1", 0))
+        destination = data_socket.getsockname()
+        receiver = hololink_module.operators.LinuxReceiver(
+            int(frame_memory),
+            allocation_size,
+            data_socket.fileno(),
+            int(frame_memory),
+            batch_size=batch_size,
+        )
+
+        def _run():
+            cuda.cuCtxSetCurrent(cu_context)
+            receiver.run()
+
+        receiver_thread = threading.Thread(daemon=True, target=_run)
+        receiver_thread.start()
+
+        formatter = mock_server.InfinibandFormatter(
+            socket.inet_aton("127.0.0.1"),
+            12288,
+            socket.inet_aton(destination[0]),
+            destination[1],
+            receiver.get_qp_number(),
+            receiver.get_rkey(),
+        )
+        # Build the packet stream up front so we only measure the receiver.
+        psn = 0x1000
+        frames = []
+        for frame_number in range(frame_count):
+            packets, psn = make_frame_packets(
+                formatter, psn, frame_size, payload_size, frame_number
+            )
+            frames.append(packets)
+
+        packets_received, packets_dropped, frames_received = 0, 0, 0
+        start = time.monotonic()
+        for packets in frames:
+            for packet in packets:
+                sender.sendto(packet, destination)
+            # If the kernel dropped our metadata packet, this times out.
+            ok, metadata = receiver.get_next_frame(100)
+            if not ok:
+                continue
+            frames_received += 1
+            packets_received += metadata.frame_packets_received
+            packets_dropped = metadata.packets_dropped
+        elapsed = time.monotonic() - start
+        receiver.close()
+        receiver_thread.join()
+        assert frames_received > 0
+        return packets_received, packets_dropped, elapsed
+    finally:
+        sender.close()
+        data_socket.close()
+        cuda.cuMemFree(frame_memory)
+
+
+@pytest.mark.skip_unless_benchmark
+@pytest.mark.parametrize(
+    "frame_size, payload_size",
+    [
+        (1920 * 1080 * 2, 1472 - 32),
+        (3840 * 2160 * 2, 8192),
+    ],
+)
+def test_linux_receiver_batching(frame_size, payload_size, frame_count=30):
+    """Compare packets/s for the single-recv and recvmmsg ingest paths."""
+    (cu_result,) = cuda.cuInit(0)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    cu_result, cu_device = cuda.cuDeviceGet(0)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    cu_result, cu_context = cuda.cuDevicePrimaryCtxRetain(cu_device)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    try:
+        rates = {}
+        for batch_size in [1, 8, 64]:
+            packets_received, packets_dropped, elapsed = measure_receiver(
+                cu_context, batch_size, frame_size, payload_size, frame_count
+            )
+            rates[batch_size] = packets_received / elapsed
+            logging.info(
+                f"{batch_size=} {packets_received=} {packets_dropped=} "
+                f"{elapsed=:.3f} packets/s={rates[batch_size]:.0f}"
+            )
+        for batch_size, rate in rates.items():
+            logging.info(
+                f"{batch_size=} speedup vs. single recv={rate / rates[1]:.2f}x"
+            )
+    finally:
+        cuda.cuDevicePrimaryCtxRelease(cu_device)
+
+
+def test_linux_receiver_pages(
+    pages=4, frame_count=6, frame_size=0x10000, payload_size=1024
+):
+    """Frames that arrive while the application is busy are queued up
+    in the ring, oldest first; each is written to its own page."""
+    (cu_result,) = cuda.cuInit(0)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    cu_result, cu_device = cuda.cuDeviceGet(0)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    cu_result, cu_context = cuda.cuDevicePrimaryCtxRetain(cu_device)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    (cu_result,) = cuda.cuCtxSetCurrent(cu_context)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    page_size = (
+        hololink_module.round_up(frame_size, hololink_module.PAGE_SIZE)
+        + hololink_module.METADATA_SIZE
+    )
+    cu_result, frame_memory = cuda.cuMemAlloc(page_size * pages)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        data_socket.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 2 * frame_size * frame_count
+        )
+        data_socket.bind(("127.0.0.1", 0))
+        destination = data_socket.getsockname()
+        receiver = hololink_module.operators.LinuxReceiver(
+            int(frame_memory),
+            frame_size,
+            data_socket.fileno(),
+            int(frame_memory),
+            pages=pages,
+            cu_page_size=page_size,
+        )
+        assert receiver.get_pages() == pages
+
+        def _run():
+            cuda.cuCtxSetCurrent(cu_context)
+            receiver.run()
+
+        receiver_thread = threading.Thread(daemon=True, target=_run)
+        receiver_thread.start()
+
+        formatter = mock_server.InfinibandFormatter(
+            socket.inet_aton("127.0.0.1"),
+            12288,
+            socket.inet_aton(destination[0]),
+            destination[1],
+            receiver.get_qp_number(),
+            receiver.get_rkey(),
+        )
+        # Send all our frames without fetching any of them.
+        psn = 0x1000
+        for frame_number in range(frame_count):
+            packets, psn = make_frame_packets(
+                formatter, psn, frame_size, payload_size, frame_number
+            )
+            for packet in packets:
+                sender.sendto(packet, destination)
+        timeout = time.monotonic() + 5
+        while receiver.frames_pending() < pages:
+            assert time.monotonic() < timeout
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        # We get the newest frames that fit in the ring, oldest first;
+        # the ones before that were overwritten.
+        overwritten = frame_count - pages
+        for i in range(pages):
+            ok, metadata = receiver.get_next_frame(100)
+            assert ok
+            logging.info(
+                f"{metadata.received_frame_number=} {metadata.page=} "
+                f"{metadata.ring_occupancy=} {metadata.ring_overwrites=}"
+            )
+            assert metadata.received_frame_number == overwritten + i + 1
+            assert metadata.page == i
+            assert metadata.frame_memory == int(frame_memory) + i * page_size
+            assert metadata.ring_occupancy == pages - i - 1
+            assert metadata.ring_overwrites == overwritten
+        assert receiver.frames_pending() == 0
+        ok, metadata = receiver.get_next_frame(100)
+        assert not ok
+
+        # Each page still holds the frame it was given.
+        for i in range(pages):
+            content = bytearray(payload_size)
+            (cu_result,) = cuda.cuMemcpyDtoH(
+                content, int(frame_memory) + i * page_size, payload_size
+            )
+            assert cu_result == cuda.CUresult.CUDA_SUCCESS
+            assert content == bytes([overwritten + i] * payload_size)
+
+        receiver.close()
+        receiver_thread.join()
+    finally:
+        sender.close()
+        data_socket.close()
+        cuda.cuMemFree(frame_memory)
+        cuda.cuDevicePrimaryCtxRelease(cu_device)
+
+
+@pytest.mark.parametrize(
+    "fill_missing",
+    [
+        True,
+        False,
+    ],
+)
+def test_linux_receiver_missing_regions(
+    fill_missing, frame_size=0x10000, payload_size=1024
+):
+    """With track_missing, the receiver reports the regions of the frame
+    that didn't arrive instead of clearing the whole buffer for each frame."""
+    (cu_result,) = cuda.cuInit(0)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    cu_result, cu_device = cuda.cuDeviceGet(0)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    cu_result, cu_context = cuda.cuDevicePrimaryCtxRetain(cu_device)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    (cu_result,) = cuda.cuCtxSetCurrent(cu_context)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    allocation_size = (
+        hololink_module.round_up(frame_size, hololink_module.PAGE_SIZE)
+        + hololink_module.METADATA_SIZE
+    )
+    cu_result, frame_memory = cuda.cuMemAlloc(allocation_size)
+    assert cu_result == cuda.CUresult.CUDA_SUCCESS
+    data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * frame_size)
+        data_socket.bind(("127.0.0.1", 0))
+        destination = data_socket.getsockname()
+        receiver = hololink_module.operators.LinuxReceiver(
+            int(frame_memory),
+            frame_size,
+            data_socket.fileno(),
+            int(frame_memory),
+            track_missing=True,
+            fill_missing=fill_missing,
+        )
+
+        def _run():
+            cuda.cuCtxSetCurrent(cu_context)
+            receiver.run()
+
+        receiver_thread = threading.Thread(daemon=True, target=_run)
+        receiver_thread.start()
+
+        formatter = mock_server.InfinibandFormatter(
+            socket.inet_aton("127.0.0.1"),
+            12288,
+            socket.inet_aton(destination[0]),
+            destination[1],
+            receiver.get_qp_number(),
+            receiver.get_rkey(),
+        )
+
+        def _send_frame(frame_number, psn, skip):
+            packets, psn = make_frame_packets(
+                formatter, psn, frame_size, payload_size, frame_number, skip
+            )
+            for packet in packets:
+                sender.sendto(packet, destination)
+            ok, metadata = receiver.get_next_frame(1000)
+            assert ok
+            content = bytearray(frame_size)
+            (cu_result,) = cuda.cuMemcpyDtoH(content, int(frame_memory), frame_size)
+            assert cu_result == cuda.CUresult.CUDA_SUCCESS
+            return metadata, content, psn
+
+        # Receive enough complete frames that every page of the
+        # receiver's host buffer has been written.
+        psn = 0x1000
+        for frame_number in range(4):
+            metadata, content, psn = _send_frame(frame_number, psn, skip=())
+            assert metadata.missing_bytes == 0
+            assert metadata.missing_regions == []
+        # Drop packets 3, 4 and the last one.
+        last = frame_size // payload_size - 1
+        frame_number = 4
+        metadata, content, psn = _send_frame(frame_number, psn, skip=(3, 4, last))
+        logging.info(f"{metadata.missing_regions=} {metadata.missing_bytes=}")
+        assert metadata.missing_regions == [
+            (3 * payload_size, 2 * payload_size),
+            (last * payload_size, payload_size),
+        ]
+        assert metadata.missing_bytes == 3 * payload_size
+        for offset, length in metadata.missing_regions:
+            region = content[offset : offset + length]
+            if fill_missing:
+                assert region == bytes([0xFF] * length)
+            else:
+                # We see whatever was left in this page of the
+                # receiver's buffer, which isn't from this frame.
+                assert frame_number not in region
+        offset = 5 * payload_size
+        assert content[offset : offset + payload_size] == bytes(
+            [frame_number] * payload_size
+        )
+
+        receiver.close()
+        receiver_thread.join()
+    finally:
+        sender.close()
+        data_socket.close()
+        cuda.cuMemFree(frame_memory)
+        cuda.cuDevicePrimaryCtxRelease(cu_device)
+
+
+@pytest.mark.parametrize(
+    "huge_pages",
+    [
+        False,
+        True,
+    ],
+)
+def test_linux_receiver_host_memory(
+    huge_pages, pages=2, frame_count=30, frame_size=1920 * 1080 * 2, payload_size=8192
+):
+    """With host_memory, the receiver makes no CUDA calls and hands us
+    its own (host) buffer for each frame; this runs without a GPU."""
+    data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2 * frame_size)
+        data_socket.bind(("127.0.0.1", 0))
+        destination = data_socket.getsockname()
+        # There's no cu_buffer: HSB addresses start at 0.
+        receiver = hololink_module.operators.LinuxReceiver(
+            0,
+            frame_size,
+            data_socket.fileno(),
+            0,
+            pages=pages,
+            host_memory=True,
+            huge_pages=huge_pages,
+        )
+        assert receiver.get_host_memory()
+        receiver_thread = threading.Thread(daemon=True, target=receiver.run)
+        receiver_thread.start()
+
+        formatter = mock_server.InfinibandFormatter(
+            socket.inet_aton("127.0.0.1"),
+            12288,
+            socket.inet_aton(destination[0]),
+            destination[1],
+            receiver.get_qp_number(),
+            receiver.get_rkey(),
+        )
+        psn = 0x1000
+        frames = []
+        for frame_number in range(frame_count):
+            packets, psn = make_frame_packets(
+                formatter, psn, frame_size, payload_size, frame_number
+            )
+            frames.append(packets)
+
+        def _frame(metadata):
+            buffer = (ctypes.c_uint8 * frame_size).from_address(metadata.frame_memory)
+            return np.frombuffer(buffer, dtype=np.uint8)
+
+        received = []
+        bytes_received = 0
+        checked = 0
+        start = time.monotonic()
+        for frame_number, packets in enumerate(frames):
+            for packet in packets:
+                sender.sendto(packet, destination)
+            ok, metadata = receiver.get_next_frame(100)
+            if not ok:
+                continue
+            bytes_received += metadata.frame_bytes_received
+            received.append((frame_number, metadata))
+            # The last pages frames we fetched are still intact.
+            for held_frame_number, held_metadata in received[-pages:]:
+                frame = _frame(held_metadata)
+                if held_metadata.frame_packets_received == len(packets):
+                    assert (frame == (held_frame_number & 0xFF)).all()
+                    checked += 1
+        elapsed = time.monotonic() - start
+        logging.info(
+            f"{huge_pages=} frames={len(received)} {elapsed=:.3f} "
+            f"MB/s={bytes_received / elapsed / 1e6:.0f}"
+        )
+        assert checked > 0
+        # We're not copying out of the receiver's buffers.
+        addresses = {metadata.frame_memory for _, metadata in received}
+        assert len(addresses) <= 2 * pages + 1
+
+        receiver.close()
+        receiver_thread.join()
+    finally:
+        sender.close()
+        data_socket.close()
+
+
+def test_linux_receiver_telemetry(
+    frame_count=10, frame_size=64 * 1024, payload_size=8192
+):
+    """The receiver's counters are visible via get_telemetry, its shared
+    memory segment and the Prometheus endpoint."""
+    data_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        data_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * frame_size)
+        data_socket.bind(("127.0.0.1", 0))
+        destination = data_socket.getsockname()
+        receiver = hololink_module.operators.LinuxReceiver(
+            0,
+            frame_size,
+            data_socket.fileno(),
+            0,
+            host_memory=True,
+        )
+        receiver_thread = threading.Thread(daemon=True, target=receiver.run)
+        receiver_thread.start()
+        telemetry = receiver.get_telemetry()
+        assert telemetry.receiver() == "linux_receiver"
+
+        formatter = mock_server.InfinibandFormatter(
+            socket.inet_aton("127.0.0.1"),
+            12288,
+            socket.inet_aton(destination[0]),
+            destination[1],
+            receiver.get_qp_number(),
+            receiver.get_rkey(),
+        )
+        psn = 0x1000
+        packets_sent = 0
+        bytes_sent = 0
+        delivered = 0
+        for frame_number in range(frame_count):
+            packets, psn = make_frame_packets(
+                formatter, psn, frame_size, payload_size, frame_number
+            )
+            # Skip one packet in the first frame.
+            if frame_number == 0:
+                packets = packets[:1] + packets[2:]
+            for packet in packets:
+                sender.sendto(packet, destination)
+            packets_sent += len(packets)
+            bytes_sent += sum(len(packet) for packet in packets)
+            ok, _ = receiver.get_next_frame(1000)
+            assert ok
+            delivered += 1
+        ok, _ = receiver.get_next_frame(10)
+        assert not ok
+
+        counters = telemetry.counters()
+        logging.info(f"{counters=}")
+        assert counters["packets_received"] == packets_sent
+        assert counters["bytes_received"] == bytes_sent
+        assert counters["packets_dropped"] == 1
+        assert counters["frames_received"] == frame_count
+        assert counters["frames_delivered"] == delivered
+        assert counters["timeouts"] == 1
+        histograms = telemetry.histograms()
+        count, _, buckets = histograms["frame_wait"]
+        assert count == delivered
+        assert sum(buckets) == delivered
+
+        # An external reader sees the same values.
+        segment = hololink_module.telemetry.read_segment(
+            "/dev/shm" + telemetry.shm_name()
+        )
+        assert segment is not None
+        assert segment.pid == os.getpid()
+        assert segment.receiver == "linux_receiver"
+        assert segment.counters == counters
+        assert segment.histograms["frame_wait"].count == delivered
+
+        server = hololink_module.TelemetryServer(0)
+        url = f"http://127.0.0.1:{server.get_port()}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            text = response.read().decode()
+        labels = f'receiver="linux_receiver",instance="{telemetry.instance()}"'
+        assert (
+            f"hololink_receiver_frames_delivered_total{{{labels}}} {delivered}\n"
+            in text
+        )
+
+        receiver.close()
+        receiver_thread.join()
+    finally:
+        sender.close()
+        data_socket.close()
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import socket
+import struct
+import time
+import zlib
+
+import numpy as np
+import pytest
+
+import hololink as hololink_module
+import hololink.emulation as hemu
+
+# DataPlane register blocks for data_plane_id=0, sensor_id=0
+VP_ADDRESS = 0x1000
+HIF_ADDRESS = 0x02000300
+SOURCE_PORT = hololink_module.DATA_SOURCE_UDP_PORT
+ICRC_INITIALIZER = zlib.crc32(b"\xff" * 8)
+# 2560x1984 RAW10 with the start and end lines, as VB1940 sends it
+VB1940_FRAME_SIZE = 3200 * (1984 + 3)
+
+
+def make_data_plane(hsb, port, payload_size, frame_size, address, qp, rkey):
+    """A LinuxDataPlane configured, as the host would, to send to
+    127.0.0.1:port."""
+    try:
+        data_plane = hemu.LinuxDataPlane(hsb, hemu.IPAddress("127.0.0.1"), 0, 0)
+    except RuntimeError as e:
+        pytest.skip(f"Unable to create LinuxDataPlane: {e}")
+    hsb.write(VP_ADDRESS + hololink_module.DP_HOST_IP, 0x7F000001)
+    hsb.write(VP_ADDRESS + hololink_module.DP_HOST_UDP_PORT, port)
+    hsb.write(VP_ADDRESS + hololink_module.DP_BUFFER_LENGTH, frame_size)
+    hsb.write(VP_ADDRESS + hololink_module.DP_QP, qp)
+    hsb.write(VP_ADDRESS + hololink_module.DP_RKEY, rkey)
+    hsb.write(VP_ADDRESS + hololink_module.DP_BUFFER_MASK, 1)
+    hsb.write(VP_ADDRESS + hololink_module.DP_ADDRESS_0, address >> 7)
+    hsb.write(
+        HIF_ADDRESS + hololink_module.DP_PACKET_SIZE,
+        payload_size // hololink_module.PAGE_SIZE,
+    )
+    return data_plane
+
+
+def icrc(packet, port):
+    """The iCRC for packet, a UDP payload received on port."""
+    ip_header = struct.pack(
+        "!BBHHHBBH4s4s",
+        0x45,
+        0xFF,
+        20 + 8 + len(packet),
+        0,
+        0x4000,
+        0xFF,
+        socket.IPPROTO_UDP,
+        0xFFFF,
+        socket.inet_aton("127.0.0.1"),
+        socket.inet_aton("127.0.0.1"),
+    )
+    udp_header = struct.pack("!HHHH", SOURCE_PORT, port, 8 + len(packet), 0xFFFF)
+    crc = zlib.crc32(ip_header + udp_header + packet[:-4], ICRC_INITIALIZER)
+    return struct.pack("<I", crc)
+
+
+@pytest.mark.parametrize(
+    "frame_size, payload_size",
+    [
+        (1408 * 200 + 77, 1408),
+        (8192 * 64, 8192),
+        (100, 1408),
+    ],
+)
+def test_linux_transmitter_packets(frame_size, payload_size):
+    """Each packet, sent in batches, carries the right slice of the
+    frame with consecutive PSNs and a valid iCRC; the frame metadata
+    follows."""
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    with receiver:
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 * 1024 * 1024)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(1)
+        port = receiver.getsockname()[1]
+        address, qp, rkey = 0x10000000, 0x1234, 0xABCD
+        hsb = hemu.HSBEmulator(hemu.HSB_LEOPARD_EAGLE_CONFIG)
+        data_plane = make_data_plane(
+            hsb, port, payload_size, frame_size, address, qp, rkey
+        )
+        image = np.random.default_rng(frame_size).integers(
+            0, 256, frame_size, dtype=np.uint8
+        )
+        psn = None
+        for _ in range(2):
+            n_bytes = data_plane.send(image)
+            assert n_bytes == frame_size + 4 + 128
+            for offset in range(0, frame_size, payload_size):
+                packet = receiver.recv(hololink_module.UDP_PACKET_SIZE)
+                opcode, _, _, packet_qp, packet_psn, vaddress, packet_rkey, size = (
+                    struct.unpack_from("!BBHIIQII", packet)
+                )
+                assert opcode == 0x2A
+                assert packet_qp == 0xFF000000 | qp
+                assert packet_rkey == rkey
+                assert vaddress == address + offset
+                if psn is not None:
+                    assert packet_psn == psn
+                psn = (packet_psn + 1) & 0xFFFFFF
+                content = image[offset : offset + payload_size].tobytes()
+                assert size == len(content)
+                assert packet[28:-4] == content
+                assert packet[-4:] == icrc(packet, port)
+            packet = receiver.recv(hololink_module.UDP_PACKET_SIZE)
+            assert packet[0] == 0x2B
+            assert struct.unpack_from("!I", packet, 8)[0] == psn
+            assert packet[-4:] == icrc(packet, port)
+            (bytes_written,) = struct.unpack_from("!Q", packet, 28 + 28)
+            assert bytes_written == frame_size
+            psn = (psn + 1) & 0xFFFFFF
+
+
+@pytest.mark.skip_unless_benchmark
+def test_linux_transmitter_benchmark(frame_count=60):
+    """Frames per second LinuxTransmitter sends from one thread, in
+    the 1408-byte packets a 1500 MTU gives, for stereo VB1940 frames."""
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    with receiver:
+        receiver.bind(("127.0.0.1", 0))
+        port = receiver.getsockname()[1]
+        hsb = hemu.HSBEmulator(hemu.HSB_LEOPARD_EAGLE_CONFIG)
+        data_plane = make_data_plane(
+            hsb, port, 1408, VB1940_FRAME_SIZE, 0x10000000, 0x1234, 0xABCD
+        )
+        images = [
+            np.random.default_rng(i).integers(0, 256, VB1940_FRAME_SIZE, dtype=np.uint8)
+            for i in range(2)
+        ]
+        start = time.monotonic()
+        for frame in range(frame_count):
+            assert data_plane.send(images[frame % 2]) > VB1940_FRAME_SIZE
+        elapsed = time.monotonic() - start
+        fps = frame_count / elapsed
+        logging.info(
+            f"{fps:.1f} frames/s ({fps / 2:.1f} stereo pairs/s), "
+            f"{fps * VB1940_FRAME_SIZE * 8 / 1e9:.2f} Gbps"
+        )
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import socket
+import struct
+import subprocess
+import time
+
+import pytest
+
+import hololink as hololink_module
+
+
+def test_local_ip_and_mac_cache(iterations=1000):
+    """Repeated lookups are served from the cache, and give
+    the same answer as a fresh lookup."""
+    if not hololink_module.local_ip_and_mac_cache_stats().enabled:
+        pytest.skip("RTNETLINK isn't available.")
+    hololink_module.clear_local_ip_and_mac_cache()
+    before = hololink_module.local_ip_and_mac_cache_stats()
+    start = time.monotonic()
+    expected = hololink_module.local_ip_and_mac("127.0.0.1", 8192)
+    miss = time.monotonic() - start
+    start = time.monotonic()
+    for _ in range(iterations):
+        assert hololink_module.local_ip_and_mac("127.0.0.1", 8192) == expected
+    hit = (time.monotonic() - start) / iterations
+    after = hololink_module.local_ip_and_mac_cache_stats()
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + iterations
+    logging.info(f"miss={miss * 1e6:.1f}us hit={hit * 1e6:.2f}us")
+    assert expected[0] == "127.0.0.1"
+
+    # local_ip_and_mac_from_socket shares the interface table.
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(("127.0.0.1", 8192))
+        assert hololink_module.local_ip_and_mac_from_socket(s.fileno()) == expected
+    assert hololink_module.local_ip_and_mac_cache_stats().hits == after.hits + 1
+
+    # Clearing the cache forces a new lookup.
+    hololink_module.clear_local_ip_and_mac_cache()
+    assert hololink_module.local_ip_and_mac("127.0.0.1", 8192) == expected
+    assert hololink_module.local_ip_and_mac_cache_stats().misses == after.misses + 1
+
+
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+NLMSG_DONE = 3
+
+
+def netlink_message(message_type, payload=b""):
+    """An nlmsghdr-framed message; payload is padded to NLMSG_ALIGNTO."""
+    payload += b"\x00" * (-len(payload) % 4)
+    return struct.pack("=IHHII", 16 + len(payload), message_type, 0, 0, 0) + payload
+
+
+def has_cap_net_admin():
+    CAP_NET_ADMIN = 12
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("CapEff:"):
+                return bool(int(line.split()[1], 16) & (1 << CAP_NET_ADMIN))
+    return False
+
+
+def test_local_ip_and_mac_netlink_messages():
+    """Address, link, and route notifications flush the cache; other
+    RTNETLINK traffic doesn't."""
+    if not hololink_module.local_ip_and_mac_cache_stats().enabled:
+        pytest.skip("RTNETLINK isn't available.")
+    hololink_module.local_ip_and_mac("127.0.0.1", 8192)
+    before = hololink_module.local_ip_and_mac_cache_stats()
+    # struct ifaddrmsg: family, prefixlen, flags, scope, index
+    ifaddrmsg = struct.pack("=BBBBI", socket.AF_INET, 8, 0, 0, 1)
+    hololink_module.handle_local_ip_and_mac_netlink_messages(
+        netlink_message(RTM_GETADDR, ifaddrmsg) + netlink_message(NLMSG_DONE)
+    )
+    assert hololink_module.local_ip_and_mac_cache_stats().invalidations == (
+        before.invalidations
+    )
+    hololink_module.local_ip_and_mac("127.0.0.1", 8192)
+    assert hololink_module.local_ip_and_mac_cache_stats().hits == before.hits + 1
+    # The change can follow other messages in the same datagram.
+    hololink_module.handle_local_ip_and_mac_netlink_messages(
+        netlink_message(NLMSG_DONE) + netlink_message(RTM_NEWADDR, ifaddrmsg)
+    )
+    after = hololink_module.local_ip_and_mac_cache_stats()
+    assert after.invalidations == before.invalidations + 1
+    hololink_module.local_ip_and_mac("127.0.0.1", 8192)
+    assert hololink_module.local_ip_and_mac_cache_stats().misses == after.misses + 1
+
+
+def test_local_ip_and_mac_invalidation():
+    """Adding or removing an address flushes the cache; this changes
+    the host's network configuration so it only runs with CAP_NET_ADMIN."""
+    if not has_cap_net_admin():
+        pytest.skip("Changing network configuration requires CAP_NET_ADMIN.")
+    if not hololink_module.local_ip_and_mac_cache_stats().enabled:
+        pytest.skip("RTNETLINK isn't available.")
+    hololink_module.local_ip_and_mac("127.0.0.1", 8192)
+    before = hololink_module.local_ip_and_mac_cache_stats()
+    address = "127.0.0.77/8"
+    try:
+        r = subprocess.run(
+            ["ip", "addr", "add", address, "dev", "lo"], capture_output=True, text=True
+        )
+        if r.returncode != 0:
+            pytest.skip(f"Unable to change network configuration: {r.stderr.strip()}")
+        deadline = time.monotonic() + 5
+        while hololink_module.local_ip_and_mac_cache_stats().invalidations == (
+            before.invalidations
+        ):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        # Harmless if the address was never added.
+        subprocess.run(["ip", "addr", "del", address, "dev", "lo"], capture_output=True)
+    hololink_module.local_ip_and_mac("127.0.0.1", 8192)
+    after = hololink_module.local_ip_and_mac_cache_stats()
+    assert after.misses == before.misses + 1
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import hololink as hololink_module
+
+SIF_ADDRESS = 0x01000000
+PACKETIZER_RAM = 0x04
+PACKETIZER_DATA = 0x08
+PACKETIZER_MODE = 0x0C
+
+
+def test_packetizer_program_load(counting_hololink):
+    raw_10 = hololink_module.csi.get_packetizer_program(
+        hololink_module.PixelFormat.RAW_10
+    )
+    raw_12 = hololink_module.csi.get_packetizer_program(
+        hololink_module.PixelFormat.RAW_12
+    )
+    hololink = counting_hololink
+    # Like the packetizer after reset.
+    for register in [PACKETIZER_RAM, PACKETIZER_DATA, PACKETIZER_MODE]:
+        hololink.write_uint32(SIF_ADDRESS + register, 0)
+
+    def enable(program):
+        requests, _ = hololink.count(program.enable, hololink, SIF_ADDRESS)
+        return requests
+
+    # One read to check what's loaded, then the mode and all the
+    # microcode in 3 WR_BLOCK requests (instead of 431 writes).
+    assert enable(raw_10) == 4
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_MODE) == 0x11F1FFF7
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_RAM) == 0x14F
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_DATA) == 0x1
+    # Already running: just the read.
+    assert enable(raw_10) == 1
+    # Disabled, but the microcode is still loaded: read and set the mode.
+    raw_10.disable(hololink, SIF_ADDRESS)
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_MODE) == 0
+    assert enable(raw_10) == 2
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_MODE) == 0x11F1FFF7
+    # A different program is loaded in full.
+    assert enable(raw_12) == 2
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_MODE) == 0x11210007
+    assert hololink.read_uint32(SIF_ADDRESS + PACKETIZER_RAM) == 0x142
+    assert enable(raw_10) == 4
@@ -13,10 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
+import resource
 import threading
 import time
 
+import pytest
+
 import hololink
 
 
@@ -232,6 +236,34 @@ def test_reactor_remove_fd_callback():
         os.close(write_fd)
 
 
+def test_reactor_fd_callback_reused_fd():
+    """Test registering an fd number again after it was closed without
+    remove_fd_callback."""
+    reactor = hololink.Reactor.get_reactor()
+
+    first_fd = os.eventfd(0, os.EFD_NONBLOCK)
+    reactor.add_fd_callback(first_fd, lambda fd, events: os.eventfd_read(fd))
+    # Closing the fd takes it out of the reactor's epoll set.
+    os.close(first_fd)
+    fd = os.eventfd(0, os.EFD_NONBLOCK)
+    try:
+        callback_called = threading.Event()
+
+        def fd_callback(fd, events):
+            os.eventfd_read(fd)
+            callback_called.set()
+
+        # Same events as before, so only the callback changes.
+        reactor.add_fd_callback(fd, fd_callback)
+        os.eventfd_write(fd, 1)
+        assert callback_called.wait(timeout=1.0)
+    finally:
+        reactor.remove_fd_callback(fd)
+        if fd != first_fd:
+            reactor.remove_fd_callback(first_fd)
+        os.close(fd)
+
+
 def test_reactor_is_current_thread():
     """Test the is_current_thread method."""
     reactor = hololink.Reactor.get_reactor()
@@ -304,3 +336,75 @@ def test_reactor_thread_safety():
         assert len(thread_0_items) == 11  # 10 callbacks + 1 alarm
         assert len(thread_1_items) == 11  # 10 callbacks + 1 alarm
         assert len(thread_2_items) == 11  # 10 callbacks + 1 alarm
+
+
+@pytest.mark.skip_unless_benchmark
+def test_reactor_benchmark(alarm_count=100000, fd_count=1000, round_trips=1000):
+    """Measure scheduling and cancelling many alarms, and fd wakeup
+    latency with many file descriptors registered."""
+    reactor = hololink.Reactor.get_reactor()
+
+    def never_called():
+        assert False, "Cancelled alarm was called."
+
+    # Far enough out that none of these fire during the test.
+    start = time.monotonic()
+    handles = [reactor.add_alarm_s(3600 + i, never_called) for i in range(alarm_count)]
+    add_elapsed = time.monotonic() - start
+    # Alarms scheduled out of order still fire in order.
+    results = []
+    done = threading.Event()
+
+    def make_callback(n):
+        def callback():
+            results.append(n)
+            if len(results) == 10:
+                done.set()
+
+        return callback
+
+    for n in [5, 2, 8, 0, 9, 1, 7, 3, 6, 4]:
+        reactor.add_alarm_s(0.05 + n * 0.01, make_callback(n))
+    start = time.monotonic()
+    for handle in handles:
+        reactor.cancel_alarm(handle)
+    cancel_elapsed = time.monotonic() - start
+    assert done.wait(timeout=2.0)
+    assert results == list(range(10))
+    logging.info(
+        f"{alarm_count=} add={add_elapsed * 1e6 / alarm_count:.2f}us/alarm "
+        f"cancel={cancel_elapsed * 1e6 / alarm_count:.2f}us/alarm"
+    )
+
+    # Make sure we have room for fd_count more file descriptors; the
+    # original limit is restored when we're done.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = fd_count * 2
+    fds = []
+    try:
+        if (soft != resource.RLIM_INFINITY) and (soft < wanted):
+            if (hard == resource.RLIM_INFINITY) or (hard >= wanted):
+                resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+        for _ in range(fd_count):
+            fds.append(os.eventfd(0, os.EFD_NONBLOCK))
+        ready = threading.Semaphore(0)
+
+        def fd_callback(fd, events):
+            os.eventfd_read(fd)
+            ready.release()
+
+        for fd in fds:
+            reactor.add_fd_callback(fd, fd_callback)
+        start = time.monotonic()
+        for i in range(round_trips):
+            os.eventfd_write(fds[(i * 7) % fd_count], 1)
+            assert ready.acquire(timeout=1.0)
+        elapsed = time.monotonic() - start
+        logging.info(
+            f"{fd_count=} {round_trips=} latency={elapsed * 1e6 / round_trips:.1f}us"
+        )
+    finally:
+        for fd in fds:
+            reactor.remove_fd_callback(fd)
+            os.close(fd)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import hololink as hololink_module
+
+HOST_OWNED = hololink_module.APB_RAM
+OTHER = hololink_module.APB_RAM + 0x100
+
+
+def test_register_cache(counting_hololink):
+    hololink = counting_hololink
+    hololink.write_uint32(HOST_OWNED + 4, 0)
+    hololink.declare_host_owned(HOST_OWNED, 0x10)
+    assert not hololink.get_register_cache_enable()
+    hololink.set_register_cache_enable(True)
+
+    # The first write goes out; writing the same value again doesn't.
+    assert hololink.count(hololink.write_uint32, HOST_OWNED, 0x5) == (1, True)
+    assert hololink.count(hololink.write_uint32, HOST_OWNED, 0x5) == (0, True)
+    assert hololink.get_register_cache_elided_writes() == 1
+    # Reads and read-modify-writes use the cached value.
+    assert hololink.count(hololink.read_uint32, HOST_OWNED) == (0, 0x5)
+    assert hololink.count(hololink.or_uint32, HOST_OWNED, 0x2) == (1, True)
+    mask = ~0x2 & 0xFFFFFFFF
+    assert hololink.count(hololink.and_uint32, HOST_OWNED, mask) == (1, True)
+    assert hololink.count(hololink.and_uint32, HOST_OWNED, mask) == (0, True)
+    assert hololink.get_register_cache_hits() == 4
+    assert hololink.get_cached_uint32(HOST_OWNED) == 0x5
+    # Registers that aren't host owned always go to the device.
+    assert hololink.count(hololink.write_uint32, OTHER, 0x7) == (1, True)
+    assert hololink.count(hololink.write_uint32, OTHER, 0x7) == (1, True)
+    assert hololink.count(hololink.read_uint32, OTHER) == (1, 0x7)
+    assert hololink.get_cached_uint32(OTHER) is None
+    # Host-owned registers are read once, then cached.
+    assert hololink.count(hololink.read_uint32, HOST_OWNED + 4) == (1, 0)
+    assert hololink.count(hololink.read_uint32, HOST_OWNED + 4) == (0, 0)
+    # After invalidating, the device is asked again.
+    hololink.invalidate_register_cache()
+    assert hololink.count(hololink.read_uint32, HOST_OWNED) == (1, 0x5)
+    assert hololink.count(hololink.write_uint32, HOST_OWNED, 0x5) == (0, True)
+    # Disabling the cache sends everything.
+    hololink.set_register_cache_enable(False)
+    assert hololink.count(hololink.write_uint32, HOST_OWNED, 0x5) == (1, True)
+    assert hololink.count(hololink.read_uint32, HOST_OWNED) == (1, 0x5)
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import collections
+import logging
+
+import pytest
+
+import hololink as hololink_module
+from hololink.sensors import imx477, register_table
+from hololink.sensors.vb1940 import vb1940_mode
+
+PERIPHERAL_I2C_ADDRESS = 0x10
+
+
+class EmulatedHololink(hololink_module.Hololink):
+    """
+    Executes control plane requests in-process: memory reads and
+    writes, software sequencer programs, and an I2C controller that
+    completes immediately.  Keeps a count of requests sent and the
+    list of (register, value) writes each peripheral saw, assuming
+    16-bit register addresses that auto-increment.
+    """
+
+    def __init__(self):
+        super().__init__(
+            peer_ip="127.0.0.1",
+            control_port=8192,
+            serial_number="register-table",
+            sequence_number_checking=False,
+        )
+        self._memory = collections.defaultdict(int)
+        self._replies = collections.deque()
+        self.requests = 0
+        self.i2c_writes = []
+
+    def send_control(self, request):
+        self.requests += 1
+        deserializer = hololink_module.Deserializer(bytearray(request))
+        cmd_code = deserializer.next_uint8()
+        flags = deserializer.next_uint8()
+        sequence = deserializer.next_uint16_be()
+        deserializer.next_uint8()  # reserved
+        deserializer.next_uint8()  # reserved
+        pairs = []
+        while deserializer.position() < len(request):
+            address = deserializer.next_uint32_be()
+            value = deserializer.next_uint32_be()
+            pairs.append((address, value))
+        reply = bytearray(hololink_module.UDP_PACKET_SIZE)
+        serializer = hololink_module.Serializer(reply)
+        serializer.append_uint8(0x80 | cmd_code)
+        serializer.append_uint8(flags)
+        serializer.append_uint16_be(sequence)
+        serializer.append_uint8(hololink_module.RESPONSE_SUCCESS)
+        serializer.append_uint8(0)  # reserved
+        for address, value in pairs:
+            if cmd_code in (hololink_module.WR_DWORD, hololink_module.WR_BLOCK):
+                self.memory_write(address, value)
+            else:
+                value = self._memory[address]
+            serializer.append_uint32_be(address)
+            serializer.append_uint32_be(value)
+        serializer.append_uint16_be(0)  # latched_sequence
+        self._replies.append(list(reply[: serializer.length()]))
+
+    def receive_control(self, timeout):
+        if len(self._replies) == 0:
+            return []
+        return self._replies.popleft()
+
+    def memory_write(self, address, value):
+        self._memory[address] = value
+        i2c_control = hololink_module.I2C_CTRL + hololink_module.I2C_REG_CONTROL
+        if address == i2c_control:
+            status = hololink_module.I2C_CTRL + hololink_module.I2C_REG_STATUS
+            if value & hololink_module.I2C_START:
+                self.i2c(value)
+                self._memory[status] = hololink_module.I2C_DONE
+            else:
+                self._memory[status] = 0
+        elif (address == hololink_module.CTRL_EVT_SW_EVENT) and (value == 1):
+            self.run_sequencer(hololink_module.Hololink.Event.SW_EVENT)
+
+    def i2c(self, control):
+        peripheral_i2c_address = (control >> 16) & 0x7F
+        num_bytes = self._memory[
+            hololink_module.I2C_CTRL + hololink_module.I2C_REG_NUM_BYTES
+        ]
+        write_byte_count = num_bytes & 0x1FF
+        data_buffer = hololink_module.I2C_CTRL + hololink_module.I2C_REG_DATA_BUFFER
+        content = b"".join(
+            self._memory[data_buffer + i].to_bytes(4, "little")
+            for i in range(0, write_byte_count, 4)
+        )[:write_byte_count]
+        register = int.from_bytes(content[:2], "big")
+        for i, value in enumerate(content[2:]):
+            self.i2c_writes.append((peripheral_i2c_address, register + i, value))
+
+    def run_sequencer(self, event):
+        DONE = 0xFFFFFFFF
+        instruction_pointer = self._memory[hololink_module.APB_RAM + int(event) * 4]
+        op_bit = 32
+        while True:
+            if op_bit >= 32:
+                command = self._memory[instruction_pointer]
+                instruction_pointer += 4
+                op_bit = 0
+                continue
+            operand = self._memory[instruction_pointer]
+            instruction_pointer += 4
+            if operand == DONE:
+                break
+            opcode = (command >> op_bit) & 3
+            op_bit += 2
+            if opcode == hololink_module.Sequencer.Op.POLL:
+                match = self._memory[instruction_pointer]
+                mask = self._memory[instruction_pointer + 4]
+                instruction_pointer += 8
+                # The I2C controller here is always done.
+                assert (self._memory[operand] & mask) == match
+            elif opcode == hololink_module.Sequencer.Op.RD:
+                self._memory[instruction_pointer] = self._memory[operand]
+                instruction_pointer += 4
+            elif opcode == hololink_module.Sequencer.Op.WR:
+                value = self._memory[instruction_pointer]
+                instruction_pointer += 4
+                self.memory_write(operand, value)
+
+
+def write_table(i2c, table, wait_registers):
+    """One i2c_transaction per register write, as sensors used to do."""
+    for register, value in table:
+        if register in wait_registers:
+            continue
+        write_bytes = bytearray(register.to_bytes(2, "big"))
+        write_bytes.append(value)
+        i2c.i2c_transaction(PERIPHERAL_I2C_ADDRESS, write_bytes, 0)
+
+
+IMX477_WAITS = (imx477.IMX477_TABLE_WAIT_MS, imx477.IMX477_TABLE_END)
+VB1940_WAITS = (vb1940_mode.VB1940_TABLE_WAIT_MS,)
+
+
+@pytest.mark.parametrize(
+    "name, table, wait_registers",
+    [
+        ("imx477_1920X1080_60fps", imx477.imx477_mode_1920X1080_60fps, IMX477_WAITS),
+        ("imx477_3840X2160_60fps", imx477.imx477_mode_3840X2160_60fps, IMX477_WAITS),
+        (
+            "vb1940_2560X1984_30fps",
+            vb1940_mode.vb1940_mode_2560X1984_30fps,
+            VB1940_WAITS,
+        ),
+        (
+            "vb1940_1920X1080_30fps",
+            vb1940_mode.vb1940_mode_1920X1080_30fps,
+            VB1940_WAITS,
+        ),
+        (
+            "vb1940_2560X1984_30fps_8bit",
+            vb1940_mode.vb1940_mode_2560X1984_30fps_8bit,
+            VB1940_WAITS,
+        ),
+    ],
+)
+def test_register_table_round_trips(name, table, wait_registers):
+    """Replaying a compiled plan writes exactly what writing the table
+    one register at a time does, with far fewer control round trips."""
+    hololink = EmulatedHololink()
+    i2c = hololink.get_i2c(hololink_module.CAM_I2C_BUS)
+    write_table(i2c, table, wait_registers)
+    before, expected = hololink.requests, hololink.i2c_writes
+
+    hololink = EmulatedHololink()
+    i2c = hololink.get_i2c(hololink_module.CAM_I2C_BUS)
+    register_table.clear_plans()
+    plan = register_table.plan(("test", name), table, wait_registers)
+    assert register_table.plan(("test", name), table, wait_registers) is plan
+    plan.replay(i2c, PERIPHERAL_I2C_ADDRESS)
+    after = hololink.requests
+    assert hololink.i2c_writes == expected
+    logging.info(
+        f"{name}: registers={plan.register_count()} "
+        f"transactions={plan.transaction_count()} "
+        f"round_trips {before=} {after=} ({before / after:.1f}x fewer)"
+    )
+    assert after < before
+
+
+def test_register_table_compile():
+    wait = "wait"
+    table = [(0x100 + i, i & 0xFF) for i in range(300)]
+    table += [(0x500, 1), (0x501, 2), (wait, 5), (0x502, 3), (0x600, 4), (0x601, 5)]
+    plan = register_table.compile_table(table, (wait,))
+    assert plan.register_count() == 305
+    steps = plan.steps()
+    assert [op for op, _ in steps] == ["write", "wait", "write"]
+    first, second, third = steps[0][1]
+    # A run is split so each transaction, with its register address,
+    # fits in encode_i2c_request's buffer.
+    assert len(first) == register_table.MAX_WRITE_BYTES
+    assert first[:3] == bytearray([0x01, 0x00, 0x00])
+    assert second[:2] == (0x100 + 254).to_bytes(2, "big")
+    assert len(second) == 2 + 300 - 254
+    assert third == bytearray([0x05, 0x00, 1, 2])
+    assert steps[1] == ("wait", 5)
+    # Writes after the wait aren't merged with those before it.
+    assert steps[2][1] == [bytearray([0x05, 0x02, 3]), bytearray([0x06, 0x00, 4, 5])]
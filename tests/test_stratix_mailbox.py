@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import logging
+import random
+import time
+import types
+
+import mock_server
+import pytest
+
+from tools import hololink as hololink_tool
+
+
+@pytest.fixture
+def hololink(counting_hololink):
+    return counting_hololink
+
+
+def test_stratix_mailbox(hololink):
+    mailbox = hololink_tool.StratixMailbox(hololink)
+    assert mailbox.get_idcode() == mock_server.StratixMailbox.IDCODE
+    assert mailbox.get_chipid() == mock_server.StratixMailbox.CHIPID
+    with pytest.raises(hololink_tool.StratixMailboxError) as e:
+        hololink_tool.StratixQspi(mailbox).close()
+    assert e.value.error_code == hololink_tool.StratixQspi.QSPI_NOT_OPENED_BY_CLIENT
+
+
+def test_stratix_mailbox_program(hololink):
+    """Program and verify an image that takes more than one erase
+    block, and report the rate so that this can be tracked as a
+    benchmark."""
+    random.seed(0x5EED)
+    content_size = hololink_tool.StratixQspi.ERASE_64K_BYTES + 0x1000
+    content = random.randbytes(content_size)
+    pages = content_size // hololink_tool.StratixQspi.PAGE_BYTES
+    args = types.SimpleNamespace(
+        skip_program_stratix=False, skip_verify_stratix=False, differential=False
+    )
+    strategy = hololink_tool.SensorBridge100Strategy(types.SimpleNamespace(_args=args))
+    #
+    start = time.monotonic()
+    requests = hololink.requests
+    strategy.program_stratix(hololink, content)
+    program_s = time.monotonic() - start
+    program_requests = hololink.requests - requests
+    #
+    start = time.monotonic()
+    requests = hololink.requests
+    strategy.verify_stratix(hololink, content)
+    verify_s = time.monotonic() - start
+    verify_requests = hololink.requests - requests
+    logging.info(
+        f"program: {content_size / 1024 / program_s:.1f} KiB/s {program_requests=}; "
+        f"verify: {content_size / 1024 / verify_s:.1f} KiB/s {verify_requests=}"
+    )
+    # Each page is over 1000 words through the mailbox; we expect only
+    # a few dozen requests to move them.
+    assert program_requests < pages * 32
+    assert verify_requests < pages * 32
+
+
+def test_stratix_mailbox_program_differential(hololink):
+    """With differential programming, only the sectors that changed
+    are erased, written and verified."""
+    random.seed(0xD1FF)
+    sector_bytes = hololink_tool.StratixQspi.ERASE_64K_BYTES
+    content = random.randbytes(sector_bytes + 0x1000)
+    args = types.SimpleNamespace(
+        skip_program_stratix=False, skip_verify_stratix=False, differential=True
+    )
+    strategy = hololink_tool.SensorBridge100Strategy(types.SimpleNamespace(_args=args))
+    assert strategy.program_stratix(hololink, content) == [0, sector_bytes]
+    # Nothing changed.
+    assert strategy.program_stratix(hololink, content) == []
+    # Change one byte in the second sector.
+    changed = bytearray(content)
+    changed[sector_bytes + 5] ^= 0xFF
+    changed = bytes(changed)
+    sectors = strategy.program_stratix(hololink, changed)
+    assert sectors == [sector_bytes]
+    strategy.verify_stratix(hololink, changed, sectors)
+    # Make sure the change landed.
+    args.differential = False
+    strategy.verify_stratix(hololink, changed)
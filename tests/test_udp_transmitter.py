@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import collections
+import logging
+import socket
+import struct
+import threading
+
+import numpy as np
+import pytest
+
+import hololink as hololink_module
+
+holoscan = pytest.importorskip(
+    "holoscan", reason="Use 'pip3 install holoscan' to enable holoscan tests."
+)
+
+# UdpTransmitterOp::SegmentHeader: sequence, offset, tensor_size
+SEGMENT_HEADER = struct.Struct("!III")
+
+# Ask for this much; the kernel caps it at net.core.rmem_max.
+RECEIVE_BUFFER_SIZE = 64 * 1024 * 1024
+
+
+def require_receive_buffer(datagrams, segment_size):
+    """Loopback UDP drops datagrams that don't fit in the receiver's
+    SO_RCVBUF, and the sender doesn't wait for us; skip unless all the
+    datagrams fit, even if Reassembler falls behind."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+        buffer_size = s.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    # A generous guess at what the kernel charges for each datagram.
+    size = segment_size + SEGMENT_HEADER.size + 28 + 320
+    truesize = (1 << (size - 1).bit_length()) + 1024
+    if datagrams * truesize > buffer_size:
+        pytest.skip(
+            f"SO_RCVBUF={buffer_size} is too small for {datagrams} datagrams; "
+            "raise net.core.rmem_max to run this."
+        )
+
+
+class TensorSourceOp(holoscan.core.Operator):
+    def __init__(self, *args, tensors=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tensors = iter(tensors)
+
+    def setup(self, spec):
+        spec.output("output")
+
+    def compute(self, op_input, op_output, context):
+        op_output.emit({"": next(self._tensors)}, "output")
+
+
+class TransmitterApplication(holoscan.core.Application):
+    def __init__(self, tensors, port, **kwargs):
+        super().__init__()
+        self._tensors = tensors
+        self._port = port
+        self._kwargs = kwargs
+
+    def compose(self):
+        source = TensorSourceOp(
+            self,
+            holoscan.conditions.CountCondition(self, count=len(self._tensors)),
+            name="source",
+            tensors=self._tensors,
+        )
+        self.transmitter = hololink_module.operators.UdpTransmitterOp(
+            self,
+            ip="127.0.0.1",
+            port=self._port,
+            name="udp_transmitter",
+            **self._kwargs,
+        )
+        self.add_flow(source, self.transmitter, {("output", "input")})
+
+
+class Reassembler:
+    """Collects the datagrams UdpTransmitterOp sends in segmenting mode
+    into the tensors they came from."""
+
+    def __init__(self):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE
+        )
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(1)
+        self.port = self._socket.getsockname()[1]
+        self.tensors = {}
+        self.received_bytes = collections.Counter()
+        self.datagrams = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        with self._socket:
+            while True:
+                try:
+                    datagram = self._socket.recv(65536)
+                except socket.timeout:
+                    return
+                self.datagrams += 1
+                sequence, offset, tensor_size = SEGMENT_HEADER.unpack_from(datagram)
+                data = datagram[SEGMENT_HEADER.size :]
+                tensor = self.tensors.setdefault(sequence, bytearray(tensor_size))
+                tensor[offset : offset + len(data)] = data
+                self.received_bytes[sequence] += len(data)
+
+    def join(self):
+        self._thread.join()
+
+
+@pytest.mark.parametrize(
+    "tensor_size, segment_size",
+    [
+        (1920 * 1080 * 2, 1460),
+        (16 * 1024, 1460),
+        (8192 * 4, 8192),
+        (100, 1460),
+        (0, 1460),
+    ],
+)
+def test_udp_transmitter_segments(tensor_size, segment_size, tensor_count=5):
+    """Every tensor arrives whole, split into segment_size datagrams."""
+    rng = np.random.default_rng(tensor_size)
+    tensors = [
+        rng.integers(0, 256, tensor_size, dtype=np.uint8) for _ in range(tensor_count)
+    ]
+    datagrams_per_tensor = max(1, -(-tensor_size // segment_size))
+    require_receive_buffer(tensor_count * datagrams_per_tensor, segment_size)
+    reassembler = Reassembler()
+    application = TransmitterApplication(
+        tensors,
+        reassembler.port,
+        segment_size=segment_size,
+        queue_size=tensor_count,
+        lossy=False,
+    )
+    application.run()
+    reassembler.join()
+    metrics = application.transmitter.get_metrics()
+    logging.info(
+        f"{tensor_size=} {segment_size=} datagrams={metrics.datagrams_sent} "
+        f"mean_latency={metrics.total_send_latency_s / tensor_count * 1000:.3f}ms "
+        f"max_latency={metrics.max_send_latency_s * 1000:.3f}ms"
+    )
+    assert metrics.tensors_sent == tensor_count
+    assert metrics.tensors_dropped == 0
+    assert metrics.send_errors == 0
+    assert metrics.datagrams_sent == tensor_count * datagrams_per_tensor
+    assert metrics.bytes_sent == tensor_count * tensor_size
+    assert reassembler.datagrams == metrics.datagrams_sent
+    assert sorted(reassembler.tensors.keys()) == list(range(tensor_count))
+    for sequence, tensor in enumerate(tensors):
+        assert reassembler.received_bytes[sequence] == tensor_size
+        assert reassembler.tensors[sequence] == tensor.tobytes()
+
+
+def test_udp_transmitter_lossy(tensor_count=50, tensor_size=2048):
+    """With a full queue in lossy mode, tensors are dropped and counted."""
+    tensors = [np.full(tensor_size, i, dtype=np.uint8) for i in range(tensor_count)]
+    require_receive_buffer(tensor_count * -(-tensor_size // 1460), 1460)
+    reassembler = Reassembler()
+    application = TransmitterApplication(
+        tensors, reassembler.port, segment_size=1460, queue_size=1, lossy=True
+    )
+    application.run()
+    reassembler.join()
+    metrics = application.transmitter.get_metrics()
+    logging.info(f"sent={metrics.tensors_sent} dropped={metrics.tensors_dropped}")
+    assert metrics.tensors_sent + metrics.tensors_dropped == tensor_count
+    assert len(reassembler.tensors) == metrics.tensors_sent
+    # Each tensor that was sent is one of the originals, intact.
+    for tensor in reassembler.tensors.values():
+        assert tensor == tensors[tensor[0]].tobytes()
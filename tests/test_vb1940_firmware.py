@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See README.md for detailed information.
+
+import hashlib
+import logging
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from hololink.sensors.vb1940 import vb1940, vb1940_firmware, vb1940_mode
+
+# (length, sha256) of each table as it was when these were lists of ints.
+EXPECTED = {
+    "VB1940_CERTIFICATE": (
+        458,
+        "5579aac07fe58ed038ae12949f8a344a1b3b910791c11a6f198325ed08070cd7",
+    ),
+    "VB1940_FW": (
+        16292,
+        "10ad09af221e438a927a25df4c111df22318d1f08f9bc6d66a4fb747f8453c0f",
+    ),
+    "LDEC_RAM_CONTENT": (
+        10980,
+        "329fb0c796d72c3a08fe5707d2ee42bf293f97c61b78a1aa8c74be37f8b73284",
+    ),
+    "RD_RAM_SEQ_1_CONTENT": (
+        624,
+        "e0a7724c35f345a6a11d214300cfc7d10c1c4ee8c6d31ba080ab212037a47eb6",
+    ),
+    "GT_RAM_PAT_CONTENT": (
+        608,
+        "c821718ba125435d7ce96d65ecff6dbb5a8c6deb1da6af75f0adee638f63ec28",
+    ),
+    "GT_RAM_SEQ_1_CONTENT": (
+        300,
+        "bb03a8a9584984102cc5603b2afe184ffdd6b1c0c0185a14b02f199df3cc0d18",
+    ),
+    "GT_RAM_SEQ_2_CONTENT": (
+        216,
+        "b514c05352673c6c11148b5955f9ead60dc57968987e40d1cd77b8d152eecec2",
+    ),
+    "GT_RAM_SEQ_3_CONTENT": (
+        160,
+        "f4be1d2e047b3ee18b3a6971996cf0f6746cbeb7b41db0b730f9413464de51cb",
+    ),
+    "GT_RAM_SEQ_4_CONTENT": (
+        164,
+        "bf2318ab45d199a7f715ef83770933309348fb5b3b09524065147e38efbbc789",
+    ),
+    "RD_RAM_PAT_CONTENT": (
+        1560,
+        "38daffc10f4b15630b86e984e94089207d990526d51e6364d765e4e8a505311f",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(EXPECTED.keys()))
+def test_vb1940_firmware_content(name):
+    length, sha256 = EXPECTED[name]
+    content = getattr(vb1940_mode, name)
+    assert content is getattr(vb1940_firmware, name)
+    assert len(content) == length
+    assert hashlib.sha256(content).hexdigest() == sha256
+
+
+class PageRecorder:
+    """Stands in for Vb1940Cam, recording set_register_buffer calls."""
+
+    write_data_in_pages = vb1940.Vb1940Cam.write_data_in_pages
+    write_certificate = vb1940.Vb1940Cam.write_certificate
+    write_fw = vb1940.Vb1940Cam.write_fw
+    write_vt_patch = vb1940.Vb1940Cam.write_vt_patch
+
+    def __init__(self):
+        self.memory = {}
+
+    def set_register_buffer(self, register, data_buffer, timeout=None):
+        assert len(data_buffer) <= vb1940_mode.VB1940_PAGE_SIZE
+        for i, value in enumerate(bytes(data_buffer)):
+            self.memory[register + i] = value
+
+    def content(self, start_addr, length):
+        return bytes(self.memory[start_addr + i] for i in range(length))
+
+
+def test_vb1940_firmware_pages():
+    """The paged writes put every byte of each blob where it belongs."""
+    recorder = PageRecorder()
+    recorder.write_certificate()
+    certificate = vb1940_mode.VB1940_CERTIFICATE
+    assert (
+        recorder.content(vb1940_mode.VB1940_CERTIFICATE_START_ADDR, len(certificate))
+        == certificate
+    )
+    recorder = PageRecorder()
+    recorder.write_fw()
+    fw = vb1940_mode.VB1940_FW
+    assert recorder.content(vb1940_mode.VB1940_FWP_START_ADDR, len(fw)) == fw
+    # The VT patch tables don't overlap.
+    recorder = PageRecorder()
+    recorder.write_vt_patch()
+    for name in EXPECTED.keys():
+        if name in ("VB1940_CERTIFICATE", "VB1940_FW"):
+            continue
+        content = getattr(vb1940_mode, name)
+        start_addr = getattr(vb1940_mode, f"{name}_START_ADDR")
+        assert recorder.content(start_addr, len(content)) == content
+
+
+def list_module_source(module):
+    """Python source for module's tables in the list-of-ints style
+    vb1940_mode used to have them in."""
+    lines = []
+    for name in EXPECTED.keys():
+        lines.append(f"{name} = [")
+        lines.extend(f"    0x{value:02X}," for value in getattr(module, name))
+        lines.append("]")
+    return "\n".join(lines) + "\n"
+
+
+def cold_import_s(source, iterations=5):
+    """Seconds to compile and execute source, as an import without
+    a cached .pyc does."""
+    start = time.monotonic()
+    for _ in range(iterations):
+        exec(compile(source, "<benchmark>", "exec"), {})
+    return (time.monotonic() - start) / iterations
+
+
+def test_vb1940_firmware_import_time():
+    """Compare loading the tables as lists of ints with loading
+    them as bytes; and check that importing hololink.sensors.vb1940
+    doesn't load them at all."""
+    with open(vb1940_firmware.__file__) as f:
+        bytes_source = f.read()
+    before = cold_import_s(list_module_source(vb1940_firmware))
+    after = cold_import_s(bytes_source)
+    logging.info(
+        f"table load {before * 1000:.2f}ms -> {after * 1000:.2f}ms "
+        f"({before / after:.1f}x faster)"
+    )
+    assert after < before
+
+    script = (
+        "import sys, time\n"
+        "start = time.monotonic()\n"
+        "import hololink.sensors.vb1940\n"
+        "print(time.monotonic() - start)\n"
+        "print('hololink.sensors.vb1940.vb1940_firmware' in sys.modules)\n"
+    )
+    environment = dict(
+        os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONPATH=os.pathsep.join(sys.path)
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+    elapsed, loaded = result.stdout.split()
+    logging.info(f"import hololink.sensors.vb1940 {float(elapsed) * 1000:.2f}ms")
+    assert loaded == "False"